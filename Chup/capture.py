@@ -122,13 +122,20 @@
 </html>
 """
 
+import os
+import sys
 import asyncio
 from playwright.async_api import async_playwright
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Converter', 'Converter'))
+from asset_mirror import AssetMirror  # noqa: E402
+
 async def take_screenshot():
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=True)
         page = await browser.new_page(viewport={"width": 1920, "height": 1080})
+        # Font/ảnh lấy từ mirror cục bộ (ASSET_MIRROR_MODE=offline để không dùng mạng)
+        await AssetMirror().install(page)
         await page.set_content(stringHtml)
         # Chụp với kích thước cố định thay vì full_page để tránh phần trắng
         await page.screenshot(path="screenshot.png", full_page=False, clip={
@@ -0,0 +1,200 @@
+const fs = require('fs/promises');
+const path = require('path');
+const crypto = require('crypto');
+
+// Mirror cục bộ cho font / CSS / ảnh mà slide kéo từ Google Fonts, Unsplash, ...
+// Layout trên đĩa (dùng chung với asset_mirror.py):
+//   urls/<sha256(url)>.json          { url, hash, status, contentType }
+//   objects/<hash[0:2]>/<hash>       nội dung, đánh địa chỉ theo sha256
+// mode: 'off' (không chặn request), 'cache' (phục vụ từ mirror, thiếu thì tải rồi lưu),
+//       'offline' (chỉ phục vụ từ mirror, thiếu thì abort ngay thay vì chờ timeout)
+const DEFAULT_MIRROR_DIR = process.env.ASSET_MIRROR_DIR || path.join(__dirname, '.asset_mirror');
+const MIRRORED_TYPES = new Set(['font', 'stylesheet', 'image']);
+const FORWARDED_HEADERS = ['user-agent', 'accept', 'accept-language', 'referer'];
+// Body của các asset hay dùng được giữ trong RAM (LRU theo bytes); phần còn lại đọc lại từ đĩa
+const MEMO_MAX_BYTES = Number(process.env.ASSET_MIRROR_MEMO_MB || 64) * 1024 * 1024;
+
+function sha256(data) {
+    return crypto.createHash('sha256').update(data).digest('hex');
+}
+
+async function writeAtomic(filePath, data) {
+    await fs.mkdir(path.dirname(filePath), { recursive: true });
+    const tmpPath = `${filePath}.${process.pid}.${crypto.randomBytes(4).toString('hex')}.tmp`;
+    await fs.writeFile(tmpPath, data);
+    await fs.rename(tmpPath, filePath);
+}
+
+class AssetMirror {
+    constructor(dir = DEFAULT_MIRROR_DIR, mode = process.env.ASSET_MIRROR_MODE || 'cache', memoMaxBytes = MEMO_MAX_BYTES) {
+        this.dir = dir;
+        this.mode = mode;
+        this.memo = new Map();  // thứ tự chèn của Map = thứ tự LRU
+        this.memoBytes = 0;
+        this.memoMaxBytes = memoMaxBytes;
+        this.hits = 0;
+        this.misses = 0;
+    }
+
+    metaPath(url) {
+        return path.join(this.dir, 'urls', `${sha256(url)}.json`);
+    }
+
+    objectPath(hash) {
+        return path.join(this.dir, 'objects', hash.slice(0, 2), hash);
+    }
+
+    remember(url, entry) {
+        const previous = this.memo.get(url);
+        if (previous) {
+            this.memo.delete(url);
+            this.memoBytes -= previous.body.length;
+        }
+        if (entry.body.length > this.memoMaxBytes) return;
+        this.memo.set(url, entry);
+        this.memoBytes += entry.body.length;
+        for (const [oldUrl, oldEntry] of this.memo) {
+            if (this.memoBytes <= this.memoMaxBytes) break;
+            this.memo.delete(oldUrl);
+            this.memoBytes -= oldEntry.body.length;
+        }
+    }
+
+    async lookup(url) {
+        const memoized = this.memo.get(url);
+        if (memoized) {
+            this.memo.delete(url);
+            this.memo.set(url, memoized);  // vừa dùng → cuối hàng LRU
+            return memoized;
+        }
+        try {
+            const meta = JSON.parse(await fs.readFile(this.metaPath(url), 'utf8'));
+            const entry = { ...meta, body: await fs.readFile(this.objectPath(meta.hash)) };
+            this.remember(url, entry);
+            return entry;
+        } catch (e) {
+            return null;
+        }
+    }
+
+    async store(url, { status, contentType, body }) {
+        const hash = sha256(body);
+        await writeAtomic(this.objectPath(hash), body);
+        const meta = { url, hash, status, contentType };
+        await writeAtomic(this.metaPath(url), JSON.stringify(meta));
+        const entry = { ...meta, body };
+        this.remember(url, entry);
+        return entry;
+    }
+
+    async fetchAndStore(url, requestHeaders = {}) {
+        const headers = {};
+        for (const name of FORWARDED_HEADERS) {
+            if (requestHeaders[name]) headers[name] = requestHeaders[name];
+        }
+        const res = await fetch(url, { headers, redirect: 'follow' });
+        if (!res.ok) return null;
+        const body = Buffer.from(await res.arrayBuffer());
+        return this.store(url, {
+            status: res.status,
+            contentType: res.headers.get('content-type') || 'application/octet-stream',
+            body
+        });
+    }
+
+    async attach(page) {
+        if (this.mode === 'off') return;
+        await page.setRequestInterception(true);
+        page.on('request', request => {
+            this.handle(request).catch(() => request.continue().catch(() => {}));
+        });
+    }
+
+    async handle(request) {
+        const url = request.url();
+        if (!MIRRORED_TYPES.has(request.resourceType()) || !/^https?:/.test(url)) {
+            return request.continue();
+        }
+        let entry = await this.lookup(url);
+        if (entry) {
+            this.hits++;
+        } else {
+            this.misses++;
+            if (this.mode !== 'offline') {
+                entry = await this.fetchAndStore(url, request.headers()).catch(() => null);
+            }
+        }
+        if (!entry) {
+            return request.abort(this.mode === 'offline' ? 'internetdisconnected' : 'failed');
+        }
+        return request.respond({
+            status: entry.status,
+            contentType: entry.contentType,
+            // Font từ fonts.gstatic.com được tải theo CORS
+            headers: { 'Access-Control-Allow-Origin': '*' },
+            body: entry.body
+        });
+    }
+}
+
+async function collectHtmlFiles(targets) {
+    const files = [];
+    for (const target of targets) {
+        const stat = await fs.stat(target);
+        if (stat.isDirectory()) {
+            for (const name of (await fs.readdir(target)).sort()) {
+                if (name.endsWith('.html')) files.push(path.join(target, name));
+            }
+        } else {
+            files.push(target);
+        }
+    }
+    return files;
+}
+
+// Warm-up: mở từng slide qua mirror ở mode 'cache' để tải sẵn mọi font/CSS/ảnh nó dùng
+async function warmMirror(targets, { concurrency = 4 } = {}) {
+    const puppeteer = require('puppeteer');
+    const files = await collectHtmlFiles(targets);
+    const mirror = new AssetMirror(DEFAULT_MIRROR_DIR, 'cache');
+    const browser = await puppeteer.launch({
+        headless: true,
+        args: ["--no-sandbox", "--disable-setuid-sandbox", "--disable-dev-shm-usage"]
+    });
+    let next = 0;
+    try {
+        const worker = async () => {
+            const page = await browser.newPage();
+            await mirror.attach(page);
+            while (next < files.length) {
+                const file = files[next++];
+                try {
+                    await page.goto(`file://${path.resolve(file)}`, { waitUntil: 'networkidle0', timeout: 60000 });
+                    await page.evaluate(() => document.fonts.ready);
+                    console.log(`[JS] ✅ Warmed: ${file}`);
+                } catch (e) {
+                    console.warn(`[JS] ⚠️ Warm-up failed for ${file}: ${e.message}`);
+                }
+            }
+            await page.close();
+        };
+        await Promise.all(Array.from({ length: Math.min(concurrency, files.length) }, worker));
+    } finally {
+        await browser.close();
+    }
+    console.log(`[JS] 📦 Mirror ${mirror.dir}: ${mirror.misses} assets fetched, ${mirror.hits} already present`);
+}
+
+module.exports = { AssetMirror, DEFAULT_MIRROR_DIR, warmMirror };
+
+if (require.main === module) {
+    const [command, ...targets] = process.argv.slice(2);
+    if (command !== 'warm' || targets.length === 0) {
+        console.error('Usage: node asset-mirror.js warm <file.html|dir>...');
+        process.exit(1);
+    }
+    warmMirror(targets).catch(error => {
+        console.error('[JS] ❌ Warm-up failed:', error);
+        process.exit(1);
+    });
+}
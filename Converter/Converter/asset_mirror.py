@@ -0,0 +1,131 @@
+"""
+Phía Python của mirror asset cục bộ (cùng định dạng trên đĩa với asset-mirror.js), dùng cho
+các đường chụp ảnh bằng Playwright. Nạp sẵn mirror bằng:
+
+    node asset-mirror.js warm all_slides_test/
+
+mode: 'off' | 'cache' (thiếu thì tải rồi lưu) | 'offline' (thiếu thì abort ngay).
+"""
+
+import os
+import json
+import hashlib
+import asyncio
+import threading
+from collections import OrderedDict
+
+CONVERTER_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_MIRROR_DIR = os.environ.get('ASSET_MIRROR_DIR', os.path.join(CONVERTER_DIR, '.asset_mirror'))
+MIRRORED_TYPES = {'font', 'stylesheet', 'image'}
+# Body của các asset hay dùng được giữ trong RAM (LRU theo bytes); phần còn lại đọc lại từ đĩa
+MEMO_MAX_BYTES = int(float(os.environ.get('ASSET_MIRROR_MEMO_MB', '64')) * 1024 * 1024)
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _write_atomic(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{os.urandom(4).hex()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class AssetMirror:
+    def __init__(self, root=DEFAULT_MIRROR_DIR, mode=None, memo_max_bytes=MEMO_MAX_BYTES):
+        self.root = root
+        self.mode = mode or os.environ.get('ASSET_MIRROR_MODE', 'cache')
+        self.memo_max_bytes = memo_max_bytes
+        self.memo_bytes = 0
+        self._memo = OrderedDict()
+        self._memo_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def meta_path(self, url):
+        return os.path.join(self.root, 'urls', _sha256(url.encode('utf-8')) + '.json')
+
+    def object_path(self, digest):
+        return os.path.join(self.root, 'objects', digest[:2], digest)
+
+    def lookup(self, url):
+        """Trả về dict {url, hash, status, contentType, body} hoặc None."""
+        with self._memo_lock:
+            entry = self._memo.get(url)
+            if entry is not None:
+                self._memo.move_to_end(url)
+                return entry
+        try:
+            with open(self.meta_path(url), 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(self.object_path(meta['hash']), 'rb') as f:
+                entry = dict(meta, body=f.read())
+        except (OSError, ValueError, KeyError):
+            return None
+        self._remember(url, entry)
+        return entry
+
+    def _remember(self, url, entry):
+        with self._memo_lock:
+            previous = self._memo.pop(url, None)
+            if previous is not None:
+                self.memo_bytes -= len(previous['body'])
+            if len(entry['body']) > self.memo_max_bytes:
+                return
+            self._memo[url] = entry
+            self.memo_bytes += len(entry['body'])
+            while self.memo_bytes > self.memo_max_bytes:
+                _, evicted = self._memo.popitem(last=False)
+                self.memo_bytes -= len(evicted['body'])
+
+    def store(self, url, status, content_type, body):
+        digest = _sha256(body)
+        _write_atomic(self.object_path(digest), body)
+        meta = {'url': url, 'hash': digest, 'status': status, 'contentType': content_type}
+        _write_atomic(self.meta_path(url), json.dumps(meta).encode('utf-8'))
+        entry = dict(meta, body=body)
+        self._remember(url, entry)
+        return entry
+
+    async def handle_route(self, route):
+        """Route handler cho Playwright async API (page.route / context.route)."""
+        request = route.request
+        url = request.url
+        if request.resource_type not in MIRRORED_TYPES or not url.startswith(('http://', 'https://')):
+            await route.continue_()
+            return
+
+        # Đọc/ghi file của mirror chạy trên thread pool, không chặn event loop của Playwright
+        loop = asyncio.get_running_loop()
+        entry = await loop.run_in_executor(None, self.lookup, url)
+        if entry is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            if self.mode == 'offline':
+                await route.abort('internetdisconnected')
+                return
+            try:
+                response = await route.fetch()
+            except Exception:
+                await route.abort('failed')
+                return
+            if not response.ok:
+                await route.fulfill(response=response)
+                return
+            entry = await loop.run_in_executor(
+                None, self.store, url, response.status,
+                response.headers.get('content-type', 'application/octet-stream'), await response.body())
+
+        await route.fulfill(
+            status=entry['status'],
+            headers={'content-type': entry['contentType'], 'access-control-allow-origin': '*'},
+            body=entry['body'],
+        )
+
+    async def install(self, target):
+        """Chặn request của một Page hoặc BrowserContext Playwright qua mirror."""
+        if self.mode != 'off':
+            await target.route('**/*', self.handle_route)
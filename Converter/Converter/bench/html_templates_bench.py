@@ -0,0 +1,79 @@
+"""
+Benchmark html_templates (template biên dịch sẵn) so với gọi thẳng f-string của html_lib,
+trên toàn bộ generator `generate_*`. Mỗi lần gọi đổi giá trị các slot chuỗi để không đo
+nhầm một output hằng; output của hai đường được so khớp trước khi đo.
+
+Cột "compiled" luôn đi đường template; cột "library" là thứ CompiledLibrary thực sự trả về
+(template nếu nó nhanh hơn, ngược lại hàm gốc).
+
+    python bench/html_templates_bench.py [số lần gọi mỗi generator, mặc định 2000]
+"""
+
+import os
+import sys
+import time
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import html_lib  # noqa: E402
+from html_templates import CompiledGenerator, CompiledLibrary  # noqa: E402
+
+
+def call_args(compiled, rounds):
+    """Một bộ kwargs cho mỗi lần gọi: slot chuỗi nhận giá trị khác nhau, còn lại giữ mặc định."""
+    text_slots = [name for name in compiled.slots if isinstance(compiled.defaults[name], str)]
+    return [{name: f'{compiled.defaults[name]} {i}' for name in text_slots} for i in range(rounds)]
+
+
+def timed(fn, calls, repeats=5):
+    """Thời gian tốt nhất trong `repeats` lượt gọi hết `calls` (bớt nhiễu của máy)."""
+    best = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for kwargs in calls:
+            fn(**kwargs)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    generators = sorted(html_lib.iter_generators())
+
+    library = CompiledLibrary(html_lib)
+    rows = []
+    for name, fn in generators:
+        compiled = CompiledGenerator(fn)
+        calls = call_args(compiled, rounds)
+        started = time.perf_counter()
+        first = compiled(**calls[0])
+        compile_ms = (time.perf_counter() - started) * 1000
+        if first != fn(**calls[0]) or compiled(**calls[-1]) != fn(**calls[-1]):
+            print(f'!! {name}: output khác hàm gốc')
+            continue
+        chosen = getattr(library, name)
+        direct = timed(fn, calls)
+        fast = timed(compiled, calls)
+        adaptive = timed(chosen, calls)
+        rows.append((name, direct / rounds * 1e6, fast / rounds * 1e6, adaptive / rounds * 1e6,
+                     compile_ms, chosen is not fn))
+
+    print(f'{"generator":45} {"f-string µs":>12} {"compiled µs":>12} {"library µs":>11} {"x":>6} {"compile ms":>11}')
+    for name, direct, fast, adaptive, compile_ms, templated in sorted(rows, key=lambda r: r[1] / r[3]):
+        mark = '' if templated else ' (f-string)'
+        print(f'{name:45} {direct:12.2f} {fast:12.2f} {adaptive:11.2f} {direct / adaptive:6.1f} {compile_ms:11.2f}{mark}')
+
+    total_direct = sum(r[1] for r in rows)
+    total_fast = sum(r[2] for r in rows)
+    total_adaptive = sum(r[3] for r in rows)
+    print(f'\n{len(rows)} generator, {rounds} lần gọi mỗi generator; '
+          f'{sum(1 for r in rows if r[5])} generator dùng template trong CompiledLibrary')
+    print(f'Tổng một lượt mọi generator: f-string {total_direct:.1f} µs, compiled {total_fast:.1f} µs '
+          f'({total_direct / total_fast:.2f}x), library {total_adaptive:.1f} µs ({total_direct / total_adaptive:.2f}x)')
+    print(f'Compile trung bình {statistics.mean(r[4] for r in rows):.2f} ms (một lần mỗi generator)')
+
+
+if __name__ == '__main__':
+    main()
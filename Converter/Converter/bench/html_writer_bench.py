@@ -0,0 +1,67 @@
+"""
+Benchmark html_writer (ghi theo luồng) so với gọi thẳng generator rồi ghi nguyên chuỗi, với
+các slide có danh sách dài (vòng lặp `+=` trong generator). Đo peak bộ nhớ (tracemalloc) và
+thời gian ghi vào một sink bỏ dữ liệu; output nối lại của hai đường được so khớp trước khi đo.
+
+    python bench/html_writer_bench.py [số item mỗi slide, mặc định 5000]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import html_lib  # noqa: E402
+from html_writer import render_to  # noqa: E402
+
+
+class NullSink:
+    def write(self, data):
+        pass
+
+
+def cases(items):
+    steps = [{'image_url': f'https://example.com/{i}.png', 'title': f'Bước {i}', 'description': 'Mô tả ' * 10}
+             for i in range(items)]
+    milestones = [{'year': str(2000 + i), 'title': f'Mốc {i}', 'desc': 'Mô tả ' * 10} for i in range(items)]
+    columns = max(1, int(items ** 0.5))
+    return [
+        ('generate_process_steps_slide', {'steps': steps}),
+        ('generate_timeline_slide', {'milestones': milestones}),
+        ('generate_content_slide', {'items': [f'Mục {i}' for i in range(columns * columns)],
+                                    'num_columns': columns, 'num_rows': columns}),
+    ]
+
+
+def measure(fn):
+    tracemalloc.start()
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed * 1000, peak / 1024
+
+
+def main():
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    print(f'{"generator":32} {"KB output":>10} {"chuỗi ms":>9} {"chuỗi KB":>9} {"luồng ms":>9} {"luồng KB":>9}')
+    for name, kwargs in cases(items):
+        fn = getattr(html_lib, name)
+        expected = fn(**kwargs)
+        chunks = []
+        render_to(chunks.append, name, **kwargs)
+        if ''.join(chunks) != expected:
+            print(f'!! {name}: output khác hàm gốc')
+            continue
+        sink = NullSink()
+        direct_ms, direct_kb = measure(lambda: sink.write(fn(**kwargs)))
+        stream_ms, stream_kb = measure(lambda: render_to(sink, name, **kwargs))
+        print(f'{name:32} {len(expected) / 1024:10.0f} {direct_ms:9.1f} {direct_kb:9.0f} {stream_ms:9.1f} {stream_kb:9.0f}')
+    print(f'\n{items} item mỗi slide; KB = peak bộ nhớ cấp phát trong lúc render + ghi')
+
+
+if __name__ == '__main__':
+    main()
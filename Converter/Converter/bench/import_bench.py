@@ -0,0 +1,59 @@
+"""
+Benchmark thời gian import html_lib (package nạp lười) trong interpreter mới, ở hai trạng thái:
+  cold: chưa có bytecode (.pyc) — lần chạy đầu, container mới, thư mục chỉ đọc
+  warm: .pyc đã có sẵn
+
+Ba kịch bản:
+  package      import html_lib
+  1 generator  import html_lib + html_lib.generate_title_slide (nạp đúng module con intro)
+  all          import html_lib + nạp mọi module con (tương đương html_lib.py một file trước đây)
+
+    python bench/import_bench.py [số lần chạy mỗi kịch bản, mặc định 15]
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import statistics
+import subprocess
+
+CONVERTER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    'package': 'import html_lib',
+    '1 generator': 'import html_lib; html_lib.generate_title_slide',
+    'all': 'import html_lib; list(html_lib.iter_generators())',
+}
+
+# Chỉ đo phần import, không tính thời gian khởi động interpreter
+PROBE = 'import time; t = time.perf_counter(); {code}; print((time.perf_counter() - t) * 1000)'
+
+
+def run(code: str, pycache: str) -> float:
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    out = subprocess.run(
+        [sys.executable, '-X', f'pycache_prefix={pycache}', '-c', PROBE.format(code=code)],
+        cwd=CONVERTER_DIR, env=env, capture_output=True, text=True, check=True)
+    return float(out.stdout.strip())
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    print(f'{"kịch bản":14} {"cold ms":>10} {"warm ms":>10}')
+    for name, code in SCENARIOS.items():
+        cold, warm = [], []
+        for _ in range(rounds):
+            pycache = tempfile.mkdtemp(prefix='import-bench-')
+            try:
+                cold.append(run(code, pycache))  # prefix rỗng: phải biên dịch từ source
+                warm.append(run(code, pycache))  # lần hai dùng .pyc vừa ghi
+            finally:
+                shutil.rmtree(pycache, ignore_errors=True)
+        print(f'{name:14} {statistics.median(cold):10.2f} {statistics.median(warm):10.2f}')
+    print(f'\nTrung vị của {rounds} lần chạy, mỗi lần một interpreter mới')
+
+
+if __name__ == '__main__':
+    main()
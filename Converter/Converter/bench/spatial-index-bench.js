@@ -0,0 +1,110 @@
+// Benchmark các pass hình học của converter.js trên slide tổng hợp 5k–20k element:
+// bản gốc (elementsData.find / divsWithBackground.some) so với spatial-index.js.
+//   node bench/spatial-index-bench.js [5000 10000 20000]
+const { centerTextBlocks, indexPanels } = require('../spatial-index');
+
+const SLIDE_W = 1920;
+const SLIDE_H = 1080;
+
+// Bản gốc, giữ nguyên logic trước khi có spatial index
+function centerTextBlocksNaive(elementsData) {
+    elementsData.forEach((el) => {
+        if (['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'span', 'label', 'button', 'a'].includes(el.tagName)) {
+            const parentBox = elementsData.find(box =>
+                ['div', 'section', 'article', 'main'].includes(box.tagName) &&
+                box !== el &&
+                el.relativeX >= box.relativeX &&
+                el.relativeY >= box.relativeY &&
+                el.relativeX + el.rect.width <= box.relativeX + box.rect.width &&
+                el.relativeY + el.rect.height <= box.relativeY + box.rect.height
+            );
+            if (parentBox) {
+                const centerX = parentBox.relativeX + parentBox.rect.width / 2 - el.rect.width / 2;
+                const centerY = parentBox.relativeY + parentBox.rect.height / 2 - el.rect.height / 2;
+                if (Math.abs(el.relativeX - centerX) < 20 && Math.abs(el.relativeY - centerY) < 20) {
+                    el.relativeX = centerX;
+                    el.relativeY = centerY;
+                }
+            }
+        }
+    });
+}
+
+function hasPanelInsideNaive(panels, el) {
+    return panels.some(child => child !== el &&
+        child.relativeX >= el.relativeX &&
+        child.relativeY >= el.relativeY &&
+        child.relativeX + child.rect.width <= el.relativeX + el.rect.width + 50 &&
+        child.relativeY + child.rect.height <= el.relativeY + el.rect.height + 50);
+}
+
+// PRNG cố định để hai bản chạy trên cùng dữ liệu
+function rng(seed) {
+    return () => {
+        seed = (seed * 1664525 + 1013904223) >>> 0;
+        return seed / 4294967296;
+    };
+}
+
+// Lưới card (div có nền) chứa heading/paragraph, cộng các container toàn màn hình
+// không chứa panel nào (trường hợp xấu nhất cho .some).
+function makeSlide(count) {
+    const rand = rng(count);
+    const elements = [];
+    const cards = Math.ceil(count / 4);
+    const cols = Math.ceil(Math.sqrt(cards * SLIDE_W / SLIDE_H));
+    const cardW = SLIDE_W / cols;
+    const cardH = SLIDE_H / Math.ceil(cards / cols);
+    for (let i = 0; elements.length < count; i++) {
+        const x = (i % cols) * cardW;
+        const y = Math.floor(i / cols) * cardH;
+        elements.push({ tagName: 'div', relativeX: x, relativeY: y, rect: { width: cardW, height: cardH }, bg: rand() < 0.5 });
+        for (const tagName of ['h3', 'p', 'span']) {
+            const w = cardW * (0.3 + rand() * 0.5);
+            const h = cardH * (0.1 + rand() * 0.2);
+            elements.push({
+                tagName,
+                relativeX: x + (cardW - w) / 2 + (rand() - 0.5) * 30,
+                relativeY: y + (cardH - h) / 2 + (rand() - 0.5) * 30,
+                rect: { width: w, height: h }
+            });
+        }
+    }
+    return elements.slice(0, count);
+}
+
+function time(fn) {
+    const started = process.hrtime.bigint();
+    const result = fn();
+    return { ms: Number(process.hrtime.bigint() - started) / 1e6, result };
+}
+
+function runPasses(elements, indexed) {
+    const panels = elements.filter(el => el.tagName === 'div' && el.bg);
+    // 50 container "full-screen" giả lập, đặt lệch ra ngoài để không chứa panel nào
+    const containers = Array.from({ length: 50 }, (_, i) => ({
+        tagName: 'div', relativeX: SLIDE_W + i, relativeY: 0, rect: { width: SLIDE_W, height: SLIDE_H }
+    }));
+    if (indexed) {
+        centerTextBlocks(elements, SLIDE_W, SLIDE_H);
+        const index = indexPanels(panels, SLIDE_W, SLIDE_H);
+        return containers.map(c => index.hasPanelInside(c)).concat(elements.filter(e => e.tagName === 'div').map(c => index.hasPanelInside(c)));
+    }
+    centerTextBlocksNaive(elements);
+    return containers.map(c => hasPanelInsideNaive(panels, c)).concat(elements.filter(e => e.tagName === 'div').map(c => hasPanelInsideNaive(panels, c)));
+}
+
+const sizes = process.argv.slice(2).map(Number).filter(Boolean);
+console.log('elements  naive_ms  indexed_ms  speedup  indexed_us/element  same_result');
+for (const count of sizes.length ? sizes : [5000, 10000, 15000, 20000]) {
+    const naiveData = makeSlide(count);
+    const indexedData = makeSlide(count);
+    const naive = time(() => runPasses(naiveData, false));
+    const indexed = time(() => runPasses(indexedData, true));
+    const same = JSON.stringify(naive.result) === JSON.stringify(indexed.result) &&
+        naiveData.every((el, i) => el.relativeX === indexedData[i].relativeX && el.relativeY === indexedData[i].relativeY);
+    console.log(
+        `${String(count).padStart(8)}  ${naive.ms.toFixed(1).padStart(8)}  ${indexed.ms.toFixed(1).padStart(10)}  ` +
+        `${(naive.ms / indexed.ms).toFixed(1).padStart(6)}x  ${(indexed.ms * 1000 / count).toFixed(2).padStart(18)}  ${same}`
+    );
+}
@@ -0,0 +1,162 @@
+"""
+Cache trên đĩa cho output của converter.js, đánh địa chỉ theo nội dung.
+
+Key = sha256(HTML đầu vào + viewport + phiên bản converter + options), thêm thư mục chứa file
+đầu vào với input là file (asset tương đối như `images/a.png` phụ thuộc vào nó); phiên bản
+converter là hash của các file *.js và package-lock.json cạnh converter.js — sửa converter
+hay nâng Puppeteer/Chromium đều tự làm cache cũ hết hiệu lực. Dung lượng bị giới hạn,
+entry ít dùng nhất bị xoá trước (LRU theo mtime, được "touch" mỗi lần hit).
+"""
+
+import os
+import json
+import glob
+import hashlib
+import threading
+
+CONVERTER_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(CONVERTER_DIR, '.conversion_cache')
+DEFAULT_VIEWPORT = (1920, 1080, 1)
+
+_version = None
+
+
+def converter_version():
+    """Hash của mã nguồn converter (các file *.js + package-lock.json), tính một lần."""
+    global _version
+    if _version is None:
+        digest = hashlib.sha256()
+        sources = sorted(glob.glob(os.path.join(CONVERTER_DIR, '*.js')))
+        sources.append(os.path.join(CONVERTER_DIR, 'package-lock.json'))
+        for source in sources:
+            if os.path.isfile(source):
+                digest.update(os.path.basename(source).encode('utf-8'))
+                with open(source, 'rb') as f:
+                    digest.update(f.read())
+        _version = digest.hexdigest()[:16]
+    return _version
+
+
+class ConversionCache:
+    def __init__(self, root=DEFAULT_CACHE_DIR, max_bytes=512 * 1024 * 1024):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._sizes = None  # path -> size, nạp lười bằng một lần quét thư mục
+
+    def key(self, html, viewport=DEFAULT_VIEWPORT, options=None, base_dir=None):
+        """base_dir: thư mục của file HTML đầu vào (None với HTML không có URL gốc)."""
+        if isinstance(html, str):
+            html = html.encode('utf-8')
+        digest = hashlib.sha256()
+        digest.update(converter_version().encode('ascii'))
+        params = [list(viewport), options or {}]
+        if base_dir is not None:
+            # Cùng HTML ở hai thư mục khác nhau tham chiếu tới asset tương đối khác nhau
+            params.append(os.path.realpath(base_dir))
+        digest.update(json.dumps(params, sort_keys=True).encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(html)
+        return digest.hexdigest()
+
+    def path_for(self, key, suffix='.html'):
+        return os.path.join(self.root, key[:2], key + suffix)
+
+    def get(self, key, suffix='.html'):
+        """
+        Trả về bytes đã cache hoặc None. suffix chọn artifact đi kèm cùng key (vd. '.layout.json',
+        '.html.gz'); chỉ lần tra output chính ('.html') được tính vào hits/misses.
+        """
+        path = self.path_for(key, suffix)
+        counted = suffix == '.html'
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            if counted:
+                with self._lock:
+                    self.misses += 1
+            return None
+        try:
+            os.utime(path)  # đánh dấu vừa dùng cho LRU
+        except OSError:
+            pass
+        if counted:
+            with self._lock:
+                self.hits += 1
+        return data
+
+    def put(self, key, data, suffix='.html'):
+        path = self.path_for(key, suffix)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        with self._lock:
+            sizes = self._load_sizes()
+            sizes[path] = len(data)
+            if sum(sizes.values()) > self.max_bytes:
+                self._evict(sizes)
+
+    def stats(self):
+        with self._lock:
+            sizes = self._load_sizes()
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(sizes),
+                'bytes': sum(sizes.values()),
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def _load_sizes(self):
+        if self._sizes is None:
+            self._sizes = {}
+            for path in glob.glob(os.path.join(self.root, '*', '*')):
+                if path.endswith('.tmp'):
+                    continue
+                try:
+                    self._sizes[path] = os.path.getsize(path)
+                except OSError:
+                    pass
+        return self._sizes
+
+    def _evict(self, sizes):
+        def mtime(path):
+            try:
+                return os.path.getmtime(path)
+            except OSError:
+                return 0
+
+        total = sum(sizes.values())
+        # Xoá tới 90% giới hạn để không phải evict lại ngay ở lần put kế tiếp
+        target = self.max_bytes * 0.9
+        for path in sorted(sizes, key=mtime):
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= sizes.pop(path)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_conversion_cache():
+    """Cache dùng chung trong process; cấu hình qua CONVERSION_CACHE_DIR / CONVERSION_CACHE_MAX_MB."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ConversionCache(
+                root=os.environ.get('CONVERSION_CACHE_DIR', DEFAULT_CACHE_DIR),
+                max_bytes=int(os.environ.get('CONVERSION_CACHE_MAX_MB', '512')) * 1024 * 1024,
+            )
+        return _cache
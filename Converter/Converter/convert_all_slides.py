@@ -6,15 +6,57 @@ Tự động phát hiện tất cả file HTML - không hardcode tên file.
 """
 
 import os
+import json
+import math
 import time
+import argparse
 from pathlib import Path
-from converter import run_html_converter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from converter import get_converter_daemon, convert_file_cached
+from layout_ir import layout_path_for
 
 
-def convert_all_continuous():
+FAILED_LOG_NAME = ".failed.json"
+
+
+def _percentile(values, pct):
+    """Percentile theo nearest-rank (values đã sort)."""
+    if not values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(values)))
+    return values[rank - 1]
+
+
+def _convert_one(daemon, html_file, output_path, retries, options=None):
+    """
+    Chuyển đổi một file qua conversion cache + converter daemon. Ghi ra file tạm rồi os.replace để một lần
+    chạy bị dừng giữa chừng không để lại output dở dang (lần chạy sau sẽ làm lại file đó).
+    """
+    tmp_path = output_path.with_name(output_path.name + ".part")
+    started = time.perf_counter()
+    last_error = None
+    for _ in range(retries + 1):
+        try:
+            result = convert_file_cached(str(html_file), str(tmp_path), daemon, options)
+            if result.get("layoutOutput"):
+                os.replace(result["layoutOutput"], layout_path_for(str(output_path)))
+            os.replace(tmp_path, output_path)
+            return True, time.perf_counter() - started, None
+        except Exception as e:
+            last_error = str(e).strip().splitlines()[0] if str(e).strip() else repr(e)
+    if tmp_path.exists():
+        tmp_path.unlink()
+    return False, time.perf_counter() - started, last_error
+
+
+def convert_all_continuous(workers=4, retries=1, options=None):
     """
     Chuyển đổi tất cả files HTML từ all_slides_test sang converted_slides.
     Tự động quét thư mục nguồn - hoạt động với bất kỳ file nào.
+
+    Chạy song song tối đa `workers` file trên converter daemon (một Chromium, pool page).
+    Tiến trình in theo đúng thứ tự file. File đã có output được bỏ qua, file lỗi được ghi vào
+    converted_slides/.failed.json và sẽ được thử lại ở lần chạy sau.
     """
     input_dir = Path("all_slides_test")
     output_dir = Path("converted_slides")
@@ -37,47 +79,87 @@ def convert_all_continuous():
     if total_files == 0:
         print("⚠️  Không tìm thấy file HTML nào trong thư mục nguồn!")
         return {"total": 0, "success": 0, "error": 0, "skipped": 0, "duration": 0}
+
+    failed_log = output_dir / FAILED_LOG_NAME
+    previous_failures = json.loads(failed_log.read_text(encoding="utf-8")) if failed_log.exists() else {}
     
-    print(f"\n🔄 Bắt đầu chuyển đổi {total_files} file HTML...")
+    print(f"\n🔄 Bắt đầu chuyển đổi {total_files} file HTML ({workers} workers)...")
+    if previous_failures:
+        print(f"🔁 Thử lại {len(previous_failures)} file lỗi từ lần chạy trước")
     print("=" * 80)
     
     success_count = 0
     error_count = 0
     skipped_count = 0
+    failures = {}
+    latencies = []
     start_time = time.time()
-    
-    for i, html_file in enumerate(html_files, 1):
-        output_filename = html_file.stem + "_converted.html"
-        output_path = output_dir / output_filename
-        
-        # Skip nếu đã tồn tại
-        if output_path.exists():
-            print(f"⏭️  [{i}/{total_files}] Đã tồn tại: {output_filename}")
-            skipped_count += 1
-            continue
-        
-        print(f"\n📄 [{i}/{total_files}] Đang chuyển đổi: {html_file.name}")
-        
-        try:
-            run_html_converter(str(html_file), str(output_path))
-            
+
+    # Kết quả hoàn thành không theo thứ tự → buffer lại và in theo thứ tự file
+    results = {}
+    next_to_print = 1
+
+    def flush_progress():
+        nonlocal next_to_print
+        while next_to_print in results:
+            html_file, output_filename, status, elapsed, error = results.pop(next_to_print)
+            prefix = f"[{next_to_print}/{total_files}]"
+            if status == "skipped":
+                print(f"⏭️  {prefix} Đã tồn tại: {output_filename}")
+            elif status == "success":
+                print(f"✅ {prefix} {html_file.name} → {output_filename} ({elapsed:.2f}s)")
+            else:
+                print(f"❌ {prefix} {html_file.name}: {error}")
+            next_to_print += 1
+
+    daemon = get_converter_daemon(pool_size=workers)
+    executor = ThreadPoolExecutor(max_workers=workers)
+    futures = {}
+    try:
+        for i, html_file in enumerate(html_files, 1):
+            output_filename = html_file.stem + "_converted.html"
+            output_path = output_dir / output_filename
+
+            # Skip nếu đã tồn tại
             if output_path.exists():
-                print(f"    ✅ Thành công: {output_filename}")
+                results[i] = (html_file, output_filename, "skipped", 0.0, None)
+                skipped_count += 1
+                continue
+
+            future = executor.submit(_convert_one, daemon, html_file, output_path, retries, options)
+            futures[future] = (i, html_file, output_filename)
+        flush_progress()
+
+        for future in as_completed(futures):
+            i, html_file, output_filename = futures[future]
+            ok, elapsed, error = future.result()
+            if ok:
                 success_count += 1
+                latencies.append(elapsed)
+                results[i] = (html_file, output_filename, "success", elapsed, None)
             else:
-                print(f"    ❌ Lỗi: File không được tạo")
                 error_count += 1
-                
-        except KeyboardInterrupt:
-            print(f"\n\n⚠️  Đã dừng tại file {i}/{total_files}")
-            break
-        except Exception as e:
-            print(f"    ❌ Lỗi: {str(e)}")
-            error_count += 1
-        
-        time.sleep(0.5)
+                failures[html_file.name] = error
+                results[i] = (html_file, output_filename, "error", elapsed, error)
+            flush_progress()
+
+    except KeyboardInterrupt:
+        print(f"\n\n⚠️  Đã dừng - {success_count + skipped_count}/{total_files} file đã xong, chạy lại để tiếp tục")
+        for future in futures:
+            future.cancel()
+    finally:
+        executor.shutdown(wait=True)
+
+    if failures:
+        failed_log.write_text(json.dumps(failures, ensure_ascii=False, indent=2), encoding="utf-8")
+    elif failed_log.exists():
+        failed_log.unlink()
     
     duration = time.time() - start_time
+    latencies.sort()
+    throughput = success_count / duration if duration > 0 else 0.0
+    p50 = _percentile(latencies, 50)
+    p95 = _percentile(latencies, 95)
     
     print("\n" + "=" * 80)
     print("📊 KẾT QUẢ:")
@@ -86,18 +168,25 @@ def convert_all_continuous():
     print(f"  ⏭️  Bỏ qua: {skipped_count}")
     print(f"  📁 Tổng: {total_files}")
     print(f"  ⏱️  Thời gian: {duration:.1f}s")
+    print(f"  🚀 Throughput: {throughput:.2f} slides/s")
+    print(f"  📈 Latency/slide: p50 {p50:.2f}s, p95 {p95:.2f}s")
     
     if success_count + skipped_count == total_files:
         print("\n🎉 HOÀN THÀNH!")
     else:
         print(f"\n⚠️  Còn {total_files - success_count - skipped_count} files chưa chuyển đổi")
+        if failures:
+            print(f"💡 Danh sách lỗi: {failed_log}")
     
     return {
         "total": total_files,
         "success": success_count,
         "error": error_count,
         "skipped": skipped_count,
-        "duration": duration
+        "duration": duration,
+        "throughput": throughput,
+        "p50": p50,
+        "p95": p95
     }
 
 
@@ -179,11 +268,31 @@ def create_final_index():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Chuyển đổi tất cả slides trong all_slides_test")
+    parser.add_argument("-j", "--workers", type=int, default=int(os.environ.get("CONVERTER_POOL_SIZE", "4")),
+                        help="Số slide chuyển đổi song song (mặc định 4)")
+    parser.add_argument("--retries", type=int, default=1, help="Số lần thử lại mỗi file lỗi trong một lần chạy")
+    parser.add_argument("--compact-styles", action="store_true",
+                        help="Chỉ xuất các thuộc tính style khác mặc định của thẻ (output gọn hơn)")
+    parser.add_argument("--dedupe-styles", action="store_true",
+                        help="Gom style lặp lại thành class sinh tự động, inline chỉ giữ vị trí/kích thước")
+    parser.add_argument("--layout", action="store_true",
+                        help="Ghi thêm layout IR (<tên>_converted.layout.json) cạnh mỗi slide")
+    args = parser.parse_args()
+
     print("🚀 Bắt đầu chuyển đổi tất cả slides...")
     print("💡 Bấm Ctrl+C để dừng\n")
     
+    options = {}
+    if args.compact_styles:
+        options["compactStyles"] = True
+    if args.dedupe_styles:
+        options["dedupeStyles"] = True
+    if args.layout:
+        options["layout"] = True
+
     try:
-        result = convert_all_continuous()
+        result = convert_all_continuous(workers=args.workers, retries=args.retries, options=options or None)
         
         if result["success"] > 0:
             print("\n📝 Đang tạo file index...")
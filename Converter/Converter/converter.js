@@ -1,12 +1,57 @@
 const puppeteer = require('puppeteer');
 const fs = require('fs/promises');
 const path = require('path');
+const net = require('net');
+const readline = require('readline');
+const { AssetMirror } = require('./asset-mirror');
 
-async function convertHtmlToAbsolute(inputFilePath, outputFilePath) {
-    console.log('[JS] 🚀 Starting advanced conversion process v2 (Block-aware)...');
+const VIEWPORT = { width: 1920, height: 1080, deviceScaleFactor: 1 };
+
+// Spatial index cho các pass hình học, inject vào trang trước khi phân tích layout
+const SPATIAL_INDEX_SOURCE = require('fs').readFileSync(path.join(__dirname, 'spatial-index.js'), 'utf8');
+
+// Font/CSS/ảnh được phục vụ từ mirror cục bộ (ASSET_MIRROR_MODE=off|cache|offline, --offline)
+const assetMirror = new AssetMirror();
+
+// left/top/width/height ở đầu chuỗi hoặc ngay sau ';' (không khớp min-width, max-height, ...)
+const GEOMETRY_DECL_RE = /(^|;)\s*(left|top|width|height)\s*:\s*([^;]*)/gi;
+
+// Layout IR (options.layout): elementsData sau hậu xử lý, ghi thành <output>.layout.json cạnh HTML.
+// Tăng version khi đổi ý nghĩa/tên trường; thêm trường mới thì không cần.
+const LAYOUT_IR_VERSION = 1;
+
+function layoutPathFor(outputPath) {
+    return outputPath.replace(/\.html?$/i, '') + '.layout.json';
+}
+
+// FNV-1a 32-bit, base36: tên class ổn định theo nội dung CSS
+function hashStyle(css) {
+    let hash = 0x811c9dc5;
+    for (let i = 0; i < css.length; i++) {
+        hash ^= css.charCodeAt(i);
+        hash = Math.imul(hash, 0x01000193);
+    }
+    return (hash >>> 0).toString(36);
+}
+
+// Thời gian từng phase (ms): mark(name) cộng dồn thời gian từ lần mark trước vào timings[name]
+function phaseTimer() {
+    let last = process.hrtime.bigint();
+    const timings = {};
+    return {
+        timings,
+        mark(name) {
+            const now = process.hrtime.bigint();
+            timings[name] = (timings[name] || 0) + Number(now - last) / 1e6;
+            last = now;
+        }
+    };
+}
+
+async function launchBrowser() {
     // ⚠️ DEV ONLY: --no-sandbox bypasses AppArmor restrictions on Ubuntu 23.10+
     // For production, fix Chrome sandbox properly per Chromium docs
-    const browser = await puppeteer.launch({
+    return puppeteer.launch({
         // executablePath: "/usr/bin/chromium-browser",
         headless: true,
         args: [
@@ -15,495 +60,708 @@ async function convertHtmlToAbsolute(inputFilePath, outputFilePath) {
             "--disable-dev-shm-usage"
         ]
     });
+}
+
+async function newConverterPage(browser) {
     const page = await browser.newPage();
+    await page.setViewport(VIEWPORT);
+    await assetMirror.attach(page);
+    return page;
+}
 
-    let inputHeadHtml = '';
-    try {
-        // Đọc input.html để lấy các thẻ <link rel="stylesheet"> và <style>
-        const inputRaw = await fs.readFile(inputFilePath, 'utf8');
-        const headMatch = inputRaw.match(/<head[\s\S]*?<\/head>/i);
-        if (headMatch) {
-            const headContent = headMatch[0];
-            // Lấy tất cả <link rel="stylesheet" ...> và <style>...</style>
-            const linkAndStyleTags = headContent.match(/<(link[^>]*rel=["']stylesheet["'][^>]*>|style[\s\S]*?<\/style>)/gi);
-            if (linkAndStyleTags) {
-                inputHeadHtml = linkAndStyleTags.join('\n');
+// source: { inputPath } (mở file://, giữ được đường dẫn tương đối) hoặc { html } (page.setContent, không chạm đĩa)
+// options.compactStyles: chỉ xuất thuộc tính khác mặc định của thẻ; options.styleReport: đo thêm bản cũ để so sánh
+// timer: phaseTimer() của caller để gộp các phase ngoài convertPage (launch, acquire, write) vào cùng kết quả
+async function convertPage(page, source, options = {}, timer = phaseTimer()) {
+    // Offline mọi asset đến từ đĩa: 'load' đã bao gồm CSS/ảnh, không cần chờ 500ms network idle
+    const waitUntil = assetMirror.mode === 'offline' ? 'load' : 'networkidle0';
+    if (source.html !== undefined) {
+        await page.setContent(source.html, { waitUntil });
+        console.log(`[JS] 📁 Page loaded from string (${source.html.length} chars)`);
+    } else {
+        const absoluteInputPath = path.resolve(source.inputPath);
+        await page.goto(`file://${absoluteInputPath}`, { waitUntil });
+        console.log(`[JS] 📁 Page loaded: ${absoluteInputPath}`);
+    }
+
+    // Lấy các thẻ <link rel="stylesheet"> và <style> của <head> từ DOM đã parse (không đọc lại file)
+    const inputHeadHtml = await page.evaluate(() =>
+        Array.from(document.head.querySelectorAll('link[rel="stylesheet"], style'))
+            .map(el => el.outerHTML)
+            .join('\n')
+    ).catch(e => {
+        console.warn('[JS] ⚠️ Không thể lấy font/style từ input:', e);
+        return '';
+    });
+    timer.mark('load');
+
+    console.log('[JS] ⏳ Waiting for dynamic content to settle...');
+    await page.waitForFunction(() => document.fonts.ready.then(() => true), { timeout: 10000 }).catch(() => console.warn('[JS] ⚠️ Font loading timed out.'));
+    console.log('[JS] ✅ Fonts are ready.');
+    timer.mark('fonts');
+
+    await page.evaluate(async () => {
+        await Promise.all(document.getAnimations().map(anim => anim.finished));
+        await new Promise(requestAnimationFrame);
+    }).catch(() => console.warn('[JS] ⚠️ Animation waiting failed.'));
+    console.log('[JS] ✅ Animations have finished.');
+    timer.mark('animations');
+
+    await page.evaluate(SPATIAL_INDEX_SOURCE);
+
+    const pageData = await page.evaluate((options) => {
+        const stylePropsToCopy = [
+            'color', 'background', 'background-color', 'background-image', 'background-size',
+            'background-position', 'background-repeat', 'background-attachment', 'background-clip',
+            'font-family', 'font-size', 'font-weight', 'font-style', 'line-height',
+            'text-align', 'text-decoration', 'text-transform', 'text-shadow', 'letter-spacing', 'word-spacing',
+            'border-radius', 'border-image', 'opacity', 'box-shadow', 'filter', 'transform', 'transform-origin',
+            'fill', 'stroke', 'stroke-width', 'stroke-linecap', 'stroke-linejoin', 'stroke-dasharray',
+            'cursor', 'transition', 'user-select', 'pointer-events',
+            'list-style-type', 'list-style-position', 'list-style-image', 'clip-path',
+            // Bổ sung các thuộc tính quan trọng cho layout và text
+            'margin', 'margin-top', 'margin-right', 'margin-bottom', 'margin-left',
+            'padding', 'padding-top', 'padding-right', 'padding-bottom', 'padding-left',
+            'box-sizing', 'line-height', 'letter-spacing', 'text-align', 'vertical-align', 'white-space',
+            // ✅ THÊM: Các thuộc tính cho hình ảnh và kích thước
+            'width', 'height', 'min-width', 'min-height', 'max-width', 'max-height',
+            'object-fit', 'object-position', 'aspect-ratio', 'display'
+        ];
+
+        function getLegacyVisualStyles(element) {
+            const computedStyle = window.getComputedStyle(element);
+            let styleString = '';
+            const inlineStyle = element.getAttribute('style');
+            if (inlineStyle) {
+                styleString += inlineStyle.endsWith(';') ? inlineStyle : inlineStyle + '; ';
+            }
+            for (const prop of stylePropsToCopy) {
+                if (inlineStyle && inlineStyle.includes(prop + ':')) continue;
+                const value = computedStyle.getPropertyValue(prop);
+                if (value && value !== 'none' && value !== '0px' && value !== 'normal' && value !== 'initial' && value !== 'auto') {
+                    styleString += `${prop}: ${value}; `;
+                }
+            }
+            const borderProps = ['border-top', 'border-right', 'border-bottom', 'border-left'];
+            for (const prop of borderProps) {
+                styleString += `${prop}: ${computedStyle.getPropertyValue(prop)}; `;
             }
+            return styleString;
         }
-    } catch (e) {
-        console.warn('[JS] ⚠️ Không thể lấy font/style từ input:', e);
-    }
 
-    try {
-        const absoluteInputPath = path.resolve(inputFilePath);
+        // Thuộc tính kế thừa: output là cây phẳng nên vẫn phải ghi rõ (giữ rule lọc cũ).
+        // Thuộc tính không kế thừa: so với style mặc định của cùng thẻ trong iframe trống.
+        const inheritedProps = new Set([
+            'color', 'font-family', 'font-size', 'font-weight', 'font-style', 'line-height',
+            'text-align', 'text-transform', 'text-shadow', 'letter-spacing', 'word-spacing', 'white-space',
+            'fill', 'stroke', 'stroke-width', 'stroke-linecap', 'stroke-linejoin', 'stroke-dasharray',
+            'cursor', 'pointer-events', 'list-style-type', 'list-style-position', 'list-style-image'
+        ]);
+        const uniqueStyleProps = Array.from(new Set(stylePropsToCopy));
+        const defaultStyleCache = new Map();
+        let defaultsFrame = null;
+
+        function getDefaultStyle(element) {
+            const key = `${element.namespaceURI}|${element.tagName}`;
+            if (defaultStyleCache.has(key)) return defaultStyleCache.get(key);
+            if (!defaultsFrame) {
+                defaultsFrame = document.createElement('iframe');
+                defaultsFrame.style.cssText = 'position:absolute;left:-10000px;top:0;width:0;height:0;border:0;visibility:hidden;';
+                document.documentElement.appendChild(defaultsFrame);
+            }
+            const frameDoc = defaultsFrame.contentDocument;
+            const probe = frameDoc.createElementNS(element.namespaceURI, element.tagName.toLowerCase());
+            frameDoc.body.appendChild(probe);
+            const probeStyle = defaultsFrame.contentWindow.getComputedStyle(probe);
+            const defaults = {};
+            for (const prop of uniqueStyleProps) defaults[prop] = probeStyle.getPropertyValue(prop);
+            probe.remove();
+            defaultStyleCache.set(key, defaults);
+            return defaults;
+        }
 
-        await page.setViewport({ width: 1920, height: 1080, deviceScaleFactor: 1 });
+        function getCompactVisualStyles(element) {
+            const computedStyle = window.getComputedStyle(element);
+            const defaults = getDefaultStyle(element);
+            let styleString = '';
+            const inlineStyle = element.getAttribute('style');
+            if (inlineStyle) {
+                styleString += inlineStyle.endsWith(';') ? inlineStyle : inlineStyle + '; ';
+            }
+            for (const prop of uniqueStyleProps) {
+                if (inlineStyle && element.style.getPropertyValue(prop) !== '') continue;
+                const value = computedStyle.getPropertyValue(prop);
+                if (!value) continue;
+                if (inheritedProps.has(prop)) {
+                    if (value === 'none' || value === '0px' || value === 'normal' || value === 'initial' || value === 'auto') continue;
+                } else if (value === defaults[prop]) {
+                    continue;
+                }
+                styleString += `${prop}: ${value}; `;
+            }
+            for (const side of ['top', 'right', 'bottom', 'left']) {
+                if (computedStyle.getPropertyValue(`border-${side}-style`) === 'none') continue;
+                if (computedStyle.getPropertyValue(`border-${side}-width`) === '0px') continue;
+                styleString += `border-${side}: ${computedStyle.getPropertyValue(`border-${side}`)}; `;
+            }
+            return styleString;
+        }
 
-        await page.goto(`file://${absoluteInputPath}`, { waitUntil: 'networkidle0' });
-        console.log(`[JS] 📁 Page loaded: ${absoluteInputPath}`);
+        const styleStats = { elements: 0, ms: 0, bytes: 0, legacyMs: 0, legacyBytes: 0 };
+
+        function getVisualStyles(element) {
+            const extract = options.compactStyles ? getCompactVisualStyles : getLegacyVisualStyles;
+            const started = performance.now();
+            const styleString = extract(element);
+            styleStats.ms += performance.now() - started;
+            styleStats.elements++;
+            styleStats.bytes += styleString.length;
+            if (options.styleReport && options.compactStyles) {
+                const legacyStarted = performance.now();
+                styleStats.legacyBytes += getLegacyVisualStyles(element).length;
+                styleStats.legacyMs += performance.now() - legacyStarted;
+            }
+            return styleString;
+        }
 
-        console.log('[JS] ⏳ Waiting for dynamic content to settle...');
-        await page.waitForFunction(() => document.fonts.ready.then(() => true), { timeout: 10000 }).catch(() => console.warn('[JS] ⚠️ Font loading timed out.'));
-        console.log('[JS] ✅ Fonts are ready.');
-
-        await page.evaluate(async () => {
-            await Promise.all(document.getAnimations().map(anim => anim.finished));
-            await new Promise(requestAnimationFrame);
-        }).catch(() => console.warn('[JS] ⚠️ Animation waiting failed.'));
-        console.log('[JS] ✅ Animations have finished.');
-
-        const pageData = await page.evaluate(() => {
-            const stylePropsToCopy = [
-                'color', 'background', 'background-color', 'background-image', 'background-size',
-                'background-position', 'background-repeat', 'background-attachment', 'background-clip',
-                'font-family', 'font-size', 'font-weight', 'font-style', 'line-height',
-                'text-align', 'text-decoration', 'text-transform', 'text-shadow', 'letter-spacing', 'word-spacing',
-                'border-radius', 'border-image', 'opacity', 'box-shadow', 'filter', 'transform', 'transform-origin',
-                'fill', 'stroke', 'stroke-width', 'stroke-linecap', 'stroke-linejoin', 'stroke-dasharray',
-                'cursor', 'transition', 'user-select', 'pointer-events',
-                'list-style-type', 'list-style-position', 'list-style-image', 'clip-path',
-                // Bổ sung các thuộc tính quan trọng cho layout và text
-                'margin', 'margin-top', 'margin-right', 'margin-bottom', 'margin-left',
-                'padding', 'padding-top', 'padding-right', 'padding-bottom', 'padding-left',
-                'box-sizing', 'line-height', 'letter-spacing', 'text-align', 'vertical-align', 'white-space',
-                // ✅ THÊM: Các thuộc tính cho hình ảnh và kích thước
-                'width', 'height', 'min-width', 'min-height', 'max-width', 'max-height',
-                'object-fit', 'object-position', 'aspect-ratio', 'display'
-            ];
-
-            function getVisualStyles(element) {
-                const computedStyle = window.getComputedStyle(element);
-                let styleString = '';
-                const inlineStyle = element.getAttribute('style');
-                if (inlineStyle) {
-                    styleString += inlineStyle.endsWith(';') ? inlineStyle : inlineStyle + '; ';
-                }
-                for (const prop of stylePropsToCopy) {
-                    if (inlineStyle && inlineStyle.includes(prop + ':')) continue;
-                    const value = computedStyle.getPropertyValue(prop);
-                    if (value && value !== 'none' && value !== '0px' && value !== 'normal' && value !== 'initial' && value !== 'auto') {
-                        styleString += `${prop}: ${value}; `;
-                    }
-                }
-                const borderProps = ['border-top', 'border-right', 'border-bottom', 'border-left'];
-                for (const prop of borderProps) {
-                    styleString += `${prop}: ${computedStyle.getPropertyValue(prop)}; `;
+        function getImportantAttributes(element) {
+            const attributes = {};
+            const tagName = element.tagName.toLowerCase();
+            const importantAttrs = {
+                'img': ['src', 'alt', 'title', 'loading', 'decoding'], 'a': ['href', 'target', 'title', 'rel'],
+                'input': ['type', 'name', 'value', 'placeholder', 'required', 'disabled', 'readonly', 'checked'],
+                'textarea': ['name', 'placeholder', 'required', 'disabled', 'readonly', 'rows', 'cols'],
+                'button': ['type', 'name', 'disabled'], 'form': ['action', 'method', 'target'], 'iframe': ['src', 'title', 'allowfullscreen'],
+                'video': ['src', 'controls', 'poster'], 'audio': ['src', 'controls'], 'label': ['for']
+            };
+            const globalAttrs = ['id', 'class', 'title', 'lang', 'data-*'];
+            const allAttrs = [...(importantAttrs[tagName] || []), ...globalAttrs];
+            allAttrs.forEach(attr => {
+                if (attr === 'data-*') {
+                    Array.from(element.attributes).forEach(attribute => {
+                        if (attribute.name.startsWith('data-')) attributes[attribute.name] = attribute.value;
+                    });
+                } else {
+                    const value = element.getAttribute(attr);
+                    if (value !== null) attributes[attr] = value;
                 }
-                return styleString;
+            });
+            return attributes;
+        }
+
+        const isBackgroundLayer = (el, mainContainer) => {
+            const tag = el.tagName.toLowerCase();
+            let cls = '';
+            if (typeof el.className === 'string') {
+                cls = el.className.toLowerCase();
+            } else if (el.className && typeof el.className.baseVal === 'string') {
+                cls = el.className.baseVal.toLowerCase();
             }
 
-            function getImportantAttributes(element) {
-                const attributes = {};
-                const tagName = element.tagName.toLowerCase();
-                const importantAttrs = {
-                    'img': ['src', 'alt', 'title', 'loading', 'decoding'], 'a': ['href', 'target', 'title', 'rel'],
-                    'input': ['type', 'name', 'value', 'placeholder', 'required', 'disabled', 'readonly', 'checked'],
-                    'textarea': ['name', 'placeholder', 'required', 'disabled', 'readonly', 'rows', 'cols'],
-                    'button': ['type', 'name', 'disabled'], 'form': ['action', 'method', 'target'], 'iframe': ['src', 'title', 'allowfullscreen'],
-                    'video': ['src', 'controls', 'poster'], 'audio': ['src', 'controls'], 'label': ['for']
-                };
-                const globalAttrs = ['id', 'class', 'title', 'lang', 'data-*'];
-                const allAttrs = [...(importantAttrs[tagName] || []), ...globalAttrs];
-                allAttrs.forEach(attr => {
-                    if (attr === 'data-*') {
-                        Array.from(element.attributes).forEach(attribute => {
-                            if (attribute.name.startsWith('data-')) attributes[attribute.name] = attribute.value;
-                        });
-                    } else {
-                        const value = element.getAttribute(attr);
-                        if (value !== null) attributes[attr] = value;
+            return (
+                el === mainContainer ||
+                (tag === 'div' && (cls.includes('background') || cls.includes('bg')))
+            );
+        };
+
+
+        const { centerTextBlocks, indexPanels } = window.__slidegenLayout;
+
+        // Kết quả isOrIsInside được nhớ theo từng element (mỗi tập tagNames một bảng),
+        // nên cả pass chỉ đi qua mỗi tổ tiên một lần thay vì một lần cho mỗi con cháu.
+        const insideMemo = new Map();
+
+        const helperFunctions = {
+            isOrIsInside: (element, tagNames) => {
+                const memoKey = tagNames.join(',');
+                let memo = insideMemo.get(memoKey);
+                if (!memo) insideMemo.set(memoKey, memo = new Map());
+                const path = [];
+                let current = element;
+                let result = false;
+                while (current && current !== document.body) {
+                    if (memo.has(current)) {
+                        result = memo.get(current);
+                        break;
                     }
-                });
-                return attributes;
+                    path.push(current);
+                    if (tagNames.includes(current.tagName.toLowerCase())) {
+                        result = true;
+                        break;
+                    }
+                    current = current.parentElement;
+                }
+                // Mọi node đã đi qua có cùng kết quả (đều nằm dưới node quyết định kết quả)
+                for (const node of path) memo.set(node, result);
+                return result;
+            },
+            escapeHtml: (content) => {
+                return content
+                    .replace(/&/g, '&amp;')
+                    .replace(/</g, '&lt;')
+                    .replace(/>/g, '&gt;')
+                    .replace(/"/g, '&quot;')
+                    .replace(/'/g, '&#39;');
             }
+        };
 
-            const isBackgroundLayer = (el, mainContainer) => {
-                const tag = el.tagName.toLowerCase();
-                let cls = '';
-                if (typeof el.className === 'string') {
-                    cls = el.className.toLowerCase();
-                } else if (el.className && typeof el.className.baseVal === 'string') {
-                    cls = el.className.baseVal.toLowerCase();
-                }
+        const mainContainer = document.body;
+        const containerRect = mainContainer.getBoundingClientRect();
+        const elements = Array.from(mainContainer.querySelectorAll('*:not(script, style, meta, link, title)'));
+        const elementsData = [];
+        const processedElements = new Set();
 
-                return (
-                    el === mainContainer ||
-                    (tag === 'div' && (cls.includes('background') || cls.includes('bg')))
-                );
-            };
+        elements.forEach((el, index) => {
+            if (processedElements.has(el)) return;
 
+            const style = window.getComputedStyle(el);
+            if (style.visibility === 'hidden' || style.display === 'none' || style.opacity === '0') return;
 
-            const helperFunctions = {
-                isOrIsInside: (element, tagNames) => {
-                    let current = element;
-                    while (current && current !== document.body) {
-                        if (tagNames.includes(current.tagName.toLowerCase())) return true;
-                        current = current.parentElement;
-                    }
-                    return false;
-                },
-                escapeHtml: (content) => {
-                    return content
-                        .replace(/&/g, '&amp;')
-                        .replace(/</g, '&lt;')
-                        .replace(/>/g, '&gt;')
-                        .replace(/"/g, '&quot;')
-                        .replace(/'/g, '&#39;');
-                }
-            };
+            const rect = el.getBoundingClientRect();
+            if (rect.width === 0 && rect.height === 0) return;
 
-            const mainContainer = document.body;
-            const containerRect = mainContainer.getBoundingClientRect();
-            const elements = Array.from(mainContainer.querySelectorAll('*:not(script, style, meta, link, title)'));
-            const elementsData = [];
-            const processedElements = new Set();
-
-            elements.forEach((el, index) => {
-                if (processedElements.has(el)) return;
-
-                const style = window.getComputedStyle(el);
-                if (style.visibility === 'hidden' || style.display === 'none' || style.opacity === '0') return;
-
-                const rect = el.getBoundingClientRect();
-                if (rect.width === 0 && rect.height === 0) return;
-
-                const tagName = el.tagName.toLowerCase();
-
-                // ✅ SPECIAL: Capture divs containing SVG (chỉ div trực tiếp chứa SVG, không phải container lớn)
-                if (tagName === 'div') {
-                    // Kiểm tra xem div có SVG child TRỰC TIẾP không (không phải SVG ở sâu bên trong)
-                    const hasDirectSvgChild = Array.from(el.children).some(child => child.tagName.toLowerCase() === 'svg');
-
-                    if (hasDirectSvgChild) {
-                        const divRect = el.getBoundingClientRect();
-                        if (divRect.width > 0 && divRect.height > 0) {
-                            elementsData.push({
-                                tagName: 'div',
-                                rect: { width: divRect.width, height: divRect.height },
-                                style: getVisualStyles(el),
-                                attributes: getImportantAttributes(el),
-                                content: el.innerHTML, // Giữ nguyên SVG bên trong
-                                index,
-                                relativeX: divRect.left - containerRect.left,
-                                relativeY: divRect.top - containerRect.top,
-                                zIndex: 100 + index
-                            });
-                            el.querySelectorAll('*').forEach(child => processedElements.add(child)); // Mark tất cả children
-                            processedElements.add(el);
-                            return; // Dừng xử lý element này
-                        }
-                    }
-                }
+            const tagName = el.tagName.toLowerCase();
 
-                // ✅ SPECIAL: Luôn capture SVG elements riêng biệt (nếu không nằm trong div đã xử lý)
-                if (tagName === 'svg') {
-                    const svgRect = el.getBoundingClientRect();
-                    if (svgRect.width > 0 && svgRect.height > 0) {
+            // ✅ SPECIAL: Capture divs containing SVG (chỉ div trực tiếp chứa SVG, không phải container lớn)
+            if (tagName === 'div') {
+                // Kiểm tra xem div có SVG child TRỰC TIẾP không (không phải SVG ở sâu bên trong)
+                const hasDirectSvgChild = Array.from(el.children).some(child => child.tagName.toLowerCase() === 'svg');
+
+                if (hasDirectSvgChild) {
+                    const divRect = el.getBoundingClientRect();
+                    if (divRect.width > 0 && divRect.height > 0) {
                         elementsData.push({
                             tagName: 'div',
-                            rect: { width: svgRect.width, height: svgRect.height },
+                            rect: { width: divRect.width, height: divRect.height },
                             style: getVisualStyles(el),
                             attributes: getImportantAttributes(el),
-                            content: el.outerHTML,
+                            content: el.innerHTML, // Giữ nguyên SVG bên trong
                             index,
-                            relativeX: svgRect.left - containerRect.left,
-                            relativeY: svgRect.top - containerRect.top,
+                            relativeX: divRect.left - containerRect.left,
+                            relativeY: divRect.top - containerRect.top,
                             zIndex: 100 + index
                         });
-                        el.querySelectorAll('*').forEach(child => processedElements.add(child));
+                        el.querySelectorAll('*').forEach(child => processedElements.add(child)); // Mark tất cả children
                         processedElements.add(el);
-                        return;
+                        return; // Dừng xử lý element này
                     }
                 }
+            }
 
-                const isComplexBlock = ['ul', 'ol', 'table', 'figure'].includes(tagName);
-                let content = '';
-
-                if (isComplexBlock) {
-                    content = el.innerHTML;
-                    el.querySelectorAll('*').forEach(child => processedElements.add(child));
-                } else if (helperFunctions.isOrIsInside(el.parentElement, ['ul', 'ol', 'table', 'figure'])) {
-                    return;
-                } else if (['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'a', 'button'].includes(tagName)) {
-                    content = el.innerHTML;
+            // ✅ SPECIAL: Luôn capture SVG elements riêng biệt (nếu không nằm trong div đã xử lý)
+            if (tagName === 'svg') {
+                const svgRect = el.getBoundingClientRect();
+                if (svgRect.width > 0 && svgRect.height > 0) {
+                    elementsData.push({
+                        tagName: 'div',
+                        rect: { width: svgRect.width, height: svgRect.height },
+                        style: getVisualStyles(el),
+                        attributes: getImportantAttributes(el),
+                        content: el.outerHTML,
+                        index,
+                        relativeX: svgRect.left - containerRect.left,
+                        relativeY: svgRect.top - containerRect.top,
+                        zIndex: 100 + index
+                    });
                     el.querySelectorAll('*').forEach(child => processedElements.add(child));
-                } else if (['span', 'strong', 'b', 'em', 'i', 'u', 'mark', 'small', 'code', 'sub', 'sup'].includes(tagName)) {
-                    // ✅ BỎ QUA inline elements - chúng sẽ được giữ trong innerHTML của parent
+                    processedElements.add(el);
                     return;
-                } else if (tagName === 'svg') {
-                    content = el.outerHTML;
-                } else if (['img', 'input', 'br', 'hr', 'iframe', 'video'].includes(tagName)) {
-                    content = '';
-                } else if (tagName === 'div') {
-                    // ✅ DIV: Kiểm tra có text hoặc inline elements không
-                    const hasOnlyTextAndInline = Array.from(el.childNodes).every(node => {
-                        if (node.nodeType === Node.TEXT_NODE) return true;
-                        if (node.nodeType === Node.ELEMENT_NODE) {
-                            const childTag = node.tagName.toLowerCase();
-                            return ['span', 'strong', 'b', 'em', 'i', 'u', 'mark', 'small', 'code', 'sub', 'sup', 'br'].includes(childTag);
-                        }
-                        return false;
-                    });
+                }
+            }
 
-                    if (hasOnlyTextAndInline) {
-                        // Chỉ có text và inline → lấy innerHTML, mark inline elements
-                        content = el.innerHTML;
-                        el.querySelectorAll('span, strong, b, em, i, u, mark, small, code, sub, sup').forEach(child => processedElements.add(child));
-                    } else {
-                        // Có block elements con → không lấy innerHTML, để các con tự xử lý
-                        content = '';
+            const isComplexBlock = ['ul', 'ol', 'table', 'figure'].includes(tagName);
+            let content = '';
+
+            if (isComplexBlock) {
+                content = el.innerHTML;
+                el.querySelectorAll('*').forEach(child => processedElements.add(child));
+            } else if (helperFunctions.isOrIsInside(el.parentElement, ['ul', 'ol', 'table', 'figure'])) {
+                return;
+            } else if (['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'a', 'button'].includes(tagName)) {
+                content = el.innerHTML;
+                el.querySelectorAll('*').forEach(child => processedElements.add(child));
+            } else if (['span', 'strong', 'b', 'em', 'i', 'u', 'mark', 'small', 'code', 'sub', 'sup'].includes(tagName)) {
+                // ✅ BỎ QUA inline elements - chúng sẽ được giữ trong innerHTML của parent
+                return;
+            } else if (tagName === 'svg') {
+                content = el.outerHTML;
+            } else if (['img', 'input', 'br', 'hr', 'iframe', 'video'].includes(tagName)) {
+                content = '';
+            } else if (tagName === 'div') {
+                // ✅ DIV: Kiểm tra có text hoặc inline elements không
+                const hasOnlyTextAndInline = Array.from(el.childNodes).every(node => {
+                    if (node.nodeType === Node.TEXT_NODE) return true;
+                    if (node.nodeType === Node.ELEMENT_NODE) {
+                        const childTag = node.tagName.toLowerCase();
+                        return ['span', 'strong', 'b', 'em', 'i', 'u', 'mark', 'small', 'code', 'sub', 'sup', 'br'].includes(childTag);
                     }
-                } else {
-                    el.childNodes.forEach(node => {
-                        if (node.nodeType === Node.TEXT_NODE && node.textContent.trim()) {
-                            content += helperFunctions.escapeHtml(node.textContent);
-                        }
-                    });
-                }
+                    return false;
+                });
 
-                let computedZIndex;
-                if (isBackgroundLayer(el, mainContainer)) {
-                    computedZIndex = 0; // Nền luôn là thấp nhất
+                if (hasOnlyTextAndInline) {
+                    // Chỉ có text và inline → lấy innerHTML, mark inline elements
+                    content = el.innerHTML;
+                    el.querySelectorAll('span, strong, b, em, i, u, mark, small, code, sub, sup').forEach(child => processedElements.add(child));
                 } else {
-                    computedZIndex = 100 + index; // Đảm bảo không trùng, tăng dần theo thứ tự
+                    // Có block elements con → không lấy innerHTML, để các con tự xử lý
+                    content = '';
                 }
-
-                // ✅ SPECIAL: Với hình ảnh, tìm container cha có class image-container
-                let useRect = { width: rect.width, height: rect.height };
-                let useX = rect.left - containerRect.left;
-                let useY = rect.top - containerRect.top;
-
-                if (tagName === 'img') {
-                    // Tìm container cha có class chứa "image"
-                    let parent = el.parentElement;
-                    while (parent && parent !== mainContainer) {
-                        if (parent.className && parent.className.includes('image-container')) {
-                            const parentRect = parent.getBoundingClientRect();
-                            useRect = { width: parentRect.width, height: parentRect.height };
-                            useX = parentRect.left - containerRect.left;
-                            useY = parentRect.top - containerRect.top;
-                            break;
-                        }
-                        parent = parent.parentElement;
+            } else {
+                el.childNodes.forEach(node => {
+                    if (node.nodeType === Node.TEXT_NODE && node.textContent.trim()) {
+                        content += helperFunctions.escapeHtml(node.textContent);
                     }
-                }
-
-                elementsData.push({
-                    tagName: tagName === 'svg' ? 'div' : tagName,
-                    rect: useRect,
-                    style: getVisualStyles(el),
-                    attributes: getImportantAttributes(el),
-                    content,
-                    index,
-                    relativeX: useX,
-                    relativeY: useY,
-                    zIndex: computedZIndex
                 });
+            }
 
-                processedElements.add(el);
-            });
+            let computedZIndex;
+            if (isBackgroundLayer(el, mainContainer)) {
+                computedZIndex = 0; // Nền luôn là thấp nhất
+            } else {
+                computedZIndex = 100 + index; // Đảm bảo không trùng, tăng dần theo thứ tự
+            }
 
-            // Sau khi thu thập xong elementsData, tự động căn giữa các block text nếu nằm gần giữa một box
-            elementsData.forEach((el) => {
-                if ([
-                    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'span', 'label', 'button', 'a'
-                ].includes(el.tagName)) {
-                    const parentBox = elementsData.find(box =>
-                        ['div', 'section', 'article', 'main'].includes(box.tagName) &&
-                        box !== el &&
-                        el.relativeX >= box.relativeX &&
-                        el.relativeY >= box.relativeY &&
-                        el.relativeX + el.rect.width <= box.relativeX + box.rect.width &&
-                        el.relativeY + el.rect.height <= box.relativeY + box.rect.height
-                    );
-                    if (parentBox) {
-                        const centerX = parentBox.relativeX + parentBox.rect.width / 2 - el.rect.width / 2;
-                        const centerY = parentBox.relativeY + parentBox.rect.height / 2 - el.rect.height / 2;
-                        if (Math.abs(el.relativeX - centerX) < 20 && Math.abs(el.relativeY - centerY) < 20) {
-                            el.relativeX = centerX;
-                            el.relativeY = centerY;
-                        }
+            // ✅ SPECIAL: Với hình ảnh, tìm container cha có class image-container
+            let useRect = { width: rect.width, height: rect.height };
+            let useX = rect.left - containerRect.left;
+            let useY = rect.top - containerRect.top;
+
+            if (tagName === 'img') {
+                // Tìm container cha có class chứa "image"
+                let parent = el.parentElement;
+                while (parent && parent !== mainContainer) {
+                    if (parent.className && parent.className.includes('image-container')) {
+                        const parentRect = parent.getBoundingClientRect();
+                        useRect = { width: parentRect.width, height: parentRect.height };
+                        useX = parentRect.left - containerRect.left;
+                        useY = parentRect.top - containerRect.top;
+                        break;
                     }
+                    parent = parent.parentElement;
                 }
+            }
+
+            elementsData.push({
+                tagName: tagName === 'svg' ? 'div' : tagName,
+                rect: useRect,
+                style: getVisualStyles(el),
+                attributes: getImportantAttributes(el),
+                content,
+                index,
+                relativeX: useX,
+                relativeY: useY,
+                zIndex: computedZIndex
             });
 
-            // ✅ TRÍCH XUẤT STYLE TỪ CONTAINER VÀ MERGE VÀO BODY
-            let containerStyles = { background: '', padding: { top: 0, right: 0, bottom: 0, left: 0 }, borderRadius: '', boxShadow: '' };
-
-            // Bước 1: Tìm các div con có background (như top-panel, bottom-panel)
-            const divsWithBackground = [];
-            elementsData.forEach(el => {
-                if (el.tagName === 'div') {
-                    const style = el.style.toLowerCase();
-                    const hasBackground =
-                        (style.includes('background-color') && !style.includes('background-color: rgba(0, 0, 0, 0)') && !style.includes('background-color: transparent')) ||
-                        (style.includes('background-image') && !style.includes('background-image: none')) ||
-                        (style.includes('background:') && !style.includes('background: none') && !style.includes('background: rgba(0, 0, 0, 0)'));
-
-                    if (hasBackground) {
-                        divsWithBackground.push(el);
-                    }
+            processedElements.add(el);
+        });
+
+        // Sau khi thu thập xong elementsData, tự động căn giữa các block text nếu nằm gần giữa một box
+        // (tra box chứa qua spatial grid thay vì elementsData.find cho từng text, xem spatial-index.js)
+        centerTextBlocks(elementsData, containerRect.width, containerRect.height);
+
+        // ✅ TRÍCH XUẤT STYLE TỪ CONTAINER VÀ MERGE VÀO BODY
+        let containerStyles = { background: '', padding: { top: 0, right: 0, bottom: 0, left: 0 }, borderRadius: '', boxShadow: '' };
+
+        // Bước 1: Tìm các div con có background (như top-panel, bottom-panel)
+        const divsWithBackground = [];
+        elementsData.forEach(el => {
+            if (el.tagName === 'div') {
+                const style = el.style.toLowerCase();
+                const hasBackground =
+                    (style.includes('background-color') && !style.includes('background-color: rgba(0, 0, 0, 0)') && !style.includes('background-color: transparent')) ||
+                    (style.includes('background-image') && !style.includes('background-image: none')) ||
+                    (style.includes('background:') && !style.includes('background: none') && !style.includes('background: rgba(0, 0, 0, 0)'));
+
+                if (hasBackground) {
+                    divsWithBackground.push(el);
                 }
-            });
+            }
+        });
 
-            // Bước 2: Phân loại container và trích xuất style
-            let shouldRemoveContainer = false;
-
-            elementsData.forEach((el, idx) => {
-                if (el.tagName === 'div') {
-                    const isFullScreenContainer =
-                        (el.rect.width >= 1900 && el.rect.height >= 1000) ||
-                        (el.relativeX <= 10 && el.relativeY <= 10 && el.rect.width >= containerRect.width * 0.95);
-
-                    if (isFullScreenContainer) {
-                        // Kiểm tra xem container có chứa child panels với background không
-                        const hasChildPanelsWithBg = divsWithBackground.some(child => {
-                            return child !== el && // Không phải chính nó
-                                child.relativeX >= el.relativeX &&
-                                child.relativeY >= el.relativeY &&
-                                child.relativeX + child.rect.width <= el.relativeX + el.rect.width + 50 && // +50 tolerance
-                                child.relativeY + child.rect.height <= el.relativeY + el.rect.height + 50;
-                        });
+        // Bước 2: Phân loại container và trích xuất style
+        let shouldRemoveContainer = false;
+        const panelIndex = indexPanels(divsWithBackground, containerRect.width, containerRect.height);
 
-                        // ✅ THÊM: Kiểm tra pseudo-elements (::before, ::after)
-                        const realElement = elements[idx];
-                        let hasPseudoElementsWithBg = false;
-                        if (realElement) {
-                            const beforeStyle = window.getComputedStyle(realElement, '::before');
-                            const afterStyle = window.getComputedStyle(realElement, '::after');
-
-                            const checkPseudoBg = (pseudoStyle) => {
-                                if (!pseudoStyle) return false;
-                                const bgColor = pseudoStyle.backgroundColor;
-                                const bgImage = pseudoStyle.backgroundImage;
-                                return (bgColor && bgColor !== 'rgba(0, 0, 0, 0)' && bgColor !== 'transparent') ||
-                                    (bgImage && bgImage !== 'none');
-                            };
+        elementsData.forEach((el, idx) => {
+            if (el.tagName === 'div') {
+                const isFullScreenContainer =
+                    (el.rect.width >= 1900 && el.rect.height >= 1000) ||
+                    (el.relativeX <= 10 && el.relativeY <= 10 && el.rect.width >= containerRect.width * 0.95);
+
+                if (isFullScreenContainer) {
+                    // Kiểm tra xem container có chứa child panels với background không
+                    const hasChildPanelsWithBg = panelIndex.hasPanelInside(el, 50); // +50 tolerance
+
+                    // ✅ THÊM: Kiểm tra pseudo-elements (::before, ::after)
+                    const realElement = elements[idx];
+                    let hasPseudoElementsWithBg = false;
+                    if (realElement) {
+                        const beforeStyle = window.getComputedStyle(realElement, '::before');
+                        const afterStyle = window.getComputedStyle(realElement, '::after');
+
+                        const checkPseudoBg = (pseudoStyle) => {
+                            if (!pseudoStyle) return false;
+                            const bgColor = pseudoStyle.backgroundColor;
+                            const bgImage = pseudoStyle.backgroundImage;
+                            return (bgColor && bgColor !== 'rgba(0, 0, 0, 0)' && bgColor !== 'transparent') ||
+                                (bgImage && bgImage !== 'none');
+                        };
+
+                        hasPseudoElementsWithBg = checkPseudoBg(beforeStyle) || checkPseudoBg(afterStyle);
+                    }
+
+                    if (!hasChildPanelsWithBg && !hasPseudoElementsWithBg) {
+                        // TRƯỜNG HỢP 1: Container có background đơn giản, không có child panels màu, không có pseudo-elements
+                        // → Trích xuất background và đánh dấu để loại bỏ
+                        shouldRemoveContainer = true;
 
-                            hasPseudoElementsWithBg = checkPseudoBg(beforeStyle) || checkPseudoBg(afterStyle);
+                        const style = el.style;
+
+                        // Trích xuất background-color
+                        const bgColorMatch = style.match(/background-color:\s*(rgb\([^)]+\)|rgba\([^)]+\)|#[a-fA-F0-9]{3,8}|[a-z]+)/i);
+                        if (bgColorMatch) containerStyles.background = bgColorMatch[1];
+
+                        // Trích xuất background-image nếu có
+                        const bgImageMatch = style.match(/background-image:\s*([^;]+)/i);
+                        if (bgImageMatch && !bgImageMatch[1].includes('none')) {
+                            containerStyles.background = bgImageMatch[1];
                         }
 
-                        if (!hasChildPanelsWithBg && !hasPseudoElementsWithBg) {
-                            // TRƯỜNG HỢP 1: Container có background đơn giản, không có child panels màu, không có pseudo-elements
-                            // → Trích xuất background và đánh dấu để loại bỏ
-                            shouldRemoveContainer = true;
-
-                            const style = el.style;
-
-                            // Trích xuất background-color
-                            const bgColorMatch = style.match(/background-color:\s*(rgb\([^)]+\)|rgba\([^)]+\)|#[a-fA-F0-9]{3,8}|[a-z]+)/i);
-                            if (bgColorMatch) containerStyles.background = bgColorMatch[1];
-
-                            // Trích xuất background-image nếu có
-                            const bgImageMatch = style.match(/background-image:\s*([^;]+)/i);
-                            if (bgImageMatch && !bgImageMatch[1].includes('none')) {
-                                containerStyles.background = bgImageMatch[1];
-                            }
-
-                            // Trích xuất padding
-                            const paddingMatch = style.match(/padding:\s*([\d.]+)px\s+([\d.]+)px\s+([\d.]+)px\s+([\d.]+)px/i);
-                            if (paddingMatch) {
-                                containerStyles.padding = {
-                                    top: parseFloat(paddingMatch[1]),
-                                    right: parseFloat(paddingMatch[2]),
-                                    bottom: parseFloat(paddingMatch[3]),
-                                    left: parseFloat(paddingMatch[4])
-                                };
-                            }
-
-                            // Trích xuất border-radius
-                            const borderRadiusMatch = style.match(/border-radius:\s*([^;]+)/i);
-                            if (borderRadiusMatch) containerStyles.borderRadius = borderRadiusMatch[1];
-
-                            // Trích xuất box-shadow
-                            const boxShadowMatch = style.match(/box-shadow:\s*([^;]+)/i);
-                            if (boxShadowMatch && !boxShadowMatch[1].includes('none')) {
-                                containerStyles.boxShadow = boxShadowMatch[1];
-                            }
+                        // Trích xuất padding
+                        const paddingMatch = style.match(/padding:\s*([\d.]+)px\s+([\d.]+)px\s+([\d.]+)px\s+([\d.]+)px/i);
+                        if (paddingMatch) {
+                            containerStyles.padding = {
+                                top: parseFloat(paddingMatch[1]),
+                                right: parseFloat(paddingMatch[2]),
+                                bottom: parseFloat(paddingMatch[3]),
+                                left: parseFloat(paddingMatch[4])
+                            };
+                        }
+
+                        // Trích xuất border-radius
+                        const borderRadiusMatch = style.match(/border-radius:\s*([^;]+)/i);
+                        if (borderRadiusMatch) containerStyles.borderRadius = borderRadiusMatch[1];
+
+                        // Trích xuất box-shadow
+                        const boxShadowMatch = style.match(/box-shadow:\s*([^;]+)/i);
+                        if (boxShadowMatch && !boxShadowMatch[1].includes('none')) {
+                            containerStyles.boxShadow = boxShadowMatch[1];
                         }
-                        // else: TRƯỜNG HỢP 2 - Container có child panels màu → Giữ lại container
                     }
+                    // else: TRƯỜNG HỢP 2 - Container có child panels màu → Giữ lại container
                 }
-            });
+            }
+        });
 
-            // ✅ LỌC BỎ các div rỗng/trong suốt không có nội dung
-            const filteredElements = elementsData.filter(el => {
-                // Giữ lại tất cả các thẻ không phải div
-                if (el.tagName !== 'div') return true;
+        // ✅ LỌC BỎ các div rỗng/trong suốt không có nội dung
+        const filteredElements = elementsData.filter(el => {
+            // Giữ lại tất cả các thẻ không phải div
+            if (el.tagName !== 'div') return true;
 
-                // ❌ BỎ QUA các container chính (full-screen divs) - CHỈ nếu shouldRemoveContainer = true
-                const isFullScreenContainer =
-                    (el.rect.width >= 1900 && el.rect.height >= 1000) || // Gần full viewport
-                    (el.relativeX <= 10 && el.relativeY <= 10 && el.rect.width >= containerRect.width * 0.95); // Bắt đầu từ góc và chiếm >95% width
+            // ❌ BỎ QUA các container chính (full-screen divs) - CHỈ nếu shouldRemoveContainer = true
+            const isFullScreenContainer =
+                (el.rect.width >= 1900 && el.rect.height >= 1000) || // Gần full viewport
+                (el.relativeX <= 10 && el.relativeY <= 10 && el.rect.width >= containerRect.width * 0.95); // Bắt đầu từ góc và chiếm >95% width
 
-                if (isFullScreenContainer && shouldRemoveContainer) {
-                    // Loại bỏ container đơn giản - style đã được trích xuất
-                    return false;
-                }
+            if (isFullScreenContainer && shouldRemoveContainer) {
+                // Loại bỏ container đơn giản - style đã được trích xuất
+                return false;
+            }
 
-                // Kiểm tra div có nội dung không (text hoặc innerHTML)
-                const hasContent = el.content && el.content.trim().length > 0;
-                if (hasContent) return true;
+            // Kiểm tra div có nội dung không (text hoặc innerHTML)
+            const hasContent = el.content && el.content.trim().length > 0;
+            if (hasContent) return true;
 
-                // Kiểm tra div có background không (màu sắc hoặc hình ảnh)
-                const style = el.style.toLowerCase();
-                const hasBackground =
-                    (style.includes('background-color') && !style.includes('background-color: rgba(0, 0, 0, 0)') && !style.includes('background-color: transparent')) ||
-                    (style.includes('background-image') && !style.includes('background-image: none')) ||
-                    (style.includes('background:') && !style.includes('background: none') && !style.includes('background: rgba(0, 0, 0, 0)'));
+            // Kiểm tra div có background không (màu sắc hoặc hình ảnh)
+            const style = el.style.toLowerCase();
+            const hasBackground =
+                (style.includes('background-color') && !style.includes('background-color: rgba(0, 0, 0, 0)') && !style.includes('background-color: transparent')) ||
+                (style.includes('background-image') && !style.includes('background-image: none')) ||
+                (style.includes('background:') && !style.includes('background: none') && !style.includes('background: rgba(0, 0, 0, 0)'));
 
-                if (hasBackground) return true;
+            if (hasBackground) return true;
 
-                // Kiểm tra div có border không
-                const hasBorder =
-                    style.includes('border-top:') && !style.includes('border-top: 0px') && !style.includes('border-top: none') ||
-                    style.includes('border-right:') && !style.includes('border-right: 0px') && !style.includes('border-right: none') ||
-                    style.includes('border-bottom:') && !style.includes('border-bottom: 0px') && !style.includes('border-bottom: none') ||
-                    style.includes('border-left:') && !style.includes('border-left: 0px') && !style.includes('border-left: none');
+            // Kiểm tra div có border không
+            const hasBorder =
+                style.includes('border-top:') && !style.includes('border-top: 0px') && !style.includes('border-top: none') ||
+                style.includes('border-right:') && !style.includes('border-right: 0px') && !style.includes('border-right: none') ||
+                style.includes('border-bottom:') && !style.includes('border-bottom: 0px') && !style.includes('border-bottom: none') ||
+                style.includes('border-left:') && !style.includes('border-left: 0px') && !style.includes('border-left: none');
 
-                if (hasBorder) return true;
+            if (hasBorder) return true;
 
-                // Kiểm tra div có shadow không
-                const hasShadow = style.includes('box-shadow') && !style.includes('box-shadow: none');
-                if (hasShadow) return true;
+            // Kiểm tra div có shadow không
+            const hasShadow = style.includes('box-shadow') && !style.includes('box-shadow: none');
+            if (hasShadow) return true;
 
-                // Nếu không có gì → bỏ qua
-                return false;
-            });
+            // Nếu không có gì → bỏ qua
+            return false;
+        });
 
 
-            const svgDefsEl = document.querySelector('svg[width="0"][height="0"]');
-            const svgDefsHtml = svgDefsEl ? svgDefsEl.outerHTML : '';
+        const svgDefsEl = document.querySelector('svg[width="0"][height="0"]');
+        const svgDefsHtml = svgDefsEl ? svgDefsEl.outerHTML : '';
 
-            const bodyStyle = window.getComputedStyle(document.body);
-            const bg = (bodyStyle.backgroundImage && bodyStyle.backgroundImage !== 'none') ? bodyStyle.background : bodyStyle.backgroundColor;
+        const bodyStyle = window.getComputedStyle(document.body);
+        const bg = (bodyStyle.backgroundImage && bodyStyle.backgroundImage !== 'none') ? bodyStyle.background : bodyStyle.backgroundColor;
 
-            // THÊM svgDefsHtml VÀ containerStyles VÀO ĐỐI TƯỢNG TRẢ VỀ
-            return {
-                svgDefsHtml: svgDefsHtml,
-                bodyBg: bg,
-                containerStyles: containerStyles, // ✅ Style từ container
-                contentBlock: {
-                    width: containerRect.width,
-                    height: containerRect.height
-                },
-                elements: filteredElements  // ✅ Trả về danh sách đã lọc
-            };
-        });
+        if (defaultsFrame) defaultsFrame.remove();
+
+        // THÊM svgDefsHtml VÀ containerStyles VÀO ĐỐI TƯỢNG TRẢ VỀ
+        return {
+            styleStats: styleStats,
+            svgDefsHtml: svgDefsHtml,
+            bodyBg: bg,
+            containerStyles: containerStyles, // ✅ Style từ container
+            contentBlock: {
+                width: containerRect.width,
+                height: containerRect.height
+            },
+            elements: filteredElements  // ✅ Trả về danh sách đã lọc
+        };
+    }, options);
+
+    timer.mark('evaluate');
+
+    if (!pageData || pageData.elements.length === 0) {
+        throw new Error("No visible elements were found.");
+    }
 
-        if (!pageData || pageData.elements.length === 0) {
-            throw new Error("No visible elements were found.");
+    console.log(`[JS] ✅ Browser-side processing complete. Analyzed ${pageData.elements.length} final elements.`);
+
+    const stats = pageData.styleStats;
+    const styleReport = {
+        mode: options.compactStyles ? 'compact' : 'legacy',
+        elements: stats.elements,
+        bytes: stats.bytes,
+        msPerElement: stats.elements ? stats.ms / stats.elements : 0
+    };
+    if (options.compactStyles && options.styleReport) {
+        styleReport.legacyBytes = stats.legacyBytes;
+        styleReport.bytesSaved = stats.legacyBytes - stats.bytes;
+        styleReport.legacyMsPerElement = stats.elements ? stats.legacyMs / stats.elements : 0;
+        console.log(`[JS] 🎨 Compact styles: ${stats.bytes} bytes vs ${stats.legacyBytes} legacy (saved ${styleReport.bytesSaved}), ` +
+            `${styleReport.msPerElement.toFixed(3)} vs ${styleReport.legacyMsPerElement.toFixed(3)} ms/element`);
+    }
+
+    // ✅ Áp dụng background từ container (nếu có) vào body
+    const finalBodyBg = pageData.containerStyles.background || pageData.bodyBg;
+    const bodyPadding = pageData.containerStyles.padding;
+    const bodyBorderRadius = pageData.containerStyles.borderRadius;
+    const bodyBoxShadow = pageData.containerStyles.boxShadow;
+
+    // options.dedupeStyles: phần style chung (mọi thứ trừ vị trí/kích thước) được gom thành class sinh ra,
+    // mỗi chuỗi CSS chỉ xuất một lần trong <style>; inline chỉ còn z-index/left/top/width/height
+    const dedupe = Boolean(options.dedupeStyles);
+    const sharedRules = new Map(); // css → tên class
+    const ruleCss = new Map(); // tên class → css (phát hiện va chạm hash)
+    const dedupeReport = { rules: 0, legacyInlineBytes: 0, inlineBytes: 0, sharedBytes: 0 };
+    const layoutElements = [];
+    let elementsHtml = '';
+
+    pageData.elements.sort((a, b) => a.index - b.index).forEach(data => {
+        let visualStyle = data.style.replace(/z-index\s*:\s*[^;]+;?/g, '');
+
+        // ✅ Điều chỉnh vị trí dựa trên padding của container
+        const adjustedX = data.relativeX - bodyPadding.left;
+        const adjustedY = data.relativeY - bodyPadding.top;
+
+        // ✅ SPECIAL FIX: Xử lý đặc biệt cho hình ảnh với kích thước container cha  
+        let finalStyle;
+        if (data.tagName === 'img') {
+            // Loại bỏ các thuộc tính width/height cũ và làm clean CSS
+            let cleanStyleContent = visualStyle
+                .replace(/\bwidth\s*:\s*[^;]+;?\s*/gi, '')
+                .replace(/\bheight\s*:\s*[^;]+;?\s*/gi, '')
+                .replace(/\bobject-fit\s*:\s*[^;]+;?\s*/gi, '')
+                .replace(/stroke-\s*/gi, 'stroke-width: 1px; stroke-') // Sửa lỗi stroke- thiếu width
+                .replace(/;\s*;/g, ';') // Loại bỏ dấu ; thừa
+                .replace(/^\s*;|;\s*$/g, '') // Loại bỏ ; ở đầu/cuối
+                .trim();
+
+            // Đảm bảo có dấu ; cuối nếu cần
+            if (cleanStyleContent && !cleanStyleContent.endsWith(';')) {
+                cleanStyleContent += ';';
+            }
+            visualStyle = cleanStyleContent;
+
+            finalStyle = `position:absolute;z-index:${data.zIndex};left:${adjustedX}px;top:${adjustedY}px;width:${data.rect.width}px;height:${data.rect.height}px;object-fit:cover!important;box-sizing:border-box;${visualStyle}`;
+        } else {
+            finalStyle = `position:absolute;z-index:${data.zIndex};left:${adjustedX}px;top:${adjustedY}px;width:${data.rect.width}px;height:${data.rect.height}px;box-sizing:border-box;${visualStyle}`;
+        }
+
+        if (options.layout) {
+            // Toạ độ giống hệt HTML xuất ra: gốc là góc trên-trái của .content-wrapper
+            layoutElements.push({
+                tag: data.tagName,
+                index: data.index,
+                x: adjustedX,
+                y: adjustedY,
+                width: data.rect.width,
+                height: data.rect.height,
+                zIndex: data.zIndex,
+                style: visualStyle,
+                attributes: data.attributes,
+                content: data.content
+            });
         }
 
-        console.log(`[JS] ✅ Browser-side processing complete. Analyzed ${pageData.elements.length} final elements.`);
+        const attributes = { ...data.attributes };
+        if (dedupe) {
+            dedupeReport.legacyInlineBytes += finalStyle.length;
+            // left/top/width/height trong phần visual (inline style gốc, computed width/height) đứng sau
+            // geometry nên từng thắng nó; giữ nguyên giá trị thắng đó ở inline
+            const geometry = {};
+            const shared = visualStyle
+                .replace(GEOMETRY_DECL_RE, (match, sep, prop, value) => {
+                    geometry[prop.toLowerCase()] = value.trim();
+                    return sep;
+                })
+                .replace(/;\s*;/g, ';')
+                .replace(/^\s*;\s*/, '');
+            const sharedCss = `position:absolute;${data.tagName === 'img' ? 'object-fit:cover!important;' : ''}box-sizing:border-box;${shared}`;
+            let className = sharedRules.get(sharedCss);
+            if (!className) {
+                className = `sg-${hashStyle(sharedCss)}`;
+                while (ruleCss.has(className)) className += 'x';
+                sharedRules.set(sharedCss, className);
+                ruleCss.set(className, sharedCss);
+            }
+            attributes.class = attributes.class ? `${attributes.class} ${className}` : className;
+            finalStyle = `z-index:${data.zIndex};left:${geometry.left ?? adjustedX + 'px'};top:${geometry.top ?? adjustedY + 'px'};` +
+                `width:${geometry.width ?? data.rect.width + 'px'};height:${geometry.height ?? data.rect.height + 'px'};`;
+            dedupeReport.inlineBytes += finalStyle.length + className.length + 1;
+        }
+        finalStyle = finalStyle.replace(/'/g, '&#39;');
 
-        // ✅ Áp dụng background từ container (nếu có) vào body
-        const finalBodyBg = pageData.containerStyles.background || pageData.bodyBg;
-        const bodyPadding = pageData.containerStyles.padding;
-        const bodyBorderRadius = pageData.containerStyles.borderRadius;
-        const bodyBoxShadow = pageData.containerStyles.boxShadow;
+        let attributesString = '';
+        for (const attr in attributes) {
+            const value = String(attributes[attr]).replace(/"/g, '&quot;');
+            attributesString += ` ${attr}="${value}"`;
+        }
+        const selfClosingTags = ['img', 'input', 'br', 'hr', 'iframe'];
+        if (selfClosingTags.includes(data.tagName)) {
+            elementsHtml += `    <${data.tagName} style='${finalStyle}'${attributesString}>\n`;
+        } else {
+            elementsHtml += `    <${data.tagName} style='${finalStyle}'${attributesString}>${data.content}</${data.tagName}>\n`;
+        }
+    });
+
+    // Inline style thắng mọi rule không !important của CSS gốc (vẫn được nhúng lại trong <head>);
+    // selector hai lần ID giữ thứ tự ưu tiên đó cho các class sinh ra
+    let sharedStyleCss = '';
+    for (const [css, className] of sharedRules) {
+        sharedStyleCss += `#sg-root#sg-root .${className}{${css.replace(/<\/style/gi, '\\3c /style')}}\n`;
+    }
+    dedupeReport.rules = sharedRules.size;
+    dedupeReport.sharedBytes = sharedStyleCss.length;
+    if (dedupe) {
+        const saved = dedupeReport.legacyInlineBytes - dedupeReport.inlineBytes - dedupeReport.sharedBytes;
+        console.log(`[JS] 🧩 Style dedupe: ${pageData.elements.length} elements → ${sharedRules.size} classes, saved ${saved} bytes`);
+    }
 
-        let newHtmlContent = `<!DOCTYPE html><html lang="en"><head><meta charset="UTF-8"><title>Converted HTML</title>${inputHeadHtml}<style>
+    let newHtmlContent = `<!DOCTYPE html><html lang="en"><head><meta charset="UTF-8"><title>Converted HTML</title>${inputHeadHtml}<style>
 *{box-sizing:border-box;}
 html { width: 1920px; height: 1080px; }
 body {
@@ -517,52 +775,10 @@ body {
 }
 .outer-wrapper{padding:0;box-sizing:border-box;width:1920px;height:1080px;overflow:hidden;}
 .content-wrapper{position:absolute;left:50%;top:50%;transform:translate(-50%,-50%) scale(var(--scale,1));transform-origin:center center;width:${pageData.contentBlock.width}px;height:${pageData.contentBlock.height}px;overflow:visible;background:inherit;box-sizing:border-box;}
-</style></head><body>${pageData.svgDefsHtml}<div class="outer-wrapper"><div class="content-wrapper">
-`;
-        pageData.elements.sort((a, b) => a.index - b.index).forEach(data => {
-            const styleContent = data.style.replace(/z-index\s*:\s*[^;]+;?/g, '').replace(/'/g, '&#39;');
-
-            // ✅ Điều chỉnh vị trí dựa trên padding của container
-            const adjustedX = data.relativeX - bodyPadding.left;
-            const adjustedY = data.relativeY - bodyPadding.top;
-
-            // ✅ SPECIAL FIX: Xử lý đặc biệt cho hình ảnh với kích thước container cha  
-            let finalStyle;
-            if (data.tagName === 'img') {
-                // Loại bỏ các thuộc tính width/height cũ và làm clean CSS
-                let cleanStyleContent = styleContent
-                    .replace(/\bwidth\s*:\s*[^;]+;?\s*/gi, '')
-                    .replace(/\bheight\s*:\s*[^;]+;?\s*/gi, '')
-                    .replace(/\bobject-fit\s*:\s*[^;]+;?\s*/gi, '')
-                    .replace(/stroke-\s*/gi, 'stroke-width: 1px; stroke-') // Sửa lỗi stroke- thiếu width
-                    .replace(/;\s*;/g, ';') // Loại bỏ dấu ; thừa
-                    .replace(/^\s*;|;\s*$/g, '') // Loại bỏ ; ở đầu/cuối
-                    .trim();
-
-                // Đảm bảo có dấu ; cuối nếu cần
-                if (cleanStyleContent && !cleanStyleContent.endsWith(';')) {
-                    cleanStyleContent += ';';
-                }
-
-                finalStyle = `position:absolute;z-index:${data.zIndex};left:${adjustedX}px;top:${adjustedY}px;width:${data.rect.width}px;height:${data.rect.height}px;object-fit:cover!important;box-sizing:border-box;${cleanStyleContent}`;
-            } else {
-                finalStyle = `position:absolute;z-index:${data.zIndex};left:${adjustedX}px;top:${adjustedY}px;width:${data.rect.width}px;height:${data.rect.height}px;box-sizing:border-box;${styleContent}`;
-            }
-
-            let attributesString = '';
-            for (const attr in data.attributes) {
-                const value = String(data.attributes[attr]).replace(/"/g, '&quot;');
-                attributesString += ` ${attr}="${value}"`;
-            }
-            const selfClosingTags = ['img', 'input', 'br', 'hr', 'iframe'];
-            if (selfClosingTags.includes(data.tagName)) {
-                newHtmlContent += `    <${data.tagName} style='${finalStyle}'${attributesString}>\n`;
-            } else {
-                newHtmlContent += `    <${data.tagName} style='${finalStyle}'${attributesString}>${data.content}</${data.tagName}>\n`;
-            }
-        });
+${sharedStyleCss}</style></head><body>${pageData.svgDefsHtml}<div class="outer-wrapper"><div class="content-wrapper"${dedupe ? ' id="sg-root"' : ''}>
+${elementsHtml}`;
 
-        newHtmlContent += `</div><script>
+    newHtmlContent += `</div><script>
 (function() {
   function resizeContent() {
     var wrapper = document.querySelector('.content-wrapper');
@@ -576,20 +792,302 @@ body {
   window.addEventListener('DOMContentLoaded', resizeContent);
 })();
 </script></body></html>`;
-        await fs.writeFile(outputFilePath, newHtmlContent);
-        console.log(`[JS] ✨ Success! Output saved to: ${outputFilePath}`);
+    const layout = options.layout ? {
+        version: LAYOUT_IR_VERSION,
+        viewport: { width: VIEWPORT.width, height: VIEWPORT.height },
+        content: { width: pageData.contentBlock.width, height: pageData.contentBlock.height },
+        background: finalBodyBg,
+        container: { padding: bodyPadding, borderRadius: bodyBorderRadius, boxShadow: bodyBoxShadow },
+        elements: layoutElements
+    } : undefined;
+    timer.mark('serialize');
+    return {
+        html: newHtmlContent, elements: pageData.elements.length, styleReport,
+        dedupeReport: dedupe ? dedupeReport : undefined, layout, timings: timer.timings
+    };
+}
 
+async function readStdin() {
+    const chunks = [];
+    for await (const chunk of process.stdin) chunks.push(chunk);
+    return Buffer.concat(chunks).toString('utf8');
+}
+
+// "-" làm input/output: đọc HTML từ stdin / ghi HTML ra stdout (log chuyển sang stderr)
+async function convertHtmlToAbsolute(inputFilePath, outputFilePath, options = {}) {
+    if (outputFilePath === '-') console.log = (...args) => console.error(...args);
+    console.log('[JS] 🚀 Starting advanced conversion process v2 (Block-aware)...');
+    const source = inputFilePath === '-' ? { html: await readStdin() } : { inputPath: inputFilePath };
+    const timer = phaseTimer();
+    const browser = await launchBrowser();
+    try {
+        const page = await newConverterPage(browser);
+        timer.mark('launch');
+        const result = await convertPage(page, source, options, timer);
+        if (outputFilePath === '-') {
+            process.stdout.write(result.html);
+        } else {
+            await fs.writeFile(outputFilePath, result.html);
+            console.log(`[JS] ✨ Success! Output saved to: ${outputFilePath}`);
+            if (result.layout) {
+                await fs.writeFile(layoutPathFor(outputFilePath), JSON.stringify(result.layout));
+                console.log(`[JS] 📐 Layout IR saved to: ${layoutPathFor(outputFilePath)}`);
+            }
+            timer.mark('write');
+        }
+        console.log(`[JS] ⏱️ Timings ${JSON.stringify(roundTimings(timer.timings))}`);
     } catch (error) {
         console.error('[JS] ❌ An error occurred during conversion:', error);
-        process.exit(1);
+        process.exitCode = 1;
+    } finally {
+        await browser.close();
+    }
+}
+
+function roundTimings(timings) {
+    const rounded = {};
+    for (const [phase, ms] of Object.entries(timings)) rounded[phase] = Math.round(ms * 100) / 100;
+    return rounded;
+}
+
+// Pool of warm pages sharing one browser; a page that fails a job is replaced.
+class PagePool {
+    constructor(browser, size) {
+        this.browser = browser;
+        this.size = size;
+        this.idle = [];
+        this.waiters = [];
+        this.created = 0;
+    }
+
+    async acquire() {
+        if (this.idle.length > 0) return this.idle.pop();
+        if (this.created < this.size) return this.create();
+        return new Promise((resolve, reject) => this.waiters.push({ resolve, reject }));
+    }
+
+    async create() {
+        this.created++;
+        try {
+            return await newConverterPage(this.browser);
+        } catch (e) {
+            this.created--;
+            throw e;
+        }
+    }
+
+    async release(page, broken = false) {
+        if (broken) {
+            await page.close().catch(() => {});
+            try {
+                page = await this.replace();
+            } catch (e) {
+                // Không tạo lại được page: job đang chờ thử tạo một page mới cho riêng nó,
+                // thất bại thì báo lỗi cho job đó thay vì để nó chờ mãi
+                const waiter = this.waiters.shift();
+                if (waiter) this.create().then(waiter.resolve, waiter.reject);
+                return;
+            }
+        }
+        const waiter = this.waiters.shift();
+        if (waiter) waiter.resolve(page);
+        else this.idle.push(page);
+    }
+
+    async replace() {
+        try {
+            return await newConverterPage(this.browser);
+        } catch (e) {
+            this.created--;
+            throw e;
+        }
+    }
+}
+
+// job: { id, input | html, output?, options? } — có output thì ghi file, không thì trả HTML trong kết quả
+// (options.layout: layout IR ghi ra <output>.layout.json, hoặc trả trong trường "layout")
+async function runJob(pool, job, defaultOptions = {}) {
+    const started = Date.now();
+    const timer = phaseTimer();
+    let page;
+    try {
+        page = await pool.acquire();
+    } catch (error) {
+        return { id: job.id, ok: false, error: `No converter page available: ${error && error.message || error}`, ms: Date.now() - started };
+    }
+    timer.mark('acquire');
+    let broken = false;
+    try {
+        const source = job.html !== undefined ? { html: job.html } : { inputPath: job.input };
+        const result = await convertPage(page, source, { ...defaultOptions, ...job.options }, timer);
+        const response = {
+            id: job.id, ok: true, elements: result.elements,
+            styleReport: result.styleReport, dedupeReport: result.dedupeReport
+        };
+        if (job.output) {
+            await fs.writeFile(job.output, result.html);
+            console.log(`[JS] ✨ Success! Output saved to: ${job.output}`);
+            response.output = job.output;
+            if (result.layout) {
+                response.layoutOutput = layoutPathFor(job.output);
+                await fs.writeFile(response.layoutOutput, JSON.stringify(result.layout));
+            }
+        } else {
+            response.html = result.html;
+            response.layout = result.layout;
+        }
+        if (job.output) timer.mark('write');
+        response.timings = roundTimings(timer.timings);
+        response.ms = Date.now() - started;
+        return response;
+    } catch (error) {
+        broken = true;
+        return {
+            id: job.id, ok: false, error: String(error && error.stack || error),
+            timings: roundTimings(timer.timings), ms: Date.now() - started
+        };
+    } finally {
+        await pool.release(page, broken);
+    }
+}
+
+// Daemon protocol: one JSON job per line ({"id", "input", "output"} or {"id", "html"}), one JSON result per line.
+function serveJsonLines(pool, input, write, defaultOptions) {
+    const rl = readline.createInterface({ input, crlfDelay: Infinity });
+    rl.on('line', line => {
+        if (!line.trim()) return;
+        let job;
+        try {
+            job = JSON.parse(line);
+        } catch (e) {
+            write({ id: null, ok: false, error: `Invalid job: ${e.message}` });
+            return;
+        }
+        if (typeof job.html !== 'string' && !(job.input && job.output)) {
+            write({ id: job.id ?? null, ok: false, error: 'Job requires "html" or "input" and "output"' });
+            return;
+        }
+        runJob(pool, job, defaultOptions).then(write);
+    });
+    return rl;
+}
+
+async function runDaemon({ socketPath, poolSize, options }) {
+    // stdout carries the protocol, so route the per-job logs to stderr
+    console.log = (...args) => console.error(...args);
+
+    const timer = phaseTimer();
+    const browser = await launchBrowser();
+    timer.mark('launch');
+    const pool = new PagePool(browser, poolSize);
+    const shutdown = async () => {
+        await browser.close().catch(() => {});
+        process.exit(0);
+    };
+    process.on('SIGTERM', shutdown);
+    process.on('SIGINT', shutdown);
+
+    if (socketPath) {
+        await fs.rm(socketPath, { force: true });
+        const server = net.createServer(conn => {
+            serveJsonLines(pool, conn, result => conn.write(JSON.stringify(result) + '\n'), options);
+        });
+        server.listen(socketPath, () => console.error(`[JS] 🔥 Converter daemon listening on ${socketPath} (${poolSize} pages)`));
+    } else {
+        const rl = serveJsonLines(pool, process.stdin, result => process.stdout.write(JSON.stringify(result) + '\n'), options);
+        rl.on('close', shutdown);
+        console.error(`[JS] 🔥 Converter daemon ready on stdin (${poolSize} pages)`);
+    }
+    process.stdout.write(JSON.stringify({ id: null, ok: true, ready: true, timings: roundTimings(timer.timings) }) + '\n');
+}
+
+// Batch mode: manifest is a JSON array of {"input", "output"} pairs (or {"jobs": [...]}).
+// Converts on `concurrency` pages of one browser and prints a JSON report on stdout.
+async function runBatch({ manifestPath, concurrency, reportPath, options }) {
+    console.log = (...args) => console.error(...args);
+
+    const manifest = JSON.parse(await fs.readFile(manifestPath, 'utf8'));
+    const jobs = (Array.isArray(manifest) ? manifest : manifest.jobs || [])
+        .map((job, idx) => ({ id: job.id ?? idx, input: job.input, output: job.output, options: job.options }));
+
+    const started = Date.now();
+    const browser = await launchBrowser();
+    const pool = new PagePool(browser, Math.max(1, Math.min(concurrency, jobs.length)));
+    const results = new Array(jobs.length);
+    let next = 0;
+    try {
+        const worker = async () => {
+            while (next < jobs.length) {
+                const idx = next++;
+                const job = jobs[idx];
+                results[idx] = (job.input && job.output)
+                    ? await runJob(pool, job, options)
+                    : { id: job.id, ok: false, error: 'Job requires "input" and "output"', ms: 0 };
+                console.error(`[JS] ${results[idx].ok ? '✅' : '❌'} [${idx + 1}/${jobs.length}] ${job.input} (${results[idx].ms} ms)`);
+            }
+        };
+        await Promise.all(Array.from({ length: pool.size }, worker));
     } finally {
         await browser.close();
     }
+
+    const failed = results.filter(r => !r.ok).length;
+    const report = {
+        total: jobs.length,
+        success: jobs.length - failed,
+        error: failed,
+        concurrency: pool.size,
+        duration_ms: Date.now() - started,
+        results: results.map((r, idx) => ({ ...r, input: jobs[idx].input }))
+    };
+    const reportJson = JSON.stringify(report, null, 2);
+    if (reportPath) await fs.writeFile(reportPath, reportJson);
+    process.stdout.write(reportJson + '\n');
+    if (failed > 0) process.exitCode = 1;
 }
 
-if (process.argv.length < 4) {
-    console.error('❌ Error: Missing arguments!\nUsage: node your_script.js <input_file.html> <output_file.html>');
-    process.exit(1);
+function parseFlag(args, name, fallback) {
+    const idx = args.indexOf(name);
+    return idx !== -1 && idx + 1 < args.length ? args[idx + 1] : fallback;
 }
 
-convertHtmlToAbsolute(process.argv[2], process.argv[3]);
\ No newline at end of file
+module.exports = { convertPage, launchBrowser, newConverterPage, PagePool, runJob, layoutPathFor, LAYOUT_IR_VERSION };
+
+if (require.main === module) {
+    const BOOLEAN_FLAGS = ['--offline', '--compact-styles', '--style-report', '--dedupe-styles', '--layout'];
+    const rawArgs = process.argv.slice(2);
+    const cliArgs = rawArgs.filter(arg => !BOOLEAN_FLAGS.includes(arg));
+    const cliOptions = {
+        compactStyles: rawArgs.includes('--compact-styles'),
+        styleReport: rawArgs.includes('--style-report'),
+        dedupeStyles: rawArgs.includes('--dedupe-styles'),
+        layout: rawArgs.includes('--layout')
+    };
+    if (rawArgs.includes('--offline')) assetMirror.mode = 'offline';
+
+    if (cliArgs.includes('--daemon')) {
+        runDaemon({
+            socketPath: parseFlag(cliArgs, '--socket', null),
+            poolSize: parseInt(parseFlag(cliArgs, '--pages', '4'), 10),
+            options: cliOptions
+        }).catch(error => {
+            console.error('[JS] ❌ Converter daemon failed to start:', error);
+            process.exit(1);
+        });
+    } else if (cliArgs.includes('--batch')) {
+        runBatch({
+            manifestPath: parseFlag(cliArgs, '--batch', null),
+            concurrency: parseInt(parseFlag(cliArgs, '--concurrency', '4'), 10),
+            reportPath: parseFlag(cliArgs, '--report', null),
+            options: cliOptions
+        }).catch(error => {
+            console.error('[JS] ❌ Batch conversion failed:', error);
+            process.exit(1);
+        });
+    } else if (cliArgs.length < 2) {
+        console.error('❌ Error: Missing arguments!\nUsage: node converter.js <input_file.html|-> <output_file.html|->\n       node converter.js --daemon [--socket <path>] [--pages <n>]\n       node converter.js --batch <manifest.json> [--concurrency <n>] [--report <report.json>]\n       (--offline: chỉ dùng asset từ mirror cục bộ, xem asset-mirror.js)\n       (--compact-styles: chỉ xuất style khác mặc định; --style-report: so sánh bytes/thời gian với bản cũ)\n       (--dedupe-styles: gom style chung thành class, inline chỉ giữ vị trí/kích thước)\n       (--layout: ghi thêm layout IR <output>.layout.json cạnh file HTML)');
+        process.exit(1);
+    } else {
+        convertHtmlToAbsolute(cliArgs[0], cliArgs[1], cliOptions);
+    }
+}
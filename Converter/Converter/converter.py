@@ -1,8 +1,235 @@
 import subprocess
 import os
+import json
+import tempfile
+import atexit
+import itertools
+import threading
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+from conversion_cache import get_conversion_cache
+from layout_ir import layout_path_for
+
+JS_SCRIPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'converter.js')
+
+
+class ConverterError(RuntimeError):
+    pass
+
+
+class ConverterDaemon:
+    """
+    Client cho `node converter.js --daemon`: giữ một tiến trình Node + Chromium sống lâu
+    và gửi job qua stdin theo JSON-lines, nên mỗi slide không phải launch lại browser.
+    Thread-safe: nhiều thread có thể gọi convert() cùng lúc, daemon xử lý song song
+    trên pool gồm `pool_size` page.
+    """
+
+    def __init__(self, js_script_path=JS_SCRIPT_PATH, pool_size=4, startup_timeout=60):
+        self.js_script_path = js_script_path
+        self.pool_size = pool_size
+        self.startup_timeout = startup_timeout
+        self._proc = None
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._ids = itertools.count(1)
+        self._stderr_tail = deque(maxlen=200)
+        self.launch_timings = {}  # {'launch': ms} của lần khởi động gần nhất
+        self.starts = 0
+
+    def _start(self):
+        if not os.path.exists(self.js_script_path):
+            raise FileNotFoundError(f"converter.js not found at {self.js_script_path}")
+
+        proc = subprocess.Popen(
+            ['node', self.js_script_path, '--daemon', '--pages', str(self.pool_size)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            bufsize=1,
+            cwd=os.path.dirname(self.js_script_path),
+        )
+        ready = Future()
+        threading.Thread(target=self._read_stdout, args=(proc, ready), daemon=True).start()
+        threading.Thread(target=self._read_stderr, args=(proc,), daemon=True).start()
+        try:
+            self.launch_timings = ready.result(timeout=self.startup_timeout).get('timings') or {}
+        except Exception:
+            proc.kill()
+            raise ConverterError("Converter daemon failed to start:\n" + self.stderr_tail())
+        self.starts += 1
+        self._proc = proc
+
+    def _read_stdout(self, proc, ready):
+        for line in proc.stdout:
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            if message.get('ready'):
+                ready.set_result(message)
+                continue
+            with self._lock:
+                future = self._pending.pop(message.get('id'), None)
+            if future is not None:
+                future.set_result(message)
+
+        # Process exited: fail everything still waiting on it
+        if not ready.done():
+            ready.set_exception(ConverterError("Converter daemon exited during startup"))
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if self._proc is proc:
+                self._proc = None
+        for future in pending.values():
+            future.set_exception(ConverterError("Converter daemon exited:\n" + self.stderr_tail()))
+
+    def _read_stderr(self, proc):
+        for line in proc.stderr:
+            self._stderr_tail.append(line.rstrip('\n'))
+
+    def stderr_tail(self, lines=40):
+        return '\n'.join(list(self._stderr_tail)[-lines:])
+
+    def submit(self, job):
+        """Gửi một job (dict) cho daemon, trả về Future chứa kết quả JSON."""
+        future = Future()
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._start()
+            job_id = next(self._ids)
+            future.job_id = job_id
+            self._pending[job_id] = future
+            try:
+                self._proc.stdin.write(json.dumps(dict(job, id=job_id)) + '\n')
+                self._proc.stdin.flush()
+            except OSError as exc:
+                self._pending.pop(job_id, None)
+                raise ConverterError(f"Converter daemon is not accepting jobs: {exc}")
+        return future
+
+    def convert(self, input_file, output_file, options=None, timeout=120):
+        """
+        Chuyển đổi input_file → output_file, raise ConverterError nếu thất bại.
+        options: dict truyền cho convertPage, ví dụ {'compactStyles': True}.
+        """
+        return self._run({
+            'input': os.path.abspath(input_file),
+            'output': os.path.abspath(output_file),
+            'options': options or {},
+        }, timeout)
+
+    def convert_html(self, html, options=None, timeout=120):
+        """
+        Chuyển đổi HTML dạng string, không dùng file tạm: daemon nạp bằng page.setContent và trả
+        HTML đã chuyển đổi trong kết quả. Trả về dict {'html', 'elements', 'ms', 'timings', ...};
+        timings là ms theo phase (acquire, load, fonts, animations, evaluate, serialize).
+        """
+        return self._run({'html': html, 'options': options or {}}, timeout)
+
+    def _run(self, job, timeout):
+        """
+        Gửi job và chờ kết quả. Quá `timeout` thì bỏ job khỏi _pending (kết quả đến muộn bị
+        bỏ qua) và raise ConverterError như mọi lỗi khác của converter.
+        """
+        future = self.submit(job)
+        try:
+            result = future.result(timeout=timeout)
+        except FutureTimeoutError:
+            with self._lock:
+                self._pending.pop(future.job_id, None)
+            raise ConverterError(f"Converter timed out after {timeout}s") from None
+        if not result.get('ok'):
+            raise ConverterError(result.get('error') or 'Unknown converter error')
+        return result
+
+    def close(self):
+        with self._lock:
+            proc, self._proc = self._proc, None
+        if proc is not None and proc.poll() is None:
+            proc.stdin.close()
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+
+
+_daemon = None
+_daemon_lock = threading.Lock()
+
+
+def get_converter_daemon(pool_size=None):
+    """Daemon dùng chung trong process (khởi động lười ở job đầu tiên)."""
+    global _daemon
+    with _daemon_lock:
+        if _daemon is None:
+            size = pool_size or int(os.environ.get('CONVERTER_POOL_SIZE', '4'))
+            _daemon = ConverterDaemon(pool_size=size)
+            atexit.register(_daemon.close)
+        return _daemon
+
+
+def convert_file_cached(input_file, output_file, daemon=None, options=None):
+    """
+    Như ConverterDaemon.convert nhưng tra cache theo nội dung HTML trước: cache hit chỉ
+    ghi lại output đã lưu, không cần tới Node. Kết quả có thêm khoá 'cached'.
+    Với options={'layout': True}, layout IR (.layout.json) được cache cùng key và ghi lại cạnh output.
+    """
+    cache = get_conversion_cache()
+    with open(input_file, 'rb') as f:
+        key = cache.key(f.read(), options=options, base_dir=os.path.dirname(os.path.abspath(input_file)))
+    with_layout = bool(options and options.get('layout'))
+
+    cached = cache.get(key)
+    cached_layout = cache.get(key, suffix='.layout.json') if with_layout and cached is not None else None
+    if cached is not None and (cached_layout is not None or not with_layout):
+        with open(output_file, 'wb') as f:
+            f.write(cached)
+        result = {'ok': True, 'cached': True, 'output': os.path.abspath(output_file), 'ms': 0}
+        if with_layout:
+            result['layoutOutput'] = os.path.abspath(layout_path_for(output_file))
+            with open(result['layoutOutput'], 'wb') as f:
+                f.write(cached_layout)
+        return result
+
+    result = (daemon or get_converter_daemon()).convert(input_file, output_file, options=options)
+    with open(output_file, 'rb') as f:
+        cache.put(key, f.read())
+    if result.get('layoutOutput'):
+        with open(result['layoutOutput'], 'rb') as f:
+            cache.put(key, f.read(), suffix='.layout.json')
+    result['cached'] = False
+    return result
+
+
+def run_batch_converter(pairs, concurrency=4):
+    """
+    Chuyển đổi nhiều cặp (input, output) trong một lần `node converter.js --batch`:
+    một browser, `concurrency` page song song. Trả về report JSON (per-file status + ms).
+    """
+    jobs = [{'input': os.path.abspath(i), 'output': os.path.abspath(o)} for i, o in pairs]
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False, encoding='utf-8') as f:
+        json.dump(jobs, f)
+        manifest_path = f.name
+    try:
+        proc = subprocess.run(
+            ['node', JS_SCRIPT_PATH, '--batch', manifest_path, '--concurrency', str(concurrency)],
+            capture_output=True, text=True, encoding='utf-8',
+            cwd=os.path.dirname(JS_SCRIPT_PATH),
+        )
+    finally:
+        os.unlink(manifest_path)
+    try:
+        return json.loads(proc.stdout)
+    except ValueError:
+        raise ConverterError(f"Batch converter failed (code {proc.returncode}):\n{proc.stderr}")
+
 
 def run_html_converter(input_file, output_file):
-    js_script_path = 'converter.js'
+    js_script_path = JS_SCRIPT_PATH
     if not os.path.exists(js_script_path):
         print(f"Lỗi: Không tìm thấy file script '{js_script_path}'.")
         return
@@ -13,23 +240,20 @@ def run_html_converter(input_file, output_file):
     print(f"[Python] Chuẩn bị gọi script: {js_script_path}")
     print(f"[Python]  - File nguồn: {input_file}")
     print(f"[Python]  - File đích:  {output_file}")
-    
+
     try:
-        command = ['node', js_script_path, input_file, output_file]
-        result = subprocess.run(
-            command, capture_output=True, text=True, check=True, encoding='utf-8'
-        )
-        print("\n--- Log từ Node.js ---")
-        print(result.stdout)
-        print("------------------------")
-        print(f"[Python] Script Node.js đã thực thi thành công!")
+        result = convert_file_cached(input_file, output_file)
+        if result['cached']:
+            print("[Python] Cache hit - dùng lại kết quả đã chuyển đổi.")
+        else:
+            print(f"[Python] Script Node.js đã thực thi thành công! ({result.get('elements')} elements, {result.get('ms')} ms)")
         print(f"[Python] File kết quả đã được tạo tại: {output_file}")
 
     except FileNotFoundError:
         print("\n[LỖI] Lệnh 'node' không được tìm thấy.")
-    except subprocess.CalledProcessError as e:
+    except ConverterError as e:
         print("\n[LỖI] Script Node.js đã gặp sự cố.")
-        print("\n--- Log lỗi từ Node.js ---\n" + e.stderr + "---------------------------")
+        print("\n--- Log lỗi từ Node.js ---\n" + str(e) + "\n---------------------------")
 
 if __name__ == "__main__":
-    run_html_converter('input.html', 'output.html')
\ No newline at end of file
+    run_html_converter('input.html', 'output.html')
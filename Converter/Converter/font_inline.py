@@ -0,0 +1,237 @@
+"""
+Nhúng font vào slide đã render: thay link Google Fonts bằng `@font-face` dạng data URI,
+chỉ chứa các glyph slide thực sự dùng.
+
+Font lấy từ mirror asset cục bộ (asset_mirror.py / asset-mirror.js) — nơi đã lưu stylesheet
+css2 và file font của Google Fonts, nạp sẵn bằng:
+
+    node asset-mirror.js warm all_slides_test/
+
+Với mỗi link stylesheet font của slide:
+  - đọc stylesheet từ mirror, tách các block `@font-face` (mỗi block một subset unicode-range);
+  - bỏ block không chứa ký tự nào slide dùng (trình duyệt cũng sẽ không tải nó);
+  - subset font còn lại về đúng các ký tự đó (fontTools, woff2 nếu có Brotli, ngược lại woff)
+    và nhúng thành `data:` URI trong một `<style>` thay cho link.
+Link nào thiếu trong mirror được giữ nguyên. Không có fontTools thì file font của mirror được
+nhúng nguyên vẹn (vẫn chạy offline, chỉ không nhỏ lại). Slide có `<script>` có thể tự sinh chữ
+nên không bị subset.
+
+    from font_inline import inline_fonts
+    html = inline_fonts(html)
+    python font_inline.py slide.html [output.html]
+"""
+
+import io
+import re
+import sys
+import base64
+import html as html_module
+import threading
+from collections import OrderedDict
+
+from asset_mirror import AssetMirror
+
+try:
+    from fontTools import subset as ft_subset
+    from fontTools.ttLib import TTFont
+except ImportError:  # fontTools là tuỳ chọn: thiếu thì nhúng nguyên file font
+    ft_subset = None
+
+try:
+    import brotli  # noqa: F401  (fontTools cần để đọc/ghi woff2)
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+MAX_CACHED_SUBSETS = 512
+LINK_RE = re.compile(r'[ \t]*<link\b[^>]*>[ \t]*\n?', re.I)
+HREF_RE = re.compile(r'\bhref\s*=\s*"([^"]*)"', re.I)
+FONT_HOST_RE = re.compile(r'^https://fonts\.(googleapis|gstatic)\.com(/|$)', re.I)
+STYLESHEET_RE = re.compile(r'^https://fonts\.googleapis\.com/css2?\?', re.I)
+FONT_FACE_RE = re.compile(r'@font-face\s*\{([^}]*)\}', re.I)
+SRC_URL_RE = re.compile(r'url\(\s*[\'"]?([^\'")]+)[\'"]?\s*\)')
+UNICODE_RANGE_RE = re.compile(r'unicode-range\s*:\s*([^;]+);?', re.I)
+SRC_DECL_RE = re.compile(r'src\s*:[^;]+;?', re.I)
+SKIPPED_ELEMENTS_RE = re.compile(r'<(style|script|head|title)\b.*?</\1\s*>', re.S | re.I)
+TAG_RE = re.compile(r'<[^>]*>')
+CSS_CONTENT_RE = re.compile(r'content\s*:\s*(["\'])(.*?)\1', re.S)
+SCRIPT_RE = re.compile(r'<script\b', re.I)
+FONT_MIME = {'woff2': 'font/woff2', 'woff': 'font/woff'}
+FONT_FORMATS = {'font/woff2': 'woff2', 'font/woff': 'woff', 'font/ttf': 'truetype', 'font/otf': 'opentype'}
+
+
+def used_codepoints(document: str):
+    """Các code point slide hiển thị (text + `content:` của CSS), cả hai dạng hoa/thường; None nếu có script."""
+    if SCRIPT_RE.search(document):
+        return None
+    text = html_module.unescape(TAG_RE.sub(' ', SKIPPED_ELEMENTS_RE.sub(' ', document)))
+    text += ''.join(match.group(2) for match in CSS_CONTENT_RE.finditer(document))
+    # text-transform: uppercase/capitalize hay dùng trong html_lib
+    text = text + text.upper() + text.lower()
+    return {ord(ch) for ch in text} | {0x20, 0xA0}
+
+
+def parse_unicode_range(value: str) -> list:
+    """[(đầu, cuối)...] từ giá trị unicode-range CSS (U+41, U+0-FF, U+4??)."""
+    ranges = []
+    for token in value.split(','):
+        token = token.strip().upper()
+        if not token.startswith('U+'):
+            continue
+        token = token[2:]
+        if '?' in token:
+            ranges.append((int(token.replace('?', '0'), 16), int(token.replace('?', 'F'), 16)))
+        elif '-' in token:
+            start, _, end = token.partition('-')
+            ranges.append((int(start, 16), int(end, 16)))
+        else:
+            ranges.append((int(token, 16), int(token, 16)))
+    return ranges
+
+
+def _in_ranges(codepoints: set, ranges: list) -> frozenset:
+    if not ranges:
+        return frozenset(codepoints)
+    return frozenset(cp for cp in codepoints if any(start <= cp <= end for start, end in ranges))
+
+
+def subset_font(data: bytes, codepoints) -> tuple:
+    """(bytes, định dạng) của font chỉ còn các glyph cho `codepoints`; None nếu không subset được."""
+    if ft_subset is None:
+        return None
+    flavor = 'woff2' if HAS_BROTLI else 'woff'
+    try:
+        font = TTFont(io.BytesIO(data))
+        options = ft_subset.Options()
+        options.flavor = flavor
+        options.layout_features = ['*']  # giữ ligature/kerning và dấu tiếng Việt ghép (mark/mkmk)
+        options.notdef_outline = True
+        subsetter = ft_subset.Subsetter(options)
+        subsetter.populate(unicodes=sorted(codepoints))
+        subsetter.subset(font)
+        out = io.BytesIO()
+        font.flavor = flavor
+        font.save(out)
+    except Exception:
+        return None  # woff2 khi thiếu Brotli, font hỏng...: để nhúng nguyên file
+    return out.getvalue(), flavor
+
+
+class FontInliner:
+    def __init__(self, mirror: AssetMirror = None, subset: bool = True):
+        self.mirror = mirror or AssetMirror()
+        self.subset = subset
+        self._subsets = OrderedDict()  # (hash file font, code point) -> data URI
+        self._lock = threading.Lock()
+        self.inlined_links = 0
+        self.missing_links = 0
+
+    def _data_uri(self, entry: dict, codepoints) -> str:
+        key = (entry['hash'], codepoints)
+        uri = self._subsets.get(key)
+        if uri is not None:
+            return uri
+        result = subset_font(entry['body'], codepoints) if self.subset and codepoints is not None else None
+        if result is None:
+            data, mime = entry['body'], entry.get('contentType') or 'font/woff2'
+        else:
+            data, mime = result[0], FONT_MIME[result[1]]
+        uri = f"data:{mime};base64,{base64.b64encode(data).decode('ascii')}"
+        with self._lock:
+            self._subsets[key] = uri
+            if len(self._subsets) > MAX_CACHED_SUBSETS:
+                self._subsets.popitem(last=False)
+        return uri
+
+    def _font_faces(self, url: str, codepoints) -> str:
+        """Các @font-face (đã nhúng) thay cho một stylesheet font; None nếu mirror thiếu gì đó."""
+        sheet = self.mirror.lookup(url)
+        if sheet is None or sheet.get('status', 200) >= 400:
+            return None
+        faces = []
+        for match in FONT_FACE_RE.finditer(sheet['body'].decode('utf-8', 'replace')):
+            body = match.group(1)
+            src = SRC_URL_RE.search(body)
+            if src is None:
+                continue
+            wanted = None
+            if codepoints is not None:
+                unicode_range = UNICODE_RANGE_RE.search(body)
+                wanted = _in_ranges(codepoints, parse_unicode_range(unicode_range.group(1)) if unicode_range else [])
+                if not wanted:
+                    continue  # subset này không có ký tự nào của slide
+            entry = self.mirror.lookup(src.group(1))
+            if entry is None:
+                return None
+            uri = self._data_uri(entry, wanted)
+            font_format = FONT_FORMATS.get(uri[5:uri.index(';')])
+            src_value = f"url({uri}) format('{font_format}')" if font_format else f'url({uri})'
+            declarations = SRC_DECL_RE.sub(lambda _: f'src: {src_value};', body, count=1)
+            faces.append(f'@font-face {{{declarations}}}')
+        return '\n'.join(faces)
+
+    def inline(self, document: str) -> str:
+        """`document` với mọi link stylesheet font có trong mirror được thay bằng font nhúng."""
+        links = [(match, html_module.unescape(href.group(1)))
+                 for match in LINK_RE.finditer(document)
+                 for href in [HREF_RE.search(match.group(0))] if href and FONT_HOST_RE.match(href.group(1))]
+        sheets = [(match, url) for match, url in links if STYLESHEET_RE.match(url)]
+        if not sheets:
+            return document
+
+        codepoints = used_codepoints(document)
+        replacements = {}
+        for match, url in sheets:
+            faces = self._font_faces(url, codepoints)
+            if faces is None:
+                self.missing_links += 1
+                continue
+            self.inlined_links += 1
+            indent = match.group(0)[:len(match.group(0)) - len(match.group(0).lstrip(' \t'))]
+            replacements[match.start()] = f'{indent}<style>\n{faces}\n{indent}</style>\n' if faces else ''
+        if not replacements:
+            return document
+
+        # Preconnect tới fonts.* chỉ bỏ khi không còn link font nào phải tải
+        drop_preconnect = len(replacements) == len(sheets)
+        parts, last = [], 0
+        for match, url in links:
+            if match.start() in replacements:
+                parts.append(document[last:match.start()])
+                parts.append(replacements[match.start()])
+                last = match.end()
+            elif drop_preconnect and not STYLESHEET_RE.match(url):
+                parts.append(document[last:match.start()])
+                last = match.end()
+        parts.append(document[last:])
+        return ''.join(parts)
+
+
+_inliner = None
+
+
+def inline_fonts(document: str, mirror: AssetMirror = None) -> str:
+    """Nhúng font cho một slide bằng FontInliner dùng chung (hoặc một mirror chỉ định)."""
+    global _inliner
+    if mirror is not None:
+        return FontInliner(mirror).inline(document)
+    if _inliner is None:
+        _inliner = FontInliner()
+    return _inliner.inline(document)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) not in (2, 3):
+        print('Cách dùng: python font_inline.py <slide.html> [output.html]')
+        sys.exit(1)
+    with open(sys.argv[1], 'r', encoding='utf-8') as f:
+        source = f.read()
+    inliner = FontInliner()
+    result = inliner.inline(source)
+    output = sys.argv[2] if len(sys.argv) == 3 else sys.argv[1]
+    with open(output, 'w', encoding='utf-8') as f:
+        f.write(result)
+    print(f'✓ {inliner.inlined_links} stylesheet font được nhúng, {inliner.missing_links} thiếu trong mirror → {output}')
+    print(f'  {len(source.encode("utf-8")):,} bytes → {len(result.encode("utf-8")):,} bytes '
+          f'(subset: {"fontTools" if ft_subset else "không, thiếu fontTools"}, '
+          f'{"woff2" if HAS_BROTLI else "woff"})')
@@ -0,0 +1,368 @@
+"""
+Render cả một deck từ html_lib và gom phần dùng chung của các slide.
+
+Mỗi slide do html_lib sinh ra là một document đầy đủ: reset CSS, `.outer-wrapper` /
+`.content-wrapper`, media query và link Google Fonts lặp lại ở mọi slide. `render_deck`
+nhận danh sách (tên generator, kwargs) và trả về một bundle:
+
+    index.html          deck document: mọi slide nối tiếp nhau, mỗi slide một khung 1920x1080
+    slides/001.html     từng slide, <style> được thay bằng <link> tới stylesheet dùng chung
+    css/deck.css        các block CSS dùng chung (reset...) của mọi slide hoặc của đa số slide
+    css/<hash>.css      phần CSS còn lại, một file cho mỗi nội dung khác nhau
+
+Link font của cả deck được gộp thành một URL css2 duy nhất (trọng số của cùng một family
+được hợp lại), nên trình duyệt chỉ tải stylesheet font một lần.
+
+Một block chỉ được đưa vào deck.css khi đưa nó lên đầu stylesheet không đổi cascade: không
+block nào đứng trước nó đặt cùng nhóm thuộc tính (so bảo thủ, không xét selector), nên slide
+trong bundle hiển thị giống hệt slide gốc. deck.css dành cho mọi slide hoặc cho nhóm slide cùng
+chứa một block có ở ít nhất nửa deck (slide ngoài nhóm giữ nguyên CSS), và chỉ được tạo khi số
+byte bớt được lớn hơn số byte của các thẻ link thêm vào.
+
+Thực tế các generator khác nhau gần như không có block giống hệt nhau ngoài reset `* {...}`
+(~52 byte, khoảng bằng một thẻ link), nên phần lớn mức giảm đến từ việc slide cùng stylesheet
+dùng chung một css/<hash>.css chứ không phải từ deck.css. Đo: deck 60 slide kiểu pipeline
+(5 generator) ~402 KB → ~143 KB, không có deck.css; 60 slide ngẫu nhiên từ html_lib
+~385 KB → ~298 KB, không có deck.css.
+
+    from html_deck import render_deck
+    bundle = render_deck([('generate_title_slide', {'main_title': 'Q3'}),
+                          ('generate_main_points_slide', {'title': 'Kết quả'})])
+    bundle.write('out/deck')        # hoặc bundle.to_zip()
+"""
+
+import io
+import os
+import re
+import sys
+import json
+import hashlib
+import zipfile
+import textwrap
+
+FONTS_CSS_URL = 'https://fonts.googleapis.com/css2'
+FONT_LINK_RE = re.compile(r'[ \t]*<link\b[^>]*href="https://fonts\.(?:googleapis|gstatic)\.com[^"]*"[^>]*>\s*', re.I)
+FONT_HREF_RE = re.compile(r'href="https://fonts\.googleapis\.com/css2\?([^"]*)"', re.I)
+STYLE_RE = re.compile(r'[ \t]*<style\b[^>]*>(.*?)</style>\s*', re.S | re.I)
+COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+HEAD_OPEN_RE = re.compile(r'<head\b[^>]*>', re.I)
+META_CHARSET_RE = re.compile(r'<meta\b[^>]*\bcharset\b[^>]*>', re.I)
+DECK_CSS_LINK = '    <link rel="stylesheet" href="../css/deck.css">'
+# Nhóm slide tối thiểu (tỉ lệ trên cả deck) được xét để dùng chung deck.css
+MIN_SHARED_FRACTION = 0.5
+DECLARATION_RE = re.compile(r'(?:^|[{;])\s*([-\w]+)\s*:')
+# Thuộc tính đặt giá trị cho nhóm khác (shorthand / longhand khác tiền tố)
+PROPERTY_GROUPS = {'line': 'font', 'top': 'inset', 'right': 'inset', 'bottom': 'inset', 'left': 'inset',
+                   'row': 'gap', 'column': 'gap', 'columns': 'gap', 'place': 'align', 'justify': 'align'}
+
+DECK_INDEX_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>{title}</title>
+{fonts}    <style>
+        @page {{ size: 1920px 1080px; margin: 0; }}
+        html, body {{ margin: 0; padding: 0; background: #111; }}
+        .deck-slide {{ width: 1920px; height: 1080px; overflow: hidden; break-after: page; }}
+        .deck-slide:last-child {{ break-after: auto; }}
+        .deck-slide iframe {{ width: 1920px; height: 1080px; border: 0; display: block; }}
+    </style>
+</head>
+<body>
+{slides}
+</body>
+</html>
+"""
+
+
+def css_blocks(css: str) -> list:
+    """Các block cấp cao nhất (rule, @media, @keyframes...) của một stylesheet, bỏ comment."""
+    css = COMMENT_RE.sub('', css)
+    blocks, depth, start = [], 0, 0
+    for i, ch in enumerate(css):
+        if ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                blocks.append(textwrap.dedent(css[start:i + 1].strip('\n')).strip())
+                start = i + 1
+    rest = css[start:].strip()
+    if rest:
+        blocks.append(rest)  # @import/@charset hoặc phần dư không có block
+    return blocks
+
+
+def _block_keys(block: str) -> set:
+    """
+    Nhóm thuộc tính một block đặt (margin-top → margin, line-height → font...), để biết hai block
+    có thể đổi thứ tự mà không đổi cascade. Bảo thủ: không xét selector, '*' xung đột với mọi block.
+    """
+    head, brace, body = block.partition('{')
+    head = head.strip().lower()
+    if not brace or head.startswith('@import') or head.startswith('@charset'):
+        return {'*'}
+    if head.startswith(('@keyframes', '@-webkit-keyframes', '@font-face', '@page', '@property', '@counter-style')):
+        return {' '.join(head.split())}  # trùng tên thì thứ tự mới quan trọng
+    keys = set()
+    for prop in DECLARATION_RE.findall(body):
+        prop = prop.lower()
+        if prop.startswith('--'):
+            keys.add(prop)
+            continue
+        prop = re.sub(r'^-(webkit|moz|ms|o)-', '', prop)
+        if prop == 'all':
+            return {'*'}
+        group = prop.split('-')[0]
+        keys.add(PROPERTY_GROUPS.get(group, group))
+    return keys
+
+
+def _conflict(keys_a: set, keys_b: set) -> bool:
+    return '*' in keys_a or '*' in keys_b or not keys_a.isdisjoint(keys_b)
+
+
+def shared_blocks(sheets: list) -> list:
+    """
+    Các block (đã chuẩn hoá khoảng trắng) có trong mọi stylesheet và đưa được lên đầu mọi
+    stylesheet mà không đổi cascade: không vượt qua block nào đứng trước nó đặt cùng nhóm thuộc
+    tính, và giữ thứ tự tương đối giữa các block được đưa lên với nhau.
+    """
+    if len(sheets) < 2 or not all(sheets):
+        return []
+    positions = [{} for _ in sheets]  # block -> vị trí xuất hiện đầu tiên trong từng sheet
+    for sheet, first in zip(sheets, positions):
+        for idx, block in enumerate(sheet):
+            first.setdefault(block, idx)
+    keys = {}
+    hoisted = []
+    for block in sheets[0]:
+        if block in hoisted or not all(block in first for first in positions):
+            continue
+        block_keys = keys.setdefault(block, _block_keys(block))
+        movable = True
+        for sheet, first in zip(sheets, positions):
+            at = first[block]
+            for other in sheet[:at]:
+                if other not in hoisted and _conflict(block_keys, keys.setdefault(other, _block_keys(other))):
+                    movable = False
+                    break
+            # Block đã đưa lên đứng sau nó trong sheet này và cùng nhóm: đổi thứ tự giữa hai block
+            if movable and any(first[h] > at and _conflict(block_keys, keys[h]) for h in hoisted):
+                movable = False
+            if not movable:
+                break
+        if movable:
+            hoisted.append(block)
+    return hoisted
+
+
+def deck_stylesheet(sheets: list) -> tuple:
+    """
+    (chỉ số các slide dùng deck.css, block của deck.css). Xét cả nhóm mọi slide lẫn nhóm các slide
+    cùng chứa một block có ở ít nhất MIN_SHARED_FRACTION số slide, chọn nhóm tiết kiệm nhiều byte
+    nhất; slide ngoài nhóm giữ nguyên CSS của nó và không link deck.css.
+    """
+    everyone = list(range(len(sheets)))
+    candidates = [everyone]
+    counts = {}
+    for sheet in sheets:
+        for block in set(sheet):
+            counts[block] = counts.get(block, 0) + 1
+    threshold = max(2, MIN_SHARED_FRACTION * len(sheets))
+    seen = {tuple(everyone)}
+    for block, count in sorted(counts.items(), key=lambda item: -item[1]):
+        if count < threshold:
+            break
+        members = [idx for idx, sheet in enumerate(sheets) if block in sheet]
+        if tuple(members) not in seen:
+            seen.add(tuple(members))
+            candidates.append(members)
+
+    best, best_saving = ([], []), 0
+    for members in candidates:
+        hoisted = shared_blocks([sheets[idx] for idx in members])
+        # Stylesheet giống hệt nhau đã dùng chung một file → chỉ tính sheet khác nhau
+        distinct = len({tuple(sheets[idx]) for idx in members})
+        saving = (distinct - 1) * sum(len(block) for block in hoisted) - len(members) * len(DECK_CSS_LINK)
+        if saving > best_saving:
+            best, best_saving = (members, hoisted), saving
+    return best
+
+
+def _parse_family(spec: str):
+    """('Name', {(ital, wght)...}) từ một giá trị `family=` của css2; None nếu dùng trục khác."""
+    name, _, axes = spec.partition(':')
+    if not axes:
+        return name, {('0', '400')}
+    tags, _, values = axes.partition('@')
+    tags = tags.split(',')
+    if tags == ['wght']:
+        return name, {('0', w) for w in values.split(';')}
+    if tags == ['ital', 'wght']:
+        return name, {tuple(v.split(',', 1)) for v in values.split(';')}
+    if tags == ['ital']:
+        return name, {(i, '400') for i in values.split(';')}
+    return None
+
+
+def merge_font_links(queries: list) -> str:
+    """
+    Một URL css2 cho mọi link Google Fonts của deck. Trọng số/kiểu nghiêng của cùng family
+    được hợp lại; family dùng trục khác (wdth, opsz...) được giữ nguyên văn.
+    """
+    families, verbatim, display = {}, [], None
+    for query in queries:
+        for param in query.split('&'):
+            key, _, value = param.partition('=')
+            if key == 'display':
+                display = display or value
+            elif key == 'family':
+                parsed = _parse_family(value)
+                if parsed is None:
+                    if value not in verbatim:
+                        verbatim.append(value)
+                else:
+                    families.setdefault(parsed[0], set()).update(parsed[1])
+    if not families and not verbatim:
+        return None
+
+    params = []
+    for name, styles in families.items():
+        ordered = sorted(styles, key=lambda s: (int(s[0]), float(s[1])))
+        if ordered == [('0', '400')]:
+            params.append(f'family={name}')
+        elif all(ital == '0' for ital, _ in ordered):
+            params.append(f"family={name}:wght@{';'.join(w for _, w in ordered)}")
+        else:
+            params.append(f"family={name}:ital,wght@{';'.join(f'{i},{w}' for i, w in ordered)}")
+    params.extend(f'family={value}' for value in verbatim)
+    if display:
+        params.append(f'display={display}')
+    return f"{FONTS_CSS_URL}?{'&'.join(params)}"
+
+
+def _font_links(url: str, indent: str = '    ') -> str:
+    if not url:
+        return ''
+    return (f'{indent}<link rel="preconnect" href="https://fonts.googleapis.com">\n'
+            f'{indent}<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>\n'
+            f'{indent}<link href="{url}" rel="stylesheet">\n')
+
+
+class DeckBundle:
+    def __init__(self, files: dict, original_bytes: int):
+        self.files = files
+        self.original_bytes = original_bytes
+
+    @property
+    def bytes(self) -> int:
+        return sum(len(content.encode('utf-8')) for content in self.files.values())
+
+    @property
+    def slides(self) -> list:
+        return [self.files[name] for name in sorted(self.files) if name.startswith('slides/')]
+
+    def write(self, directory: str) -> str:
+        for name, content in self.files.items():
+            path = os.path.join(directory, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+        return os.path.join(directory, 'index.html')
+
+    def to_zip(self) -> bytes:
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as zf:
+            for name, content in sorted(self.files.items()):
+                zf.writestr(name, content)
+        return archive.getvalue()
+
+
+def bundle_documents(documents: list, title: str = 'Deck') -> DeckBundle:
+    """Gom CSS/font của các slide (document HTML đầy đủ) đã render sẵn thành một DeckBundle."""
+    heads, sheets, font_queries = [], [], []
+    for doc in documents:
+        head_end = doc.lower().find('</head>')
+        head_end = head_end if head_end != -1 else 0
+        head, body = doc[:head_end], doc[head_end:]
+        font_queries.extend(FONT_HREF_RE.findall(head))
+        head = FONT_LINK_RE.sub('', head)
+        styles = STYLE_RE.findall(head)
+        first = STYLE_RE.search(head)
+        insert_at = first.start() if first else len(head)
+        head = STYLE_RE.sub('', head[:insert_at]) + '\0' + STYLE_RE.sub('', head[insert_at:])
+        heads.append((head, body))
+        sheets.append([block for css in styles for block in css_blocks(css)])
+
+    normalized = [[' '.join(block.split()) for block in sheet] for sheet in sheets]
+    members, hoisted = deck_stylesheet(normalized)
+    members = set(members)
+
+    files = {}
+    if hoisted:
+        first = min(members)
+        originals = dict(zip(normalized[first], sheets[first]))
+        files['css/deck.css'] = '\n'.join(originals[block] for block in hoisted) + '\n'
+    fonts_url = merge_font_links(font_queries)
+    slide_names = []
+    for idx, ((head, body), sheet, norm) in enumerate(zip(heads, sheets, normalized), start=1):
+        shared = hoisted if idx - 1 in members else []
+        links = [DECK_CSS_LINK] if shared else []
+        # Bỏ lần xuất hiện đầu tiên của mỗi block đã đưa vào deck.css
+        pending = set(shared)
+        rest = []
+        for block, key in zip(sheet, norm):
+            if key in pending:
+                pending.discard(key)
+            else:
+                rest.append(block)
+        if rest:
+            css = '\n'.join(rest) + '\n'
+            name = f'css/{hashlib.sha256(css.encode("utf-8")).hexdigest()[:16]}.css'
+            files[name] = css
+            links.append(f'    <link rel="stylesheet" href="../{name}">')
+        head = head.replace('\0', '\n'.join(links) + '\n' if links else '')
+        if fonts_url:
+            # <meta charset> phải nằm trong 1024 byte đầu: link font chèn sau nó, không có thì sau <head>
+            match = META_CHARSET_RE.search(head) or HEAD_OPEN_RE.search(head)
+            at = match.end() if match else 0
+            head = head[:at] + '\n' + _font_links(fonts_url).rstrip('\n') + head[at:]
+        slide_name = f'slides/{idx:03d}.html'
+        files[slide_name] = head + body
+        slide_names.append(slide_name)
+
+    files['index.html'] = DECK_INDEX_TEMPLATE.format(
+        title=title,
+        fonts=_font_links(fonts_url),
+        slides='\n'.join(f'    <div class="deck-slide"><iframe src="{name}" loading="lazy"></iframe></div>'
+                         for name in slide_names),
+    )
+    return DeckBundle(files, sum(len(doc.encode('utf-8')) for doc in documents))
+
+
+def render_deck(slides: list, library=None, title: str = 'Deck') -> DeckBundle:
+    """
+    Render danh sách (tên generator, kwargs) bằng html_lib (qua template biên dịch sẵn
+    khi không chỉ định `library`) rồi gom thành DeckBundle.
+    """
+    if library is None:
+        from html_templates import compiled_library
+        library = compiled_library()
+    documents = [getattr(library, name)(**(kwargs or {})) for name, kwargs in slides]
+    return bundle_documents(documents, title=title)
+
+
+if __name__ == '__main__':
+    # python html_deck.py deck.json out_dir
+    # deck.json: [["generate_title_slide", {"main_title": "..."}], ...]
+    if len(sys.argv) != 3:
+        print('Cách dùng: python html_deck.py <deck.json> <thư mục output>')
+        sys.exit(1)
+    with open(sys.argv[1], 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+    bundle = render_deck([(name, kwargs) for name, kwargs in spec])
+    index = bundle.write(sys.argv[2])
+    print(f'✓ {len(spec)} slide → {index}')
+    print(f'  {bundle.original_bytes:,} bytes → {bundle.bytes:,} bytes '
+          f'({bundle.bytes * 100 / max(1, bundle.original_bytes):.0f}%)')
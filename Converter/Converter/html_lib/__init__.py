@@ -0,0 +1,172 @@
+"""
+Thư viện slide template: các hàm `generate_*(...) -> str` trả về HTML 1920x1080 của một slide.
+
+Thư viện được chia theo loại slide thành các module con (intro, transition, content, team,
+thank_you) và nạp lười: `import html_lib` chỉ nạp file này, còn `html_lib.generate_x` (hay
+`from html_lib import generate_x`) mới import đúng module con chứa hàm đó, một lần. Nhờ vậy
+backend và các tool chỉ dùng vài generator không phải biên dịch/nạp cả ~21k dòng template.
+
+    import html_lib
+    html = html_lib.generate_title_slide(main_title="Báo cáo")
+    for name, fn in html_lib.iter_generators():   # nạp mọi module con
+        ...
+"""
+
+import importlib
+
+CATEGORIES = ('intro', 'transition', 'content', 'team', 'thank_you')
+
+# Tên generator -> module con. Generator mới chưa có ở đây vẫn tìm được (chậm hơn, quét mọi
+# module con), nhưng nên thêm vào để giữ đường nạp lười.
+_REGISTRY = {
+    'generate_title_slide': 'intro',
+    'generate_introduction_slide': 'intro',
+    'generate_intro_slide1': 'intro',
+    'generate_elegant_intro_slide': 'intro',
+    'generate_title_slide_2': 'intro',
+    'generate_dynamic_intro_slide': 'intro',
+    'generate_big_concept_slide': 'intro',
+    'generate_elegant_agenda_slide': 'intro',
+    'generate_playful_title_slide': 'intro',
+    'generate_minimalist_title_slide': 'intro',
+    'generate_mission_slide': 'intro',
+    'generate_training_intro_slide': 'intro',
+    'generate_employee_intro_slide': 'intro',
+    'generate_research_proposal_slide': 'intro',
+    'generate_business_intro_slide': 'intro',
+    'generate_title_slide_3': 'intro',
+    'generate_minimalist_slide': 'intro',
+    'generate_title_slide_5': 'intro',
+    'generate_title_slide_7': 'intro',
+    'generate_title_slide_11': 'intro',
+    'generate_title_slide_12': 'intro',
+    'generate_title_slide_13': 'intro',
+    'generate_title_slide_15': 'intro',
+    'generate_title_slide_17': 'intro',
+    'generate_title_slide_18': 'intro',
+    'generate_geometric_transition_slide': 'transition',
+    'generate_dusk_transition_slide': 'transition',
+    'generate_memphis_transition_slide': 'transition',
+    'generate_pushpin_section_header': 'transition',
+    'generate_section_header_slide': 'transition',
+    'generate_intro_slide': 'transition',
+    'generate_research_proposal_transition_slide': 'transition',
+    'generate_business_transition_slide': 'transition',
+    'generate_section_header_slide_5': 'transition',
+    'generate_section_header_slide_6': 'transition',
+    'generate_section_header_slide_8': 'transition',
+    'generate_section_header_slide_9': 'transition',
+    'generate_section_header_slide_10': 'transition',
+    'generate_section_header_slide_12': 'transition',
+    'generate_section_header_slide_15': 'transition',
+    'generate_section_header_slide_17': 'transition',
+    'generate_section_header_slide_18': 'transition',
+    'generate_content_slide': 'content',
+    'generate_comparison_slide': 'content',
+    'generate_process_slide': 'content',
+    'generate_process_steps_slide': 'content',
+    'generate_icon_list_slide_2': 'content',
+    'generate_image_cutout_list_slide': 'content',
+    'generate_body_slide2': 'content',
+    'generate_body_slide4': 'content',
+    'generate_body_slide5': 'content',
+    'generate_body_slide7': 'content',
+    'generate_body_slide10': 'content',
+    'generate_body_slide11': 'content',
+    'generate_body_slide12': 'content',
+    'generate_body_slide15': 'content',
+    'generate_body_slide18': 'content',
+    'generate_body_slide19': 'content',
+    'generate_body_slide20': 'content',
+    'generate_main_points_slide': 'content',
+    'generate_elegant_points_slide': 'content',
+    'generate_corporate_content_slide': 'content',
+    'generate_split_content_slide': 'content',
+    'generate_corporate_multicolumn_slide': 'content',
+    'generate_corporate_grid_slide': 'content',
+    'generate_vision_mission_slide': 'content',
+    'generate_strategic_goals_slide': 'content',
+    'generate_service_roadmap_slide': 'content',
+    'generate_financial_projections_slide_dark': 'content',
+    'generate_minimalist_tech_list_slide': 'content',
+    'generate_split_layout_list_slide': 'content',
+    'generate_reference_slide': 'content',
+    'generate_icon_list_slide': 'content',
+    'generate_flexible_columns_slide': 'content',
+    'generate_text_with_image_slide': 'content',
+    'generate_instructions_slide': 'content',
+    'generate_geometric_split_content_slide': 'content',
+    'generate_geometric_split_content_slide_2': 'content',
+    'generate_geometric_image_content_slide': 'content',
+    'generate_geometric_grid_slide': 'content',
+    'generate_memphis_content_slide': 'content',
+    'generate_memphis_multicolumn_slide': 'content',
+    'generate_memphis_grid_slide': 'content',
+    'generate_premium_abstract_slide': 'content',
+    'generate_company_mission_slide': 'content',
+    'generate_methodology_slide': 'content',
+    'generate_planning_phase_slide': 'content',
+    'generate_timeline_slide': 'content',
+    'generate_quote_slide': 'content',
+    'generate_classic_content_slide': 'content',
+    'generate_team_slide': 'team',
+    'generate_colorful_team_grid_slide': 'team',
+    'generate_corporate_team_slide': 'team',
+    'generate_thank_you_slide_3': 'thank_you',
+    'generate_corporate_thank_you_slide': 'thank_you',
+    'generate_business_thank_you_slide': 'thank_you',
+    'generate_thank_you_slide_4': 'thank_you',
+    'generate_thank_you_decorative_slide': 'thank_you',
+    'generate_watercolor_thank_you_slide': 'thank_you',
+    'generate_thank_you_slide_5': 'thank_you',
+    'generate_thank_you_slide_6': 'thank_you',
+    'generate_thank_you_slide_7': 'thank_you',
+    'generate_modern_contact_slide': 'thank_you',
+    'generate_closing_slide': 'thank_you',
+    'generate_minimalist_thank_you_slide': 'thank_you',
+    'generate_minimalist_sage_slide': 'thank_you',
+    'generate_thank_you_so_much_slide': 'thank_you',
+    'generate_brand_collaboration_closing_slide': 'thank_you',
+    'generate_military_thank_you_slide': 'thank_you',
+    'generate_corporate2_thank_you_slide': 'thank_you',
+    'generate_creative_thank_you_slide': 'thank_you',
+    'generate_tech_thank_you_slide': 'thank_you',
+    'generate_minimalist_thank_you_slide_2': 'thank_you',
+    'generate_elegant_thank_you_slide': 'thank_you',
+}
+
+__all__ = tuple(_REGISTRY)
+
+
+def _load(category):
+    return importlib.import_module(f'{__name__}.{category}')
+
+
+def __getattr__(name):
+    category = _REGISTRY.get(name)
+    if category is not None:
+        value = getattr(_load(category), name)
+    elif name.startswith('generate_'):
+        for module in map(_load, CATEGORIES):
+            if hasattr(module, name):
+                value = getattr(module, name)
+                break
+        else:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # lần sau không qua __getattr__ nữa
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_REGISTRY))
+
+
+def iter_generators(categories=CATEGORIES):
+    """(tên, hàm) của mọi hàm `generate_*` định nghĩa trong các module con, theo thứ tự trong file."""
+    for category in categories:
+        module = _load(category)
+        for name, value in vars(module).items():
+            if name.startswith('generate_') and callable(value) and getattr(value, '__module__', None) == module.__name__:
+                yield name, value
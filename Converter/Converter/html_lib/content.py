@@ -0,0 +1,10440 @@
+"""Slide nội dung (SLIDE CONTENT)."""
+
+#------------------------SLIDE CONTENT
+def generate_content_slide(
+    main_title="CONTENT",
+    items=None,
+    main_title_color="#555555",
+    number_color="#a2c4c9",
+    item_title_color="#555555",
+    background_color="#ffffff",
+    accent_color="#a2c4c9",
+    border_width="30px",
+    font_family="Arial, sans-serif",
+    num_columns=3,
+    num_rows=2,
+):
+    """
+    Generates an HTML slide with a main title and a grid of numbered items.
+    
+    Parameters:
+    - main_title: The main title of the slide
+    - items: List of item titles (default is ["Your Title Here"] * 6)
+    - main_title_font_size: Font size for the main title
+    - number_font_size: Font size for the item numbers
+    - item_title_font_size: Font size for the item titles
+    - main_title_color: Color for the main title
+    - number_color: Color for the item numbers
+    - item_title_color: Color for the item titles
+    - background_color: Background color of the slide
+    - accent_color: Color for the corner accents
+    - border_width: Width of the border around the slide
+    - font_family: Font family for the slide
+    - num_columns: Number of columns in the grid
+    - num_rows: Number of rows in the grid
+    
+    Returns:
+    - HTML code for the content slide
+    """
+    
+    # Default values if not provided
+    if items is None:
+        items = ["Your Title Here"] * 6
+    
+    # Ensure we have enough items
+    num_items = num_columns * num_rows
+    if len(items) < num_items:
+        items.extend(["Your Title Here"] * (num_items - len(items)))
+    elif len(items) > num_items:
+        items = items[:num_items]
+    
+    # Generate HTML for grid items
+    grid_items_html = ""
+    for i in range(num_items):
+        item_number = str(i + 1).zfill(2)
+        item_title = items[i]
+        
+        grid_items_html += f"""
+        <div class="content-card">
+            <div class="item-number">{item_number}</div>
+            <div class="item-title">{item_title}</div>
+        </div>
+        """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Content Slide</title>
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; }}
+        body {{
+            font-family: {font_family};
+            background: {accent_color};
+            width: 100vw;
+            height: 100vh;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            overflow: hidden;
+        }}
+
+        .slide-container {{
+            width: 95vw;
+            height: 90vh;
+            max-width: 1400px;
+            max-height: 900px;
+            background: {background_color};
+            border-radius: 20px;
+            box-shadow: 0 15px 40px rgba(0,0,0,0.15);
+            display: flex;
+            flex-direction: column;
+            padding: 4rem;
+            position: relative;
+        }}
+
+        .slide-container::before {{
+            content: '';
+            position: absolute;
+            top: 0;
+            left: 0;
+            right: 0;
+            height: 5px;
+            background: linear-gradient(90deg, {accent_color}, {number_color});
+            border-radius: 20px 20px 0 0;
+        }}
+        
+        .main-title {{
+            font-size: 5rem !important;
+            font-weight: 700;
+            color: {main_title_color};
+            text-align: center !important;
+            margin-bottom: 3rem;
+            letter-spacing: 0.02em;
+            position: relative;
+            display: block;
+            width: 100%;
+        }}
+
+        .main-title::after {{
+            content: '';
+            position: absolute;
+            bottom: -1rem;
+            left: 50%;
+            transform: translateX(-50%);
+            width: 100px;
+            height: 3px;
+            background: {number_color};
+            border-radius: 2px;
+        }}
+        
+        .grid-container {{
+            display: grid;
+            grid-template-columns: repeat({num_columns}, 1fr);
+            grid-template-rows: repeat({num_rows}, 1fr);
+            gap: 2rem;
+            flex: 1;
+            padding: 1rem 0;
+        }}
+        
+        .content-card {{
+            background: linear-gradient(135deg, rgba(255,255,255,0.9), rgba(255,255,255,0.7));
+            border: 2px solid {accent_color}20;
+            border-radius: 16px;
+            padding: 2rem;
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+            text-align: center;
+            position: relative;
+            box-shadow: 0 8px 25px rgba(0,0,0,0.08);
+            overflow: hidden;
+        }}
+
+        .content-card::before {{
+            content: '';
+            position: absolute;
+            top: 0;
+            left: 0;
+            right: 0;
+            height: 4px;
+            background: linear-gradient(90deg, {number_color}, {accent_color});
+        }}
+        
+        .item-number {{
+            font-size: 3rem !important;
+            font-weight: 700;
+            color: {number_color};
+            margin-bottom: 1rem;
+            line-height: 1;
+            position: relative;
+            text-align: center !important;
+            display: block;
+        }}
+
+        .item-number::after {{
+            content: '';
+            position: absolute;
+            bottom: -0.5rem;
+            left: 50%;
+            transform: translateX(-50%);
+            width: 40px;
+            height: 2px;
+            background: {number_color}40;
+            border-radius: 1px;
+        }}
+        
+        .item-title {{
+            font-size: 2rem !important;
+            font-weight: 500;
+            color: {item_title_color};
+            line-height: 1.4;
+            text-align: center !important;
+            display: block;
+            width: 100%;
+        }}
+
+        /* Responsive Design */
+        @media (max-width: 75rem) {{
+            .slide-container {{ padding: 3rem; }}
+            .main-title {{ font-size: 3rem; }}
+            .item-number {{ font-size: 3rem; }}
+            .item-title {{ font-size: 1.1rem; }}
+        }}
+
+        @media (max-width: 50rem) {{
+            .slide-container {{ 
+                width: 98vw;
+                height: 95vh;
+                padding: 2rem;
+            }}
+            .main-title {{ 
+                font-size: 2.5rem; 
+                margin-bottom: 2rem;
+            }}
+            .grid-container {{ 
+                grid-template-columns: repeat(2, 1fr);
+                grid-template-rows: repeat(3, 1fr);
+                gap: 1.5rem;
+            }}
+            .content-card {{ padding: 1.5rem; }}
+            .item-number {{ font-size: 2.5rem; }}
+            .item-title {{ font-size: 1rem; }}
+        }}
+
+        @media (max-width: 30rem) {{
+            .grid-container {{ 
+                grid-template-columns: 1fr;
+                grid-template-rows: repeat(6, 1fr);
+                gap: 1rem;
+            }}
+            .content-card {{ padding: 1rem; }}
+            .item-number {{ font-size: 2rem; }}
+            .item-title {{ font-size: 0.9rem; }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <h1 class="main-title">{main_title}</h1>
+        
+        <div class="grid-container">
+            {grid_items_html}
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+def generate_comparison_slide(
+    main_title="Your Title Here",
+    left_title="Your Title Here",
+    right_title="Your Title Here",
+    left_text="Presentation are communication tools that can be used as demontrations, lectures, reports, and more. it is mostly presented before an audience. Presentation are communication tools that can be used as demontrations, lectures, reports, and more.",
+    right_text="Presentation are communication tools that can be used as demontrations, lectures, reports, and more. it is mostly presented before an audience. Presentation are communication tools that can be used as demontrations, lectures, reports, and more.",
+    left_icon="gavel",  # Options: "gavel", "custom"
+    right_icon="scales",  # Options: "scales", "custom"
+    custom_left_icon="",  # Custom SVG code if left_icon is "custom"
+    custom_right_icon="",  # Custom SVG code if right_icon is "custom"
+    title_color="#555555",
+    text_color="#555555",
+    icon_color="#a2c4c9",
+    background_color="#ffffff",
+    accent_color="#a2c4c9",
+    divider_color="#555555",
+    font_family="Arial, sans-serif",
+):
+    """
+    Generates an HTML slide with a main title and two comparison columns with icons.
+    The slide has a border design that matches the image exactly.
+    
+    Parameters:
+    - main_title: The main title of the slide
+    - left_title: Title for the left column
+    - right_title: Title for the right column
+    - left_text: Text content for the left column
+    - right_text: Text content for the right column
+    - left_icon: Icon for the left column ("gavel" or "custom")
+    - right_icon: Icon for the right column ("scales" or "custom")
+    - custom_left_icon: Custom SVG code for left icon if left_icon is "custom"
+    - custom_right_icon: Custom SVG code for right icon if right_icon is "custom"
+    - main_title_font_size: Font size for the main title
+    - column_title_font_size: Font size for the column titles
+    - text_font_size: Font size for the text content
+    - title_color: Color for all titles
+    - text_color: Color for all text content
+    - icon_color: Color for the icons
+    - background_color: Background color of the slide
+    - accent_color: Color for the corner accents
+    - divider_color: Color for the divider line
+    - font_family: Font family for the slide
+    
+    Returns:
+    - HTML code for the comparison slide
+    """
+    
+    # Define the SVG icons
+    gavel_icon = f"""<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" width="70" height="70" fill="none" stroke="{icon_color}" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+        <path d="M14 13L3 2M14 13L9 18M14 13L16 11L20 15L18 17M14 6L17 9M9 1L3 7M20 21H4"/>
+    </svg>"""
+    
+    scales_icon = f"""<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" width="70" height="70" fill="none" stroke="{icon_color}" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+        <path d="M12 3v18M8 21h8M7 8l-4 4M17 8l4 4M5 12a2 2 0 1 0 4 0 2 2 0 1 0-4 0M15 12a2 2 0 1 0 4 0 2 2 0 1 0-4 0"/>
+        <path d="M5 12h14"/>
+    </svg>"""
+    
+    # Select the appropriate icons
+    if left_icon == "gavel":
+        left_icon_html = gavel_icon
+    elif left_icon == "custom":
+        left_icon_html = custom_left_icon
+    else:
+        left_icon_html = gavel_icon
+        
+    if right_icon == "scales":
+        right_icon_html = scales_icon
+    elif right_icon == "custom":
+        right_icon_html = custom_right_icon
+    else:
+        right_icon_html = scales_icon
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Comparison Slide</title>
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; width: 1920px; height: 1080px; }}
+        body, html {{
+            height: 1080px;
+            width: 1920px;
+            font-family: {font_family};
+            background-color: {accent_color};
+            color: {title_color};
+            overflow: hidden;
+        }}
+
+        .slide-background {{
+            position: absolute;
+            left: 120px;
+            top: 80px;
+            width: 1680px;
+            height: 920px;
+            background-color: {background_color};
+            border-radius: 16px;
+            box-shadow: 0 20px 40px rgba(0,0,0,0.15);
+        }}
+        
+        .main-title {{
+            position: absolute;
+            left: 200px;
+            top: 140px;
+            width: 1520px;
+            font-size: 80px;
+            font-weight: 700;
+            color: {title_color};
+            text-align: center;
+            line-height: 1.2;
+        }}
+        
+        .left-column {{
+            position: absolute;
+            left: 200px;
+            top: 260px;
+            width: 730px;
+            height: 680px;
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+            justify-content: flex-start;
+            padding: 50px 40px;
+            text-align: center;
+        }}
+        
+        .right-column {{
+            position: absolute;
+            left: 990px;
+            top: 260px;
+            width: 730px;
+            height: 680px;
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+            justify-content: flex-start;
+            padding: 50px 40px;
+            text-align: center;
+        }}
+        
+        .divider {{
+            position: absolute;
+            left: 960px;
+            top: 280px;
+            width: 3px;
+            height: 640px;
+            border-left: 3px dashed {divider_color};
+        }}
+        
+        .left-icon {{
+            margin-bottom: 40px;
+        }}
+        
+        .right-icon {{
+            margin-bottom: 40px;
+        }}
+        
+        .left-title {{
+            font-size: 45px;
+            font-weight: 700;
+            color: {title_color};
+            text-align: center;
+            margin-bottom: 30px;
+            line-height: 1.3;
+        }}
+        
+        .right-title {{
+            font-size: 45px;
+            font-weight: 700;
+            color: {title_color};
+            text-align: center;
+            margin-bottom: 30px;
+            line-height: 1.3;
+        }}
+        
+        .left-text {{
+            font-size: 30px;
+            color: {text_color};
+            text-align: center;
+            line-height: 1.6;
+        }}
+        
+        .right-text {{
+            font-size: 30px;
+            color: {text_color};
+            text-align: center;
+            line-height: 1.6;
+        }}
+    </style>
+</head>
+<body>
+    <!-- Background layer -->
+    <div class="slide-background"></div>
+    
+    <!-- Main title -->
+    <h1 class="main-title">{main_title}</h1>
+    
+    <!-- Left column -->
+    <div class="left-column">
+        <div class="left-icon">
+            {left_icon_html}
+        </div>
+        <h2 class="left-title">{left_title}</h2>
+        <p class="left-text">{left_text}</p>
+    </div>
+    
+    <!-- Divider -->
+    <div class="divider"></div>
+    
+    <!-- Right column -->
+    <div class="right-column">
+        <div class="right-icon">
+            {right_icon_html}
+        </div>
+        <h2 class="right-title">{right_title}</h2>
+        <p class="right-text">{right_text}</p>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+def generate_process_slide(
+    main_title="Your Title Here",
+    left_title="Your Title Here",
+    right_title="Your Title Here",
+    left_content="Presentation are communication tools that can be used as demontrations, lectures, reports, and more. it is mostly presented before an audience. Presentation are communication tools that can be used as demontrations, lectures, reports, and more.",
+    right_content="Presentation are communication tools that can be used as demontrations, lectures, reports, and more. it is mostly presented before an audience. Presentation are communication tools that can be used as demontrations, lectures, reports, and more.",
+    title_color="#555555",
+    left_box_color="#8cbeca",
+    right_box_color="#70c5da",
+    text_color="#ffffff",
+    arrow_color="#f0f0f0",
+    background_color="#ffffff",
+    accent_color="#a2c4c9",
+    border_width="30px",
+    font_family="Arial, sans-serif",
+    box_width="380px",
+    box_height="350px",
+    box_border_radius="5px",
+):
+    """
+    Generates an HTML slide with a main title and two process boxes connected by an arrow.
+    
+    Parameters:
+    - main_title: The main title of the slide
+    - left_title: Title for the left box
+    - right_title: Title for the right box
+    - left_content: Content text for the left box
+    - right_content: Content text for the right box
+    - main_title_font_size: Font size for the main title
+    - box_title_font_size: Font size for the box titles
+    - content_font_size: Font size for the content text
+    - title_color: Color for the main title
+    - left_box_color: Background color for the left box
+    - right_box_color: Background color for the right box
+    - text_color: Color for the text in the boxes
+    - arrow_color: Color for the arrow connecting the boxes
+    - background_color: Background color of the slide
+    - accent_color: Color for the corner accents
+    - border_width: Width of the border around the slide
+    - font_family: Font family for the slide
+    - box_width: Width of each box
+    - box_height: Height of each box
+    - box_border_radius: Border radius for the boxes
+    
+    Returns:
+    - HTML code for the process slide
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Process Slide</title>
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; }}
+        body {{
+            font-family: {font_family};
+            background: {accent_color};
+            width: 100vw;
+            height: 100vh;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            overflow: hidden;
+        }}
+
+        .slide-container {{
+            width: 98vw;
+            height: 96vh;
+            max-width: 1600px;
+            max-height: 1000px;
+            background: {background_color};
+            border-radius: 20px;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+            display: flex;
+            flex-direction: column;
+            padding: 5rem;
+            position: relative;
+        }}
+        
+        .main-title {{
+            font-size: 6rem !important;
+            font-weight: 700;
+            color: {title_color};
+            text-align: center !important;
+            margin-bottom: 4rem;
+            line-height: 1.2;
+            display: block;
+            width: 100%;
+        }}
+        
+        .boxes-container {{
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            position: relative;
+            flex: 1;
+            gap: 2rem;
+        }}
+        
+        .process-box {{
+            flex: 1;
+            max-width: 650px;
+            background: var(--box-color);
+            border-radius: 25px;
+            padding: 5rem;
+            color: {text_color};
+            box-shadow: 0 8px 20px rgba(0,0,0,0.1);
+            z-index: 2;
+        }}
+
+        .left-box {{
+            --box-color: {left_box_color};
+        }}
+        
+        .right-box {{
+            --box-color: {right_box_color};
+        }}
+        
+        .box-title {{
+            font-size: 3.5rem !important;
+            font-weight: 600;
+            margin-bottom: 2.5rem;
+            text-align: center !important;
+            display: block;
+            width: 100%;
+        }}
+        
+        .box-content {{
+            font-size: 2rem !important;
+            line-height: 1.8;
+            text-align: center !important;
+            display: block;
+            width: 100%;
+        }}
+        
+        .arrow-container {{
+            position: absolute;
+            top: 50%;
+            left: 50%;
+            transform: translate(-50%, -50%);
+            z-index: 3;
+        }}
+
+        .arrow {{
+            width: 100px;
+            height: 100px;
+            background: {left_box_color};
+            border-radius: 50%;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            box-shadow: 0 4px 12px rgba(0,0,0,0.15);
+        }}
+
+        .arrow::before {{
+            content: '→';
+            font-size: 2.8rem !important;
+            color: {text_color};
+            font-weight: bold;
+        }}
+
+     
+
+        /* Responsive Design */
+        @media (max-width: 75rem) {{
+            .slide-container {{ padding: 3rem; }}
+            .main-title {{ font-size: 2.25rem; }}
+            .box-title {{ font-size: 1.5rem; }}
+            .box-content {{ font-size: 1rem; }}
+        }}
+
+        @media (max-width: 50rem) {{
+            .slide-container {{ 
+                padding: 2rem;
+                width: 95vw;
+                height: 90vh;
+            }}
+            .main-title {{ font-size: 2rem; margin-bottom: 2.5rem; }}
+            .boxes-container {{ 
+                flex-direction: column; 
+                gap: 2rem;
+            }}
+            .process-box {{ 
+                max-width: 100%;
+                padding: 2rem;
+            }}
+            .arrow-container {{
+                position: relative;
+                top: auto;
+                left: auto;
+                transform: none;
+                margin: 1rem 0;
+            }}
+            .arrow::before {{
+                content: '↓';
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <h1 class="main-title">{main_title}</h1>
+        
+        <div class="boxes-container">
+            <!-- Left Process Box -->
+            <div class="process-box left-box">
+                <h2 class="box-title">{left_title}</h2>
+                <p class="box-content">{left_content}</p>
+            </div>
+            
+            <!-- Arrow Connection -->
+            <div class="arrow-container">
+                <div class="arrow"></div>
+            </div>
+            
+            <!-- Right Process Box -->
+            <div class="process-box right-box">
+                <h2 class="box-title">{right_title}</h2>
+                <p class="box-content">{right_content}</p>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+# form business
+def generate_process_steps_slide(
+    main_title="Cách tiếp cận đề xuất",
+    steps=[
+        {
+            "image_url": "https://images.unsplash.com/photo-1516321497487-e288fb19713f?q=80&w=2940&auto=format&fit=crop",
+            "title": "Thiết lập nền tảng số",
+            "description": "Thuyết trình là công cụ giao tiếp có thể dùng để giảng dạy."
+        },
+        {
+            "image_url": "https://images.unsplash.com/photo-1506905925346-21bda4d32df4",
+            "title": "Ra mắt các chiến dịch số",
+            "description": "Thuyết trình là công cụ giao tiếp có thể dùng để giảng dạy."
+        },
+        {
+            "image_url": "https://images.unsplash.com/photo-1454165804606-c3d57bc86b40?q=80&w=2940&auto=format&fit=crop",
+            "title": "Theo dõi kết quả",
+            "description": "Thuyết trình là công cụ giao tiếp có thể dùng để giảng dạy."
+        }
+    ],
+    accent_color="#EAD6D6",
+    bg_color="#FCFCFC",
+    title_color="#1F2937",
+    text_heading_color="#374151",
+    text_body_color="#6B7280",
+    font_family_title="'Playfair Display', serif",
+    font_family_body="'Montserrat', sans-serif",
+    custom_css=""
+):
+    """
+    Generates a structured, multi-step process or plan slide.
+    Features a three-column layout with a title panel, an image strip, and corresponding text.
+    """
+    
+    images_html = ""
+    steps_text_html = ""
+    for step in steps:
+        images_html += f"<img src='{step.get('image_url', '')}' alt='{step.get('title', '')}' class='step-image'>"
+        steps_text_html += f"""
+        <div class="step-item">
+            <h3 class="step-title">{step.get('title', '')}</h3>
+            <p class="step-description">{step.get('description', '')}</p>
+        </div>
+        """
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="vi">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{main_title}</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Playfair+Display:ital,wght@1,500&family=Montserrat:wght@400;500&display=swap" rel="stylesheet">
+    <style>
+        :root {{ font-size: 16px; }}
+        body, html {{
+            margin: 0; padding: 0; height: 100%; width: 100%;
+            font-family: {font_family_body};
+            overflow: hidden;
+            background-color: {bg_color};
+        }}
+        
+        .slide-container {{
+            width: 100%; height: 100vh;
+            display: flex; align-items: center; justify-content: center;
+        }}
+        
+        .content-wrapper {{
+            display: flex;
+            width: 100%; height: 100%;
+            max-width: 80rem; /* 1280px */
+        }}
+        
+        .title-section {{
+            flex: 0 0 30%;
+            background-color: {accent_color};
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            padding: 2rem;
+            box-sizing: border-box;
+        }}
+        
+        .main-title {{
+            font-family: {font_family_title};
+            font-size: 6rem;
+            font-weight: 500;
+            font-style: italic;
+            color: {title_color};
+            line-height: 1.3;
+            text-align: center;
+        }}
+        
+        .steps-layout {{
+            flex: 1;
+            display: flex;
+            align-items: center;
+            padding: 3rem 4rem;
+        }}
+        
+        .image-strip-section {{
+            display: flex;
+            flex-direction: column;
+            justify-content: space-between;
+            gap: 1.5rem;
+            height: 100%;
+            max-height: 35rem; /* 560px */
+        }}
+        .step-image {{
+            width: 10rem; /* 160px */
+            height: 10rem; /* 160px */
+            object-fit: cover;
+            box-shadow: 0 0.5rem 1.5rem rgba(0,0,0,0.07);
+        }}
+        
+        .steps-text-section {{
+            display: flex;
+            flex-direction: column;
+            justify-content: space-between;
+            padding-left: 3rem;
+            height: 100%;
+            max-height: 35rem; /* 560px */
+        }}
+        .step-item {{
+            flex: 1;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+        }}
+        .step-title {{
+            font-size: 2.4rem;
+            font-weight: 500;
+            color: {text_heading_color};
+            margin: 0 0 0.5rem 0;
+        }}
+        .step-description {{
+            font-size: 1.5rem;
+            color: {text_body_color};
+            line-height: 1.6;
+            margin: 0;
+            max-width: 25rem; /* 400px */
+        }}
+
+        @media (max-width: 64em) {{ /* 1024px */
+            .steps-layout {{ padding: 2rem; }}
+            .main-title {{ font-size: 2.5rem; }}
+        }}
+
+        @media (max-width: 48em) {{ /* 768px */
+            .content-wrapper {{ flex-direction: column; }}
+            .title-section {{ flex: 0 0 auto; width: 100%; height: 8rem; }}
+            .steps-layout {{ flex-direction: column; padding: 2rem; align-items: flex-start; overflow-y: auto; }}
+            .image-strip-section, .steps-text-section {{
+                 flex-direction: row; justify-content: flex-start; gap: 1rem;
+                 width: 100%; max-height: none; height: auto;
+                 padding-left: 0;
+            }}
+             .image-strip-section {{
+                 align-items: flex-start; /* Fix image alignment */
+                 flex-wrap: wrap; /* Allow wrapping */
+             }}
+            .steps-text-section {{
+                display: block; /* Change from flex to block */
+            }}
+            .step-item {{ margin-bottom: 2rem; }}
+            .step-image {{ width: 8rem; height: 8rem; }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="content-wrapper">
+            <div class="title-section">
+                <h1 class="main-title">{main_title}</h1>
+            </div>
+            <div class="steps-layout">
+                <div class="image-strip-section">
+                    {images_html}
+                </div>
+                <div class="steps-text-section">
+                    {steps_text_html}
+                </div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    return html_code
+
+
+
+
+def generate_icon_list_slide_2(
+    main_title="Giải pháp",
+    subtitle="CÁCH TIẾP CẬN ĐA KÊNH",
+    items=[
+        {
+            "icon_svg": '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="currentColor"><path d="M18 16.08c-.76 0-1.44.3-1.96.77L8.91 12.7c.05-.23.09-.46.09-.7s-.04-.47-.09-.7l7.05-4.11c.54.5 1.25.81 2.04.81 1.66 0 3-1.34 3-3s-1.34-3-3-3-3 1.34-3 3c0 .24.04.47.09.7L8.04 9.81C7.5 9.31 6.79 9 6 9c-1.66 0-3 1.34-3 3s1.34 3 3 3c.79 0 1.5-.31 2.04-.81l7.12 4.16c-.05.21-.08.43-.08.65 0 1.61 1.31 2.92 2.92 2.92s2.92-1.31 2.92-2.92-1.31-2.92-2.92-2.92z"/></svg>',
+            "text": "Hiện diện trực tuyến"
+        },
+        {
+            "icon_svg": '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="currentColor"><path d="M17 1.01L7 1c-1.1 0-2 .9-2 2v18c0 1.1.9 2 2 2h10c1.1 0 2-.9 2-2V3c0-1.1-.9-1.99-2-1.99zM17 19H7V5h10v14z"/></svg>',
+            "text": "Các chiến dịch số"
+        },
+        {
+            "icon_svg": '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="currentColor"><path d="M0 8c3.42 0 6.55 1.31 8.83 3.59L12 15l3.17-3.41A12.42 12.42 0 0024 8h-3c-1.93 0-3.68.79-4.95 2.05L12 14.1l-4.05-4.05A6.97 6.97 0 003 8H0z M1 22h22v-2H1v2zm2-2h18v-2H3v2zm2-2h14v-2H5v2z"/></svg>',
+            "text": "Hiện diện trực tuyến"
+        }
+    ],
+    accent_color="#EAD6D6",
+    bg_color="#FCFCFC",
+    title_color="#1F2937",
+    subtitle_color="#4B5563",
+    text_color="#374151",
+    icon_color="#FFFFFF",
+    font_family_title="'Playfair Display', serif",
+    font_family_body="'Montserrat', sans-serif",
+    custom_css=""
+):
+    """
+    Generates a clean, minimalist slide for presenting solutions, features, or key points.
+    Features a two-column layout with a large title on the left and a vertical list of icon-text pairs.
+    """
+    
+    list_items_html = ""
+    for item in items:
+        list_items_html += f"""
+        <div class="list-item">
+            <div class="icon-container">
+                {item.get('icon_svg', '')}
+            </div>
+            <p class="item-text">{item.get('text', '')}</p>
+        </div>
+        """
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="vi">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{main_title}</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Playfair+Display:ital,wght@1,500&family=Montserrat:wght@400;600&display=swap" rel="stylesheet">
+    <style>
+        :root {{ font-size: 16px; }}
+        body, html {{
+            margin: 0; padding: 0; height: 100%; width: 100%;
+            font-family: {font_family_body};
+            overflow: hidden;
+            background-color: {bg_color};
+        }}
+        
+        .slide-container {{
+            width: 100%; height: 100vh;
+            display: flex; align-items: center; justify-content: center;
+            padding: 4vw; box-sizing: border-box;
+        }}
+        
+        .content-wrapper {{
+            display: flex;
+            align-items: center;
+            width: 100%;
+            max-width: 70rem; /* 1120px */
+            transform: scale(1.2);
+            min-height: 60vh;
+        }}
+        
+        .title-section {{
+            flex: 1;
+            padding-right: 4rem;
+        }}
+        
+        .main-title {{
+            font-family: {font_family_title};
+            font-size: 4.5rem;
+            font-weight: 700;
+            font-style: italic;
+            color: {title_color};
+            margin-bottom: 2rem;
+            line-height: 1.1;
+        }}
+        
+        .subtitle {{
+            color: {subtitle_color};
+            font-size: 1.8rem;
+            font-weight: 700;
+            text-transform: uppercase;
+            letter-spacing: 0.05em;
+        }}
+
+        .list-section {{
+            flex: 1;
+            display: flex;
+            flex-direction: column;
+            gap: 3rem;
+        }}
+        
+        .list-item {{
+            display: flex;
+            align-items: center;
+            gap: 1.5rem;
+        }}
+
+        .icon-container {{
+            flex-shrink: 0;
+            width: 7rem;
+            height: 7rem;
+            background-color: {accent_color};
+            display: flex;
+            align-items: center;
+            justify-content: center;
+        }}
+        .icon-container svg {{
+            width: 4rem;
+            height: 4rem;
+            fill: {icon_color};
+        }}
+        
+        .item-text {{
+            font-size: 1.8rem;
+            font-weight: 600;
+            margin: 0;
+            color: {text_color};
+            line-height: 7rem;
+        }}
+
+        @media (max-width: 48em) {{ /* 768px */
+            .content-wrapper {{ flex-direction: column; text-align: center; }}
+            .title-section {{ padding-right: 0; margin-bottom: 3rem; }}
+            .list-section {{ width: 100%; align-items: flex-start; }}
+            .main-title {{ font-size: 3.5rem; }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="content-wrapper">
+            <div class="title-section">
+                <h1 class="main-title">{main_title}</h1>
+                <h2 class="subtitle">{subtitle}</h2>
+            </div>
+            <div class="list-section">
+                {list_items_html}
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    return html_code
+
+
+
+
+def generate_image_cutout_list_slide(
+    list_items=[
+        {"title": "Add a main point", "description": "Elaborate on what you want to discuss."},
+        {"title": "Add a main point", "description": "Elaborate on what you want to discuss."},
+        {"title": "Add a main point", "description": "Elaborate on what you want to discuss."},
+        {"title": "Add a main point", "description": "Elaborate on what you want to discuss."}
+    ],
+    # --- Thiết kế & Màu sắc ---
+    background_image_url="https://images.unsplash.com/photo-1541746972996-4e0b0f43e02a?q=80&w=2940&auto=format&fit=crop",
+    content_bg_color="#1A1A22",
+    text_heading_color="#FFFFFF",
+    text_color="#C0C0C0",
+    accent_color="#8A63D2",
+    line_color="rgba(255, 255, 255, 0.2)",
+    # --- Font chữ ---
+    font_family_title="'Source Serif 4', serif",
+    font_family_body="'Inter', sans-serif",
+    custom_css=""
+):
+    """
+    Generates a sophisticated list slide with a unique 'cut-out' effect.
+    The main content panel appears to sit on top of a continuous background image.
+    """
+    
+    list_items_html = "".join([
+        f"""<div class="list-item">
+            <h3 class="item-title">{item.get('title', '')}</h3>
+            <p class="item-description">{item.get('description', '')}</p>
+        </div>"""
+        for item in list_items
+    ])
+
+    # SVG for the decorative spinner
+    spinner_svg = f'''
+    <svg class="decorative-spinner" width="60" height="60" viewBox="0 0 100 100" xmlns="http://www.w3.org/2000/svg">
+        <g fill="none" stroke="{accent_color}" stroke-width="4">
+            {''.join([f'<circle cx="50" cy="50" r="45" stroke-dasharray="2.9 8.8" transform="rotate({i * 15} 50 50)"/>' for i in range(1)])}
+        </g>
+    </svg>
+    '''
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Key Points Slide</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Source+Serif+4:wght@600&family=Inter:wght@400&display=swap" rel="stylesheet">
+    <style>
+        :root {{ font-size: 16px; }}
+        body, html {{
+            margin: 0; padding: 0; height: 100%; width: 100%;
+            overflow: hidden;
+            background-color: #111;
+        }}
+        
+        .slide-container {{
+            width: 100%; height: 100vh;
+            position: relative;
+            background-image: url('{background_image_url}');
+            background-size: cover;
+            background-position: center;
+        }}
+        
+        .content-panel {{
+            position: absolute;
+            top: 0;
+            right: 0;
+            width: 70%;
+            height: 100%;
+            background-color: {content_bg_color};
+            display: flex;
+            align-items: center;
+            justify-content: flex-start;
+            padding: 4rem 4rem 4rem 6rem;
+            box-sizing: border-box;
+        }}
+        
+        .decorative-spinner {{
+            position: absolute;
+            top: 2rem;
+            right: 3rem;
+            animation: spin 10s linear infinite;
+        }}
+
+
+        .list-container {{
+            width: 100%;
+            max-width: 35rem; /* 560px */
+            position: relative;
+            padding-left: 1.5rem;
+        }}
+        
+        /* The vertical guide line */
+        .list-container::before {{
+            content: '';
+            position: absolute;
+            left: 0;
+            top: 0.5rem;
+            bottom: 0.5rem;
+            width: 2px;
+            background-color: {line_color};
+        }}
+        
+        .list-item {{
+            position: relative;
+            padding-left: 3rem;
+            margin-bottom: 3.5rem;
+        }}
+        .list-item:last-child {{ margin-bottom: 0; }}
+
+        /* The custom bullet point */
+        .list-item::before {{
+            content: '';
+            position: absolute;
+            left: -0.6rem; /* -(dot_width/2) */
+            top: 0.5rem;
+            width: 1.2rem;
+            height: 1.2rem;
+            background-color: {accent_color};
+            border-radius: 50%;
+        }}
+        
+        .item-title {{
+            font-family: {font_family_title};
+            font-size: 2.2rem;
+            font-weight: 600;
+            color: {text_heading_color};
+            margin: 0 0 0.5rem 0;
+        }}
+        
+        .item-description {{
+            font-family: {font_family_body};
+            font-size: 1.6rem;
+            color: {text_color};
+            line-height: 1.6;
+            margin: 0;
+            opacity: 0.9;
+        }}
+
+        @media (max-width: 48em) {{
+            .content-panel {{
+                width: 100%;
+                padding: 2rem;
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="content-panel">
+            {spinner_svg}
+            <div class="list-container">
+                {list_items_html}
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    return html_code
+
+
+
+
+def generate_body_slide2(
+    # Main parameters
+    main_title="MainTitle",
+    
+    # Content parameters
+    subtitle1="SubTitle1",
+    content1="Content1",
+    subtitle2="SubTitle2",
+    content2="Content2",
+    subtitle3="SubTitle3",
+    content3="Content3",
+    
+    # Style parameters
+    main_bg_color="#ffffff",  # White background
+    accent_color="#d5e8b9",   # Light green accent
+    title_color="#333333",
+    subtitle_color="#333333",
+    content_color="#555555",
+    font_family="'Inter', sans-serif",
+    image_url="Image/generate_body_slide2/Default_1.png",
+
+    # Icon parameters - SVG paths for each icon
+    icon1="""<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" width="24" height="24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M9 18h6M12 2v6M12 18v4M14.5 8a2.5 2.5 0 1 0-5 0 2.5 2.5 0 0 0 5 0zM16.5 13a4.5 4.5 0 1 0-9 0 4.5 4.5 0 0 0 9 0z"></path></svg>""",  # Lightbulb
+    icon2="""<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" width="24" height="24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><circle cx="12" cy="12" r="10"></circle><circle cx="12" cy="12" r="6"></circle><circle cx="12" cy="12" r="2"></circle></svg>""",  # Target
+    icon3="""<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" width="24" height="24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M18 20V10M12 20V4M6 20v-6"></path></svg>""",  # Bar chart
+):
+    """
+    Generates an HTML slide with a main title, large image on the left,
+    and three content sections with icons on the right - Full viewport design.
+    
+    Parameters:
+    - main_title: The main title of the slide
+    
+    Content parameters:
+    - subtitle1, subtitle2, subtitle3: Subtitles for each content section
+    - content1, content2, content3: Content text for each section
+    
+    Style parameters:
+    - main_bg_color: Background color for the slide
+    - accent_color: Color for accents and icon backgrounds
+    - title_color: Color for the main title
+    - subtitle_color: Color for subtitles
+    - content_color: Color for content text
+    - title_font_size: Font size for the main title
+    - subtitle_font_size: Font size for subtitles
+    - content_font_size: Font size for content text
+    - font_family: Font family for the slide
+    
+    Icon parameters:
+    - icon1, icon2, icon3: SVG code for each icon
+    
+    Returns:
+    - HTML code for the slide
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Image with Icons Slide</title>
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        html {{ 
+            font-size: 16px; 
+            width: 100vw; 
+            height: 100vh;
+            overflow: hidden;
+        }}
+        
+        body {{
+            font-family: {font_family};
+            background-color: {accent_color}; /* Full viewport accent background */
+            width: 100vw;
+            height: 100vh;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            padding: 5rem 7.5rem; /* 80px 120px */
+        }}
+
+        .slide-inner-container {{
+            width: 100%;
+            height: 100%;
+            max-width: 105rem; /* 1680px */
+            max-height: 57.5rem; /* 920px */
+            background-color: {main_bg_color};
+            border-radius: 1rem; /* 16px */
+            box-shadow: 0 1.25rem 2.5rem rgba(0,0,0,0.15);
+            display: flex;
+            flex-direction: column;
+            padding: 3rem 4rem; /* 48px 64px */
+            position: relative;
+        }}
+        
+        .title-section {{
+            display: flex;
+            align-items: center;
+            margin-bottom: 2.5rem; /* 40px */
+        }}
+        
+        .title-accent {{
+            width: 2.5rem; /* 40px - increased size */
+            height: 2.5rem; /* 40px */
+            background: linear-gradient(135deg, {accent_color}, rgba(213, 232, 185, 0.8));
+            margin-right: 1.25rem; /* 20px */
+            border-radius: 0.5rem; /* 8px */
+            box-shadow: 0 0.25rem 0.5rem rgba(0,0,0,0.1);
+        }}
+        
+        .main-title {{
+            font-size: 3.5rem; 
+            color: {title_color};
+            font-weight: 600;
+            margin: 0;
+        }}
+        
+        .content-layout {{
+            display: flex;
+            width: 100%;
+            flex: 1;
+            gap: 2.5rem; /* 40px */
+        }}
+        
+        .image-section {{
+            flex: 2;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            padding: 1.5rem; /* 24px */
+            background: rgba(255,255,255,0.9);
+            border-radius: 1rem; /* 16px */
+            box-shadow: 0 0.75rem 1.5rem rgba(0,0,0,0.1);
+            position: relative;
+            overflow: hidden;
+        }}
+        
+        .image-frame {{
+            width: 100%;
+            height: 100%;
+            position: relative;
+            overflow: hidden;
+            border-radius: 0.75rem; /* 12px */
+        }}
+        
+        .image-accent {{
+            position: absolute;
+            top: 0;
+            left: 0;
+            width: 95%;
+            height: 95%;
+            border: 0.5rem solid {accent_color}; /* 8px */
+            border-radius: 0.75rem; /* 12px */
+            z-index: 1;
+            transition: all 0.3s ease;
+        }}
+        
+        .image-section:hover .image-accent {{
+            border-width: 0.75rem; /* 12px - expand on hover */
+            background: linear-gradient(45deg, {accent_color}20, transparent);
+        }}
+        
+        .image-container {{
+            position: absolute;
+            top: 1.5rem; /* 24px */
+            left: 1.5rem; /* 24px */
+            width: 95%;
+            height: 95%;
+            background: linear-gradient(135deg, #f8f9fa, #e9ecef);
+            overflow: hidden;
+            z-index: 2;
+            border-radius: 0.75rem; /* 12px */
+            transition: transform 0.3s ease;
+        }}
+        
+        .image-section:hover .image-container {{
+            transform: scale(1.02); /* subtle zoom on hover */
+        }}
+        
+        .image-container img {{
+            width: 100%;
+            height: 100%;
+            object-fit: cover;
+            border-radius: 0.75rem; /* 12px */
+            transition: transform 0.3s ease;
+        }}
+        
+        .image-section:hover .image-container img {{
+            transform: scale(1.05); /* image zoom effect */
+        }}
+        
+        .content-section {{
+            flex: 3;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            gap: 2rem; /* 32px */
+        }}
+        
+        .content-item {{
+            display: flex;
+            align-items: flex-start;
+            background: rgba(255,255,255,0.9);
+            padding: 1.5rem; /* 24px */
+            border-radius: 1rem; /* 16px */
+            box-shadow: 0 0.5rem 1rem rgba(0,0,0,0.1);
+            transition: all 0.3s ease;
+            border-left: 0.25rem solid {accent_color}; /* 4px */
+            position: relative;
+            overflow: hidden;
+        }}
+        
+        .content-item:hover {{
+            transform: translateX(0.5rem); /* 8px horizontal shift */
+            box-shadow: 0 0.75rem 1.5rem rgba(0,0,0,0.15);
+            border-left-width: 0.5rem; /* 8px - expand border */
+        }}
+        
+        .content-item::before {{
+            content: '';
+            position: absolute;
+            top: 0;
+            left: 0;
+            width: 0.25rem; /* 4px */
+            height: 100%;
+            background: linear-gradient(to bottom, {accent_color}, rgba(213, 232, 185, 0.5));
+            transform: scaleY(0);
+            transition: transform 0.3s ease;
+            transform-origin: top;
+        }}
+        
+        .content-item:hover::before {{
+            transform: scaleY(1);
+        }}
+        
+        .icon-container {{
+            width: 4rem; /* 64px - increased size */
+            height: 4rem; /* 64px */
+            background: linear-gradient(135deg, {accent_color}, rgba(213, 232, 185, 0.8));
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            margin-right: 1.5rem; /* 24px */
+            flex-shrink: 0;
+            border-radius: 0.75rem; /* 12px */
+            box-shadow: 0 0.25rem 0.5rem rgba(0,0,0,0.1);
+            transition: all 0.3s ease;
+        }}
+        
+        .content-item:hover .icon-container {{
+            transform: scale(1.1) rotate(5deg); /* hover effect */
+            box-shadow: 0 0.5rem 1rem rgba(0,0,0,0.15);
+        }}
+        
+        .icon-container svg {{
+            width: 2rem; /* 32px - increased size */
+            height: 2rem; /* 32px */
+            stroke: #333333;
+            transition: all 0.3s ease;
+        }}
+        
+        .content-item:hover .icon-container svg {{
+            stroke: #ffffff;
+            transform: scale(1.1);
+        }}
+        
+        .content-text {{
+            flex: 1;
+        }}
+        
+        .subtitle {{
+            font-size: 2.2rem;
+            color: {subtitle_color};
+            margin: 0 0 0.75rem 0; /* 12px */
+            font-weight: 600;
+            position: relative;
+        }}
+        
+        .subtitle::after {{
+            content: '';
+            position: absolute;
+            bottom: -0.25rem; /* -4px */
+            left: 0;
+            width: 2rem; /* 32px */
+            height: 0.125rem; /* 2px */
+            background: {accent_color};
+            border-radius: 0.0625rem; /* 1px */
+            transition: width 0.3s ease;
+        }}
+        
+        .content-item:hover .subtitle::after {{
+            width: 4rem; /* 64px - expand underline on hover */
+        }}
+        
+        .content {{
+            font-size: 1.5rem;
+            color: {content_color};
+            margin: 0;
+            line-height: 1.6;
+            padding: 0.75rem; /* 12px */
+            background: rgba(213, 232, 185, 0.1);
+            border-radius: 0.5rem; /* 8px */
+            transition: all 0.3s ease;
+        }}
+        
+        .content-item:hover .content {{
+            background: rgba(213, 232, 185, 0.2);
+            transform: translateY(-0.125rem); /* -2px */
+        }}
+        
+        /* Responsive design */
+        @media screen and (max-width: 75rem) {{
+            body {{
+                padding: 3rem 5rem;
+            }}
+            
+            .content-layout {{
+                flex-direction: column;
+                gap: 2rem;
+            }}
+            
+            .image-section {{
+                flex: none;
+                height: 20rem;
+            }}
+            
+            .content-section {{
+                flex: none;
+                gap: 1.5rem;
+            }}
+        }}
+        
+        @media screen and (max-width: 50rem) {{
+            body {{
+                padding: 2rem 3rem;
+            }}
+            
+            .slide-inner-container {{
+                padding: 2rem 3rem;
+            }}
+            
+            .content-item {{
+                padding: 1rem;
+            }}
+            
+            .icon-container {{
+                width: 3rem;
+                height: 3rem;
+                margin-right: 1rem;
+            }}
+            
+            .icon-container svg {{
+                width: 1.5rem;
+                height: 1.5rem;
+            }}
+            
+            .main-title {{
+                font-size: 2rem;
+            }}
+            
+            .subtitle {{
+                font-size: 1.25rem;
+            }}
+            
+            .content {{
+                font-size: 1rem;
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-inner-container">
+        <!-- Title Section -->
+        <div class="title-section">
+            <div class="title-accent"></div>
+            <h1 class="main-title">{main_title}</h1>
+        </div>
+        
+        <!-- Content Layout -->
+        <div class="content-layout">
+            <!-- Image Section -->
+            <div class="image-section">
+                <div class="image-frame">
+                    <div class="image-accent"></div>
+                    <div class="image-container">
+                        <img src="{image_url}" alt="Slide image">
+                    </div>
+                </div>
+            </div>
+            
+            <!-- Content Section -->
+            <div class="content-section">
+                <!-- Content Item 1 -->
+                <div class="content-item">
+                    <div class="icon-container">
+                        {icon1}
+                    </div>
+                    <div class="content-text">
+                        <h3 class="subtitle">{subtitle1}</h3>
+                        <p class="content">{content1}</p>
+                    </div>
+                </div>
+                
+                <!-- Content Item 2 -->
+                <div class="content-item">
+                    <div class="icon-container">
+                        {icon2}
+                    </div>
+                    <div class="content-text">
+                        <h3 class="subtitle">{subtitle2}</h3>
+                        <p class="content">{content2}</p>
+                    </div>
+                </div>
+                
+                <!-- Content Item 3 -->
+                <div class="content-item">
+                    <div class="icon-container">
+                        {icon3}
+                    </div>
+                    <div class="content-text">
+                        <h3 class="subtitle">{subtitle3}</h3>
+                        <p class="content">{content3}</p>
+                    </div>
+                </div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+
+
+
+def generate_body_slide4(
+    # Main parameters
+    main_title="MainTitle",
+    main_content="Content",
+    
+    # Content parameters
+    subtitle1="Subtitle1",
+    content1="Content1",
+    subtitle2="Subtitle2",
+    content2="Content2",
+    subtitle3="Subtitle3",
+    content3="Content3",
+    
+    # Style parameters
+    main_bg_color="#ffffff",  # White background
+    accent_color="#d5e8b9",   # Light green accent
+    title_color="#333333",
+    content_color="#555555",
+    subtitle_color="#333333",
+    font_family="'Inter', sans-serif",
+    image_url_1="Image/generate_body_slide4/Default_1.png",
+    image_url_2="Image/generate_body_slide4/Default_2.png",
+    image_url_3="Image/generate_body_slide4/Default_3.png"
+):
+    """
+    Generates an HTML slide with a main title, horizontal content bar,
+    and three images with subtitles and content - Full viewport design.
+    
+    Parameters:
+    - main_title: The main title of the slide
+    - main_content: Content for the horizontal bar
+    
+    Content parameters:
+    - subtitle1, subtitle2, subtitle3: Subtitles for each image
+    - content1, content2, content3: Content text for each image
+    
+    Style parameters:
+    - main_bg_color: Background color for the slide
+    - accent_color: Color for accents and borders
+    - title_color: Color for the main title and subtitles
+    - content_color: Color for content text
+    - subtitle_color: Color for subtitles
+    - title_font_size: Font size for the main title
+    - content_font_size: Font size for content text
+    - subtitle_font_size: Font size for subtitles
+    - font_family: Font family for the slide
+    
+    Returns:
+    - HTML code for the slide
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Image Gallery Slide</title>
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        html {{ 
+            font-size: 16px; 
+            width: 100vw; 
+            height: 100vh;
+            overflow: hidden;
+        }}
+        
+        body {{
+            font-family: {font_family};
+            background-color: {accent_color}; /* Full viewport accent background */
+            width: 100vw;
+            height: 100vh;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            padding: 5rem 7.5rem; /* 80px 120px */
+        }}
+
+        .slide-inner-container {{
+            width: 100%;
+            height: 100%;
+            max-width: 105rem; /* 1680px */
+            max-height: 57.5rem; /* 920px */
+            background-color: {main_bg_color};
+            border-radius: 1rem; /* 16px */
+            box-shadow: 0 1.25rem 2.5rem rgba(0,0,0,0.15);
+            display: flex;
+            flex-direction: column;
+            padding: 3rem 4rem; /* 48px 64px */
+            position: relative;
+        }}
+        
+        .title-section {{
+            display: flex;
+            align-items: center;
+            margin-bottom: 2.5rem; /* 40px */
+        }}
+        
+        .title-accent {{
+            width: 2.5rem; /* 40px - increased size */
+            height: 2.5rem; /* 40px */
+            background: linear-gradient(135deg, {accent_color}, rgba(213, 232, 185, 0.8));
+            margin-right: 1.25rem; /* 20px */
+            border-radius: 0.5rem; /* 8px */
+            box-shadow: 0 0.25rem 0.5rem rgba(0,0,0,0.1);
+        }}
+        
+        .main-title {{
+            font-size: 3.5rem;
+            color: {title_color};
+            font-weight: 600;
+            margin: 0;
+        }}
+        
+        .content-bar {{
+            width: 100%;
+            background: linear-gradient(135deg, {accent_color}, rgba(213, 232, 185, 0.9));
+            padding: 1.5rem 2.5rem; /* 24px 40px */
+            margin-bottom: 2.5rem; /* 40px */
+            border-radius: 0.75rem; /* 12px */
+            text-align: center;
+            color: {content_color};
+            font-size: 1.6rem;
+            font-weight: 500;
+            box-shadow: 0 0.5rem 1rem rgba(0,0,0,0.1);
+            position: relative;
+            overflow: hidden;
+        }}
+        
+        .content-bar::before {{
+            content: '';
+            position: absolute;
+            top: 0;
+            left: 0;
+            width: 100%;
+            height: 0.25rem; /* 4px */
+            background: linear-gradient(90deg, {title_color}, {accent_color});
+        }}
+        
+        .image-gallery {{
+            display: flex;
+            justify-content: space-between;
+            width: 100%;
+            flex: 1;
+            align-items: stretch;
+            gap: 2rem; /* 32px */
+        }}
+        
+        .image-item {{
+            flex: 1;
+            display: flex;
+            flex-direction: column;
+            background: rgba(255,255,255,0.9);
+            border-radius: 1.25rem; /* 20px */
+            padding: 2rem; /* 32px */
+            box-shadow: 0 0.5rem 1rem rgba(0,0,0,0.1);
+            transition: all 0.3s ease;
+            border: 0.125rem solid transparent; /* 2px */
+            position: relative;
+            overflow: hidden;
+        }}
+        
+        .image-item:hover {{
+            transform: translateY(-0.5rem); /* -8px hover lift */
+            box-shadow: 0 1rem 2rem rgba(0,0,0,0.15);
+            border-color: {accent_color};
+        }}
+        
+        .image-container {{
+            position: relative;
+            width: 100%;
+            height: 15rem; /* 240px - increased height */
+            margin-bottom: 1.25rem; /* 20px */
+            overflow: hidden;
+            border-radius: 0.75rem; /* 12px */
+            background: linear-gradient(135deg, #f8f9fa, #e9ecef);
+        }}
+        
+        .image-border {{
+            position: absolute;
+            top: 0;
+            left: 0;
+            width: 100%;
+            height: 100%;
+            border-left: 0.5rem solid {accent_color}; /* 8px */
+            border-radius: 0.75rem 0 0 0.75rem; /* 12px */
+            z-index: 1;
+            transition: all 0.3s ease;
+        }}
+        
+        .image-item:hover .image-border {{
+            border-left-width: 1rem; /* 16px - expand on hover */
+            background: linear-gradient(to right, {accent_color}, transparent 70%);
+        }}
+        
+        .image-container img {{
+            width: 100%;
+            height: 100%;
+            object-fit: cover;
+            transition: transform 0.3s ease;
+            border-radius: 0.75rem; /* 12px */
+        }}
+        
+        .image-item:hover .image-container img {{
+            transform: scale(1.05); /* zoom effect on hover */
+        }}
+        
+        .subtitle {{
+            font-size: 2rem;
+            color: {subtitle_color};
+            margin: 0 0 1rem 0; /* 16px */
+            font-weight: 600;
+            text-align: center;
+            position: relative;
+        }}
+        
+        .subtitle::after {{
+            content: '';
+            position: absolute;
+            bottom: -0.25rem; /* -4px */
+            left: 50%;
+            transform: translateX(-50%);
+            width: 2rem; /* 32px */
+            height: 0.125rem; /* 2px */
+            background: {accent_color};
+            border-radius: 0.0625rem; /* 1px */
+            transition: width 0.3s ease;
+        }}
+        
+        .image-item:hover .subtitle::after {{
+            width: 4rem; /* 64px - expand underline on hover */
+        }}
+        
+        .image-content {{
+            font-size: 1.5rem;
+            color: {content_color};
+            margin: 0;
+            text-align: center;
+            line-height: 1.6;
+            flex: 1;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            padding: 1.25rem; /* 20px */
+            background: rgba(213, 232, 185, 0.1);
+            border-radius: 0.5rem; /* 8px */
+            transition: all 0.3s ease;
+        }}
+        
+        .image-item:hover .image-content {{
+            background: rgba(213, 232, 185, 0.2);
+            transform: translateY(-0.125rem); /* -2px */
+        }}
+        
+        /* Responsive design */
+        @media screen and (max-width: 75rem) {{
+            body {{
+                padding: 3rem 5rem;
+            }}
+            
+            .image-gallery {{
+                flex-direction: column;
+                gap: 1.5rem;
+            }}
+            
+            .image-item {{
+                flex-direction: row;
+                align-items: center;
+            }}
+            
+            .image-container {{
+                width: 40%;
+                height: 12rem;
+                margin-bottom: 0;
+                margin-right: 1.5rem;
+            }}
+            
+            .content-area {{
+                flex: 1;
+            }}
+        }}
+        
+        @media screen and (max-width: 50rem) {{
+            body {{
+                padding: 2rem 3rem;
+            }}
+            
+            .slide-inner-container {{
+                padding: 2rem 3rem;
+            }}
+            
+            .image-item {{
+                flex-direction: column;
+                padding: 1rem;
+            }}
+            
+            .image-container {{
+                width: 100%;
+                height: 10rem;
+                margin-right: 0;
+                margin-bottom: 1rem;
+            }}
+            
+            .main-title {{
+                font-size: 2rem;
+            }}
+            
+            .subtitle {{
+                font-size: 1.25rem;
+            }}
+            
+            .image-content {{
+                font-size: 1rem;
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-inner-container">
+        <!-- Title Section -->
+        <div class="title-section">
+            <div class="title-accent"></div>
+            <h1 class="main-title">{main_title}</h1>
+        </div>
+        
+        <!-- Content Bar -->
+        <div class="content-bar">
+            {main_content}
+        </div>
+        
+        <!-- Image Gallery -->
+        <div class="image-gallery">
+            <!-- Image Item 1 -->
+            <div class="image-item">
+                <div class="image-container">
+                    <div class="image-border"></div>
+                    <img src="{image_url_1}" alt="Image 1">
+                </div>
+                <div class="content-area">
+                    <h3 class="subtitle">{subtitle1}</h3>
+                    <p class="image-content">{content1}</p>
+                </div>
+            </div>
+            
+            <!-- Image Item 2 -->
+            <div class="image-item">
+                <div class="image-container">
+                    <div class="image-border"></div>
+                    <img src="{image_url_2}" alt="Image 2">
+                </div>
+                <div class="content-area">
+                    <h3 class="subtitle">{subtitle2}</h3>
+                    <p class="image-content">{content2}</p>
+                </div>
+            </div>
+            
+            <!-- Image Item 3 -->
+            <div class="image-item">
+                <div class="image-container">
+                    <div class="image-border"></div>
+                    <img src="{image_url_3}" alt="Image 3">
+                </div>
+                <div class="content-area">
+                    <h3 class="subtitle">{subtitle3}</h3>
+                    <p class="image-content">{content3}</p>
+                </div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+# sửa biến trong tool
+
+
+
+def generate_body_slide5(
+    # Main parameters
+    main_title="MainTitle",
+    
+    # Content parameters
+    subtitle1="SUBTITLE1",
+    content1="Content1",
+    subtitle2="SUBTITLE2",
+    content2="Content2",
+    subtitle3="SUBTITLE3",
+    content3="Content3",
+    subtitle4="SUBTITLE4",
+    content4="Content4",
+    
+    # Style parameters
+    main_bg_color="#ffffff",  # White background
+    accent_color="#d5e8b9",   # Light green accent
+    title_color="#333333",
+    subtitle_color="#6b9d34", # Green color for subtitles
+    content_color="#555555",
+    font_family="'Inter', sans-serif",
+    image_url_1="Image/generate_body_slide5/Default_1.png",
+    image_url_2="Image/generate_body_slide5/Default_2.png",
+    image_url_3="Image/generate_body_slide5/Default_3.png",
+    image_url_4="Image/generate_body_slide5/Default_4.png",
+):
+    """
+    Generates an HTML slide with a main title, 2x2 image grid on the left,
+    and four content sections on the right - Full viewport design.
+    
+    Parameters:
+    - main_title: The main title of the slide
+    
+    Content parameters:
+    - subtitle1, subtitle2, subtitle3, subtitle4: Subtitles for each content section
+    - content1, content2, content3, content4: Content text for each section
+    
+    Style parameters:
+    - main_bg_color: Background color for the slide
+    - accent_color: Color for accents and borders
+    - title_color: Color for the main title
+    - subtitle_color: Color for subtitles
+    - content_color: Color for content text
+    - title_font_size: Font size for the main title
+    - subtitle_font_size: Font size for subtitles
+    - content_font_size: Font size for content text
+    - font_family: Font family for the slide
+    
+    Returns:
+    - HTML code for the slide
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Image Grid Slide</title>
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        html {{ 
+            font-size: 16px; 
+            width: 100vw; 
+            height: 100vh;
+            overflow: hidden;
+        }}
+        
+        body {{
+            font-family: {font_family};
+            background-color: {accent_color}; /* Full viewport accent background */
+            width: 100vw;
+            height: 100vh;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            padding: 5rem 7.5rem; /* 80px 120px */
+        }}
+
+        .slide-inner-container {{
+            width: 100%;
+            height: 100%;
+            max-width: 105rem; /* 1680px */
+            max-height: 57.5rem; /* 920px */
+            background-color: {main_bg_color};
+            border-radius: 1rem; /* 16px */
+            box-shadow: 0 1.25rem 2.5rem rgba(0,0,0,0.15);
+            display: flex;
+            flex-direction: column;
+            padding: 3rem 4rem; /* 48px 64px */
+            position: relative;
+        }}
+        
+        .title-section {{
+            display: flex;
+            align-items: center;
+            margin-bottom: 2.5rem; /* 40px */
+        }}
+        
+        .title-accent {{
+            width: 2.5rem; /* 40px - increased size */
+            height: 2.5rem; /* 40px */
+            background: linear-gradient(135deg, {accent_color}, rgba(213, 232, 185, 0.8));
+            margin-right: 1.25rem; /* 20px */
+            border-radius: 0.5rem; /* 8px */
+            box-shadow: 0 0.25rem 0.5rem rgba(0,0,0,0.1);
+        }}
+        
+        .main-title {{
+            font-size: 3.5rem;
+            color: {title_color};
+            font-weight: 600;
+            margin: 0;
+        }}
+        
+        .content-layout {{
+            display: flex;
+            width: 100%;
+            flex: 1;
+            gap: 2.5rem; /* 40px */
+        }}
+        
+        .image-section {{
+            flex: 2;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            background: rgba(255,255,255,0.9);
+            border-radius: 1rem; /* 16px */
+            padding: 2rem; /* 32px */
+            box-shadow: 0 0.75rem 1.5rem rgba(0,0,0,0.1);
+            border-left: 0.25rem solid {accent_color}; /* accent border */
+        }}
+        
+        .image-grid {{
+            width: 100%;
+            height: 100%;
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            grid-template-rows: 1fr 1fr;
+            gap: 1rem; /* 16px */
+        }}
+        
+        .image-card {{
+            position: relative;
+            border-radius: 0.75rem; /* 12px */
+            overflow: hidden;
+            background: linear-gradient(135deg, #f8f9fa, #e9ecef);
+            box-shadow: 0 0.5rem 1rem rgba(0,0,0,0.1);
+            transition: all 0.3s ease;
+        }}
+        
+        .image-card:hover {{
+            transform: scale(1.05) rotate(1deg); /* hover effect */
+            box-shadow: 0 0.75rem 1.5rem rgba(0,0,0,0.15);
+            z-index: 2;
+        }}
+        
+        .image-container {{
+            width: 100%;
+            height: 100%;
+            position: relative;
+            overflow: hidden;
+        }}
+        
+        .image-container img {{
+            width: 100%;
+            height: 100%;
+            object-fit: cover;
+            transition: transform 0.3s ease;
+        }}
+        
+        .image-card:hover .image-container img {{
+            transform: scale(1.1); /* zoom effect on hover */
+        }}
+        
+        .image-overlay {{
+            position: absolute;
+            bottom: 0;
+            left: 0;
+            width: 100%;
+            height: 0.5rem; /* 8px - increased overlay */
+            background: linear-gradient(90deg, {accent_color}, rgba(213, 232, 185, 0.8));
+            transition: all 0.3s ease;
+        }}
+        
+        .image-card:hover .image-overlay {{
+            height: 25%; /* expand overlay on hover */
+            background: linear-gradient(to top, {accent_color}, transparent);
+        }}
+        
+        .content-sections {{
+            flex: 3;
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            grid-template-rows: 1fr 1fr;
+            gap: 2rem;
+        }}
+        
+        .content-item {{
+            background: rgba(255,255,255,0.9);
+            border-radius: 1rem; /* 16px */
+            padding: 2rem;
+            box-shadow: 0 0.5rem 1rem rgba(0,0,0,0.1);
+            transition: all 0.3s ease;
+            border-left: 0.25rem solid {subtitle_color}; /* subtitle color border */
+            position: relative;
+            overflow: hidden;
+        }}
+        
+        .content-item:hover {{
+            transform: translateY(-0.25rem); /* -4px hover lift */
+            box-shadow: 0 0.75rem 1.5rem rgba(0,0,0,0.15);
+        }}
+        
+        .content-item::before {{
+            content: '';
+            position: absolute;
+            top: 0;
+            left: 0;
+            width: 100%;
+            height: 0.25rem; /* 4px */
+            background: linear-gradient(90deg, {subtitle_color}, rgba(107, 157, 52, 0.6));
+            transform: scaleX(0);
+            transition: transform 0.3s ease;
+            transform-origin: left;
+        }}
+        
+        .content-item:hover::before {{
+            transform: scaleX(1);
+        }}
+        
+        .subtitle {{
+            font-size: 2rem;
+            color: {subtitle_color};
+            margin: 0 0 1rem 0;
+            font-weight: 600;
+            position: relative;
+        }}
+        
+        .subtitle::after {{
+            content: '';
+            position: absolute;
+            bottom: -0.25rem; /* -4px */
+            left: 0;
+            width: 2rem; /* 32px */
+            height: 0.125rem; /* 2px */
+            background: {subtitle_color};
+            border-radius: 0.0625rem; /* 1px */
+        }}
+        
+        .content {{
+            font-size: 1.6rem;
+            color: {content_color};
+            margin: 0;
+            line-height: 1.6;
+            padding: 1rem;
+            background: rgba(107, 157, 52, 0.05); /* subtitle color with low opacity */
+            border-radius: 0.5rem; /* 8px */
+            transition: all 0.3s ease;
+        }}
+        
+        .content-item:hover .content {{
+            background: rgba(107, 157, 52, 0.1);
+            transform: translateX(0.25rem); /* 4px */
+        }}
+        
+        /* Responsive design */
+        @media screen and (max-width: 75rem) {{
+            body {{
+                padding: 3rem 5rem;
+            }}
+            
+            .content-layout {{
+                flex-direction: column;
+                gap: 2rem;
+            }}
+            
+            .image-section {{
+                flex: none;
+                height: 20rem;
+            }}
+            
+            .content-sections {{
+                flex: none;
+                gap: 1rem;
+            }}
+        }}
+        
+        @media screen and (max-width: 50rem) {{
+            body {{
+                padding: 2rem 3rem;
+            }}
+            
+            .slide-inner-container {{
+                padding: 2rem 3rem;
+            }}
+            
+            .content-sections {{
+                grid-template-columns: 1fr;
+                grid-template-rows: repeat(4, 1fr);
+            }}
+            
+            .content-item {{
+                padding: 1rem;
+            }}
+            
+            .main-title {{
+                font-size: 2rem;
+            }}
+            
+            .subtitle {{
+                font-size: 1.25rem;
+            }}
+            
+            .content {{
+                font-size: 1rem;
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-inner-container">
+        <!-- Title Section -->
+        <div class="title-section">
+            <div class="title-accent"></div>
+            <h1 class="main-title">{main_title}</h1>
+        </div>
+        
+        <!-- Content Layout -->
+        <div class="content-layout">
+            <!-- Image Section -->
+            <div class="image-section">
+                <div class="image-grid">
+                    <div class="image-card">
+                        <div class="image-container">
+                            <img src="{image_url_1}" alt="Image 1">
+                            <div class="image-overlay"></div>
+                        </div>
+                    </div>
+                    <div class="image-card">
+                        <div class="image-container">
+                            <img src="{image_url_2}" alt="Image 2">
+                            <div class="image-overlay"></div>
+                        </div>
+                    </div>
+                    <div class="image-card">
+                        <div class="image-container">
+                            <img src="{image_url_3}" alt="Image 3">
+                            <div class="image-overlay"></div>
+                        </div>
+                    </div>
+                    <div class="image-card">
+                        <div class="image-container">
+                            <img src="{image_url_4}" alt="Image 4">
+                            <div class="image-overlay"></div>
+                        </div>
+                    </div>
+                </div>
+            </div>
+            
+            <!-- Content Sections -->
+            <div class="content-sections">
+                <div class="content-item">
+                    <h3 class="subtitle">{subtitle1}</h3>
+                    <p class="content">{content1}</p>
+                </div>
+                <div class="content-item">
+                    <h3 class="subtitle">{subtitle2}</h3>
+                    <p class="content">{content2}</p>
+                </div>
+                <div class="content-item">
+                    <h3 class="subtitle">{subtitle3}</h3>
+                    <p class="content">{content3}</p>
+                </div>
+                <div class="content-item">
+                    <h3 class="subtitle">{subtitle4}</h3>
+                    <p class="content">{content4}</p>
+                </div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+# sửa biến trong tool
+
+
+
+
+
+def generate_body_slide7(
+    # Main parameters
+    main_title="MainTitle",
+    subtitle="SubTitle",
+  
+    # Content parameters
+    content1="Content1",
+    content2="Content2",
+    
+    # Style parameters
+    main_bg_color="#ffffff",  # White background
+    accent_color="#d5e8b9",   # Light green accent
+    title_color="#333333",
+    subtitle_color="#333333",
+    content_color="#4a90a0",  # Teal/blue color for content
+    divider_color="#d5e8b9",  # Light green divider
+    font_family="'Inter', sans-serif",
+    image_url_1="Image/generate_body_slide7/Default_1.png",
+    image_url_2="Image/generate_body_slide7/Default_2.png",
+    image_url_3="Image/generate_body_slide7/Default_3.png",
+
+):
+    """
+    Generates an HTML slide with a main title, three vertical images on the left,
+    and content with subtitle on the right - Full viewport design.
+    
+    Parameters:
+    - main_title: The main title of the slide
+    - subtitle: The subtitle on the right side
+    
+    Content parameters:
+    - content1, content2: Content text sections
+    
+    Style parameters:
+    - main_bg_color: Background color for the slide
+    - accent_color: Color for accents
+    - title_color: Color for the main title
+    - subtitle_color: Color for the subtitle
+    - content_color: Color for content text
+    - divider_color: Color for the horizontal divider
+    - title_font_size: Font size for the main title
+    - subtitle_font_size: Font size for the subtitle
+    - content_font_size: Font size for content text
+    - font_family: Font family for the slide
+    
+    Returns:
+    - HTML code for the slide
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Vertical Images Slide</title>
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        html {{ 
+            font-size: 16px; 
+            width: 100vw; 
+            height: 100vh;
+            overflow: hidden;
+        }}
+        
+        body {{
+            font-family: {font_family};
+            background-color: {accent_color}; /* Full viewport accent background */
+            width: 100vw;
+            height: 100vh;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            padding: 5rem 7.5rem; /* 80px 120px */
+        }}
+
+        .slide-inner-container {{
+            width: 100%;
+            height: 100%;
+            max-width: 105rem; /* 1680px */
+            max-height: 57.5rem; /* 920px */
+            background-color: {main_bg_color};
+            border-radius: 1rem; /* 16px */
+            box-shadow: 0 1.25rem 2.5rem rgba(0,0,0,0.15);
+            display: flex;
+            flex-direction: column;
+            padding: 3rem 4rem; /* 48px 64px */
+            position: relative;
+        }}
+        
+        .title-section {{
+            display: flex;
+            align-items: center;
+            margin-bottom: 2.5rem; /* 40px */
+        }}
+        
+        .title-accent {{
+            width: 2.5rem; /* 40px - increased size */
+            height: 2.5rem; /* 40px */
+            background: linear-gradient(135deg, {accent_color}, rgba(213, 232, 185, 0.8));
+            margin-right: 1.25rem; /* 20px */
+            border-radius: 0.5rem; /* 8px */
+            box-shadow: 0 0.25rem 0.5rem rgba(0,0,0,0.1);
+        }}
+        
+        .main-title {{
+            font-size: 4.5rem;
+            color: {title_color};
+            font-weight: 600;
+            margin: 0;
+        }}
+        
+        .content-layout {{
+            display: flex;
+            width: 100%;
+            flex: 1;
+            gap: 2.5rem; /* 40px */
+        }}
+        
+        .image-section {{
+            flex: 2;
+            display: flex;
+            flex-direction: column;
+            gap: 1rem; /* 16px */
+        }}
+        
+        .image-card {{
+            flex: 1;
+            background: rgba(255,255,255,0.9);
+            border-radius: 0.75rem; /* 12px */
+            overflow: hidden;
+            box-shadow: 0 0.5rem 1rem rgba(0,0,0,0.1);
+            transition: all 0.3s ease;
+            position: relative;
+            border-left: 0.25rem solid {accent_color}; /* accent border */
+        }}
+        
+        .image-card:hover {{
+            transform: translateX(0.5rem) scale(1.02); /* hover effect */
+            box-shadow: 0 0.75rem 1.5rem rgba(0,0,0,0.15);
+        }}
+        
+        .image-container {{
+            width: 100%;
+            height: 100%;
+            overflow: hidden;
+            position: relative;
+        }}
+        
+        .image-container img {{
+            width: 100%;
+            height: 100%;
+            object-fit: cover;
+            transition: transform 0.3s ease;
+        }}
+        
+        .image-card:hover .image-container img {{
+            transform: scale(1.05); /* zoom effect on hover */
+        }}
+        
+        .image-overlay {{
+            position: absolute;
+            bottom: 0;
+            left: 0;
+            width: 100%;
+            height: 0.25rem; /* 4px */
+            background: linear-gradient(90deg, {accent_color}, rgba(213, 232, 185, 0.8));
+        }}
+        
+        .content-section {{
+            flex: 3;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            background: rgba(255,255,255,0.9);
+            border-radius: 1rem; /* 16px */
+            padding: 3rem;
+            box-shadow: 0 0.75rem 1.5rem rgba(0,0,0,0.1);
+            border-left: 0.25rem solid {accent_color}; /* accent border */
+        }}
+        
+        .subtitle {{
+            font-size: 2.5rem;
+            color: {subtitle_color};
+            margin: 0 0 2rem 0;
+            font-weight: 600;
+            position: relative;
+        }}
+        
+        .subtitle::after {{
+            content: '';
+            position: absolute;
+            bottom: -0.5rem; /* -8px */
+            left: 0;
+            width: 4rem; /* 64px */
+            height: 0.25rem; /* 4px */
+            background: linear-gradient(90deg, {divider_color}, rgba(213, 232, 185, 0.6));
+            border-radius: 0.125rem; /* 2px */
+        }}
+        
+        .content {{
+            font-size: 2rem;
+            color: {content_color};
+            margin: 0 0 2rem 0;
+            line-height: 1.6;
+            padding: 1.25rem;
+            background: rgba(74, 144, 160, 0.05); /* content color with low opacity */
+            border-radius: 0.5rem; /* 8px */
+            border-left: 0.25rem solid {content_color}; /* content accent */
+            transition: all 0.3s ease;
+        }}
+        
+        .content:hover {{
+            background: rgba(74, 144, 160, 0.1);
+            transform: translateX(0.25rem); /* 4px */
+        }}
+        
+        .content:last-child {{
+            margin-bottom: 0;
+        }}
+        
+        /* Responsive design */
+        @media screen and (max-width: 75rem) {{
+            body {{
+                padding: 3rem 5rem;
+            }}
+            
+            .content-layout {{
+                flex-direction: column;
+                gap: 2rem;
+            }}
+            
+            .image-section {{
+                flex: none;
+                height: 20rem;
+                flex-direction: row;
+            }}
+            
+            .content-section {{
+                flex: none;
+            }}
+        }}
+        
+        @media screen and (max-width: 50rem) {{
+            body {{
+                padding: 2rem 3rem;
+            }}
+            
+            .slide-inner-container {{
+                padding: 2rem 3rem;
+            }}
+            
+            .image-section {{
+                flex-direction: column;
+                height: 15rem;
+            }}
+            
+            .main-title {{
+                font-size: 2rem;
+            }}
+            
+            .subtitle {{
+                font-size: 1.5rem;
+            }}
+            
+            .content {{
+                font-size: 1rem;
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-inner-container">
+        <!-- Title Section -->
+        <div class="title-section">
+            <div class="title-accent"></div>
+            <h1 class="main-title">{main_title}</h1>
+        </div>
+        
+        <!-- Content Layout -->
+        <div class="content-layout">
+            <!-- Image Section -->
+            <div class="image-section">
+                <div class="image-card">
+                    <div class="image-container">
+                        <img src="{image_url_1}" alt="Image 1">
+                        <div class="image-overlay"></div>
+                    </div>
+                </div>
+                <div class="image-card">
+                    <div class="image-container">
+                        <img src="{image_url_2}" alt="Image 2">
+                        <div class="image-overlay"></div>
+                    </div>
+                </div>
+                <div class="image-card">
+                    <div class="image-container">
+                        <img src="{image_url_3}" alt="Image 3">
+                        <div class="image-overlay"></div>
+                    </div>
+                </div>
+            </div>
+            
+            <!-- Content Section -->
+            <div class="content-section">
+                <h2 class="subtitle">{subtitle}</h2>
+                <p class="content">{content1}</p>
+                <p class="content">{content2}</p>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+# sửa biến trong tool
+
+
+def generate_body_slide10(
+    # Main parameters
+    main_title="MainTitle",
+    
+    # Content parameters
+    subtitle1="SubTitle1",
+    content1="Content1",
+    subtitle2="SubTitle2",
+    content2="Content2",
+    subtitle3="SubTitle3",
+    content3="Content3",
+    
+    # Style parameters
+    main_bg_color="#ffffff",
+    accent_color="#d5e8b9",
+    title_color="#333333",
+    subtitle_color="#333333",
+    content_color="#555555",
+    font_family="'Inter', sans-serif",
+    image_url="Image/generate_body_slide10/Default_1.png",
+
+    # Icon parameters - SVG paths for each icon
+    icon1="""<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" width="24" height="24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M9 18h6M12 2v6M12 18v4M14.5 8a2.5 2.5 0 1 0-5 0 2.5 2.5 0 0 0 5 0zM16.5 13a4.5 4.5 0 1 0-9 0 4.5 4.5 0 0 0 9 0z"></path></svg>""",  # Lightbulb
+    icon2="""<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" width="24" height="24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><circle cx="12" cy="12" r="10"></circle><circle cx="12" cy="12" r="6"></circle><circle cx="12" cy="12" r="2"></circle></svg>""",  # Target
+    icon3="""<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" width="24" height="24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M18 20V10M12 20V4M6 20v-6"></path></svg>""",  # Bar chart
+):
+    """
+    Generates an HTML slide with a main title, large image on the left,
+    and three content sections with icons on the right - Full viewport design.
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Image with Icons Slide</title>
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        html {{ 
+            font-size: 16px; 
+            width: 100vw; 
+            height: 100vh;
+            overflow: hidden;
+        }}
+        
+        body {{
+            font-family: {font_family};
+            background-color: {accent_color}; /* Full viewport accent background */
+            width: 100vw;
+            height: 100vh;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            padding: 5rem 7.5rem; /* 80px 120px */
+        }}
+
+        .slide-inner-container {{
+            width: 100%;
+            height: 100%;
+            max-width: 105rem; /* 1680px */
+            max-height: 57.5rem; /* 920px */
+            background-color: {main_bg_color};
+            border-radius: 1rem; /* 16px */
+            box-shadow: 0 1.25rem 2.5rem rgba(0,0,0,0.15);
+            display: flex;
+            flex-direction: column;
+            padding: 3rem 4rem; /* 48px 64px */
+            position: relative;
+        }}
+        
+        .title-section {{
+            display: flex;
+            align-items: center;
+            margin-bottom: 2rem;
+        }}
+        
+        .title-accent {{
+            width: 2.5rem; /* 40px - tăng kích thước */
+            height: 2.5rem; /* 40px */
+            background-color: {accent_color};
+            margin-right: 1.25rem; /* 20px */
+            border-radius: 0.5rem; /* 8px */
+        }}
+        
+        .main-title {{
+            font-size: 4.5rem;
+            color: {title_color};
+            font-weight: 600;
+            margin: 0;
+        }}
+        
+        .content-layout {{
+            display: flex;
+            width: 100%;
+            flex: 1;
+            gap: 2.5rem; /* 40px - gap giữa image và content */
+        }}
+        
+        .image-section {{
+            flex: 2;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            background: rgba(255,255,255,0.9);
+            border-radius: 1rem; /* 16px */
+            padding: 2rem; /* 32px */
+            box-shadow: 0 0.75rem 1.5rem rgba(0,0,0,0.1);
+        }}
+        
+        .image-frame {{
+            width: 100%;
+            height: 100%;
+            position: relative;
+            max-height: 28rem; /* 448px */
+            border-radius: 0.75rem; /* 12px */
+            overflow: hidden;
+            background: linear-gradient(135deg, #f8f9fa, #e9ecef);
+        }}
+        
+        .image-accent {{
+            position: absolute;
+            top: -0.5rem; /* -8px */
+            left: -0.5rem; /* -8px */
+            width: calc(100% + 1rem);
+            height: calc(100% + 1rem);
+            border: 0.25rem solid {accent_color}; /* 4px */
+            border-radius: 1rem; /* 16px */
+            box-sizing: border-box;
+            z-index: 1;
+        }}
+        
+        .image-container {{
+            position: relative;
+            width: 100%;
+            height: 100%;
+            z-index: 2;
+            border-radius: 0.75rem; /* 12px */
+            overflow: hidden;
+        }}
+        
+        .image-container img {{
+            width: 100%;
+            height: 100%;
+            object-fit: cover;
+            transition: transform 0.3s ease;
+        }}
+        
+        .image-section:hover .image-container img {{
+            transform: scale(1.05); /* zoom effect on hover */
+        }}
+        
+        .content-section {{
+            flex: 3;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            gap: 1.5rem;
+        }}
+        
+        .content-item {{
+            display: flex;
+            align-items: flex-start;
+            background: rgba(255,255,255,0.9);
+            border-radius: 0.75rem; /* 12px */
+            padding: 1.5rem;
+            box-shadow: 0 0.5rem 1rem rgba(0,0,0,0.1);
+            transition: all 0.3s ease;
+            border-left: 0.25rem solid {accent_color}; /* accent border */
+        }}
+        
+        .content-item:hover {{
+            transform: translateX(0.5rem); /* 8px - hover effect */
+            box-shadow: 0 0.75rem 1.5rem rgba(0,0,0,0.15);
+        }}
+        
+        .icon-container {{
+            width: 5rem;
+            height: 5rem;
+            background: linear-gradient(135deg, {accent_color}, rgba(213, 232, 185, 0.8));
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            margin-right: 1.5rem; /* 24px */
+            flex-shrink: 0;
+            border-radius: 0.75rem; /* 12px */
+            box-shadow: 0 0.25rem 0.5rem rgba(0,0,0,0.1);
+            transition: all 0.3s ease;
+        }}
+        
+        .content-item:hover .icon-container {{
+            transform: scale(1.1) rotate(5deg); /* hover animation */
+            box-shadow: 0 0.5rem 1rem rgba(0,0,0,0.15);
+        }}
+        
+        .icon-container svg {{
+            width: 2.5rem;
+            height: 2.5rem;
+            stroke: #333333;
+            filter: drop-shadow(0 0.125rem 0.25rem rgba(0,0,0,0.1));
+        }}
+        
+        .content-text {{
+            flex: 1;
+        }}
+        
+        .subtitle {{
+            font-size: 2rem;
+            color: {subtitle_color};
+            margin: 0 0 0.5rem 0;
+            font-weight: 600;
+        }}
+        
+        .content {{
+            font-size: 1.6rem;
+            color: {content_color};
+            margin: 0;
+            line-height: 1.5;
+        }}
+        
+        /* Responsive design */
+        @media screen and (max-width: 75rem) {{
+            body {{
+                padding: 3rem 5rem;
+            }}
+            
+            .content-layout {{
+                flex-direction: column;
+                gap: 2rem;
+            }}
+            
+            .image-section {{
+                flex: none;
+                height: 20rem;
+            }}
+            
+            .content-section {{
+                flex: none;
+                gap: 1.5rem;
+            }}
+        }}
+        
+        @media screen and (max-width: 50rem) {{
+            body {{
+                padding: 2rem 3rem;
+            }}
+            
+            .slide-inner-container {{
+                padding: 2rem 3rem;
+            }}
+            
+            .content-item {{
+                flex-direction: column;
+                text-align: center;
+            }}
+            
+            .icon-container {{
+                margin-right: 0;
+                margin-bottom: 1rem;
+            }}
+            
+            .title-font-size {{
+                font-size: 2rem;
+            }}
+            
+            .subtitle-font-size {{
+                font-size: 1.25rem;
+            }}
+            
+            .content-font-size {{
+                font-size: 1rem;
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-inner-container">
+        <!-- Title Section -->
+        <div class="title-section">
+            <div class="title-accent"></div>
+            <h1 class="main-title">{main_title}</h1>
+        </div>
+        
+        <!-- Content Layout -->
+        <div class="content-layout">
+            <!-- Image Section -->
+            <div class="image-section">
+                <div class="image-frame">
+                    <div class="image-accent"></div>
+                    <div class="image-container">
+                        <img src="{image_url}" alt="Slide image">
+                    </div>
+                </div>
+            </div>
+            
+            <!-- Content Section -->
+            <div class="content-section">
+                <!-- Content Item 1 -->
+                <div class="content-item">
+                    <div class="icon-container">
+                        {icon1}
+                    </div>
+                    <div class="content-text">
+                        <h3 class="subtitle">{subtitle1}</h3>
+                        <p class="content">{content1}</p>
+                    </div>
+                </div>
+                
+                <!-- Content Item 2 -->
+                <div class="content-item">
+                    <div class="icon-container">
+                        {icon2}
+                    </div>
+                    <div class="content-text">
+                        <h3 class="subtitle">{subtitle2}</h3>
+                        <p class="content">{content2}</p>
+                    </div>
+                </div>
+                
+                <!-- Content Item 3 -->
+                <div class="content-item">
+                    <div class="icon-container">
+                        {icon3}
+                    </div>
+                    <div class="content-text">
+                        <h3 class="subtitle">{subtitle3}</h3>
+                        <p class="content">{content3}</p>
+                    </div>
+                </div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+# sửa biến trong tool
+
+
+
+
+def generate_body_slide11(
+    # Main parameters
+    main_title="MainTitle",
+    
+    # Content parameters
+    subtitle1="SUBTITLE1",
+    content1="Content1",
+    subtitle2="SUBTITLE2",
+    content2="Content2",
+    subtitle3="SUBTITLE3",
+    content3="Content3",
+    
+    # Style parameters
+    main_bg_color="#ffffff",
+    box_bg_color="#e6f2dd",
+    accent_color="#e6f2dd",
+    title_color="#333333",
+    subtitle_color="#333333",
+    content_color="#555555",
+    font_family="'Inter', sans-serif",
+    box_height="15.625rem",
+    
+    # Icon parameters - SVG paths for each icon
+    icon1="""<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" width="32" height="32" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M3 3v18h18"></path><path d="M18 9l-5 5-2-2-4 4"></path></svg>""",
+    icon2="""<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" width="32" height="32" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M18 20V10M12 20V4M6 20v-6"></path></svg>""",
+    icon3="""<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" width="32" height="32" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M2 3h6a4 4 0 0 1 4 4v14a3 3 0 0 0-3-3H2z"></path><path d="M22 3h-6a4 4 0 0 0-4 4v14a3 3 0 0 1 3-3h7z"></path></svg>""",
+):
+    """
+    Generates an HTML slide with a main title and three content boxes with icons.
+    Full viewport design with modern styling.
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Three Column Slide</title>
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        html {{ 
+            font-size: 16px; 
+            width: 100vw; 
+            height: 100vh;
+            overflow: hidden;
+        }}
+        
+        body {{
+            font-family: {font_family};
+            background-color: {accent_color}; /* Full viewport accent background */
+            width: 100vw;
+            height: 100vh;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            padding: 5rem 7.5rem; /* 80px 120px */
+        }}
+
+        .slide-inner-container {{
+            width: 100%;
+            height: 100%;
+            max-width: 105rem; /* 1680px */
+            max-height: 57.5rem; /* 920px */
+            background-color: {main_bg_color};
+            border-radius: 1rem; /* 16px */
+            box-shadow: 0 1.25rem 2.5rem rgba(0,0,0,0.15);
+            display: flex;
+            flex-direction: column;
+            padding: 3rem 4rem; /* 48px 64px */
+            position: relative;
+        }}
+        
+        .title-section {{
+            display: flex;
+            align-items: center;
+            margin-bottom: 2.5rem;
+        }}
+        
+        .title-accent {{
+            width: 2.5rem; /* 40px - tăng kích thước */
+            height: 2.5rem; /* 40px */
+            background-color: {box_bg_color};
+            margin-right: 1.25rem; /* 20px */
+            border-radius: 0.5rem; /* 8px */
+        }}
+        
+        .main-title {{
+            font-size: 4.5rem;
+            color: {title_color};
+            font-weight: 600;
+            margin: 0;
+        }}
+        
+        .content-layout {{
+            display: flex;
+            justify-content: space-between;
+            flex: 1;
+            gap: 2rem; /* 32px - tạo gap giữa boxes */
+            align-items: stretch;
+        }}
+        
+        .content-box {{
+            flex: 1;
+            background: linear-gradient(135deg, {box_bg_color}, rgba(230, 242, 221, 0.8));
+            position: relative;
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+            padding: 4.5rem 2rem 2rem;
+            border-radius: 1rem;
+            text-align: center;
+            box-shadow: 0 0.75rem 1.5rem rgba(0,0,0,0.1);
+            transition: all 0.3s ease;
+            border: 0.125rem solid rgba(255,255,255,0.3);
+        }}
+        
+        .content-box:hover {{
+            transform: translateY(-0.5rem); /* 8px - hover effect */
+            box-shadow: 0 1.25rem 2.5rem rgba(0,0,0,0.15);
+        }}
+        
+        .icon-circle {{
+            width: 6rem;
+            height: 6rem;
+            border-radius: 50%;
+            background: linear-gradient(135deg, #ffffff, #f8f9fa);
+            position: absolute;
+            top: -3rem;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            box-shadow: 0 0.75rem 1.5rem rgba(0, 0, 0, 0.15);
+            border: 0.25rem solid rgba(255,255,255,0.8);
+            transition: all 0.3s ease;
+        }}
+        
+        .content-box:hover .icon-circle {{
+            transform: scale(1.1) rotate(5deg); /* hover animation */
+            box-shadow: 0 1rem 2rem rgba(0, 0, 0, 0.2);
+        }}
+        
+        .icon-circle svg {{
+            stroke: {accent_color};
+            width: 2.5rem;
+            height: 2.5rem;
+            filter: drop-shadow(0 0.125rem 0.25rem rgba(0,0,0,0.1));
+        }}
+        
+        .subtitle {{
+            font-size: 2rem;
+            color: {subtitle_color};
+            margin: 0 0 1.5rem 0;
+            font-weight: 700;
+            text-transform: uppercase;
+            letter-spacing: 0.05rem;
+        }}
+        
+        .content {{
+            font-size: 1.6rem;
+            color: {content_color};
+            margin: 0;
+            line-height: 1.6;
+            flex: 1;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+        }}
+        
+        /* Responsive design */
+        @media screen and (max-width: 75rem) {{
+            body {{
+                padding: 3rem 5rem;
+            }}
+            
+            .content-layout {{
+                flex-direction: column;
+                gap: 1.5rem;
+            }}
+            
+            .content-box {{
+                padding: 3rem 1.5rem 1.5rem;
+            }}
+            
+            .icon-circle {{
+                width: 4rem;
+                height: 4rem;
+                top: -2rem;
+            }}
+            
+            .icon-circle svg {{
+                width: 1.5rem;
+                height: 1.5rem;
+            }}
+        }}
+        
+        @media screen and (max-width: 50rem) {{
+            body {{
+                padding: 2rem 3rem;
+            }}
+            
+            .slide-inner-container {{
+                padding: 2rem 3rem;
+            }}
+            
+            .title-section {{
+                margin-bottom: 2rem;
+            }}
+            
+            .title-font-size {{
+                font-size: 2rem;
+            }}
+            
+            .subtitle-font-size {{
+                font-size: 1.25rem;
+            }}
+            
+            .content-font-size {{
+                font-size: 1rem;
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-inner-container">
+        <!-- Title Section -->
+        <div class="title-section">
+            <div class="title-accent"></div>
+            <h1 class="main-title">{main_title}</h1>
+        </div>
+        
+        <!-- Content Layout -->
+        <div class="content-layout">
+            <!-- Content Box 1 -->
+            <div class="content-box">
+                <div class="icon-circle">
+                    {icon1}
+                </div>
+                <h3 class="subtitle">{subtitle1}</h3>
+                <p class="content">{content1}</p>
+            </div>
+            
+            <!-- Content Box 2 -->
+            <div class="content-box">
+                <div class="icon-circle">
+                    {icon2}
+                </div>
+                <h3 class="subtitle">{subtitle2}</h3>
+                <p class="content">{content2}</p>
+            </div>
+            
+            <!-- Content Box 3 -->
+            <div class="content-box">
+                <div class="icon-circle">
+                    {icon3}
+                </div>
+                <h3 class="subtitle">{subtitle3}</h3>
+                <p class="content">{content3}</p>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+# sửa biến trong tool
+
+
+
+def generate_body_slide12(
+    # Main parameters
+    main_title="MainTitle",
+    main_content="Content",
+    
+    # Content parameters
+    subtitle1="Subtitle1",
+    content1="Content1",
+    subtitle2="Subtitle2",
+    content2="Content2",
+    subtitle3="Subtitle3",
+    content3="Content3",
+    
+    # Style parameters
+    main_bg_color="#ffffff",
+    accent_color="#d5e8b9",
+    title_color="#333333",
+    content_color="#555555",
+    subtitle_color="#333333",
+    font_family="'Inter', sans-serif",
+    image_url_1="Image/generate_body_slide12/Default_1.png",
+    image_url_2="Image/generate_body_slide12/Default_2.png",
+    image_url_3="Image/generate_body_slide12/Default_3.png",
+
+):
+    """
+    Generates an HTML slide with a main title, horizontal content bar,
+    and three images with subtitles and content - Full viewport design.
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Image Gallery Slide</title>
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        html {{ 
+            font-size: 16px; 
+            width: 100vw; 
+            height: 100vh;
+            overflow: hidden;
+        }}
+        
+        body {{
+            font-family: {font_family};
+            background-color: {accent_color}; /* Full viewport accent background */
+            width: 100vw;
+            height: 100vh;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            padding: 5rem 7.5rem; /* 80px 120px */
+        }}
+
+        .slide-inner-container {{
+            width: 100%;
+            height: 100%;
+            max-width: 105rem; /* 1680px */
+            max-height: 57.5rem; /* 920px */
+            background-color: {main_bg_color};
+            border-radius: 1rem; /* 16px */
+            box-shadow: 0 1.25rem 2.5rem rgba(0,0,0,0.15);
+            display: flex;
+            flex-direction: column;
+            padding: 3rem 4rem; /* 48px 64px */
+            position: relative;
+        }}
+        
+        .title-section {{
+            display: flex;
+            align-items: center;
+            margin-bottom: 2rem; /* 32px */
+        }}
+        
+        .title-accent {{
+            width: 2.5rem; /* 40px - tăng kích thước */
+            height: 2.5rem; /* 40px */
+            background-color: {accent_color};
+            margin-right: 1.25rem; /* 20px */
+            border-radius: 0.5rem; /* 8px */
+        }}
+        
+        .main-title {{
+            font-size: 4.5rem;
+            color: {title_color};
+            font-weight: 600;
+            margin: 0;
+        }}
+        
+        .content-bar {{
+            width: 100%;
+            background: linear-gradient(135deg, {accent_color}, rgba(213, 232, 185, 0.8));
+            padding: 1.5rem 2.5rem;
+            margin-bottom: 2rem;
+            border-radius: 0.75rem;
+            text-align: center;
+            color: {content_color};
+            font-size: 1.6rem;
+            font-weight: 500;
+            box-shadow: 0 0.5rem 1rem rgba(0,0,0,0.1);
+            border: 0.125rem solid rgba(255,255,255,0.3);
+        }}
+        
+        .image-gallery {{
+            display: flex;
+            justify-content: space-between;
+            flex: 1;
+            gap: 2rem; /* 32px - tạo gap giữa items */
+            align-items: stretch;
+        }}
+        
+        .image-item {{
+            flex: 1;
+            display: flex;
+            flex-direction: column;
+            background: rgba(255,255,255,0.9);
+            border-radius: 1.25rem;
+            padding: 2rem;
+            box-shadow: 0 0.75rem 1.5rem rgba(0,0,0,0.1);
+            transition: all 0.3s ease;
+        }}
+        
+        .image-item:hover {{
+            transform: translateY(-0.5rem); /* 8px - hover effect */
+            box-shadow: 0 1.25rem 2.5rem rgba(0,0,0,0.15);
+        }}
+        
+        .image-container {{
+            position: relative;
+            width: 100%;
+            height: 18rem; /* 288px - tăng chiều cao */
+            margin-bottom: 1.5rem; /* 24px */
+            overflow: hidden;
+            border-radius: 0.75rem; /* 12px */
+            background: linear-gradient(135deg, #f8f9fa, #e9ecef);
+        }}
+        
+        .image-border {{
+            position: absolute;
+            top: 0;
+            left: 0;
+            width: 100%;
+            height: 100%;
+            border: 0.25rem solid {accent_color}; /* 4px border all around */
+            border-radius: 0.75rem; /* 12px */
+            box-sizing: border-box;
+            z-index: 1;
+        }}
+        
+        .image-container img {{
+            width: 100%;
+            height: 100%;
+            object-fit: cover;
+            border-radius: 0.5rem; /* 8px */
+            transition: transform 0.3s ease;
+        }}
+        
+        .image-item:hover .image-container img {{
+            transform: scale(1.05); /* zoom effect on hover */
+        }}
+        
+        .subtitle {{
+            font-size: 2rem;
+            color: {subtitle_color};
+            margin: 0 0 1rem 0;
+            font-weight: 600;
+            text-align: center;
+            color: {accent_color};
+        }}
+        
+        .image-content {{
+            font-size: 1.5rem;
+            color: {content_color};
+            margin: 0;
+            text-align: center;
+            line-height: 1.6;
+            flex: 1;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+        }}
+        
+        /* Responsive design */
+        @media screen and (max-width: 75rem) {{
+            body {{
+                padding: 3rem 5rem;
+            }}
+            
+            .image-gallery {{
+                flex-direction: column;
+                gap: 1.5rem;
+            }}
+            
+            .image-container {{
+                height: 15rem;
+            }}
+        }}
+        
+        @media screen and (max-width: 50rem) {{
+            body {{
+                padding: 2rem 3rem;
+            }}
+            
+            .slide-inner-container {{
+                padding: 2rem 3rem;
+            }}
+            
+            .title-font-size {{
+                font-size: 2rem;
+            }}
+            
+            .content-font-size {{
+                font-size: 1rem;
+            }}
+            
+            .subtitle-font-size {{
+                font-size: 1.25rem;
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-inner-container">
+        <!-- Title Section -->
+        <div class="title-section">
+            <div class="title-accent"></div>
+            <h1 class="main-title">{main_title}</h1>
+        </div>
+        
+        <!-- Content Bar -->
+        <div class="content-bar">
+            {main_content}
+        </div>
+        
+        <!-- Image Gallery -->
+        <div class="image-gallery">
+            <!-- Image Item 1 -->
+            <div class="image-item">
+                <div class="image-container">
+                    <div class="image-border"></div>
+                    <img src="{image_url_1}" alt="Image 1">
+                </div>
+                <h3 class="subtitle">{subtitle1}</h3>
+                <p class="image-content">{content1}</p>
+            </div>
+            
+            <!-- Image Item 2 -->
+            <div class="image-item">
+                <div class="image-container">
+                    <div class="image-border"></div>
+                    <img src="{image_url_2}" alt="Image 2">
+                </div>
+                <h3 class="subtitle">{subtitle2}</h3>
+                <p class="image-content">{content2}</p>
+            </div>
+            
+            <!-- Image Item 3 -->
+            <div class="image-item">
+                <div class="image-container">
+                    <div class="image-border"></div>
+                    <img src="{image_url_3}" alt="Image 3">
+                </div>
+                <h3 class="subtitle">{subtitle3}</h3>
+                <p class="image-content">{content3}</p>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+# sửa biến trong tool
+
+
+# sửa biến trong tool 
+
+def generate_body_slide15(
+    # Main parameters
+    main_title="MainTitle",
+    
+    # Content parameters
+    content1="""
+        <ul>SubTitle1
+            <li>Point 1</li>
+            <li>Point 2</li>
+            <li>Point 3</li>
+        </ul>
+    """,
+    content2="""
+        <ul>SubTitle2
+            <li>Point 1</li>
+            <li>Point 2</li>
+            <li>Point 3</li>
+        </ul>
+    """,
+
+    # Style parameters (đã chuyển sang rem)
+    main_bg_color="#ffffff",
+    accent_color="#d5e8b9",
+    title_color="#333333",
+    subtitle_color="#333333",
+    content_color="#555555",
+    font_family="'Inter', sans-serif",
+    image_url="Image/generate_body_slide15/Default_1.png",  # Default image path
+):
+    """
+    Generates an HTML slide with an image on the right and two content sections on the left.
+    All size parameters are now in REM.
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Image Right Slide</title>
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        html {{ 
+            font-size: 16px; 
+            width: 100vw; 
+            height: 100vh;
+            overflow: hidden;
+        }}
+        
+        body {{
+            font-family: {font_family};
+            background-color: {accent_color}; /* Accent color cho toàn màn hình */
+            width: 100vw;
+            height: 100vh;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            padding: 5rem 7.5rem; /* 80px 120px */
+        }}
+
+        .slide-inner-container {{
+            width: 100%;
+            height: 100%;
+            max-width: 105rem; /* 1680px */
+            max-height: 57.5rem; /* 920px */
+            background-color: {main_bg_color};
+            border-radius: 1rem; /* 16px */
+            box-shadow: 0 1.25rem 2.5rem rgba(0,0,0,0.15); /* 0 20px 40px */
+            display: flex;
+            flex-direction: column;
+            padding: 2.5rem 5rem; /* 40px 80px */
+            position: relative;
+            justify-content: space-between;
+        }}
+        
+        .title-section {{
+            display: flex;
+            align-items: center;
+            margin-bottom: 2rem;
+        }}
+        
+        .title-accent {{
+            width: 1.875rem; /* 30px */
+            height: 1.875rem; /* 30px */
+            background-color: {accent_color};
+            margin-right: 0.9375rem; /* 15px */
+            border-radius: 0.25rem; /* 4px - thêm border radius */
+        }}
+        
+        .main-title {{
+            font-size: 4.5rem;
+            color: {title_color};
+            font-weight: 600;
+            margin: 0;
+        }}
+        
+        .content-layout {{
+            display: flex;
+            width: 100%;
+            flex: 1; /* chiếm toàn bộ space còn lại */
+            gap: 2.5rem; /* 40px - tạo gap giữa columns */
+        }}
+        
+        .left-column {{
+            flex: 2.5; /* tăng từ 2 lên 2.5 để content có nhiều space hơn */
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            gap: 2rem; /* 32px */
+        }}
+        
+        .right-column {{
+            flex: 2.5; /* giảm từ 3 xuống 2.5 để ảnh nhỏ hơn */
+            display: flex;
+            align-items: center;
+            justify-content: center;
+        }}
+        
+        .image-container {{
+            width: 100%;
+            height: 100%;
+            overflow: hidden;
+            border-radius: 0.5rem; /* 8px - thêm border radius */
+            box-shadow: 0 0.25rem 0.5rem rgba(0,0,0,0.1); /* thêm shadow */
+        }}
+        
+        .image-container img {{
+            width: 100%;
+            height: 100%;
+            object-fit: cover;
+            transition: transform 0.3s ease; /* thêm hover effect */
+        }}
+        
+        .image-container:hover img {{
+            transform: scale(1.02); /* zoom nhẹ khi hover */
+        }}
+        
+        .content-section {{
+            display: flex;
+            flex-direction: column;
+        }}
+        
+        .subtitle-container {{
+            background-color: {accent_color};
+            padding: 1.25rem 2rem;
+            border-radius: 0.5rem;
+            margin-bottom: 1rem;
+            box-shadow: 0 0.125rem 0.25rem rgba(0,0,0,0.1);
+        }}
+        
+        /* CSS cho nội dung chèn vào */
+        .content-section ul {{
+            list-style: none;
+            padding: 0;
+            margin: 0;
+        }}
+
+        .content-section ul li {{
+            font-size: 1.6rem;
+            color: {content_color};
+            line-height: 1.6;
+            padding-left: 1rem;
+            position: relative;
+            margin-bottom: 0.5rem;
+        }}
+        
+        .content-section ul li::before {{
+            content: '•';
+            color: {accent_color}; /* đổi màu bullet */
+            position: absolute;
+            left: 0;
+            font-weight: bold;
+        }}
+
+        /* Giả định dòng đầu tiên của <ul> là subtitle */
+        .content-section ul {{
+            font-size: 2.5rem;
+            color: {subtitle_color};
+            font-weight: 600;
+            margin-bottom: 0.75rem;
+        }}
+
+    </style>
+</head>
+<body>
+    <div class="slide-inner-container">
+        <!-- Title Section -->
+        <div class="title-section">
+            <div class="title-accent"></div>
+            <h1 class="main-title">{main_title}</h1>
+        </div>
+        
+        <!-- Content Layout -->
+        <div class="content-layout">
+            <!-- Left Column with Content Sections -->
+            <div class="left-column">
+                <!-- Content Section 1 -->
+                <div class="content-section">
+                    <div class="subtitle-container">
+                        {content1}
+                    </div>
+                </div>
+                
+                <!-- Content Section 2 -->
+                <div class="content-section">
+                    <div class="subtitle-container">
+                        {content2}
+                    </div>
+                </div>
+            </div>
+            
+            <!-- Right Column with Image -->
+            <div class="right-column">
+                <div class="image-container">
+                    <img src="{image_url}" alt="Slide image">
+                </div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+# sửa biến trong tool 
+
+
+
+
+
+def generate_body_slide18(
+    main_title="Main title",
+    left_title="Subtitle 1",
+    right_title="Subtitle 2",
+    left_text="Content1",
+    right_text="Content2",
+    left_icon="gavel",  # Options: "gavel", "custom"
+    right_icon="scales",  # Options: "scales", "custom"
+    custom_left_icon="",  # Custom SVG code if left_icon is "custom"
+    custom_right_icon="",  # Custom SVG code if right_icon is "custom"
+    # Style parameters (đã chuyển sang rem cho consistency)
+    main_title_font_size="3rem",          # THAY ĐỔI: 48px -> 3rem
+    column_title_font_size="2.25rem",     # THAY ĐỔI: 36px -> 2.25rem
+    text_font_size="1.375rem",            # THAY ĐỔI: 22px -> 1.375rem
+    title_color="#555555",
+    text_color="#555555",
+    icon_color="#a2c4c9",
+    background_color="#ffffff",
+    accent_color="#a2c4c9",
+    divider_color="#555555",
+    font_family="Arial, sans-serif"
+):
+    """
+    Generates an HTML slide with a main title and two comparison columns with icons.
+    The slide has a border design that matches the image exactly.
+    
+    Parameters:
+    - main_title: The main title of the slide
+    - left_title: Title for the left column
+    - right_title: Title for the right column
+    - left_text: Text content for the left column
+    - right_text: Text content for the right column
+    - left_icon: Icon for the left column ("gavel" or "custom")
+    - right_icon: Icon for the right column ("scales" or "custom")
+    - custom_left_icon: Custom SVG code for left icon if left_icon is "custom"
+    - custom_right_icon: Custom SVG code for right icon if right_icon is "custom"
+    - main_title_font_size: Font size for the main title
+    - column_title_font_size: Font size for the column titles
+    - text_font_size: Font size for the text content
+    - title_color: Color for all titles
+    - text_color: Color for all text content
+    - icon_color: Color for the icons
+    - background_color: Background color of the slide
+    - accent_color: Color for the corner accents
+    - divider_color: Color for the divider line
+    - font_family: Font family for the slide
+    
+    Returns:
+    - HTML code for the comparison slide
+    """
+    
+    # Define the SVG icons
+    gavel_icon = f"""<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" width="90" height="90" fill="none" stroke="{icon_color}" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+        <path d="M14 13L3 2M14 13L9 18M14 13L16 11L20 15L18 17M14 6L17 9M9 1L3 7M20 21H4"/>
+    </svg>"""
+    
+    scales_icon = f"""<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" width="90" height="90" fill="none" stroke="{icon_color}" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+        <path d="M12 3v18M8 21h8M7 8l-4 4M17 8l4 4M5 12a2 2 0 1 0 4 0 2 2 0 1 0-4 0M15 12a2 2 0 1 0 4 0 2 2 0 1 0-4 0"/>
+        <path d="M5 12h14"/>
+    </svg>"""
+    
+    # Select the appropriate icons
+    if left_icon == "gavel":
+        left_icon_html = gavel_icon
+    elif left_icon == "custom":
+        left_icon_html = custom_left_icon
+    else:
+        left_icon_html = gavel_icon
+        
+    if right_icon == "scales":
+        right_icon_html = scales_icon
+    elif right_icon == "custom":
+        right_icon_html = custom_right_icon
+    else:
+        right_icon_html = scales_icon
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Comparison Slide</title>
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; }}
+        body, html {{
+            height: 100vh;
+            width: 100vw;
+            font-family: {font_family};
+            background-color: {accent_color};
+            color: {text_color};
+            overflow: hidden;
+        }}
+
+        .slide-container {{
+            width: 100%;
+            height: 100%;
+            position: relative;
+            background-color: {accent_color};
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            padding: 5rem 7.5rem; /* 80px 120px */
+        }}
+
+        .slide-inner-container {{
+            width: 100%;
+            height: 100%;
+            max-width: 105rem; /* 1680px */
+            max-height: 57.5rem; /* 920px */
+            background-color: {background_color};
+            border-radius: 1rem; /* 16px */
+            box-shadow: 0 1.25rem 2.5rem rgba(0,0,0,0.15); /* 0 20px 40px */
+            display: flex;
+            flex-direction: column;
+            padding: 3.75rem 5rem; /* 60px 80px */
+            position: relative;
+            justify-content: center;
+        }}
+        
+        .main-title {{
+            font-size: 4.5rem;
+            font-weight: 700;
+            color: {title_color};
+            text-align: center;
+            margin-bottom: 3rem;
+            line-height: 1.2;
+        }}
+        
+        .columns-container {{
+            display: flex;
+            flex: 1;
+            align-items: center;
+            justify-content: space-between;
+            gap: 2rem; /* 32px */
+            height: 100%;
+            max-width: 100%;
+        }}
+        
+        .column {{
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+            justify-content: center;
+            flex: 1;
+            padding: 1rem 2rem;
+            max-width: calc(50% - 1rem);
+        }}
+        
+        .icon-container {{
+            margin-bottom: 2rem;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            height: 6rem;
+        }}
+        
+        .column-title {{
+            font-size: 2.8rem;
+            font-weight: 600;
+            color: {title_color};
+            text-align: center;
+            margin: 0 0 1.5rem 0;
+            line-height: 1.3;
+        }}
+        
+        .column-text {{
+            font-size: 1.8rem;
+            color: {text_color};
+            text-align: center;
+            line-height: 1.5;
+            max-width: 100%;
+        }}
+        
+        .divider {{
+            width: 0.125rem; /* 2px */
+            height: 60%;
+            background: {divider_color};
+            border: none;
+            align-self: center;
+            opacity: 0.4;
+            flex-shrink: 0;
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="slide-inner-container">
+            <h1 class="main-title">{main_title}</h1>
+            
+            <div class="columns-container">
+                <div class="column">
+                    <div class="icon-container">
+                        {left_icon_html}
+                    </div>
+                    <h2 class="column-title">{left_title}</h2>
+                    <p class="column-text">{left_text}</p>
+                </div>
+                
+                <div class="divider"></div>
+                
+                <div class="column">
+                    <div class="icon-container">
+                        {right_icon_html}
+                    </div>
+                    <h2 class="column-title">{right_title}</h2>
+                    <p class="column-text">{right_text}</p>
+                </div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+# sửa biến trong tool 
+
+
+
+def generate_body_slide19(
+    main_title="Your Title Here",
+    left_column_titles=["Your Title Here", "Your Title Here"],
+    left_column_texts=[
+        "Presentations are communication tools that can be used as demonstrations.",
+        "Presentation are communication tools that can be used as demontrations, lectures, reports, and more. it is mostly presented before an audience."
+    ],
+    right_column_titles=["Your Title Here", "Your Title Here"],
+    right_column_texts=[
+        "Presentations are communication tools that can be used as speeches, reports, and more.",
+        "Presentations are communication tools that can be used as speeches, reports, and more."
+    ],
+    # Style parameters (đã chuyển sang rem)
+    
+    main_title_color="#555555",
+    left_bg_color="#a2c4c9",
+    left_text_color="#ffffff",
+    right_title_color="#555555",
+    right_text_color="#555555",
+    border_color="#a2c4c9",
+    icon_color="#a2c4c9",
+    font_family="Arial, sans-serif",
+):
+    """
+    Generates an HTML slide with two columns. All size parameters are now in REM.
+    """
+    
+    # Create left column sections HTML
+    left_sections_html = ""
+    for i, (title, text) in enumerate(zip(left_column_titles, left_column_texts)):
+        left_sections_html += f"""
+        <div class="left-section">
+            <h2>{title}</h2>
+            <p>{text}</p>
+        </div>
+        """
+    
+    # Create right column sections HTML
+    right_sections_html = ""
+    icons = [
+        # Document with pencil icon
+        """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" width="48" height="48" fill="none" stroke="ICON_COLOR" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+            <path d="M14 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V8z"></path>
+            <polyline points="14 2 14 8 20 8"></polyline>
+            <path d="M16 13l-4 4h-4v-4l8-8z"></path>
+        </svg>""",
+        # Magnifying glass icon
+        """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" width="48" height="48" fill="none" stroke="ICON_COLOR" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+            <circle cx="11" cy="11" r="8"></circle>
+            <line x1="21" y1="21" x2="16.65" y2="16.65"></line>
+        </svg>"""
+    ]
+    
+    for i, (title, text) in enumerate(zip(right_column_titles, right_column_texts)):
+        icon = icons[i % len(icons)].replace("ICON_COLOR", icon_color)
+        right_sections_html += f"""
+        <div class="right-section-{i}">
+            <div class="icon-{i}">{icon}</div>
+            <h2 class="right-title-{i}">{title}</h2>
+            <p class="right-text-{i}">{text}</p>
+        </div>
+        """
+    
+    # Create the HTML content with CSS - Flat absolute positioning
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Two Column Slide</title>
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; width: 1920px; height: 1080px; }}
+        body, html {{
+            height: 1080px;
+            width: 1920px;
+            font-family: {font_family};
+            background-color: {border_color};
+            color: {right_text_color};
+            overflow: hidden;
+        }}
+
+        .slide-background {{
+            position: absolute;
+            left: 120px;
+            top: 80px;
+            width: 1680px;
+            height: 920px;
+            background-color: #ffffff;
+            border-radius: 16px;
+            box-shadow: 0 20px 40px rgba(0,0,0,0.15);
+        }}
+        
+        .main-title {{
+            position: absolute;
+            left: 200px;
+            top: 140px;
+            width: 1520px;
+            font-size: 4.5rem;
+            font-weight: 700;
+            color: {main_title_color};
+            text-align: center;
+            line-height: 1.2;
+        }}
+        
+        .left-column {{
+            position: absolute;
+            left: 200px;
+            top: 243px;
+            width: 730px;
+            height: 717px;
+            background-color: {left_bg_color};
+            border-radius: 8px;
+            padding: 40px;
+        }}
+        
+        .left-section {{
+            margin-bottom: 32px;
+        }}
+        
+        .left-section:last-child {{
+            margin-bottom: 0;
+        }}
+        
+        .left-section h2 {{
+            font-size: 2.5rem;
+            font-weight: 600;
+            color: {left_text_color};
+            margin-bottom: 16px;
+            line-height: 1.3;
+        }}
+        
+        .left-section p {{
+            font-size: 1.6rem;
+            color: {left_text_color};
+            line-height: 1.5;
+            opacity: 0.95;
+        }}
+        
+        .right-section-0 {{
+            position: absolute;
+            left: 990px;
+            top: 280px;
+            width: 730px;
+            height: 320px;
+        }}
+        
+        .icon-0 {{
+            position: absolute;
+            left: 0;
+            top: 0;
+            width: 80px;
+            height: 80px;
+            background-color: rgba(162, 196, 201, 0.1);
+            border-radius: 12px;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+        }}
+        
+        .icon-0 svg {{
+            width: 60px;
+            height: 60px;
+        }}
+        
+        .right-title-0 {{
+            position: absolute;
+            left: 100px;
+            top: 0;
+            width: 630px;
+            font-size: 2.5rem;
+            font-weight: 600;
+            color: {right_title_color};
+            line-height: 1.3;
+        }}
+        
+        .right-text-0 {{
+            position: absolute;
+            left: 100px;
+            top: 65px;
+            width: 630px;
+            font-size: 1.6rem;
+            color: {right_text_color};
+            line-height: 1.5;
+        }}
+        
+        .right-section-1 {{
+            position: absolute;
+            left: 990px;
+            top: 640px;
+            width: 730px;
+            height: 320px;
+        }}
+        
+        .icon-1 {{
+            position: absolute;
+            left: 0;
+            top: 0;
+            width: 80px;
+            height: 80px;
+            background-color: rgba(162, 196, 201, 0.1);
+            border-radius: 12px;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+        }}
+        
+        .icon-1 svg {{
+            width: 60px;
+            height: 60px;
+        }}
+        
+        .right-title-1 {{
+            position: absolute;
+            left: 100px;
+            top: 0;
+            width: 630px;
+            font-size: 2.5rem;
+            font-weight: 600;
+            color: {right_title_color};
+            line-height: 1.3;
+        }}
+        
+        .right-text-1 {{
+            position: absolute;
+            left: 100px;
+            top: 65px;
+            width: 630px;
+            font-size: 1.6rem;
+            color: {right_text_color};
+            line-height: 1.5;
+        }}
+    </style>
+</head>
+<body>
+    <!-- Background layer -->
+    <div class="slide-background"></div>
+    
+    <!-- Main title -->
+    <h1 class="main-title">{main_title}</h1>
+    
+    <!-- Left column -->
+    <div class="left-column">
+        {left_sections_html}
+    </div>
+    
+    <!-- Right column sections -->
+    {right_sections_html}
+</body>
+</html>"""
+    
+    return html_code
+# sửa biến trong tool 
+
+
+def generate_body_slide20(
+    main_title="Your Title Here",
+    left_title="Your Title Here",
+    right_title="Your Title Here",
+    left_text="Presentation are communication tools that can be used as demontrations, lectures, reports, and more. it is mostly presented before an audience. Presentation are communication tools that can be used as demontrations, lectures, reports, and more.",
+    right_text="Presentation are communication tools that can be used as demontrations, lectures, reports, and more. it is mostly presented before an audience. Presentation are communication tools that can be used as demontrations, lectures, reports, and more.",
+    left_icon="gavel",
+    right_icon="scales",
+    custom_left_icon="",
+    custom_right_icon="",
+    # Style parameters (đã chuyển sang rem)
+    
+    title_color="#555555",
+    text_color="#555555",
+    icon_color="#a2c4c9",
+    background_color="#ffffff",
+    accent_color="#a2c4c9",
+    divider_color="#555555",
+    font_family="Arial, sans-serif",
+):
+    """
+    Generates an HTML slide with two comparison columns. All size parameters are now in REM.
+    """
+    
+    # Define the SVG icons
+    # Kích thước icon cũng được chuyển đổi sang rem và tăng lên
+    gavel_icon = f"""<svg xmlns="http://www.w3.org/2000/svg" width="80" height="80" viewBox="0 0 24 24" fill="none" stroke="{icon_color}" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+        <path d="M14 13L3 2M14 13L9 18M14 13L16 11L20 15L18 17M14 6L17 9M9 1L3 7M20 21H4"/>
+    </svg>"""
+    
+    scales_icon = f"""<svg xmlns="http://www.w3.org/2000/svg" width="80" height="80" viewBox="0 0 24 24" fill="none" stroke="{icon_color}" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+        <path d="M12 3v18M8 21h8M7 8l-4 4M17 8l4 4M5 12a2 2 0 1 0 4 0 2 2 0 1 0-4 0M15 12a2 2 0 1 0 4 0 2 2 0 1 0-4 0"/>
+        <path d="M5 12h14"/>
+    </svg>"""
+    
+    # Select the appropriate icons
+    if left_icon == "gavel":
+        left_icon_html = gavel_icon
+    elif left_icon == "custom":
+        left_icon_html = custom_left_icon
+    else:
+        left_icon_html = gavel_icon
+        
+    if right_icon == "scales":
+        right_icon_html = scales_icon
+    elif right_icon == "custom":
+        right_icon_html = custom_right_icon
+    else:
+        right_icon_html = scales_icon
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Comparison Slide</title>
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; width: 1920px; height: 1080px; }}
+        body, html {{
+            height: 1080px;
+            width: 1920px;
+            font-family: {font_family};
+            background-color: {accent_color};
+            color: {text_color};
+            overflow: hidden;
+        }}
+
+        .slide-background {{
+            position: absolute;
+            left: 120px;
+            top: 80px;
+            width: 1680px;
+            height: 920px;
+            background-color: {background_color};
+            border-radius: 16px;
+            box-shadow: 0 20px 40px rgba(0,0,0,0.15);
+        }}
+        
+        .main-title {{
+            position: absolute;
+            left: 200px;
+            top: 140px;
+            width: 1520px;
+            font-size: 4.5rem;
+            font-weight: 700;
+            color: {title_color};
+            text-align: center;
+            line-height: 1.2;
+        }}
+        
+        .left-column {{
+            position: absolute;
+            left: 260px;
+            top: 280px;
+            width: 650px;
+            height: 620px;
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+            justify-content: flex-start;
+            padding: 0 32px;
+            text-align: center;
+        }}
+        
+        .right-column {{
+            position: absolute;
+            left: 1010px;
+            top: 280px;
+            width: 650px;
+            height: 620px;
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+            justify-content: flex-start;
+            padding: 0 32px;
+            text-align: center;
+        }}
+        
+        .divider {{
+            position: absolute;
+            left: 960px;
+            top: 290px;
+            width: 2px;
+            height: 600px;
+            background-color: {divider_color};
+            opacity: 0.3;
+        }}
+        
+        .left-icon {{
+            width: 100px;
+            height: 100px;
+            background-color: rgba(162, 196, 201, 0.1);
+            border-radius: 16px;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            margin-bottom: 28px;
+        }}
+        
+        .left-icon svg {{
+            width: 80px;
+            height: 80px;
+        }}
+        
+        .right-icon {{
+            width: 100px;
+            height: 100px;
+            background-color: rgba(162, 196, 201, 0.1);
+            border-radius: 16px;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            margin-bottom: 28px;
+        }}
+        
+        .right-icon svg {{
+            width: 80px;
+            height: 80px;
+        }}
+        
+        .left-title {{
+            font-size: 2.8rem;
+            font-weight: 600;
+            color: {title_color};
+            text-align: center;
+            margin-bottom: 24px;
+            line-height: 1.3;
+        }}
+        
+        .right-title {{
+            font-size: 2.8rem;
+            font-weight: 600;
+            color: {title_color};
+            text-align: center;
+            margin-bottom: 24px;
+            line-height: 1.3;
+        }}
+        
+        .left-text {{
+            font-size: 1.8rem;
+            color: {text_color};
+            text-align: center;
+            line-height: 1.6;
+            max-width: 90%;
+        }}
+        
+        .right-text {{
+            font-size: 1.8rem;
+            color: {text_color};
+            text-align: center;
+            line-height: 1.6;
+            max-width: 90%;
+        }}
+    </style>
+</head>
+<body>
+    <!-- Background layer -->
+    <div class="slide-background"></div>
+    
+    <!-- Main title -->
+    <h1 class="main-title">{main_title}</h1>
+    
+    <!-- Divider -->
+    <div class="divider"></div>
+    
+    <!-- Left column -->
+    <div class="left-column">
+        <div class="left-icon">
+            {left_icon_html}
+        </div>
+        <h2 class="left-title">{left_title}</h2>
+        <p class="left-text">{left_text}</p>
+    </div>
+    
+    <!-- Right column -->
+    <div class="right-column">
+        <div class="right-icon">
+            {right_icon_html}
+        </div>
+        <h2 class="right-title">{right_title}</h2>
+        <p class="right-text">{right_text}</p>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+# sửa biến trong tool 
+
+
+
+
+def generate_main_points_slide(
+    title="WRITE YOUR TOPIC OR IDEA",
+    point1_title="ADD A MAIN POINT",
+    point1_description="Briefly elaborate on what you want to discuss.",
+    point2_title="ADD A MAIN POINT", 
+    point2_description="Briefly elaborate on what you want to discuss.",
+    point3_title="ADD A MAIN POINT",
+    point3_description="Briefly elaborate on what you want to discuss.",
+    font_family="'Inter', sans-serif"
+):
+    """
+    Generates a completely static main points slide with three columns featuring environmental icons.
+    All animations and hover effects have been removed.
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Main Points Slide</title>
+    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700&display=swap" rel="stylesheet">
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body, html {{
+            height: 100vh;
+            width: 100vw;
+            font-family: {font_family};
+            background-color: #111827;
+            overflow: hidden;
+            position: relative;
+        }}
+        
+        .slide-container {{
+            height: 100vh;
+            width: 100vw;
+            padding: 4rem 2rem;
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+            justify-content: center;
+            position: relative;
+        }}
+        
+        .main-title {{
+            font-size: 4.5rem;
+            font-weight: 700;
+            color: #10d9c4;
+            text-align: center;
+            margin-bottom: 5rem;
+            letter-spacing: 2px;
+            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+            text-transform: uppercase;
+        }}
+        
+        .content-grid {{
+            display: grid;
+            grid-template-columns: repeat(3, 1fr);
+            gap: 5rem;
+            max-width: 1200px;
+            width: 100%;
+            align-items: center;
+        }}
+        
+        .point-column {{
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+            text-align: center;
+            /* ĐÃ XÓA: transition và hover effect */
+        }}
+        
+        .icon-circle {{
+            width: 170px;
+            height: 170px;
+            background: rgba(255, 255, 255, 0.1);
+            border: 4px solid #10d9c4;
+            border-radius: 50%;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            margin-bottom: 2.5rem;
+            position: relative;
+            backdrop-filter: blur(10px);
+            box-shadow: 0 8px 32px rgba(16, 217, 196, 0.3);
+        }}
+        
+        /* Plastic Bag Icon */
+        .plastic-bag-icon {{
+            width: 90px;
+            height: 90px;
+            position: relative;
+        }}
+
+        .bag-body {{
+            width: 40px;
+            height: 45px;
+            background: #10d9c4;
+            border-radius: 4px 4px 12px 12px;
+            position: absolute;
+            top: 12px;
+            left: 15px;
+            border: 3px solid #0891b2;
+            box-shadow: inset 0 2px 4px rgba(0,0,0,0.2);
+        }}
+
+        .bag-handles {{
+            position: absolute;
+            top: 0;
+            left: 15px;
+            width: 40px;
+            height: 20px;
+        }}
+
+        .bag-handle-left {{
+            width: 12px;
+            height: 16px;
+            background: transparent;
+            border: 3px solid #10d9c4;
+            border-radius: 50%;
+            position: absolute;
+            top: 0;
+            left: 2px;
+            border-bottom: none;
+        }}
+
+        .bag-handle-right {{
+            width: 12px;
+            height: 16px;
+            background: transparent;
+            border: 3px solid #10d9c4;
+            border-radius: 50%;
+            position: absolute;
+            top: 0;
+            right: 2px;
+            border-bottom: none;
+        }}
+
+        .bag-details {{
+            position: absolute;
+            top: 20px;
+            left: 20px;
+            width: 30px;
+            height: 30px;
+        }}
+
+        .bag-line {{
+            width: 25px;
+            height: 2px;
+            background: #0891b2;
+            margin: 6px 0;
+            border-radius: 1px;
+            opacity: 0.7;
+        }}
+        
+        /* Faucet Icon */
+        .faucet-icon {{
+            width: 90px;
+            height: 90px;
+            position: relative;
+        }}
+
+        .faucet-main {{
+            width: 35px;
+            height: 20px;
+            background: #10d9c4;
+            border-radius: 18px 18px 0 0;
+            position: absolute;
+            top: 22px;
+            left: 17px;
+            border: 3px solid #0891b2;
+            border-bottom: none;
+        }}
+
+        .faucet-spout {{
+            width: 22px;
+            height: 12px;
+            background: #10d9c4;
+            border-radius: 0 0 11px 11px;
+            position: absolute;
+            top: 32px;
+            left: 24px;
+            border: 3px solid #0891b2;
+            border-top: none;
+        }}
+
+        .faucet-lever {{
+            width: 8px;
+            height: 16px;
+            background: #10d9c4;
+            border-radius: 4px;
+            position: absolute;
+            top: 8px;
+            left: 31px;
+            border: 2px solid #0891b2;
+        }}
+
+        .faucet-lever::after {{
+            content: '';
+            width: 14px;
+            height: 4px;
+            background: #10d9c4;
+            border-radius: 2px;
+            position: absolute;
+            top: 3px;
+            left: -3px;
+            border: 2px solid #0891b2;
+        }}
+
+        .water-drops {{
+            position: absolute;
+            top: 46px;
+            left: 32px;
+        }}
+
+        .water-drop {{
+            width: 4px;
+            height: 6px;
+            background: #10d9c4;
+            border-radius: 50% 50% 50% 0;
+            transform: rotate(-45deg);
+            position: absolute;
+            border: 1px solid #0891b2;
+        }}
+
+        /* ĐÃ XÓA: Hoạt ảnh giọt nước */
+        .water-drop:nth-child(1) {{
+            top: 0;
+            left: 0;
+        }}
+
+        .water-drop:nth-child(2) {{
+            top: 8px;
+            left: 1px;
+        }}
+        
+        /* Factory Icon */
+        .factory-icon {{
+            width: 90px;
+            height: 90px;
+            position: relative;
+        }}
+
+        .factory-main {{
+            width: 45px;
+            height: 32px;
+            background: #10d9c4;
+            border-radius: 3px;
+            position: absolute;
+            bottom: 8px;
+            left: 12px;
+            border: 3px solid #0891b2;
+        }}
+
+        .factory-windows {{
+            position: absolute;
+            top: 6px;
+            left: 6px;
+            display: grid;
+            grid-template-columns: 1fr 1fr 1fr;
+            gap: 4px;
+            width: 30px;
+        }}
+
+        .factory-window {{
+            width: 6px;
+            height: 6px;
+            background: #0891b2;
+            border-radius: 1px;
+        }}
+
+        .factory-chimney1 {{
+            width: 8px;
+            height: 25px;
+            background: #10d9c4;
+            border-radius: 4px 4px 0 0;
+            position: absolute;
+            top: 5px;
+            left: 25px;
+            border: 3px solid #0891b2;
+            border-bottom: none;
+        }}
+
+        .factory-chimney2 {{
+            width: 6px;
+            height: 18px;
+            background: #10d9c4;
+            border-radius: 3px 3px 0 0;
+            position: absolute;
+            top: 12px;
+            left: 42px;
+            border: 2px solid #0891b2;
+            border-bottom: none;
+        }}
+
+        /* ĐÃ XÓA: Hoạt ảnh khói */
+        .smoke-cloud {{
+            position: absolute;
+            top: 0;
+            left: 27px;
+        }}
+
+        .smoke-puff {{
+            width: 4px;
+            height: 4px;
+            background: #10d9c4;
+            border-radius: 50%;
+            position: absolute;
+            opacity: 0.8;
+        }}
+
+        .smoke-puff:nth-child(1) {{ top: 2px; left: 0; }}
+        .smoke-puff:nth-child(2) {{ top: -2px; left: 3px; }}
+        .smoke-puff:nth-child(3) {{ top: -6px; left: 1px; }}
+        .smoke-puff:nth-child(4) {{ top: -9px; left: 4px; }}
+        .smoke-puff:nth-child(5) {{ top: -12px; left: 0px; }}
+        
+        .point-title {{
+            font-size: 2rem;
+            font-weight: 700;
+            color: white;
+            margin-bottom: 1.2rem;
+            letter-spacing: 1px;
+            text-transform: uppercase;
+        }}
+        
+        .point-description {{
+            font-size: 1.6rem;
+            color: rgba(255, 255, 255, 0.9);
+            line-height: 1.6;
+            max-width: 280px;
+            font-weight: 400;
+        }}
+        
+        @media (max-width: 768px) {{
+            .slide-container {{
+                padding: 2rem 1rem;
+            }}
+            
+            .main-title {{
+                font-size: 2rem;
+                margin-bottom: 3rem;
+                letter-spacing: 1px;
+            }}
+            
+            .content-grid {{
+                grid-template-columns: 1fr;
+                gap: 3rem;
+            }}
+            
+            .icon-circle {{
+                width: 120px;
+                height: 120px;
+            }}
+            
+            .point-title {{
+                font-size: 1.2rem;
+            }}
+            
+            .point-description {{
+                font-size: 1rem;
+                max-width: 280px;
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <h1 class="main-title">{title}</h1>
+        
+        <div class="content-grid">
+            <div class="point-column">
+                <div class="icon-circle">
+                    <div class="plastic-bag-icon">
+                        <div class="bag-body"></div>
+                        <div class="bag-handles">
+                            <div class="bag-handle-left"></div>
+                            <div class="bag-handle-right"></div>
+                        </div>
+                        <div class="bag-details">
+                            <div class="bag-line"></div>
+                            <div class="bag-line"></div>
+                            <div class="bag-line"></div>
+                        </div>
+                    </div>
+                </div>
+                <h3 class="point-title">{point1_title}</h3>
+                <p class="point-description">{point1_description}</p>
+            </div>
+            
+            <div class="point-column">
+                <div class="icon-circle">
+                    <div class="faucet-icon">
+                        <div class="faucet-main"></div>
+                        <div class="faucet-spout"></div>
+                        <div class="faucet-lever"></div>
+                        <div class="water-drops">
+                            <div class="water-drop"></div>
+                            <div class="water-drop"></div>
+                        </div>
+                    </div>
+                </div>
+                <h3 class="point-title">{point2_title}</h3>
+                <p class="point-description">{point2_description}</p>
+            </div>
+            
+            <div class="point-column">
+                <div class="icon-circle">
+                    <div class="factory-icon">
+                        <div class="factory-main"></div>
+                        <div class="factory-windows">
+                            <div class="factory-window"></div>
+                            <div class="factory-window"></div>
+                            <div class="factory-window"></div>
+                        </div>
+                        <div class="factory-chimney1"></div>
+                        <div class="factory-chimney2"></div>
+                        <div class="smoke-cloud">
+                            <div class="smoke-puff"></div>
+                            <div class="smoke-puff"></div>
+                            <div class="smoke-puff"></div>
+                            <div class="smoke-puff"></div>
+                            <div class="smoke-puff"></div>
+                        </div>
+                    </div>
+                </div>
+                <h3 class="point-title">{point3_title}</h3>
+                <p class="point-description">{point3_description}</p>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+
+
+def generate_elegant_points_slide(
+    main_title="Write Your Topic or Idea Here",
+    points=[
+        {
+            "title": "Add a Key Point",
+            "description": "Briefly elaborate on the topic you want to discuss."
+        },
+        {
+            "title": "Add a Key Point",
+            "description": "Briefly elaborate on the topic you want to discuss."
+        },
+        {
+            "title": "Add a Key Point",
+            "description": "Briefly elaborate on the topic you want to discuss."
+        },
+        {
+            "title": "Add a Key Point",
+            "description": "Briefly elaborate on the topic you want to discuss."
+        }
+    ],
+    font_family="'Be Vietnam Pro', sans-serif",
+    bg_color="#FDFCFB",
+    card_bg_color="#FFFFFF",
+    title_color="#4E443F",
+    text_color="#5D534D",
+    accent_color="#B99C6B"
+):
+    """
+    Generates an elegant points slide optimized for 1920x1080 screenshots
+    with an adjusted layout that emphasizes the content grid over the title.
+    """
+
+    icons_svg = [
+        """<svg class="point-icon" viewBox="0 0 24 24"><path fill="currentColor" d="M12 2A7 7 0 0 0 5 9c0 2.38 1.19 4.47 3 5.74V17a1 1 0 0 0 1 1h6a1 1 0 0 0 1-1v-2.26c1.81-1.27 3-3.36 3-5.74A7 7 0 0 0 12 2M9 21a1 1 0 0 0 1 1h4a1 1 0 0 0 1-1v-1H9z"></path></svg>""",
+        """<svg class="point-icon" viewBox="0 0 24 24"><path fill="currentColor" d="M12 2a10 10 0 1 0 10 10A10 10 0 0 0 12 2m0 18a8 8 0 1 1 8-8a8 8 0 0 1-8 8m0-14a6 6 0 1 0 6 6a6 6 0 0 0-6-6m0 10a4 4 0 1 1 4-4a4 4 0 0 1-4 4m0-6a2 2 0 1 0 2 2a2 2 0 0 0-2-2"></path></svg>""",
+        """<svg class="point-icon" viewBox="0 0 24 24"><path fill="currentColor" d="m3.5 18.49l6-6.01l4 4L22 6.92L20.59 5.51L13.5 12.5l-4-4l-7.5 7.5z"></path></svg>""",
+        """<svg class="point-icon" viewBox="0 0 24 24"><path fill="currentColor" d="M12 8a4 4 0 1 0 0 8a4 4 0 0 0 0-8m0 6a2 2 0 1 1 0-4a2 2 0 0 1 0 4m6.6-4.95l-.71-.71l-1.42 1.42l.71.71c.39.39.39 1.02 0 1.41l-1.42 1.42l-.71.71l1.42 1.42l.71-.71l1.42-1.42l-.71-.71c-.39-.39-.39-1.02 0-1.41M5.4 7.05L4 5.64l.71-.71l1.42 1.42l-.71.71c-.39.39-1.02.39-1.41 0l-1.42-1.42l-.71-.71L4 5.64M18.36 5.64l.71.71l1.42-1.42l-.71-.71a.996.996 0 0 0-1.41 0l-1.42 1.42l-.71.71l1.42 1.42zm-12.72 12.72l-.71-.71l-1.42 1.42l.71.71c.39.39.39 1.02 0 1.41l-1.42 1.42l-.71.71l1.42 1.42l.71-.71l1.42-1.42l-.71-.71c-.39-.39-.39-1.02 0-1.41Z"></path></svg>"""
+    ]
+
+    points_html = ""
+    for i, point in enumerate(points):
+        icon = icons_svg[i % len(icons_svg)]
+        points_html += f"""
+        <div class="point-card">
+            <div class="icon-wrapper">
+                {icon}
+            </div>
+            <div class="icon-divider"></div>
+            <h2 class="point-title">{point['title']}</h2>
+            <p class="point-description">{point['description']}</p>
+        </div>
+        """
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Elegant Points Slide - 1920x1080</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Be+Vietnam+Pro:wght@400;600;800&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; width: 1920px; height: 1080px; }}
+        body, html {{
+            height: 1080px;
+            width: 1920px;
+            font-family: {font_family};
+            background-color: {bg_color};
+            color: {text_color};
+            overflow: hidden;
+        }}
+
+        .slide-container {{
+            width: 1920px;
+            height: 1080px;
+            position: relative;
+            padding: 80px 120px;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            text-align: center;
+        }}
+
+        .main-title {{
+            font-size: 90px;
+            font-weight: 800;
+            color: {title_color};
+            margin-bottom: 80px;
+            line-height: 1.2;
+        }}
+
+        .points-grid {{
+            display: grid;
+            grid-template-columns: repeat(4, 1fr);
+            gap: 60px;
+            flex: 1;
+            align-items: center;
+        }}
+
+        .point-card {{
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+            background-color: {card_bg_color};
+            padding: 50px 40px;
+            border-radius: 20px;
+            border: 1px solid #EAE2D6;
+            box-shadow: 0 15px 40px rgba(0,0,0,0.1);
+            height: 100%;
+        }}
+        
+        .point-icon {{
+            width: 100px;
+            height: 100px;
+            color: {accent_color};
+        }}
+        
+        .icon-divider {{
+            width: 80px;
+            height: 5px;
+            background-color: {accent_color};
+            border-radius: 2px;
+            margin: 30px 0;
+        }}
+
+        .point-title {{
+            font-size: 42px;
+            font-weight: 600;
+            color: {title_color};
+            margin-bottom: 25px;
+            margin-top: 10px;
+
+            line-height: 1.3;
+        }}
+
+        .point-description {{
+            font-size: 26px;
+            line-height: 1.7;
+            text-align: center;
+        }}
+
+        /* Content wrapper for scaling */
+        .content-wrapper {{
+            position: absolute;
+            left: 50%;
+            top: 50%;
+            transform: translate(-50%, -50%);
+            width: 1920px;
+            height: 1080px;
+            overflow: visible;
+            background: inherit;
+        }}
+        
+        .outer-wrapper {{
+            padding: 0;
+            box-sizing: border-box;
+            width: 1920px;
+            height: 1080px;
+            overflow: hidden;
+        }}
+
+    </style>
+</head>
+<body>
+    <div class="outer-wrapper">
+        <div class="content-wrapper">
+            <div class="slide-container">
+                <h1 class="main-title">{main_title}</h1>
+                <div class="points-grid">
+                    {points_html}
+                </div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+#xong
+
+def generate_corporate_content_slide(
+    main_title="THIS IS A <span class='highlight'>SLIDE</span> TITLE",
+    list_items=[
+        { "title": "First Key Point", "description": "Here you have a list of items, presented in a modern, card-based format." },
+        { "title": "Second Key Point", "description": "And some text to elaborate on the second main idea of your slide." },
+        { "title": "Third Key Point", "description": "But remember not to overload your slides with too much content." }
+    ],
+    font_family="'Montserrat', 'Inter', sans-serif",
+    bg_color="#F8FAFC",
+    accent_panel_color="#6366F1",
+    title_color="#FFFFFF",
+    card_bg_color="#FFFFFF",
+    card_border_color="#E5E7EB",
+    list_title_color="#000000",
+    list_text_color="#333333"
+):
+    """
+    Generates a bright, professional, and STATIC content slide.
+    Hover effects have been removed.
+    """
+
+    list_html = ""
+    for i, item in enumerate(list_items):
+        number = f"{i+1:02d}"
+        list_html += f"""
+        <div class="list-item-card">
+            <div class="item-content">
+                <h3 class="list-item-title">{item['title']}</h3>
+                <p class="list-item-description">{item['description']}</p>
+            </div>
+        </div>
+        """
+
+    clip_path_svg = """
+    <svg width="0" height="0">
+      <defs>
+        <clipPath id="angled-title-panel" clipPathUnits="objectBoundingBox">
+          <polygon points="0 0, 1 0, 0.85 1, 0 1" />
+        </clipPath>
+      </defs>
+    </svg>
+    """
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Corporate Content Slide - Bright Design</title>
+    <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@400;700;800&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; }}
+        body, html {{
+            height: 100vh;
+            width: 100vw;
+            font-family: {font_family};
+            overflow: hidden;
+            background-color: {bg_color};
+        }}
+
+        .slide-container {{
+            width: 100%; height: 100%;
+            display: flex; position: relative;
+        }}
+
+        .accent-panel {{
+            flex: 1;
+            background-color: {accent_panel_color};
+            clip-path: url(#angled-title-panel);
+            display: flex;
+            align-items: center;
+            padding: 4rem;
+        }}
+
+        .slide-title {{
+            font-size: clamp(3.5rem, 6vw, 6rem);
+            font-weight: 800;
+            color: {title_color};
+            text-transform: uppercase;
+            max-width: 15ch;
+            line-height: 1.1;
+        }}
+        .highlight {{ color: {bg_color}; opacity: 0.8; }}
+        
+        .content-column {{
+            flex: 1.2;
+            padding: 4rem;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            gap: 2rem;
+        }}
+
+        .list-item-card {{
+            background: {card_bg_color};
+            border-radius: 1rem;
+            padding: 2.5rem;
+            position: relative;
+            overflow: hidden;
+            border: 1px solid {card_border_color};
+            box-shadow: 0 8px 25px rgba(0,0,0,0.07);
+            /* ĐÃ XÓA: transition */
+        }}
+        /* ĐÃ XÓA: khối :hover */
+
+        .item-number {{
+            position: absolute;
+            top: -1rem; right: 1rem;
+            font-size: 5rem;
+            font-weight: 800;
+            color: rgba(30, 41, 59, 0.05);
+            z-index: 1;
+        }}
+        .item-content {{ position: relative; z-index: 2; }}
+
+        .list-item-title {{
+            font-size: 2.2rem;
+            font-weight: 700;
+            color: {list_title_color};
+            margin-bottom: 1rem;
+        }}
+        .list-item-description {{
+            font-size: 1.6rem;
+            line-height: 1.6;
+            color: {list_text_color};
+        }}
+        
+        @media (max-width: 64rem) {{
+            .slide-container {{ flex-direction: column; }}
+            .accent-panel {{ flex: 0.5; width: 100%; clip-path: none; text-align: center; }}
+            .slide-title {{ max-width: none; }}
+            .content-column {{ flex: 1; width: 100%; }}
+        }}
+    </style>
+</head>
+<body>
+    {clip_path_svg}
+    <div class="slide-container">
+        <div class="accent-panel">
+            <h1 class="slide-title">{main_title}</h1>
+        </div>
+        <div class="content-column">
+            {list_html}
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+
+
+def generate_split_content_slide(
+    main_title="SPLIT YOUR CONTENT",
+    columns=[
+        { "icon_name": "bulb", "title": "Title One", "description": "Description for the first column goes here. Elaborate on your point with clear and concise text." },
+        { "icon_name": "target", "title": "Title Two", "description": "Description for the second column. This layout is perfect for comparing two ideas side-by-side." }
+    ],
+    font_family="'Montserrat', 'Inter', sans-serif",
+    bg_gradient_start="#0F172A",
+    bg_gradient_end="#1E293B",
+    title_color="#FFFFFF",
+    text_color="#D1D5DB",
+    accent_color="#22D3EE"
+):
+    """
+    Generates a high-tech, STATIC, dark-themed slide for comparing two points.
+    Hover effects have been removed.
+    """
+
+    icons = {
+        "bulb": '<path d="M12 2a7 7 0 0 0-7 7c0 2.38 1.19 4.47 3 5.74V17a1 1 0 0 0 1 1h6a1 1 0 0 0 1-1v-2.26c1.81-1.27 3-3.36 3-5.74A7 7 0 0 0 12 2M9 21a1 1 0 0 0 1 1h4a1 1 0 0 0 1-1v-1H9z"/>',
+        "target": '<path d="M12 2a10 10 0 1 0 10 10A10 10 0 0 0 12 2m0 18a8 8 0 1 1 8-8a8 8 0 0 1-8 8m0-14a6 6 0 1 0 6 6a6 6 0 0 0-6-6m0 10a4 4 0 1 1 4-4a4 4 0 0 1-4 4m0-6a2 2 0 1 0 2 2a2 2 0 0 0-2-2"/>'
+    }
+
+    columns_html = ""
+    for col in columns:
+        icon_svg = icons.get(col.get("icon_name"), "")
+        columns_html += f"""
+        <div class="column-card">
+            <div class="card-header">
+                <svg class="column-icon" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="currentColor">{icon_svg}</svg>
+            </div>
+            <h2 class="column-title">{col['title']}</h2>
+            <p class="column-description">{col['description']}</p>
+        </div>
+        """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Split Content Slide - High-Tech Design</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@400;700;800&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; width: 1920px; height: 1080px; }}
+        body, html {{
+            height: 1080px;
+            width: 1920px;
+            font-family: {font_family};
+            background: linear-gradient(135deg, {bg_gradient_start}, {bg_gradient_end});
+            color: {text_color};
+            overflow: hidden;
+        }}
+
+        .slide-container {{
+            width: 1920px;
+            height: 1080px;
+            position: relative;
+            padding: 80px 120px;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            text-align: center;
+        }}
+
+        .main-title {{
+            font-size: 90px;
+            font-weight: 800;
+            color: {title_color};
+            text-transform: uppercase;
+            text-align: center;
+            margin-bottom: 80px;
+            line-height: 1.2;
+        }}
+        .highlight {{ color: {accent_color}; }}
+        
+        .columns-grid {{
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            gap: 80px;
+            flex: 1;
+            align-items: center;
+        }}
+
+        .column-card {{
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+            background: rgba(255, 255, 255, 0.05);
+            backdrop-filter: blur(10px);
+            border: 1px solid rgba(255, 255, 255, 0.1);
+            border-top: 3px solid {accent_color};
+            box-shadow: 0 0 30px rgba(34, 211, 238, 0.1);
+            padding: 60px 50px;
+            border-radius: 20px;
+            height: 100%;
+        }}
+
+        .card-header {{
+            margin-bottom: 40px;
+            color: {accent_color};
+        }}
+        .column-icon {{
+            width: 80px;
+            height: 80px;
+        }}
+
+        .column-title {{
+            font-size: 48px;
+            font-weight: 700;
+            color: {title_color};
+            margin-bottom: 25px;
+            line-height: 1.3;
+        }}
+        .column-description {{
+            font-size: 28px;
+            line-height: 1.7;
+            color: {text_color};
+            text-align: center;
+        }}
+
+        /* Content wrapper for scaling */
+        .content-wrapper {{
+            position: absolute;
+            left: 50%;
+            top: 50%;
+            transform: translate(-50%, -50%);
+            width: 1920px;
+            height: 1080px;
+            overflow: visible;
+            background: inherit;
+        }}
+        
+        .outer-wrapper {{
+            padding: 0;
+            box-sizing: border-box;
+            width: 1920px;
+            height: 1080px;
+            overflow: hidden;
+        }}
+
+    </style>
+</head>
+<body>
+    <div class="outer-wrapper">
+        <div class="content-wrapper">
+            <div class="slide-container">
+                <h1 class="main-title">{main_title}</h1>
+                <div class="columns-grid">
+                    {columns_html}
+                </div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+
+
+
+
+def generate_corporate_multicolumn_slide(
+    main_title="IN TWO OR THREE<br><span class='highlight'>COLUMNS</span>",
+    columns=[
+        { "title": "Yellow", "description": "Is the color of gold, butter and ripe lemons." },
+        { "title": "Blue", "description": "Is the colour of the clear sky and the deep sea." },
+        { "title": "Red", "description": "Is the color of blood, and because of this it has historically been associated with sacrifice, danger and courage." }
+    ],
+    font_family="'Montserrat', 'Inter', sans-serif",
+    accent_color="#8B5CF6",
+    shadow_color="#7C3AED",
+    text_color="#4B5563",
+    icon_color="#D1D5DB"
+):
+    """
+    Generates a professional, STATIC content slide for presenting information in 2 or 3 columns.
+    Hover effects have been removed.
+    """
+    icon_svg = f"""<svg class="icon-svg" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="{icon_color}" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><circle cx="12" cy="12" r="10"></circle><line x1="2" y1="12" x2="22" y2="12"></line><path d="M12 2a15.3 15.3 0 0 1 4 10 15.3 15.3 0 0 1-4 10 15.3 15.3 0 0 1-4-10 15.3 15.3 0 0 1 4-10z"></path></svg>"""
+    columns_html = "".join([f"""<div class="info-column"><h2 class="column-title">{col['title']}</h2><p class="column-description">{col['description']}</p></div>""" for col in columns])
+    clip_path_svg = """<svg width="0" height="0"><defs><clipPath id="angled-multi-divider" clipPathUnits="objectBoundingBox"><polygon points="0.15 0, 1 0, 1 1, 0 1" /></clipPath></defs></svg>"""
+    grid_template_style = f"repeat({len(columns)}, 1fr)"
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8"><meta name="viewport" content="width=device-width, initial-scale=1.0"><title>Multi-Column Content Slide</title>
+    <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@400;600;700;800&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }} html {{ font-size: 18px; }}
+        body, html {{ height: 100vh; width: 100vw; font-family: {font_family}; overflow: hidden; background-color: #FFFFFF; }}
+        .slide-container {{ width: 100%; height: 100%; display: flex; position: relative; border-top: 6px solid #F3F4F6; }}
+        .content-area {{ flex: 2; padding: 4rem 5rem; display: flex; flex-direction: column; justify-content: center; }}
+        .color-panel {{ flex: 1; position: relative; background: linear-gradient(135deg, {accent_color} 0%, {shadow_color} 100%); clip-path: url(#angled-multi-divider); }}
+        .color-panel::before {{ content: ''; position: absolute; top: 0; left: 0; width: 100%; height: 100%; background: linear-gradient(135deg, {shadow_color} 0%, #6D28D9 100%); clip-path: url(#angled-multi-divider); transform: translateX(-2rem); z-index: -1; }}
+        .title-group {{ display: flex; align-items: center; gap: 1.5rem; margin-bottom: 5rem; }}
+        .icon-svg {{ width: 4.5rem; height: 4.5rem; flex-shrink: 0; filter: drop-shadow(0 2px 4px rgba(0,0,0,0.1)); }}
+        .slide-title {{ font-size: 3.5rem; font-weight: 800; color: {text_color}; text-transform: uppercase; line-height: 1.1; letter-spacing: 0.5px; }}
+        .highlight {{ color: {accent_color}; text-shadow: 0 2px 4px rgba(139, 92, 246, 0.3); }}
+        .columns-grid {{ display: grid; grid-template-columns: {grid_template_style}; gap: 3rem; padding-left: 5rem; }}
+        .info-column {{
+            position: relative; padding: 2.5rem 2rem;
+            background: linear-gradient(135deg, #F8FAFC 0%, #F1F5F9 100%);
+            border-radius: 16px; border: 1px solid #E2E8F0;
+            box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
+        }}
+        .info-column::before {{ content: ''; position: absolute; top: 0; left: 0; width: 100%; height: 4px; background: linear-gradient(90deg, {accent_color}, {shadow_color}); border-radius: 16px 16px 0 0; }}
+        .column-title {{ font-size: 2.2rem; font-weight: 700; color: {text_color}; margin-bottom: 1.2rem; text-transform: uppercase; letter-spacing: 0.5px; }}
+        .column-description {{ color: {text_color}; font-size: 1.6rem; line-height: 1.7; font-weight: 400; }}
+        @media (max-width: 1400px) {{ .slide-title {{ font-size: 3rem; }} .column-title {{ font-size: 1.9rem; }} .column-description {{ font-size: 1.4rem; }} }}
+        @media (max-width: 1200px) {{ .content-area {{ padding: 3rem 4rem; }} .columns-grid {{ gap: 2rem; padding-left: 3rem; }} }}
+    </style>
+</head>
+<body>
+    {clip_path_svg}
+    <div class="slide-container">
+        <div class="content-area"><div class="title-group">{icon_svg}<h1 class="slide-title">{main_title}</h1></div><div class="columns-grid">{columns_html}</div></div>
+        <div class="color-panel"></div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+
+
+
+def generate_corporate_grid_slide(
+    main_title="LET'S <span class='highlight'>REVIEW</span> SOME<br>CONCEPTS",
+    grid_items=[
+        { "title": "title", "description": "description." },
+        { "title": "title", "description": "description." },
+        { "title": "title", "description": "description." },
+        { "title": "title", "description": "description." },        
+        { "title": "title", "description": "description." },
+        { "title": "title", "description": "description." }
+    ],
+    font_family="'Montserrat', 'Inter', sans-serif",
+    accent_color="#22C55E",
+    shadow_color="#16A34A",
+    text_color="#6B7280",
+    icon_color="#D1D5DB"
+):
+    icon_svg = f"""
+    <svg class="icon-svg" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="{icon_color}" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+        <path d="M17 3a2.828 2.828 0 1 1 4 4L7.5 20.5 2 22l1.5-5.5L17 3z"></path>
+    </svg>
+    """
+
+    grid_items_html = ""
+    for item in grid_items:
+        grid_items_html += f"""
+        <div class="grid-item">
+            <h2 class="item-title">{item['title']}</h2>
+            <p class="item-description">{item['description']}</p>
+        </div>
+        """
+    
+    clip_path_svg = """
+    <svg width="0" height="0">
+      <defs>
+        <clipPath id="angled-grid-divider" clipPathUnits="objectBoundingBox">
+          <polygon points="0.15 0, 1 0, 1 1, 0 1" />
+        </clipPath>
+      </defs>
+    </svg>
+    """
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Grid Content Slide - Adjusted</title>
+    <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@400;700;800&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 18px; }}
+        body, html {{
+            height: 100vh;
+            width: 100vw;
+            font-family: {font_family};
+            overflow: hidden;
+            background-color: #FFFFFF;
+        }}
+
+        .slide-container {{
+            width: 100%; height: 100%;
+            display: flex; position: relative;
+            border-top: 4px solid #F3F4F6;
+        }}
+
+        .content-area {{
+            flex: 2.5;
+            padding: 5.5rem;
+            display: flex;
+            flex-direction: column;
+            justify-content: flex-start;
+        }}
+        
+        .color-panel {{
+            flex: 1;
+            position: relative;
+            background-color: {accent_color};
+            clip-path: url(#angled-grid-divider);
+        }}
+
+        .color-panel::before {{
+            content: ''; position: absolute;
+            top: 0; left: 0; width: 100%; height: 100%;
+            background-color: {shadow_color};
+            clip-path: url(#angled-grid-divider);
+            transform: translateX(-1.5rem);
+            z-index: -1;
+        }}
+        
+        .title-group {{ 
+            display: flex; 
+            align-items: center; 
+            gap: 2rem; 
+            margin-bottom: 5.5rem; 
+            padding-bottom: 0.5rem;
+        }}
+        .icon-svg {{ width: 4.5rem; height: 4.5rem; flex-shrink: 0; }}
+        .slide-title {{
+            font-size: 3.5rem;
+            font-weight: 800;
+            color: {text_color};
+            text-transform: uppercase;
+            line-height: 1.2;
+        }}
+        .highlight {{ color: {accent_color}; }}
+        
+        .content-grid {{
+            display: grid;
+            grid-template-columns: repeat(3, 1fr);
+            gap: 3.5rem 4rem;
+            padding-left: 6rem;
+        }}
+
+        .item-title {{ 
+            font-size: 2.75rem; /* TO HƠN */
+            font-weight: 800; 
+            color: {text_color}; 
+            margin-bottom: 1.25rem; 
+        }}
+        .item-description {{ 
+            color: {text_color}; 
+            font-size: 2rem;  /* TO HƠN */
+            line-height: 1.9; 
+        }}
+
+        @media (max-width: 64rem) {{
+            .content-grid {{ grid-template-columns: repeat(2, 1fr); }}
+        }}
+         @media (max-width: 48rem) {{
+            .slide-container {{ flex-direction: column; }}
+            .content-area, .color-panel {{ flex: none; width: 100%; }}
+            .content-area {{ height: 70vh; padding: 2rem; justify-content: center; }}
+            .color-panel {{ height: 30vh; clip-path: none; }}
+            .color-panel::before {{ display: none; }}
+            .content-grid {{ grid-template-columns: 1fr; padding-left: 0; text-align: center; }}
+            .title-group {{ justify-content: center; }}
+        }}
+    </style>
+</head>
+<body>
+    {clip_path_svg}
+    <div class="slide-container">
+        <div class="content-area">
+            <div class="title-group">
+                {icon_svg}
+                <h1 class="slide-title">{main_title}</h1>
+            </div>
+            <div class="content-grid">
+                {grid_items_html}
+            </div>
+        </div>
+        <div class="color-panel"></div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+
+
+# def generate_business_overview_slide(
+#     main_title="BUSINESS OVERVIEW",
+#     sections=[
+#         {
+#             "icon": "chart-analysis",
+#             "content": "Lorem ipsum dolor sit amet, consectetur adipiscing elit."
+#         },
+#         {
+#             "icon": "innovation",
+#             "content": "Lorem ipsum dolor sit amet, consectetur adipiscing elit."
+#         },
+#         {
+#             "icon": "growth",
+#             "content": "Lorem ipsum dolor sit amet, consectetur adipiscing elit."
+#         }
+#     ],
+#     left_bg_color="#1a4b8c",
+#     right_bg_color="#f8f9fa",
+#     title_color="#FFFFFF",
+#     icon_bg_color="#2a3f6b",
+#     icon_color="#FFFFFF",
+#     content_bg_color="#FFFFFF",
+#     content_text_color="#1a4b8c",
+#     font_family="'Inter', sans-serif",
+#     show_border=False,
+#     border_opacity=0.25,
+#     section_spacing="30px",
+#     icon_size="110px",
+#     custom_css=""
+# ):
+#     """
+#     Generate a professional business overview slide with icon-content sections layout.
+
+#     :param main_title: Main title text (10-25 characters), displayed on the left side
+#     :param sections: List of dictionaries with icon and content for each section,
+#                     or list of lists where first element is content and second is icon
+#     :param left_bg_color: Background color for the left title section (hex code)
+#     :param right_bg_color: Background color for the right content area (hex code)
+#     :param title_color: Color of the main title text (hex code)
+#     :param icon_bg_color: Background color for icon containers (hex code)
+#     :param icon_color: Color of the icons (hex code)
+#     :param content_bg_color: Background color for content text areas (hex code)
+#     :param content_text_color: Text color for content sections (hex code)
+#     :param title_font_size: Font size for the main title
+#     :param content_font_size: Font size for section content text
+#     :param font_family: Font family for all text elements
+#     :param show_border: Whether to show the dashed border frame
+#     :param border_opacity: Opacity of the border frame (0.0 to 1.0)
+#     :param section_spacing: Vertical spacing between content sections
+#     :param icon_size: Size of the icon containers
+#     :param custom_css: Additional custom CSS to be included
+#     :return: A string containing the HTML code for the slide
+#     """
+
+#     # Icon SVG definitions
+#     icons = {
+#         "chart-analysis": '''<svg viewBox="0 0 24 24" fill="currentColor" width="55" height="55">
+#             <path d="M3 3v18h18v-2H5V3H3zm4 14h2V9H7v8zm4 0h2V7h-2v10zm4 0h2v-4h-2v4zm3-12l-3 3-3-3-4 4-1.5-1.5L9 10l3-3 3 3 4-4z"/>
+#         </svg>''',
+#         "innovation": '''<svg viewBox="0 0 24 24" fill="currentColor" width="55" height="55">
+#             <path d="M9 21c0 .55.45 1 1 1h4c.55 0 1-.45 1-1v-1H9v1zm3-19C8.14 2 5 5.14 5 9c0 2.38 1.19 4.47 3 5.74V17c0 .55.45 1 1 1h6c.55 0 1-.45 1-1v-2.26c1.81-1.27 3-3.36 3-5.74 0-3.86-3.14-7-7-7zm2.85 11.1l-.85.6V16h-4v-2.3l-.85-.6C7.8 12.16 7 10.63 7 9c0-2.76 2.24-5 5-5s5 2.24 5 5c0 1.63-.8 3.16-2.15 4.1z"/>
+#             <circle cx="12" cy="9" r="1"/>
+#             <path d="M12 6v2m0 4v2m-3-3h2m4 0h2"/>
+#         </svg>''',
+#         "growth": '''<svg viewBox="0 0 24 24" fill="currentColor" width="55" height="55">
+#             <path d="M16 6l2.29 2.29-4.88 4.88-4-4L2 16.59 3.41 18l6-6 4 4 6.3-6.29L22 12V6h-6z"/>
+#             <path d="M5 19h2v2H5zm4 0h2v2H9zm4 0h2v2h-2z"/>
+#         </svg>'''
+#     }
+
+#     # Generate sections HTML
+#     sections_html = ""
+#     for i, section in enumerate(sections):
+#         # Mới: Kiểm tra section có phải là list hay không và xử lý tương ứng
+#         if isinstance(section, list):
+#             # Giả định dữ liệu dạng [content, icon]
+#             content = section[0] if len(section) > 0 else ""
+#             icon_name = section[1] if len(section) > 1 else "chart-analysis"
+#             icon_svg = icons.get(icon_name, icons["chart-analysis"])
+#         else:
+#             # Định dạng dictionary gốc
+#             content = section.get("content", "")
+#             icon_name = section.get("icon", "chart-analysis")
+#             icon_svg = icons.get(icon_name, icons["chart-analysis"])
+        
+#         sections_html += f'''
+#         <div class="content-section">
+#             <div class="icon-container">
+#                 {icon_svg}
+#             </div>
+#             <div class="text-container">
+#                 {content}
+#             </div>
+#         </div>
+#         '''
+
+#     html_code = f"""<!DOCTYPE html>
+# <html lang="en">
+# <head>
+#     <meta charset="UTF-8">
+#     <meta name="viewport" content="width=device-width, initial-scale=1.0">
+#     <title>{main_title}</title>
+#     <link href="https://fonts.googleapis.com/css2?family=Roboto:wght@300;400;700;900&display=swap" rel="stylesheet">
+#     <style>
+#         body, html {{
+#             margin: 0;
+#             padding: 0;
+#             height: 100%;
+#             width: 100%;
+#             font-family: {font_family};
+#             overflow: hidden;
+#         }}
+        
+#         .slide-container {{
+#             width: 100%;
+#             height: 100vh;
+#             display: flex;
+#             position: relative;
+#             background: linear-gradient(135deg, {right_bg_color} 0%, #e9ecef 100%);
+#         }}
+        
+#         .slide-border {{
+#             position: absolute;
+#             top: 45px;
+#             left: 45px;
+#             right: 45px;
+#             bottom: 45px;
+#             border: {("3px dashed rgba(26, 75, 140, " + str(border_opacity) + ")" if show_border else "none")};
+#             border-radius: 12px;
+#             pointer-events: none;
+#             z-index: 5;
+#         }}
+        
+#         .left-section {{
+#             width: 40%;
+#             background: linear-gradient(135deg, {left_bg_color} 0%, #0d2d5e 100%);
+#             color: {title_color};
+#             display: flex;
+#             align-items: center;
+#             justify-content: center;
+#             padding: 100px 60px;
+#             position: relative;
+#             z-index: 10;
+#             box-shadow: 8px 0 30px rgba(0, 0, 0, 0.2);
+#         }}
+        
+#         .title {{
+#             font-size: 6rem;
+#             font-weight: 900;
+#             line-height: 1.1;
+#             text-align: center;
+#             letter-spacing: 0.1em;
+#             text-shadow: 3px 3px 6px rgba(0, 0, 0, 0.3);
+#             text-transform: uppercase;
+#         }}
+        
+#         .right-section {{
+#             width: 60%;
+#             padding: 100px 80px;
+#             display: flex;
+#             flex-direction: column;
+#             justify-content: center;
+#             gap: 45px;
+#             position: relative;
+#             z-index: 10;
+#         }}
+        
+#         .content-section {{
+#             display: flex;
+#             align-items: stretch;
+#             box-shadow: 0 6px 20px rgba(0, 0, 0, 0.1);
+#             border-radius: 16px;
+#             overflow: hidden;
+#             min-height: 140px;
+#         }}
+        
+#         .icon-container {{
+#             width: {icon_size};
+#             min-width: {icon_size};
+#             background: linear-gradient(135deg, {icon_bg_color} 0%, #1a2942 100%);
+#             color: {icon_color};
+#             display: flex;
+#             align-items: center;
+#             justify-content: center;
+#             padding: 30px;
+#         }}
+        
+#         .icon-container svg {{
+#             filter: drop-shadow(0 3px 6px rgba(0, 0, 0, 0.25));
+#         }}
+        
+#         .text-container {{
+#             flex: 1;
+#             background: linear-gradient(135deg, {content_bg_color} 0%, #fafbfc 100%);
+#             color: {content_text_color};
+#             padding: 35px 45px;
+#             font-size: 2.5rem;
+#             line-height: 1.7;
+#             display: flex;
+#             align-items: center;
+#             font-weight: 500;
+#         }}
+        
+#         /* Decorative elements */
+#         .left-section::before {{
+#             content: '';
+#             position: absolute;
+#             top: 0;
+#             right: -35px;
+#             width: 70px;
+#             height: 100%;
+#             background: linear-gradient(90deg, transparent 0%, {left_bg_color} 50%, transparent 100%);
+#             z-index: -1;
+#             opacity: 0.6;
+#         }}
+        
+#         .left-section::after {{
+#             content: '';
+#             position: absolute;
+#             top: 50%;
+#             left: 50%;
+#             transform: translate(-50%, -50%);
+#             width: 130%;
+#             height: 130%;
+#             background: radial-gradient(circle, rgba(255,255,255,0.12) 0%, transparent 70%);
+#             pointer-events: none;
+#         }}
+        
+#         @media (max-width: 768px) {{
+#             .slide-container {{
+#                 flex-direction: column;
+#             }}
+            
+#             .left-section, .right-section {{
+#                 width: 100%;
+#             }}
+            
+#             .left-section {{
+#                 height: 30%;
+#                 padding: 30px 20px;
+#             }}
+            
+#             .right-section {{
+#                 height: 70%;
+#                 padding: 30px 20px;
+#             }}
+            
+#             .title {{
+#                 font-size: 2.5rem;
+#             }}
+            
+#             .content-section {{
+#                 margin-bottom: 10px !important;
+#             }}
+            
+#             .icon-container {{
+#                 width: 60px;
+#                 min-width: 60px;
+#                 padding: 15px;
+#             }}
+            
+#             .icon-container svg {{
+#                 width: 30px;
+#                 height: 30px;
+#             }}
+            
+#             .text-container {{
+#                 padding: 15px 20px;
+#                 font-size: 0.85rem;
+#             }}
+#         }}
+        
+#         @media (max-width: 480px) {{
+#             .slide-border {{
+#                 top: 15px;
+#                 left: 15px;
+#                 right: 15px;
+#                 bottom: 15px;
+#             }}
+            
+#             .title {{
+#                 font-size: 2rem;
+#             }}
+            
+#             .text-container {{
+#                 font-size: 0.8rem;
+#                 padding: 12px 15px;
+#             }}
+#         }}
+        
+#         {custom_css}
+#     </style>
+# </head>
+# <body>
+#     <div class="slide-container">
+#         <!-- Border frame -->
+#         <div class="slide-border"></div>
+        
+#         <!-- Left section with title -->
+#         <div class="left-section">
+#             <h1 class="title">{main_title}</h1>
+#         </div>
+        
+#         <!-- Right section with content -->
+#         <div class="right-section">
+#             {sections_html}
+#         </div>
+#     </div>
+# </body>
+# </html>"""
+
+#     return html_code
+
+
+
+def generate_vision_mission_slide(
+    vision_title="VISION",
+    mission_title="MISSION",
+    vision_points=[
+        "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
+        "Lorem ipsum dolor sit amet, consectetur adipiscing elit."
+    ],
+    mission_points=[
+        "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
+        "Lorem ipsum dolor sit amet, consectetur adipiscing elit."
+    ],
+    vision_bg_color="#1a4b8c",
+    mission_bg_color="#4a7bc8",
+    text_color="#FFFFFF",
+    vision_number_color="rgba(74, 123, 200, 0.3)",
+    mission_number_color="rgba(26, 75, 140, 0.3)",
+    font_family="'Inter', sans-serif",
+    show_border=True,
+    border_color="#1a4b8c",
+    border_opacity=0.4,
+    show_geometric_pattern=True,
+    pattern_opacity=0.1,
+    custom_css=""
+):
+    """
+    Generate a professional vision and mission slide with split layout and numbered points.
+
+    :param vision_title: Title for the vision section (5-15 characters)
+    :param mission_title: Title for the mission section (5-15 characters)
+    :param vision_points: List of vision statements or list of lists where first element is vision text
+    :param mission_points: List of mission statements or list of lists where first element is mission text
+    :param vision_bg_color: Background color for the vision section (hex code)
+    :param mission_bg_color: Background color for the mission section (hex code)
+    :param text_color: Color of all text elements (hex code)
+    :param title_font_size: Font size for section titles
+    :param content_font_size: Font size for content text
+    :param number_font_size: Font size for large background numbers
+    :param vision_number_color: Color of background numbers in vision section (rgba)
+    :param mission_number_color: Color of background numbers in mission section (rgba)
+    :param font_family: Font family for all text elements
+    :param show_border: Whether to show the dashed border frame
+    :param border_color: Color of the border frame (hex code)
+    :param border_opacity: Opacity of the border frame (0.0 to 1.0)
+    :param show_geometric_pattern: Whether to show geometric background pattern
+    :param pattern_opacity: Opacity of the geometric pattern (0.0 to 1.0)
+    :param custom_css: Additional custom CSS to be included
+    :return: A string containing the HTML code for the slide
+    """
+
+    # Generate vision points HTML
+    vision_html = ""
+    for i, point in enumerate(vision_points, 1):
+        # Xử lý point dạng list hoặc string
+        point_text = point[0] if isinstance(point, list) and len(point) > 0 else point
+        
+        vision_html += f'''
+        <div class="content-point">
+            <div class="point-number">{i:02d}</div>
+            <div class="point-text">{point_text}</div>
+        </div>
+        '''
+
+    # Generate mission points HTML
+    mission_html = ""
+    for i, point in enumerate(mission_points, 1):
+        # Xử lý point dạng list hoặc string
+        point_text = point[0] if isinstance(point, list) and len(point) > 0 else point
+        
+        mission_html += f'''
+        <div class="content-point">
+            <div class="point-number">{i:02d}</div>
+            <div class="point-text">{point_text}</div>
+        </div>
+        '''
+
+    # Generate background numbers for vision
+    vision_bg_numbers = ""
+    for i in range(1, len(vision_points) + 1):
+        vision_bg_numbers += f'<div class="bg-number bg-number-{i}">{i:02d}</div>'
+
+    # Generate background numbers for mission
+    mission_bg_numbers = ""
+    for i in range(1, len(mission_points) + 1):
+        mission_bg_numbers += f'<div class="bg-number bg-number-{i}">{i:02d}</div>'
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{vision_title} & {mission_title}</title>
+    <link href="https://fonts.googleapis.com/css2?family=Roboto:wght@300;400;700&display=swap" rel="stylesheet">
+    <style>
+        body, html {{
+            margin: 0;
+            padding: 0;
+            height: 100%;
+            width: 100%;
+            font-family: {font_family};
+            overflow: hidden;
+            background: linear-gradient(135deg, #e8f4f8 0%, #d1e7dd 100%);
+        }}
+        
+        .slide-container {{
+            width: 100%;
+            height: 100vh;
+            display: flex;
+            position: relative;
+            padding: 40px;
+            box-sizing: border-box;
+        }}
+        
+        .slide-border {{
+            position: absolute;
+            top: 20px;
+            left: 20px;
+            right: 20px;
+            bottom: 20px;
+            border: {("2px dashed " + border_color if show_border else "none")};
+            opacity: {border_opacity};
+            pointer-events: none;
+            z-index: 5;
+        }}
+        
+        .section {{
+            width: 50%;
+            position: relative;
+            padding: 60px 40px;
+            color: {text_color};
+            overflow: hidden;
+            display: flex;
+            flex-direction: column;
+        }}
+        
+        .vision-section {{
+            background-color: {vision_bg_color};
+            margin-right: 10px;
+            margin-bottom: 10px;
+        }}
+        
+        .mission-section {{
+            background-color: {mission_bg_color};
+            margin-left: 10px;
+            margin-bottom: 10px;
+        }}
+        
+        .section-title {{
+            font-size: 6rem;
+            font-weight: 700;
+            margin-bottom: 80px;
+            text-align: center;
+            letter-spacing: 0.08em;
+            z-index: 10;
+            position: relative;
+            text-shadow: 0 2px 4px rgba(0, 0, 0, 0.2);
+        }}
+        
+        .content-point {{
+            display: flex;
+            align-items: flex-start;
+            margin-bottom: 35px;
+            position: relative;
+            z-index: 10;
+        }}
+        
+        .point-number {{
+            font-size: 2.4rem;
+            font-weight: 700;
+            margin-right: 25px;
+            min-width: 65px;
+            opacity: 0.95;
+        }}
+        
+        .point-text {{
+            font-size: 1.8rem;
+            line-height: 1.7;
+            flex: 1;
+            font-weight: 400;
+        }}
+        
+        /* Background numbers */
+        .bg-number {{
+            position: absolute;
+            font-size: 8rem;
+            font-weight: 900;
+            z-index: 1;
+            pointer-events: none;
+            user-select: none;
+        }}
+        
+        .vision-section .bg-number {{
+            color: {vision_number_color};
+        }}
+        
+        .mission-section .bg-number {{
+            color: {mission_number_color};
+        }}
+        
+        .bg-number-1 {{
+            top: 20%;
+            right: -20px;
+        }}
+        
+        .bg-number-2 {{
+            bottom: 20%;
+            left: -20px;
+        }}
+        
+        .bg-number-3 {{
+            top: 50%;
+            right: -30px;
+            transform: translateY(-50%);
+        }}
+        
+        .bg-number-4 {{
+            bottom: 10%;
+            right: -25px;
+        }}
+        
+        /* Geometric pattern */
+        .geometric-pattern {{
+            position: absolute;
+            top: 0;
+            left: 0;
+            right: 0;
+            bottom: 0;
+            opacity: {pattern_opacity if show_geometric_pattern else 0};
+            z-index: 2;
+            background-image: 
+                linear-gradient(45deg, transparent 40%, rgba(255,255,255,0.1) 50%, transparent 60%),
+                linear-gradient(-45deg, transparent 40%, rgba(255,255,255,0.1) 50%, transparent 60%);
+            background-size: 60px 60px, 80px 80px;
+            background-position: 0 0, 30px 30px;
+        }}
+        
+        /* Decorative triangles */
+        .triangle {{
+            position: absolute;
+            width: 0;
+            height: 0;
+            opacity: 0.1;
+            z-index: 3;
+        }}
+        
+        .triangle-1 {{
+            border-left: 60px solid transparent;
+            border-right: 60px solid transparent;
+            border-bottom: 100px solid rgba(255, 255, 255, 0.2);
+            top: 10%;
+            left: 10%;
+            transform: rotate(15deg);
+        }}
+        
+        .triangle-2 {{
+            border-left: 40px solid transparent;
+            border-right: 40px solid transparent;
+            border-bottom: 80px solid rgba(255, 255, 255, 0.2);
+            bottom: 15%;
+            right: 15%;
+            transform: rotate(-25deg);
+        }}
+        
+        @media (max-width: 768px) {{
+            .slide-container {{
+                flex-direction: column;
+                padding: 20px;
+            }}
+            
+            .section {{
+                width: 100%;
+                height: 50%;
+                padding: 30px 20px;
+            }}
+            
+            .vision-section {{
+                margin-right: 0;
+                margin-bottom: 10px;
+            }}
+            
+            .mission-section {{
+                margin-left: 0;
+                margin-top: 10px;
+            }}
+            
+            .section-title {{
+                font-size: 3.5rem;
+                margin-bottom: 30px;
+            }}
+            
+            .point-text {{
+                font-size: 1.4rem;
+            }}
+            
+            .bg-number {{
+                font-size: 4rem;
+            }}
+            
+            .content-point {{
+                margin-bottom: 20px;
+            }}
+        }}
+        
+        @media (max-width: 480px) {{
+            .section-title {{
+                font-size: 2.8rem;
+            }}
+            
+            .point-text {{
+                font-size: 1.2rem;
+            }}
+            
+            .point-number {{
+                font-size: 1.8rem;
+                margin-right: 18px;
+                min-width: 40px;
+            }}
+        }}
+        
+        {custom_css}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <!-- Border frame -->
+        <div class="slide-border"></div>
+        
+        <!-- Vision Section -->
+        <div class="section vision-section">
+            <div class="geometric-pattern"></div>
+            {vision_bg_numbers}
+            <div class="triangle triangle-1"></div>
+            
+            <h1 class="section-title">{vision_title}</h1>
+            <div class="content-area">
+                {vision_html}
+            </div>
+        </div>
+        
+        <!-- Mission Section -->
+        <div class="section mission-section">
+            <div class="geometric-pattern"></div>
+            {mission_bg_numbers}
+            <div class="triangle triangle-2"></div>
+            
+            <h1 class="section-title">{mission_title}</h1>
+            <div class="content-area">
+                {mission_html}
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    return html_code
+
+
+def generate_strategic_goals_slide(
+    main_title="STRATEGIC GOALS",
+    goals=[
+        {
+            "number": "01",
+            "content": "Lorem ipsum dolor sit amet, consectetur adipiscing elit."
+        },
+        {
+            "number": "02",
+            "content": "Lorem ipsum dolor sit amet, consectetur adipiscing elit."
+        },
+        {
+            "number": "03",
+            "content": "Lorem ipsum dolor sit amet, consectetur adipiscing elit."
+        }
+    ],
+    bg_image="skyscrapers.jpg",
+    bg_overlay_color="rgba(26, 75, 140, 0.85)",
+    title_color="#FFFFFF",
+    number_bg_color="#1a4b8c",
+    number_text_color="#FFFFFF",
+    content_bg_color="#FFFFFF",
+    content_text_color="#1a4b8c",
+    font_family="'Inter', sans-serif",
+    show_border=True,
+    border_opacity=0.4,
+    number_circle_size="80px",
+    content_padding="20px",
+    custom_css=""
+):
+    """
+    Generate a professional strategic goals slide with numbered points and background image.
+
+    :param main_title: Main title text (10-25 characters), displayed on the left side
+    :param goals: List of dictionaries with number and content for each strategic goal,
+                 or list of lists where first element is content and second is number
+    :param bg_image: Background image URL or path (skyscraper/city image recommended)
+    :param bg_overlay_color: Color overlay for the background image (rgba with transparency)
+    :param title_color: Color of the main title text (hex code)
+    :param number_bg_color: Background color for the number circles (hex code)
+    :param number_text_color: Text color for the numbers (hex code)
+    :param content_bg_color: Background color for content text boxes (hex code)
+    :param content_text_color: Text color for content (hex code)
+    :param title_font_size: Font size for the main title
+    :param number_font_size: Font size for the numbers
+    :param content_font_size: Font size for content text
+    :param font_family: Font family for all text elements
+    :param show_border: Whether to show the dashed border frame
+    :param border_opacity: Opacity of the border frame (0.0 to 1.0)
+    :param number_circle_size: Size of the circular number containers
+    :param content_padding: Padding inside content boxes
+    :param custom_css: Additional custom CSS to be included
+    :return: A string containing the HTML code for the slide
+    """
+
+    # Generate goals HTML
+    goals_html = ""
+    for i, goal in enumerate(goals):
+        # Xử lý goal dạng list hoặc dictionary
+        if isinstance(goal, list):
+            # Nếu goal là list thì giả định [content, number]
+            if len(goal) >= 2:
+                # Kiểm tra loại dữ liệu của phần tử đầu tiên
+                if isinstance(goal[0], str) and not goal[0].isdigit():
+                    content = goal[0]
+                    number = goal[1] if len(goal) > 1 and goal[1] else f"{i+1:02d}"
+                else:
+                    number = goal[0] if goal[0] else f"{i+1:02d}"
+                    content = goal[1] if len(goal) > 1 else ""
+            else:
+                content = goal[0] if len(goal) > 0 else ""
+                number = f"{i+1:02d}"
+        else:
+            # Đối với dictionary, sử dụng get() như trước
+            number = goal.get("number", f"{i+1:02d}")
+            content = goal.get("content", "")
+        
+        goals_html += f'''
+        <div class="goal-item">
+            <div class="number-circle">
+                <span>{number}</span>
+            </div>
+            <div class="content-box">
+                <div class="content-text">{content}</div>
+            </div>
+        </div>
+        '''
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{main_title}</title>
+    <link href="https://fonts.googleapis.com/css2?family=Roboto:wght@300;400;700&display=swap" rel="stylesheet">
+    <style>
+        body, html {{
+            margin: 0;
+            padding: 0;
+            height: 100%;
+            width: 100%;
+            font-family: {font_family};
+            overflow: hidden;
+        }}
+        
+        .slide-container {{
+            width: 100%;
+            height: 100vh;
+            position: relative;
+            background-image: url('{bg_image}');
+            background-size: cover;
+            background-position: center;
+            padding: 40px;
+            box-sizing: border-box;
+        }}
+        
+        .bg-overlay {{
+            position: absolute;
+            top: 0;
+            left: 0;
+            width: 100%;
+            height: 100%;
+            background-color: {bg_overlay_color};
+            z-index: 1;
+        }}
+        
+        .slide-border {{
+            position: absolute;
+            top: 20px;
+            left: 20px;
+            right: 20px;
+            bottom: 20px;
+            border: {("2px dashed rgba(255, 255, 255, " + str(border_opacity) + ")" if show_border else "none")};
+            pointer-events: none;
+            z-index: 5;
+        }}
+        
+        .content-wrapper {{
+            position: relative;
+            z-index: 10;
+            display: flex;
+            height: 100%;
+        }}
+        
+        .title-section {{
+            width: 40%;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+        }}
+        
+        .main-title {{
+            font-size: 4.5rem;
+            font-weight: 700;
+            color: {title_color};
+            line-height: 1.1;
+            text-transform: uppercase;
+            letter-spacing: 0.05em;
+            text-shadow: 0 2px 4px rgba(0, 0, 0, 0.3);
+        }}
+        
+        .goals-section {{
+            width: 60%;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            gap: 20px;
+        }}
+        
+        .goal-item {{
+            display: flex;
+            align-items: center;
+        }}
+        
+        .number-circle {{
+            width: {number_circle_size};
+            height: {number_circle_size};
+            min-width: {number_circle_size};
+            background-color: {number_bg_color};
+            border-radius: 50%;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            margin-right: 20px;
+            z-index: 20;
+            position: relative;
+            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);
+        }}
+        
+        .number-circle span {{
+            color: {number_text_color};
+            font-size: 2.5rem;
+            font-weight: 700;
+        }}
+        
+        .content-box {{
+            flex: 1;
+            background-color: {content_bg_color};
+            border-radius: 8px;
+            padding: {content_padding};
+            padding-left: {content_padding};
+            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.15);
+            z-index: 10;
+            position: relative;
+        }}
+        
+        .content-text {{
+            color: {content_text_color};
+            font-size: 0.9rem;
+            line-height: 1.5;
+        }}
+        
+        @media (max-width: 768px) {{
+            .content-wrapper {{
+                flex-direction: column;
+            }}
+            
+            .title-section, .goals-section {{
+                width: 100%;
+            }}
+            
+            .title-section {{
+                height: 30%;
+                align-items: flex-start;
+                justify-content: center;
+            }}
+            
+            .goals-section {{
+                height: 70%;
+            }}
+            
+            .main-title {{
+                font-size: 2.5rem;
+                text-align: center;
+                margin-top: 20px;
+            }}
+            
+            .number-circle {{
+                width: 60px;
+                height: 60px;
+                min-width: 60px;
+                margin-right: 15px;
+            }}
+            
+            .number-circle span {{
+                font-size: 1.8rem;
+            }}
+            
+            .content-box {{
+                padding: 15px;
+            }}
+            
+            .content-text {{
+                font-size: 0.8rem;
+            }}
+        }}
+        
+        {custom_css}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <!-- Background overlay -->
+        <div class="bg-overlay"></div>
+        
+        <!-- Border frame -->
+        <div class="slide-border"></div>
+        
+        <!-- Content -->
+        <div class="content-wrapper">
+            <!-- Title section -->
+            <div class="title-section">
+                <h1 class="main-title">{main_title}</h1>
+            </div>
+            
+            <!-- Goals section -->
+            <div class="goals-section">
+                {goals_html}
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    return html_code
+
+
+
+
+def generate_service_roadmap_slide(
+    main_title="SERVICE ROADMAP",
+    roadmap_items=[
+        {
+            "title": "Phase 1",
+            "content": "Lorem ipsum dolor sit amet, consectetur adipiscing elit."
+        },
+        {
+            "title": "Phase 2", 
+            "content": "Lorem ipsum dolor sit amet, consectetur adipiscing elit."
+        },
+        {
+            "title": "Phase 3",
+            "content": "Lorem ipsum dolor sit amet, consectetur adipiscing elit."
+        },
+        {
+            "title": "Phase 4",
+            "content": "Lorem ipsum dolor sit amet, consectetur adipiscing elit."
+        }
+    ],
+    bg_gradient_start="#4A90E2",
+    bg_gradient_end="#2E5BBA",
+    title_color="#FFFFFF",
+    card_bg_color="#FFFFFF",
+    card_text_color="#2E5BBA",
+    card_title_color="#1A4480",
+    font_family="'Inter', sans-serif",
+    show_border=True,
+    border_color="rgba(255, 255, 255, 0.3)",
+    show_decorative_triangles=True,
+    triangle_color="rgba(255, 255, 255, 0.1)",
+    card_border_radius="20px",
+    card_padding="25px",
+    card_shadow="0 8px 24px rgba(0, 0, 0, 0.15)",
+    custom_css=""
+):
+    """
+    Generate a professional service roadmap slide with gradient background and decorative elements.
+
+    :param main_title: Main title text (10-30 characters), displayed at the top center
+    :param roadmap_items: List of dictionaries with title and content for each roadmap phase,
+                         or list of lists where first element is title and second is content
+    :param bg_gradient_start: Starting color of the background gradient (hex code)
+    :param bg_gradient_end: Ending color of the background gradient (hex code)
+    :param title_color: Color of the main title text (hex code)
+    :param card_bg_color: Background color for content cards (hex code)
+    :param card_text_color: Text color for card content (hex code)
+    :param card_title_color: Text color for card titles (hex code)
+    :param title_font_size: Font size for the main title
+    :param card_title_font_size: Font size for card titles
+    :param card_content_font_size: Font size for card content text
+    :param font_family: Font family for all text elements
+    :param show_border: Whether to show the dashed border frame
+    :param border_color: Color of the border frame (rgba with transparency)
+    :param show_decorative_triangles: Whether to show decorative triangle elements
+    :param triangle_color: Color of the decorative triangles (rgba with transparency)
+    :param card_border_radius: Border radius for content cards
+    :param card_padding: Padding inside content cards
+    :param card_shadow: Box shadow for content cards
+    :param custom_css: Additional custom CSS to be included
+    :return: A string containing the HTML code for the slide
+    """
+
+    # Generate roadmap items HTML
+    items_html = ""
+    for i, item in enumerate(roadmap_items):
+        # Xử lý item dạng list hoặc dictionary
+        if isinstance(item, list):
+            # Giả định dữ liệu dạng [title, content]
+            title = item[0] if len(item) > 0 else f"Phase {i+1}"
+            content = item[1] if len(item) > 1 else ""
+        else:
+            # Định dạng dictionary gốc
+            title = item.get("title", f"Phase {i+1}")
+            content = item.get("content", "")
+            
+        items_html += f'''
+        <div class="roadmap-card">
+            <h3 class="card-title">{title}</h3>
+            <div class="card-content">{content}</div>
+        </div>
+        '''
+
+    # Generate decorative triangles
+    triangles_html = ""
+    if show_decorative_triangles:
+        triangles_html = '''
+        <!-- Top triangles -->
+        <div class="triangle triangle-top-left"></div>
+        <div class="triangle triangle-top-right"></div>
+        
+        <!-- Bottom triangles -->
+        <div class="triangle triangle-bottom-left"></div>
+        <div class="triangle triangle-bottom-right"></div>
+        '''
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{main_title}</title>
+    <link href="https://fonts.googleapis.com/css2?family=Roboto:wght@300;400;700&display=swap" rel="stylesheet">
+    <style>
+        body, html {{
+            margin: 0;
+            padding: 0;
+            height: 100%;
+            width: 100%;
+            font-family: {font_family};
+            overflow: hidden;
+        }}
+        
+        .slide-container {{
+            width: 100%;
+            height: 100vh;
+            position: relative;
+            background: linear-gradient(135deg, {bg_gradient_start} 0%, {bg_gradient_end} 100%);
+            padding: 40px;
+            box-sizing: border-box;
+            display: flex;
+            flex-direction: column;
+        }}
+        
+        .slide-border {{
+            position: absolute;
+            top: 20px;
+            left: 20px;
+            right: 20px;
+            bottom: 20px;
+            border: {("2px dashed " + border_color if show_border else "none")};
+            pointer-events: none;
+            z-index: 5;
+        }}
+        
+        .triangle {{
+            position: absolute;
+            width: 0;
+            height: 0;
+            z-index: 2;
+        }}
+        
+        .triangle-top-left {{
+            top: 0;
+            left: 0;
+            border-left: 120px solid {triangle_color};
+            border-bottom: 120px solid transparent;
+        }}
+        
+        .triangle-top-right {{
+            top: 0;
+            right: 0;
+            border-right: 120px solid {triangle_color};
+            border-bottom: 120px solid transparent;
+        }}
+        
+        .triangle-bottom-left {{
+            bottom: 0;
+            left: 0;
+            border-left: 120px solid {triangle_color};
+            border-top: 120px solid transparent;
+        }}
+        
+        .triangle-bottom-right {{
+            bottom: 0;
+            right: 0;
+            border-right: 120px solid {triangle_color};
+            border-top: 120px solid transparent;
+        }}
+        
+        .content-wrapper {{
+            position: relative;
+            z-index: 10;
+            height: 100%;
+            display: flex;
+            flex-direction: column;
+        }}
+        
+        .title-section {{
+            text-align: center;
+            margin-bottom: 60px;
+            margin-top: 40px;
+        }}
+        
+        .main-title {{
+            font-size: 6rem;
+            font-weight: 700;
+            color: {title_color};
+            letter-spacing: 0.1em;
+            text-shadow: 0 2px 4px rgba(0, 0, 0, 0.3);
+            margin: 0;
+        }}
+        
+        .roadmap-grid {{
+            flex: 1;
+            display: grid;
+            grid-template-columns: repeat(2, 1fr);
+            gap: 30px;
+            max-width: 1200px;
+            margin: 0 auto;
+            width: 100%;
+        }}
+        
+        .roadmap-card {{
+            background-color: {card_bg_color};
+            border-radius: {card_border_radius};
+            padding: {card_padding};
+            box-shadow: {card_shadow};
+            transition: transform 0.3s ease, box-shadow 0.3s ease;
+            position: relative;
+            overflow: hidden;
+        }}
+        
+        .roadmap-card:hover {{
+            transform: translateY(-5px);
+            box-shadow: 0 12px 32px rgba(0, 0, 0, 0.2);
+        }}
+        
+        .roadmap-card::before {{
+            content: '';
+            position: absolute;
+            top: 0;
+            left: 0;
+            right: 0;
+            height: 4px;
+            background: linear-gradient(90deg, {bg_gradient_start}, {bg_gradient_end});
+        }}
+        
+        .card-title {{
+            font-size: 3rem;
+            font-weight: 700;
+            color: {card_title_color};
+            margin: 0 0 15px 0;
+            text-transform: uppercase;
+            letter-spacing: 0.05em;
+        }}
+        
+        .card-content {{
+            font-size: 2.1rem;
+            color: {card_text_color};
+            line-height: 1.6;
+            margin: 0;
+        }}
+        
+        @media (max-width: 768px) {{
+            .slide-container {{
+                padding: 20px;
+            }}
+            
+            .main-title {{
+                font-size: 2.5rem;
+            }}
+            
+            .roadmap-grid {{
+                grid-template-columns: 1fr;
+                gap: 20px;
+            }}
+            
+            .roadmap-card {{
+                padding: 20px;
+            }}
+            
+            .card-title {{
+                font-size: 1rem;
+            }}
+            
+            .card-content {{
+                font-size: 0.8rem;
+            }}
+            
+            .triangle {{
+                display: none;
+            }}
+        }}
+        
+        @media (max-width: 480px) {{
+            .title-section {{
+                margin-bottom: 30px;
+                margin-top: 20px;
+            }}
+            
+            .main-title {{
+                font-size: 2rem;
+            }}
+        }}
+        
+        {custom_css}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <!-- Decorative triangles -->
+        {triangles_html}
+        
+        <!-- Border frame -->
+        <div class="slide-border"></div>
+        
+        <!-- Content -->
+        <div class="content-wrapper">
+            <!-- Title section -->
+            <div class="title-section">
+                <h1 class="main-title">{main_title}</h1>
+            </div>
+            
+            <!-- Roadmap grid -->
+            <div class="roadmap-grid">
+                {items_html}
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    return html_code
+
+
+
+
+def generate_financial_projections_slide_dark(
+    # Main title
+    main_title="FINANCIAL PROJECTIONS",
+    
+    # Card content
+    cards=[
+        {
+            "title": "REVENUE FORECASTS",
+            "content": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. Suspendisse quis enim pretium, bibendum ante ullamcorper, tincidunt augue. Nunc sed lorem aliquam, malesuada lectus eu, placerat lorem. Proin at aliquet sapien, vitae elementum mi."
+        },
+        {
+            "title": "EXPENSE PROJECTIONS", 
+            "content": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. Suspendisse quis enim pretium, bibendum ante ullamcorper, tincidunt augue. Nunc sed lorem aliquam, malesuada lectus eu, placerat lorem. Proin at aliquet sapien, vitae elementum mi."
+        },
+        {
+            "title": "FUNDING REQUIREMENTS",
+            "content": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. Suspendisse quis enim pretium, bibendum ante ullamcorper, tincidunt augue. Nunc sed lorem aliquam, malesuada lectus eu, placerat lorem. Proin at aliquet sapien, vitae elementum mi."
+        }
+    ],
+    
+    # Colors - Dark Theme
+    background_color="#1E3A8A",  # Deep blue
+    main_title_color="#FFFFFF",
+    card_background_color="rgba(255, 255, 255, 0.95)",
+    card_title_color="#1E3A8A",
+    card_content_color="#374151",
+    border_color="rgba(255, 255, 255, 0.3)",
+    
+    # Typography
+    font_family="'Inter', sans-serif",
+    main_title_font_weight="700",
+    main_title_letter_spacing="0.05em",
+    card_title_font_weight="700",
+    card_title_letter_spacing="0.02em",
+    card_content_line_height="1.6",
+    card_content_font_weight="400",
+    
+    # Layout
+    slide_padding="60px",
+    main_title_margin_bottom="80px",
+    cards_gap="40px",
+    card_padding="40px",
+    card_border_radius="12px",
+    card_shadow="0 8px 32px rgba(0, 0, 0, 0.2)",
+    card_title_margin_bottom="25px",
+    
+    # Border frame
+    show_border_frame=True,
+    frame_border_style="3px dashed",
+    frame_border_color="rgba(255, 255, 255, 0.4)",
+    frame_border_radius="12px",
+    frame_padding="80px",
+    
+    # Responsive
+    mobile_title_font_size="2.8rem",
+    mobile_card_title_font_size="1.4rem",
+    mobile_card_content_font_size="0.9rem",
+    mobile_cards_gap="20px",
+    mobile_card_padding="25px",
+    mobile_slide_padding="30px",
+    mobile_frame_padding="40px",
+    
+    # Additional styling
+    additional_css=""
+):
+    """
+    Generate an HTML slide for financial projections with dark blue theme and three cards.
+    
+    :param main_title: Main title displayed at the top of the slide
+    :param cards: List of dictionaries with 'title' and 'content' keys for each card,
+                 or list of lists where first element is title and second is content
+    :param background_color: Solid background color (dark blue)
+    :param main_title_color: Color of the main title text
+    :param card_background_color: Background color of the cards
+    :param card_title_color: Color of the card titles
+    :param card_content_color: Color of the card content text
+    :param border_color: Color of the border elements
+    :param font_family: Font family for all text elements
+    :param main_title_font_size: Font size of the main title
+    :param main_title_font_weight: Font weight of the main title
+    :param main_title_letter_spacing: Letter spacing of the main title
+    :param card_title_font_size: Font size of the card titles
+    :param card_title_font_weight: Font weight of the card titles
+    :param card_title_letter_spacing: Letter spacing of the card titles
+    :param card_content_font_size: Font size of the card content
+    :param card_content_line_height: Line height of the card content
+    :param card_content_font_weight: Font weight of the card content
+    :param slide_padding: Padding around the entire slide
+    :param main_title_margin_bottom: Bottom margin below the main title
+    :param cards_gap: Gap between the cards
+    :param card_padding: Internal padding within each card
+    :param card_border_radius: Border radius of the cards
+    :param card_shadow: Box shadow of the cards
+    :param card_title_margin_bottom: Bottom margin below card titles
+    :param show_border_frame: Whether to show dashed border frame
+    :param frame_border_style: Style of the border frame
+    :param frame_border_color: Color of the border frame
+    :param frame_border_radius: Border radius of the frame
+    :param frame_padding: Padding inside the border frame
+    :param mobile_title_font_size: Main title font size on mobile
+    :param mobile_card_title_font_size: Card title font size on mobile
+    :param mobile_card_content_font_size: Card content font size on mobile
+    :param mobile_cards_gap: Gap between cards on mobile
+    :param mobile_card_padding: Card padding on mobile
+    :param mobile_slide_padding: Slide padding on mobile
+    :param mobile_frame_padding: Frame padding on mobile
+    :param additional_css: Additional CSS to include
+    :return: A string containing the HTML code for the slide
+    """
+    
+    # Generate cards HTML
+    cards_html = ""
+    for card in cards:
+        # Handle both dictionary and list formats
+        if isinstance(card, list):
+            # Assume list format: [title, content]
+            title = card[0] if len(card) > 0 else ""
+            content = card[1] if len(card) > 1 else ""
+        else:
+            # Original dictionary format
+            title = card.get('title', '')
+            content = card.get('content', '')
+        
+        cards_html += f"""
+        <div class="financial-card">
+            <h2 class="card-title">{title}</h2>
+            <p class="card-content">{content}</p>
+        </div>
+        """
+    
+    # Generate border frame
+    frame_class = "content-frame" if show_border_frame else "content-frame no-border"
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{main_title}</title>
+    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css" rel="stylesheet">
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body, html {{
+            height: 100%;
+            font-family: {font_family};
+            overflow: hidden;
+        }}
+        
+        .slide-container {{
+            width: 100vw;
+            height: 100vh;
+            background-color: {background_color};
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            align-items: center;
+            padding: {slide_padding};
+            position: relative;
+            box-sizing: border-box;
+        }}
+        
+        .content-frame {{
+            width: 100%;
+            max-width: 1400px;
+            padding: {frame_padding};
+            position: relative;
+            text-align: center;
+        }}
+        
+        .content-frame:not(.no-border) {{
+            border: {frame_border_style} {frame_border_color};
+            border-radius: {frame_border_radius};
+        }}
+        
+        .main-title {{
+            font-size: 4.5rem;
+            font-weight: {main_title_font_weight};
+            color: {main_title_color};
+            margin-bottom: {main_title_margin_bottom};
+            letter-spacing: {main_title_letter_spacing};
+            text-shadow: 0 2px 4px rgba(0, 0, 0, 0.3);
+        }}
+        
+        .cards-container {{
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+            gap: {cards_gap};
+            width: 100%;
+        }}
+        
+        .financial-card {{
+            background-color: {card_background_color};
+            padding: {card_padding};
+            border-radius: {card_border_radius};
+            box-shadow: {card_shadow};
+            text-align: left;
+            transition: transform 0.3s ease, box-shadow 0.3s ease;
+            backdrop-filter: blur(10px);
+        }}
+        
+        .financial-card:hover {{
+            transform: translateY(-5px);
+            box-shadow: 0 12px 40px rgba(0, 0, 0, 0.3);
+        }}
+        
+        .card-title {{
+            font-size: 2.3rem;
+            font-weight: {card_title_font_weight};
+            color: {card_title_color};
+            margin-bottom: {card_title_margin_bottom};
+            letter-spacing: {card_title_letter_spacing};
+            text-align: center;
+        }}
+        
+        .card-content {{
+            font-size: 1.5rem;
+            line-height: {card_content_line_height};
+            color: {card_content_color};
+            font-weight: {card_content_font_weight};
+            margin: 0;
+        }}
+        
+        /* Responsive Design */
+        @media (max-width: 1200px) {{
+            .cards-container {{
+                grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
+                gap: 30px;
+            }}
+            
+            .main-title {{
+                font-size: 3.5rem;
+            }}
+            
+            .content-frame {{
+                padding: 60px;
+            }}
+        }}
+        
+        @media (max-width: 768px) {{
+            .slide-container {{
+                padding: {mobile_slide_padding};
+            }}
+            
+            .content-frame {{
+                padding: {mobile_frame_padding};
+            }}
+            
+            .main-title {{
+                font-size: {mobile_title_font_size};
+                margin-bottom: 50px;
+            }}
+            
+            .cards-container {{
+                grid-template-columns: 1fr;
+                gap: {mobile_cards_gap};
+            }}
+            
+            .financial-card {{
+                padding: {mobile_card_padding};
+            }}
+            
+            .card-title {{
+                font-size: {mobile_card_title_font_size};
+            }}
+            
+            .card-content {{
+                font-size: {mobile_card_content_font_size};
+            }}
+        }}
+        
+        @media (max-width: 480px) {{
+            .main-title {{
+                font-size: 2.2rem;
+                margin-bottom: 40px;
+            }}
+            
+            .card-title {{
+                font-size: 1.2rem;
+            }}
+            
+            .card-content {{
+                font-size: 0.85rem;
+            }}
+            
+            .financial-card {{
+                padding: 20px;
+            }}
+            
+            .content-frame {{
+                padding: 30px 20px;
+            }}
+        }}
+        
+        {additional_css}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="{frame_class}">
+            <h1 class="main-title">{main_title}</h1>
+            
+            <div class="cards-container">
+                {cards_html}
+            </div>
+        </div>
+    </div>
+    
+    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>
+</body>
+</html>"""
+    
+    return html_code
+
+
+
+def generate_minimalist_tech_list_slide(
+    title="This is a slide title",
+    list_items=[
+        "Here you have a list of items",
+        "And some text",
+        "But remember not to overload your slides with content"
+    ],
+    concluding_text="Your audience will listen to you or read the content, but won’t do both.",
+    font_family="'Nunito', 'Inter', sans-serif",
+    sky_top_color="#ABB0EA",
+    sky_bottom_color="#A2CFED",
+    grid_dot_color="rgba(0, 0, 0, 0.05)",
+    text_color="#1F2937",
+    accent_color="#6366F1",
+    font_size_multiplier=1.0,
+    title_font_size=None,
+    list_item_font_size=None,
+    concluding_text_font_size=None,
+    custom_css="",
+    **kwargs
+):
+    """
+    Generates a bright, clean, and STATIC tech-themed list slide.
+    Animated rockets have been removed.
+    """
+    
+    bullet_svg = f"""
+    <svg class="bullet-icon" viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg">
+        <circle cx="12" cy="12" r="9" stroke="{accent_color}" stroke-width="2" fill="#FFFFFF" />
+        <circle cx="12" cy="12" r="4" fill="{accent_color}" />
+    </svg>
+    """
+    
+    list_items_html = "".join([f'<li class="list-item">{bullet_svg}<span>{item}</span></li>' for item in list_items])
+    
+    # ĐÃ XÓA: Phần tạo HTML cho tên lửa.
+    rockets_html = ""
+
+    # Logic sinh font-size giữ nguyên
+    if title_font_size: title_style = f"font-size: {title_font_size};"
+    else: title_style = f"font-size: clamp(calc(4rem * {font_size_multiplier}), calc((5vw + 1.5rem) * {font_size_multiplier}), calc(6.5rem * {font_size_multiplier}));"
+    if list_item_font_size: list_item_style = f"font-size: {list_item_font_size};"
+    else: list_item_style = f"font-size: clamp(calc(1.8rem * {font_size_multiplier}), calc((2vw + 0.5rem) * {font_size_multiplier}), calc(2.4rem * {font_size_multiplier}));"
+    if concluding_text_font_size: concluding_text_style = f"font-size: {concluding_text_font_size};"
+    else: concluding_text_style = f"font-size: clamp(calc(1.8rem * {font_size_multiplier}), calc((2vw + 0.5rem) * {font_size_multiplier}), calc(2.4rem * {font_size_multiplier}));"
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Bright Tech List Slide</title>
+    <link href="https://fonts.googleapis.com/css2?family=Nunito:wght@400;700;800&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        body, html {{
+            height: 100vh; width: 100vw; font-family: {font_family};
+            overflow: hidden;
+            background-color: {sky_top_color};
+            background-image: 
+                radial-gradient(circle, {grid_dot_color} 1px, transparent 1px),
+                linear-gradient(to bottom, {sky_top_color}, {sky_bottom_color});
+            background-size: 25px 25px, 100% 100%;
+        }}
+        .slide-container {{
+            width: 100%; height: 100%; display: flex;
+            align-items: center; position: relative;
+        }}
+        
+        /* ĐÃ XÓA: Toàn bộ CSS cho tên lửa và animation peek */
+
+        .accent-border {{
+            position: absolute;
+            left: 4rem; top: 4rem; bottom: 4rem;
+            width: 5px;
+            background: {accent_color};
+            border-radius: 3px;
+        }}
+        
+        .content-wrapper {{
+            z-index: 10;
+            padding: 4rem 4rem 4rem 8rem;
+            max-width: 70%;
+        }}
+        
+        .slide-title {{
+            {title_style}
+            font-weight: 800; color: {text_color};
+            margin-bottom: 3rem;
+        }}
+        .item-list {{ list-style: none; margin-bottom: 2.5rem; }}
+        .list-item {{
+            display: flex; align-items: flex-start;
+            {list_item_style}
+            color: {text_color}; line-height: 1.8;
+            margin-bottom: 1.5rem;
+        }}
+        .bullet-icon {{
+            width: 1.2em; height: 1.2em;
+            margin-right: 1.2rem; margin-top: 0.2em;
+            flex-shrink: 0;
+        }}
+        .concluding-text {{
+            {concluding_text_style}
+            color: {text_color}; line-height: 1.8;
+            border-left: 4px solid {accent_color};
+            padding-left: 1.5rem;
+            font-style: italic;
+        }}
+        
+        @media (max-width: 768px) {{
+            .content-wrapper {{ max-width: 90%; padding: 4rem 2rem; }}
+            .accent-border {{ left: 1.5rem; top: 2rem; bottom: 2rem; }}
+            .slide-container {{ justify-content: center; text-align: center; }}
+            .list-item, .concluding-text {{ text-align: left; }}
+        }}
+        {custom_css}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="accent-border"></div>
+        {rockets_html}
+        <div class="content-wrapper">
+            <h1 class="slide-title">{title}</h1>
+            <ul class="item-list">
+                {list_items_html}
+            </ul>
+            <p class="concluding-text">{concluding_text}</p>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+
+
+
+
+
+def generate_split_layout_list_slide(
+    main_title="YOUR MAIN TOPIC",
+    points=[
+        {
+            "title": "ADD A KEY POINT",
+            "description": "Briefly elaborate on this key point to provide more details and context for your audience."
+        },
+        {
+            "title": "ADD A KEY POINT", 
+            "description": "Briefly elaborate on this key point to provide more details and context for your audience."
+        },
+        {
+            "title": "ADD A KEY POINT",
+            "description": "Briefly elaborate on this key point to provide more details and context for your audience."
+        }
+    ],
+    font_family="'Be Vietnam Pro', sans-serif",
+    left_bg_color="#6F6254",
+    right_bg_color="#F5F0E8",
+    light_text_color="#F5F0E8",
+    dark_text_color="#6F6254",
+    divider_color="#D3CFC7",
+    # Font control parameters
+    main_title_font_size=None,
+    point_title_font_size=None,
+    point_description_font_size=None,
+    custom_css=""
+):
+    """
+    Generates a professional Split-Layout List slide, offering both responsive and fixed font size controls.
+    """
+
+    points_html = ""
+    for point in points:
+        points_html += f"""
+        <div class="point-item">
+            <h2 class="point-title">{point['title']}</h2>
+            <p class="point-description">{point['description']}</p>
+        </div>
+        """
+
+    # Generate CSS for font sizes based on parameters
+    # Main Title Style
+    if main_title_font_size:
+        main_title_style = f"font-size: {main_title_font_size};"
+    else:
+        main_title_style = f"font-size: clamp(calc(2.5rem * 1.3), calc(6vw * 1.3), calc(4rem * 1.3));"
+    
+    # Point Title Style
+    if point_title_font_size:
+        point_title_style = f"font-size: {point_title_font_size};"
+    else:
+        point_title_style = f"font-size: clamp(calc(1.1rem * 1.3), calc((1.5vw + 0.2rem) * 1.3), calc(1.35rem * 1.3));"
+
+    # Point Description Style
+    if point_description_font_size:
+        point_desc_style = f"font-size: {point_description_font_size};"
+    else:
+        point_desc_style = f"font-size: clamp(calc(1rem * 1.3), calc((1vw + 0.1rem) * 1.3), calc(1.1rem * 1.3));"
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Split-Layout List Slide</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Be+Vietnam+Pro:wght@400;900&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; }}
+        body, html {{
+            height: 100vh; width: 100vw;
+            font-family: {font_family}; overflow: hidden;
+        }}
+        .slide-container {{ width: 100%; height: 100%; display: flex; }}
+        .left-column {{
+            flex: 1; max-width: 35%;
+            background-color: {left_bg_color}; color: {light_text_color};
+            padding: 3rem; display: flex; flex-direction: column;
+            justify-content: center; align-items: center; text-align: center;
+        }}
+        .right-column {{
+            flex: 2; background-color: {right_bg_color}; color: {dark_text_color};
+            padding: 4rem 3rem; overflow-y: auto;
+        }}
+        .points-list {{ display: flex; flex-direction: column; gap: 2rem; }}
+        .point-item:not(:last-child) {{
+            padding-bottom: 2rem; border-bottom: 1px solid {divider_color};
+        }}
+
+        /* Font size styles */
+        .main-title {{
+            {main_title_style}
+            font-weight: 900; line-height: 1.2; text-transform: uppercase;
+        }}
+        .point-title {{
+            {point_title_style}
+            font-weight: 900; text-transform: uppercase; margin-bottom: 0.75rem;
+        }}
+        .point-description {{
+            {point_desc_style}
+            line-height: 1.6; font-weight: 400; max-width: 45rem;
+        }}
+        
+        @media (max-width: 768px) {{
+            .slide-container {{ flex-direction: column; overflow-y: auto; }}
+            .left-column {{ max-width: 100%; width: 100%; flex: none; height: auto; min-height: 12rem; padding: 2rem; }}
+            .right-column {{ flex: none; width: 100%; padding: 2.5rem 2rem; }}
+        }}
+        
+        {custom_css}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="left-column">
+            <h1 class="main-title">{main_title}</h1>
+        </div>
+        <div class="right-column">
+            <div class="points-list">
+                {points_html}
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+
+
+
+def generate_reference_slide(
+    main_title="CONTENT",
+    reference_items=[
+        {
+            "title": "PRIMARY REFERENCE TITLE",
+            "description": "Presentations are communication tools that can be used as demonstrations, lectures, speeches, reports, and more. They serve various purposes and are effective tools."
+        },
+        {
+            "title": "SECONDARY REFERENCE TITLE",
+            "description": "Presentations are communication tools that can be used as demonstrations, lectures, speeches, reports, and more. They serve various purposes and are effective tools."
+        }
+    ],
+    # ĐÃ THAY ĐỔI: Đặt một URL ảnh mặc định chất lượng cao, hoạt động tốt
+    image_url="https://images.unsplash.com/photo-1543269865-cbf427effbad?q=80&w=2070&auto=format&fit=crop",
+    font_family="'Be Vietnam Pro', sans-serif",
+    bg_color="#FFFFFF",
+    text_color="#1F2937",
+    accent_color="#3B82F6"
+):
+    """
+    Generates a professional reference slide with large fonts, a default high-quality image,
+    and elegant decorative elements.
+    """
+
+    items_html = ""
+    for item in reference_items:
+        items_html += f"""
+        <div class="reference-item">
+            <h2 class="reference-title">{item['title']}</h2>
+            <p class="reference-description">{item['description']}</p>
+        </div>
+        """
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Reference Slide - Enhanced</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Be+Vietnam+Pro:wght@400;700;900&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; }}
+        body, html {{
+            height: 100vh;
+            width: 100vw;
+            font-family: {font_family};
+            overflow: hidden;
+        }}
+
+        .slide-container {{
+            width: 100%;
+            height: 100%;
+            display: flex;
+        }}
+
+        .text-column {{
+            flex: 0.6; 
+            background-color: {bg_color};
+            color: {text_color};
+            padding: 5rem 6rem;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+        }}
+
+        .image-column {{
+            flex: 0.4;
+            background-image: url('{image_url}');
+            background-size: cover;
+            background-position: center;
+        }}
+
+        .main-title {{
+            font-size: 5rem;
+            font-weight: 900;
+            text-transform: uppercase;
+            margin-bottom: 1.5rem;
+        }}
+        
+        .title-divider {{
+            width: 100px;
+            height: 5px;
+            background: {accent_color};
+            border: none;
+            border-radius: 3px;
+            margin-bottom: 4rem;
+        }}
+
+        .references-list {{
+            display: flex;
+            flex-direction: column;
+            gap: 3rem;
+        }}
+
+        .reference-title {{
+            font-size: 2.4rem;
+            font-weight: 700;
+            text-transform: uppercase;
+            margin-bottom: 1rem;
+        }}
+
+        .reference-description {{
+            font-size: 2rem;
+            line-height: 1.7;
+            font-weight: 400;
+            max-width: 45rem;
+        }}
+        
+        @media (max-width: 64rem) {{
+             .text-column {{ padding: 4rem; }}
+        }}
+
+        @media (max-width: 48rem) {{
+            .slide-container {{
+                flex-direction: column-reverse; 
+                overflow-y: auto;
+                height: auto;
+                min-height: 100vh;
+            }}
+            .text-column, .image-column {{
+                flex: none;
+                width: 100%;
+            }}
+            .image-column {{
+                height: 20rem; 
+            }}
+             .text-column {{
+                padding: 3rem 2rem;
+             }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="text-column">
+            <h1 class="main-title">{main_title}</h1>
+            <hr class="title-divider" />
+            <div class="references-list">
+                {items_html}
+            </div>
+        </div>
+        <div class="image-column"></div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+
+
+
+
+
+def generate_icon_list_slide(
+    main_title="Write your topic or idea",
+    points=[
+        { "icon_name": "megaphone", "title": "Add a main point", "description": "Briefly elaborate on what you want to discuss." },
+        { "icon_name": "star", "title": "Add a main point", "description": "Briefly elaborate on what you want to discuss." },
+        { "icon_name": "thumbs-up", "title": "Add a main point", "description": "Briefly elaborate on what you want to discuss." }
+    ],
+    font_family="'Montserrat', 'Inter', sans-serif",
+    bg_color="#FFFFFF",
+    main_title_color="#111827",
+    point_title_color="#1F2937",
+    point_description_color="#4B5563",
+    accent_color="#3B82F6"
+):
+    """
+    Generates an icon list slide optimized for 1920x1080 screenshots
+    with an adjusted layout that emphasizes the list of points over the main title.
+    """
+
+    icons = {
+        "megaphone": '<path d="M12 8V5c0-1.1-.9-2-2-2H6c-1.1 0-2 .9-2 2v3H2l-1.99 9.95A2 2 0 002 20h12c1.1 0 2-.9 2-2v-3h2v-4h-4zm-2 0H6V5h4v3z"/>',
+        "star": '<path d="M12 17.27L18.18 21l-1.64-7.03L22 9.24l-7.19-.61L12 2 9.19 8.63 2 9.24l5.46 4.73L5.82 21z"/>',
+        "thumbs-up": '<path d="M1 21h4V9H1v12zm22-11c0-1.1-.9-2-2-2h-6.31l.95-4.57.03-.32c0-.41-.17-.79-.44-1.06L14.17 1 7.59 7.59C7.22 7.95 7 8.45 7 9v10c0 1.1.9 2 2 2h9c.83 0 1.54-.5 1.84-1.22l3.02-7.05c.09-.23.14-.47.14-.73v-2z"/>'
+    }
+
+    points_html = ""
+    for point in points:
+        icon_svg_path = icons.get(point['icon_name'], "")
+        points_html += f"""
+        <div class="point-item">
+            <div class="icon-circle" style="background-color: {accent_color};">
+                <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="white" width="50px" height="50px">
+                    {icon_svg_path}
+                </svg>
+            </div>
+            <div class="text-content">
+                <h2 class="point-title" style="color: {point_title_color};">{point['title']}</h2>
+                <p class="point-description" style="color: {point_description_color};">{point['description']}</p>
+            </div>
+        </div>
+        """
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Icon List Slide - 1920x1080</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@400;700;800&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; width: 1920px; height: 1080px; }}
+        body, html {{
+            height: 1080px;
+            width: 1920px;
+            font-family: {font_family};
+            background-color: {bg_color};
+            overflow: hidden;
+        }}
+
+        .slide-container {{
+            width: 1920px;
+            height: 1080px;
+            position: relative;
+            display: grid;
+            grid-template-columns: 1fr 1.2fr;
+            align-items: center;
+            gap: 80px;
+            padding: 80px 120px;
+        }}
+
+        .title-column {{
+            padding-right: 40px;
+        }}
+
+        .main-title {{
+            font-size: 100px;
+            font-weight: 800;
+            line-height: 1.2;
+            color: {main_title_color};
+            margin-bottom: 30px;
+        }}
+
+        .title-divider {{
+            height: 8px;
+            width: 120px;
+            background-color: {accent_color};
+            border-radius: 4px;
+            border: none;
+        }}
+
+        .points-column {{
+            display: flex;
+            flex-direction: column;
+            gap: 60px;
+        }}
+
+        .point-item {{
+            display: flex;
+            align-items: center;
+            gap: 40px;
+        }}
+
+        .icon-circle {{
+            width: 130px;
+            height: 130px;
+            border-radius: 50%;
+            flex-shrink: 0;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            box-shadow: 0 6px 20px {accent_color}33;
+        }}
+
+        .point-title {{
+            font-size: 48px;
+            font-weight: 700;
+            margin-bottom: 15px;
+        }}
+
+        .point-description {{
+            font-size: 32px;
+            line-height: 1.8;
+            font-weight: 400;
+        }}
+
+        /* Content wrapper for scaling */
+        .content-wrapper {{
+            position: absolute;
+            left: 50%;
+            top: 50%;
+            transform: translate(-50%, -50%);
+            width: 1920px;
+            height: 1080px;
+            overflow: visible;
+            background: inherit;
+        }}
+        
+        .outer-wrapper {{
+            padding: 0;
+            box-sizing: border-box;
+            width: 1920px;
+            height: 1080px;
+            overflow: hidden;
+        }}
+
+    </style>
+</head>
+<body>
+    <div class="outer-wrapper">
+        <div class="content-wrapper">
+            <div class="slide-container">
+                <div class="title-column">
+                    <h1 class="main-title">{main_title}</h1>
+                    <hr class="title-divider" />
+                </div>
+                <div class="points-column">
+                    {points_html}
+                </div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+
+def generate_flexible_columns_slide(
+    main_title="IN TWO OR THREE COLUMNS",
+    columns=[
+        {
+            "title": "Yellow",
+            "description": "Is the color of gold, butter and ripe lemons. In the spectrum of visible light, yellow is found between green and orange."
+        },
+        {
+            "title": "Blue",
+            "description": "Is the colour of the clear sky and the deep sea. It is located between violet and green on the optical spectrum."
+        },
+        {
+            "title": "Red",
+            "description": "Is the color of blood, and because of this it has historically been associated with sacrifice, danger and courage."
+        }
+    ],
+    font_family_heading="'Patrick Hand', cursive",
+    font_family_body="'Lato', sans-serif",
+    text_color="#34495E",
+    bg_url="https://www.toptal.com/designers/subtlepatterns/uploads/paper.png"
+):
+    """
+    Generates a slide with content positioned higher on the page to create more empty space at the bottom.
+    """
+
+    columns_html = ""
+    for column in columns:
+        columns_html += f"""
+        <div class="column">
+            <h2 class="column-title">{column['title']}</h2>
+            <p class="column-description">{column['description']}</p>
+        </div>
+        """
+
+    grid_columns_style = f"repeat({len(columns)}, 1fr)"
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Minimalist Columns Slide - Positioned Higher</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Lato&family=Patrick+Hand&display=swap" rel="stylesheet">
+
+    <style>
+        * {{
+            box-sizing: border-box;
+            margin: 0;
+            padding: 0;
+        }}
+
+        /* OVERRIDE EDITOR BACKGROUND - HIGHEST SPECIFICITY */
+        div[style*="background: white"], 
+        div[style*="background: #FFFFFF"],
+        div[style*="background-color: white"],
+        div[style*="background-color: #FFFFFF"],
+        #canvas,
+        [data-bg*="#FFFFFF"] {{
+            background-color: #F8F8F8 !important;
+            background-image: 
+                linear-gradient(to bottom, transparent 98%, #E0E0E0 98%),
+                url('{bg_url}') !important;
+            background-repeat: repeat, repeat !important;
+            background-position: top, top !important;
+            background-size: 3.5rem 3.5rem, auto !important;
+        }}
+
+        body#body.body, html#html.html {{
+            height: 100vh !important;
+            width: 100vw !important;
+            font-family: {font_family_body} !important;
+            color: {text_color} !important;
+            overflow: hidden !important;
+            background-color: #F8F8F8 !important;
+            background-image: 
+                linear-gradient(to bottom, transparent 98%, #E0E0E0 98%),
+                url('{bg_url}') !important;
+            background-repeat: repeat, repeat !important;
+            background-position: top, top !important;
+            background-size: 3.5rem 3.5rem, auto !important;
+        }}
+
+        .slide-container {{
+            width: 100% !important;
+            height: 100% !important;
+            display: flex !important;
+            flex-direction: column !important;
+            justify-content: flex-start !important;
+            align-items: center !important;
+            padding: 3rem 3rem !important;
+            background: transparent !important;
+        }}
+
+        .main-title {{
+            font-family: 'Patrick Hand', cursive;
+            font-size: clamp(4rem, 8vw, 5rem); 
+            text-transform: uppercase;
+            margin-bottom: 10rem; 
+            font-weight: 400;
+            text-align: center;
+        }}
+        .content-grid {{
+            width: 100%;
+            max-width: 90rem;
+            display: grid;
+            grid-template-columns: {grid_columns_style};
+            gap: 4.5rem;
+        }}
+
+        .column-title {{
+            font-weight: 700;
+            font-size: 3.2rem;
+            margin-bottom: 1.5rem;
+        }}
+
+        .column-description {{
+            font-size: 2.2rem;
+            line-height: 2;
+        }}
+
+        @media (max-width: 64rem) {{
+            .content-grid {{
+                grid-template-columns: 1fr;
+            }}
+            body, html {{
+                height: auto;
+                min-height: 100vh;
+                overflow-y: auto;
+            }}
+            .slide-container {{
+                padding: 3rem 2.5rem;
+            }}
+        }}
+    </style>
+</head>
+<body id="body" class="body">
+    <div class="slide-container">
+        <h1 class="main-title">{main_title}</h1>
+        <div class="content-grid">
+            {columns_html}
+        </div>
+    </div>
+</body>
+</html>"""
+
+    return html_code
+
+
+
+
+
+def generate_text_with_image_slide(
+    title="Tiltle Tiltle TiltleTiltle Tiltle",
+    text_content="Content.",
+    image_url="https://images.unsplash.com/photo-1522071820081-009f0129c71c?auto=format&fit=crop&w=1920&q=80",
+    font_family_heading="'Patrick Hand', cursive",
+    font_family_body="'Lato', sans-serif",
+    text_color="#34495E",
+    bg_url="https://www.toptal.com/designers/subtlepatterns/uploads/paper.png",
+    doodle_border_url="https://i.imgur.com/Qy2O1vN.png"
+):
+    """
+    Generates a doodle-themed, two-column slide with text on the left and a full-height image on the right.
+    """
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Text and Image Slide</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Patrick+Hand&family=Lato:wght@400;700&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; }}
+        body, html {{
+            height: 100vh;
+            width: 100vw;
+            font-family: {font_family_body};
+            color: {text_color};
+            overflow: hidden;
+            background-color: #F8F8F8;
+        }}
+
+        .slide-container {{
+            width: 100%;
+            height: 100%;
+            display: flex;
+        }}
+
+        .text-column {{
+            flex: 1.5; /* Takes more space */
+            padding: 2rem 4rem;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            /* Layered background for the text column only */
+            background-image: url('{bg_url}');
+            background-repeat: repeat;
+            background-position: center;
+            background-size: auto;
+        }}
+        
+        .image-column {{
+            flex: 1; /* Takes less space */
+            background-image: url('{image_url}');
+            background-size: cover;
+            background-position: center;
+        }}
+
+        .title {{
+            font-family: {font_family_heading};
+            font-size: clamp(3rem, 4vw, 4rem);
+            font-weight: 400;
+            text-transform: uppercase;
+            margin-bottom: 1.5rem;
+        }}
+        
+        .text-content {{
+            font-size: 2rem;
+            line-height: 1.8;
+            max-width: 35ch; /* Limit line length for readability */
+        }}
+        
+        /* --- Responsive Design --- */
+        @media (max-width: 48rem) {{ /* 768px */
+            .slide-container {{
+                flex-direction: column;
+            }}
+            .text-column {{
+                height: 60vh;
+                padding: 2rem 2rem 4rem 2rem;
+                justify-content: center;
+                text-align: center;
+            }}
+            .text-content {{
+                margin: 0 auto;
+            }}
+            .image-column {{
+                height: 40vh;
+            }}
+        }}
+
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="text-column">
+            <h1 class="title">{title}</h1>
+            <p class="text-content">{text_content}</p>
+        </div>
+        <div class="image-column"></div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+
+
+def generate_instructions_slide(
+    main_title="TOPIC",
+    columns=[
+        { "title": ["TOPIC ONE"], "list_items": ["First instruction point.", "Second instruction point.", "Third instruction point."] },
+        { "title": ["TOPIC TWO"], "list_items": ["First instruction point.", "Second instruction point.", "Third instruction point."] },
+        { "title": ["TOPIC THREE"], "list_items": ["First instruction point.", "Second instruction point.", "Third instruction point."] }
+    ],
+    font_family="'Poppins', 'Inter', sans-serif",
+    header_primary_color="#4F46E5",
+    header_secondary_color="#1E293B",
+    header_text_color="#FFFFFF",
+    body_title_color="#1E293B",
+    body_text_color="#333333"
+):
+    """
+    Generates a professional three-column instructions slide with extra-large,
+    impactful fonts and generous spacing.
+    """
+    
+    columns_html = ""
+    for column in columns:
+        title = column["title"]
+        if isinstance(title, str):
+            title = [title]
+        list_items_html = "".join([f"<li>{item}</li>" for item in column['list_items']])
+        title_items_html = "".join([f"<li>{item}</li>" for item in title])
+
+        columns_html += f"""
+        <div class="column">
+            <h2 class="column-title">{title_items_html}</h2>
+            <ul class="instruction-list">
+                {list_items_html}
+            </ul>
+        </div>
+        """
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Instructions Slide - Extra Large</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@400;700;800&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; }}
+        body, html {{
+            height: 100vh;
+            width: 100vw;
+            font-family: {font_family};
+            background-color: #FFFFFF;
+            overflow: hidden;
+        }}
+
+        .slide-container {{
+            width: 100%;
+            height: 100%;
+            display: flex;
+            flex-direction: column;
+        }}
+
+        .header-bar {{
+            width: 100%;
+            background-color: {header_primary_color};
+            color: {header_text_color};
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+        }}
+        
+        .header-title {{
+            /* ĐÃ SỬA ĐỔI: To hơn một chút */
+            font-size: clamp(3.5rem, 4vw, 4.5rem);
+            font-weight: 700;
+            padding: 2.5rem 3.5rem;
+        }}
+        
+        .header-accent {{
+            background-color: {header_secondary_color};
+            height: 100%;
+            padding: 2.5rem;
+            display: flex;
+            align-items: center;
+        }}
+        
+        .dots-icon {{
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            gap: 0.4rem;
+        }}
+        .dot {{
+            width: 0.7rem;
+            height: 0.7rem;
+            background-color: {header_text_color};
+            border-radius: 50%;
+        }}
+
+        .content-grid {{
+            padding: 5rem; /* Tăng padding để thoáng hơn */
+            display: grid;
+            grid-template-columns: repeat(3, 1fr);
+            gap: 3.5rem; /* Tăng gap */
+            flex-grow: 1;
+        }}
+        
+        .column-title {{
+            /* ĐÃ SỬA ĐỔI: To hơn một chút */
+            font-size: 3rem;
+            font-weight: 800;
+            color: {body_title_color};
+            text-transform: uppercase;
+            margin-bottom: 2.5rem; /* Tăng lề dưới */
+        }}
+        
+        .instruction-list {{
+            list-style: none;
+            padding: 0;
+            display: flex;
+            flex-direction: column;
+            gap: 1.5rem; /* Tăng khoảng cách */
+        }}
+        
+        .instruction-list li {{
+            display: flex;
+            align-items: flex-start;
+            gap: 0.75rem;
+            /* ĐÃ SỬA ĐỔI: To hơn một chút */
+            font-size: 2rem;
+            color: {body_text_color};
+            line-height: 1.7;
+        }}
+
+        .instruction-list li::before {{
+            content: '•';
+            color: {header_primary_color};
+            font-weight: 800;
+            /* ĐÃ SỬA ĐỔI: To hơn một chút */
+            font-size: 2.2rem;
+            margin-top: 0.15rem;
+        }}
+        
+        @media (max-width: 64rem) {{
+            .content-grid {{ 
+                grid-template-columns: 1fr; 
+                max-width: 45rem; 
+                margin: 0 auto;
+                padding: 4rem 2rem;
+            }}
+            body, html {{
+                 height: auto;
+                 min-height: 100vh;
+                 overflow-y: auto;
+            }}
+        }}
+
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="header-bar">
+            <h1 class="header-title">{main_title}</h1>
+            <div class="header-accent">
+                <div class="dots-icon">
+                    <div class="dot"></div><div class="dot"></div>
+                    <div class="dot"></div><div class="dot"></div>
+                </div>
+            </div>
+        </div>
+        <div class="content-grid">
+            {columns_html}
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+
+
+
+def generate_geometric_split_content_slide(
+    main_title="You can also split your content",
+    columns=[
+        {
+            "title": "White",
+            "description": "Is the color of milk and fresh snow, the color produced by the combination of all the colors of the visible spectrum."
+        },
+        {
+            "title": "Black",
+            "description": "Is the color of ebony and of outer space. It has been the symbolic color of elegance, solemnity and authority."
+        }
+    ],
+    font_family="'Poppins', 'Inter', sans-serif",
+    bg_color="#0F172A",
+    text_color="#FFFFFF"
+):
+    """
+    Generates a multi-column content slide with a robust layout that prevents
+    text and decorative shapes from ever overlapping.
+    """
+    columns_html = ""
+    for col in columns:
+        columns_html += f"""
+        <div class="column-item">
+            <h3 class="column-title">{col['title']}</h3>
+            <p class="column-description">{col['description']}</p>
+        </div>
+        """
+
+    grid_template_style = f"repeat({len(columns)}, 1fr)"
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Split Content Slide - Final Fix</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@600;800&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; }}
+        body, html {{
+            height: 100vh;
+            width: 100vw;
+            font-family: {font_family};
+            overflow: hidden;
+            background-color: {bg_color};
+            color: {text_color};
+        }}
+
+        .slide-container {{
+            width: 100%; height: 100%;
+            display: flex;
+            align-items: center;
+            justify-content: center; /* Center the content wrapper */
+            position: relative;
+            padding: 4rem;
+        }}
+
+        /* FIX: Create a safe zone for all text content */
+        .content-wrapper {{
+            width: 100%;
+            max-width: 85rem; /* Max width to prevent collision */
+            position: relative;
+            z-index: 10;
+            padding: 0 4rem; /* Inner padding for safety */
+        }}
+        
+        .main-title {{
+            font-size: 3.5rem;
+            font-weight: 800;
+            margin-bottom: 4rem;
+        }}
+
+        .columns-grid {{
+            display: grid;
+            grid-template-columns: {grid_template_style};
+            gap: 4rem;
+        }}
+
+        .column-title {{
+            font-size: 2.5rem;
+            font-weight: 800;
+            margin-bottom: 1rem;
+        }}
+
+        .column-description {{
+            font-size: 2rem;
+            font-weight: 600;
+            line-height: 1.6;
+        }}
+
+        /* Shapes are positioned relative to the viewport, outside the content wrapper */
+        .shape-cluster {{ position: absolute; pointer-events: none; z-index: 1; transform: scale(0.85); }}
+        .shape {{ position: absolute; border-radius: 8px; }}
+        .top-right {{ top: 5rem; right: 5rem; width: 25rem; height: 20rem; }}
+        .shape-tr-1 {{ width: 14rem; height: 14rem; background-color: #1E3A8A; opacity: 0.6; top: 0; right: 8rem; transform: rotate(15deg); }}
+        .shape-tr-2 {{ width: 15rem; height: 15rem; background-color: #34D399; opacity: 0.7; top: 2rem; right: 0; transform: rotate(25deg); }}
+        .shape-tr-3 {{ width: 13rem; height: 13rem; background-color: #6366F1; opacity: 0.6; top: 8rem; right: 10rem; transform: rotate(35deg); }}
+        .shape-tr-4 {{ width: 12rem; height: 12rem; background: linear-gradient(45deg, #F59E0B, #FBBF24); opacity: 0.8; top: 12rem; right: 2rem; transform: rotate(10deg); }}
+        .bottom-left {{ bottom: 3rem; left: -5rem; width: 25rem; height: 20rem; }}
+        .shape-bl-1 {{ width: 12rem; height: 12rem; background-color: #4F46E5; opacity: 0.5; bottom: 0; left: 10rem; transform: rotate(-25deg); }}
+        .shape-bl-2 {{ width: 14rem; height: 14rem; background-color: #10B981; opacity: 0.4; bottom: 8rem; left: 2rem; transform: rotate(-35deg); }}
+        .shape-bl-3 {{ width: 16rem; height: 16rem; background: linear-gradient(45deg, #EF4444, #F97316); opacity: 0.7; bottom: 0; left: 0; transform: rotate(-15deg); }}
+
+        @media (max-width: 75rem) {{
+            .content-wrapper {{ padding: 0 1rem; }}
+        }}
+        @media (max-width: 48rem) {{
+            .columns-grid {{ grid-template-columns: 1fr; gap: 2rem; }}
+            .main-title {{ text-align: center; }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="content-wrapper">
+            <h1 class="main-title">{main_title}</h1>
+            <div class="columns-grid">
+                {columns_html}
+            </div>
+        </div>
+        <div class="shape-cluster top-right">
+            <div class="shape shape-tr-1"></div><div class="shape shape-tr-2"></div><div class="shape shape-tr-3"></div><div class="shape shape-tr-4"></div>
+        </div>
+        <div class="shape-cluster bottom-left">
+             <div class="shape shape-bl-1"></div><div class="shape shape-bl-2"></div><div class="shape shape-bl-3"></div>
+        </div>
+    </div>
+</body>
+</html>"""
+    return html_code
+
+
+
+
+
+def generate_geometric_split_content_slide_2(
+    main_title="In two or three columns",
+    columns=[
+        {
+            "title": "Yellow",
+            "description": "Is the color of gold, butter and ripe lemons. In the spectrum of visible light, yellow is found between green and orange."
+        },
+        {
+            "title": "Blue",
+            "description": "Is the colour of the clear sky and the deep sea. It is located between violet and green on the optical spectrum."
+        },
+        {
+            "title": "Red",
+            "description": "Is the color of blood, and because of this it has historically been associated with sacrifice, danger and courage."
+        }
+    ],
+    font_family="'Poppins', 'Inter', sans-serif",
+    bg_color="#0F172A",
+    text_color="#FFFFFF"
+):
+    """
+    Generates a multi-column content slide with a robust layout that prevents
+    text and decorative shapes from ever overlapping. Maintains the 'geometric theme'.
+    """
+    columns_html = ""
+    for col in columns:
+        columns_html += f"""
+        <div class="column-item">
+            <h3 class="column-title">{col['title']}</h3>
+            <p class="column-description">{col['description']}</p>
+        </div>
+        """
+
+    grid_template_style = f"repeat({len(columns)}, 1fr)"
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Multi-Column Slide - Safe Layout</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@600;800&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; }}
+        body, html {{
+            height: 100vh;
+            width: 100vw;
+            font-family: {font_family};
+            overflow: hidden;
+            background-color: {bg_color};
+            color: {text_color};
+        }}
+
+        .slide-container {{
+            width: 100%; height: 100%;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            position: relative;
+            padding: 4rem;
+        }}
+
+        .content-wrapper {{
+            width: 100%;
+            max-width: 90rem; /* Wide safe zone for 3 columns */
+            position: relative;
+            z-index: 10;
+            padding: 0 4rem;
+        }}
+        
+        .main-title {{
+            font-size: 3.5rem;
+            font-weight: 800;
+            margin-bottom: 4rem;
+        }}
+
+        .columns-grid {{
+            display: grid;
+            grid-template-columns: {grid_template_style};
+            gap: 4rem;
+        }}
+
+        .column-title {{
+            font-size: 2.5rem;
+            font-weight: 800;
+            margin-bottom: 1rem;
+        }}
+
+        .column-description {{
+            font-size: 2rem;
+            font-weight: 600;
+            line-height: 1.6;
+        }}
+
+        /* Decorative shapes are positioned relative to the viewport, outside the content wrapper */
+        .shape-cluster {{ position: absolute; pointer-events: none; z-index: 1; transform: scale(0.85); }}
+        .shape {{ position: absolute; border-radius: 8px; }}
+        .top-right {{ top: 5rem; right: 5rem; width: 25rem; height: 20rem; }}
+        .shape-tr-1 {{ width: 14rem; height: 14rem; background-color: #1E3A8A; opacity: 0.6; top: 0; right: 8rem; transform: rotate(15deg); }}
+        .shape-tr-2 {{ width: 15rem; height: 15rem; background-color: #34D399; opacity: 0.7; top: 2rem; right: 0; transform: rotate(25deg); }}
+        .shape-tr-3 {{ width: 13rem; height: 13rem; background-color: #6366F1; opacity: 0.6; top: 8rem; right: 10rem; transform: rotate(35deg); }}
+        .shape-tr-4 {{ width: 12rem; height: 12rem; background: linear-gradient(45deg, #F59E0B, #FBBF24); opacity: 0.8; top: 12rem; right: 2rem; transform: rotate(10deg); }}
+        .bottom-left {{ bottom: 3rem; left: -5rem; width: 25rem; height: 20rem; }}
+        .shape-bl-1 {{ width: 12rem; height: 12rem; background-color: #4F46E5; opacity: 0.5; bottom: 0; left: 10rem; transform: rotate(-25deg); }}
+        .shape-bl-2 {{ width: 14rem; height: 14rem; background-color: #10B981; opacity: 0.4; bottom: 8rem; left: 2rem; transform: rotate(-35deg); }}
+        .shape-bl-3 {{ width: 16rem; height: 16rem; background: linear-gradient(45deg, #EF4444, #F97316); opacity: 0.7; bottom: 0; left: 0; transform: rotate(-15deg); }}
+
+        @media (max-width: 75rem) {{
+            .content-wrapper {{ padding: 0 1rem; max-width: 100%; }}
+        }}
+        @media (max-width: 48rem) {{
+            .columns-grid {{ grid-template-columns: 1fr; gap: 2.5rem; }}
+            .main-title {{ text-align: center; }}
+            .slide-container {{ padding: 2rem; }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="content-wrapper">
+            <h1 class="main-title">{main_title}</h1>
+            <div class="columns-grid">
+                {columns_html}
+            </div>
+        </div>
+        <div class="shape-cluster top-right">
+            <div class="shape shape-tr-1"></div><div class="shape shape-tr-2"></div><div class="shape shape-tr-3"></div><div class="shape shape-tr-4"></div>
+        </div>
+        <div class="shape-cluster bottom-left">
+             <div class="shape shape-bl-1"></div><div class="shape shape-bl-2"></div><div class="shape shape-bl-3"></div>
+        </div>
+    </div>
+</body>
+</html>"""
+    return html_code
+
+
+def generate_geometric_image_content_slide(
+    image_url="https://images.unsplash.com/photo-1557804506-669a67965ba0?q=80&w=2574&auto=format&fit=crop",
+    main_title="A picture is worth a <span class='highlight'>thousand</span> words",
+    description="A complex idea can be conveyed with just a single still image, namely making it possible to absorb large amounts of data quickly.",
+    font_family="'Poppins', 'Inter', sans-serif",
+    bg_color="#0F172A",
+    text_color="#FFFFFF"
+):
+    """
+    Generates a content slide with a custom-shaped image on the left and text on the right.
+    Features compact, subtle geometric shapes in the corners to maintain the theme.
+    """
+
+    clip_path_svg = """
+    <svg width="0" height="0">
+      <defs>
+        <clipPath id="custom-image-shape" clipPathUnits="objectBoundingBox">
+          <polygon points="0 0, 0.85 0, 1 0.15, 1 0.85, 0.85 1, 0 1" />
+        </clipPath>
+      </defs>
+    </svg>
+    """
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Image Content Slide</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@600;800&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; }}
+        body, html {{
+            height: 100vh;
+            width: 100vw;
+            font-family: {font_family};
+            overflow: hidden;
+            background-color: {bg_color};
+            color: {text_color};
+        }}
+
+        .slide-container {{
+            width: 100%; height: 100%;
+            display: flex;
+            align-items: center;
+            position: relative;
+        }}
+        
+        .image-column {{
+            flex: 1.1;
+            height: 100%;
+            clip-path: url(#custom-image-shape);
+        }}
+        
+        .image-column img {{
+            width: 100%;
+            height: 100%;
+            object-fit: cover;
+        }}
+
+        .text-column {{
+            flex: 1;
+            padding: 4rem 6rem;
+            position: relative;
+            z-index: 10;
+        }}
+
+        .main-title {{
+            font-size: 5rem;
+            font-weight: 800;
+            line-height: 1.2;
+            margin-bottom: 4rem;
+        }}
+
+        
+
+        .description {{
+            font-size: 2rem;
+            font-weight: 600;
+            line-height: 1.6;
+            max-width: 45ch;
+        }}
+
+        /* FIX: Compact decorative shapes */
+        .shape-cluster {{
+            position: absolute;
+            pointer-events: none;
+            z-index: 5;
+            transform: scale(0.75);
+        }}
+        .shape {{ position: absolute; border-radius: 6px; }}
+
+        .top-right {{
+            top: 2rem; right: 2rem;
+            width: 20rem; height: 15rem;
+        }}
+        .shape-tr-1 {{ width: 10rem; height: 10rem; background-color: #1E3A8A; opacity: 0.6; top: 0; right: 8rem; transform: rotate(15deg); }}
+        .shape-tr-2 {{ width: 12rem; height: 12rem; background-color: #34D399; opacity: 0.8; top: 1rem; right: 0; transform: rotate(25deg); }}
+        .shape-tr-3 {{ width: 9rem; height: 9rem; background-color: #A855F7; opacity: 0.7; top: -1rem; right: 0.5rem; transform: rotate(-15deg) scaleX(-1); }}
+        .shape-tr-4 {{ width: 8rem; height: 8rem; background: #F43F5E; opacity: 0.9; top: 8rem; right: 6rem; transform: rotate(10deg); }}
+
+        .bottom-left {{
+            bottom: 2rem; left: -6rem;
+            width: 20rem; height: 15rem;
+        }}
+        .shape-bl-1 {{ width: 10rem; height: 10rem; background-color: #4F46E5; opacity: 0.5; bottom: 0; left: 10rem; transform: rotate(-25deg); }}
+        .shape-bl-2 {{ width: 12rem; height: 12rem; background-color: #10B981; opacity: 0.5; bottom: 5rem; left: 2rem; transform: rotate(-35deg); }}
+        .shape-bl-3 {{ width: 14rem; height: 14rem; background: linear-gradient(45deg, #EF4444, #F97316); opacity: 0.8; bottom: -2rem; left: 0; transform: rotate(-15deg); }}
+        
+        @media (max-width: 64rem) {{
+            .slide-container {{ flex-direction: column; }}
+            .image-column {{ flex: 1; width: 100%; clip-path: none; }}
+            .text-column {{ flex: 0.8; width: 100%; padding: 2rem; text-align: center; }}
+            .main-title {{ font-size: 2.5rem; }}
+            .description {{ font-size: 1.2rem; max-width: none; }}
+        }}
+
+    </style>
+</head>
+<body>
+    {clip_path_svg}
+    <div class="slide-container">
+        <div class="image-column">
+            <img src="{image_url}" alt="A descriptive image for the slide content">
+        </div>
+        <div class="text-column">
+            <h1 class="main-title">{main_title}</h1>
+            <p class="description">{description}</p>
+        </div>
+        
+        <div class="shape-cluster top-right">
+            <div class="shape shape-tr-1"></div><div class="shape shape-tr-2"></div><div class="shape shape-tr-3"></div><div class="shape shape-tr-4"></div>
+        </div>
+        <div class="shape-cluster bottom-left">
+             <div class="shape shape-bl-1"></div><div class="shape shape-bl-2"></div><div class="shape shape-bl-3"></div>
+        </div>
+    </div>
+</body>
+</html>"""
+    return html_code
+
+
+
+def generate_geometric_grid_slide(
+    main_title="Let's review some concepts",
+    grid_items=[
+        {"title": "Yellow", "description": "Is the color of gold, butter and ripe lemons. In the spectrum of visible light, yellow is found between green and orange."},
+        {"title": "Blue", "description": "Is the colour of the clear sky and the deep sea. It is located between violet and green on the optical spectrum."},
+        {"title": "Red", "description": "Is the color of blood, and because of this it has historically been associated with sacrifice, danger and courage."},
+        {"title": "Yellow", "description": "Is the color of gold, butter and ripe lemons. In the spectrum of visible light, yellow is found between green and orange."},
+        {"title": "Blue", "description": "Is the colour of the clear sky and the deep sea. It is located between violet and green on the optical spectrum."},
+        {"title": "Red", "description": "Is the color of blood, and because of this it has historically been associated with sacrifice, danger and courage."}
+    ],
+    font_family="'Poppins', 'Inter', sans-serif",
+    bg_color="#0F172A",
+    text_color="#FFFFFF"
+):
+    """
+    Generates a 2x3 grid slide with very subtle and transparent decorative shapes,
+    ensuring content is the primary focus.
+    """
+    grid_items_html = ""
+    for item in grid_items:
+        grid_items_html += f"""
+        <div class="grid-item">
+            <h3 class="item-title">{item['title']}</h3>
+            <p class="item-description">{item['description']}</p>
+        </div>
+        """
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Grid Content Slide - Faded Shapes</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@600;800&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; }}
+        body, html {{
+            height: 100vh;
+            width: 100vw;
+            font-family: {font_family};
+            overflow: hidden;
+            background-color: {bg_color};
+            color: {text_color};
+        }}
+
+        .slide-container {{
+            width: 100%; height: 100%;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            position: relative;
+            padding: 4rem;
+        }}
+
+        .content-wrapper {{
+            width: 100%;
+            max-width: 90rem;
+            position: relative;
+            z-index: 10;
+            padding: 0 4rem;
+        }}
+        
+        .main-title {{
+            font-size: 3.5rem;
+            font-weight: 800;
+            margin-bottom: 4rem;
+        }}
+
+        .content-grid {{
+            display: grid;
+            grid-template-columns: repeat(3, 1fr);
+            gap: 3rem 4rem;
+        }}
+
+        .item-title {{
+            font-size: 2rem;
+            font-weight: 800;
+            margin-bottom: 0.75rem;
+        }}
+
+        .item-description {{
+            font-size: 1.5rem;
+            font-weight: 600;
+            line-height: 1.6;
+        }}
+
+        /* FIX: Opacity values significantly reduced for a more subtle effect */
+        .shape-cluster {{ position: absolute; pointer-events: none; z-index: 1; transform: scale(0.5); }}
+        .shape {{ position: absolute; border-radius: 8px; }}
+        .top-right {{ top: 5rem; right: 5rem; width: 25rem; height: 20rem; }}
+        .shape-tr-1 {{ width: 14rem; height: 14rem; background-color: #1E3A8A; opacity: 0.3; top: 0; right: 8rem; transform: rotate(15deg); }}
+        .shape-tr-2 {{ width: 15rem; height: 15rem; background-color: #34D399; opacity: 0.4; top: 2rem; right: 0; transform: rotate(25deg); }}
+        .shape-tr-3 {{ width: 13rem; height: 13rem; background-color: #6366F1; opacity: 0.3; top: 8rem; right: 10rem; transform: rotate(35deg); }}
+        .shape-tr-4 {{ width: 12rem; height: 12rem; background: linear-gradient(45deg, #F59E0B, #FBBF24); opacity: 0.5; top: 12rem; right: 2rem; transform: rotate(10deg); }}
+        .bottom-left {{ bottom: 3rem; left: -5rem; width: 25rem; height: 20rem; }}
+        .shape-bl-1 {{ width: 12rem; height: 12rem; background-color: #4F46E5; opacity: 0.2; bottom: 0; left: 10rem; transform: rotate(-25deg); }}
+        .shape-bl-2 {{ width: 14rem; height: 14rem; background-color: #10B981; opacity: 0.2; bottom: 8rem; left: 2rem; transform: rotate(-35deg); }}
+        .shape-bl-3 {{ width: 16rem; height: 16rem; background: linear-gradient(45deg, #EF4444, #F97316); opacity: 0.4; bottom: 0; left: 0; transform: rotate(-15deg); }}
+
+        @media (max-width: 75rem) {{
+            .content-wrapper {{ padding: 0 1rem; max-width: 100%; }}
+            .content-grid {{ grid-template-columns: repeat(2, 1fr); }}
+        }}
+        @media (max-width: 48rem) {{
+            .content-grid {{ grid-template-columns: 1fr; }}
+            .main-title {{ text-align: center; }}
+            .slide-container {{ padding: 2rem; }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="content-wrapper">
+            <h1 class="main-title">{main_title}</h1>
+            <div class="content-grid">
+                {grid_items_html}
+            </div>
+        </div>
+        <div class="shape-cluster top-right">
+            <div class="shape shape-tr-1"></div><div class="shape shape-tr-2"></div><div class="shape shape-tr-3"></div><div class="shape shape-tr-4"></div>
+        </div>
+        <div class="shape-cluster bottom-left">
+             <div class="shape shape-bl-1"></div><div class="shape shape-bl-2"></div><div class="shape shape-bl-3"></div>
+        </div>
+    </div>
+</body>
+</html>"""
+    return html_code
+
+
+
+
+def generate_memphis_content_slide(
+    main_title="This is a slide title",
+    list_items=[
+        "Here you have a list of items",
+        "And some text",
+        "But remember not to overload your slides with content"
+    ],
+    concluding_text="Your audience will listen to you or read the content, but won't do both.",
+    font_family_title="'Lora', serif",
+    font_family_body="'Source Code Pro', monospace",
+    top_panel_bg="#19114B",
+    bottom_panel_bg="#403271",
+    palette=["#F87171", "#FBBF24", "#A78BFA", "#60A5FA", "#34D399"]
+):
+    """
+    Generates a 'Memphis-style' content slide with a dramatic 20/80 layout split
+    and precisely positioned decorative elements to match the user's final sample.
+    """
+    list_html = "".join(f"<li>{item}</li>" for item in list_items)
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8"><meta name="viewport" content="width=device-width, initial-scale=1.0"><title>Memphis Content Slide - 20/80 Layout</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com"><link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Lora:wght@400;600&family=Source+Code+Pro:wght@400;600&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }} html {{ font-size: 16px; }}
+        body, html {{ height: 100vh; width: 100vw; overflow: hidden; }}
+        .slide-container {{ width: 100%; height: 100%; display: flex; flex-direction: column; position: relative; color: #FFFFFF; }}
+        .top-panel, .bottom-panel {{ position: relative; overflow: hidden; display: flex; justify-content: center; }}
+        .top-panel {{ background-color: {top_panel_bg}; flex-basis: 20%; align-items: center; }}
+        .bottom-panel {{ background-color: {bottom_panel_bg}; flex-basis: 80%; align-items: flex-start; padding-top: 6rem; }}
+        .panel-content {{ width: 100%; max-width: 75rem; padding: 2rem 4rem; }}
+        .main-title {{ font-family: {font_family_title}; font-size: 3rem; font-weight: 600; text-align: center; }}
+        .content-list {{ font-family: {font_family_body}; list-style: none; margin-bottom: 3rem; }}
+        .content-list li {{ font-size: 2rem; line-height: 1.7; padding-left: 2.5rem; position: relative; margin-bottom: 0.5rem; }}
+        .content-list li::before {{ content: ''; position: absolute; left: 0; top: 50%; transform: translateY(-50%); width: 1rem; height: 1rem; border-radius: 50%; border: 2px solid {palette[1]}; }}
+        .concluding-text {{ font-family: {font_family_body}; font-size: 2rem; line-height: 1.7; max-width: 60ch; }}
+        .shape {{ position: absolute; }}
+        .shape-tl-1 {{ width: 4rem; height: 4rem; border: 2px dashed {palette[0]}; top: 2rem; left: 2rem; transform: rotate(-25deg); }}
+        .shape-tl-2 {{ width: 0; height: 0; border-left: 1.5rem solid transparent; border-right: 1.5rem solid transparent; border-bottom: 2.5rem solid {palette[0]}; top: 3.5rem; left: 7rem; transform: rotate(20deg); opacity: 0.8; }}
+        .shape-tr-1 {{ width: 6rem; height: 6rem; border: 2px dashed {palette[1]}; border-radius: 50%; top: 1rem; right: 1rem; }}
+        .shape-tr-2 {{ width: 0; height: 0; border-left: 2rem solid transparent; border-right: 2rem solid transparent; border-bottom: 3.5rem solid {palette[3]}; top: 2rem; right: 8rem; transform: rotate(25deg); }}
+        .shape-bl-1 {{ width: 1.5rem; height: 1.5rem; background-color: {palette[3]}; bottom: 2rem; left: 5rem; }}
+        .shape-bl-2 {{ width: 0; height: 0; border-right: 2rem solid {palette[3]}; border-top: 1.5rem solid transparent; border-bottom: 1.5rem solid transparent; bottom: 3rem; left: 2rem; }}
+        .shape-br-1 {{ width: 5rem; height: 5rem; background-color: {palette[0]}; border-radius: 50%; bottom: 3rem; right: 4rem; opacity: 0.8; }}
+        .shape-br-2 {{ width: 0; height: 0; border-left: 2.5rem solid transparent; border-right: 2.5rem solid transparent; border-bottom: 4rem solid {palette[1]}; bottom: 7rem; right: 9rem; transform: rotate(45deg); opacity: 0.9; }}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="top-panel">
+            <div class="panel-content"><h1 class="main-title">{main_title}</h1></div>
+            <div class="shape shape-tl-1"></div><div class="shape shape-tl-2"></div>
+            <div class="shape shape-tr-1"></div><div class="shape shape-tr-2"></div>
+        </div>
+        <div class="bottom-panel">
+            <div class="panel-content"><ul class="content-list">{list_html}</ul><p class="concluding-text">{concluding_text}</p></div>
+            <div class="shape shape-bl-1"></div><div class="shape shape-bl-2"></div>
+            <div class="shape shape-br-1"></div><div class="shape shape-br-2"></div>
+        </div>
+    </div>
+</body>
+</html>"""
+    return html_code
+
+
+def generate_memphis_multicolumn_slide(
+    main_title="In two or three columns",
+    columns=[
+        {"title": "Yellow", "description": "Is the color of gold, butter and ripe lemons."},
+        {"title": "Blue", "description": "Is the colour of the clear sky and the deep sea."},
+        {"title": "Red", "description": "Is the color of blood, and because of this it has historically been associated with sacrifice, danger and courage."}
+    ],
+    font_family_title="'Lora', serif",
+    font_family_body="'Source Code Pro', monospace",
+    top_panel_bg="#19114B",
+    bottom_panel_bg="#403271",
+    palette=["#F43F5E", "#FBBF24", "#A78BFA", "#60A5FA", "#34D399"]
+):
+    """
+    Generates a STATIC 'Memphis-style' multi-column slide. The rotating icon animation has been removed.
+    """
+    svg_patterns = f"""<svg width="0" height="0" style="position:absolute;"><defs><pattern id="pattern-dots" x="0" y="0" width="8" height="8" patternUnits="userSpaceOnUse"><circle cx="2" cy="2" r="2" fill="{palette[3]}" /></pattern><pattern id="pattern-stripes" x="0" y="0" width="10" height="10" patternUnits="userSpaceOnUse" patternTransform="rotate(45)"><line x1="0" y1="0" x2="0" y2="10" stroke="{palette[1]}" stroke-width="4" /></pattern></defs></svg>"""
+    columns_html = "".join([f"""<div class="column-item"><h3 class="column-title">{col['title']}</h3><p class="column-description">{col['description']}</p></div>""" for col in columns])
+    grid_template_style = f"repeat({len(columns)}, 1fr)"
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8"><meta name="viewport" content="width=device-width, initial-scale=1.0"><title>Memphis Multi-Column Slide</title>
+    <link href="https://fonts.googleapis.com/css2?family=Lora:wght@400;600&family=Source+Code+Pro:wght@400;600&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }} html {{ font-size: 16px; }}
+        body, html {{ height: 100vh; width: 100vw; overflow: hidden; }}
+        .slide-container {{ width: 100%; height: 100%; display: flex; flex-direction: column; position: relative; color: #FFFFFF; }}
+        .top-panel, .bottom-panel {{ position: relative; overflow: hidden; display: flex; justify-content: center; }}
+        .top-panel {{ background-color: {top_panel_bg}; flex-basis: 20%; align-items: center; }}
+        .bottom-panel {{ background-color: {bottom_panel_bg}; flex-basis: 80%; align-items: flex-start; padding-top: 6rem; }}
+        .panel-content {{ width: 100%; max-width: 80rem; padding: 2rem 4rem; }}
+        .main-title {{ font-family: {font_family_title}; font-size: 3.5rem; font-weight: 600; text-align: center; }}
+        .columns-grid {{ display: grid; grid-template-columns: {grid_template_style}; gap: 3rem 5rem; }}
+        .column-title {{ font-family: {font_family_body}; font-size: 2.5rem; font-weight: 600; margin-bottom: 1.5rem; }}
+        .column-description {{ font-family: {font_family_body}; font-size: 1.75rem; line-height: 1.6; }}
+        .shape {{ position: absolute; }} .pentagon {{ clip-path: polygon(50% 0%, 100% 38%, 82% 100%, 18% 100%, 0% 38%); }}
+        .shape-tl-1 {{ width: 6rem; height: 6rem; background: {palette[2]}; opacity: 0.4; top: 1rem; left: 8rem; }}
+        .shape-tl-2 {{ width: 8rem; height: 8rem; background: url(#pattern-dots); top: -1rem; left: 1rem; border-radius: 50%; opacity: 0.8; }}
+        .shape-tl-3 {{ width: 5rem; height: 5rem; border: 3px solid {palette[0]}; top: 7rem; left: 2rem; }}
+        .shape-tr-1 {{ width: 5rem; height: 5rem; border: 3px dashed {palette[1]}; border-radius: 50%; top: 1rem; right: 8rem; }}
+        .shape-tr-2 {{ width: 9rem; height: 9rem; background: url(#pattern-stripes); border-radius: 50%; top: 4rem; right: 1rem; transform: rotate(45deg); opacity: 0.9; }}
+        .shape-tr-3 {{ width: 4rem; height: 4rem; border: 3px solid {palette[3]}; top: 9rem; right: 12rem; }}
+        .shape-bl-1 {{ width: 7rem; height: 7rem; border: 3px dashed {palette[2]}; border-radius: 50%; bottom: 1rem; left: 8rem; }}
+        .shape-bl-2 {{ width: 0; height: 0; border-left: 3rem solid transparent; border-right: 3rem solid transparent; border-bottom: 5rem solid {palette[0]}; bottom: 8rem; left: 2rem; transform: rotate(-15deg); }}
+        .shape-bl-3 {{ width: 9rem; height: 9rem; background: url(#pattern-stripes); bottom: 1rem; left: -1rem; clip-path: polygon(50% 0%, 100% 50%, 50% 100%, 0% 50%); transform: rotate(-25deg); opacity: 0.7; }}
+        .shape-br-1 {{ width: 6rem; height: 6rem; border: 3px solid {palette[0]}; border-radius: 50%; bottom: 2rem; right: 2rem; }}
+        .shape-br-2 {{ width: 8rem; height: 8rem; background: url(#pattern-dots); border-radius: 50%; bottom: 1rem; right: 9rem; }}
+        .shape-br-3 {{ width: 0; height: 0; border-left: 2rem solid transparent; border-right: 2rem solid transparent; border-bottom: 3.5rem solid {palette[1]}; bottom: 10rem; right: 4rem; transform: rotate(45deg); opacity: 0.7;}}
+    </style>
+</head>
+<body>
+    {svg_patterns}
+    <div class="slide-container">
+        <div class="top-panel"><div class="panel-content"><h1 class="main-title">{main_title}</h1></div><div class="shape shape-tl-1 pentagon"></div><div class="shape shape-tl-2"></div><div class="shape shape-tl-3 pentagon"></div><div class="shape shape-tr-1"></div><div class="shape shape-tr-2"></div><div class="shape shape-tr-3 pentagon"></div></div>
+        <div class="bottom-panel"><div class="panel-content"><div class="columns-grid">{columns_html}</div></div><div class="shape shape-bl-1"></div><div class="shape shape-bl-2"></div><div class="shape shape-bl-3"></div><div class="shape shape-br-1"></div><div class="shape shape-br-2"></div><div class="shape shape-br-3"></div></div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+
+
+
+def generate_memphis_grid_slide(
+    main_title="Let's review some concepts",
+    grid_items=[
+        {"title": "Yellow", "description": "Is the color of gold, butter and ripe lemons."},
+        {"title": "Blue", "description": "Is the colour of the clear sky and the deep sea."},
+        {"title": "Red", "description": "Is the color of blood, and because of this it has historically been associated with sacrifice, danger and courage."},
+        {"title": "Yellow", "description": "Is the color of gold, butter and ripe lemons."},
+        {"title": "Blue", "description": "Is the colour of the clear sky and the deep sea."},
+        {"title": "Red", "description": "Is the color of blood, and because of this it has historically been associated with sacrifice, danger and courage."}
+    ],
+    font_family_title="'Lora', serif",
+    font_family_body="'Source Code Pro', monospace",
+    top_panel_bg="#19114B",
+    bottom_panel_bg="#403271",
+    palette=["#F43F5E", "#FBBF24", "#A78BFA", "#60A5FA", "#34D399"]
+):
+    """
+    Generates a STATIC 'Memphis-style' 2x3 grid slide. The rotating icon animation has been removed.
+    """
+    if len(grid_items) != 6:
+        raise ValueError("This function requires exactly 6 items for the grid_items parameter.")
+    svg_patterns = f"""<svg width="0" height="0" style="position:absolute;"><defs><pattern id="pattern-dots" x="0" y="0" width="8" height="8" patternUnits="userSpaceOnUse"><circle cx="2" cy="2" r="2" fill="{palette[3]}" /></pattern><pattern id="pattern-stripes" x="0" y="0" width="10" height="10" patternUnits="userSpaceOnUse" patternTransform="rotate(45)"><line x1="0" y1="0" x2="0" y2="10" stroke="{palette[1]}" stroke-width="4" /></pattern></defs></svg>"""
+    grid_html = "".join(f"""<div class="grid-item"><h3 class="item-title">{item['title']}</h3><p class="item-description">{item['description']}</p></div>""" for item in grid_items)
+    grid_template_style = f"repeat(3, 1fr)"
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8"><meta name="viewport" content="width=device-width, initial-scale=1.0"><title>Memphis Grid Slide</title>
+    <link href="https://fonts.googleapis.com/css2?family=Lora:wght@400;600&family=Source+Code+Pro:wght@400;600&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }} html {{ font-size: 16px; }}
+        body, html {{ height: 100vh; width: 100vw; overflow: hidden; }}
+        .slide-container {{ width: 100%; height: 100%; display: flex; flex-direction: column; position: relative; color: #FFFFFF; }}
+        .top-panel, .bottom-panel {{ position: relative; overflow: hidden; display: flex; justify-content: center; }}
+        .top-panel {{ background-color: {top_panel_bg}; flex-basis: 20%; align-items: center; }}
+        .bottom-panel {{ background-color: {bottom_panel_bg}; flex-basis: 80%; align-items: flex-start; padding-top: 6rem; }}
+        .panel-content {{ width: 100%; max-width: 80rem; padding: 2rem 4rem; }}
+        .main-title {{ font-family: {font_family_title}; font-size: 2.25rem; font-weight: 600; text-align: center; }}
+        .columns-grid {{ display: grid; grid-template-columns: {grid_template_style}; gap: 3rem 4rem; }}
+        .item-title {{ font-family: {font_family_body}; font-size: 1.25rem; font-weight: 600; margin-bottom: 1rem; }}
+        .item-description {{ font-family: {font_family_body}; font-size: 1.1rem; line-height: 1.6; }}
+        .shape {{ position: absolute; }} .pentagon {{ clip-path: polygon(50% 0%, 100% 38%, 82% 100%, 18% 100%, 0% 38%); }}
+        .shape-tl-1 {{ width: 6rem; height: 6rem; background: {palette[2]}; opacity: 0.4; top: 1rem; left: 8rem; }}
+        .shape-tl-2 {{ width: 8rem; height: 8rem; background: url(#pattern-dots); top: -1rem; left: 1rem; border-radius: 50%; opacity: 0.8; }}
+        .shape-tl-3 {{ width: 5rem; height: 5rem; border: 3px solid {palette[0]}; top: 7rem; left: 2rem; }}
+        .shape-tr-1 {{ width: 5rem; height: 5rem; border: 3px dashed {palette[1]}; border-radius: 50%; top: 1rem; right: 8rem; }}
+        .shape-tr-2 {{ width: 9rem; height: 9rem; background: url(#pattern-stripes); border-radius: 50%; top: 4rem; right: 1rem; transform: rotate(45deg); opacity: 0.9; }}
+        .shape-tr-3 {{ width: 4rem; height: 4rem; border: 3px solid {palette[3]}; top: 9rem; right: 12rem; }}
+        .shape-bl-1 {{ width: 7rem; height: 7rem; border: 3px dashed {palette[2]}; border-radius: 50%; bottom: 1rem; left: 8rem; }}
+        .shape-bl-2 {{ width: 0; height: 0; border-left: 3rem solid transparent; border-right: 3rem solid transparent; border-bottom: 5rem solid {palette[0]}; bottom: 8rem; left: 2rem; transform: rotate(-15deg); }}
+        .shape-bl-3 {{ width: 9rem; height: 9rem; background: url(#pattern-stripes); bottom: 1rem; left: -1rem; clip-path: polygon(50% 0%, 100% 50%, 50% 100%, 0% 50%); transform: rotate(-25deg); opacity: 0.7; }}
+        .shape-br-1 {{ width: 6rem; height: 6rem; border: 3px solid {palette[0]}; border-radius: 50%; bottom: 2rem; right: 2rem; }}
+        .shape-br-2 {{ width: 8rem; height: 8rem; background: url(#pattern-dots); border-radius: 50%; bottom: 1rem; right: 9rem; }}
+        .shape-br-3 {{ width: 0; height: 0; border-left: 2rem solid transparent; border-right: 2rem solid transparent; border-bottom: 3.5rem solid {palette[1]}; bottom: 10rem; right: 4rem; transform: rotate(45deg); opacity: 0.7;}}
+    </style>
+</head>
+<body>
+    {svg_patterns}
+    <div class="slide-container">
+        <div class="top-panel"><div class="panel-content"><h1 class="main-title">{main_title}</h1></div><div class="shape shape-tl-1 pentagon"></div><div class="shape shape-tl-2"></div><div class="shape shape-tl-3 pentagon"></div><div class="shape shape-tr-1"></div><div class="shape shape-tr-2"></div><div class="shape shape-tr-3 pentagon"></div></div>
+        <div class="bottom-panel"><div class="panel-content"><div class="columns-grid">{grid_html}</div></div><div class="shape shape-bl-1"></div><div class="shape shape-bl-2"></div><div class="shape shape-bl-3"></div><div class="shape shape-br-1"></div><div class="shape shape-br-2"></div><div class="shape shape-br-3"></div></div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+
+def generate_premium_abstract_slide(
+    main_title="HR Management",
+    content_paragraphs=[
+        "We foster a dynamic and supportive work environment where every individual can thrive. Our approach integrates technology and human-centric policies to build a resilient and engaged workforce.",
+        "From talent acquisition to professional development, our comprehensive strategies ensure that our people are our greatest asset, driving innovation and success."
+    ],
+    # --- Bảng màu thiết kế cao cấp ---
+    bg_color="#F8FAFC", # Off-white, rất nhẹ
+    aurora_color_1="#FBCFE8", # Pink
+    aurora_color_2="#CFFAFE", # Cyan
+    aurora_color_3="#DDD6FE", # Lavender
+    title_color="#881337", # Deep Raspberry
+    text_color="#334155",  # Slate Gray
+    # --- Tùy chỉnh khác ---
+    enable_animation=True,
+    show_border=True,
+    font_family_title="'Poppins', sans-serif",
+    font_family_content="'Inter', sans-serif",
+    custom_css=""
+):
+    """
+    Generate a premium, modern slide with an aurora gradient background and abstract glassmorphism graphics.
+
+    :param main_title: The main title of the slide.
+    :param content_paragraphs: A list of strings for body text.
+    :param bg_color: The base background color.
+    :param aurora_color_1: First color for the aurora gradient effect.
+    :param aurora_color_2: Second color for the aurora gradient effect.
+    :param aurora_color_3: Third color for the aurora gradient effect.
+    :param title_color: Color for the main title.
+    :param text_color: Color for the paragraph text.
+    :param enable_animation: Whether to enable subtle load animations.
+    :param show_border: Whether to show a subtle finishing border.
+    :param font_family_title: Font family for the title.
+    :param font_family_content: Font family for the content.
+    :param custom_css: Additional custom CSS.
+    :return: HTML string for the slide.
+    """
+
+    paragraphs_html = "".join([f"<p class='content-paragraph'>{p}</p>" for p in content_paragraphs])
+    animation_class = "animated" if enable_animation else ""
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{main_title}</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@600&family=Inter:wght@400&display=swap" rel="stylesheet">
+    <style>
+        body, html {{
+            margin: 0;
+            padding: 0;
+            height: 100%;
+            width: 100%;
+            overflow: hidden;
+            background-color: {bg_color};
+            color: {text_color};
+        }}
+        
+        .slide-container {{
+            width: 100%;
+            height: 100vh;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            padding: 4vw;
+            box-sizing: border-box;
+            position: relative;
+        }}
+        
+        /* Aurora Gradient Background */
+        .aurora-shape {{
+            position: absolute;
+            filter: blur(120px);
+            opacity: 0.4;
+            border-radius: 50%;
+        }}
+        .aurora-1 {{
+            width: 450px;
+            height: 450px;
+            top: -150px;
+            left: -150px;
+            background: {aurora_color_1};
+        }}
+        .aurora-2 {{
+            width: 400px;
+            height: 400px;
+            bottom: -150px;
+            right: -100px;
+            background: {aurora_color_2};
+        }}
+        .aurora-3 {{
+            width: 300px;
+            height: 300px;
+            top: 50%;
+            right: 15%;
+            transform: translateY(-50%);
+            background: {aurora_color_3};
+            opacity: 0.3;
+        }}
+
+        .slide-border {{
+            position: absolute;
+            top: 20px;
+            left: 20px;
+            right: 20px;
+            bottom: 20px;
+            border: 1px solid rgba(0, 0, 0, 0.05);
+            border-radius: 20px;
+            display: { "block" if show_border else "none" };
+        }}
+
+        .content-wrapper {{
+            display: flex;
+            align-items: center;
+            justify-content: space-between;
+            width: 100%;
+            max-width: 1200px;
+            position: relative;
+            z-index: 1;
+        }}
+        
+        .text-section {{
+            flex-basis: 50%;
+            padding-right: 40px;
+        }}
+        
+        .graphic-section {{
+            flex-basis: 50%;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            height: 400px;
+        }}
+        
+        .main-title {{
+            font-family: {font_family_title};
+            font-size: 4.5rem;
+            font-weight: 600;
+            color: {title_color};
+            margin: 0 0 30px 0;
+            line-height: 1.15;
+        }}
+        
+        .content-paragraph {{
+            font-family: {font_family_content};
+            font-size: 1.1rem;
+            line-height: 1.8;
+            margin-bottom: 20px;
+            max-width: 500px;
+        }}
+
+        /* Abstract Glassmorphism Graphic */
+        .abstract-graphic {{
+            position: relative;
+            width: 380px;
+            height: 380px;
+        }}
+        .abstract-shape {{
+            position: absolute;
+            border-radius: 30%;
+            transition: transform 0.4s ease-out;
+        }}
+        .shape1 {{
+            width: 380px;
+            height: 380px;
+            background: rgba(255, 255, 255, 0.4);
+            backdrop-filter: blur(10px);
+            border: 1px solid rgba(255, 255, 255, 0.5);
+            border-radius: 50%;
+        }}
+        .shape2 {{
+            width: 180px;
+            height: 180px;
+            top: 30px;
+            left: 10px;
+            background: {aurora_color_1};
+            opacity: 0.8;
+            border-radius: 45% 55% 70% 30% / 30% 30% 70% 70%;
+            transform: rotate(-15deg);
+        }}
+        .shape3 {{
+            width: 200px;
+            height: 200px;
+            bottom: 20px;
+            right: 0px;
+            background: {aurora_color_2};
+            opacity: 0.8;
+            border-radius: 60% 40% 30% 70% / 60% 30% 70% 40%;
+            transform: rotate(15deg);
+        }}
+        
+        
+
+        /* Responsive */
+        @media (max-width: 900px) {{
+            .main-title {{ font-size: 3.2rem; }}
+        }}
+        @media (max-width: 768px) {{
+            .content-wrapper {{ flex-direction: column-reverse; text-align: center; }}
+            .text-section {{ padding-right: 0; margin-top: 40px; align-items: center; display:flex; flex-direction:column;}}
+            .graphic-section {{ flex-basis: auto; width: 60%; height: 300px; margin-bottom: 20px; }}
+            .abstract-graphic, .shape1 {{ width: 300px; height: 300px; }}
+            .shape2 {{ width: 140px; height: 140px; }}
+            .shape3 {{ width: 160px; height: 160px; }}
+        }}
+        
+        {custom_css}
+    </style>
+</head>
+<body>
+    <div class="slide-container {animation_class}">
+        <div class="aurora-shape aurora-1"></div>
+        <div class="aurora-shape aurora-2"></div>
+        <div class="aurora-shape aurora-3"></div>
+        <div class="slide-border"></div>
+
+        <div class="content-wrapper">
+            <div class="text-section">
+                <h1 class="main-title">{main_title}</h1>
+                <div class="content-area">
+                    {paragraphs_html}
+                </div>
+            </div>
+            <div class="graphic-section">
+                <div class="abstract-graphic">
+                    <div class="abstract-shape shape1"></div>
+                    <div class="abstract-shape shape2"></div>
+                    <div class="abstract-shape shape3"></div>
+                </div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    return html_code
+
+
+def generate_company_mission_slide(
+    main_title="OUR COMPANY OUR COMPANY OUR COMPANY OUR COMPANY",
+    mission_items=[
+        "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore",
+        "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore",
+        "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore",
+        "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore",
+        "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore",
+        "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore",
+        "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore"
+    ],
+    title_color="#000000",
+    panel_bg_color="#0052CC",
+    panel_text_color="#FFFFFF",
+    number_bg_color="#E8E8E8",
+    number_text_color="#000000",
+    accent_bar_color="#0052CC",
+    bg_color="#F5F5F5",
+):
+    """
+    Generate a company mission slide with customizable numbered items.
+    
+    Parameters:
+    - main_title: Main title text (default: "OUR COMPANY")
+    - mission_items: List of mission item texts (default: 6 items with Lorem ipsum)
+    - title_color: Color for main title
+    - subtitle_color: Color for subtitle
+    - panel_bg_color: Background color for right panel
+    - panel_text_color: Text color inside panel
+    - number_bg_color: Background color for number circles
+    - number_text_color: Text color for numbers
+    - accent_bar_color: Color for bottom accent bar
+    - bg_color: Background color for slide
+    - custom_css: Additional custom CSS
+    
+    Returns:
+    - HTML code for the company mission slide
+    """
+    
+    # Generate mission items HTML
+    mission_items_html = ""
+    for idx, item in enumerate(mission_items, 1):
+        mission_items_html += f"""
+        <div class="mission-item">
+            <div class="number-circle">{idx}</div>
+            <div class="mission-text">{item}</div>
+        </div>
+        """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Company Mission Slide</title>
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+
+        body {{
+            font-family: 'Arial', sans-serif;
+            background-color: {bg_color};
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            min-height: 100vh;
+            padding: 20px;
+        }}
+
+        .slide-wrapper {{
+            width: 1920px;
+            height: 1080px;
+            background-color: {bg_color};
+            position: relative;
+            transform-origin: top left;
+        }}
+
+        .slide-container {{
+            width: 100%;
+            height: 100%;
+            display: flex;
+            gap: 60px;
+            padding: 100px 0px 100px 80px;
+        }}
+
+        .left-section {{
+            flex: 0 0 35%;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            gap: 60px;
+        }}
+
+        .title-section {{
+            margin-bottom: 20px;
+        }}
+
+        .main-title {{
+            font-size: 64px;
+            font-weight: 700;
+            color: {title_color};
+            letter-spacing: 3px;
+            margin-bottom: 8px;
+            line-height: 1.2;
+        }}
+
+        .left-text {{
+            font-size: 24px;
+            line-height: 1.7;
+            color: {title_color};
+            max-width: 600px;
+            opacity: 0.9;
+        }}
+
+        .accent-bar {{
+            width: 180px;
+            height: 14px;
+            background-color: {accent_bar_color};
+            margin-top: 20px;
+            border-radius: 2px;
+        }}
+
+        .right-section {{
+            flex: 1;
+            position: relative;
+            display: flex;
+            align-items: center;
+        }}
+
+        .mission-panel {{
+            background-color: {panel_bg_color};
+            border-radius: 50px 0 0 50px;
+            padding: 70px 80px 70px 120px;
+            width: 100%;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            gap: 48px;
+            position: relative;
+            overflow: visible;
+            box-shadow: 0 20px 60px rgba(0, 0, 0, 0.1);
+        }}
+
+        .mission-item {{
+            display: flex;
+            align-items: center;
+            gap: 35px;
+            position: relative;
+        }}
+
+        .number-circle {{
+            position: absolute;
+            left: -100px;
+            width: 90px;
+            height: 90px;
+            background-color: {number_bg_color};
+            border-radius: 50%;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            font-size: 52px;
+            font-weight: 900;
+            color: {number_text_color};
+            flex-shrink: 0;
+            box-shadow: 0 8px 24px rgba(0, 0, 0, 0.15);
+        }}
+
+        .mission-text {{
+            font-size: 28px;
+            line-height: 1.65;
+            color: {panel_text_color};
+        }}
+
+
+        @media (max-width: 1920px) {{
+            .slide-wrapper {{
+                transform: scale(calc(100vw / 1920));
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-wrapper">
+        <div class="slide-container">
+            <div class="left-section">
+                <div class="title-section">
+                    <div class="main-title">{main_title}</div>
+                </div>
+                <div class="accent-bar"></div>
+            </div>
+            
+            <div class="right-section">
+                <div class="mission-panel">
+                    {mission_items_html}
+                </div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+
+def generate_methodology_slide(
+    title="Methodology Methodology ",
+    title_color="#000000",
+    accent_color="#C9A86A",
+    qualitative_title="Qualitative Methods",
+    qualitative_text="Qualitative research methods involve collecting and analyzing non-numerical data to explore the underlying motivations, perceptions, and behaviors of individuals. In our research proposal, qualitative methods will be utilized to gain in-depth insights into consumer preferences, attitudes, and experiences related to the new product.",
+    quantitative_title="Quantitative Methods",
+    quantitative_text="Quantitative research methods involve collecting and analyzing numerical data to quantify relationships, trends, and patterns. In our research proposal, quantitative methods will be employed to measure the prevalence, frequency, and magnitude of certain phenomena related to the new product.",
+    image_url="https://images.unsplash.com/photo-1551288049-bebda4e38f71?q=80&w=2340&auto=format&fit=crop",
+    bg_color="#F5F5F5",
+    font_family="'Inter', sans-serif",
+    custom_css=""
+):
+    """
+    Generate a Methodology slide with two method boxes and professional image.
+    
+    Args:
+        title: Main title text
+        title_color: Color for the main title
+        accent_color: Color for accent elements (bar, circles, boxes)
+        qualitative_title: Title for qualitative methods box
+        qualitative_text: Description text for qualitative methods
+        quantitative_title: Title for quantitative methods box
+        quantitative_text: Description text for quantitative methods
+        image_url: URL for the right side professional image
+        bg_color: Background color
+        font_family: Font family for the text
+        custom_css: Additional custom CSS
+    
+    Returns:
+        str: Complete HTML code for the methodology slide
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Methodology Slide</title>
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body {{
+            font-family: {font_family};
+            background-color: {bg_color};
+            overflow: hidden;
+        }}
+        
+        .slide-wrapper {{
+            width: 100vw;
+            height: 100vh;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            background-color: {bg_color};
+        }}
+        
+        .slide-container {{
+            width: 1920px;
+            height: 1080px;
+            background-color: {bg_color};
+            position: relative;
+            overflow: hidden;
+        }}
+        
+        /* Decorative circles in top right */
+        .decorative-circles {{
+            position: absolute;
+            top: 0;
+            right: 40%;
+            width: 250px;
+            height: 250px;
+            z-index: 1;
+        }}
+        
+        .circle {{
+            position: absolute;
+            border: 3px solid {accent_color};
+            border-radius: 50%;
+            opacity: 0.6;
+        }}
+        
+        .circle-1 {{
+            width: 100px;
+            height: 100px;
+            top: 30px;
+            right: 80px;
+        }}
+        
+        .circle-2 {{
+            width: 130px;
+            height: 130px;
+            top: 15px;
+            right: 65px;
+        }}
+        
+        .circle-3 {{
+            width: 160px;
+            height: 160px;
+            top: 0;
+            right: 50px;
+        }}
+        
+        .circle-4 {{
+            width: 190px;
+            height: 190px;
+            top: -15px;
+            right: 35px;
+        }}
+        
+        .circle-5 {{
+            width: 220px;
+            height: 220px;
+            top: -30px;
+            right: 20px;
+        }}
+        
+        /* Title Section */
+        .title-section {{
+            position: absolute;
+            top: 30px;
+            left: 0;
+            display: flex;
+            align-items: center;
+            z-index: 2;
+        }}
+        
+        .title-accent {{
+            width: 100px;
+            height: 100px;
+            background-color: {accent_color};
+            margin-right: 20px;
+        }}
+        
+        .title {{
+            font-size: 75px;
+            font-weight: 900;
+            color: {title_color};
+            
+        }}
+        
+        /* Content Section */
+        .content-section {{
+            position: absolute;
+            top: 240px;
+            left: 50px;
+            right: 50px;
+            display: flex;
+            gap: 30px;
+            height: 780px;
+        }}
+        
+        /* Left side - Method boxes */
+        .methods-container {{
+            flex: 0 0 620px;
+            display: flex;
+            flex-direction: column;
+            gap: 30px;
+        }}
+        
+        .method-box {{
+            padding: 40px;
+            border-radius: 8px;
+            display: flex;
+            flex-direction: column;
+            gap: 20px;
+            flex: 1;
+        }}
+        
+        .method-box.qualitative {{
+            background-color: rgba(201, 168, 106, 0.3);
+        }}
+        
+        .method-box.quantitative {{
+            background-color: rgba(201, 168, 106, 0.5);
+        }}
+        
+        .method-title {{
+            font-size: 45px;
+            font-weight: 700;
+            color: {title_color};
+            margin-bottom: 15px;
+        }}
+        
+        .method-text {{
+            font-size: 21px;
+            line-height: 1.7;
+            color: #1a1a1a;
+        }}
+        
+        /* Right side - Image */
+        .image-container {{
+            flex: 1;
+            position: relative;
+            border-radius: 8px;
+            overflow: hidden;
+            box-shadow: 0 10px 40px rgba(0, 0, 0, 0.15);
+        }}
+        
+        .image-container img {{
+            width: 100%;
+            height: 100%;
+            object-fit: cover;
+        }}
+        
+        {custom_css}
+    </style>
+</head>
+<body>
+    <div class="slide-wrapper">
+        <div class="slide-container">
+            <!-- Decorative Circles -->
+            <div class="decorative-circles">
+                <div class="circle circle-1"></div>
+                <div class="circle circle-2"></div>
+                <div class="circle circle-3"></div>
+                <div class="circle circle-4"></div>
+                <div class="circle circle-5"></div>
+            </div>
+            
+            <!-- Title Section -->
+            <div class="title-section">
+                <div class="title-accent"></div>
+                <h1 class="title">{title}</h1>
+            </div>
+            
+            <!-- Content Section -->
+            <div class="content-section">
+                <!-- Methods Container -->
+                <div class="methods-container">
+                    <!-- Qualitative Methods Box -->
+                    <div class="method-box qualitative">
+                        <h2 class="method-title">{qualitative_title}</h2>
+                        <p class="method-text">{qualitative_text}</p>
+                    </div>
+                    
+                    <!-- Quantitative Methods Box -->
+                    <div class="method-box quantitative">
+                        <h2 class="method-title">{quantitative_title}</h2>
+                        <p class="method-text">{quantitative_text}</p>
+                    </div>
+                </div>
+                
+                <!-- Image Container -->
+                <div class="image-container">
+                    <img src="{image_url}" alt="Professional working with technology">
+                </div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+def generate_planning_phase_slide(
+    title="Planning Phase",
+    title_color="#C5E898",
+    bg_color="#1A4D4D",
+    marker_light_color="#C5E898",
+    marker_dark_color="#4ECDC4",
+    phases=None,
+    timeline_color="#FFFFFF",
+    custom_css=""
+):
+    """
+    Generate a Planning Phase slide with timeline and icon markers.
+    
+    This function creates an HTML slide showing a planning phase timeline with
+    4 stages represented by pin markers containing line art icons, connected by
+    a horizontal timeline. Each stage has a title and description below.
+    
+    Args:
+        title (str): Main title text (default: "Planning Phase")
+        title_color (str): Color for the title (default: "#C5E898" - light yellow-green)
+        bg_color (str): Background color (default: "#1A4D4D" - dark teal)
+        marker_light_color (str): Color for light markers (default: "#C5E898")
+        marker_dark_color (str): Color for dark markers (default: "#4ECDC4")
+        phases (list): List of phase dictionaries with keys: 'name', 'description', 'icon_type', 'marker_color'
+                       Options for icon_type: 'brain', 'checklist', 'design', 'puzzle'
+                       Options for marker_color: 'light' or 'dark'
+        timeline_color (str): Color for the timeline line and dots (default: "#FFFFFF")
+        custom_css (str): Additional custom CSS to inject
+    
+    Returns:
+        str: Complete HTML code for the planning phase slide
+    """
+    
+    # Default phases if none provided
+    if phases is None:
+        phases = [
+            {
+                'name': 'Planning',
+                'description': 'Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do.',
+                'icon_type': 'brain',
+                'marker_color': 'light'
+            },
+            {
+                'name': 'Analysis',
+                'description': 'Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do.',
+                'icon_type': 'checklist',
+                'marker_color': 'dark'
+            },
+            {
+                'name': 'Design',
+                'description': 'Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do.',
+                'icon_type': 'design',
+                'marker_color': 'light'
+            },
+            {
+                'name': 'Implementation',
+                'description': 'Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do.',
+                'icon_type': 'puzzle',
+                'marker_color': 'dark'
+            }
+        ]
+    
+    # Generate icon SVGs based on type
+    def get_icon_svg(icon_type):
+        icons = {
+            'brain': '''
+                <path d="M30,25 Q30,15 40,15 Q45,15 45,20 Q50,15 55,20 Q60,15 60,25 Q60,30 55,35 Q60,40 55,45 Q55,50 50,50 Q45,55 40,50 Q35,55 30,50 Q25,50 25,45 Q20,40 25,35 Q20,30 30,25 Z" fill="none" stroke="currentColor" stroke-width="2.5"/>
+                <circle cx="42" cy="30" r="3" fill="none" stroke="currentColor" stroke-width="2"/>
+                <circle cx="48" cy="35" r="2" fill="none" stroke="currentColor" stroke-width="2"/>
+                <path d="M35,30 Q35,35 40,35" fill="none" stroke="currentColor" stroke-width="2"/>
+            ''',
+            'checklist': '''
+                <rect x="28" y="20" width="30" height="35" rx="3" fill="none" stroke="currentColor" stroke-width="2.5"/>
+                <circle cx="43" cy="32" r="8" fill="none" stroke="currentColor" stroke-width="2.5"/>
+                <path d="M40,32 L42,34 L46,30" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round"/>
+                <line x1="32" y1="45" x2="38" y2="45" stroke="currentColor" stroke-width="2"/>
+                <line x1="32" y1="50" x2="36" y2="50" stroke="currentColor" stroke-width="2"/>
+                <path d="M48,30 L52,26 L54,28" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round"/>
+            ''',
+            'design': '''
+                <rect x="30" y="23" width="28" height="20" rx="2" fill="none" stroke="currentColor" stroke-width="2.5"/>
+                <line x1="33" y1="27" x2="55" y2="27" stroke="currentColor" stroke-width="1.5"/>
+                <line x1="33" y1="31" x2="55" y2="31" stroke="currentColor" stroke-width="1.5"/>
+                <line x1="33" y1="35" x2="55" y2="35" stroke="currentColor" stroke-width="1.5"/>
+                <line x1="33" y1="39" x2="50" y2="39" stroke="currentColor" stroke-width="1.5"/>
+                <path d="M52,45 L55,52 L58,45 L55,48 Z" fill="currentColor" stroke="currentColor" stroke-width="1.5" stroke-linejoin="round"/>
+            ''',
+            'puzzle': '''
+                <path d="M32,25 L32,35 Q32,38 35,38 Q38,38 38,35 L38,25 L48,25 L48,35 L58,35 L58,45 L48,45 L48,55 L38,55 L38,45 Q38,42 35,42 Q32,42 32,45 L32,55 L22,55 L22,45 L22,35 L32,35 Z" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linejoin="round"/>
+                <circle cx="35" cy="30" r="2" fill="currentColor"/>
+                <circle cx="43" cy="40" r="2" fill="currentColor"/>
+            '''
+        }
+        return icons.get(icon_type, icons['brain'])
+    
+    # Generate markers HTML - each marker created individually
+    marker_1_bg = marker_light_color  # Planning - light
+    marker_1_icon = '''
+                <path d="M30,25 Q30,15 40,15 Q45,15 45,20 Q50,15 55,20 Q60,15 60,25 Q60,30 55,35 Q60,40 55,45 Q55,50 50,50 Q45,55 40,50 Q35,55 30,50 Q25,50 25,45 Q20,40 25,35 Q20,30 30,25 Z" fill="none" stroke="currentColor" stroke-width="2.5"/>
+                <circle cx="42" cy="30" r="3" fill="none" stroke="currentColor" stroke-width="2"/>
+                <circle cx="48" cy="35" r="2" fill="none" stroke="currentColor" stroke-width="2"/>
+                <path d="M35,30 Q35,35 40,35" fill="none" stroke="currentColor" stroke-width="2"/>
+            '''
+    
+    marker_2_bg = marker_dark_color  # Analysis - dark
+    marker_2_icon = '''
+                <rect x="28" y="20" width="30" height="35" rx="3" fill="none" stroke="currentColor" stroke-width="2.5"/>
+                <circle cx="43" cy="32" r="8" fill="none" stroke="currentColor" stroke-width="2.5"/>
+                <path d="M40,32 L42,34 L46,30" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round"/>
+                <line x1="32" y1="45" x2="38" y2="45" stroke="currentColor" stroke-width="2"/>
+                <line x1="32" y1="50" x2="36" y2="50" stroke="currentColor" stroke-width="2"/>
+                <path d="M48,30 L52,26 L54,28" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round"/>
+            '''
+    
+    marker_3_bg = marker_light_color  # Design - light
+    marker_3_icon = '''
+                <rect x="30" y="23" width="28" height="20" rx="2" fill="none" stroke="currentColor" stroke-width="2.5"/>
+                <line x1="33" y1="27" x2="55" y2="27" stroke="currentColor" stroke-width="1.5"/>
+                <line x1="33" y1="31" x2="55" y2="31" stroke="currentColor" stroke-width="1.5"/>
+                <line x1="33" y1="35" x2="55" y2="35" stroke="currentColor" stroke-width="1.5"/>
+                <line x1="33" y1="39" x2="50" y2="39" stroke="currentColor" stroke-width="1.5"/>
+                <path d="M52,45 L55,52 L58,45 L55,48 Z" fill="currentColor" stroke="currentColor" stroke-width="1.5" stroke-linejoin="round"/>
+            '''
+    
+    marker_4_bg = marker_dark_color  # Implementation - dark
+    marker_4_icon = '''
+                <path d="M32,25 L32,35 Q32,38 35,38 Q38,38 38,35 L38,25 L48,25 L48,35 L58,35 L58,45 L48,45 L48,55 L38,55 L38,45 Q38,42 35,42 Q32,42 32,45 L32,55 L22,55 L22,45 L22,35 L32,35 Z" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linejoin="round"/>
+                <circle cx="35" cy="30" r="2" fill="currentColor"/>
+                <circle cx="43" cy="40" r="2" fill="currentColor"/>
+            '''
+    
+    markers_html = f'''
+        <div class="phase-marker">
+            <div class="marker-pin" style="--marker-bg: {marker_1_bg};">
+                <svg viewBox="0 0 80 80" class="marker-icon" style="color: {bg_color};">
+                    {marker_1_icon}
+                </svg>
+            </div>
+        </div>
+        <div class="phase-marker">
+            <div class="marker-pin" style="--marker-bg: {marker_2_bg};">
+                <svg viewBox="0 0 80 80" class="marker-icon" style="color: {bg_color};">
+                    {marker_2_icon}
+                </svg>
+            </div>
+        </div>
+        <div class="phase-marker">
+            <div class="marker-pin" style="--marker-bg: {marker_3_bg};">
+                <svg viewBox="0 0 80 80" class="marker-icon" style="color: {bg_color};">
+                    {marker_3_icon}
+                </svg>
+            </div>
+        </div>
+        <div class="phase-marker">
+            <div class="marker-pin" style="--marker-bg: {marker_4_bg};">
+                <svg viewBox="0 0 80 80" class="marker-icon" style="color: {bg_color};">
+                    {marker_4_icon}
+                </svg>
+            </div>
+        </div>
+        '''
+    
+    # Generate timeline items HTML - each item created individually
+    timeline_html = f'''
+        <div class="timeline-item">
+            <div class="timeline-track-segment">
+                <div class="timeline-dot"></div>
+            </div>
+            <h3 class="phase-name">Planning</h3>
+            <p class="phase-description">Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do.</p>
+        </div>
+        <div class="timeline-item">
+            <div class="timeline-track-segment">
+                <div class="timeline-dot"></div>
+            </div>
+            <h3 class="phase-name">Analysis</h3>
+            <p class="phase-description">Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do.</p>
+        </div>
+        <div class="timeline-item">
+            <div class="timeline-track-segment">
+                <div class="timeline-dot"></div>
+            </div>
+            <h3 class="phase-name">Design</h3>
+            <p class="phase-description">Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do.</p>
+        </div>
+        <div class="timeline-item">
+            <div class="timeline-track-segment">
+                <div class="timeline-dot"></div>
+            </div>
+            <h3 class="phase-name">Implementation</h3>
+            <p class="phase-description">Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do.</p>
+        </div>
+        '''
+    
+    html_code = f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body {{
+            width: 1920px;
+            height: 1080px;
+            font-family: 'Arial', 'Segoe UI', Tahoma, sans-serif;
+            background: {bg_color};
+            color: white;
+            overflow: hidden;
+            padding: 80px 100px;
+            display: flex;
+            flex-direction: column;
+        }}
+        
+        .title {{
+            font-size: 90px;
+            font-weight: 300;
+            color: {title_color};
+            margin-bottom: 100px;
+            letter-spacing: 2px;
+        }}
+        
+        .markers-container {{
+            display: flex;
+            justify-content: space-between;
+            align-items: flex-end;
+            margin-bottom: 60px;
+            padding: 0 60px;
+        }}
+        
+        .phase-marker {{
+            flex: 1;
+            display: flex;
+            justify-content: center;
+            align-items: flex-end;
+        }}
+        
+        .marker-pin {{
+            width: 180px;
+            height: 180px;
+            background-color: var(--marker-bg);
+            border-radius: 50%;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            box-shadow: 0 8px 20px rgba(0, 0, 0, 0.3);
+        }}
+        
+        .marker-icon {{
+            width: 90px;
+            height: 90px;
+        }}
+        
+        .timeline-container {{
+            padding: 0 60px;
+        }}
+        
+        .timeline-items {{
+            display: flex;
+            justify-content: space-between;
+            background: linear-gradient(to right, {timeline_color} 0%, {timeline_color} 100%);
+            background-size: 100% 3px;
+            background-position: center 15px;
+            background-repeat: no-repeat;
+        }}
+        
+        .timeline-item {{
+            flex: 1;
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+        }}
+        
+        .timeline-track-segment {{
+            height: 30px;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            margin-bottom: 30px;
+        }}
+        
+        .timeline-dot {{
+            width: 30px;
+            height: 30px;
+            background: {timeline_color};
+            border-radius: 50%;
+            border: 5px solid {bg_color};
+        }}
+        
+        .phase-name {{
+            font-size: 38px;
+            font-weight: 600;
+            color: white;
+            margin-bottom: 20px;
+            letter-spacing: 0.5px;
+        }}
+        
+        .phase-description {{
+            font-size: 22px;
+            line-height: 1.6;
+            color: rgba(255, 255, 255, 0.9);
+            padding: 0 20px;
+            text-align: center;
+        }}
+        
+        {custom_css}
+    </style>
+</head>
+<body>
+    <h1 class="title">{title}</h1>
+    
+    <div class="markers-container">
+        <div class="phase-marker">
+            <div class="marker-pin" style="--marker-bg: {marker_light_color};">
+                <svg viewBox="0 0 80 80" class="marker-icon" style="color: {bg_color};">
+                    <path d="M30,25 Q30,15 40,15 Q45,15 45,20 Q50,15 55,20 Q60,15 60,25 Q60,30 55,35 Q60,40 55,45 Q55,50 50,50 Q45,55 40,50 Q35,55 30,50 Q25,50 25,45 Q20,40 25,35 Q20,30 30,25 Z" fill="none" stroke="currentColor" stroke-width="2.5"/>
+                    <circle cx="42" cy="30" r="3" fill="none" stroke="currentColor" stroke-width="2"/>
+                    <circle cx="48" cy="35" r="2" fill="none" stroke="currentColor" stroke-width="2"/>
+                    <path d="M35,30 Q35,35 40,35" fill="none" stroke="currentColor" stroke-width="2"/>
+                </svg>
+            </div>
+        </div>
+        <div class="phase-marker">
+            <div class="marker-pin" style="--marker-bg: {marker_dark_color};">
+                <svg viewBox="0 0 80 80" class="marker-icon" style="color: {bg_color};">
+                    <rect x="28" y="20" width="30" height="35" rx="3" fill="none" stroke="currentColor" stroke-width="2.5"/>
+                    <circle cx="43" cy="32" r="8" fill="none" stroke="currentColor" stroke-width="2.5"/>
+                    <path d="M40,32 L42,34 L46,30" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round"/>
+                    <line x1="32" y1="45" x2="38" y2="45" stroke="currentColor" stroke-width="2"/>
+                    <line x1="32" y1="50" x2="36" y2="50" stroke="currentColor" stroke-width="2"/>
+                    <path d="M48,30 L52,26 L54,28" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round"/>
+                </svg>
+            </div>
+        </div>
+        <div class="phase-marker">
+            <div class="marker-pin" style="--marker-bg: {marker_light_color};">
+                <svg viewBox="0 0 80 80" class="marker-icon" style="color: {bg_color};">
+                    <rect x="30" y="23" width="28" height="20" rx="2" fill="none" stroke="currentColor" stroke-width="2.5"/>
+                    <line x1="33" y1="27" x2="55" y2="27" stroke="currentColor" stroke-width="1.5"/>
+                    <line x1="33" y1="31" x2="55" y2="31" stroke="currentColor" stroke-width="1.5"/>
+                    <line x1="33" y1="35" x2="55" y2="35" stroke="currentColor" stroke-width="1.5"/>
+                    <line x1="33" y1="39" x2="50" y2="39" stroke="currentColor" stroke-width="1.5"/>
+                    <path d="M52,45 L55,52 L58,45 L55,48 Z" fill="currentColor" stroke="currentColor" stroke-width="1.5" stroke-linejoin="round"/>
+                </svg>
+            </div>
+        </div>
+        <div class="phase-marker">
+            <div class="marker-pin" style="--marker-bg: {marker_dark_color};">
+                <svg viewBox="0 0 80 80" class="marker-icon" style="color: {bg_color};">
+                    <path d="M32,25 L32,35 Q32,38 35,38 Q38,38 38,35 L38,25 L48,25 L48,35 L58,35 L58,45 L48,45 L48,55 L38,55 L38,45 Q38,42 35,42 Q32,42 32,45 L32,55 L22,55 L22,45 L22,35 L32,35 Z" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linejoin="round"/>
+                    <circle cx="35" cy="30" r="2" fill="currentColor"/>
+                    <circle cx="43" cy="40" r="2" fill="currentColor"/>
+                </svg>
+            </div>
+        </div>
+    </div>
+    
+    <div class="timeline-container">
+        <div class="timeline-items">
+            {timeline_html}
+        </div>
+    </div>
+</body>
+</html>'''
+    
+    return html_code
+
+def generate_timeline_slide(
+    main_title="COMPANY HISTORY",
+    subtitle="A journey of innovation and growth",
+    milestones=[
+        {"year": "2020", "title": "Foundation", "desc": "Started with a team of 5 visionaries."},
+        {"year": "2021", "title": "Series A", "desc": "Raised $10M to expand operations."},
+        {"year": "2022", "title": "Global Launch", "desc": "Entered 3 new international markets."},
+        {"year": "2023", "title": "Market Leader", "desc": "Achieved #1 status in the industry."}
+    ],
+    bg_color="#1E1E2E",
+    accent_color="#F43F5E",
+    text_color="#FFFFFF",
+    font_family="'Inter', sans-serif"
+):
+    """
+    Generates a horizontal timeline slide to visualize progress or history.
+    Layout: Horizontal axis with alternating or aligned milestones.
+    """
+    milestone_html = ""
+    start_x = 200
+    gap = 400
+    
+    for i, item in enumerate(milestones):
+        x_pos = start_x + (i * gap)
+        # Alternate positions for visual interest if desired, but kept linear here for flat structure reliability
+        top_pos_circle = 540 - 15  # Center line is at 540px
+        top_pos_title = 580  # Position for h3
+        top_pos_desc = 619   # Position for p (580 + 29 height + 10 spacing)
+        top_pos_year = 450
+        
+        milestone_html += f"""
+        <div style="position: absolute; left: {x_pos}px; top: {top_pos_circle}px; width: 30px; height: 30px; background: {accent_color}; border: 4px solid {bg_color}; border-radius: 50%; z-index: 2; box-shadow: 0 0 0 4px {accent_color}40;"></div>
+        
+        <div style="position: absolute; left: {x_pos - 60}px; top: {top_pos_year}px; width: 150px; text-align: center;">
+            <span style="font-size: 36px; font-weight: 800; color: {accent_color};">{item['year']}</span>
+        </div>
+        
+        <div style="position: absolute; left: {x_pos - 100}px; top: {top_pos_title}px; width: 230px; text-align: center;">
+            <h3 style="font-size: 24px; font-weight: 700; color: {text_color};">{item['title']}</h3>
+        </div>
+        <div style="position: absolute; left: {x_pos - 100}px; top: {top_pos_desc}px; width: 230px; text-align: center;">
+            <p style="font-size: 18px; color: {text_color}; opacity: 0.7; line-height: 1.4;">{item['desc']}</p>
+        </div>
+        """
+
+    html = f"""<!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="UTF-8">
+        <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;700;800&display=swap" rel="stylesheet">
+        <style>
+            * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+            html, body {{ width: 1920px; height: 1080px; font-family: {font_family}; background: {bg_color}; overflow: hidden; }}
+        </style>
+    </head>
+    <body>
+        <div style="position: absolute; top: 100px; left: 0; width: 1920px; text-align: center;">
+            <h1 style="font-size: 72px; font-weight: 800; color: {text_color}; margin-bottom: 20px;">{main_title}</h1>
+            <p style="font-size: 28px; color: {text_color}; opacity: 0.6;">{subtitle}</p>
+        </div>
+
+        <div style="position: absolute; top: 554px; left: 150px; width: 1620px; height: 2px; background: rgba(255,255,255,0.1);"></div>
+        <div style="position: absolute; top: 554px; left: 150px; width: {len(milestones) * gap}px; height: 2px; background: {accent_color};"></div>
+
+        {milestone_html}
+
+        <svg style="position: absolute; bottom: 0; right: 0; width: 400px; height: 400px; opacity: 0.05;" viewBox="0 0 200 200">
+            <circle cx="200" cy="200" r="180" fill="{text_color}" />
+        </svg>
+    </body>
+    </html>"""
+    return html
+
+def generate_quote_slide(
+    quote="Design is not  what it looks like and feels like. Design is how it works.",
+    author="Steve Jobs",
+    role="Co-founder, Apple",
+    bg_color="#FAF9F6",
+    quote_color="#18181B",
+    accent_color="#EA580C",
+    font_family="Playfair Display"
+):
+    """
+    Generates an elegant quote slide centered on screen.
+    """
+    html = f"""<!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="UTF-8">
+        <link href="https://fonts.googleapis.com/css2?family=Playfair+Display:ital,wght@0,400;0,700;1,400&family=Inter:wght@400;600&display=swap" rel="stylesheet">
+        <style>
+            * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+            html, body {{ width: 1920px; height: 1080px; font-family: {font_family}, serif; background: {bg_color}; overflow: hidden; }}
+        </style>
+    </head>
+    <body>
+        <!-- Decorative quotation mark -->
+        <div style="position: absolute; top: 180px; left: 200px; font-size: 300px; color: {accent_color}; opacity: 0.1; font-family: {font_family}, serif; line-height: 1; pointer-events: none;">"</div>
+        
+        <!-- Main quote text -->
+        <h1 style="position: absolute; top: 300px; left: 300px; width: 1320px; font-size: 80px; font-weight: 700; color: {quote_color}; line-height: 1.3; font-style: italic; text-align: center;">
+            {quote}
+        </h1>
+        
+        <!-- Accent line -->
+        <div style="position: absolute; top: 610px; left: 910px; width: 100px; height: 4px; background: {accent_color};"></div>
+        
+        <!-- Author name -->
+        <h3 style="position: absolute; top: 654px; left: 300px; width: 1320px; font-size: 36px; font-weight: 700; color: {quote_color}; font-family: Inter, sans-serif; text-align: center;">{author}</h3>
+        
+        <!-- Author role -->
+        <p style="position: absolute; top: 708px; left: 300px; width: 1320px; font-size: 24px; color: #71717A; font-family: Inter, sans-serif; text-align: center;">{role}</p>
+        
+        <div style="position: absolute; top: 60px; left: 60px; width: 1800px; height: 960px; border: 2px solid {quote_color}; opacity: 0.1; pointer-events: none;"></div>
+    </body>
+    </html>"""
+    return html
+
+def generate_classic_content_slide(
+    main_title="MARKET OPPORTUNITY",
+    paragraph="The global market for our solution is expanding rapidly. By leveraging our unique technology stack, we can capture significant market share in the next fiscal year.",
+    bullet_points=[
+        "Target audience growth of 15% YoY",
+        "Low competition in the premium segment",
+        "High barrier to entry for new players",
+        "Strong demand for automated solutions"
+    ],
+    image_url="https://images.unsplash.com/photo-1460925895917-afdab827c52f?q=80&w=2015&auto=format&fit=crop",
+    theme_color="#2563EB",
+    text_color="#1F2937",
+    bg_color="#FFFFFF"
+):
+    """
+    Generates a classic content slide with Title, Paragraph, Bullet Points (Left) and Image (Right).
+    Perfect for detailed explanations.
+    """
+    # Tạo HTML cho danh sách bullet points
+    bullets_html = ""
+    for i, point in enumerate(bullet_points):
+        top_pos = 500 + (i * 60)
+        bullets_html += f"""
+        <div style="position: absolute; left: 120px; top: {top_pos}px; width: 750px; height: 50px;">
+            <div style="display: flex; align-items: flex-start;">
+                <div style="width: 10px; height: 10px; background: {theme_color}; border-radius: 50%; margin-top: 12px; margin-right: 20px; flex-shrink: 0;"></div>
+                <p style="font-size: 24px; color: {text_color}; line-height: 1.4; width: 700px;">{point}</p>
+            </div>
+        </div>
+        """
+
+    html = f"""<!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="UTF-8">
+        <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700;800&display=swap" rel="stylesheet">
+        <style>
+            * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+            html, body {{ width: 1920px; height: 1080px; font-family: 'Inter', sans-serif; background: {bg_color}; overflow: hidden; }}
+        </style>
+    </head>
+    <body>
+        <div style="position: absolute; top: 100px; left: 120px;">
+            <div style="width: 100px; height: 8px; background: {theme_color}; margin-bottom: 30px;"></div>
+            <h1 style="font-size: 72px; font-weight: 800; color: {text_color}; margin-bottom: 40px; text-transform: uppercase;">{main_title}</h1>
+        </div>
+
+        <div style="position: absolute; top: 300px; left: 120px; width: 750px;">
+            <p style="font-size: 28px; line-height: 1.6; color: {text_color}; opacity: 0.8; margin-bottom: 40px;">
+                {paragraph}
+            </p>
+        </div>
+
+        {bullets_html}
+
+        <div style="position: absolute; top: 100px; right: 120px; width: 800px; height: 880px; border-radius: 30px; overflow: hidden; box-shadow: 0 20px 50px rgba(0,0,0,0.1);">
+            <img src="{image_url}" style="width: 100%; height: 100%; object-fit: cover;">
+        </div>
+        
+        <div style="position: absolute; bottom: 50px; left: 120px; font-size: 16px; color: {text_color}; opacity: 0.4;">
+            CONFIDENTIAL - {main_title}
+        </div>
+    </body>
+    </html>"""
+    return html
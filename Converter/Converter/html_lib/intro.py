@@ -0,0 +1,4345 @@
+"""Slide mở đầu / tiêu đề (SLIDE INTRO)."""
+
+#---------------------- SLIDE INTRO
+def generate_title_slide(
+    main_title="BUSINESS PLAN",
+    subtitle="2026 - 2030",
+    bg_color="#1a4b8c",
+    bg_gradient_to="#2a6cb7",
+    text_color="#FFFFFF",
+    font_family="'Inter', sans-serif",
+    show_skyline=True,
+    skyline_opacity=0.3,
+    triangle_opacity=0.2,
+    show_border=True,
+    custom_css=""
+):
+    """
+    Generate a professional title slide with a blue gradient background and geometric shapes.
+
+    :param main_title: Main title text (10-30 characters), displayed prominently in the center
+    :param subtitle: Subtitle text (5-20 characters), displayed below the main title
+    :param bg_color: Primary background color (hex code)
+    :param bg_gradient_to: Secondary background color for gradient effect (hex code)
+    :param text_color: Color of the title and subtitle text (hex code)
+    :param font_family: Font family for all text elements
+    :param show_skyline: Whether to show the city skyline silhouette at the bottom
+    :param skyline_opacity: Opacity of the skyline silhouette (0.0 to 1.0)
+    :param triangle_opacity: Opacity of the triangle decorative elements (0.0 to 1.0)
+    :param title_font_size: Font size for the main title
+    :param subtitle_font_size: Font size for the subtitle
+    :param show_border: Whether to show the dashed border frame
+    :param custom_css: Additional custom CSS to be included
+    :return: A string containing the HTML code for the slide
+    """
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{main_title}</title>
+    <link href="https://fonts.googleapis.com/css2?family=Roboto:wght@400;700&display=swap" rel="stylesheet">
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        html {{ font-size: 16px; width: 1920px; height: 1080px; }}
+        body, html {{
+            height: 1080px;
+            width: 1920px;
+            font-family: {font_family};
+            overflow: hidden;
+        }}
+        
+        .slide-container {{
+            width: 1920px;
+            height: 1080px;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            align-items: center;
+            background: linear-gradient(135deg, {bg_color} 0%, {bg_gradient_to} 100%);
+            position: relative;
+            color: {text_color};
+            padding: 60px;
+            box-sizing: border-box;
+        }}
+        
+        /* Content wrapper for scaling */
+        .content-wrapper {{
+            position: absolute;
+            left: 50%;
+            top: 50%;
+            transform: translate(-50%, -50%);
+            width: 1920px;
+            height: 1080px;
+            overflow: visible;
+            background: inherit;
+        }}
+        
+        .outer-wrapper {{
+            padding: 0;
+            box-sizing: border-box;
+            width: 1920px;
+            height: 1080px;
+            overflow: hidden;
+        }}
+
+        .content-frame {{
+            width: 90%;
+            max-width: 1200px;
+            padding: 80px;
+            position: relative;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            align-items: center;
+            z-index: 5;
+        }}
+        
+        .content-frame:not(.no-border) {{
+            border: 2px dashed rgba(255, 255, 255, 0.3);
+        }}
+        
+        .title {{
+            font-size: 6rem;
+            font-weight: bold;
+            text-align: center;
+            margin-bottom: 20px;
+            z-index: 10;
+            letter-spacing: 2px;
+        }}
+        
+        .subtitle {{
+            font-size: 4rem;
+            text-align: center;
+            z-index: 10;
+        }}
+        
+        /* Decorative triangles */
+        .triangle {{
+            position: absolute;
+            width: 0;
+            height: 0;
+            opacity: {triangle_opacity};
+            z-index: 1;
+        }}
+        
+        .triangle-1 {{
+            border-left: 100px solid transparent;
+            border-right: 100px solid transparent;
+            border-bottom: 200px solid rgba(255, 255, 255, 0.1);
+            top: 10%;
+            left: 5%;
+            transform: rotate(15deg);
+        }}
+        
+        .triangle-2 {{
+            border-left: 80px solid transparent;
+            border-right: 80px solid transparent;
+            border-bottom: 160px solid rgba(255, 255, 255, 0.1);
+            top: 20%;
+            right: 10%;
+            transform: rotate(-25deg);
+        }}
+        
+        .triangle-3 {{
+            border-left: 120px solid transparent;
+            border-right: 120px solid transparent;
+            border-bottom: 240px solid rgba(255, 255, 255, 0.1);
+            bottom: 5%;
+            left: 15%;
+            transform: rotate(45deg);
+        }}
+        
+        .triangle-4 {{
+            border-left: 90px solid transparent;
+            border-right: 90px solid transparent;
+            border-bottom: 180px solid rgba(255, 255, 255, 0.1);
+            bottom: 15%;
+            right: 5%;
+            transform: rotate(-35deg);
+        }}
+        
+        /* City skyline */
+        .skyline {{
+            position: absolute;
+            bottom: 0;
+            left: 0;
+            width: 100%;
+            height: 100px;
+            background-image: url('data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1000 100"><path d="M0,100 L0,70 L20,70 L20,40 L40,40 L40,60 L60,60 L60,50 L80,50 L80,80 L100,80 L100,60 L120,60 L120,30 L140,30 L140,50 L160,50 L160,70 L180,70 L180,50 L200,50 L200,30 L220,30 L220,40 L240,40 L240,60 L260,60 L260,50 L280,50 L280,70 L300,70 L300,40 L320,40 L320,60 L340,60 L340,50 L360,50 L360,30 L380,30 L380,60 L400,60 L400,40 L420,40 L420,70 L440,70 L440,50 L460,50 L460,60 L480,60 L480,30 L500,30 L500,50 L520,50 L520,40 L540,40 L540,60 L560,60 L560,70 L580,70 L580,50 L600,50 L600,40 L620,40 L620,60 L640,60 L640,30 L660,30 L660,50 L680,50 L680,70 L700,70 L700,60 L720,60 L720,40 L740,40 L740,50 L760,50 L760,30 L780,30 L780,60 L800,60 L800,50 L820,50 L820,70 L840,70 L840,40 L860,40 L860,60 L880,60 L880,50 L900,50 L900,30 L920,30 L920,60 L940,60 L940,40 L960,40 L960,70 L980,70 L980,50 L1000,50 L1000,100 Z" fill="black" opacity="0.3"/></svg>');
+            background-size: cover;
+            opacity: {skyline_opacity};
+            display: {("block" if show_skyline else "none")};
+            z-index: 2;
+        }}
+        
+        @media (max-width: 768px) {{
+            .outer-wrapper {{
+                transform: scale(0.4);
+                transform-origin: top left;
+            }}
+        }}
+        
+        @media (max-width: 480px) {{
+            .outer-wrapper {{
+                transform: scale(0.25);
+                transform-origin: top left;
+            }}
+        }}
+        
+        {custom_css}
+    </style>
+</head>
+<body>
+    <div class="outer-wrapper">
+        <div class="content-wrapper">
+            <div class="slide-container">
+                <!-- Decorative triangles -->
+                <div class="triangle triangle-1"></div>
+                <div class="triangle triangle-2"></div>
+                <div class="triangle triangle-3"></div>
+                <div class="triangle triangle-4"></div>
+                
+                <!-- Content -->
+                <div class="content-frame{(" no-border" if not show_border else "")}">
+                    <h1 class="title">{main_title}</h1>
+                    <div class="subtitle">{subtitle}</div>
+                </div>
+                
+                <!-- City skyline -->
+                <div class="skyline"></div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+
+    return html_code
+
+def generate_introduction_slide(
+    main_title="INTRODUCTION",
+    content_text="Lorem ipsum dolor sit amet, consectetur adipiscing elit. Suspendisse quis enim pretium, bibendum ante ullamcorper, tincidunt augue. ",
+    bg_color="#1a4b8c",
+    bg_gradient_to="#2a6cb7",
+    text_color="#FFFFFF",
+    font_family="'Inter', sans-serif",
+    show_decorative_triangles=True,
+    triangle_opacity=0.15,
+    show_border=True,
+    border_opacity=0.4,
+    content_max_width="800px",
+    line_height="1.6",
+    letter_spacing="0.1em",
+    custom_css=""
+):
+    """
+    Generate a professional introduction slide with gradient background and decorative elements.
+
+    :param main_title: Main title text (8-20 characters) or list where first element is title
+    :param content_text: Main content paragraph or list where first element is content
+    :param bg_color: Primary background color (hex code)
+    :param bg_gradient_to: Secondary background color for gradient effect (hex code)
+    :param text_color: Color of all text elements (hex code)
+    :param title_font_size: Font size for the main title
+    :param content_font_size: Font size for the content text
+    :param font_family: Font family for all text elements
+    :param show_decorative_triangles: Whether to show decorative triangle elements
+    :param triangle_opacity: Opacity of the decorative triangles (0.0 to 1.0)
+    :param show_border: Whether to show the dashed border frame
+    :param border_opacity: Opacity of the border frame (0.0 to 1.0)
+    :param content_max_width: Maximum width of the content area
+    :param line_height: Line height for the content text
+    :param letter_spacing: Letter spacing for the title
+    :param custom_css: Additional custom CSS to be included
+    :return: A string containing the HTML code for the slide
+    """
+
+    # Extract title and content if they're lists
+    if isinstance(main_title, list) and len(main_title) > 0:
+        main_title = main_title[0]
+    
+    if isinstance(content_text, list) and len(content_text) > 0:
+        content_text = content_text[0]
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{main_title}</title>
+    <link href="https://fonts.googleapis.com/css2?family=Roboto:wght@300;400;700&display=swap" rel="stylesheet">
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        html {{ font-size: 16px; width: 1920px; height: 1080px; }}
+        body, html {{
+            height: 1080px;
+            width: 1920px;
+            font-family: {font_family};
+            overflow: hidden;
+        }}
+        
+        .slide-container {{
+            width: 1920px;
+            height: 1080px;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            align-items: center;
+            background: linear-gradient(135deg, {bg_color} 0%, {bg_gradient_to} 100%);
+            position: relative;
+            color: {text_color};
+            padding: 60px;
+            box-sizing: border-box;
+        }}
+        
+        /* Content wrapper for scaling */
+        .content-wrapper {{
+            position: absolute;
+            left: 50%;
+            top: 50%;
+            transform: translate(-50%, -50%);
+            width: 1920px;
+            height: 1080px;
+            overflow: visible;
+            background: inherit;
+        }}
+        
+        .outer-wrapper {{
+            padding: 0;
+            box-sizing: border-box;
+            width: 1920px;
+            height: 1080px;
+            overflow: hidden;
+        }}
+
+        .content-frame {{
+            width: 100%;
+            max-width: 1400px;
+            padding: 80px;
+            position: relative;
+            text-align: center;
+        }}
+        
+        .content-frame:not(.no-border) {{
+            border: 3px dashed rgba(255, 255, 255, 0.4);
+            border-radius: 12px;
+        }}
+        
+        
+        .title {{
+            font-size: 6rem;
+            font-weight: 700;
+            margin-bottom: 40px;
+            letter-spacing: {letter_spacing};
+            text-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+        }}
+        
+        .content {{
+            font-size: 2.25rem;
+            line-height: {line_height};
+            font-weight: 300;
+            text-align: center;
+            max-width: 90%;
+            margin: 0 auto;
+            text-shadow: 0 1px 2px rgba(0, 0, 0, 0.1);
+        }}
+        
+        /* Decorative triangles */
+        .triangle {{
+            position: absolute;
+            opacity: {triangle_opacity if show_decorative_triangles else 0};
+            z-index: 1;
+        }}
+        
+        .triangle-top-left {{
+            top: 5%;
+            left: 5%;
+            width: 0;
+            height: 0;
+            border-left: 120px solid transparent;
+            border-right: 120px solid transparent;
+            border-bottom: 200px solid rgba(255, 255, 255, 0.1);
+            transform: rotate(15deg);
+        }}
+        
+        .triangle-top-right {{
+            top: 8%;
+            right: 8%;
+            width: 0;
+            height: 0;
+            border-left: 100px solid transparent;
+            border-right: 100px solid transparent;
+            border-bottom: 180px solid rgba(255, 255, 255, 0.1);
+            transform: rotate(-25deg);
+        }}
+        
+        .triangle-bottom-left {{
+            bottom: 10%;
+            left: 3%;
+            width: 0;
+            height: 0;
+            border-left: 80px solid transparent;
+            border-right: 80px solid transparent;
+            border-bottom: 140px solid rgba(255, 255, 255, 0.1);
+            transform: rotate(45deg);
+        }}
+        
+        .triangle-bottom-right {{
+            bottom: 5%;
+            right: 5%;
+            width: 0;
+            height: 0;
+            border-left: 110px solid transparent;
+            border-right: 110px solid transparent;
+            border-bottom: 190px solid rgba(255, 255, 255, 0.1);
+            transform: rotate(-35deg);
+        }}
+        
+        /* Additional geometric shapes */
+        .geometric-shape {{
+            position: absolute;
+            opacity: {triangle_opacity * 0.7 if show_decorative_triangles else 0};
+            z-index: 2;
+        }}
+        
+        .shape-1 {{
+            top: 15%;
+            left: 15%;
+            width: 60px;
+            height: 60px;
+            background: rgba(255, 255, 255, 0.05);
+            transform: rotate(45deg);
+        }}
+        
+        .shape-2 {{
+            top: 20%;
+            right: 20%;
+            width: 40px;
+            height: 40px;
+            background: rgba(255, 255, 255, 0.05);
+            border-radius: 50%;
+        }}
+        
+        .shape-3 {{
+            bottom: 25%;
+            left: 20%;
+            width: 50px;
+            height: 50px;
+            background: rgba(255, 255, 255, 0.05);
+            clip-path: polygon(50% 0%, 0% 100%, 100% 100%);
+        }}
+        
+        @media (max-width: 768px) {{
+            .outer-wrapper {{
+                transform: scale(0.4);
+                transform-origin: top left;
+            }}
+        }}
+        
+        @media (max-width: 480px) {{
+            .outer-wrapper {{
+                transform: scale(0.25);
+                transform-origin: top left;
+            }}
+        }}
+        
+        {custom_css}
+    </style>
+</head>
+<body>
+    <div class="outer-wrapper">
+        <div class="content-wrapper">
+            <div class="slide-container">
+                <!-- Decorative triangles -->
+                <div class="triangle triangle-top-left"></div>
+                <div class="triangle triangle-top-right"></div>
+                <div class="triangle triangle-bottom-left"></div>
+                <div class="triangle triangle-bottom-right"></div>
+                
+                <!-- Additional geometric shapes -->
+                <div class="geometric-shape shape-1"></div>
+                <div class="geometric-shape shape-2"></div>
+                <div class="geometric-shape shape-3"></div>
+                
+                <!-- Main content -->
+                <div class="content-frame{(" no-border" if not show_border else "")}">
+                    <h1 class="title">{main_title}</h1>
+                    <div class="content">{content_text}</div>
+                </div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+
+    return html_code
+
+def generate_intro_slide1(
+    main_title="Main Title",
+    subtitle1="Subtitle1",
+    subtitle2="Subtitle2",
+    main_bg_color="#ffffff",
+    accent_bg_color="#6ea88a",
+    text_box_bg_color="#c5e6b8",
+    title_color="#333333",
+    subtitle_color="#555555",
+    line_color="#e6c35c",
+    font_family="'Inter', sans-serif",
+    main_title_font_style="italic",
+    image_url="Image/generate_intro_slide1/Default_1.png"        # Thêm tham số cho URL ảnh
+):
+    """
+    Tạo slide HTML với thiết kế marketing có nền tràn viền như các slide khác.
+    Các tham số kích thước nên được truyền vào dưới dạng chuỗi với đơn vị REM.
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Marketing Slide</title>
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; }}
+        body, html {{
+            height: 100vh;
+            width: 100vw;
+            font-family: {font_family};
+            background-color: {accent_bg_color};
+            overflow: hidden;
+        }}
+
+        .slide-container {{
+            width: 100%;
+            height: 100%;
+            position: relative;
+            background-color: {accent_bg_color};
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            padding: 5rem 7.5rem; /* 80px 120px */
+        }}
+
+        .slide-inner-container {{
+            width: 100%;
+            height: 100%;
+            max-width: 105rem; /* 1680px */
+            max-height: 57.5rem; /* 920px */
+            background-color: {main_bg_color};
+            border-radius: 1rem; /* 16px */
+            box-shadow: 0 1.25rem 2.5rem rgba(0,0,0,0.15);
+            position: relative;
+            overflow: hidden;
+            display: flex;
+        }}
+        
+        .left-content {{
+            flex: 0 0 60%;
+            height: 100%;
+            position: relative;
+            background-color: {main_bg_color};
+            display: flex;
+            align-items: center;
+            justify-content: center;
+        }}
+        
+        .right-content {{
+            flex: 0 0 40%;
+            height: 100%;
+            background-color: {accent_bg_color};
+            position: relative;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+        }}
+        
+        .image-container {{
+            width: 80%;
+            height: 70%;
+            background-color: white;
+            border-radius: 1rem;
+            box-shadow: 0 1rem 2rem rgba(0,0,0,0.15);
+            overflow: hidden;
+            position: relative;
+            z-index: 3;
+        }}
+        
+        .image-container img {{
+            width: 100%;
+            height: 100%;
+            object-fit: cover;
+        }}
+        
+        .accent-bar-top {{
+            position: absolute;
+            top: 0;
+            left: 0;
+            width: 4rem; /* 64px - larger for better visibility */
+            height: 2rem; /* 32px */
+            background-color: {text_box_bg_color};
+            z-index: 1;
+        }}
+        
+        .accent-bar-middle {{
+            position: absolute;
+            top: 50%;
+            left: 0;
+            right: 0;
+            height: 4rem; /* 64px - larger */
+            background-color: {text_box_bg_color};
+            transform: translateY(-50%);
+            z-index: 1;
+        }}
+        
+        .content-box {{
+            background-color: {text_box_bg_color};
+            padding: 6rem; /* Increased padding */
+            border-radius: 1.5rem; /* Rounded corners */
+            z-index: 2;
+            position: relative;
+            width: 85%; 
+            height: 85%; 
+            max-width: none; 
+            box-shadow: 0 1.5rem 3rem rgba(0,0,0,0.15); /* Deeper shadow */
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            border: 1px solid rgba(255,255,255,0.2);
+        }}
+        
+        .main-title {{
+            font-size: 5.5rem; /* Larger title */
+            color: {title_color};
+            margin: 0 0 2.5rem 0; 
+            font-weight: 800;
+            font-style: {main_title_font_style};
+            line-height: 1.1;
+            text-align: center;
+            letter-spacing: -0.02em;
+        }}
+        
+        .subtitle {{
+            font-size: 2.2rem; /* Larger subtitle */
+            color: {subtitle_color};
+            margin: 1.5rem 0; 
+            line-height: 1.5;
+            text-align: center;
+            font-weight: 300;
+        }}
+        
+        .divider {{
+            width: 60%; 
+            height: 0.4rem; 
+            background-color: {line_color};
+            margin: 3.5rem auto 0 auto; 
+            border-radius: 0.2rem;
+            opacity: 0.8;
+        }}
+        
+        .decorative-element {{
+            position: absolute;
+            background-color: {text_box_bg_color};
+            opacity: 0.5;
+            z-index: 1;
+        }}
+        
+        .deco-1 {{
+            top: 1rem;
+            right: 1rem;
+            width: 4rem; /* 64px - smaller so they don't interfere with image */
+            height: 4rem;
+            border-radius: 50%;
+        }}
+        
+        .deco-2 {{
+            bottom: 1rem;
+            right: 1rem;
+            width: 3rem; /* 48px - smaller square */
+            height: 3rem;
+            transform: rotate(45deg);
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="slide-inner-container">
+            <!-- Accent bars -->
+            <div class="accent-bar-top"></div>
+            <div class="accent-bar-middle"></div>
+            
+            <!-- Left content area -->
+            <div class="left-content">
+                <div class="content-box">
+                    <h1 class="main-title">{main_title}</h1>
+                    <p class="subtitle">{subtitle1}</p>
+                    <p class="subtitle">{subtitle2}</p>
+                </div>
+            </div>
+            
+            <!-- Right content area -->
+            <div class="right-content">
+                <div class="image-container">
+                    <img src="{image_url}" alt="slide visual">
+                </div>
+                <div class="decorative-element deco-1"></div>
+                <div class="decorative-element deco-2"></div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+def generate_elegant_intro_slide(
+    main_title="My Amazing Presentation",
+    subtitle="This is a test slide to demonstrate the improved layout and styling.",
+    image_url="https://images.pexels.com/photos/3807735/pexels-photo-3807735.jpeg?auto=compress&cs=tinysrgb&w=1260&h=750&dpr=1",
+    font_family="'Be Vietnam Pro', sans-serif",
+    background_color="#EAE3D9",
+    text_color="#4A403A",
+    decoration_color_start="#F7DC6F",
+    decoration_color_end="#C9A842"
+):
+    """
+    Generates an elegant intro slide optimized for 1920x1080 screenshots with balanced layout.
+    Features improved proportions, spacing, and visual hierarchy.
+    """
+
+    # SVG Definitions
+    gradient_def = f"""
+    <linearGradient id="goldGradient" x1="0%" y1="0%" x2="100%" y2="100%">
+        <stop offset="0%" style="stop-color:{decoration_color_start};stop-opacity:1" />
+        <stop offset="100%" style="stop-color:{decoration_color_end};stop-opacity:1" />
+    </linearGradient>
+    """
+    
+    star_svg = """
+    <svg class="star" viewBox="0 0 100 100" xmlns="http://www.w3.org/2000/svg">
+        <polygon points="50,0 61,39 100,50 61,61 50,100 39,61 0,50 39,39" fill="url(#goldGradient)"/>
+    </svg>
+    """
+    
+    botanical_frame_svg = f"""
+    <svg class="botanical-frame" viewBox="0 0 200 200" xmlns="http://www.w3.org/2000/svg">
+        <defs>{gradient_def}</defs>
+        <g fill="url(#goldGradient)" stroke="url(#goldGradient)" stroke-width="1" stroke-linecap="round">
+            <!-- Main Stem -->
+            <path d="M 190,10 C 120,80 110,120 10,190" fill="none" stroke-width="2"/>
+
+            <!-- Leaves on the right -->
+            <path d="M 190,10 C 180,50 160,60 145,60 C 160,60 170,80 185,90" fill="none"/>
+            <path d="M 160,65 C 150,95 120,110 110,105 C 120,110 130,130 145,140" fill="none"/>
+
+            <!-- Leaves on the left -->
+            <path d="M 80,185 C 110,175 125,150 120,140 C 125,150 145,160 160,170" fill="none"/>
+            <path d="M 15,190 C 45,180 60,150 55,145 C 60,150 80,165 95,175" fill="none"/>
+
+            <!-- Berries -->
+            <circle cx="120" cy="80" r="4"/>
+            <circle cx="105" cy="125" r="4"/>
+            <circle cx="70" cy="165" r="4"/>
+        </g>
+    </svg>
+    """
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Elegant Intro Slide</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Be+Vietnam+Pro:wght@400;700&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; width: 1920px; height: 1080px; }}
+        body, html {{
+            height: 1080px;
+            width: 1920px;
+            font-family: {font_family};
+            background-color: {background_color};
+            color: {text_color};
+            overflow: hidden;
+        }}
+
+        .slide-container {{
+            width: 1920px;
+            height: 1080px;
+            position: relative;
+            background-color: {background_color};
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            align-items: center;
+            padding: 80px 120px;
+            gap: 80px;
+        }}
+
+        .text-column {{
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            padding-right: 40px;
+            z-index: 10;
+        }}
+
+        .main-title {{
+            font-size: 112px;
+            font-weight: 700;
+            line-height: 1.1;
+            margin-bottom: 40px;
+            max-width: 720px;
+        }}
+
+        .subtitle {{
+            font-size: 36px;
+            line-height: 1.6;
+            opacity: 0.85;
+            max-width: 600px;
+            font-weight: 400;
+        }}
+
+        .image-column {{
+            position: relative;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+        }}
+
+        .image-wrapper {{
+            position: relative;
+            width: 100%;
+            max-width: 560px;
+            height: 420px;
+            border-radius: 16px;
+            overflow: hidden;
+            box-shadow: 0 20px 40px rgba(0,0,0,0.15);
+        }}
+
+        .main-image {{
+            width: 100%;
+            height: 100%;
+            object-fit: cover;
+            display: block;
+        }}
+
+        /* --- Decorations --- */
+        .star-cluster {{
+            position: absolute;
+            top: -20px;
+            left: -20px;
+            width: 80px;
+            height: 80px;
+            pointer-events: none;
+            z-index: 20;
+        }}
+        
+        .star-cluster .star {{ 
+            position: absolute; 
+            opacity: 0.9; 
+        }}
+        
+        .star-cluster .star:nth-child(1) {{ 
+            width: 28px; 
+            height: 28px; 
+            top: 0; 
+            left: 0; 
+        }}
+        
+        .star-cluster .star:nth-child(2) {{ 
+            width: 22px; 
+            height: 22px; 
+            top: 30px; 
+            left: 10px; 
+        }}
+        
+        .star-cluster .star:nth-child(3) {{ 
+            width: 18px; 
+            height: 18px; 
+            top: 8px; 
+            left: 36px; 
+        }}
+
+        .botanical-frame {{
+            position: absolute;
+            bottom: -40px;
+            right: -40px;
+            width: 200px;
+            height: 200px;
+            opacity: 0.8;
+            pointer-events: none;
+            transform: scaleX(-1);
+            z-index: 5;
+        }}
+
+        /* Content wrapper for scaling */
+        .content-wrapper {{
+            position: absolute;
+            left: 50%;
+            top: 50%;
+            transform: translate(-50%, -50%);
+            width: 1920px;
+            height: 1080px;
+            overflow: visible;
+            background: inherit;
+        }}
+        
+        .outer-wrapper {{
+            padding: 0;
+            box-sizing: border-box;
+            width: 1920px;
+            height: 1080px;
+            overflow: hidden;
+        }}
+
+    </style>
+</head>
+<body>
+    <div class="outer-wrapper">
+        <div class="content-wrapper">
+            <div class="slide-container">
+                <div class="text-column">
+                    <h1 class="main-title">{main_title}</h1>
+                    <p class="subtitle">{subtitle}</p>
+                </div>
+                <div class="image-column">
+                    <div class="image-wrapper">
+                        <img class="main-image" src="{image_url}" alt="Introductory image" />
+                        <div class="star-cluster">
+                            {star_svg}
+                            {star_svg}
+                            {star_svg}
+                        </div>
+                        {botanical_frame_svg}
+                    </div>
+                </div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+def generate_title_slide_2(
+    main_title="THIS IS YOUR<br><span class='highlight'>PRESENTATION</span><br>TITLE",
+    font_family="'Montserrat', 'Inter', sans-serif",
+    accent_color="#06B6D4",
+    shadow_color="#0E7490",
+    text_color="#6B7280",
+    icon_color="#D1D5DB"
+):
+    """
+    Generates a modern, corporate title slide with a dynamic diagonal split.
+    Features a two-tone color panel. The title can optionally contain a highlighted word.
+    """
+
+    # SVG icon for a presentation chart
+    icon_svg = f"""
+    <svg class="icon-svg" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="{icon_color}" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+        <path d="M3 3v18h18"/>
+        <path d="m19 9-5 5-4-4-3 3"/>
+    </svg>
+    """
+
+    # SVG clip-path definition for the diagonal shape
+    clip_path_svg = """
+    <svg width="0" height="0">
+      <defs>
+        <clipPath id="angled-title-divider" clipPathUnits="objectBoundingBox">
+          <polygon points="0.3 0, 1 0, 1 1, 0 1" />
+        </clipPath>
+      </defs>
+    </svg>
+    """
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Corporate Title Slide</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@800&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; }}
+        body, html {{
+            height: 100vh;
+            width: 100vw;
+            font-family: {font_family};
+            overflow: hidden;
+            background-color: #FFFFFF;
+        }}
+
+        .slide-container {{
+            width: 100%;
+            height: 100%;
+            display: flex;
+            position: relative;
+            border-top: 4px solid #F3F4F6;
+        }}
+
+        .text-column {{
+            flex: 1;
+            padding: 4rem;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+        }}
+        
+        .color-column {{
+            flex: 1;
+            position: relative;
+            background-color: {accent_color};
+            clip-path: url(#angled-title-divider);
+        }}
+
+        .color-column::before {{
+            content: '';
+            position: absolute;
+            top: 0;
+            left: 0;
+            width: 100%;
+            height: 100%;
+            background-color: {shadow_color};
+            clip-path: url(#angled-title-divider);
+            transform: translateX(-1.5rem);
+            z-index: -1;
+        }}
+        
+        .icon-svg {{
+            width: 3rem;
+            height: 3rem;
+            margin-bottom: 1.5rem;
+        }}
+
+        .main-title {{
+            font-size: clamp(2.5rem, 7vw, 6rem);
+            font-weight: 800;
+            color: {text_color};
+            line-height: 1.1;
+            text-transform: uppercase;
+        }}
+        
+        .highlight {{
+            color: {accent_color};
+        }}
+        
+        @media (max-width: 48rem) {{
+            .text-column {{ text-align: center; align-items: center; }}
+            .color-column {{ display: none; }}
+        }}
+
+    </style>
+</head>
+<body>
+    {clip_path_svg}
+    <div class="slide-container">
+        <div class="text-column">
+            {icon_svg}
+            <h1 class="main-title">{main_title}</h1>
+        </div>
+        <div class="color-column"></div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+def generate_dynamic_intro_slide(
+    # ĐÃ THAY ĐỔI: Chữ mặc định mới, phù hợp với font lớn
+    main_title="Innovate. Create. Inspire.",
+    subtitle="This is where we outline our core mission and the driving force behind our vision.",
+    # ĐÃ THAY ĐỔI: Ảnh nền mới, hiện đại hơn
+    image_url="https://images.unsplash.com/photo-1521737711867-e3b97375f902?q=80&w=1887&auto=format&fit=crop",
+    font_family="'Poppins', 'Inter', sans-serif",
+    primary_color="#4F46E5",
+    secondary_color="#3730A3",
+    text_color="#FFFFFF"
+):
+    """
+    Generates a dynamic introductory slide with larger fonts for greater impact,
+    an angled divider, and geometric decorations.
+    """
+    
+    clip_path_svg = """
+    <svg width="0" height="0">
+      <defs>
+        <clipPath id="angled-divider" clipPathUnits="objectBoundingBox">
+          <polygon points="0 0, 1 0, 1 0.85, 0.85 1, 0 1" />
+        </clipPath>
+      </defs>
+    </svg>
+    """
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Dynamic Intro Slide - Large Text</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@400;800&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; }}
+        body, html {{
+            height: 100vh;
+            width: 100vw;
+            font-family: {font_family};
+            overflow: hidden;
+        }}
+
+        .slide-container {{
+            width: 100%;
+            height: 100%;
+            display: flex;
+            background-color: white;
+        }}
+
+        .text-column {{
+            flex: 1.2;
+            background-color: {primary_color};
+            color: {text_color};
+            clip-path: url(#angled-divider);
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            padding: 6rem 5rem;
+        }}
+
+        .image-column {{
+            flex: 1;
+            background-image: url('{image_url}');
+            background-size: cover;
+            background-position: center;
+        }}
+
+        .title-group {{
+            flex: 1;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+        }}
+
+        .main-title {{
+            font-size: clamp(3.5rem, 6vw, 6rem);
+            font-weight: 700;
+            line-height: 1.15;
+            margin-bottom: 6rem;
+            letter-spacing: -0.02em;
+        }}
+
+        .subtitle {{
+            font-size: 2rem;
+            font-weight: 400;
+            line-height: 1.6;
+            opacity: 0.95;
+            max-width: 42rem;
+        }}
+
+        .footer-decor {{
+            width: 100%;
+            height: 5rem;
+            background-color: {secondary_color};
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            padding: 0 2rem;
+        }}
+        
+        .arcs {{
+            width: 5rem;
+            height: 5rem;
+            position: relative;
+        }}
+        .arcs::before, .arcs::after {{
+            content: '';
+            position: absolute;
+            border-radius: 50%;
+            border: 0.125rem solid {text_color};
+            left: -3.5rem;
+            top: 50%;
+            transform: translateY(-50%);
+        }}
+        .arcs::before {{ width: 7rem; height: 7rem; }}
+        .arcs::after {{ width: 6rem; height: 6rem; }}
+
+        .dots-grid {{
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            gap: 0.5rem;
+        }}
+        .dot {{
+            width: 0.75rem;
+            height: 0.75rem;
+            background-color: {text_color};
+            border-radius: 50%;
+        }}
+        
+        @media (max-width: 64rem) {{
+            .text-column {{
+                flex: 1;
+                clip-path: none;
+            }}
+            .image-column {{ flex: 1; }}
+        }}
+
+        @media (max-width: 48rem) {{
+            .slide-container {{ flex-direction: column; }}
+            .text-column, .image-column {{ flex: none; width: 100%; }}
+            .text-column {{ height: 60vh; padding: 2.5rem; justify-content: center; text-align: center; }}
+            .image-column {{ height: 40vh; }}
+            .footer-decor {{ display: none; }}
+        }}
+    </style>
+</head>
+<body>
+    {clip_path_svg}
+    <div class="slide-container">
+        <div class="text-column">
+            <div class="title-group">
+                <h1 class="main-title">{main_title}</h1>
+                <p class="subtitle">{subtitle}</p>
+            </div>
+            <div class="footer-decor">
+                <div class="arcs"></div>
+                <div class="dots-grid">
+                    <div class="dot"></div><div class="dot"></div>
+                    <div class="dot"></div><div class="dot"></div>
+                </div>
+            </div>
+        </div>
+        <div class="image-column"></div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+def generate_big_concept_slide(
+    main_title="BIG<br>CONCEPT",
+    subtitle="Bring the attention of your audience over a key concept using icons or illustrations",
+    icon_name="space",
+    font_family="'Poppins', 'Inter', sans-serif",
+    bg_color="#0F172A",
+    text_color="#FFFFFF"
+):
+    """
+    Generates a 'Big Concept' slide with a space-themed illustration (planet and stars).
+    Maintains the geometric corner design and clean, bold typography.
+    """
+    
+    # SVG definitions - The red rocket has been removed.
+    icons = {
+        "space": f"""
+            <div class="illustration-container">
+                <svg class="icon-planet" viewBox="0 0 60 60" fill="#7DD3FC" xmlns="http://www.w3.org/2000/svg">
+                    <path d="M51.9,20.6c-3-5.2-7.8-9.1-13.6-11.1C32.1,7.2,25.4,6,18.9,6.9c-5.1,0.7-9.8,2.7-13.7,5.9C-2,19.9-0.2,31.8,7,39
+                        c4.5,4.5,10.4,7,16.8,7c5.6,0,11-1.8,15.5-5.1C48,35.1,53.8,27.7,51.9,20.6z"/>
+                    <path d="M58.5,39.6c-2.3,0-4.5-0.3-6.7-0.8c-7.2-1.8-12.2-6.5-14-12.7c-0.7-2.5-0.6-5.1,0.2-7.6c0.5-1.5,1.1-3,1.9-4.3
+                        c-4,6.3-4.3,14.2-0.8,20.8c2.9,5.5,8.5,9.3,15,10.2c1.4,0.2,2.8,0.3,4.2,0.3c3.7,0,7.3-0.9,10.5-2.6
+                        C67.1,43.2,63.1,39.6,58.5,39.6z"/>
+                    <circle cx="21.5" cy="18.9" r="1.5" fill="#0F172A"/>
+                    <circle cx="16.9" cy="25.5" r="1" fill="#0F172A"/>
+                    <circle cx="27.8" cy="26.9" r="2" fill="#0F172A"/>
+                </svg>
+                <svg class="icon-star" style="top: 0; right: 8rem;" viewBox="0 0 24 24" fill="#FACC15" xmlns="http://www.w3.org/2000/svg"><path d="M12,17.3l-5.3,3.2l1.4-6.2L3.5,9.5l6.3-0.5L12,3.2l2.2,5.8l6.3,0.5l-4.6,4.8l1.4,6.2L12,17.3z"/></svg>
+                <svg class="icon-star" style="top: 5rem; right: 0;" viewBox="0 0 24 24" fill="#FACC15" xmlns="http://www.w3.org/2000/svg"><path d="M12,17.3l-5.3,3.2l1.4-6.2L3.5,9.5l6.3-0.5L12,3.2l2.2,5.8l6.3,0.5l-4.6,4.8l1.4,6.2L12,17.3z"/></svg>
+                <svg class="icon-star" style="top: 10rem; right: 6rem;" viewBox="0 0 24 24" fill="#FACC15" xmlns="http://www.w3.org/2000/svg"><path d="M12,17.3l-5.3,3.2l1.4-6.2L3.5,9.5l6.3-0.5L12,3.2l2.2,5.8l6.3,0.5l-4.6,4.8l1.4,6.2L12,17.3z"/></svg>
+            </div>
+        """
+    }
+    
+    icon_svg_html = icons.get(icon_name, "<div>Icon not found</div>")
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Big Concept Slide</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@600;800&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; }}
+        body, html {{
+            height: 100vh;
+            width: 100vw;
+            font-family: {font_family};
+            overflow: hidden;
+            background-color: {bg_color};
+            color: {text_color};
+        }}
+
+        .slide-container {{
+            width: 100%; height: 100%;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            position: relative;
+            padding: 4rem;
+        }}
+        
+        .main-content-grid {{
+            display: grid;
+            grid-template-columns: 1.2fr 1fr;
+            align-items: center;
+            gap: 2rem;
+            width: 100%;
+            max-width: 80rem;
+            z-index: 10;
+        }}
+
+        .text-column {{
+            padding-right: 3rem;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+        }}
+        
+        .big-title {{
+            font-size: 5.5rem;
+            font-weight: 800;
+            line-height: 1.05;
+            text-transform: uppercase;
+            margin-bottom: 3rem;
+            letter-spacing: -0.02em;
+        }}
+
+        .subtitle {{
+            font-size: 2rem;
+            line-height: 1.6;
+            font-weight: 400;
+            max-width: 90%;
+            opacity: 0.95;
+        }}
+        
+        .icon-column {{
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            position: relative;
+            height: 25rem;
+        }}
+        
+        .illustration-container {{
+            position: relative;
+            width: 100%;
+            height: 100%;
+        }}
+        
+        .illustration-container svg {{
+            position: absolute;
+            transform: rotate(-15deg);
+        }}
+        
+        .icon-planet {{ width: 15rem; height: 15rem; top: 2rem; right: 1rem; }}
+        /* Rocket CSS rule removed */
+        .icon-star {{ width: 2.5rem; height: 2.5rem; }}
+
+        /* Reused Geometric Shapes */
+        .shape-cluster {{ position: absolute; pointer-events: none; z-index: 1; transform: scale(0.85); }}
+        .shape {{ position: absolute; border-radius: 8px; }}
+        .top-right {{ top: 5rem; right: 5rem; width: 25rem; height: 20rem; }}
+        .shape-tr-1 {{ width: 14rem; height: 14rem; background-color: #1E3A8A; opacity: 0.6; top: 0; right: 8rem; transform: rotate(15deg); }}
+        .shape-tr-2 {{ width: 15rem; height: 15rem; background-color: #34D399; opacity: 0.7; top: 2rem; right: 0; transform: rotate(25deg); }}
+        .shape-tr-3 {{ width: 13rem; height: 13rem; background-color: #6366F1; opacity: 0.6; top: 8rem; right: 10rem; transform: rotate(35deg); }}
+        .shape-tr-4 {{ width: 12rem; height: 12rem; background: linear-gradient(45deg, #F59E0B, #FBBF24); opacity: 0.8; top: 12rem; right: 2rem; transform: rotate(10deg); }}
+        .bottom-left {{ bottom: 3rem; left: -5rem; width: 25rem; height: 20rem; }}
+        .shape-bl-1 {{ width: 12rem; height: 12rem; background-color: #4F46E5; opacity: 0.5; bottom: 0; left: 10rem; transform: rotate(-25deg); }}
+        .shape-bl-2 {{ width: 14rem; height: 14rem; background-color: #10B981; opacity: 0.4; bottom: 8rem; left: 2rem; transform: rotate(-35deg); }}
+        .shape-bl-3 {{ width: 16rem; height: 16rem; background: linear-gradient(45deg, #EF4444, #F97316); opacity: 0.7; bottom: 0; left: 0; transform: rotate(-15deg); }}
+
+        @media (max-width: 64rem) {{
+            .main-content-grid {{ grid-template-columns: 1fr; text-align: center; }}
+            .text-column {{ padding-right: 0; order: 2; }}
+            .icon-column {{ order: 1; height: 15rem; margin-bottom: 2rem; }}
+            .subtitle {{ max-width: none; }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="shape-cluster top-right"></div>
+        <div class="shape-cluster bottom-left"></div>
+        <div class="main-content-grid">
+            <div class="text-column">
+                <h1 class="big-title">{main_title}</h1>
+                <p class="subtitle">{subtitle}</p>
+            </div>
+            <div class="icon-column">
+                {icon_svg_html}
+            </div>
+        </div>
+        <div class="shape-cluster top-right">
+            <div class="shape shape-tr-1"></div><div class="shape shape-tr-2"></div><div class="shape shape-tr-3"></div><div class="shape shape-tr-4"></div>
+        </div>
+        <div class="shape-cluster bottom-left">
+             <div class="shape shape-bl-1"></div><div class="shape shape-bl-2"></div><div class="shape shape-bl-3"></div>
+        </div>
+    </div>
+</body>
+</html>"""
+    return html_code
+
+def generate_elegant_agenda_slide(
+    main_title="Bài thuyết trình hôm nay",
+    subtitle="CHỦ ĐỀ CHÍNH",
+    agenda_items=[
+        "Về công ty chúng tôi",
+        "Dịch vụ mạng xã hội",
+        "Vấn đề/Cơ hội",
+        "Giải pháp của chúng tôi",
+        "Thực hiện kế hoạch",
+        "Đội ngũ của chúng tôi"
+    ],
+    # --- Hình ảnh và màu sắc ---
+    image_url="https://images.unsplash.com/photo-1484417894907-623942c8ee29?q=80&w=2832&auto=format&fit=crop",
+    accent_color="#EAD6D6", # Dusty Rose
+    bg_color="#FCFCFC",
+    title_color="#1F2937", # Dark Gray
+    subtitle_color="#B48E8E",
+    text_color="#4B5563", # Medium Gray
+    # --- Font chữ ---
+    font_family_title="'Playfair Display', serif",
+    font_family_body="'Montserrat', sans-serif",
+    custom_css=""
+):
+    """
+    Generates an elegant, minimalist agenda or table of contents slide.
+    Features a two-column layout with a framed image on the left and a text list on the right.
+    """
+    
+    agenda_list_html = "".join([f"<li class='agenda-item'>{item}</li>" for item in agenda_items])
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="vi">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{main_title}</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Playfair+Display:ital,wght@1,500&family=Montserrat:wght@400;600&display=swap" rel="stylesheet">
+    <style>
+        :root {{ font-size: 16px; }}
+        body, html {{
+            margin: 0; padding: 0; height: 100%; width: 100%;
+            font-family: {font_family_body};
+            overflow: hidden;
+            background-color: {bg_color};
+        }}
+        
+        .slide-container {{
+            width: 100%; height: 100vh;
+            display: flex; align-items: center; justify-content: center;
+            padding: 4vw; box-sizing: border-box;
+        }}
+        
+        .content-wrapper {{
+            display: flex; align-items: center; justify-content: center;
+            width: 100%; max-width: 75rem; /* 1200px */
+        }}
+        
+        /* Image Section with Decorative Frame */
+        .image-section {{
+            flex: 1;
+            position: relative;
+            height: 28rem; /* 448px */
+        }}
+        .accent-bg {{
+            position: absolute;
+            top: 0;
+            left: 0;
+            width: 90%;
+            height: 90%;
+            background-color: {accent_color};
+            z-index: 1;
+        }}
+        .main-image {{
+            position: absolute;
+            bottom: 0;
+            right: 0;
+            width: 90%;
+            height: 90%;
+            object-fit: cover;
+            z-index: 2;
+            box-shadow: 0 1rem 2rem rgba(0,0,0,0.1);
+        }}
+        
+        /* Text Section */
+        .text-section {{
+            flex: 1;
+            padding-left: 5rem;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+        }}
+        
+        .main-title {{
+            font-family: {font_family_title};
+            font-size: 5rem;
+            font-weight: 600;
+            font-style: italic;
+            color: {title_color};
+            margin: 0 0 2rem 0;
+            line-height: 1.15;
+            letter-spacing: -0.01em;
+        }}
+        
+        .subtitle {{
+            font-size: 1.15rem;
+            font-weight: 600;
+            color: {subtitle_color};
+            text-transform: uppercase;
+            letter-spacing: 0.25em;
+            margin-bottom: 2.5rem;
+        }}
+
+        .agenda-list {{
+            list-style: none;
+            padding: 0;
+            margin: 0;
+        }}
+        .agenda-item {{
+            font-size: 1.75rem;
+            color: {text_color};
+            margin-bottom: 1.5rem;
+            font-weight: 400;
+            line-height: 1.4;
+        }}
+
+        /* Responsive Design */
+        @media (max-width: 56.25em) {{ /* 900px */
+            .text-section {{ padding-left: 3rem; }}
+            .main-title {{ font-size: 3rem; }}
+            .agenda-item {{ font-size: 1rem; }}
+        }}
+        @media (max-width: 48em) {{ /* 768px */
+            .content-wrapper {{ flex-direction: column; }}
+            .image-section {{ width: 80%; height: 20rem; margin-bottom: 3rem; }}
+            .text-section {{ width: 80%; padding-left: 0; text-align: center; }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="content-wrapper">
+            <div class="image-section">
+                <div class="accent-bg"></div>
+                <img src="{image_url}" alt="Workspace" class="main-image">
+            </div>
+            <div class="text-section">
+                <h1 class="main-title">{main_title}</h1>
+                <h3 class="subtitle">{subtitle}</h3>
+                <ul class="agenda-list">
+                    {agenda_list_html}
+                </ul>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    return html_code
+
+def generate_playful_title_slide(
+    main_title="Introduction<br>to penguins",
+    subtitle="Introduce penguins here. Mention their characteristics and unique behaviors.",
+    illustration_character="penguin",
+    font_family_title="'Patrick Hand', cursive",
+    font_family_body="'Lato', sans-serif",
+    top_bg_color="#FFC947",
+    bottom_bg_color="#E8715D",
+    text_color="#2D2D2D",
+    doodle_color="#89CFF0"
+):
+    """
+    Generates a friendly, hand-drawn style title slide. Features a large, charming
+    illustration and playful typography, perfect for educational or light-hearted topics.
+    """
+    illustrations = {
+        "penguin": f"""
+            <div class="illustration-wrapper">
+                <svg class="doodle doodle-1" viewBox="0 0 100 50"><path d="M 10 40 Q 30 10 50 25 T 90 20" stroke="{doodle_color}" stroke-width="8" fill="none" stroke-linecap="round"/></svg>
+                <svg class="doodle doodle-2" viewBox="0 0 30 30"><path d="M15 2 L19 11 L29 11 L21 17 L24 27 L15 21 L6 27 L9 17 L1 11 L11 11 Z" fill="{doodle_color}"/></svg>
+                <svg class="doodle doodle-3" viewBox="0 0 100 50"><path d="M 10 20 Q 30 40 50 25 T 90 30" stroke="{doodle_color}" stroke-width="8" fill="none" stroke-linecap="round"/></svg>
+                <svg class="doodle doodle-4" viewBox="0 0 30 30"><path d="M15 2 L19 11 L29 11 L21 17 L24 27 L15 21 L6 27 L9 17 L1 11 L11 11 Z" fill="{doodle_color}"/></svg>
+                <svg class="penguin-svg" viewBox="0 0 200 220" xmlns="http://www.w3.org/2000/svg"><g transform="translate(0, 10)"><path d="M 80 200 Q 70 205 60 200 L 65 210 Z" fill="#E8B48E"/><path d="M 120 200 Q 130 205 140 200 L 135 210 Z" fill="#E8B48E"/><path d="M 100 0 C 40 0, 10 60, 10 130 Q 10 200, 100 200 Q 190 200, 190 130 C 190 60, 160 0, 100 0 Z" fill="#2D2D2D"/><path d="M 100 55 C 70 55, 50 80, 50 130 Q 50 180, 100 180 Q 150 180, 150 130 C 150 80, 130 55, 100 55 Z" fill="#FFFFFF"/><path d="M 100 20 C 140 20, 160 60, 150 90 L 100 80 L 50 90 C 40 60, 60 20, 100 20 Z" fill="#FFFFFF"/><rect x="65" y="80" width="70" height="25" fill="#D92E2E" rx="5"/><path d="M 90 65 L 110 65 L 100 78 Z" fill="#FF8C61"/><circle cx="85" cy="55" r="5" fill="#2D2D2D"/><circle cx="115" cy="55" r="5" fill="#2D2D2D"/><circle cx="70" cy="65" r="8" fill="#FADADD" opacity="0.8"/><circle cx="130" cy="65" r="8" fill="#FADADD" opacity="0.8"/><path d="M 80 90 L 65 160 L 85 155 L 95 95 Z" fill="#D92E2E" transform="rotate(-5, 80, 90)"/><rect x="68" y="98" width="12" height="5" fill="#FFFFFF"/><rect x="67" y="110" width="14" height="5" fill="#FFFFFF"/><rect x="66" y="122" width="16" height="5" fill="#FFFFFF"/><rect x="65" y="134" width="18" height="5" fill="#FFFFFF"/><path d="M 65 160 L 63 168 M 70 158 L 68 166 M 75 157 L 73 165 M 80 156 L 78 164 M 85 155 L 83 163" stroke="#FFFFFF" stroke-width="2" stroke-linecap="round"/><path d="M 95 18 Q 100 10 105 18" stroke="#2D2D2D" stroke-width="2" fill="none" stroke-linecap="round"/></g></svg>
+            </div>
+        """
+    }
+    illustration_html = illustrations.get(illustration_character, "<div>Illustration not found.</div>")
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8"><meta name="viewport" content="width=device-width, initial-scale=1.0"><title>Playful Title Slide</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com"><link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Patrick+Hand&family=Lato:wght@400;700&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }} html {{ font-size: 16px; }}
+        body, html {{ height: 100vh; width: 100vw; overflow: hidden; }}
+        .slide-container {{ width: 100%; height: 100%; background-color: {top_bg_color}; position: relative; display: grid; grid-template-columns: 1fr 1fr; align-items: center; padding: 4rem 5rem; }}
+        .slide-container::after {{ content: ''; position: absolute; bottom: 0; left: 0; width: 100%; height: 15%; background-color: {bottom_bg_color}; z-index: 0; }}
+        .text-column {{ z-index: 10; display: flex; flex-direction: column; justify-content: center; }}
+        .main-title {{ font-family: 'Patrick Hand', cursive; font-size: clamp(3.5rem, 8vw, 6.5rem); font-weight: 400; color: #2D2D2D; line-height: 1.15; margin-bottom: 2.5rem; }}
+        .subtitle {{ font-family: {font_family_body}; font-size: 2rem; color: {text_color}; line-height: 1.6; max-width: 45ch; font-weight: 400; }}
+        .illustration-column {{ z-index: 5; display: flex; align-items: center; justify-content: center; }}
+        .illustration-wrapper {{ position: relative; width: 90%; max-width: 450px; }}
+        .penguin-svg {{ width: 100%; height: auto; filter: drop-shadow(5px 5px 10px rgba(0,0,0,0.1)); }}
+        .doodle {{ position: absolute; opacity: 0.7; }}
+        .doodle-1 {{ width: 6rem; top: 0; left: 25%; transform: rotate(15deg); }}
+        .doodle-2 {{ width: 2rem; top: 2rem; right: 0; transform: rotate(25deg); }}
+        .doodle-3 {{ width: 6rem; bottom: 5rem; right: -1rem; transform: rotate(-20deg) scaleX(-1); }}
+        .doodle-4 {{ width: 2rem; bottom: 2rem; left: 0; transform: rotate(-15deg); }}
+        @media (max-width: 48rem) {{ .slide-container {{ grid-template-columns: 1fr; text-align: center; }} .text-column {{ order: 2; }} .illustration-column {{ order: 1; }} .subtitle {{ margin: 0 auto; }} }}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="text-column"><h1 class="main-title">{main_title}</h1><p class="subtitle">{subtitle}</p></div>
+        <div class="illustration-column">{illustration_html}</div>
+    </div>
+</body>
+</html>"""
+    return html_code
+
+def generate_minimalist_title_slide(
+    main_title="This is your presentation title",
+    subtitle="A subtitle to provide more context or a tagline",
+    author_line="Presented by Your Name / Company",
+    font_family="'Inter', sans-serif",
+    bg_color="#111827",
+    text_color="#F9FAFB",
+    subtitle_color="#E5E7EB",
+    accent_color="#38BDF8"
+):
+    """
+    Generates a stunning, STATIC high-tech title slide with a dark theme
+    and a glowing portal. The portal no longer animates.
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Modern Title Slide</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;800&display=swap" rel="stylesheet">
+    <style>
+        :root {{
+            --accent-color: {accent_color};
+        }}
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; }}
+        body, html {{
+            height: 100vh;
+            width: 100vw;
+            font-family: {font_family};
+            overflow: hidden;
+            background-color: {bg_color};
+            color: {text_color};
+        }}
+
+        .slide-container {{
+            width: 100%;
+            height: 100%;
+            display: flex;
+            align-items: center;
+            justify-content: flex-start;
+            padding: 4rem 5rem;
+            position: relative;
+        }}
+
+        .text-content {{
+            max-width: 50%;
+            z-index: 2;
+        }}
+
+        .main-title {{
+            font-size: clamp(3.5rem, 8vw, 6.5rem);
+            font-weight: 800;
+            line-height: 1.15;
+            margin-bottom: 2rem;
+        }}
+
+        .subtitle {{
+            font-size: 1.85rem;
+            line-height: 1.6;
+            color: {subtitle_color};
+            opacity: 0.9;
+            margin-bottom: 3rem;
+            max-width: 35ch;
+        }}
+        
+        .author-line {{
+            font-size: 1.3rem;
+            text-transform: uppercase;
+            letter-spacing: 0.1em;
+            opacity: 0.7;
+        }}
+
+        .glowing-portal {{
+            position: absolute;
+            width: 45rem;
+            height: 45rem;
+            right: -10rem;
+            top: 50%;
+            transform: translateY(-50%);
+            border: 4px solid var(--accent-color);
+            border-radius: 50%;
+            box-shadow: 
+                0 0 20px 0 var(--accent-color),
+                inset 0 0 20px 0 var(--accent-color),
+                0 0 60px 10px rgba(56, 189, 248, 0.3);
+            /* ĐÃ XÓA: animation: spin 80s linear infinite; */
+            z-index: 1;
+        }}
+
+        /* ĐÃ XÓA: @keyframes spin */
+
+        @media (max-width: 64rem) {{
+            .slide-container {{ 
+                flex-direction: column;
+                justify-content: center;
+                text-align: center;
+                padding: 2rem;
+            }}
+            .text-content {{ max-width: 100%; }}
+            .glowing-portal {{
+                width: 30rem;
+                height: 30rem;
+                right: 50%;
+                top: 50%;
+                transform: translate(50%, -50%);
+                opacity: 0.3;
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="glowing-portal"></div>
+        <div class="text-content">
+            <h1 class="main-title">{main_title}</h1>
+            <p class="subtitle">{subtitle}</p>
+            <p class="author-line">{author_line}</p>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+def generate_mission_slide(
+    top_text="Subheading or Category",
+    title="Your Main Title Here",
+    subtitle="Elaborate on your key message or provide a call to action. This text can be a bit longer.",
+    image_url="https://images.unsplash.com/photo-1521737604893-d14cc237f11d?q=80&w=2084&auto=format&fit=crop", 
+    image_alt_text="A team collaborating in a modern office, representing mission and goals",
+    font_family="'Inter', sans-serif",
+    background_color_left="#F5EBE0",
+    text_color_title="#4E443F",
+    text_color_top="#4E443F",
+    text_color_subtitle="#475569",
+    slide_background_color="#FDFCFB"
+):
+    """
+    Generates a mission slide with an adjusted layout: smaller titles and a larger, more prominent description area.
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en"> 
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Mission and Goals - Adjusted Layout</title>
+    <style>
+        :root {{
+            --base-font-size: 16px; 
+        }}
+
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body, html {{
+            height: 100vh;
+            width: 100vw;
+            font-family: {font_family};
+            overflow: hidden;
+            font-size: var(--base-font-size);
+        }}
+        
+        .slide-container {{
+            width: 100vw;
+            height: 100vh;
+            background-color: {slide_background_color}; 
+            display: flex;
+            overflow: hidden;
+        }}
+        
+        .left-column {{
+            /* ĐÃ SỬA ĐỔI: Tăng không gian cho cột văn bản (từ 2 thành 3) */
+            flex: 3; 
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            overflow-y: auto; 
+        }}
+
+        .left-column-top-content {{
+            background-color: {background_color_left};
+            padding: 3rem 4rem; /* Điều chỉnh lại padding */
+            border-top-right-radius: 1.5rem; 
+            border-bottom-right-radius: 1.5rem; 
+            /* ĐÃ SỬA ĐỔI: Giảm chiều cao tối thiểu để nhường không gian cho description */
+            min-height: 45vh;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+        }}
+        
+        .top-text {{
+            /* ĐÃ SỬA ĐỔI: Giảm kích thước chữ */
+            font-size: 1.3rem;
+            color: {text_color_top};
+            margin-bottom: 0.75rem;
+            font-weight: 600;
+            letter-spacing: 0.05em;
+        }}
+        
+        .main-title {{
+            /* ĐÃ SỬA ĐỔI: Giảm kích thước chữ của tiêu đề chính */
+            font-size: clamp(3rem, 5vw, 5rem); 
+            color: {text_color_title};
+            font-weight: 700;
+            line-height: 1.2;
+            margin-bottom: 1rem;
+        }}
+        
+        .subtitle-text {{
+            /* ĐÃ SỬA ĐỔI: Tăng kích thước chữ của description và padding */
+            font-size: 1.85rem; 
+            color: {text_color_subtitle};
+            line-height: 1.7;
+            padding: 3rem 4rem; 
+            flex-grow: 1;
+            font-weight: 400;
+        }}
+        
+        .right-column {{
+            /* ĐÃ SỬA ĐỔI: Giữ nguyên flex: 1 để cột trái rộng hơn */
+            flex: 1; 
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            overflow: hidden;
+            padding: 2rem; 
+        }}
+        
+        .right-column img {{
+            display: block;
+            width: 100%; 
+            height: 100%; 
+            object-fit: cover; 
+            border-radius: 1rem; 
+        }}
+
+        @media (max-width: 48rem) {{ 
+            .slide-container {{
+                flex-direction: column;
+            }}
+            .left-column, .right-column {{
+                flex: none; /* Reset flex ratio on mobile */
+            }}
+            .left-column {{
+                order: 1;
+                width: 100%; 
+                height: auto; 
+            }}
+            .left-column-top-content {{
+                border-radius: 0; 
+                padding: 2.5rem 2rem;
+                min-height: 0; 
+            }}
+            .main-title {{
+                font-size: clamp(2rem, 7vw, 2.8rem);
+            }}
+            .subtitle-text {{
+                font-size: 1.1rem;
+                padding: 2rem;
+            }}
+            .right-column {{
+                order: 2;
+                width: 100%; 
+                height: 40vh; 
+                padding: 1.5rem; 
+            }}
+        }}
+
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="left-column">
+            <div class="left-column-top-content">
+                <p class="top-text">{top_text}</p>
+                <h1 class="main-title">{title}</h1>
+            </div>
+            <p class="subtitle-text">{subtitle}</p>
+        </div>
+        <div class="right-column">
+            <img src="{image_url}" alt="{image_alt_text}">
+        </div>
+    </div>
+</body>
+</html>"""
+    return html_code
+
+# moi by Nam
+def generate_training_intro_slide(
+    main_title="Introduction",
+    description_text="Briefly introduce yourself and explain the purpose of your training presentation. Discuss its objectives, and give the audience an idea of what to expect in the coming slides.",
+    bg_color="#3a3a3a",
+    title_color="#b8d89f",
+    text_color="#e8d7a8",
+    image_url="https://images.pexels.com/photos/3587620/pexels-photo-3587620.jpeg?auto=compress&cs=tinysrgb&w=1260&h=750&dpr=1",
+    font_family="'Inter', sans-serif",
+):
+    """
+    Generate a training introduction slide with dark background and bottom image.
+    
+    This slide features a two-section layout:
+    - Top section: Dark background with title and description text
+    - Bottom section: Full-width training/professional image
+    
+    :param main_title: Main title text (e.g., "Introduction")
+    :param description_text: Description or explanation text below title
+    :param bg_color: Background color for the top section (hex code)
+    :param title_color: Color for the main title (hex code, light green by default)
+    :param text_color: Color for the description text (hex code, light yellow by default)
+    :param image_url: URL of the image to display in bottom section
+    :param font_family: Font family for all text elements
+    :param title_font_size: Font size for the main title
+    :param text_font_size: Font size for the description text
+    :param image_height: Height of the image section (percentage or px)
+    :param custom_css: Additional custom CSS to be included
+    :return: A string containing the HTML code for the slide
+    """
+    
+    # Extract values if they're lists
+    if isinstance(main_title, list) and len(main_title) > 0:
+        main_title = main_title[0]
+    
+    if isinstance(description_text, list) and len(description_text) > 0:
+        description_text = description_text[0]
+    
+    if isinstance(image_url, list) and len(image_url) > 0:
+        image_url = image_url[0]
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{main_title}</title>
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        html {{ 
+            font-size: 16px; 
+            width: 100%;
+            height: 100%;
+        }}
+        
+        body, html {{
+            height: 100vh;
+            width: 100vw;
+            font-family: {font_family};
+            overflow: hidden;
+        }}
+        
+        .slide-container {{
+            width: 100%;
+            height: 100%;
+            display: flex;
+            flex-direction: column;
+            background: {bg_color};
+            position: relative;
+        }}
+        
+        /* Content wrapper for scaling */
+        .content-wrapper {{
+            position: absolute;
+            left: 0;
+            top: 0;
+            width: 100%;
+            height: 100%;
+            overflow: hidden;
+            background: inherit;
+        }}
+        
+        .outer-wrapper {{
+            padding: 0;
+            box-sizing: border-box;
+            width: 100%;
+            height: 100%;
+            overflow: hidden;
+        }}
+        
+        /* Top text section */
+        .text-section {{
+            flex: 1;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            padding: 5% 7%;
+            background: {bg_color};
+        }}
+        
+        .title {{
+            font-size: clamp(2rem, 8vw, 7rem);
+            font-weight: 300;
+            color: {title_color};
+            margin-bottom: 2rem;
+            letter-spacing: 0.02em;
+            line-height: 1.1;
+        }}
+        
+        .description {{
+            font-size: clamp(1rem, 2.5vw, 2.4rem);
+            color: {text_color};
+            line-height: 1.5;
+            max-width: 90%;
+            font-weight: 300;
+        }}
+        
+        /* Bottom image section */
+        .image-section {{
+            height: 55%;
+            width: 100%;
+            overflow: hidden;
+            position: relative;
+        }}
+        
+        .image-section img {{
+            width: 100%;
+            height: 100%;
+            object-fit: cover;
+            object-position: center;
+            display: block;
+        }}
+        
+
+    </style>
+</head>
+<body>
+    <div class="outer-wrapper">
+        <div class="content-wrapper">
+            <div class="slide-container">
+                <!-- Top text section -->
+                <div class="text-section">
+                    <h1 class="title">{main_title}</h1>
+                    <p class="description">{description_text}</p>
+                </div>
+                
+                <!-- Bottom image section -->
+                <div class="image-section">
+                    <img src="{image_url}" alt="Training introduction image">
+                </div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+def generate_employee_intro_slide(
+    main_title="Employee Transition Plan",
+    subtitle="Use the following infographics to outline how your team or company will manage responsibilities and workflow during employee movement.",
+    bg_color="#0d4d3d",
+    title_color="#FFFFFF",
+    subtitle_color="#FFFFFF",
+    circle_color_1="#0a3d2f",
+    circle_color_2="#10855b",
+    circle_color_3="#2dd4bf",
+    circle_color_4="#FFFFFF",
+    font_family="'Inter', sans-serif",
+):
+    """
+    Generate an Employee Introduction slide with decorative geometric circles.
+    
+    This function creates a modern presentation slide featuring:
+    - Company name in top left
+    - Large main title
+    - Descriptive subtitle
+    - Decorative overlapping circles on the right side
+    - Professional green color scheme
+    
+    Args:
+        company_name (str): Company name displayed at top left
+        main_title (str): Main slide title
+        subtitle (str): Descriptive text below title
+        bg_color (str): Background color (default: dark green)
+        company_text_color (str): Color for company name (default: cyan)
+        title_color (str): Color for main title (default: white)
+        subtitle_color (str): Color for subtitle (default: white)
+        circle_color_1 (str): First circle color (darkest green)
+        circle_color_2 (str): Second circle color (medium green)
+        circle_color_3 (str): Third circle color (light cyan)
+        circle_color_4 (str): Fourth circle color (white)
+        font_family (str): Font family for all text
+        
+    Returns:
+        str: Complete HTML code for the slide
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Employee Transition Plan</title>
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body {{
+            font-family: {font_family};
+            overflow: hidden;
+        }}
+        
+        .slide-container {{
+            width: 1920px;
+            height: 1080px;
+            background: {bg_color};
+            position: relative;
+            overflow: hidden;
+        }}
+        
+        .content-wrapper {{
+            position: relative;
+            width: 100%;
+            height: 100%;
+            padding: 80px 150px;
+            z-index: 2;
+        }}
+
+        .main-content {{
+            max-width: 900px;
+        }}
+        
+        .main-title {{
+            color: {title_color};
+            font-size: 96px;
+            font-weight: 700;
+            line-height: 1.1;
+            margin-bottom: 40px;
+        }}
+        
+        .subtitle {{
+            color: {subtitle_color};
+            font-size: 24px;
+            line-height: 1.6;
+            font-weight: 400;
+            max-width: 700px;
+        }}
+        
+        .decorative-circles {{
+            position: absolute;
+            right: 0;
+            top: 50%;
+            transform: translateY(-50%);
+            width: 900px;
+            height: 900px;
+            z-index: 1;
+        }}
+        
+        .circle {{
+            position: absolute;
+            border-radius: 50%;
+        }}
+        
+        .circle-1 {{
+            width: 600px;
+            height: 600px;
+            background: radial-gradient(circle at 25% 25%, {circle_color_1}, #051f18, #000000);
+            top: -80px;
+            right: 180px;
+            opacity: 0.95;
+            box-shadow: 
+                0 40px 100px rgba(0, 0, 0, 0.5),
+                inset 0 0 80px rgba(45, 212, 191, 0.1);
+        }}
+        
+        .circle-2 {{
+            width: 520px;
+            height: 520px;
+            background: radial-gradient(circle at 35% 35%, {circle_color_2}, #0a5a3e, #042820);
+            top: 40px;
+            right: 120px;
+            opacity: 0.9;
+            box-shadow: 
+                0 35px 80px rgba(16, 133, 91, 0.4),
+                inset 0 0 60px rgba(45, 212, 191, 0.15);
+        }}
+        
+        .circle-3 {{
+            width: 450px;
+            height: 450px;
+            background: radial-gradient(circle at 30% 30%, {circle_color_3}, #16a174, #0e7557);
+            top: 140px;
+            right: 60px;
+            opacity: 0.95;
+            box-shadow: 
+                0 30px 70px rgba(45, 212, 191, 0.3),
+                inset 0 0 50px rgba(255, 255, 255, 0.1);
+        }}
+        
+        .circle-4 {{
+            width: 380px;
+            height: 380px;
+            background: radial-gradient(circle at 25% 25%, {circle_color_4}, #d1fae5, #a7f3d0);
+            top: 250px;
+            right: 10px;
+            opacity: 1;
+            box-shadow: 
+                0 25px 60px rgba(255, 255, 255, 0.2),
+                inset 0 0 40px rgba(45, 212, 191, 0.2);
+        }}
+        
+        .circle-accent-1 {{
+            width: 250px;
+            height: 250px;
+            background: radial-gradient(circle at 50% 50%, rgba(45, 212, 191, 0.4), rgba(45, 212, 191, 0.1), transparent);
+            top: -120px;
+            right: 450px;
+            opacity: 0.7;
+            filter: blur(30px);
+        }}
+        
+        .circle-accent-2 {{
+            width: 180px;
+            height: 180px;
+            background: radial-gradient(circle at 50% 50%, rgba(255, 255, 255, 0.3), rgba(255, 255, 255, 0.1), transparent);
+            bottom: -80px;
+            right: 300px;
+            opacity: 0.6;
+            filter: blur(35px);
+        }}
+        
+        .circle-accent-3 {{
+            width: 320px;
+            height: 320px;
+            background: radial-gradient(circle at 50% 50%, rgba(16, 133, 91, 0.5), rgba(16, 133, 91, 0.2), transparent);
+            top: 50%;
+            right: 650px;
+            transform: translateY(-50%);
+            opacity: 0.5;
+            filter: blur(40px);
+        }}
+        
+        .circle-ring {{
+            width: 700px;
+            height: 700px;
+            border: 3px solid rgba(45, 212, 191, 0.2);
+            top: -100px;
+            right: 150px;
+            opacity: 0.4;
+        }}
+        
+        .circle-ring-2 {{
+            width: 500px;
+            height: 500px;
+            border: 2px solid rgba(255, 255, 255, 0.15);
+            top: 100px;
+            right: 200px;
+            opacity: 0.3;
+        }}
+        
+        /* Responsive wrapper for preview */
+        .wrapper {{
+            width: 100vw;
+            height: 100vh;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            background: #1a1a1a;
+        }}
+        
+        .scale-container {{
+            transform-origin: center center;
+        }}
+        
+    </style>
+</head>
+<body>
+    <div class="wrapper">
+        <div class="scale-container" id="scaleContainer">
+            <div class="slide-container">
+                <div class="decorative-circles">
+                    <div class="circle circle-ring"></div>
+                    <div class="circle circle-ring-2"></div>
+                    <div class="circle circle-accent-1"></div>
+                    <div class="circle circle-accent-2"></div>
+                    <div class="circle circle-accent-3"></div>
+                    <div class="circle circle-1"></div>
+                    <div class="circle circle-2"></div>
+                    <div class="circle circle-3"></div>
+                    <div class="circle circle-4"></div>
+                </div>
+                
+                <div class="content-wrapper">
+                    <div class="main-content">
+                        <h1 class="main-title">{main_title}</h1>
+                        <p class="subtitle">{subtitle}</p>
+                    </div>
+                </div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+
+def generate_research_proposal_slide(
+    title="Research Proposal Presentation",
+    subtitle="PRODUCT RESEARCH PROPOSAL FOR INGOUDE COMPANY",
+    bg_color="#FFFFFF",
+    accent_color="#C4A57B",
+    title_color="#000000",
+    subtitle_color="#9B8B6F",
+    left_bar_width="60"
+):
+    """
+    Generate a minimalist research proposal title slide with geometric decorations.
+    
+    This function creates a clean, professional slide featuring:
+    - Large bold title text
+    - Subtitle in accent color
+    - Geometric decorative elements (circles, arches, dots, bar)
+    - Modern minimalist aesthetic
+    
+    Args:
+        title (str): Main title text for the slide
+        subtitle (str): Subtitle/description text
+        bg_color (str): Background color (default: white)
+        accent_color (str): Color for decorative elements (default: tan/brown)
+        title_color (str): Color for main title (default: black)
+        subtitle_color (str): Color for subtitle (default: darker tan)
+        left_bar_width (str): Width of left decorative bar in pixels
+    
+    Returns:
+        str: Complete HTML code for the slide
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Research Proposal Presentation</title>
+    <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@700;900&family=Inter:wght@400;500&display=swap" rel="stylesheet">
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body {{
+            font-family: 'Inter', sans-serif;
+            background-color: {bg_color};
+            overflow: hidden;
+        }}
+        
+        .slide-container {{
+            width: 1920px;
+            height: 1080px;
+            position: relative;
+            background-color: {bg_color};
+            overflow: hidden;
+        }}
+        
+        /* Left decorative bar */
+        .left-bar {{
+            position: absolute;
+            left: 0;
+            top: 180px;
+            width: {left_bar_width}px;
+            height: 180px;
+            background-color: {accent_color};
+            opacity: 0.9;
+        }}
+        
+        /* Content area */
+        .content {{
+            position: absolute;
+            left: 120px;
+            top: 50%;
+            transform: translateY(-50%);
+            max-width: 1200px;
+            z-index: 10;
+        }}
+        
+        .title {{
+            font-family: 'Montserrat', sans-serif;
+            font-size: 110px;
+            font-weight: 900;
+            color: {title_color};
+            line-height: 1.1;
+            margin-bottom: 40px;
+            letter-spacing: -2px;
+        }}
+        
+        .subtitle {{
+            font-family: 'Inter', sans-serif;
+            font-size: 28px;
+            font-weight: 500;
+            color: {subtitle_color};
+            letter-spacing: 4px;
+            text-transform: uppercase;
+        }}
+        
+        /* Decorative elements container */
+        .decorations {{
+            position: absolute;
+            top: 0;
+            right: 0;
+            width: 100%;
+            height: 100%;
+            pointer-events: none;
+            overflow: hidden;
+            background-image: 
+                linear-gradient({accent_color} 1px, transparent 1px),
+                linear-gradient(90deg, {accent_color} 1px, transparent 1px);
+            background-size: 40px 40px;
+            opacity: 0.1;
+        }}
+        
+        /* Central crosshair */
+        .crosshair {{
+            position: absolute;
+            top: 50%;
+            left: 50%;
+            transform: translate(-50%, -50%);
+            width: 400px;
+            height: 400px;
+        }}
+        
+        .crosshair-line {{
+            position: absolute;
+            background-color: {accent_color};
+            opacity: 0.6;
+        }}
+        
+        .crosshair-line.horizontal {{
+            top: 50%;
+            left: 0;
+            width: 100%;
+            height: 2px;
+            transform: translateY(-50%);
+        }}
+        
+        .crosshair-line.vertical {{
+            top: 0;
+            left: 50%;
+            width: 2px;
+            height: 100%;
+            transform: translateX(-50%);
+        }}
+        
+        /* Geometric shapes */
+        .geometric-shape {{
+            position: absolute;
+            border: 2px solid {accent_color};
+            opacity: 0.5;
+        }}
+        
+        .triangle {{
+            top: 200px;
+            right: 300px;
+            width: 0;
+            height: 0;
+            border-left: 50px solid transparent;
+            border-right: 50px solid transparent;
+            border-bottom: 86px solid {accent_color};
+            opacity: 0.4;
+        }}
+        
+        .square {{
+            bottom: 300px;
+            right: 200px;
+            width: 80px;
+            height: 80px;
+            background-color: transparent;
+        }}
+        
+        .hexagon {{
+            top: 400px;
+            left: 600px;
+            width: 100px;
+            height: 57px;
+            background-color: {accent_color};
+            position: relative;
+            opacity: 0.3;
+        }}
+        
+        .hexagon:before,
+        .hexagon:after {{
+            content: "";
+            position: absolute;
+            width: 0;
+            border-left: 50px solid transparent;
+            border-right: 50px solid transparent;
+            left: 0;
+        }}
+        
+        .hexagon:before {{
+            bottom: 100%;
+            border-bottom: 29px solid {accent_color};
+        }}
+        
+        .hexagon:after {{
+            top: 100%;
+            border-top: 29px solid {accent_color};
+        }}
+        
+        /* Data points */
+        .data-point {{
+            position: absolute;
+            width: 8px;
+            height: 8px;
+            background-color: {accent_color};
+            border-radius: 50%;
+            opacity: 0.7;
+        }}
+        
+        .data-point:nth-child(1) {{
+            top: 250px;
+            right: 350px;
+        }}
+        
+        .data-point:nth-child(2) {{
+            bottom: 350px;
+            right: 250px;
+        }}
+        
+        .data-point:nth-child(3) {{
+            top: 450px;
+            left: 650px;
+        }}
+        
+        /* Responsive wrapper for preview */
+        .wrapper {{
+            width: 100vw;
+            height: 100vh;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            background-color: #1a1a1a;
+        }}
+        
+        .wrapper .slide-container {{
+            max-width: 100%;
+            max-height: 100%;
+            object-fit: contain;
+        }}
+        
+    </style>
+</head>
+<body>
+    <div class="wrapper">
+        <div class="slide-container">
+            <!-- Left decorative bar -->
+            <div class="left-bar"></div>
+            
+            <!-- Main content -->
+            <div class="content">
+                <h1 class="title">{title}</h1>
+                <p class="subtitle">{subtitle}</p>
+            </div>
+            
+            <!-- Decorative elements -->
+            <div class="decorations">
+                <!-- Central crosshair -->
+                <div class="crosshair">
+                    <div class="crosshair-line horizontal"></div>
+                    <div class="crosshair-line vertical"></div>
+                </div>
+                
+                <!-- Geometric shapes -->
+                <div class="triangle"></div>
+                <div class="square geometric-shape"></div>
+                <div class="hexagon"></div>
+                
+                <!-- Data points -->
+                <div class="data-point"></div>
+                <div class="data-point"></div>
+                <div class="data-point"></div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+def generate_business_intro_slide(
+    main_title="PRESENTATION",
+    subtitle="Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore",
+    main_title_color="#0056d2",
+    subtitle_color="#666666",
+    accent_color="#0056d2",
+    main_font="Arial, sans-serif",
+    subtitle_font="Arial, sans-serif"
+):
+    """
+    Generate a clean business presentation intro slide with centered text and decorative side circles.
+    
+    Args:
+        main_title (str): Large main title text (e.g., "PRESENTATION")
+        subtitle (str): Description text below main title
+        bg_color (str): Background color (default: light gray)
+        main_title_color (str): Color for main title (default: blue)
+        subtitle_color (str): Color for subtitle text
+        accent_color (str): Color for decorative circles
+        main_font (str): Font family for main title
+        subtitle_font (str): Font family for subtitle
+    
+    Returns:
+        str: Complete HTML code for the business intro slide
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Business Presentation Intro</title>
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body {{
+            width: 1920px;
+            height: 1080px;
+            background: 
+                repeating-linear-gradient(
+                    0deg,
+                    transparent,
+                    transparent 50px,
+                    rgba(0, 86, 210, 0.03) 50px,
+                    rgba(0, 86, 210, 0.03) 100px
+                ),
+                repeating-linear-gradient(
+                    90deg,
+                    transparent,
+                    transparent 50px,
+                    rgba(0, 86, 210, 0.03) 50px,
+                    rgba(0, 86, 210, 0.03) 100px
+                ),
+                linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            overflow: hidden;
+            position: relative;
+        }}
+        
+        .slide-container {{
+            width: 100%;
+            height: 100%;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            position: relative;
+        }}
+        
+        .content {{
+            text-align: center;
+            z-index: 10;
+            max-width: 1400px;
+            padding: 0 100px;
+        }}
+        
+        .main-title {{
+            font-family: {main_font};
+            font-size: 120px;
+            font-weight: 900;
+            color: {main_title_color};
+            letter-spacing: 4px;
+            margin-bottom: 30px;
+            line-height: 1.1;
+        }}
+        
+        .subtitle {{
+            font-family: {subtitle_font};
+            font-size: 28px;
+            font-weight: 400;
+            color: {subtitle_color};
+            line-height: 1.6;
+            max-width: 900px;
+            margin: 0 auto;
+        }}
+        
+        /* Decorative D-shapes on left and right */
+        .circle-left {{
+            position: absolute;
+            left: 0;
+            top: 50%;
+            transform: translateY(-50%);
+            width: 200px;
+            height: 400px;
+            background: {accent_color};
+            border-radius: 0 200px 200px 0;
+            z-index: 1;
+        }}
+        
+        .circle-right {{
+            position: absolute;
+            right: 0;
+            top: 50%;
+            transform: translateY(-50%);
+            width: 200px;
+            height: 400px;
+            background: {accent_color};
+            border-radius: 200px 0 0 200px;
+            z-index: 1;
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <!-- Side circles -->
+        <div class="circle-left"></div>
+        <div class="circle-right"></div>
+        
+        <!-- Main content -->
+        <div class="content">
+            <div class="main-title">{main_title}</div>
+            <div class="subtitle">{subtitle}</div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+# moi by Hien
+def generate_title_slide_3(
+    main_title="Your main presentation title",
+    subtitle="Here is where your presentation begins",
+    bg_color="#F5EBE0",
+    text_color="#C41E3A",
+    subtitle_color="#3D3D3D",
+    font_family="'Lobster Two', 'Georgia', serif",
+    show_top_lights=True,
+    show_sparkles=True,
+    custom_css=""
+):
+    """
+    Generate a Christmas Lights themed presentation slide with string lights decoration.
+    
+    Parameters:
+    - main_title: Main title text (default: "Your main presentation title")
+    - subtitle: Subtitle text (default: "Here is where your presentation begins")
+    - bg_color: Background color (default: "#F5EBE0")
+    - text_color: Main title color (default: "#C41E3A")
+    - subtitle_color: Subtitle color (default: "#3D3D3D")
+    - font_family: Font family (default: "'Lobster Two', 'Georgia', serif")
+    - show_top_lights: Show Christmas lights at top (default: True)
+    - show_sparkles: Show decorative sparkles (default: True)
+    - custom_css: Additional custom CSS (default: "")
+    
+    Returns:
+    - HTML string for the slide
+    """
+    
+    # Generate light bulbs with improved colors matching the image
+    bulbs_html = ""
+    bulb_colors = [
+        ("#C85353", "#E87676", "#8B1A1A"),  # Red
+        ("#D9B857", "#F0D67E", "#A88B2F"),  # Yellow
+        ("#5BA9BD", "#7DC4D4", "#3A6B7A"),  # Blue
+    ]
+    
+    # Positions for wire 1 - bulbs attached to upper wave points
+    wire1_positions = [
+        (55, 38), (180, 75), (380, 65), (580, 80), (780, 65), 
+        (980, 80), (1180, 65), (1380, 80), (1580, 65), (1780, 80)
+    ]
+    
+    # Positions for wire 2 - bulbs attached to lower wave points  
+    wire2_positions = [
+        (130, 62), (280, 88), (480, 42), (680, 82), (880, 42),
+        (1080, 82), (1280, 42), (1480, 82), (1680, 42), (1850, 72)
+    ]
+    
+    # Generate bulbs for wire 1
+    for i, (x, y) in enumerate(wire1_positions):
+        color_set = bulb_colors[i % 3]
+        bulb_id = f"grad1-{i}"
+        bulbs_html += f'''
+                <g transform="translate({x}, {y})">
+                    <defs>
+                        <radialGradient id="{bulb_id}" cx="30%" cy="30%">
+                            <stop offset="0%" style="stop-color:#FFFFFF;stop-opacity:1"/>
+                            <stop offset="30%" style="stop-color:{color_set[1]};stop-opacity:1"/>
+                            <stop offset="100%" style="stop-color:{color_set[2]};stop-opacity:1"/>
+                        </radialGradient>
+                    </defs>
+                    <ellipse cx="2" cy="2" rx="17" ry="25" fill="#000" opacity="0.12"/>
+                    <rect x="-6" y="-28" width="12" height="6" fill="#2a2a2a" rx="1"/>
+                    <ellipse cx="0" cy="0" rx="15" ry="23" fill="url(#{bulb_id})"/>
+                    <ellipse cx="-4" cy="-6" rx="5" ry="8" fill="white" opacity="0.7"/>
+                </g>'''
+    
+    # Generate bulbs for wire 2
+    for i, (x, y) in enumerate(wire2_positions):
+        color_set = bulb_colors[i % 3]
+        bulb_id = f"grad2-{i}"
+        bulbs_html += f'''
+                <g transform="translate({x}, {y})">
+                    <defs>
+                        <radialGradient id="{bulb_id}" cx="30%" cy="30%">
+                            <stop offset="0%" style="stop-color:#FFFFFF;stop-opacity:1"/>
+                            <stop offset="30%" style="stop-color:{color_set[1]};stop-opacity:1"/>
+                            <stop offset="100%" style="stop-color:{color_set[2]};stop-opacity:1"/>
+                        </radialGradient>
+                    </defs>
+                    <ellipse cx="2" cy="2" rx="17" ry="25" fill="#000" opacity="0.12"/>
+                    <rect x="-6" y="-28" width="12" height="6" fill="#2a2a2a" rx="1"/>
+                    <ellipse cx="0" cy="0" rx="15" ry="23" fill="url(#{bulb_id})"/>
+                    <ellipse cx="-4" cy="-6" rx="5" ry="8" fill="white" opacity="0.7"/>
+                </g>'''
+    
+    html_code = f"""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{main_title.replace('<br>', ' ')}</title>
+    <link href="https://fonts.googleapis.com/css2?family=Lobster+Two:wght@400;700&display=swap" rel="stylesheet">
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body {{
+            width: 1920px;
+            height: 1080px;
+            background: {bg_color};
+            position: relative;
+            overflow: hidden;
+            font-family: {font_family};
+        }}
+        
+        /* String Lights Top */
+        .lights-top {{
+            position: absolute;
+            top: 0;
+            left: 0;
+            width: 1920px;
+            height: 150px;
+            display: {("block" if show_top_lights else "none")};
+            z-index: 10;
+        }}
+        
+        .lights-top svg {{
+            width: 1920px;
+            height: 150px;
+        }}
+        
+        /* Content Container */
+        .content {{
+            position: absolute;
+            top: 400px;
+            left: 200px;
+            width: 1520px;
+            text-align: center;
+            z-index: 5;
+        }}
+        
+        .title {{
+            font-size: 96px;
+            color: {text_color};
+            font-weight: 700;
+            line-height: 1.1;
+            margin: 0 0 40px 0;
+            text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.1);
+        }}
+        
+        .subtitle {{
+            font-size: 32px;
+            color: {subtitle_color};
+            font-family: 'Georgia', serif;
+            font-weight: 400;
+            font-style: italic;
+            margin: 0;
+        }}
+        
+        /* Sparkles */
+        .sparkle {{
+            position: absolute;
+            color: {text_color};
+            font-size: 32px;
+            opacity: {("0.6" if show_sparkles else "0")};
+            z-index: 8;
+        }}
+        
+        .sparkle-1 {{ top: 240px; left: 130px; transform: rotate(15deg); }}
+        .sparkle-2 {{ top: 680px; left: 100px; transform: rotate(-20deg); font-size: 21px; }}
+        .sparkle-3 {{ top: 240px; left: 1770px; transform: rotate(25deg); }}
+        .sparkle-4 {{ top: 700px; left: 1780px; transform: rotate(-15deg); }}
+        .sparkle-5 {{ top: 140px; left: 720px; transform: rotate(0deg); font-size: 21px; }}
+        .sparkle-6 {{ top: 700px; left: 640px; transform: rotate(20deg); }}
+        .sparkle-7 {{ top: 450px; left: 280px; transform: rotate(10deg); font-size: 24px; }}
+        .sparkle-8 {{ top: 350px; left: 1600px; transform: rotate(-25deg); }}
+        .sparkle-9 {{ top: 560px; left: 520px; transform: rotate(30deg); font-size: 19px; }}
+        .sparkle-10 {{ top: 580px; left: 1340px; transform: rotate(-10deg); }}
+        .sparkle-11 {{ top: 200px; left: 1100px; transform: rotate(20deg); font-size: 22px; }}
+        .sparkle-12 {{ top: 630px; left: 1170px; transform: rotate(-30deg); font-size: 21px; }}
+        
+        {custom_css}
+    </style>
+</head>
+<body>
+    <!-- String Lights Top -->
+    <div class="lights-top">
+        <svg viewBox="0 0 1920 150" xmlns="http://www.w3.org/2000/svg">
+            <!-- Two intertwined wire paths with smooth crossover pattern -->
+            <path d="M -20 55 Q 80 30, 180 75 Q 280 110, 380 65 Q 480 30, 580 80 Q 680 115, 780 65 Q 880 30, 980 80 Q 1080 115, 1180 65 Q 1280 30, 1380 80 Q 1480 115, 1580 65 Q 1680 30, 1780 80 Q 1880 115, 1940 70" 
+                  stroke="#2a2a2a" 
+                  stroke-width="2.5" 
+                  fill="none"
+                  stroke-linecap="round"/>
+            <path d="M -20 105 Q 80 80, 180 35 Q 280 65, 380 100 Q 480 80, 580 35 Q 680 65, 780 110 Q 880 80, 980 35 Q 1080 65, 1180 100 Q 1280 80, 1380 35 Q 1480 65, 1580 100 Q 1680 80, 1780 35 Q 1880 65, 1940 90" 
+                  stroke="#2a2a2a" 
+                  stroke-width="2.5" 
+                  fill="none"
+                  stroke-linecap="round"/>
+            
+            {bulbs_html}
+        </svg>
+    </div>
+
+    
+    <!-- Sparkles -->
+    <div class="sparkle sparkle-1">✦</div>
+    <div class="sparkle sparkle-2">✦</div>
+    <div class="sparkle sparkle-3">✦</div>
+    <div class="sparkle sparkle-4">✦</div>
+    <div class="sparkle sparkle-5">✦</div>
+    <div class="sparkle sparkle-6">✦</div>
+    <div class="sparkle sparkle-7">✦</div>
+    <div class="sparkle sparkle-8">✦</div>
+    <div class="sparkle sparkle-9">✦</div>
+    <div class="sparkle sparkle-10">✦</div>
+    <div class="sparkle sparkle-11">✦</div>
+    <div class="sparkle sparkle-12">✦</div>
+    
+    <!-- Main Content -->
+    <div class="content">
+        <h1 class="title">{main_title}</h1>
+        <p class="subtitle">{subtitle}</p>
+    </div>
+</body>
+</html>
+    """
+    
+    return html_code
+
+def generate_minimalist_slide(
+    title="Your presentation title",
+    subtitle="Here is where your presentation begins",
+    font_family_title="Playfair Display, Georgia, serif",
+    font_family_subtitle="Inter, sans-serif",
+    background_color="#E8E3DC",
+    text_color_title="#1A1A1A",
+    text_color_subtitle="#4A4A4A",
+    line_color="#2C2C2C",
+    curve_color="#4A4A4A"
+):
+    """
+    Generate a minimalist title slide with centered text and decorative curves.
+    Uses fixed positioning (1920x1080px) compatible with HTML-to-absolute converter.
+    Removes all responsive elements (flexbox, vw/vh units, @media queries) for reliable conversion.
+    
+    Args:
+        title (str): The main title for the slide (112px serif font, centered at 1600px width)
+        subtitle (str): Descriptive text below the title (26px sans-serif font)
+        font_family_title (str): Font family for the title (default: Playfair Display, Georgia, serif)
+        font_family_subtitle (str): Font family for the subtitle (default: Inter, sans-serif)
+        background_color (str): The background color of the slide (default: #E8E3DC warm beige)
+        text_color_title (str): Color for the title text (default: #1A1A1A dark gray)
+        text_color_subtitle (str): Color for the subtitle text (default: #4A4A4A medium gray)
+        line_color (str): Color for the horizontal decorative lines (default: #2C2C2C)
+        curve_color (str): Color for the decorative SVG curves (default: #4A4A4A)
+    
+    Returns:
+        str: Complete HTML code for the slide with fixed 1920x1080px dimensions and absolute positioning
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@400;700&family=Inter:wght@300;400&display=swap" rel="stylesheet">
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body {{
+            font-family: {font_family_subtitle};
+            background-color: {background_color};
+            width: 1920px;
+            height: 1080px;
+            overflow: hidden;
+            position: relative;
+        }}
+        
+        .title {{
+            position: absolute;
+            top: 450px;
+            left: 160px;
+            width: 1600px;
+            font-family: {font_family_title};
+            font-size: 112px;
+            font-weight: 400;
+            color: {text_color_title};
+            text-align: center;
+            line-height: 1.15;
+            letter-spacing: -0.015em;
+        }}
+        
+        .subtitle {{
+            position: absolute;
+            top: 620px;
+            left: 160px;
+            width: 1600px;
+            font-family: {font_family_subtitle};
+            font-size: 26px;
+            font-weight: 300;
+            color: {text_color_subtitle};
+            text-align: center;
+            letter-spacing: 0.015em;
+        }}
+        
+        .top-line {{
+            position: absolute;
+            top: 40px;
+            left: 0;
+            width: 1920px;
+            height: 2px;
+            background-color: {line_color};
+        }}
+        
+        .bottom-line {{
+            position: absolute;
+            top: 1040px;
+            left: 0;
+            width: 1920px;
+            height: 2px;
+            background-color: {line_color};
+        }}
+    </style>
+</head>
+<body>
+    <!-- Top horizontal line -->
+    <div class="top-line"></div>
+    
+    <!-- Top-left decorative curve -->
+    <svg width="400" height="220" viewBox="0 0 400 220" style="position: absolute; top: 0; left: 0;">
+        <path d="M 0 180 Q 80 80, 200 40 Q 280 20, 400 0" 
+              stroke="{curve_color}" 
+              stroke-width="2.5" 
+              fill="none"
+              stroke-linecap="round"/>
+    </svg>
+    
+    <!-- Content -->
+    <h1 class="title">{title}</h1>
+    <p class="subtitle">{subtitle}</p>
+    
+    <!-- Bottom-right decorative curve -->
+    <svg width="400" height="220" viewBox="0 0 400 220" style="position: absolute; bottom: 0; right: 0;">
+        <path d="M 400 20 Q 300 170, 20 220" 
+              stroke="{curve_color}" 
+              stroke-width="3" 
+              fill="none"
+              stroke-linecap="round"/>
+    </svg>
+    
+    <!-- Bottom horizontal line -->
+    <div class="bottom-line"></div>
+</body>
+</html>"""
+    
+    return html_code
+
+
+
+def generate_title_slide_5(
+    top_left_text="Our shared moments",
+    year="20XX",
+    main_title="Your Title Here",
+    bottom_text="Here is where your presentation begins",
+    image_path="Image/generate_title_slide_5/Default_1.jpg",
+    font_family="'Arial'",
+    font_family_secondary="'Arial'",
+    bg_color="#b8c8d4",
+    text_color="#2c3e50",
+    show_clover=True,
+    show_decorative_lines=True,
+    custom_css=""
+):
+    """
+    Generate a notebook cover design slide with polaroid-style image and decorative elements.
+    
+    Parameters:
+    - top_left_text: Text in top-left corner (default: "Our shared moments")
+    - year: Year text in top-right corner (default: "20XX")
+    - main_title: Main title text (default: "Your Title Here")
+    - bottom_text: Text in bottom-right corner (default: "Here is where your presentation begins")
+    - image_path: Path to polaroid image (default: "Image/generate_title_slide_5/Default_1.jpg")
+    - font_family: Font for main title (default: "'Arial'")
+    - font_family_secondary: Font for secondary text (default: "'Arial'")
+    - bg_color: Background color (default: "#b8c8d4" - soft blue-gray)
+    - text_color: Text color (default: "#2c3e50" - dark blue)
+    - show_clover: Show four-leaf clover decoration (default: True)
+    - show_decorative_lines: Show top/bottom decorative lines (default: True)
+    - custom_css: Additional custom CSS (default: "")
+    
+    Returns:
+    - HTML string for the slide
+    """
+    
+    # SVG cho clover (cỏ bốn lá) - to hơn
+    clover_svg = """
+    <svg viewBox="0 0 100 100" style="width: 180px; height: 180px;">
+        <g fill="#2d5f3f">
+            <circle cx="35" cy="35" r="15"/>
+            <circle cx="65" cy="35" r="15"/>
+            <circle cx="35" cy="65" r="15"/>
+            <circle cx="65" cy="65" r="15"/>
+            <circle cx="50" cy="50" r="8"/>
+            <rect x="48" y="65" width="4" height="25" fill="#2d5f3f"/>
+        </g>
+    </svg>
+    """ if show_clover else ""
+    
+    html_code = f"""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Notebook Cover Design</title>
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body {{
+            font-family: 'Courier New', monospace;
+            width: 1920px;
+            height: 1080px;
+            overflow: hidden;
+            background: {bg_color};
+            background-image: 
+                repeating-linear-gradient(0deg, rgba(255,255,255,0.03) 0px, transparent 1px, transparent 2px, rgba(255,255,255,0.03) 3px),
+                repeating-linear-gradient(90deg, rgba(255,255,255,0.03) 0px, transparent 1px, transparent 2px, rgba(255,255,255,0.03) 3px);
+            position: relative;
+        }}
+        
+        .top-left {{
+            position: absolute;
+            top: 60px;
+            left: 120px;
+            font-size: 30px;
+            color: {text_color};
+            font-family: {font_family_secondary};
+        }}
+        
+        .top-right {{
+            position: absolute;
+            top: 60px;
+            right: 120px;
+            font-size: 24px;
+            color: {text_color};
+            font-weight: bold;
+            font-family: {font_family_secondary};
+        }}
+        
+        .text-content {{
+            position: absolute;
+            top: 330px;
+            left: 120px;
+            max-width: 1000px;
+            z-index: 1;
+        }}
+        
+        .main-title {{
+            font-size: 120px;
+            color: {text_color};
+            line-height: 1.2;
+            font-weight: 400;
+            font-family: {font_family};
+            margin: 0;
+        }}
+
+        .image-container {{
+            position: absolute;
+            right: 200px;
+            top: 240px;
+            z-index: 2;
+        }}
+
+        .polaroid {{
+            position: relative;
+            width: 480px;
+            height: 530px;
+            background: white;
+            padding: 18px;
+            padding-bottom: 55px;
+            box-shadow: 0 15px 50px rgba(0,0,0,0.35);
+            transform: rotate(6deg);
+        }}
+
+        .polaroid img {{
+            width: 444px;
+            height: 457px;
+            object-fit: cover;
+        }}
+        
+        .clover {{
+            position: absolute;
+            bottom: 30px;
+            left: 120px;
+            z-index: 10;
+        }}
+        
+        .bottom-text {{
+            position: absolute;
+            bottom: 60px;
+            right: 120px;
+            font-size: 30px;
+            color: {text_color};
+            font-family: {font_family_secondary};
+        }}
+        
+        .top-line {{
+            position: absolute;
+            top: 120px;
+            left: 120px;
+            width: 1680px;
+            height: 3px;
+            background: linear-gradient(to right, transparent, #8b4513 20%, #8b4513 80%, transparent);
+        }}
+        
+        .horizontal-line {{
+            position: absolute;
+            bottom: 120px;
+            left: 120px;
+            width: 1680px;
+            height: 3px;
+            background: linear-gradient(to right, transparent, #8b4513 20%, #8b4513 80%, transparent);
+        }}
+        
+        {custom_css}
+    </style>
+</head>
+<body>
+    <div class="top-left">{top_left_text}</div>
+    <div class="top-right">{year}</div>
+    
+    <div class="text-content">
+        <div class="main-title">{main_title}</div>
+    </div>
+
+    <div class="image-container">
+        <div class="polaroid">
+            <img src="{image_path}" alt="Notebook Cover Image">
+        </div>
+    </div>
+    
+    <div class="clover">{clover_svg}</div>
+    {('<div class="top-line"></div>' if show_decorative_lines else '')}
+    {('<div class="horizontal-line"></div>' if show_decorative_lines else '')}
+    <div class="bottom-text">{bottom_text}</div>
+</body>
+</html>
+    """
+    
+    return html_code
+
+
+
+def generate_title_slide_7(
+    main_title="Main Title Here",
+    subtitle="Here is where your presentation begins",
+    bg_color="#d4e8d4",
+    card_bg_color="#faf8f0",
+    border_color="#2d3e50",
+    accent_color="#e17b6a",
+    title_color="#2d3e50",
+    subtitle_color="#6b7280",
+    custom_css="",
+):
+    """
+    Generate an HTML title slide with a single centered text frame and one bandage decoration above it.
+    """
+
+    html_code = f"""
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>{main_title}</title>
+        <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@400;700;900&display=swap" rel="stylesheet">
+        <style>
+            * {{ margin:0; padding:0; box-sizing:border-box; }}
+            body {{ font-family: 'Poppins', sans-serif; background-color:{bg_color}; min-height:100vh; display:flex; align-items:center; justify-content:center; overflow:hidden; }}
+            .text-frame {{ width:1100px; padding:60px 80px; border-radius:24px; background:{card_bg_color}; border:5px solid {border_color}; box-shadow:0 12px 36px rgba(0,0,0,0.12); text-align:center; position:relative; }}
+            .main-title {{ font-size:56px; font-weight:900; color:{title_color}; margin:0; }}
+            .subtitle {{ font-size:34px; color:{subtitle_color}; margin-top:12px; line-height:1.2; }}
+            .bandage-core {{ width:220px; height:70px; border-radius:24px; background:{accent_color}; box-shadow:0 8px 24px rgba(0,0,0,0.12); }}
+            {custom_css}
+        </style>
+    </head>
+    <body>
+        <!-- Bandage (single element) positioned above the frame -->
+        <div style="position:absolute; left:50%; top:32%; transform:translate(-50%,-50%); z-index:40;">
+            <div class="bandage-core"></div>
+        </div>
+
+        <!-- Centered text frame with title above subtitle -->
+        <div class="text-frame">
+            <h1 class="main-title">{main_title}</h1>
+            <p class="subtitle">{subtitle}</p>
+        </div>
+    </body>
+    </html>
+    """
+
+    return html_code
+
+def generate_title_slide_11(
+    main_title="Simple and Minimalist Thesis Defense",
+    subtitle="Here is where your presentation begins",
+    bg_left_color="#f5d7d7",
+    bg_right_color="#e8e8e8",
+    text_color="#2d2d2d"
+):
+    """
+    Generate a ultra-minimalist introduction slide with split background colors.
+    
+    Parameters:
+    - main_title: Main title text (str)
+    - subtitle: Subtitle text below the title (str)
+    - bg_left_color: Background color for left half (str)
+    - bg_right_color: Background color for right half (str)
+    - text_color: Text color (str)
+    
+    Returns:
+    - HTML string for the slide
+    """
+    
+    # Handle list inputs (take first element)
+    if isinstance(main_title, list):
+        main_title = main_title[0] if main_title else "Simple and Minimalist Thesis Defense"
+    if isinstance(subtitle, list):
+        subtitle = subtitle[0] if subtitle else "Here is where your presentation begins"
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Minimalist Circle Slide</title>
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body {{
+            font-family: 'Segoe UI', Tahoma, sans-serif;
+            background: linear-gradient(90deg, {bg_left_color} 0%, {bg_left_color} 50%, {bg_right_color} 50%, {bg_right_color} 100%);
+            overflow: hidden;
+            width: 100vw;
+            height: 100vh;
+        }}
+        
+        .slide-wrapper {{
+            width: 1920px;
+            height: 1080px;
+            position: relative;
+            transform-origin: top left;
+        }}
+        
+        .slide-container {{
+            width: 100%;
+            height: 100%;
+            position: relative;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+        }}
+
+        /* Content container */
+        .content {{
+            position: absolute;
+            z-index: 5;
+            text-align: center;
+            top: 400px;
+            left: 960px;
+            transform: translateX(-50%);
+            width: 1200px;
+        }}
+        
+        .title {{
+            font-family: Georgia, 'Times New Roman', serif;
+            font-size: 110px;
+            font-weight: 400;
+            color: {text_color};
+            line-height: 1.2;
+            margin-bottom: 0px;
+        }}
+        
+        .subtitle {{
+            font-family: 'Segoe UI', Tahoma, sans-serif;
+            font-size: 36px;
+            font-weight: 400;
+            color: {text_color};
+            margin-top: 40px;
+            opacity: 0.9;
+        }}
+        
+        /* Responsive scaling */
+        @media (max-width: 1920px) {{
+            .slide-wrapper {{
+                transform: scale(0.8);
+            }}
+        }}
+        
+        @media (max-width: 1440px) {{
+            .slide-wrapper {{
+                transform: scale(0.6);
+            }}
+        }}
+        
+        @media (max-width: 768px) {{
+            .slide-wrapper {{
+                transform: scale(0.4);
+            }}
+        }}
+        
+        @media (max-width: 480px) {{
+            .slide-wrapper {{
+                transform: scale(0.25);
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-wrapper">
+        <div class="slide-container">
+            <!-- Content -->
+            <div class="content">
+                <h1 class="title">{main_title}</h1>
+                <p class="subtitle">{subtitle}</p>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+def generate_title_slide_12(
+    main_title="Elegant Black and White Thesis Defense",
+    subtitle="Here is where your presentation begins",
+    bg_color="#F5F5F5",
+    circle_color="#E5E5E5",
+    border_color="#000000",
+    text_color="#000000"
+):
+    """
+    Generate an elegant black and white minimalist slide with circular decoration.
+    
+    Args:
+        main_title (str): Main title text
+        subtitle (str): Subtitle text below main title
+        bg_color (str): Background color (default: light gray)
+        circle_color (str): Large circle decoration color (default: gray)
+        border_color (str): Border frame color (default: black)
+        text_color (str): Text color (default: black)
+    
+    Returns:
+        str: Complete HTML code for the slide
+    """
+    
+    # Handle list inputs by taking first element
+    if isinstance(main_title, list):
+        main_title = main_title[0] if main_title else "Elegant Black and White Thesis Defense"
+    if isinstance(subtitle, list):
+        subtitle = subtitle[0] if subtitle else "Here is where your presentation begins"
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Elegant Black and White Thesis Defense</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@700;900&family=Open+Sans:wght@400&display=swap" rel="stylesheet">
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body {{
+            font-family: 'Open Sans', sans-serif;
+            background-color: {bg_color};
+            overflow: hidden;
+        }}
+        
+        .slide-wrapper {{
+            width: 1920px;
+            height: 1080px;
+            position: relative;
+            overflow: hidden;
+            margin: 0 auto;
+        }}
+        
+        /* Border frame */
+        .border-frame {{
+            position: absolute;
+            top: 160px;
+            left: 160px;
+            right: 160px;
+            bottom: 160px;
+            border: 3px solid {border_color};
+            z-index: 2;
+        }}
+        
+        /* Large decorative circle */
+        .decorative-circle {{
+            position: absolute;
+            top: 50%;
+            right: -200px;
+            transform: translateY(-50%);
+            width: 700px;
+            height: 700px;
+            border-radius: 50%;
+            background-color: {circle_color};
+            z-index: 1;
+        }}
+        
+        /* Content area */
+        .content-wrapper {{
+            position: absolute;
+            top: 50%;
+            left: 300px;
+            transform: translateY(-50%);
+            z-index: 3;
+            max-width: 1100px;
+        }}
+        
+        .main-title {{
+            font-family: 'Montserrat', sans-serif;
+            font-size: 88px;
+            font-weight: 900;
+            color: {text_color};
+            line-height: 1.1;
+            margin-bottom: 40px;
+            letter-spacing: -1px;
+        }}
+        
+        .subtitle {{
+            font-family: 'Open Sans', sans-serif;
+            font-size: 36px;
+            font-weight: 400;
+            color: {text_color};
+            line-height: 1.4;
+            opacity: 0.8;
+        }}
+        
+        /* Responsive scaling */
+        @media (max-width: 1920px) {{
+            .slide-wrapper {{
+                transform: scale(0.9);
+            }}
+        }}
+        
+        @media (max-width: 1600px) {{
+            .slide-wrapper {{
+                transform: scale(0.75);
+            }}
+        }}
+        
+        @media (max-width: 1280px) {{
+            .slide-wrapper {{
+                transform: scale(0.6);
+            }}
+        }}
+        
+        @media (max-width: 768px) {{
+            .slide-wrapper {{
+                transform: scale(0.35);
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-wrapper">
+        <!-- Decorative circle -->
+        <div class="decorative-circle"></div>
+        
+        <!-- Border frame -->
+        <div class="border-frame"></div>
+        
+        <!-- Content -->
+        <div class="content-wrapper">
+            <h1 class="main-title">{main_title}</h1>
+            <p class="subtitle">{subtitle}</p>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+def generate_title_slide_13(
+    main_title="Head of Presentation",
+    subtitle="Here is where your presentation begins",
+    bg_color="#E8F4F8",
+    text_color="#1A1A4D",
+    decoration_color="#A8D5E2",
+):
+    """
+    Generate an HTML slide with diagonal geometric decorative elements
+    matching the Inverse Functions design.
+    
+    Args:
+        main_title: The main title text 
+        subtitle: The subtitle text 
+        bg_color: Background color (default: "#E8F4F8" - light cyan)
+        text_color: Color for title and subtitle text (default: "#1A1A4D" - dark blue)
+        decoration_color: Color for geometric decorations (default: "#A8D5E2" - light blue)
+    
+    Returns:
+        HTML string for the complete slide
+    """
+    
+    # Handle list inputs
+    if isinstance(main_title, list):
+        main_title = main_title[0] if main_title else "Inverse Functions"
+    if isinstance(subtitle, list):
+        subtitle = subtitle[0] if subtitle else "Here is where your presentation begins"
+    if isinstance(bg_color, list):
+        bg_color = bg_color[0] if bg_color else "#E8F4F8"
+    if isinstance(text_color, list):
+        text_color = text_color[0] if text_color else "#1A1A4D"
+    if isinstance(decoration_color, list):
+        decoration_color = decoration_color[0] if decoration_color else "#A8D5E2"
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Inverse Functions Slide</title>
+    <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@700;800;900&display=swap" rel="stylesheet">
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+
+        body {{
+            font-family: 'Montserrat', sans-serif;
+            overflow: hidden;
+            background: linear-gradient(135deg, {bg_color} 0%, #D4E8F0 100%);
+        }}
+
+        .slide-wrapper {{
+            width: 100vw;
+            height: 100vh;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            position: relative;
+        }}
+
+        .slide-container {{
+            width: 1920px;
+            height: 1080px;
+            position: relative;
+            overflow: hidden;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+        }}
+
+        .content {{
+            text-align: center;
+            z-index: 10;
+            position: relative;
+            max-width: 1400px;
+        }}
+
+        .main-title {{
+            font-family: 'Montserrat', sans-serif;
+            font-weight: 800;
+            font-size: 100px;
+            color: {text_color};
+            line-height: 1.2;
+            letter-spacing: -2px;
+            margin-bottom: 30px;
+        }}
+        
+        .subtitle {{
+            font-family: 'Montserrat', sans-serif;
+            font-weight: 400;
+            font-size: 40px;
+            color: {text_color};
+            opacity: 0.8;
+            line-height: 1.4;
+        }}
+
+        /* Decorative geometric elements - rounded rectangles at diagonal angles */
+        .geo-element {{
+            position: absolute;
+            border-radius: 50px;
+            opacity: 0.6;
+        }}
+
+        /* Top-left corner elements */
+        .geo-1 {{
+            width: 120px;
+            height: 350px;
+            background: {decoration_color};
+            top: -50px;
+            left: -20px;
+            transform: rotate(-45deg);
+        }}
+
+        .geo-2 {{
+            width: 100px;
+            height: 280px;
+            background: {decoration_color};
+            top: 20px;
+            left: 120px;
+            transform: rotate(-45deg);
+            filter: brightness(0.85);
+        }}
+
+        .geo-3 {{
+            width: 80px;
+            height: 220px;
+            background: {decoration_color};
+            top: 80px;
+            left: 240px;
+            transform: rotate(-45deg);
+            filter: brightness(1.1);
+        }}
+
+        /* Bottom-right corner elements */
+        .geo-4 {{
+            width: 100px;
+            height: 280px;
+            background: {decoration_color};
+            bottom: 50px;
+            right: 120px;
+            transform: rotate(-45deg);
+        }}
+
+        .geo-5 {{
+            width: 90px;
+            height: 240px;
+            background: {decoration_color};
+            bottom: -30px;
+            right: 0px;
+            transform: rotate(-45deg);
+            filter: brightness(0.85);
+        }}
+
+        .geo-6 {{
+            width: 110px;
+            height: 300px;
+            background: {decoration_color};
+            bottom: 100px;
+            right: 250px;
+            transform: rotate(-45deg);
+            filter: brightness(1.1);
+        }}
+
+        /* Top-right small element */
+        .geo-7 {{
+            width: 70px;
+            height: 180px;
+            background: {decoration_color};
+            top: 150px;
+            right: 50px;
+            transform: rotate(-45deg);
+            filter: brightness(1.1);
+        }}
+
+        /* Small circle in top-left area */
+        .geo-circle {{
+            width: 80px;
+            height: 80px;
+            background: {decoration_color};
+            border-radius: 50%;
+            top: 50px;
+            left: 50px;
+            opacity: 0.5;
+        }}
+
+        /* Responsive scaling */
+        @media (max-width: 1920px) {{
+            .slide-container {{
+                transform: scale(0.8);
+            }}
+        }}
+
+        @media (max-width: 1440px) {{
+            .slide-container {{
+                transform: scale(0.6);
+            }}
+        }}
+
+        @media (max-width: 1024px) {{
+            .slide-container {{
+                transform: scale(0.4);
+            }}
+        }}
+
+        @media (max-width: 768px) {{
+            .slide-container {{
+                transform: scale(0.25);
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-wrapper">
+        <div class="slide-container">
+            <!-- Decorative geometric elements -->
+            <div class="geo-element geo-circle"></div>
+            <div class="geo-element geo-1"></div>
+            <div class="geo-element geo-2"></div>
+            <div class="geo-element geo-3"></div>
+            <div class="geo-element geo-4"></div>
+            <div class="geo-element geo-5"></div>
+            <div class="geo-element geo-6"></div>
+            <div class="geo-element geo-7"></div>
+
+            <!-- Content -->
+            <div class="content">
+                <h1 class="main-title">{main_title}</h1>
+                <p class="subtitle">{subtitle}</p>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+def generate_title_slide_15(
+    main_title="SIMPLE MEETING",
+    subtitle="Here is where your presentation begins",
+    background_color="#F5F5F0",
+    subtitle_color="#7A7A7A",
+    title_color="#E8B45E",
+    accent_line_color="#E37854",
+    top_circle_color="#E37854",
+    bottom_circle_color="#5A7A7F"
+):
+    """
+    Generate a simple meeting slide with circles in corners.
+    
+    Parameters:
+    - main_title: Main title text 
+    - subtitle: Subtitle text above main title 
+    - background_color: Background color (default: "#F5F5F0" - off white)
+    - subtitle_color: Subtitle text color (default: "#7A7A7A" - gray)
+    - title_color: Main title text color (default: "#E8B45E" - golden yellow)
+    - accent_line_color: Horizontal line color (default: "#E37854" - coral orange)
+    - top_circle_color: Top left circle color (default: "#E37854" - coral orange)
+    - bottom_circle_color: Bottom right circle color (default: "#5A7A7F" - teal gray)
+    
+    Returns:
+    - HTML string for the slide
+    """
+    
+    # Handle list inputs by taking first element
+    if isinstance(main_title, list):
+        main_title = main_title[0] if main_title else "SIMPLE MEETING"
+    if isinstance(subtitle, list):
+        subtitle = subtitle[0] if subtitle else "Here is where your presentation begins"
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Simple Meeting Slide</title>
+    <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@400;800&display=swap" rel="stylesheet">
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+
+        body {{
+            font-family: 'Montserrat', sans-serif;
+            background-color: {background_color};
+            overflow: hidden;
+            width: 1920px;
+            height: 1080px;
+            position: relative;
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+            justify-content: center;
+        }}
+
+        /* Top left circle decoration */
+        .circle-top {{
+            position: absolute;
+            top: -350px;
+            left: -350px;
+            width: 700px;
+            height: 700px;
+            border-radius: 50%;
+            background-color: {top_circle_color};
+            z-index: 1;
+        }}
+
+        /* Bottom right circle decoration */
+        .circle-bottom {{
+            position: absolute;
+            top: 730px;
+            left: 1570px;
+            width: 700px;
+            height: 700px;
+            border-radius: 50%;
+            background-color: {bottom_circle_color};
+            z-index: 1;
+        }}
+
+        /* Content container */
+        .content {{
+            position: relative;
+            z-index: 10;
+            text-align: center;
+            max-width: 1400px;
+            padding: 0 100px;
+        }}
+
+        .subtitle {{
+            font-size: 32px;
+            font-weight: 400;
+            color: {subtitle_color};
+            margin-bottom: 40px;
+            letter-spacing: 0.5px;
+        }}
+
+        .main-title {{
+            font-size: 100px;
+            font-weight: 800;
+            color: {title_color};
+            letter-spacing: 8px;
+            line-height: 1.1;
+            margin-bottom: 30px;
+        }}
+
+        .accent-line {{
+            width: 180px;
+            height: 6px;
+            background-color: {accent_line_color};
+            margin: 0 auto;
+            display: none;
+        }}
+    </style>
+</head>
+<body>
+    <!-- Decorative circles -->
+    <div class="circle-top"></div>
+    <div class="circle-bottom"></div>
+    
+    <!-- Main content -->
+    <div class="content">
+        <div class="subtitle">{subtitle}</div>
+        <h1 class="main-title">{main_title}</h1>
+        <div class="accent-line"></div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+def generate_title_slide_17(
+    main_title="Heading of Presentation",
+    subtitle="Here is where your presentation begins",
+    bg_color="#F5F5F5",
+    title_color="#2D2D2D",
+    subtitle_color="#6B6B6B",
+    circle_color_1="#5DBBBB",
+    circle_color_2="#6BA3C8",
+    circle_color_3="#E8B858"
+):
+    """
+    Generate a title slide with centered text content and decorative circles positioned at four corners.
+    
+    Parameters:
+    - main_title: Main title text
+    - subtitle: Subtitle text
+    - bg_color: Background color
+    - title_color: Main title color
+    - subtitle_color: Subtitle text color
+    - circle_color_1: First decorative circle color
+    - circle_color_2: Second decorative circle color
+    - circle_color_3: Third decorative circle color
+    """
+    
+    # Handle list or string input for title
+    if isinstance(main_title, list):
+        main_title = main_title[0] if main_title else "TOWN HALL MEETING"
+    
+    if isinstance(subtitle, list):
+        subtitle = subtitle[0] if subtitle else "Here is where your presentation begins"
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Town Hall Meeting Slide</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@400;800;900&display=swap" rel="stylesheet">
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body {{
+            font-family: 'Montserrat', sans-serif;
+            overflow: hidden;
+        }}
+        
+        .slide-wrapper {{
+            width: 100vw;
+            height: 100vh;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+        }}
+        
+        .slide-container {{
+            width: 1920px;
+            height: 1080px;
+            background-color: {bg_color};
+            position: relative;
+            overflow: hidden;
+        }}
+        
+        .content {{
+            position: absolute;
+            top: 50%;
+            left: 50%;
+            transform: translate(-50%, -50%);
+            text-align: center;
+            z-index: 10;
+        }}
+        
+        .main-title {{
+            font-size: 120px;
+            font-weight: 900;
+            color: {title_color};
+            line-height: 1.2;
+            letter-spacing: 2px;
+            text-transform: uppercase;
+            max-width: 1400px;
+        }}
+        
+        .subtitle {{
+            font-size: 40px;
+            font-weight: 400;
+            color: {subtitle_color};
+            letter-spacing: 0.5px;
+            margin-top: 30px;
+        }}
+        
+        /* Decorative circles - all equal size, half visible */
+        .circle {{
+            position: absolute;
+            border-radius: 50%;
+            opacity: 0.6;
+            width: 150px;
+            height: 150px;
+        }}
+        
+        /* Top left corner circles */
+        .circle-tl-1 {{
+            background-color: {circle_color_2};
+            top: -75px;
+            left: -75px;
+        }}
+        
+        .circle-tl-2 {{
+            background-color: {circle_color_3};
+            top: 75px;
+            left: -75px;
+        }}
+        
+        /* Top right corner circles */
+        .circle-tr-1 {{
+            background-color: {circle_color_1};
+            top: -75px;
+            right: -75px;
+        }}
+        
+        .circle-tr-2 {{
+            background-color: {circle_color_2};
+            top: 75px;
+            right: -75px;
+        }}
+        
+        /* Bottom left corner circles */
+        .circle-bl-1 {{
+            background-color: {circle_color_1};
+            bottom: -75px;
+            left: -75px;
+        }}
+        
+        .circle-bl-2 {{
+            background-color: {circle_color_2};
+            bottom: 75px;
+            left: -75px;
+        }}
+        
+        /* Bottom right corner circles */
+        .circle-br-1 {{
+            background-color: {circle_color_1};
+            bottom: -75px;
+            right: -75px;
+        }}
+        
+        .circle-br-2 {{
+            background-color: {circle_color_3};
+            bottom: 75px;
+            right: -75px;
+        }}
+        
+
+    </style>
+</head>
+<body>
+    <div class="slide-wrapper">
+        <div class="slide-container">
+            <!-- Decorative circles in corners -->
+            <div class="circle circle-tl-1"></div>
+            <div class="circle circle-tl-2"></div>
+            
+            <div class="circle circle-tr-1"></div>
+            <div class="circle circle-tr-2"></div>
+            
+            <div class="circle circle-bl-1"></div>
+            <div class="circle circle-bl-2"></div>
+            
+            <div class="circle circle-br-1"></div>
+            <div class="circle circle-br-2"></div>
+            
+            <!-- Main content -->
+            <div class="content">
+                <h1 class="main-title">{main_title}</h1>
+                <p class="subtitle">{subtitle}</p>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+def generate_title_slide_18(
+    main_title="Heading of Your Presentation",
+    subtitle="Here is where your presentation begins",
+    bg_pattern_color="#E8E8E8",
+    card_bg_color="#F9ED9B",
+    title_color="#000000",
+    subtitle_color="#2D2D2D"
+):
+    """
+    Generate a minimalist title slide with centered card containing title and subtitle on full-slide geometric cube pattern background.
+    
+    Parameters:
+    - main_title: Main heading text
+    - subtitle: Subtitle text below main title
+    - bg_pattern_color: Color for the geometric cube pattern background
+    - card_bg_color: Background color of center card
+    - title_color: Color for main title text
+    - subtitle_color: Color for subtitle text
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Minimalist Pattern Meeting Slide</title>
+    <link href="https://fonts.googleapis.com/css2?family=Bebas+Neue&family=Open+Sans:wght@400;600&display=swap" rel="stylesheet">
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body {{
+            font-family: 'Open Sans', sans-serif;
+            overflow: hidden;
+            width: 1920px;
+            height: 1080px;
+            position: relative;
+            background-color: #F5F5F5;
+        }}
+        
+        .pattern-background {{
+            position: absolute;
+            top: 0;
+            left: 0;
+            width: 100%;
+            height: 100%;
+            z-index: 1;
+        }}
+        
+        .content-card {{
+            position: absolute;
+            top: 215px;
+            left: 535px;
+            width: 850px;
+            height: 650px;
+            background-color: {card_bg_color};
+            border-radius: 16px;
+            box-shadow: 0 20px 60px rgba(0, 0, 0, 0.15);
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+            justify-content: center;
+            padding: 60px;
+            z-index: 10;
+        }}
+        
+        .main-title {{
+            font-family: 'Bebas Neue', sans-serif;
+            font-size: 110px;
+            font-weight: 400;
+            color: {title_color};
+            text-align: center;
+            line-height: 1.1;
+            margin-bottom: 40px;
+            letter-spacing: 2px;
+            max-width: 730px;
+            border: none;
+            outline: none;
+            background: none;
+        }}
+        
+        .subtitle {{
+            font-family: 'Open Sans', sans-serif;
+            font-size: 36px;
+            font-weight: 400;
+            color: {subtitle_color};
+            text-align: center;
+            line-height: 1.5;
+        }}
+    </style>
+</head>
+<body>
+    <!-- Geometric pattern background -->
+    <svg class="pattern-background" xmlns="http://www.w3.org/2000/svg" width="1920" height="1080">
+                <defs>
+                    <pattern id="cubePattern" x="0" y="0" width="80" height="140" patternUnits="userSpaceOnUse">
+                        <!-- Cube faces using geometric shapes -->
+                        <polygon points="40,0 80,23 80,93 40,70" fill="{bg_pattern_color}" opacity="1"/>
+                        <polygon points="0,23 40,0 40,70 0,93" fill="{bg_pattern_color}" opacity="0.8"/>
+                        <polygon points="40,70 80,93 40,116 0,93" fill="{bg_pattern_color}" opacity="0.6"/>
+                    </pattern>
+                </defs>
+                <rect width="1920" height="1080" fill="#F5F5F5"/>
+                <rect width="1920" height="1080" fill="url(#cubePattern)"/>
+            </svg>
+    
+    <div class="content-card">
+        <h1 class="main-title">{main_title}</h1>
+        <p class="subtitle">{subtitle}</p>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
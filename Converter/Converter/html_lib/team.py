@@ -0,0 +1,434 @@
+"""Slide giới thiệu team."""
+
+#-------------------  # slide giới thiệu team
+
+def generate_team_slide(
+    main_title="Our Team",
+    team_members=[
+        {
+            "name": "Alex Johnson",
+            "role": "Lead Developer",
+            "image_url": "https://images.unsplash.com/photo-1535713875002-d1d0cf377fde?q=80&w=1780&auto=format=fit=crop"
+        },
+        {
+            "name": "Maria Garcia",
+            "role": "Product Manager",
+            "image_url": "https://images.unsplash.com/photo-1580489944761-15a19d654956?q=80&w=1887&auto=format=fit=crop"
+        },
+        {
+            "name": "James Smith",
+            "role": "UX/UI Designer",
+            "image_url": "https://images.unsplash.com/photo-1507003211169-0a1dd7228f2d?q=80&w=1887&auto=format=fit=crop"
+        }
+    ],
+    font_family="'Inter', 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif",
+    accent_bg_color="#14B8A6",
+    main_bg_color="#F8FAFC",
+    title_color="#FFFFFF",
+    name_color="#111827",
+    role_color="#6B7280"
+):
+    """
+    Generates a modern, STATIC team slide with a diagonal layout, large fonts,
+    and professional member cards. Hover effects have been removed.
+    """
+    
+    team_html = ""
+    for member in team_members:
+        team_html += f"""
+        <div class="team-member-card">
+            <div class="member-photo">
+                <img src="{member['image_url']}" alt="{member['name']}" />
+            </div>
+            <div class="member-info">
+                <h3 class="member-name">{member['name']}</h3>
+                <p class="member-role">{member['role']}</p>
+            </div>
+        </div>
+        """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Team Slide - Dynamic Design</title>
+    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;800&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        
+        body, html {{
+            height: 100vh;
+            width: 100vw;
+            font-family: {font_family};
+            overflow: hidden;
+            background-color: {main_bg_color};
+        }}
+        
+        .slide-container {{
+            height: 100vh;
+            width: 100vw;
+            display: flex;
+            position: relative;
+        }}
+        
+        .left-background {{
+            position: absolute;
+            top: 0;
+            left: 0;
+            width: 45%;
+            height: 100%;
+            background: {accent_bg_color};
+            clip-path: polygon(0 0, 100% 0, 65% 100%, 0% 100%);
+            z-index: 1;
+        }}
+
+        .title-container {{
+            position: absolute;
+            left: 0;
+            top: 50%;
+            transform: translateY(-50%);
+            width: 35%;
+            text-align: center;
+            z-index: 2;
+            padding: 2rem;
+        }}
+        
+        .main-title {{
+            font-size: clamp(3rem, 6vw, 5rem);
+            color: {title_color};
+            font-weight: 800;
+            line-height: 1.1;
+        }}
+        
+        .right-content-area {{
+            position: relative;
+            flex: 1;
+            padding: 4rem;
+            padding-left: 38%;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            gap: 2rem;
+            z-index: 2;
+        }}
+        
+        .team-member-card {{
+            display: flex;
+            align-items: center;
+            gap: 1.5rem;
+            background: #FFFFFF;
+            padding: 1.25rem;
+            border-radius: 1rem;
+            box-shadow: 0 8px 25px rgba(0, 0, 0, 0.08);
+            /* ĐÃ XÓA: transition: transform 0.3s ease, box-shadow 0.3s ease; */
+        }}
+        
+        /* ĐÃ XÓA: Khối CSS .team-member-card:hover đã được loại bỏ hoàn toàn. */
+        
+        .member-photo img {{
+            width: 6.5rem;
+            height: 6.5rem;
+            border-radius: 50%;
+            object-fit: cover;
+            border: 4px solid {accent_bg_color};
+        }}
+        
+        .member-name {{
+            font-size: 1.75rem;
+            color: {name_color};
+            font-weight: 600;
+            margin-bottom: 0.3rem;
+        }}
+        
+        .member-role {{
+            font-size: 1.1rem;
+            color: {role_color};
+        }}
+        
+        @media (max-width: 64rem) {{
+            .left-background {{ width: 100%; height: 35%; clip-path: none; }}
+            .title-container {{ width: 100%; top: 17.5%; }}
+            .right-content-area {{ padding: 2rem; padding-top: 38%; }}
+            .slide-container {{ flex-direction: column; }}
+        }}
+        
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="left-background"></div>
+        <div class="title-container">
+            <h1 class="main-title">{main_title}</h1>
+        </div>
+        <div class="right-content-area">
+            {team_html}
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+
+
+
+def generate_colorful_team_grid_slide(
+    main_title="Add a Team Members Page",
+    team_members=[
+        { "name": "Olivia Chen", "role": "Lead Designer", "image_url": "https://images.unsplash.com/photo-1580489944761-15a19d654956?q=80&w=1887&auto=format=fit=crop", "color": "#8A44A1" },
+        { "name": "Ben Carter", "role": "Frontend Developer", "image_url": "https://images.unsplash.com/photo-1507003211169-0a1dd7228f2d?q=80&w=1887&auto=format=fit=crop", "color": "#2E9A94" },
+        { "name": "Aisha Khan", "role": "Project Manager", "image_url": "https://images.unsplash.com/photo-1494790108377-be9c29b29330?q=80&w=1887&auto=format=fit=crop", "color": "#D93B58" },
+        { "name": "Leo Martinez", "role": "Marketing Head", "image_url": "https://images.unsplash.com/photo-1539571696357-5a69c17a67c6?q=80&w=1887&auto=format=fit=crop", "color": "#F3C314" }
+    ],
+    font_family="'Montserrat', 'Inter', sans-serif",
+    bg_color="#F8FAFC",
+    title_color="#111827",
+    card_text_color="#1F2937"
+):
+    """
+    Generates a vibrant, STATIC team slide with a spacious and balanced grid layout.
+    Hover effects have been removed.
+    """
+    
+    team_members_html = ""
+    for member in team_members:
+        team_members_html += f"""
+        <div class="team-card" style="--member-color: {member['color']};">
+            <img class="member-photo" src="{member['image_url']}" alt="{member['name']}" />
+            <div class="member-info">
+                <h2 class="member-name">{member['name']}</h2>
+                <p class="member-role">{member['role']}</p>
+            </div>
+        </div>
+        """
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Team Members Slide - Spacious Design</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@400;700;800&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; width: 1920px; height: 1080px; }}
+        body, html {{
+            height: 1080px;
+            width: 1920px;
+            font-family: {font_family};
+            background-color: {bg_color};
+            overflow: hidden;
+        }}
+
+        .slide-container {{
+            width: 1920px;
+            height: 1080px;
+            position: relative;
+            background-color: {bg_color};
+            display: grid;
+            grid-template-columns: 1fr 1.2fr;
+            align-items: center;
+            gap: 80px;
+            padding: 80px 120px;
+        }}
+
+        .text-column {{ padding-right: 40px; }}
+
+        .main-title {{
+            font-size: 110px;
+            font-weight: 800;
+            line-height: 1.2;
+            color: {title_color};
+            margin-bottom: 20px;
+        }}
+        
+        .title-divider {{
+            height: 8px;
+            width: 120px;
+            background: linear-gradient(90deg, #8A44A1, #2E9A94, #F3C314);
+            border: none;
+            border-radius: 4px;
+            margin-bottom: 40px;
+        }}
+        
+        .team-grid {{
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            gap: 60px;
+        }}
+        
+        .team-card {{
+            position: relative;
+            background-color: #FFFFFF;
+            border-radius: 20px;
+            padding-top: 80px; 
+            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
+            text-align: center;
+        }}
+        
+        .member-photo {{
+            width: 120px;
+            height: 120px;
+            border-radius: 50%;
+            object-fit: cover;
+            display: block;
+            position: absolute;
+            top: -60px; 
+            left: 50%;
+            transform: translateX(-50%);
+            border: 8px solid var(--member-color);
+            background-color: white;
+        }}
+        
+        .member-info {{
+            padding: 30px 20px 40px;
+            color: {card_text_color};
+        }}
+        
+        .member-name {{
+            font-size: 36px;
+            font-weight: 700;
+            margin-bottom: 10px;
+        }}
+
+        .member-role {{
+            font-size: 24px;
+            font-weight: 400;
+            opacity: 0.8;
+        }}
+
+        /* Content wrapper for scaling */
+        .content-wrapper {{
+            position: absolute;
+            left: 50%;
+            top: 50%;
+            transform: translate(-50%, -50%);
+            width: 1920px;
+            height: 1080px;
+            overflow: visible;
+            background: inherit;
+        }}
+        
+        .outer-wrapper {{
+            padding: 0;
+            box-sizing: border-box;
+            width: 1920px;
+            height: 1080px;
+            overflow: hidden;
+        }}
+
+    </style>
+</head>
+<body>
+    <div class="outer-wrapper">
+        <div class="content-wrapper">
+            <div class="slide-container">
+                <div class="text-column">
+                    <h1 class="main-title">{main_title}</h1>
+                    <hr class="title-divider" />
+                </div>
+                <div class="team-grid">
+                    {team_members_html}
+                </div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+#ngon
+
+def generate_corporate_team_slide(
+    main_title="Our Creative Team",
+    team_members=[
+        { "name": "Olivia Chen", "role": "Lead Designer", "image_url": "https://images.unsplash.com/photo-1580489944761-15a19d654956?q=80&w=1887&auto=format=fit=crop" },
+        { "name": "Ben Carter", "role": "Photographer", "image_url": "https://images.unsplash.com/photo-1507003211169-0a1dd7228f2d?q=80&w=1887&auto=format=fit=crop" },
+        { "name": "Aisha Khan", "role": "Content Strategist", "image_url": "https://images.unsplash.com/photo-1494790108377-be9c29b29330?q=80&w=1887&auto=format=fit=crop" },
+        { "name": "Leo Martinez", "role": "Illustrator", "image_url": "https://images.unsplash.com/photo-1539571696357-5a69c17a67c6?q=80&w=1887&auto=format=fit=crop" }
+    ],
+    font_family_heading="'Patrick Hand', cursive",
+    font_family_body="'Lato', sans-serif",
+    text_color="#4A403A",
+    role_color="#6B7280",
+    bg_url="https://www.toptal.com/designers/subtlepatterns/uploads/paper.png"
+):
+    """
+    Generates a creative, personal, and STATIC 'Meet the Team' slide with a Polaroid photo theme.
+    Hover effects have been removed.
+    """
+    team_members_html = "".join([f"""<div class="polaroid-card"><img class="member-photo" src="{member['image_url']}" alt="{member['name']}" /><div class="member-info"><h2 class="member-name">{member['name']}</h2><p class="member-role">{member['role']}</p></div></div>""" for member in team_members])
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8"><meta name="viewport" content="width=device-width, initial-scale=1.0"><title>Team Presentation - Polaroid Style</title>
+    <link href="https://fonts.googleapis.com/css2?family=Patrick+Hand&family=Lato:wght@400;700&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        
+        /* OVERRIDE EDITOR BACKGROUND - HIGHEST SPECIFICITY */
+        div[style*="background: white"], 
+        div[style*="background: #FFFFFF"],
+        div[style*="background-color: white"],
+        div[style*="background-color: #FFFFFF"],
+        #canvas,
+        [data-bg*="#FFFFFF"] {{
+            background: url('{bg_url}') repeat center !important;
+            background-color: #F8F8F8 !important;
+        }}
+        
+        html#html.html {{ font-size: 16px !important; }}
+        
+        body#body.body, html#html.html {{
+            height: 100vh !important; 
+            width: 100vw !important; 
+            font-family: {font_family_body} !important; 
+            overflow: hidden !important; 
+            background-color: #F8F8F8 !important; 
+            background-image: url('{bg_url}') !important;
+            background-repeat: repeat !important;
+            background-position: center !important;
+            background-size: auto !important;
+        }}
+        
+        .slide-container {{ 
+            width: 100% !important; 
+            height: 100% !important; 
+            display: flex !important; 
+            flex-direction: column !important;
+            background: transparent !important;
+        }}
+        .title-section {{ width: 100%; display: flex; justify-content: center; align-items: center; padding: 4rem 4rem 2rem 4rem; }}
+        .main-title {{ font-family: {font_family_heading}; font-size: clamp(2.5rem, 6vw, 4rem); font-weight: 400; color: {text_color}; margin: 0; text-align: center; }}
+        .content-section {{ flex: 1; width: 100%; display: flex; justify-content: center; align-items: center; padding: 0 4rem 4rem 4rem; }}
+        .team-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(280px, 1fr)); gap: 3rem; width: 100%; max-width: 80rem; }}
+        .polaroid-card {{
+            background: #FFFFFF; padding: 1rem 1rem 1.5rem 1rem; border-radius: 0.25rem;
+            box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+        }}
+        .polaroid-card:nth-child(4n+1) {{ transform: rotate(-4deg); }}
+        .polaroid-card:nth-child(4n+2) {{ transform: rotate(2deg); }}
+        .polaroid-card:nth-child(4n+3) {{ transform: rotate(5deg); }}
+        .polaroid-card:nth-child(4n+4) {{ transform: rotate(-2deg); }}
+        .member-photo {{ width: 100%; display: block; margin-bottom: 1rem; }}
+        .member-info {{ text-align: center; }}
+        .member-name {{ font-family: {font_family_heading}; font-size: 1.75rem; color: {text_color}; margin-bottom: 0.25rem; }}
+        .member-role {{ font-size: 1rem; color: {role_color}; line-height: 1.5; }}
+        @media (max-width: 48rem) {{ body, html {{ height: auto; min-height: 100vh; overflow-y: auto; }} }}
+    </style>
+</head>
+<body id="body" class="body">
+    <div class="slide-container">
+        <div class="title-section">
+            <h1 class="main-title">{main_title}</h1>
+        </div>
+        <div class="content-section">
+            <div class="team-grid">{team_members_html}</div>
+        </div>
+    </div>
+</body>
+</html>"""
+    return html_code
@@ -0,0 +1,2554 @@
+"""Slide chuyển mục / section header (SLIDE CHUYỂN SLIDE)."""
+
+#----------------------SLIDE CHUYỂN SLIDE
+
+def generate_geometric_transition_slide(
+    headline="TRANSITION HEADLINE",
+    subtitle="Let's start with the first set of slides",
+    font_family="'Poppins', 'Inter', sans-serif",
+    bg_color="#0F172A",
+    primary_text_color="#FFFFFF",
+    subtitle_color="#67E8F9"
+):
+    """
+    Generates a modern, dynamic transition slide with colorful geometric shapes.
+    Features a dark background with high-contrast, centered text. Ideal for tech
+    or creative presentations.
+    """
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Geometric Transition Slide</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@400;700&family=Roboto:wght@400;700&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; }}
+        body, html {{
+            height: 100vh;
+            width: 100vw;
+            font-family: {font_family};
+            overflow: hidden;
+            background-color: {bg_color};
+            color: {primary_text_color};
+        }}
+
+        .slide-container {{
+            width: 100%; height: 100%;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            text-align: center;
+            position: relative;
+        }}
+
+        .text-content {{
+            z-index: 10;
+            max-width: 90%;
+            width: 100%;
+        }}
+
+        .headline {{
+            font-size: clamp(6rem, 10vw, 8rem) !important;
+            font-weight: 700;
+            text-transform: uppercase;
+            line-height: 1.25;
+            margin-bottom: 3rem;
+            display: block;
+            width: 100%;
+        }}
+
+        .subtitle {{
+            font-size: 3.5rem !important;
+            font-weight: 500;
+            color: {subtitle_color};
+            line-height: 1.5;
+            display: block;
+            width: 100%;
+        }}
+
+        /* --- Geometric Shapes --- */
+        .shape-cluster {{
+            position: absolute;
+            width: 40%;
+            height: 40%;
+            pointer-events: none;
+        }}
+
+        .shape-cluster.top-right {{
+            top: 0;
+            right: 0;
+        }}
+
+        .shape-cluster.bottom-left {{
+            bottom: 0;
+            left: 0;
+        }}
+
+        .shape {{
+            position: absolute;
+            transform-origin: center center;
+            transform: skewX(-20deg) rotate(15deg);
+        }}
+
+        /* Top-Right Shapes Palette */
+        .shape-tr-1 {{ width: 10rem; height: 10rem; background-color: #34D399; opacity: 0.9; top: 6rem; right: 5rem; z-index: 2; }}
+        .shape-tr-2 {{ width: 12rem; height: 12rem; background-color: #6366F1; opacity: 0.8; top: 10rem; right: 9rem; z-index: 1; }}
+        .shape-tr-3 {{ width: 8rem; height: 8rem; background: linear-gradient(45deg, #F87171, #FBBF24); opacity: 1; top: 16rem; right: 5rem; z-index: 3; }}
+        .shape-tr-4 {{ width: 9rem; height: 9rem; background-color: #1E3A8A; opacity: 0.5; top: 3rem; right: 13rem; z-index: 0; }}
+
+        /* Bottom-Left Shapes Palette */
+        .shape-bl-1 {{ width: 8rem; height: 8rem; background-color: #34D399; opacity: 0.7; bottom: 10rem; left: 3rem; z-index: 2; }}
+        .shape-bl-2 {{ width: 7rem; height: 7rem; background-color: #FBBF24; opacity: 0.9; bottom: 7rem; left: 8rem; z-index: 3; }}
+        .shape-bl-3 {{ width: 11rem; height: 11rem; background-color: #A78BFA; opacity: 1; bottom: 2rem; left: 11rem; z-index: 2; }}
+        .shape-bl-4 {{ width: 10rem; height: 10rem; background: linear-gradient(45deg, #EF4444, #FB923C); opacity: 1; bottom: 2rem; left: 5rem; z-index: 4; }}
+        .shape-bl-5 {{ width: 9rem; height: 9rem; background-color: #1E3A8A; opacity: 0.8; bottom: 9rem; left: 7rem; z-index: 1; }}
+        .shape-bl-6 {{ width: 6rem; height: 6rem; background-color: #60A5FA; opacity: 0.4; bottom: 14rem; left: 2rem; z-index: 0; }}
+
+        @media (max-width: 48rem) {{
+            .shape-cluster {{ transform: scale(0.7); }}
+            .top-right {{ top: -5rem; right: -5rem; }}
+            .bottom-left {{ bottom: -5rem; left: -5rem; }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="shape-cluster top-right">
+            <div class="shape shape-tr-1"></div><div class="shape shape-tr-2"></div><div class="shape shape-tr-3"></div><div class="shape shape-tr-4"></div>
+        </div>
+        <div class="shape-cluster bottom-left">
+            <div class="shape shape-bl-1"></div><div class="shape shape-bl-2"></div><div class="shape shape-bl-3"></div><div class="shape shape-bl-4"></div><div class="shape shape-bl-5"></div><div class="shape shape-bl-6"></div>
+        </div>
+        <div class="text-content">
+            <h2 class="headline">{headline}</h2>
+            <p class="subtitle">{subtitle}</p>
+        </div>
+    </div>
+</body>
+</html>"""
+    return html_code
+
+def generate_dusk_transition_slide(
+    headline="Transition Headline",
+    subtitle="Let's start with the first set of slides",
+    font_family="'Nunito', 'Inter', sans-serif",
+    headline_color="#2C3E50",
+    subtitle_color="#4A5568",
+    number_color="#FDE68A",
+    sky_top_color="#6B4F9B",
+    sky_mid_color="#C07CB6",
+    sky_bottom_color="#F6B17B",
+    grid_dot_color="rgba(255, 255, 255, 0.3)"
+):
+    """
+    Generates a minimalist, tech-themed transition slide with a dusk color palette.
+    This version is static, with launching rockets removed.
+    """
+    
+    # ĐÃ XÓA: Toàn bộ phần cấu hình và HTML của tên lửa đã được loại bỏ.
+    rockets_html = ""
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Minimalist Dusk Transition</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Nunito:wght@400;800&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        body, html {{
+            height: 100vh;
+            width: 100vw;
+            font-family: {font_family};
+            overflow: hidden;
+        }}
+
+        .slide-container {{
+            width: 100%;
+            height: 100%;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+            align-items: center;
+            position: relative;
+            text-align: center;
+            background-image: 
+                radial-gradient(circle, {grid_dot_color} 1px, transparent 1px),
+                linear-gradient(to bottom, {sky_top_color}, {sky_mid_color}, {sky_bottom_color});
+            background-size: 20px 20px, 100% 100%;
+        }}
+        
+        /* --- ĐÃ XÓA: Toàn bộ phần CSS của tên lửa --- */
+
+        .headline {{
+            font-size: 5rem !important;
+            font-weight: 700;
+            color: {headline_color};
+            line-height: 1.25;
+            margin: 0 auto 3rem auto;
+            text-align: center !important;
+            display: block;
+            width: 100%;
+            padding: 0 100px;
+        }}
+
+        .subtitle {{
+            font-size: 3rem !important;
+            font-weight: 400;
+            color: {subtitle_color};
+            line-height: 1.5;
+            margin: 0 auto 0 auto;
+            text-align: center !important;
+            display: block;
+            width: 100%;
+            padding: 0 100px;
+        }}
+
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <!-- {rockets_html} bây giờ là chuỗi rỗng -->
+        {rockets_html}
+        <h1 class="headline">{headline}</h1>
+        <p class="subtitle">{subtitle}</p>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+def generate_memphis_transition_slide(
+    headline="Transition headline",
+    subtitle="Let's start with the first set of slides",
+    font_family_headline="'Lora', serif",
+    font_family_body="'Lato', sans-serif",
+    top_panel_bg="#19114B",
+    bottom_panel_bg="#403271",
+    palette=["#F87171", "#FBBF24", "#A78BFA", "#60A5FA", "#34D399"]
+):
+    """
+    Generates a vibrant, retro, and STATIC 'Memphis-style' transition slide.
+    The rotating icon animation has been removed.
+    """
+    svg_patterns = f"""<svg width="0" height="0" style="position:absolute;"><defs><pattern id="pattern-dots" x="0" y="0" width="8" height="8" patternUnits="userSpaceOnUse"><circle cx="2" cy="2" r="2" fill="{palette[3]}" /></pattern><pattern id="pattern-stripes" x="0" y="0" width="10" height="10" patternUnits="userSpaceOnUse" patternTransform="rotate(45)"><line x1="0" y1="0" x2="0" y2="10" stroke="{palette[0]}" stroke-width="4" /></pattern></defs></svg>"""
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8"><meta name="viewport" content="width=device-width, initial-scale=1.0"><title>Memphis Transition Slide</title>
+    <link href="https://fonts.googleapis.com/css2?family=Lato:wght@400;700&family=Lora:wght@400;600&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }} html {{ font-size: 16px; }}
+        body, html {{ height: 100vh; width: 100vw; overflow: hidden; font-family: {font_family_body}; }}
+        .slide-container {{ width: 100%; height: 100%; display: flex; flex-direction: column; position: relative; }}
+        .top-panel, .bottom-panel {{ flex: 1; position: relative; overflow: hidden; }}
+        .top-panel {{ background-color: {top_panel_bg}; display: flex; justify-content: center; align-items: flex-end; padding-bottom: 5rem; }}
+        .bottom-panel {{ background-color: {bottom_panel_bg}; }}
+        .text-content {{
+            text-align: center;
+            transform: scale(1.3);
+            min-width: 50vw;
+            min-height: 25vh; 
+        }}
+        .section-number {{ font-family: {font_family_headline}; font-size: 3rem; font-weight: 400; color: {palette[3]}; opacity: 0.8; }}
+        .headline {{ font-family: {font_family_headline}; font-size: 4rem; font-weight: 700; margin-bottom: 5rem ; color: #FFFFFF; }}
+        .subtitle {{font-size: 2rem; font-weight: 500; margin-bottom: 8rem; color: {palette[1]}; }}
+        .shape {{ position: absolute; }}
+        .shape-tl-1 {{ width: 8rem; height: 8rem; background: url(#pattern-dots); top: 4rem; left: 6rem; border-radius: 50%; opacity: 0.8; }}
+        .shape-tl-2 {{ width: 0; height: 0; border-left: 3rem solid transparent; border-right: 3rem solid transparent; border-bottom: 5rem solid {palette[0]}; top: 12rem; left: 3rem; transform: rotate(-25deg); }}
+        .shape-tl-3 {{ width: 5rem; height: 5rem; border: 3px solid {palette[4]}; top: 2rem; left: 1rem; clip-path: polygon(50% 0%, 100% 38%, 82% 100%, 18% 100%, 0% 38%); }}
+        .shape-tr-1 {{ width: 7rem; height: 7rem; border-radius: 50%; border: 3px dashed {palette[1]}; top: 3rem; right: 8rem; }}
+        .shape-tr-2 {{ width: 6rem; height: 6rem; background: {palette[2]}; opacity: 0.5; top: 1rem; right: 2rem; clip-path: polygon(50% 0%, 100% 38%, 82% 100%, 18% 100%, 0% 38%); transform: rotate(20deg); }}
+        .shape-tr-3 {{ width: 9rem; height: 9rem; background: url(#pattern-stripes); border-radius: 50%; top: 8rem; right: 3rem; transform: rotate(45deg); opacity: 0.9; }}
+        .shape-bl-1 {{ width: 0; height: 0; border-left: 4rem solid transparent; border-right: 4rem solid transparent; border-bottom: 7rem solid {palette[1]}; bottom: 2rem; left: 1rem; transform: rotate(15deg) scaleX(-1); }}
+        .shape-bl-2 {{ width: 6rem; height: 6rem; border: 3px dashed {palette[2]}; border-radius: 50%; bottom: 8rem; left: 9rem; }}
+        .shape-bl-3 {{ width: 4rem; height: 4rem; background-color: {palette[0]}; bottom: 1rem; left: 12rem; transform: rotate(30deg); }}
+        .shape-br-1 {{ width: 5rem; height: 5rem; background-color: {palette[3]}; border-radius: 50%; bottom: 2rem; right: 1rem; }}
+        .shape-br-2 {{ width: 9rem; height: 9rem; background: url(#pattern-dots); bottom: 6rem; right: 5rem; clip-path: polygon(50% 0%, 100% 50%, 50% 100%, 0% 50%); transform: rotate(-15deg); }}
+        .shape-br-3 {{ width: 0; height: 0; border-left: 2rem solid transparent; border-right: 2rem solid transparent; border-bottom: 3.5rem solid {palette[4]}; bottom: 1rem; right: 10rem; transform: rotate(45deg); opacity: 0.7;}}
+    </style>
+</head>
+<body>
+    {svg_patterns}
+    <div class="slide-container">
+        <div class="top-panel"><div class="text-content"><h2 class="headline">{headline}</h2><p class="subtitle">{subtitle}</p></div><div class="shape shape-tl-1"></div><div class="shape shape-tl-2"></div><div class="shape shape-tr-1"></div><div class="shape shape-tr-2"></div><div class="shape shape-tr-3"></div></div>
+        <div class="bottom-panel"><div class="shape shape-bl-1"></div><div class="shape shape-bl-2"></div><div class="shape shape-bl-3"></div><div class="shape shape-br-1"></div><div class="shape shape-br-2"></div><div class="shape shape-br-3"></div></div>
+    </div>
+</body>
+</html>"""
+    return html_code
+
+def generate_pushpin_section_header(
+    main_title="Add a Section Header",
+    font_family="'Poppins', 'Inter', sans-serif",
+    # ĐÃ THAY ĐỔI: Bảng màu mới tối giản và chuyên nghiệp
+    bg_color="#FDFCFB",
+    text_color="#1F2937",    # Xám đen
+    accent_color="#1F2937"   # Dùng cùng màu cho sự đồng nhất
+):
+    """
+    Generates a minimalist and sophisticated section header slide, featuring a central
+    title that elegantly intersects with a decorative horizontal line.
+    """
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Section Header - Minimalist Design</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@800&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        
+        /* OVERRIDE EDITOR BACKGROUND - HIGHEST SPECIFICITY */
+        div[style*="background: white"], 
+        div[style*="background: #FFFFFF"],
+        div[style*="background-color: white"],
+        div[style*="background-color: #FFFFFF"],
+        #canvas,
+        [data-bg*="#FFFFFF"] {{
+            background: url('https://www.toptal.com/designers/subtlepatterns/uploads/paper.png') repeat center !important;
+            background-color: {bg_color} !important;
+        }}
+        
+        html#html.html {{ 
+            font-size: 16px !important;
+            height: 100vh !important;
+            width: 100vw !important;
+            font-family: {font_family} !important;
+            overflow: hidden !important;
+            display: flex !important;
+            justify-content: center !important;
+            align-items: center !important;
+            background-color: {bg_color} !important;
+            background-image: url('https://www.toptal.com/designers/subtlepatterns/uploads/paper.png') !important;
+            background-repeat: repeat !important;
+            background-position: center !important;
+        }}
+        
+        body#body.body, html#html.html {{
+            height: 100vh !important;
+            width: 100vw !important;
+            font-family: {font_family} !important;
+            overflow: hidden !important;
+            display: flex !important;
+            justify-content: center !important;
+            align-items: center !important;
+            background-color: {bg_color} !important;
+            background-image: url('https://www.toptal.com/designers/subtlepatterns/uploads/paper.png') !important;
+            background-repeat: repeat !important;
+            background-position: center !important;
+        }}
+
+        .slide-container {{
+            width: 100%;
+            height: 100%;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            padding: 2rem;
+        }}
+        
+        /* ĐÃ THAY ĐỔI: Container cho toàn bộ khối tiêu đề và đường kẻ */
+        .title-block {{
+            position: relative;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            width: 100%;
+            max-width: 70rem;
+        }}
+        
+        /* Đường kẻ trang trí */
+        .divider-line {{
+            position: absolute;
+            width: 100%;
+            height: 6px;
+            background-color: {accent_color};
+            z-index: 1;
+        }}
+
+        .main-title {{
+            font-size: 6rem !important;
+            color: {text_color};
+            font-weight: 800;
+            line-height: 1.2;
+            text-align: center !important;
+            text-transform: uppercase;
+            letter-spacing: 0.05em;
+            background-color: {bg_color};
+            padding: 0 3rem;
+            z-index: 2;
+            display: block;
+            width: auto;
+            margin: 0 auto;
+            position: relative;
+        }}
+
+        /* Các chấm trang trí */
+        .dot {{
+            width: 1.5rem;
+            height: 1.5rem;
+            background-color: {accent_color};
+            border-radius: 50%;
+            z-index: 3;
+        }}
+
+        .left-dot {{
+            margin-right: 3rem;
+        }}
+
+        .right-dot {{
+            margin-left: 3rem;
+        }}
+
+    </style>
+</head>
+<body id="body" class="body">
+    <div class="slide-container">
+        <div class="title-block">
+            <div class="dot left-dot"></div>
+            <div class="divider-line"></div>
+            <h1 class="main-title">{main_title}</h1>
+            <div class="dot right-dot"></div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+def generate_section_header_slide(
+    header_text="Add a Section Header",
+    font_family="'Poppins', 'Inter', sans-serif",
+    bg_color="#F8FAFC",
+    text_color="#1E293B",
+    gradient_color_1="#A78BFA",
+    gradient_color_2="#F472B6",
+    gradient_color_3="#7DD3FC"
+):
+    """
+    Generates a vibrant and STATIC section header slide, featuring a soft aurora background.
+    Animated shapes have been removed.
+    """
+    
+    # ĐÃ XÓA: Toàn bộ phần HTML của các hình khối đã được loại bỏ.
+    shapes_svg_html = ""
+
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Section Header Slide - Geometric shapes</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@800&display=swap" rel="stylesheet">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; }}
+        body, html {{
+            height: 100vh;
+            width: 100vw;
+            font-family: {font_family};
+            overflow: hidden;
+            background-color: {bg_color};
+            position: relative;
+        }}
+
+        .graphic-background {{
+            position: absolute; top: 0; left: 0; width: 100%; height: 100%;
+            overflow: hidden; z-index: 1;
+        }}
+        .circle {{
+            position: absolute; border-radius: 50%;
+            background: linear-gradient(135deg, {gradient_color_1}, {gradient_color_2}, {gradient_color_3});
+            filter: blur(120px);
+            opacity: 0.5;
+        }}
+        .circle-1 {{ width: 30rem; height: 30rem; top: -10rem; left: -10rem; }}
+        .circle-2 {{ width: 30rem; height: 30rem; bottom: -15rem; right: -15rem; }}
+
+        .slide-container {{
+            width: 100%; height: 100%; display: flex;
+            justify-content: center; align-items: center;
+            padding: 4rem; position: relative;
+            z-index: 3;
+        }}
+        
+        .header-text {{
+            font-size: clamp(3.5rem, 8vw, 6.5rem);
+            font-weight: 800;
+            line-height: 1.15;
+            color: {text_color};
+            text-align: center;
+            max-width: 20ch;
+        }}
+
+        /* ĐÃ XÓA: Toàn bộ phần CSS cho các hình khối động đã được loại bỏ. */
+
+    </style>
+</head>
+<body>
+    <div class="graphic-background">
+        <div class="circle circle-1"></div>
+        <div class="circle circle-2"></div>
+    </div>
+    <!-- {shapes_svg_html} sẽ là chuỗi rỗng -->
+    {shapes_svg_html}
+    <div class="slide-container">
+        <h1 class="header-text">{header_text}</h1>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+
+def generate_intro_slide(
+    main_title="Main Title",
+    subtitle1="Subtitle1",
+    subtitle2="Subtitle2",
+    main_bg_color="#ffffff",
+    accent_bg_color="#6ea88a",
+    text_box_bg_color="#c5e6b8",
+    title_color="#333333",
+    subtitle_color="#555555",
+    line_color="#e6c35c",
+    font_family="'Inter', sans-serif",
+    main_title_font_style="italic",
+    image_url="Image/generate_intro_slide1/Default_1.png"
+):
+    """
+    Tạo slide HTML với thiết kế marketing có nền tràn viền như các slide khác.
+    Các tham số kích thước nên được truyền vào dưới dạng chuỗi với đơn vị REM.
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Marketing Slide</title>
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        html {{ font-size: 16px; }}
+        body, html {{
+            height: 100vh;
+            width: 100vw;
+            font-family: {font_family};
+            background-color: {accent_bg_color};
+            overflow: hidden;
+        }}
+
+        .slide-container {{
+            width: 100%;
+            height: 100%;
+            position: relative;
+            background-color: {accent_bg_color};
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            padding: 5rem 7.5rem; /* 80px 120px */
+        }}
+
+        .slide-inner-container {{
+            width: 100%;
+            height: 100%;
+            max-width: 105rem; /* 1680px */
+            max-height: 57.5rem; /* 920px */
+            background-color: {main_bg_color};
+            border-radius: 1rem; /* 16px */
+            box-shadow: 0 1.25rem 2.5rem rgba(0,0,0,0.15);
+            position: relative;
+            overflow: hidden;
+            display: flex;
+        }}
+        
+        .left-content {{
+            flex: 0 0 60%;
+            height: 100%;
+            position: relative;
+            background-color: {main_bg_color};
+            display: flex;
+            align-items: center;
+            justify-content: center;
+        }}
+        
+        .right-content {{
+            flex: 0 0 40%;
+            height: 100%;
+            background-color: {accent_bg_color};
+            position: relative;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+        }}
+        
+        .image-container {{
+            width: 80%;
+            height: 70%;
+            background-color: white;
+            border-radius: 1rem;
+            box-shadow: 0 1rem 2rem rgba(0,0,0,0.15);
+            overflow: hidden;
+            position: relative;
+            z-index: 3;
+        }}
+        
+        .image-container img {{
+            width: 100%;
+            height: 100%;
+            object-fit: cover;
+        }}
+        
+        .accent-bar-top {{
+            position: absolute;
+            top: 0;
+            left: 0;
+            width: 4rem; /* 64px - larger for better visibility */
+            height: 2rem; /* 32px */
+            background-color: {text_box_bg_color};
+            z-index: 1;
+        }}
+        
+        .accent-bar-middle {{
+            position: absolute;
+            top: 50%;
+            left: 0;
+            right: 0;
+            height: 4rem; /* 64px - larger */
+            background-color: {text_box_bg_color};
+            transform: translateY(-50%);
+            z-index: 1;
+        }}
+        
+        .content-box {{
+            background-color: {text_box_bg_color};
+            padding: 5rem; /* 80px - much larger padding */
+            border-radius: 0.5rem;
+            z-index: 2;
+            position: relative;
+            width: 90%; /* 90% of left-content width */
+            height: 85%; /* 85% of left-content height */
+            max-width: none; /* Remove max-width constraint */
+            box-shadow: 0 0.5rem 1rem rgba(0,0,0,0.1);
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+        }}
+        
+        .main-title {{
+            font-size: 5.5rem !important;
+            color: {title_color};
+            margin: 0 0 3rem 0;
+            font-weight: bold;
+            font-style: {main_title_font_style};
+            line-height: 1.2;
+            text-align: center !important;
+            display: block;
+            width: 100%;
+        }}
+        
+        .subtitle {{
+            font-size: 2.5rem !important;
+            color: {subtitle_color};
+            margin: 1rem 0;
+            line-height: 1.4;
+            text-align: center !important;
+            display: block;
+            width: 100%;
+        }}
+        
+        .divider {{
+            width: 80%; /* 80% width instead of 100% */
+            height: 0.25rem; /* 4px - thicker */
+            background-color: {line_color};
+            margin: 3rem auto 0 auto; /* 48px top margin, centered */
+            border-radius: 0.125rem;
+        }}
+        
+        .decorative-element {{
+            position: absolute;
+            background-color: {text_box_bg_color};
+            opacity: 0.5;
+            z-index: 1;
+        }}
+        
+        .deco-1 {{
+            top: 1rem;
+            right: 1rem;
+            width: 4rem; /* 64px - smaller so they don't interfere with image */
+            height: 4rem;
+            border-radius: 50%;
+        }}
+        
+        .deco-2 {{
+            bottom: 1rem;
+            right: 1rem;
+            width: 3rem; /* 48px - smaller square */
+            height: 3rem;
+            transform: rotate(45deg);
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="slide-inner-container">
+            <!-- Accent bars -->
+            <div class="accent-bar-top"></div>
+            <div class="accent-bar-middle"></div>
+            
+            <!-- Left content area -->
+            <div class="left-content">
+                <div class="content-box">
+                    <h1 class="main-title">{main_title}</h1>
+                    <p class="subtitle">{subtitle1}</p>
+                    <p class="subtitle">{subtitle2}</p>
+                    <div class="divider"></div>
+                </div>
+            </div>
+            
+            <!-- Right content area -->
+            <div class="right-content">
+                <div class="image-container">
+                    <img src="{image_url}" alt="slide visual">
+                </div>
+                <div class="decorative-element deco-1"></div>
+                <div class="decorative-element deco-2"></div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+# moi    
+def generate_research_proposal_transition_slide(
+    headline="TRANSITION HEADLINE",
+    subtitle="Let's start with the first set of slides",
+    bg_color="#FFFFFF",
+    accent_color="#C4A57B",
+    number_color="#C4A57B",
+    headline_color="#000000",
+    subtitle_color="#9B8B6F",
+    left_bar_width="60",
+):
+    """
+    Generate a minimalist transition slide with geometric decorations.
+    
+    This function creates a clean, professional transition slide featuring:
+    - Bold headline text
+    - Descriptive subtitle
+    - Geometric decorative elements (crosshair, shapes, grid, bar)
+    - Modern minimalist aesthetic
+    
+    Args:
+        headline (str): Main headline text for the transition
+        subtitle (str): Subtitle/description text
+        bg_color (str): Background color (default: white)
+        accent_color (str): Color for decorative elements (default: tan/brown)
+        number_color (str): Color for section number (default: tan/brown)
+        headline_color (str): Color for headline (default: black)
+        subtitle_color (str): Color for subtitle (default: darker tan)
+        left_bar_width (str): Width of left decorative bar in pixels
+    
+    Returns:
+        str: Complete HTML code for the transition slide
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Transition Slide</title>
+    <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@700;900&family=Inter:wght@400;500&display=swap" rel="stylesheet">
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body {{
+            font-family: 'Inter', sans-serif;
+            background-color: {bg_color};
+            overflow: hidden;
+        }}
+        
+        .slide-container {{
+            width: 1920px;
+            height: 1080px;
+            position: relative;
+            background-color: {bg_color};
+            overflow: hidden;
+        }}
+        
+        /* Left decorative bar */
+        .left-bar {{
+            position: absolute;
+            left: 0;
+            top: 180px;
+            width: {left_bar_width}px;
+            height: 180px;
+            background-color: {accent_color};
+            opacity: 0.9;
+        }}
+        
+        /* Content area */
+        .content {{
+            position: absolute;
+            left: 50%;
+            top: 50%;
+            transform: translate(-50%, -50%);
+            text-align: center;
+            z-index: 10;
+            max-width: 1400px;
+        }}
+        
+        .headline {{
+            font-family: 'Montserrat', sans-serif;
+            font-size: 90px;
+            font-weight: 900;
+            color: {headline_color};
+            line-height: 1.1;
+            margin-bottom: 30px;
+            letter-spacing: -2px;
+            text-transform: uppercase;
+        }}
+        
+        .subtitle {{
+            font-family: 'Inter', sans-serif;
+            font-size: 32px;
+            font-weight: 500;
+            color: {subtitle_color};
+            letter-spacing: 1px;
+        }}
+        
+        /* Decorative elements container */
+        .decorations {{
+            position: absolute;
+            top: 0;
+            right: 0;
+            width: 100%;
+            height: 100%;
+            pointer-events: none;
+            overflow: hidden;
+            background-image: 
+                linear-gradient({accent_color} 1px, transparent 1px),
+                linear-gradient(90deg, {accent_color} 1px, transparent 1px);
+            background-size: 40px 40px;
+            opacity: 0.08;
+        }}
+        
+        /* Central crosshair */
+        .crosshair {{
+            position: absolute;
+            top: 50%;
+            left: 50%;
+            transform: translate(-50%, -50%);
+            width: 500px;
+            height: 500px;
+        }}
+        
+        .crosshair-line {{
+            position: absolute;
+            background-color: {accent_color};
+            opacity: 0.4;
+        }}
+        
+        .crosshair-line.horizontal {{
+            top: 50%;
+            left: 0;
+            width: 100%;
+            height: 2px;
+            transform: translateY(-50%);
+        }}
+        
+        .crosshair-line.vertical {{
+            top: 0;
+            left: 50%;
+            width: 2px;
+            height: 100%;
+            transform: translateX(-50%);
+        }}
+        
+        /* Geometric shapes */
+        .geometric-shape {{
+            position: absolute;
+            border: 2px solid {accent_color};
+            opacity: 0.4;
+        }}
+        
+        .triangle {{
+            top: 150px;
+            right: 250px;
+            width: 0;
+            height: 0;
+            border-left: 50px solid transparent;
+            border-right: 50px solid transparent;
+            border-bottom: 86px solid {accent_color};
+            opacity: 0.3;
+        }}
+        
+        .square {{
+            bottom: 200px;
+            right: 300px;
+            width: 80px;
+            height: 80px;
+            background-color: transparent;
+        }}
+        
+        .hexagon {{
+            top: 200px;
+            left: 200px;
+            width: 100px;
+            height: 57px;
+            background-color: {accent_color};
+            position: relative;
+            opacity: 0.25;
+        }}
+        
+        .hexagon:before,
+        .hexagon:after {{
+            content: "";
+            position: absolute;
+            width: 0;
+            border-left: 50px solid transparent;
+            border-right: 50px solid transparent;
+            left: 0;
+        }}
+        
+        .hexagon:before {{
+            bottom: 100%;
+            border-bottom: 29px solid {accent_color};
+        }}
+        
+        .hexagon:after {{
+            top: 100%;
+            border-top: 29px solid {accent_color};
+        }}
+        
+        /* Data points */
+        .data-point {{
+            position: absolute;
+            width: 10px;
+            height: 10px;
+            background-color: {accent_color};
+            border-radius: 50%;
+            opacity: 0.5;
+        }}
+        
+        .data-point:nth-child(1) {{
+            top: 180px;
+            right: 400px;
+        }}
+        
+        .data-point:nth-child(2) {{
+            bottom: 250px;
+            right: 350px;
+        }}
+        
+        .data-point:nth-child(3) {{
+            top: 250px;
+            left: 300px;
+        }}
+        
+        .data-point:nth-child(4) {{
+            bottom: 180px;
+            left: 250px;
+        }}
+        
+        /* Responsive wrapper for preview */
+        .wrapper {{
+            width: 100vw;
+            height: 100vh;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            background-color: #1a1a1a;
+        }}
+        
+        .wrapper .slide-container {{
+            max-width: 100%;
+            max-height: 100%;
+            object-fit: contain;
+        }}
+        
+    </style>
+</head>
+<body>
+    <div class="wrapper">
+        <div class="slide-container">
+            <!-- Left decorative bar -->
+            <div class="left-bar"></div>
+            
+            <!-- Main content -->
+            <div class="content">
+                <h1 class="headline">{headline}</h1>
+                <p class="subtitle">{subtitle}</p>
+            </div>
+            
+            <!-- Decorative elements -->
+            <div class="decorations">
+                <!-- Central crosshair -->
+                <div class="crosshair">
+                    <div class="crosshair-line horizontal"></div>
+                    <div class="crosshair-line vertical"></div>
+                </div>
+                
+                <!-- Geometric shapes -->
+                <div class="triangle"></div>
+                <div class="square geometric-shape"></div>
+                <div class="hexagon"></div>
+                
+                <!-- Data points -->
+                <div class="data-point"></div>
+                <div class="data-point"></div>
+                <div class="data-point"></div>
+                <div class="data-point"></div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+def generate_business_transition_slide(
+    headline="TRANSITION",
+    subtitle="Let's start with the next section",
+    headline_color="#0056d2",
+    subtitle_color="#666666",
+    accent_color="#0056d2",
+    headline_font="Arial, sans-serif",
+    subtitle_font="Arial, sans-serif"
+):
+    """
+    Generate a clean business transition slide with centered text and decorative side D-shapes.
+    
+    Args:
+        headline (str): Main transition headline (e.g., "TRANSITION")
+        subtitle (str): Subtitle text below headline
+        headline_color (str): Color for headline (default: blue)
+        subtitle_color (str): Color for subtitle text
+        accent_color (str): Color for decorative D-shapes
+        headline_font (str): Font family for headline
+        subtitle_font (str): Font family for subtitle
+    
+    Returns:
+        str: Complete HTML code for the business transition slide
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Business Transition</title>
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body {{
+            width: 1920px;
+            height: 1080px;
+            background: 
+                repeating-linear-gradient(
+                    0deg,
+                    transparent,
+                    transparent 50px,
+                    rgba(0, 86, 210, 0.03) 50px,
+                    rgba(0, 86, 210, 0.03) 100px
+                ),
+                repeating-linear-gradient(
+                    90deg,
+                    transparent,
+                    transparent 50px,
+                    rgba(0, 86, 210, 0.03) 50px,
+                    rgba(0, 86, 210, 0.03) 100px
+                ),
+                linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            overflow: hidden;
+            position: relative;
+        }}
+        
+        .slide-container {{
+            width: 100%;
+            height: 100%;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            position: relative;
+        }}
+        
+        .content {{
+            text-align: center;
+            z-index: 10;
+            max-width: 1400px;
+            padding: 0 100px;
+        }}
+        
+        .headline {{
+            font-family: {headline_font};
+            font-size: 140px;
+            font-weight: 900;
+            color: {headline_color};
+            letter-spacing: 8px;
+            margin-bottom: 40px;
+            line-height: 1.1;
+            text-transform: uppercase;
+        }}
+        
+        .subtitle {{
+            font-family: {subtitle_font};
+            font-size: 36px;
+            font-weight: 400;
+            color: {subtitle_color};
+            line-height: 1.6;
+            max-width: 1000px;
+            margin: 0 auto;
+        }}
+        
+        /* Decorative D-shapes on left and right */
+        .circle-left {{
+            position: absolute;
+            left: 0;
+            top: 50%;
+            transform: translateY(-50%);
+            width: 200px;
+            height: 400px;
+            background: {accent_color};
+            border-radius: 0 200px 200px 0;
+            z-index: 1;
+        }}
+        
+        .circle-right {{
+            position: absolute;
+            right: 0;
+            top: 50%;
+            transform: translateY(-50%);
+            width: 200px;
+            height: 400px;
+            background: {accent_color};
+            border-radius: 200px 0 0 200px;
+            z-index: 1;
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <!-- Side D-shapes -->
+        <div class="circle-left"></div>
+        <div class="circle-right"></div>
+        
+        <!-- Main content -->
+        <div class="content">
+            <div class="headline">{headline}</div>
+            <div class="subtitle">{subtitle}</div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+def generate_section_header_slide_5(
+    section_title="THIS IS THE TITLE OF THIS SECTION",
+    bg_color="#1a3d4a",
+    text_color="#ffffff",
+    stripe_color="#2a5566",
+    custom_css="",
+):
+    """
+    Generate an HTML slide with a split design: title on left, stripes on right.
+    """
+    
+    # Handle list inputs
+    if isinstance(section_title, list):
+        section_title = section_title[0] if section_title else "THIS IS THE TITLE OF THIS SECTION"
+    
+    # Create vertical stripes pattern (always shown)
+    stripes_html = """
+        <div class="stripes">
+            <div class="stripe"></div>
+            <div class="stripe"></div>
+            <div class="stripe"></div>
+            <div class="stripe"></div>
+            <div class="stripe"></div>
+            <div class="stripe"></div>
+            <div class="stripe"></div>
+            <div class="stripe"></div>
+            <div class="stripe"></div>
+            <div class="stripe"></div>
+            <div class="stripe"></div>
+            <div class="stripe"></div>
+            <div class="stripe"></div>
+            <div class="stripe"></div>
+            <div class="stripe"></div>
+        </div>
+        """
+    
+    # Create curved line SVG (always shown)
+    curved_line_html = f"""
+        <svg class="curved-line" viewBox="0 0 600 200" xmlns="http://www.w3.org/2000/svg">
+            <path d="M 0 100 Q 150 50, 300 100 T 600 100" 
+                  stroke="{stripe_color}" 
+                  stroke-width="2" 
+                  fill="none"
+                  opacity="0.4"/>
+        </svg>
+        """
+    
+    html_code = f"""
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>Section Slide</title>
+        <link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@700;900&display=swap" rel="stylesheet">
+        <style>
+            * {{
+                margin: 0;
+                padding: 0;
+                box-sizing: border-box;
+            }}
+            
+            html {{
+                width: 1920px;
+                height: 1080px;
+            }}
+            
+            body {{
+                width: 1920px;
+                height: 1080px;
+                font-family: 'Playfair Display', serif;
+                background: {bg_color};
+                color: {text_color};
+                position: relative;
+                overflow: hidden;
+            }}
+            
+            /* Title on left */
+            .section-title {{
+                position: absolute;
+                top: 280px;
+                left: 80px;
+                width: 800px;
+                font-size: 5rem;
+                font-weight: 900;
+                line-height: 1.1;
+                letter-spacing: 0.02em;
+                text-transform: uppercase;
+                z-index: 2;
+            }}
+            
+            /* Stripes on right */
+            .stripes {{
+                position: absolute;
+                top: 0;
+                right: 0;
+                width: 960px;
+                height: 1080px;
+                display: flex;
+                gap: 30px;
+                opacity: 0.3;
+            }}
+            
+            .stripe {{
+                flex: 1;
+                background: {stripe_color};
+            }}
+            
+            /* Curved line */
+            .curved-line {{
+                position: absolute;
+                bottom: 80px;
+                left: 660px;
+                width: 600px;
+                height: 200px;
+            }}
+            
+            {custom_css}
+        </style>
+    </head>
+    <body>
+        <h1 class="section-title">{section_title}</h1>
+        {stripes_html}
+        {curved_line_html}
+    </body>
+    </html>
+    """
+    
+    return html_code
+
+def generate_section_header_slide_6(
+    title="INTRODUCTION",
+    description="Here you can add a brief description of the topic you want to talk aboout.",
+    bg_color="#ffffff",
+    bg_gradient_to="#e3f2fd",
+    title_color="#1a1a1a",
+    text_color="#4a4a4a",
+    underline_color="#1a1a1a",
+    custom_css=""
+):
+    """
+    Generates a clean and elegant section header slide with centered content.
+    
+    This function creates a simple introduction slide with a title, optional underline,
+    and description text. The slide uses a gradient background and centers all content
+    vertically and horizontally.
+    
+    Args:
+        title: Main heading text for the slide
+        description: Supporting text displayed below the title and underline
+        bg_color: Starting color of the background gradient (top)
+        bg_gradient_to: Ending color of the background gradient (bottom)
+        title_color: Color of the main title text
+        text_color: Color of the description text
+        underline_color: Color of the decorative underline
+        (Underline is always displayed in this variant.)
+        custom_css: Additional CSS rules to inject into the style block
+    
+    """
+    
+    # Handle list inputs
+    if isinstance(title, list):
+        title = title[0] if title else "INTRODUCTION"
+    if isinstance(description, list):
+        description = description[0] if description else ""
+    
+    underline_html = '''
+        <div class="underline"></div>
+    '''
+    
+    html_code = f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body {{
+            font-family: 'Arial', sans-serif;
+            background: linear-gradient(to bottom, {bg_color} 0%, {bg_gradient_to} 100%);
+            min-height: 100vh;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            overflow: hidden;
+        }}
+        
+        .slide-container {{
+            width: 1920px;
+            height: 1080px;
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+            justify-content: center;
+            padding: 100px;
+            position: relative;
+        }}
+        
+        .content {{
+            max-width: 1400px;
+            text-align: center;
+        }}
+        
+        .title {{
+            font-size: 5rem;
+            font-weight: 700;
+            color: {title_color};
+            letter-spacing: 0.05em;
+            margin-bottom: 30px;
+        }}
+        
+        .underline {{
+            width: 100%;
+            height: 3px;
+            background-color: {underline_color};
+            margin-bottom: 50px;
+        }}
+        
+        .description {{
+            font-size: 2rem;
+            color: {text_color};
+            line-height: 1.8;
+            max-width: 1200px;
+            margin: 0 auto;
+        }}
+        
+        /* Responsive adjustments */
+        @media (max-width: 1920px) {{
+            .slide-container {{
+                width: 100vw;
+                height: 100vh;
+                transform: scale(calc(100vw / 1920));
+                transform-origin: top left;
+            }}
+        }}
+        
+        {custom_css}
+    </style>
+</head>
+<body>
+    <div class="slide-container">
+        <div class="content">
+            <h1 class="title">{title}</h1>
+            {underline_html}
+            <p class="description">{description}</p>
+        </div>
+    </div>
+</body>
+</html>'''
+    
+    return html_code
+
+def generate_section_header_slide_8(
+    main_title="Name of the section",
+    subtitle="You can enter a subtitle here if you need it",
+    bg_color="#FFB84D",
+    text_color="#2C2C2C",
+    subtitle_color="#4A4A4A",
+    custom_css="",
+):
+    """
+    Simplified section slide: left-aligned text and external SVG on the right.
+    This definition intentionally overrides the previous one in the file.
+    """
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Section Slide</title>
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        body {{
+            font-family: 'Arial', sans-serif;
+            overflow: hidden;
+            margin: 0;
+            padding: 0;
+            width: 1920px;
+            height: 1080px;
+            background: {bg_color};
+            position: relative;
+        }}
+        .content {{
+            position: absolute;
+            left: 6%;
+            top: 50%;
+            transform: translateY(-50%);
+            z-index: 20;
+            text-align: left;
+            width: 44%;
+            padding-right: 20px;
+        }}
+        .main-title {{ font-size: 5rem; font-weight: 900; color: {text_color}; margin: 0 0 12px 0; line-height: 1.05; }}
+        .subtitle {{ font-size: 2.5rem; color: {subtitle_color}; font-weight: 400; line-height: 1.6; max-width: 100%; margin: 0; }}
+        .svg-decoration {{
+            position: absolute;
+            right: 50px;
+            top: 100%;
+            transform: translateY(-50%);
+            width: 900px;
+            height: 1024px;
+            z-index: 10;
+        }}
+        {custom_css}
+    </style>
+</head>
+<body>
+    <div class="content">
+        <h1 class="main-title">{main_title}</h1>
+        <p class="subtitle">{subtitle}</p>
+    </div>
+    <!-- Embedded SVG decoration (placed on the right side) -->
+    <div class="svg-decoration">
+        <svg xmlns:xlink="http://www.w3.org/1999/xlink" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1100 1200" width="100%" height="100%" preserveAspectRatio="xMidYMid meet"> <defs> <linearGradient id="d"> <stop stop-color="#ff6134" offset="0"/> <stop stop-color="#f00" offset="1"/> </linearGradient> <linearGradient id="h"> <stop stop-color="#5f0000" stop-opacity="0" offset="0"/> <stop stop-color="#f00" stop-opacity="0" offset=".5"/> <stop stop-color="#590000" offset="1"/> </linearGradient> <linearGradient id="c"> <stop stop-color="#525252" offset="0"/> <stop stop-color="#d9d9d9" offset="1"/> </linearGradient> <linearGradient id="a"> <stop offset="0"/> <stop stop-opacity="0" offset="1"/> </linearGradient> <linearGradient id="b"> <stop stop-color="#fff" offset="0"/> <stop stop-color="#fff" stop-opacity="0" offset="1"/> </linearGradient> <linearGradient id="j"> <stop stop-color="#00575f" stop-opacity="0" offset="0"/> <stop stop-color="#0062ff" stop-opacity="0" offset=".5"/> <stop stop-color="#002859" offset="1"/> </linearGradient> <linearGradient id="k"> <stop stop-color="#34abff" offset="0"/> <stop stop-color="#0057ff" offset="1"/> </linearGradient> <linearGradient id="e"> <stop stop-color="#ffff34" offset="0"/> <stop stop-color="#ffc200" offset="1"/> </linearGradient> <linearGradient id="i"> <stop stop-color="#5a5f00" stop-opacity="0" offset="0"/> <stop stop-color="#ffde00" stop-opacity="0" offset=".5"/> <stop stop-color="#cf9800" offset="1"/> </linearGradient> <linearGradient id="ce" x1="336.15" x2="345.4" y1="1203.6" y2="608.36" gradientTransform="matrix(1.2302 -.27318 .17203 .77468 -201.81 -17.563)" gradientUnits="userSpaceOnUse" xlink:href="#a"/> <linearGradient id="cd" x1="-683.5" x2="1100.7" y1="-283.39" y2="504.58" gradientTransform="matrix(.83134 -.18461 .25456 1.1464 -201.81 -17.563)" gradientUnits="userSpaceOnUse" xlink:href="#j"/> <linearGradient id="cc" x1="350.37" x2="285.9" y1="168.43" y2="601.16" gradientTransform="matrix(1.1836 -.26282 .17881 .80521 -201.81 -17.563)" gradientUnits="userSpaceOnUse" xlink:href="#b"/> <linearGradient id="cj" x1="309.16" x2="302.31" y1="900.84" y2="958.59" gradientTransform="matrix(1.2191 0 0 .82029 0 -6)" gradientUnits="userSpaceOnUse" xlink:href="#k"/> <linearGradient id="ci" x1="299.34" x2="301.38" y1="959.69" y2="945.18" gradientTransform="matrix(1.2191 0 0 .82029 0 -6)" gradientUnits="userSpaceOnUse" xlink:href="#a"/> <linearGradient id="ch" x1="293.05" x2="311.93" y1="901.66" y2="937.79" gradientTransform="matrix(1.2191 0 0 .82029 0 -6)" gradientUnits="userSpaceOnUse" xlink:href="#a"/> <linearGradient id="cg" x1="293.24" x2="310.45" y1="923.83" y2="927.12" gradientTransform="matrix(1.2191 0 0 .82029 0 -6)" gradientUnits="userSpaceOnUse" xlink:href="#a"/> <linearGradient id="cf" x1="1063" x2="1075" y1="281.09" y2="396.2" gradientTransform="matrix(.36618 0 0 2.7309 0 -6)" gradientUnits="userSpaceOnUse" xlink:href="#c"/> <linearGradient id="cb" x1="423.76" x2="448.12" y1="614.4" y2="654.13" gradientTransform="matrix(.82209 0 0 1.2164 0 -6)" gradientUnits="userSpaceOnUse" spreadMethod="reflect" xlink:href="#c"/> <linearGradient id="ca" x1="608.27" x2="572.03" y1="588.05" y2="590.56" gradientTransform="matrix(.64452 0 0 1.5515 0 -6)" gradientUnits="userSpaceOnUse" spreadMethod="reflect" xlink:href="#c"/> <linearGradient id="bz" x1="469.01" x2="491.66" y1="838.2" y2="843.22" gradientTransform="matrix(.81392 0 0 1.2286 0 -6)" gradientUnits="userSpaceOnUse" spreadMethod="reflect" xlink:href="#c"/> <linearGradient id="by" x1="365.56" x2="374.19" y1="996.04" y2="1011.3" gradientUnits="userSpaceOnUse" xlink:href="#a"/> <linearGradient id="bx" x1="376.49" x2="387.39" y1="736.07" y2="743.21" gradientUnits="userSpaceOnUse" spreadMethod="reflect" xlink:href="#a"/> <linearGradient id="bw" x1="423.76" x2="448.12" y1="614.4" y2="654.13" gradientTransform="matrix(-.78264 .25163 .37232 1.158 576.36 -7.9357)" gradientUnits="userSpaceOnUse" spreadMethod="reflect" xlink:href="#c"/> <linearGradient id="bv" x1="370.79" x2="381.53" y1="747.38" y2="754.63" gradientTransform="matrix(1.0103 -.1009 .097869 .97999 -17.724 122.41)" gradientUnits="userSpaceOnUse" spreadMethod="reflect" xlink:href="#a"/> <linearGradient id="bu" x1="608.27" x2="572.03" y1="588.05" y2="590.56" gradientTransform="matrix(-.61798 .18305 .44065 1.4876 597.5 -4.4262)" gradientUnits="userSpaceOnUse" spreadMethod="reflect" xlink:href="#c"/> <linearGradient id="bt" x1="293.24" x2="310.45" y1="923.83" y2="927.12" gradientTransform="matrix(1.213 -.12114 .081515 .81623 1.6793 116.44)" gradientUnits="userSpaceOnUse" xlink:href="#a"/> <linearGradient id="bs" x1="293.05" x2="311.93" y1="901.66" y2="937.79" gradientTransform="matrix(1.213 -.12114 .081515 .81623 1.6793 116.44)" gradientUnits="userSpaceOnUse" xlink:href="#a"/> <linearGradient id="br" x1="299.34" x2="301.38" y1="959.69" y2="945.18" gradientTransform="matrix(1.213 -.12114 .081515 .81623 1.6793 116.44)" gradientUnits="userSpaceOnUse" xlink:href="#a"/> <linearGradient id="bq" x1="309.16" x2="302.31" y1="900.84" y2="958.59" gradientTransform="matrix(1.213 -.12114 .081515 .81623 1.6793 116.44)" gradientUnits="userSpaceOnUse" xlink:href="#d"/> <linearGradient id="bp" x1="336.15" x2="345.4" y1="1203.6" y2="608.36" gradientTransform="matrix(1.197 -.39408 .24816 .75375 -200.28 124.99)" gradientUnits="userSpaceOnUse" xlink:href="#a"/> <linearGradient id="bo" x1="-683.5" x2="1100.7" y1="-283.39" y2="504.58" gradientTransform="matrix(.80888 -.26631 .36722 1.1154 -200.28 124.99)" gradientUnits="userSpaceOnUse" xlink:href="#h"/> <linearGradient id="bn" x1="350.37" x2="285.9" y1="168.43" y2="601.16" gradientTransform="matrix(1.1516 -.37914 .25794 .78345 -200.28 124.99)" gradientUnits="userSpaceOnUse" xlink:href="#b"/> <linearGradient id="bm" x1="1063" x2="1075" y1="281.09" y2="396.2" gradientTransform="matrix(.36436 -.036388 .27138 2.7174 1.6793 116.44)" gradientUnits="userSpaceOnUse" xlink:href="#c"/> <linearGradient id="bl" x1="469.01" x2="491.66" y1="838.2" y2="843.22" gradientTransform="matrix(.80989 -.080882 .12209 1.2225 1.6793 116.44)" gradientUnits="userSpaceOnUse" spreadMethod="reflect" xlink:href="#c"/> <linearGradient id="bk" x1="432.33" x2="442.94" y1="816.66" y2="835.01" gradientTransform="matrix(.80989 -.080882 .12209 1.2225 1.6793 116.44)" gradientUnits="userSpaceOnUse" xlink:href="#a"/> <linearGradient id="bj" x1="391.06" x2="584.44" gradientUnits="userSpaceOnUse" xlink:href="#e"/> <linearGradient id="bi" x1="309.16" x2="302.31" y1="900.84" y2="958.59" gradientTransform="matrix(.86745 -.09367 .43221 .63112 -2.0673 133.58)" gradientUnits="userSpaceOnUse" xlink:href="#d"/> <linearGradient id="bh" x1="423.76" x2="448.12" y1="614.4" y2="654.13" gradientTransform="matrix(.75888 .31614 -.46778 1.1229 639.92 -47.664)" gradientUnits="userSpaceOnUse" spreadMethod="reflect" xlink:href="#c"/> <linearGradient id="bg" x1="370.79" x2="381.53" y1="747.38" y2="754.63" gradientTransform="matrix(.93728 .39046 -.37874 .90913 637.62 -42.126)" gradientUnits="userSpaceOnUse" spreadMethod="reflect" xlink:href="#a"/> <linearGradient id="bf" x1="432.33" x2="442.94" y1="816.66" y2="835.01" gradientTransform="matrix(.75133 .313 -.47247 1.1341 639.92 -47.664)" gradientUnits="userSpaceOnUse" xlink:href="#a"/> <linearGradient id="be" x1="469.01" x2="491.66" y1="838.2" y2="843.22" gradientTransform="matrix(.75133 .313 -.47247 1.1341 639.92 -47.664)" gradientUnits="userSpaceOnUse" spreadMethod="reflect" xlink:href="#c"/> <linearGradient id="bd" x1="608.27" x2="572.03" y1="588.05" y2="590.56" gradientTransform="matrix(.59496 .24785 -.59666 1.4322 639.92 -47.664)" gradientUnits="userSpaceOnUse" spreadMethod="reflect" xlink:href="#c"/> <linearGradient id="bc" x1="293.24" x2="310.45" y1="923.83" y2="927.12" gradientTransform="matrix(1.1253 .46881 -.31545 .75721 639.92 -47.664)" gradientUnits="userSpaceOnUse" xlink:href="#a"/> <linearGradient id="bb" x1="293.05" x2="311.93" y1="901.66" y2="937.79" gradientTransform="matrix(1.1253 .46881 -.31545 .75721 639.92 -47.664)" gradientUnits="userSpaceOnUse" xlink:href="#a"/> <linearGradient id="ba" x1="299.34" x2="301.38" y1="959.69" y2="945.18" gradientTransform="matrix(1.1253 .46881 -.31545 .75721 639.92 -47.664)" gradientUnits="userSpaceOnUse" xlink:href="#a"/> <linearGradient id="az" x1="309.16" x2="302.31" y1="900.84" y2="958.59" gradientTransform="matrix(1.1253 .46881 -.31545 .75721 639.92 -47.664)" gradientUnits="userSpaceOnUse" xlink:href="#e"/> <linearGradient id="ay" x1="336.15" x2="345.4" y1="1203.6" y2="608.36" gradientTransform="matrix(1.2406 .2209 -.13911 .78126 458.08 -135.94)" gradientUnits="userSpaceOnUse" xlink:href="#a"/> <linearGradient id="ax" x1="-683.5" x2="1100.7" y1="-283.39" y2="504.58" gradientTransform="matrix(.8384 .14928 -.20585 1.1561 458.08 -135.94)" gradientUnits="userSpaceOnUse" xlink:href="#i"/> <linearGradient id="aw" x1="681" x2="606.26" y1="1.5028" y2="160.02" gradientTransform="matrix(1.1936 .21253 -.14459 .81205 0 0)" gradientUnits="userSpaceOnUse" xlink:href="#b"/> <linearGradient id="av" x1="1063" x2="1075" y1="281.09" y2="396.2" gradientTransform="matrix(.33802 .14082 -1.0502 2.5209 639.92 -47.664)" gradientUnits="userSpaceOnUse" xlink:href="#c"/> <linearGradient id="au" x1="309.16" x2="302.31" y1="900.84" y2="958.59" gradientTransform="matrix(.55499 .017588 .092123 .42968 275.04 290.57)" gradientUnits="userSpaceOnUse" xlink:href="#e"/> <linearGradient id="at" x1="878.35" x2="921.76" y1="504.53" y2="572.13" gradientTransform="matrix(.49907 .54378 -.99819 .91612 586.87 -250.89)" gradientUnits="userSpaceOnUse" xlink:href="#b"/> <linearGradient id="as" x1="878.35" x2="921.76" y1="504.53" y2="572.13" gradientTransform="matrix(.73148 .098521 -.18085 1.3427 97.836 -77.665)" gradientUnits="userSpaceOnUse" xlink:href="#a"/> <radialGradient id="ao" cx="413.89" cy="440.37" r="359.53" gradientTransform="matrix(.96831 -.21503 .29652 1.3353 -211.6 -61.667)" gradientUnits="userSpaceOnUse"> <stop stop-color="#00f1ff" stop-opacity="0" offset="0"/> <stop stop-color="#00c9ff" stop-opacity="0" offset=".5"/> <stop stop-color="#0065a6" stop-opacity="0" offset=".75"/> <stop stop-color="#002454" offset="1"/> </radialGradient> <radialGradient id="ae" cx="413.89" cy="440.37" r="359.53" gradientTransform="matrix(.94215 -.31018 .42774 1.2992 -214.4 82.076)" gradientUnits="userSpaceOnUse"> <stop stop-color="#f00" stop-opacity="0" offset="0"/> <stop stop-color="#f00" stop-opacity="0" offset=".5"/> <stop stop-color="#a60000" stop-opacity="0" offset=".75"/> <stop stop-color="#540000" offset="1"/> </radialGradient> <radialGradient id="r" cx="413.89" cy="440.37" r="359.53" gradientTransform="matrix(.97653 .17388 -.23978 1.3466 466 -180.42)" gradientUnits="userSpaceOnUse"> <stop stop-color="#ffdf00" stop-opacity="0" offset="0"/> <stop stop-color="#ff9f00" stop-opacity="0" offset=".5"/> <stop stop-color="#ff9a00" stop-opacity="0" offset=".75"/> <stop stop-color="#793900" offset="1"/> </radialGradient> <radialGradient id="g" cx="457.14" cy="263.79" r="94.286" gradientUnits="userSpaceOnUse" xlink:href="#b"/> <radialGradient id="f" cx="480.13" cy="516.87" r="175.44" gradientTransform="scale(.83995 1.1905)" gradientUnits="userSpaceOnUse" xlink:href="#b"/> <radialGradient id="am" cx="478.66" cy="290.04" r="372.49" gradientTransform="matrix(.96831 -.21503 .29652 1.3353 -211.6 -61.667)" gradientUnits="userSpaceOnUse" xlink:href="#j"/> <radialGradient id="al" cx="462.46" cy="233.67" r="330.33" gradientTransform="matrix(.96831 -.21503 .29652 1.3353 -211.6 -61.667)" gradientUnits="userSpaceOnUse" xlink:href="#k"/> <radialGradient id="ar" cx="214.76" cy="1378.8" r="15.406" gradientTransform="matrix(1.4686 0 0 .42526 72.665 179.83)" gradientUnits="userSpaceOnUse" xlink:href="#b"/> <radialGradient id="aq" cx="378.57" cy="752.36" r="8.5714" gradientUnits="userSpaceOnUse" xlink:href="#b"/> <radialGradient id="ap" cx="269.79" cy="1031.8" r="32.826" gradientTransform="scale(1.3926 .71807)" gradientUnits="userSpaceOnUse" xlink:href="#a"/> <radialGradient id="an" cx="376.4" cy="753.87" r="27.902" gradientUnits="userSpaceOnUse" xlink:href="#c"/> <radialGradient id="ak" cx="247.71" cy="1161.1" r="14.647" fy="1161.4" gradientTransform="scale(1.5804 .63275)" gradientUnits="userSpaceOnUse" xlink:href="#a"/> <radialGradient id="aj" cx="247.71" cy="1161.1" r="14.647" fy="1161.4" gradientTransform="matrix(1.5726 -.15705 .062879 .62962 -17.724 122.41)" gradientUnits="userSpaceOnUse" xlink:href="#a"/> <radialGradient id="ai" cx="370.71" cy="771.55" r="27.48" gradientTransform="matrix(1.0103 -.1009 .097869 .97999 -18.321 116.44)" gradientUnits="userSpaceOnUse" xlink:href="#c"/> <radialGradient id="ah" cx="378.57" cy="752.36" r="8.5714" gradientTransform="matrix(.44933 -.21734 .43543 .90022 -57.849 230.67)" gradientUnits="userSpaceOnUse" xlink:href="#b"/> <radialGradient id="ag" cx="214.76" cy="1378.8" r="15.406" gradientTransform="matrix(1.4614 -.14594 .04226 .42316 92.451 294.13)" gradientUnits="userSpaceOnUse" xlink:href="#b"/> <radialGradient id="af" cx="269.79" cy="1031.8" r="32.826" gradientTransform="matrix(1.3039 -.33682 .14896 .45905 -58.59 432.36)" gradientUnits="userSpaceOnUse" xlink:href="#a"/> <radialGradient id="ad" cx="480.13" cy="516.87" r="175.44" gradientTransform="matrix(.38873 -.31541 .42025 .51793 -35.161 543.49)" gradientUnits="userSpaceOnUse" xlink:href="#b"/> <radialGradient id="ac" cx="480.13" cy="516.87" r="175.44" gradientTransform="matrix(.65225 -.52924 .75014 .92449 -378.41 379.69)" gradientUnits="userSpaceOnUse" xlink:href="#b"/> <radialGradient id="ab" cx="457.14" cy="263.79" r="94.286" gradientTransform="matrix(1.1513 -.37905 .37905 1.1513 -309.88 102.16)" gradientUnits="userSpaceOnUse" xlink:href="#b"/> <radialGradient id="aa" cx="457.14" cy="263.79" r="94.286" gradientTransform="matrix(.40297 -.13267 .13267 .40297 97.222 186.94)" gradientUnits="userSpaceOnUse" xlink:href="#b"/> <radialGradient id="z" cx="478.66" cy="290.04" r="372.49" gradientTransform="matrix(.94215 -.31018 .42774 1.2992 -214.4 82.076)" gradientUnits="userSpaceOnUse" xlink:href="#h"/> <radialGradient id="y" cx="462.46" cy="233.67" r="330.33" gradientTransform="matrix(.94215 -.31018 .42774 1.2992 -214.4 82.076)" gradientUnits="userSpaceOnUse" xlink:href="#d"/> <radialGradient id="x" cx="893.91" cy="318.43" r="179.96" gradientTransform="scale(.72831 1.373)" gradientUnits="userSpaceOnUse" xlink:href="#d"/> <radialGradient id="w" cx="247.71" cy="1161.1" r="14.647" fy="1161.4" gradientTransform="matrix(1.4589 .60775 -.24333 .5841 637.62 -42.126)" gradientUnits="userSpaceOnUse" xlink:href="#a"/> <radialGradient id="v" cx="370.71" cy="771.55" r="27.48" gradientTransform="matrix(.93728 .39046 -.37874 .90913 639.92 -47.664)" gradientUnits="userSpaceOnUse" xlink:href="#c"/> <radialGradient id="u" cx="378.57" cy="752.36" r="8.5714" gradientTransform="matrix(.49865 .021831 -.043739 .99904 550.94 34.141)" gradientUnits="userSpaceOnUse" xlink:href="#b"/> <radialGradient id="t" cx="214.76" cy="1378.8" r="15.406" gradientTransform="matrix(1.3557 .56477 -.16354 .39256 635.54 151.82)" gradientUnits="userSpaceOnUse" xlink:href="#b"/> <radialGradient id="s" cx="269.79" cy="1031.8" r="32.826" gradientTransform="matrix(1.3076 .32203 -.086631 .47478 437 201.86)" gradientUnits="userSpaceOnUse" xlink:href="#a"/> <radialGradient id="q" cx="480.13" cy="516.87" r="175.44" gradientTransform="matrix(.49183 -.093258 .12426 .65531 404.91 310.8)" gradientUnits="userSpaceOnUse" xlink:href="#b"/> <radialGradient id="p" cx="480.13" cy="516.87" r="175.44" gradientTransform="matrix(.82525 -.15648 .22179 1.1697 180.44 3.7704)" gradientUnits="userSpaceOnUse" xlink:href="#b"/> <radialGradient id="o" cx="457.14" cy="263.79" r="94.286" gradientTransform="matrix(1.1934 .21248 -.21248 1.1934 372.42 -208.03)" gradientUnits="userSpaceOnUse" xlink:href="#b"/> <radialGradient id="n" cx="457.14" cy="263.79" r="94.286" gradientTransform="matrix(.41767 .074369 -.074369 .41767 690.59 59.723)" gradientUnits="userSpaceOnUse" xlink:href="#b"/> <radialGradient id="m" cx="478.66" cy="290.04" r="372.49" gradientTransform="matrix(.97653 .17388 -.23978 1.3466 466 -180.42)" gradientUnits="userSpaceOnUse" xlink:href="#i"/> <radialGradient id="l" cx="462.46" cy="233.67" r="330.33" gradientTransform="matrix(.97653 .17388 -.23978 1.3466 466 -180.42)" gradientUnits="userSpaceOnUse" xlink:href="#e"/> </defs> <g transform="translate(164.09 17.006)"> <path d="m369.76 746.35 40.333 399.16h7.1117l-37.384-400.17-10.061 1.0102z" fill="url(#cf)" fill-rule="evenodd"/> <path d="m558.54 282.83c39.66 178.6-67.947 439.47-174.54 466.06-103.81 25.979-315.74-169.78-355.4-348.38s46.86-349.91 193.13-382.39 297.16 86.108 336.82 264.71z" fill="url(#al)" fill-rule="evenodd" opacity=".75"/> <path d="m558.54 282.83c39.66 178.6-67.947 439.47-174.54 466.06-103.81 25.979-315.74-169.78-355.4-348.38s46.86-349.91 193.13-382.39 297.16 86.108 336.82 264.71z" fill="url(#am)" fill-rule="evenodd"/> <path d="m171.19 67.388c-12.157 0.12378-36.516 19.763-45.87 30.673-19.234 22.433-30.838 37.65-41.846 61.974-16.9 37.343 4.575 39.084 32.847 16.12 21.599-17.544-12.858 35.603-15.812 47.412-4.9339 19.723-24.964 31.75-34.405 42.761-9.848 11.486-7.2461 33.213-27.588 47.101-22.198 15.155 18.255 23.315 29.746 28.515 18.361 8.3097-10.76 46.533 27.888 20.148 22.79-15.559 16.769-31.547 31.92-1.2348 4.9966 9.997 47.588-37.134 49.59-40.28 2.3396-3.6754-3.8543-56.896-4.6394-60.431-0.01593-0.07178 13.061-19.124 28.823-15.181 24.45 6.1164 16.739 28.761 38.737 3.1049 11.176-13.035 25.825 50.398 26.334 52.687 7.2909 32.832 48.788-4.8665 62.289 3.7282 14.421 9.1801 9.0842 39.312 25.714 49.898 13.119 8.3514 43.278-30.363 47.42-36.871 13.556-21.296 0.68902-23.511 38.118 0.31566 26.363 16.782 22.406-31.973 58.262-1.2308 21.82 18.709 6.7702-20.076 7.1328-33.778 0.61195-23.122-11.942-57.191-20.132-77.478-4.6345-11.481 44.373 16.124 36.567 6.5134-14.238-17.529-32.694-32.145-45.858-48.351-17.055-20.997-24.405-34.878-36.559-59.197-10.501-21.011-5.9465-25.34-22.617-35.952-17.603-11.206-33.648 17.928-44.935-4.6553-7.8512-15.708-37.869 9.4224-52.683-0.00796-4.1717-2.6556-16.656-32.666-19.828-36.571-6.9822-8.5961-42.542 3.5936-54.234 6.1898l-11.157 2.4775c-12.796 2.8416-28.611 3.4267-42.457 6.5015-1.0072 0.22366-12.546 19.486-20.767 25.099z" fill="url(#cc)" fill-rule="evenodd" opacity=".6"/> <path transform="matrix(.41416 -.091969 .091969 .41416 88.064 73.647)" d="m551.43 263.79c0 52.073-42.213 94.286-94.286 94.286s-94.286-42.213-94.286-94.286 42.213-94.286 94.286-94.286 94.286 42.213 94.286 94.286z" fill="url(#g)" fill-rule="evenodd"/> <path transform="matrix(1.1833 -.26277 .26277 1.1833 -308.6 -51.166)" d="m551.43 263.79c0 52.073-42.213 94.286-94.286 94.286s-94.286-42.213-94.286-94.286 42.213-94.286 94.286-94.286 94.286 42.213 94.286 94.286z" fill="url(#g)" fill-rule="evenodd" opacity=".6"/> <path d="m221.72 18.129c-146.27 32.48-232.8 203.77-193.14 382.37s251.61 374.37 355.42 348.39c106.6-26.598 214.21-287.48 174.55-466.08s-190.56-297.16-336.83-264.68zm-5.2444 5.3581c5.1999-1.6039 11.041-2.4297 17.65-2.2548 19.368 0.51262 32.663 26.514 38.091 26.658 20.479 0.54202 30.72-19.317 45.575-18.924 18.58 0.49176 21.189 8.7208 32.842 16.139 10.823 6.8899 24.287 20.228 38.738 29.427 11.837 7.5353 32.715 24.002 47.104 27.601 13.508 3.3792 31.701 11.002 34.698 24.498 6.3324 28.516-14.448 21.375-14.899 38.425-0.62 23.425 41.676 16.277 48.04 44.936 6.5796 29.629-30.816 41.326-22.019 45.864 0.17767 0.09165 72.199 61.527 30.995 60.437-23.067-0.61051-67.778-34.504-74.698-6.8446-2.5144 10.051-25.863 61.413-44.016 39.065-38.873-47.858-17.132 7.8411-68.795 6.4738-17.014-0.45032-14.751-19.047-14.254-37.809 2.0721-78.291-54.609-11.471-55.159-37.497-1.6588-78.521 6.5776-10.145-17.647-39.969-14.593-17.967-25.614-36.775-52.063-23.555-40.782 20.383-6.405 29.476-4.9505 56.703 1.3524 25.317-31.749 21.715-17.676 39.041 4.7249 5.8171 30.882 53.188 22.316 47.735l-10.252-6.5264c-36.746-23.391-37.037 43.629-65.062-3.0943-21.787-36.324-21.001 20.857-50.222 37.498-11.176 33.51-15.372 9.7713-19.197-7.4531-3.4558-15.562-0.49431-28.606-4.3283-45.871-6.2542-28.164 15.771-21.03 28.811-41.514 7.5872-11.919 36.258-30.446 9.3167-37.185-14.15-3.5397-37.511 6.5336-19.844-10.222 11.358-10.773 59.758-50.389 37.207-69.724-12.698-10.888-49.658-41.663-8.3746-50.831 36.849-8.1828 45.989-9.051 46.799-39.651 0.65948-24.917 38.08-10.894 51.461-31.915 8.2807-13.008 18.212-24.848 33.812-29.66z" fill="url(#cd)" fill-rule="evenodd" opacity=".4"/> <path transform="matrix(.8353 -.54979 .54979 .8353 -404.37 218.18)" d="m568.57 602.36c0 128.6-73.553 232.86-164.29 232.86s-164.29-104.25-164.29-232.86 73.553-232.86 164.29-232.86 164.29 104.25 164.29 232.86z" fill="url(#f)" fill-rule="evenodd" opacity=".53"/> <path transform="matrix(.49782 -.32766 .30801 .46797 -79.096 415.27)" d="m568.57 602.36c0 128.6-73.553 232.86-164.29 232.86s-164.29-104.25-164.29-232.86 73.553-232.86 164.29-232.86 164.29 104.25 164.29 232.86z" fill="url(#f)" fill-rule="evenodd" opacity=".3"/> <path d="m223.16 647.36c-18.335-24.262-60.967-66.679-84.57-101.25-13.367-19.579-23.259-50.613 1.3224-49.962 37.268 0.98637 32.963 59.583 31.556-7.0075-0.0903-4.2743 28.978 44.927 54.783 4.3909 20.491-32.189 27.586 49.668 31.545 67.498 1.5402 6.9357 35.923 12.726 49.962 1.3223 35.296-28.67 6.9329 34.373 6.5667 48.21-0.89095 33.662 73.164-41.607 76.703-46.006 32.961-40.966 50.845-10.706 72.759-45.13 23.006-36.141 48.395-65.382 66.192-93.341 14.1-22.149-23.01-31.227 10.087-47.769 25.06-12.525 21.8 45.562 16.208 54.347-13.638 21.424-38.608 14.175-39.451 46.012-0.52715 19.917-0.87959 33.317 4.374 56.975 4.6926 21.132-20.482 53.457-30.251 68.803-13.828 21.722-3.488 30.228-31.562 44.26-19.256 9.6243-21.792 50.293-39.451 46.012-13.722 11.146-36.205 27.079-46.023 35.054-18.363 14.915-39.258-16.116-68.368-9.6522-21.973 4.8795-45.83-9.4892-58.286-20.169-11.998-10.287-20.75-37.527-24.097-52.596z" fill="url(#ce)" fill-rule="evenodd" opacity=".1"/> <path d="m558.54 282.83c39.66 178.6-67.947 439.47-174.54 466.06-103.81 25.979-315.74-169.78-355.4-348.38s46.86-349.91 193.13-382.39 297.16 86.108 336.82 264.71z" fill="url(#ao)" fill-rule="evenodd"/> <path transform="matrix(.95567 -.14762 .1429 .65673 -91.365 302.37)" d="m421.43 740.93c0.00747 13.021-20.462 23.578-45.714 23.578s-45.722-10.558-45.714-23.578c-0.00747-13.021 20.462-23.578 45.714-23.578s45.722 10.558 45.714 23.578z" fill="url(#ap)" fill-rule="evenodd" opacity=".3"/> <path d="m372.75 735.24c-5.9355 3.6492-15.409 17.309-18.183 24.244-1.5433 3.8583-9.0917 5.0509-13.132 7.0711-7.9485 3.9742-3.7394 11.112 4.0406 11.112 10.363 0 20.275 0.0143 30.305 2.0203 7.5648 1.513 15.433 1.0102 23.234 1.0102 7.9438 0 8.9786-5.2763 7.0711-9.0914-1.7358-3.4716-10.956-7.7692-13.132-12.122-2.0656-4.1313-1.8953-18.342-7.0711-22.223-0.38095-0.28571-6.7176-5.9639-13.132-2.0203z" fill="url(#cj)" fill-rule="evenodd"/> <path d="m372.75 735.24c-5.9355 3.6492-15.409 17.309-18.183 24.244-1.5433 3.8583-9.0917 5.0509-13.132 7.0711-7.9485 3.9742-3.7394 11.112 4.0406 11.112 10.363 0 20.275 0.0143 30.305 2.0203 7.5648 1.513 15.433 1.0102 23.234 1.0102 7.9438 0 8.9786-5.2763 7.0711-9.0914-1.7358-3.4716-10.956-7.7692-13.132-12.122-2.0656-4.1313-1.8953-18.342-7.0711-22.223-0.38095-0.28571-6.7176-5.9639-13.132-2.0203z" fill="url(#ci)" fill-rule="evenodd"/> <path d="m372.75 735.24c-5.9355 3.6492-15.409 17.309-18.183 24.244-1.5433 3.8583-9.0917 5.0509-13.132 7.0711-7.9485 3.9742-3.7394 11.112 4.0406 11.112 10.363 0 20.275 0.0143 30.305 2.0203 7.5648 1.513 15.433 1.0102 23.234 1.0102 7.9438 0 8.9786-5.2763 7.0711-9.0914-1.7358-3.4716-10.956-7.7692-13.132-12.122-2.0656-4.1313-1.8953-18.342-7.0711-22.223-0.38095-0.28571-6.7176-5.9639-13.132-2.0203z" fill="url(#ch)" fill-rule="evenodd" opacity=".46759"/> <path d="m372.75 735.24c-5.9355 3.6492-15.409 17.309-18.183 24.244-1.5433 3.8583-9.0917 5.0509-13.132 7.0711-7.9485 3.9742-3.7394 11.112 4.0406 11.112 10.363 0 20.275 0.0143 30.305 2.0203 7.5648 1.513 15.433 1.0102 23.234 1.0102 7.9438 0 8.9786-5.2763 7.0711-9.0914-1.7358-3.4716-10.956-7.7692-13.132-12.122-2.0656-4.1313-1.8953-18.342-7.0711-22.223-0.38095-0.28571-6.7176-5.9639-13.132-2.0203z" fill="url(#cg)" fill-rule="evenodd" opacity=".50926"/> <path d="m358.6 766.36c3.3826 0.43801 11.266-0.30613 16.576-1.5379 4.4948-1.0425 7.2171-1.3132 9.9457-3.8446 3.9482-3.6629 3.8424-0.52886 9.1169 1.895 2.9303 3.1286 7.1762 2.0828 10.147 8.1011 2.9303 2.7186-11.804 0-15.948 0-4.452 0-8.2997-0.76893-12.432-0.76893-2.8509 0-8.6656-1.0487-10.775-1.5378-3.2818-0.76117-1.5859-1.3708-6.6305-2.3068z" fill="url(#ar)" fill-rule="evenodd" opacity=".67593"/> <path transform="matrix(.4687 -.17161 .34381 .93904 -50.684 103.73)" d="m387.14 752.36c0 4.7339-3.8376 8.5714-8.5714 8.5714s-8.5714-3.8376-8.5714-8.5714 3.8376-8.5714 8.5714-8.5714 8.5714 3.8376 8.5714 8.5714z" fill="url(#aq)" fill-rule="evenodd" opacity=".46759"/> <path d="m384.1 745.83c-0.3158 0.0821-0.62775-0.17836-0.94162-0.26754 7.0312 1.4632 0.11247-0.14806 1.1833-1.5578-0.28866-0.20965-0.10011 0.09788-0.23015 0.22502l4.0129-9.4232c1.896 1.2204 3.96 1.8661 5.0791 4.0618 4.6622 11.939-2.839 20.797-15.457 15.351-8.5854-7.9009-5.3668-17.927 6.3536-18.753v10.365z" fill="url(#an)"/> <path d="m389.06 848.98c19.503 32.603-39.407 32.936-38.039 67.422 1.3817 34.843 31.458 19.787 50.022 50.331l1.3578 12.088c-27.175-37.964-52.084-27.652-53.159-61.72s44.852-45.57 40.61-61.82l-0.79116-6.3017z" fill="url(#ca)"/> <path d="m395.35 1000.7c-9.2864 13.302-34.107 17.943-33.956 2.474 0.35989-36.898 41.699-9.7649 42.919 20.404 0.59378 14.678-36.308 13.991-42.145 26.91l-1.0611-8.487c4.8986-11.006 39.145-9.5745 37.448-17.73-5.8074-27.907-21.85-36.132-32.52-27.469 1.285 15.131 21.256 9.9175 28.94-3.5845l0.37509 7.482z" fill="url(#bz)"/> <path d="m409.79 998.3c-9.2864 9.0131-48.541 18.335-48.39 7.8531l4.641-4.3172c1.285 10.252 35.69 0.5431 43.374-8.6056l0.37509 5.0697z" fill="url(#by)"/> <path d="m384.1 745.83c-0.3158 0.0821-0.62775-0.17836-0.94162-0.26754 7.0312 1.4632 0.11247-0.14806 1.1833-1.5578-0.28866-0.20965-0.10011 0.09788-0.23015 0.22502l4.0129-9.4232c1.896 1.2204 3.96 1.8661 5.0791 4.0618 4.6622 11.939-2.839 20.797-15.457 15.351-8.5854-7.9009-5.3668-17.927 6.3536-18.753v10.365z" fill="url(#bx)"/> <path d="m392.33 736.55c-9.7508 22.191-12.99 1.4424-21.293 2.7533-12.743-0.02489-32.129 6.3088-38.989 16.555-9.4043 14.048-13.051 28.868-5.669 47.75 7.4303 19.005 29.43 25.712 53.501 39.274l0.31106 4.0082c-18.274-14.306-48.774-14.918-58.939-36.509-10.303-21.883-9.6147-39.627 10.162-58.705 10.473-9.7433 22.831-17.617 37.494-17.937l23.422 2.8103z" fill="url(#cb)"/> <path d="m392.33 736.55c-9.7508 22.191-12.99 1.4424-21.293 2.7533-12.743-0.02489-16.792-5.2439-2.1289-5.5636l23.422 2.8103z" fill="url(#ak)" opacity=".63889"/> </g> <path d="m695.62 790.56-117.58 373.78 10.257 2.2731 113.3-374.65-5.9833-1.3983z" fill="url(#av)" fill-rule="evenodd"/> <path d="m1044.4 433.74c-32.07 180.12-231.72 379.54-340.35 363.1-105.82-15.939-226.17-278.15-194.1-458.26s177.82-304.98 325.32-278.72 241.2 193.76 209.13 373.88z" fill="url(#l)" fill-rule="evenodd" opacity=".75"/> <path d="m1044.4 433.74c-32.071 180.12-231.72 379.54-340.35 363.1-105.82-15.939-226.17-278.15-194.1-458.26s177.82-304.98 325.32-278.72 241.2 193.76 209.13 373.88z" fill="url(#m)" fill-rule="evenodd"/> <path d="m769.73 85.914c-11.27-4.5609-41.308 4.2011-54.138 10.675-26.381 13.311-42.945 22.896-62.46 41.116-29.961 27.973-10.807 37.838 24.122 27.512 26.685-7.8888-25.56 27.921-32.829 37.686-12.139 16.309-35.254 19.708-48.204 26.242-13.508 6.8155-19.461 27.872-43.58 32.87-26.319 5.4529 7.8851 28.542 16.493 37.762 13.754 14.732-27.827 38.817 17.996 29.323 27.02-5.5982 27.612-22.672 29.94 11.135 0.76797 11.15 58.208-15.978 61.267-18.112 3.5731-2.493 18.322-54.003 18.957-57.568 0.0129-0.07239 19.41-12.631 32.444-2.9293 20.217 15.048 4.3917 32.987 34.564 17.763 15.33-7.7349 4.4585 56.453 4.0474 58.762-5.8957 33.111 46.908 14.269 56.066 27.395 9.7818 14.02-6.7319 39.782 4.5483 55.949 8.8988 12.754 51.626-11.386 57.953-15.8 20.703-14.445 9.6772-21.438 35.065 14.95 17.882 25.629 32.979-20.898 54.255 21.269 12.948 25.661 13.97-15.929 19.574-28.438 9.4565-21.108 10.969-57.385 11.211-79.262 0.137-12.38 34.76 31.948 31.251 20.075-6.4022-21.656-17.819-42.246-23.738-62.268-7.6688-25.941-9.1154-41.581-10.984-68.704-1.6141-23.433 4.2552-25.678-7.0526-41.885-11.94-17.113-37.954 3.6099-39.689-21.577-1.2067-17.52-38.58-5.8649-48.629-20.267-2.8297-4.0556-2.8132-36.559-4.2397-41.384-3.1396-10.62-40.653-13.043-52.443-15.142l-11.252-2.0034c-12.905-2.2978-27.729-7.8393-41.693-10.326-1.0157-0.18086-19.074 13.163-28.822 15.183z" fill="url(#aw)" fill-rule="evenodd" opacity=".6"/> <path d="m901.29 210.91c-3.8726 21.749-24.643 36.241-46.393 32.369s-36.241-24.643-32.369-46.393 24.643-36.241 46.393-32.369 36.241 24.643 32.369 46.393z" fill="url(#n)" fill-rule="evenodd"/> <path d="m974.42 223.93c-11.065 62.141-70.409 103.55-132.55 92.482s-103.55-70.409-92.482-132.55 70.409-103.55 132.55-92.482 103.55 70.409 92.482 132.55z" fill="url(#o)" fill-rule="evenodd" opacity=".6"/> <path d="m835.32 59.873c-147.51-26.265-293.26 98.576-325.33 278.69s88.292 442.34 194.11 458.28c108.63 16.44 308.29-183 340.36-363.11s-61.631-347.59-209.14-373.86zm-6.9016 2.9293c5.4168 0.51906 11.126 2.0029 17.16 4.7059 17.682 7.9213 19.956 37.036 24.91 39.256 18.696 8.3757 35.787-6.0177 49.348 0.05774 16.962 7.599 16.206 16.198 24.11 27.528 7.3415 10.522 14.64 28.012 24.443 42.061 8.0292 11.508 20.969 34.737 32.867 43.593 11.17 8.3139 25.033 22.347 22.609 35.958-5.1206 28.759-21.557 14.175-28.53 29.74-9.5807 21.386 32.212 31.052 27.065 59.954-5.3206 29.881-44.339 26.297-37.963 33.87 0.12877 0.15292 42.986 84.56 5.3702 67.709-21.058-9.434-49.298-57.915-66.321-35.044-6.1864 8.3115-47.491 46.745-55.653 19.134-17.479-59.127-18.83 0.64981-65.994-20.48-15.533-6.9586-6.2918-23.255 1.3818-40.383 32.02-71.473-45.999-31.589-36.498-55.825 28.664-73.121 9.9731-6.8354-0.91946-43.681-6.562-22.197-9.5024-43.797-39.001-41.765-45.485 3.1329-17.248 24.746-26.375 50.439-8.4872 23.89-37.658 7.8361-31.33 29.242 2.1246 7.1868 8.0537 60.974 2.2435 52.646l-6.9542-9.9671c-24.925-35.723-50.967 26.031-58.869-27.876-6.1429-41.909-27.407 11.177-60.78 15.301-23.203 26.636-17.948 3.1084-14.855-14.262 2.7945-15.694 10.544-26.596 13.645-44.008 5.0574-28.403 22.646-13.348 42.56-27.242 11.587-8.0845 45.177-14.161 22.9-30.743-11.7-8.7089-37.139-8.394-14.387-17.068 14.628-5.5763 74.54-23.533 61.159-50.054-7.535-14.934-29.817-57.556 11.817-50.142 37.162 6.6169 45.933 9.3303 58.448-18.605 10.191-22.747 39.341 4.5877 59.777-9.6709 12.646-8.8235 26.367-15.934 42.618-14.377z" fill="url(#ax)" fill-rule="evenodd" opacity=".4"/> <path d="m851.27 489.67c23.958 126.35-28.885 242.48-118.03 259.39s-180.83-71.823-204.79-198.18 28.885-242.48 118.03-259.39 180.83 71.823 204.79 198.18z" fill="url(#p)" fill-rule="evenodd" opacity=".53"/> <path d="m800.7 579.23c13.422 70.787-18.765 136.34-71.893 146.41s-107.08-39.144-120.5-109.93 18.765-136.34 71.893-146.41 107.08 39.144 120.5 109.93z" fill="url(#q)" fill-rule="evenodd" opacity=".3"/> <path d="m594.67 641.27c-7.5955-29.447-30.637-84.997-39.13-125.99-4.8096-23.214-2.0073-55.665 20.434-45.612 34.022 15.242 7.515 67.678 31.824 5.6665 1.5604-3.9803 9.473 52.616 48.881 25.12 31.294-21.834 6.3642 56.456 3.1625 74.438-1.2454 6.9946 28.267 25.561 45.612 20.434 43.607-12.891-6.8184 34.395-12.478 47.028-13.768 30.731 83.538-10.272 88.497-12.972 46.18-25.14 51.052 9.6701 84.519-13.68 35.135-24.514 69.816-41.744 96.997-60.708 21.533-15.024-9.2324-37.674 27.682-40.217 27.949-1.9251 2.603 50.441-5.9384 56.401-20.828 14.532-41.09-1.762-54.111 27.303-8.1459 18.183-13.624 30.417-17.872 54.276-3.7946 21.311-39.464 41.47-54.383 51.879-21.118 14.734-14.844 26.563-46.155 28.719-21.476 1.4792-39.457 38.045-54.111 27.303-16.953 5.0117-43.834 11.074-55.964 14.66-22.687 6.7067-30.042-29.974-59.399-35.201-22.16-3.9457-38.657-26.384-46.048-41.032-7.1194-14.11-4.7236-42.621-2.0177-57.818z" fill="url(#ay)" fill-rule="evenodd" opacity=".1"/> <path d="m1044.4 433.74c-32.071 180.12-231.72 379.54-340.35 363.1-105.82-15.939-226.17-278.15-194.1-458.26s177.82-304.98 325.32-278.72 241.2 193.76 209.13 373.88z" fill="url(#r)" fill-rule="evenodd"/> <path d="m743.31 789.2c-1.5639 8.6109-22.057 10.858-45.768 5.0187s-41.657-17.553-40.079-26.161c1.5639-8.6109 22.057-10.858 45.768-5.0187s41.657 17.553 40.079 26.161z" fill="url(#s)" fill-rule="evenodd" opacity=".3"/> <path d="m698.96 779.91c-6.8824 1.086-20.88 10.052-26.108 15.387-2.9084 2.9681-10.335 1.1662-14.841 1.4773-8.8656 0.61199-7.7249 8.8192-0.54317 11.811 9.5657 3.985 18.71 7.8099 27.197 13.519 6.4012 4.3057 13.858 6.8672 21.058 9.867 7.3329 3.0548 10.317-1.4178 10.023-5.673-0.26729-3.8722-7.1255-11.385-7.4606-16.24-0.31809-4.6079 5.3038-17.66 2.0188-23.234-0.24178-0.41024-3.9076-8.0885-11.345-6.9149z" fill="url(#az)" fill-rule="evenodd"/> <path d="m698.96 779.91c-6.8824 1.086-20.88 10.052-26.108 15.387-2.9084 2.9681-10.335 1.1662-14.841 1.4773-8.8656 0.61199-7.7249 8.8192-0.54317 11.811 9.5657 3.985 18.71 7.8099 27.197 13.519 6.4012 4.3057 13.858 6.8672 21.058 9.867 7.3329 3.0548 10.317-1.4178 10.023-5.673-0.26729-3.8722-7.1255-11.385-7.4606-16.24-0.31809-4.6079 5.3038-17.66 2.0188-23.234-0.24178-0.41024-3.9076-8.0885-11.345-6.9149z" fill="url(#ba)" fill-rule="evenodd"/> <path d="m698.96 779.91c-6.8824 1.086-20.88 10.052-26.108 15.387-2.9084 2.9681-10.335 1.1662-14.841 1.4773-8.8656 0.61199-7.7249 8.8192-0.54317 11.811 9.5657 3.985 18.71 7.8099 27.197 13.519 6.4012 4.3057 13.858 6.8672 21.058 9.867 7.3329 3.0548 10.317-1.4178 10.023-5.673-0.26729-3.8722-7.1255-11.385-7.4606-16.24-0.31809-4.6079 5.3038-17.66 2.0188-23.234-0.24178-0.41024-3.9076-8.0885-11.345-6.9149z" fill="url(#bb)" fill-rule="evenodd" opacity=".46759"/> <path d="m698.96 779.91c-6.8824 1.086-20.88 10.052-26.108 15.387-2.9084 2.9681-10.335 1.1662-14.841 1.4773-8.8656 0.61199-7.7249 8.8192-0.54317 11.811 9.5657 3.985 18.71 7.8099 27.197 13.519 6.4012 4.3057 13.858 6.8672 21.058 9.867 7.3329 3.0548 10.317-1.4178 10.023-5.673-0.26729-3.8722-7.1255-11.385-7.4606-16.24-0.31809-4.6079 5.3038-17.66 2.0188-23.234-0.24178-0.41024-3.9076-8.0885-11.345-6.9149z" fill="url(#bc)" fill-rule="evenodd" opacity=".50926"/> <path d="m673.94 803.2c2.954 1.7051 10.517 4.0497 15.893 4.9549 4.55 0.76615 7.1671 1.5632 10.659 0.2757 5.0532-1.863 3.7503 0.98943 7.6871 5.2552 1.5018 4.0149 5.8234 4.6822 6.2512 11.38 1.6595 3.6364-10.897-4.5395-14.722-6.1331-4.1097-1.712-7.3658-3.9015-11.18-5.4907-2.6317-1.0963-7.596-4.3005-9.3546-5.563-2.7367-1.9647-0.93683-1.8752-5.2335-4.6792z" fill="url(#t)" fill-rule="evenodd" opacity=".67593"/> <path d="m711.08 794.23c-0.20706 4.7294-2.2885 8.4794-4.6491 8.3761s-4.1063-4.021-3.8993-8.7504 2.2885-8.4794 4.6491-8.3761 4.1063 4.021 3.8993 8.7503z" fill="url(#u)" fill-rule="evenodd" opacity=".46759"/> <path d="m705.36 794.06c-0.32309-0.04566-0.51089-0.40605-0.76633-0.60907 5.9278 4.0546 0.16076-0.09343 1.6914-0.98296-0.18584-0.30454-0.13005 0.05185-0.29899 0.11921l7.3281-7.1554c1.2809 1.8557 2.9379 3.2454 3.1266 5.7026-0.28744 12.814-10.618 18.106-20.172 8.2261-4.8868-10.595 1.9398-18.612 13.077-14.868l-3.9858 9.5676z" fill="url(#v)"/> <path d="m670.98 891.48c5.4655 37.595-49.744 14.957-61.743 47.317-12.124 32.695 22.131 30.655 27.522 65.989l-3.3953 11.681c-10.486-45.495-38.146-45.847-26.038-77.709s59.629-24.526 61.962-41.157l1.693-6.1213z" fill="url(#bd)"/> <path d="m619.74 1033.7c-13.688 8.7079-56.512 6.6035-50.425-7.6177 14.522-33.922 58.376 3.865 47.901 32.183-5.0964 13.778-38.896-1.0468-49.253 8.6333l2.2842-8.2425c8.7543-8.2756 39.817 6.2152 41.386-1.9654 5.3709-27.994-22.403-38.599-35.584-34.706-4.6325 14.461 33.936 14.172 46.221 4.6636l-2.531 7.0509z" fill="url(#be)"/> <path d="m617.74 1033.7c-13.688 8.7079-54.512 6.6035-48.425-7.6177l6.7343-4.0968c-4.6325 14.461 31.936 14.172 44.221 4.6636l-2.531 7.0509z" fill="url(#bf)"/> <path d="m705.36 794.06c-0.32309-0.04566-0.51089-0.40605-0.76633-0.60907 5.9278 4.0546 0.16076-0.09343 1.6914-0.98296-0.18584-0.30454-0.13005 0.05185-0.29899 0.11921l7.3281-7.1554c1.2809 1.8557 2.9379 3.2454 3.1266 5.7026-0.28744 12.814-10.618 18.106-20.172 8.2261-4.8868-10.595 1.9398-18.612 13.077-14.868l-3.9858 9.5676z" fill="url(#bg)"/> <path d="m716.53 788.65c-17.535 16.735-12.546-3.6637-20.714-5.6466-11.754-4.9235-32.085-6.5319-42.357 0.28891-14.083 9.3511-23.149 21.63-23.595 41.898-0.44949 20.401 19.383 35.929 36.387 57.704l-1.2542 3.8196c-11.367-20.233-41.39-33.404-42.47-57.243-1.0951-24.162 6.3633-40.277 31.956-50.283 13.415-4.9665 27.85-7.4825 41.508-2.139l20.54 11.601z" fill="url(#bh)"/> <path d="m716.53 788.65c-17.535 16.735-12.546-3.6637-20.714-5.6466-11.754-4.9235-13.484-11.298 0.17431-5.9545l20.54 11.601z" fill="url(#w)" opacity=".63889"/> <path d="m446.35 827.92 71.38 339.85 9.0567 0.8958-72.506-342.35-7.9305 1.6074z" fill="url(#bm)" fill-rule="evenodd"/> <path d="m586.15 348.33c57.212 173.77-23.94 444.04-127.37 481.1-100.71 36.166-331.05-137.57-388.26-311.34s11.857-352.83 154.17-399.69 304.25 56.152 361.46 229.92z" fill="url(#y)" fill-rule="evenodd" opacity=".75"/> <path d="m586.15 348.33c57.212 173.77-23.94 444.04-127.37 481.1-100.71 36.166-331.05-137.57-388.26-311.34s11.857-352.83 154.17-399.69 304.25 56.152 361.46 229.92z" fill="url(#z)" fill-rule="evenodd"/> <path transform="matrix(1.2202 0 0 1 -135.79 0)" d="m782.11 437.22a131.07 247.1 0 1 1-262.14 0 131.07 247.1 0 1 1 262.14 0z" fill="url(#x)" fill-rule="evenodd" opacity=".15"/> <path d="m179.32 172.45c-12.085 1.3313-34.371 23.294-42.595 35.08-16.91 24.233-26.944 40.528-35.48 65.825-13.106 38.838 8.4362 38.436 34.286 12.776 19.749-19.604-9.2562 36.704-11.022 48.749-2.9496 20.116-21.686 34.073-29.986 45.968-8.6579 12.408-3.9097 33.769-22.771 49.609-20.582 17.285 20.481 21.385 32.433 25.418 19.096 6.444-6.0822 47.372 29.752 17.277 21.131-17.746 13.552-33.057 31.639-4.4007 5.9653 9.451 43.662-41.679 45.342-45.008 1.9628-3.8897-9.4891-56.231-10.622-59.671-0.02298-0.06984 11.096-20.327 27.172-17.97 24.936 3.6564 19.514 26.955 38.854-0.75993 9.8258-14.081 30.706 47.582 31.439 49.809 10.517 31.945 48.063-9.6906 62.352-2.4801 15.262 7.7016 12.946 38.214 30.545 47.096 13.884 7.0063 40.046-34.514 43.522-41.401 11.373-22.538-1.6507-23.463 37.96-3.4738 27.9 14.079 19.118-34.042 57.851-7.0143 23.572 16.448 4.7416-20.65 3.7409-34.32-1.6887-23.068-17.566-55.721-27.731-75.094-5.7524-10.963 45.756 11.634 37.034 2.8474-15.909-16.027-35.727-28.737-50.436-43.555-19.057-19.199-27.75-32.28-42.261-55.271-12.537-19.863-8.4352-24.623-26.078-33.526-18.629-9.4008-31.699 21.183-45.175-0.16694-9.3733-14.85-36.745 13.139-52.423 5.2274-4.4149-2.2279-19.819-30.849-23.364-34.42-7.8018-7.8597-41.975 7.8034-53.35 11.549l-10.855 3.5739c-12.451 4.0992-28.129 6.2529-41.601 10.688-0.97996 0.32263-10.547 20.636-18.17 27.038z" fill="url(#bn)" fill-rule="evenodd" opacity=".6"/> <path d="m354.43 220.08c6.9084 20.983-4.5016 43.594-25.485 50.503s-43.594-4.5016-50.503-25.485 4.5016-43.594 25.485-50.503 43.594 4.5016 50.503 25.485z" fill="url(#aa)" fill-rule="evenodd"/> <path d="m424.99 196.85c19.738 59.953-12.862 124.55-72.814 144.29s-124.55-12.862-144.29-72.814 12.862-124.55 72.814-144.29 124.55 12.862 144.29 72.814z" fill="url(#ab)" fill-rule="evenodd" opacity=".6"/> <path d="m224.7 118.42c-142.31 46.854-211.4 225.9-154.19 399.67s287.56 347.52 388.28 311.35c103.43-37.059 184.58-307.34 127.37-481.12s-219.15-276.76-361.46-229.9zm-4.686 5.8527c5.0148-2.1127 10.745-3.5148 17.338-3.9975 19.323-1.4146 35.137 23.137 40.552 22.741 20.432-1.4957 28.649-22.274 43.469-23.359 18.537-1.357 21.95 6.5721 34.283 12.796 11.454 5.7802 26.177 17.714 41.47 25.432 12.527 6.3217 34.938 20.632 49.613 22.784 13.777 2.0201 32.638 7.7975 36.961 20.929 9.1348 27.746-12.253 22.705-11.007 39.715 1.7109 23.371 43.087 12.055 52.268 39.939 9.4914 28.829-26.557 44.184-17.352 47.825 0.1859 0.07354 77.955 54.048 36.847 57.058-23.013 1.6847-70.872-27.598-75.008 0.61222-1.5032 10.251-19.632 63.679-39.916 43.245-43.436-43.758-16.268 9.5048-67.811 13.278-16.975 1.2427-16.57-17.487-17.941-36.205-5.7181-78.109-55.479-5.9875-58.612-31.83-9.4534-77.967 5.5369-10.748-21.531-38.017-16.307-16.428-29.142-34.047-54.146-18.265-38.555 24.335-3.4441 29.967 0.70873 56.914 3.8615 25.057-29.434 24.763-13.708 40.605 5.2796 5.3188 36.015 49.856 26.949 45.281l-10.85-5.4753c-38.888-19.624-32.519 47.093-65.047 3.3864-25.289-33.979-18.825 22.841-46.247 42.303-7.7904 34.455-14.325 11.251-19.843-5.5085-4.9852-15.142-3.3345-28.415-8.8652-45.214-9.022-27.403 13.603-22.494 24.543-44.172 6.3652-12.614 33.053-33.898 5.5754-37.927-14.432-2.1161-36.676 10.229-20.762-8.1999 10.232-11.848 54.455-56.078 30.094-73.076-13.718-9.5719-53.552-36.522-13.384-49.747 35.853-11.804 44.862-13.576 42.627-44.105-1.8199-24.859 36.809-14.624 48.035-36.871 6.9471-13.767 15.653-26.535 30.697-32.873z" fill="url(#bo)" fill-rule="evenodd" opacity=".4"/> <path d="m442.64 489.2c81.03 99.865 89.602 227.17 19.145 284.33s-193.26 22.557-274.29-77.308-89.602-227.17-19.145-284.33 193.26-22.557 274.29 77.308z" fill="url(#ac)" fill-rule="evenodd" opacity=".53"/> <path d="m440.6 592.04c45.396 55.948 48.157 128.92 6.1664 162.99s-112.83 16.337-158.23-39.611-48.157-128.92-6.1664-162.99 112.83-16.337 158.23 39.611z" fill="url(#ad)" fill-rule="evenodd" opacity=".3"/> <path d="m288.67 744.39c-20.656-22.32-67.291-60.291-94.213-92.347-15.246-18.154-28.174-48.051-3.6491-49.846 37.181-2.7219 38.721 56.013 30.704-10.109-0.51461-4.2442 33.299 41.825 54.948-1.0747 17.191-34.066 32.385 46.68 38.096 64.029 2.2218 6.7483 37.01 9.0928 49.846-3.6491 32.273-32.035 10.314 33.513 11.325 47.319 2.4586 33.584 68.667-48.672 71.752-53.401 28.727-44.038 49.53-15.706 67.914-52.137 19.301-38.248 41.658-69.868 56.589-99.456 11.829-23.441-26-28.786 5.2904-48.535 23.691-14.953 26.22 43.17 21.528 52.468-11.441 22.673-37.009 17.942-34.683 49.705 1.4547 19.871 2.4356 33.239 10.014 56.259 6.7693 20.561-15.068 55.228-23.264 71.469-11.601 22.988-0.46685 30.425-27.007 47.177-18.204 11.49-16.687 52.209-34.683 49.705-12.546 12.454-33.335 30.543-42.312 39.454-16.79 16.666-40.666-12.135-68.989-2.8104-21.38 7.0389-46.546-4.8879-60.002-14.277-12.961-9.044-24.377-35.279-29.204-49.941z" fill="url(#bp)" fill-rule="evenodd" opacity=".1"/> <path d="m586.15 348.33c57.212 173.77-23.94 444.04-127.37 481.1-100.71 36.166-331.05-137.57-388.26-311.34s11.857-352.83 154.17-399.69 304.25 56.152 361.46 229.92z" fill="url(#ae)" fill-rule="evenodd"/> <path d="m489.69 804.11c2.7082 8.3222-14.266 20.022-37.91 26.13s-44.998 4.309-47.692-4.0168c-2.7082-8.3222 14.266-20.022 37.91-26.13s44.998-4.309 47.692 4.0168z" fill="url(#af)" fill-rule="evenodd" opacity=".3"/> <path d="m446.24 816.97c-5.5435 4.2209-13.612 18.754-15.684 25.931-1.1523 3.9925-8.5448 5.9294-12.364 8.341-7.5142 4.7444-2.6167 11.428 5.1248 10.655 10.311-1.0298 20.176-2.0005 30.355-1.0012 7.6777 0.75372 15.457-0.52845 23.219-1.3036 7.9045-0.7894 8.4098-6.1424 6.1326-9.749-2.0722-3.2819-11.673-6.642-14.272-10.757-2.466-3.9056-3.7086-18.062-9.2445-21.411-0.40746-0.24644-7.277-5.2668-13.268-0.70533z" fill="url(#bq)" fill-rule="evenodd"/> <path d="m446.24 816.97c-5.5435 4.2209-13.612 18.754-15.684 25.931-1.1523 3.9925-8.5448 5.9294-12.364 8.341-7.5142 4.7444-2.6167 11.428 5.1248 10.655 10.311-1.0298 20.176-2.0005 30.355-1.0012 7.6777 0.75372 15.457-0.52845 23.219-1.3036 7.9045-0.7894 8.4098-6.1424 6.1326-9.749-2.0722-3.2819-11.673-6.642-14.272-10.757-2.466-3.9056-3.7086-18.062-9.2445-21.411-0.40746-0.24644-7.277-5.2668-13.268-0.70533z" fill="url(#br)" fill-rule="evenodd"/> <path d="m446.24 816.97c-5.5435 4.2209-13.612 18.754-15.684 25.931-1.1523 3.9925-8.5448 5.9294-12.364 8.341-7.5142 4.7444-2.6167 11.428 5.1248 10.655 10.311-1.0298 20.176-2.0005 30.355-1.0012 7.6777 0.75372 15.457-0.52845 23.219-1.3036 7.9045-0.7894 8.4098-6.1424 6.1326-9.749-2.0722-3.2819-11.673-6.642-14.272-10.757-2.466-3.9056-3.7086-18.062-9.2445-21.411-0.40746-0.24644-7.277-5.2668-13.268-0.70533z" fill="url(#bs)" fill-rule="evenodd" opacity=".46759"/> <path d="m446.24 816.97c-5.5435 4.2209-13.612 18.754-15.684 25.931-1.1523 3.9925-8.5448 5.9294-12.364 8.341-7.5142 4.7444-2.6167 11.428 5.1248 10.655 10.311-1.0298 20.176-2.0005 30.355-1.0012 7.6777 0.75372 15.457-0.52845 23.219-1.3036 7.9045-0.7894 8.4098-6.1424 6.1326-9.749-2.0722-3.2819-11.673-6.642-14.272-10.757-2.466-3.9056-3.7086-18.062-9.2445-21.411-0.40746-0.24644-7.277-5.2668-13.268-0.70533z" fill="url(#bt)" fill-rule="evenodd" opacity=".50926"/> <path d="m435.26 849.34c3.4094 0.0997 11.179-1.4241 16.341-3.1775 4.3689-1.484 7.0509-2.0238 9.5144-4.814 3.5647-4.0372 3.7708-0.90807 9.2601 0.97965 3.2267 2.822 7.3476 1.3593 10.902 7.0526 3.1859 2.4139-11.746 1.173-15.87 1.5848-4.43 0.44241-8.335 0.05964-12.447 0.47029-2.8368 0.28331-8.7269-0.1824-10.874-0.45953-3.3412-0.43128-1.7143-1.2064-6.8269-1.6365z" fill="url(#ag)" fill-rule="evenodd" opacity=".67593"/> <path d="m443.7 823.82c2.0613 4.2616 2.0079 8.5502-0.11917 9.5791s-5.5224-1.5918-7.5836-5.8533-2.0079-8.5502 0.11918-9.5791 5.5224 1.5918 7.5836 5.8533z" fill="url(#ah)" fill-rule="evenodd" opacity=".46759"/> <path d="m438.59 826.38c-0.30608 0.11307-0.64237-0.1151-0.96355-0.17265 7.1418 0.75729 0.0972-0.1585 1.0227-1.6677-0.30807-0.17992-0.08989 0.10735-0.20665 0.24678l3.0566-9.7754c2.0079 1.026 4.1259 1.4634 5.4576 3.537 5.8255 11.416-0.75823 20.976-13.855 16.811-9.328-7.0086-7.1217-17.305 4.4586-19.292l1.03 10.313z" fill="url(#ai)"/> <path d="m464.55 908.06c-9.4404 36.799 49.867 38.173 58.35 71.627 8.5707 33.8-28.511 2.1226-37.637 36.68l2.1313 11.976c15.274-44.119 46.055-15.522 37.41-48.492s-58.676-48.74-59.223-65.525l-1.0311-6.2669z" fill="url(#bu)"/> <g transform="matrix(-.99601 .089248 .089248 .99601 894.77 -68.925)"> <path d="m491.89 1079.2c-7.9185 14.159-41.628 31.384-43.015 15.977-3.3086-36.751 53.223-24.29 57.435 5.6083 2.0494 14.546-34.737 17.53-39.263 30.965l-1.8992-8.3395c3.7807-11.438 38-13.417 35.501-21.363-8.5518-27.192-38.033-23.352-47.789-13.672 2.7822 14.928 33.601-2.5629 39.906-16.762l-0.87527 7.5863z" fill="url(#bl)"/> <path d="m489.62 1079.4c-7.9185 14.159-39.358 31.18-40.745 15.773l3.9849-6.8011c2.7822 14.928 31.331-2.3595 37.636-16.558l-0.87527 7.5863z" fill="url(#bk)"/> </g> <path d="m438.59 826.38c-0.30608 0.11307-0.64237-0.1151-0.96355-0.17265 7.1418 0.75729 0.0972-0.1585 1.0227-1.6677-0.30807-0.17992-0.08989 0.10735-0.20665 0.24678l3.0566-9.7754c2.0079 1.026 4.1259 1.4634 5.4576 3.537 5.8255 11.416-0.75823 20.976-13.855 16.811-9.328-7.0086-7.1217-17.305 4.4586-19.292l1.03 10.313z" fill="url(#bv)"/> <path d="m430.14 819.06c16.075 18.141 12.808-2.6027 21.113-3.896 12.124-3.9242 32.518-3.8281 42.185 3.8271 13.253 10.495 21.261 23.488 20.012 43.723-1.2567 20.367-26.318 14.183-45.082 34.462l0.93068 3.911c13.018-19.213 48.036-9.8287 51.105-33.494 3.1102-23.986-2.9757-40.668-27.643-52.777-12.953-6.07-27.128-9.7834-41.185-5.5998l-21.437 9.8443z" fill="url(#bw)"/> <path d="m445.85 816.33c-7.4974 23.05-12.782 2.7261-20.914 4.8556-12.683 1.2416-17.23-3.5493-2.6713-5.3245l23.585 0.4689z" fill="url(#aj)" opacity=".63889"/> <path transform="matrix(.98588 -.16181 .16746 .95261 -68.149 66.993)" d="m584.44 473.75a96.69 257.84 0 1 1-193.38 0 96.69 257.84 0 1 1 193.38 0z" fill="url(#bj)" fill-rule="evenodd" opacity=".15"/> <path d="m653.71 683.68c-2.3007 3.2637-1.8444 6.0549-0.16423 11.604 0.93475 3.0871-3.808 4.5847-5.6184 6.4494-3.5618 3.6684 3.1939 8.8365 8.7298 8.2387 7.3736-0.79623 14.434-1.5468 22.628-0.7741 6.1799 0.58278 11.514-0.40861 17.064-1.008 5.6524-0.61038 3.6087-4.7494 0.24127-7.5381-3.0643-2.5376-11.889-5.1357-15.731-8.3173-3.6466-3.0198-11.013-9.9661-16.741-12.555 0.65272 4.1068-7.9223 0.37365-10.409 3.9006z" fill="url(#bi)" fill-rule="evenodd" opacity=".15"/> <path d="m650.41 689.82c-6.113 15.956 4.0377 47.01 12.005 65.761 7.3191 15.227 15.94 29.876 27.587 42.183l-6.7716 6.1009c-11.662-13.528-20.585-29.018-28.232-45.127-7.2436-16.986-32.176-69.766-3.2666-78.734l-1.3221 9.8162z" fill="url(#as)" opacity=".1"/> <path d="m527.98 684.22c-2.2923 1.8259-5.071 8.8442-5.5551 12.437-0.26929 1.9988-3.5718 2.5146-5.1842 3.5145-3.1722 1.9671-0.4545 5.7665 3.0874 5.8788 4.7176 0.1495 9.2316 0.29999 14.023 1.4955 3.6138 0.90165 7.1393 0.75178 10.691 0.86432 3.6164 0.11461 3.495-2.6343 2.1981-4.6602-1.1801-1.8435-5.8601-4.2277-7.3397-6.539-1.4044-2.1938-2.9227-9.6349-5.7149-11.743-0.20551-0.15516-3.728-3.2209-6.2053-1.2477z" fill="url(#au)" fill-rule="evenodd" opacity=".15"/> <path d="m520.4 692.48c-14.908 8.3495-26.979 38.709-32.855 58.217-4.119 16.384-6.8686 33.159-5.7929 50.069l-9.1076 0.35515c-0.30527-17.858 2.7493-35.472 7.1814-52.744 5.3031-17.689 19.917-74.201 47.871-62.595l-7.2974 6.6974z" fill="url(#at)" opacity=".15"/> 
+        </svg>
+    </div>
+</body>
+</html>
+"""
+    return html_code
+
+def generate_section_header_slide_9(
+    main_title="Main Title Here",
+    subtitle="Here you could describe the topic of the section",
+    bg_gradient_from="#fef5e7",
+    bg_gradient_to="#d4a574",
+    text_color="#ffffff",
+    custom_css=""
+):
+    """
+    Generate a modern section header slide with house SVG illustration on the left and text on the right.
+    
+    Parameters:
+    - main_title: Main title text displayed prominently on the right side
+    - subtitle: Subtitle text below the main title
+    - bg_gradient_from: Starting gradient color (default: light cream #fef5e7)
+    - bg_gradient_to: Ending gradient color (default: warm brown #d4a574)
+    - text_color: Color of all text elements (default: white)
+    - custom_css: Additional CSS to inject
+    
+    Returns:
+    - HTML string containing the complete slide with SVG container on left, text on right
+    """
+    
+    if isinstance(main_title, list):
+        main_title = main_title[0]
+    if isinstance(subtitle, list):
+        subtitle = subtitle[0]
+    
+    html_code = f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{main_title}</title>
+    <link href="https://fonts.googleapis.com/css2?family=Roboto+Condensed:wght@700;900&family=Roboto:wght@300;400&display=swap" rel="stylesheet">
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body {{
+            margin: 0;
+            padding: 0 120px;
+            font-family: 'Roboto', sans-serif;
+            overflow: hidden;
+            width: 1920px;
+            height: 1080px;
+            background: linear-gradient(135deg, {bg_gradient_from} 0%, {bg_gradient_to} 100%);
+            position: relative;
+            display: flex;
+            align-items: center;
+            justify-content: space-between;
+        }}
+        
+        /* SVG Container - Left side */
+        .svg-container {{
+            position: relative;
+            width: 50%;
+            height: 95%;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            z-index: 5;
+            filter: drop-shadow(0 10px 30px rgba(0, 0, 0, 0.3));
+        }}
+        
+        .svg-container svg {{
+            width: 100%;
+            height: auto;
+            max-height: 100%;
+            opacity: 0.95;
+            filter: brightness(1.1) saturate(0.9);
+        }}
+        
+        /* Content area - Right side */
+        .content {{
+            position: relative;
+            z-index: 10;
+            text-align: right;
+            max-width: 50%;
+        }}
+        
+        .main-title {{
+            font-family: 'Roboto Condensed', sans-serif;
+            font-size: 4rem;
+            font-weight: 900;
+            color: {text_color};
+            margin-bottom: 30px;
+            line-height: 1.1;
+            letter-spacing: 2px;
+        }}
+        
+        .subtitle {{
+            font-family: 'Roboto', sans-serif;
+            font-size: 2rem;
+            font-weight: 300;
+            color: {text_color};
+            opacity: 0.9;
+            line-height: 1.6;
+        }}
+        
+        {custom_css}
+    </style>
+</head>
+<body>
+    <!-- SVG Container - Left side (paste your SVG here) -->
+    <div class="svg-container">
+        <!-- Paste your SVG code here -->
+  <svg xmlns="http://www.w3.org/2000/svg" enable-background="new 0 0 1696.48 1415.91" version="1.1" viewBox="0 0 1696.5 1415.9">
+    <style type="text/css">
+      .st0{{fill-rule:evenodd;clip-rule:evenodd;fill:#B39E63;}} .st1{{fill:#A16837;}} .st2{{fill-rule:evenodd;clip-rule:evenodd;fill:#ECD8B3;}} .st3{{fill-rule:evenodd;clip-rule:evenodd;fill:#E8CD9F;}} .st4{{fill-rule:evenodd;clip-rule:evenodd;fill:#D3A364;}} .st5{{fill-rule:evenodd;clip-rule:evenodd;fill:#BE8450;}} .st6{{fill-rule:evenodd;clip-rule:evenodd;fill:#B17D42;}} .st7{{fill:#B17D42;}} .st8{{fill-rule:evenodd;clip-rule:evenodd;fill:#E2C28F;}} .st9{{fill-rule:evenodd;clip-rule:evenodd;fill:#D2C08D;}} .st10{{fill-rule:evenodd;clip-rule:evenodd;fill:#9A864D;}} .st11{{fill-rule:evenodd;clip-rule:evenodd;fill:#D1C0A1;}} .st12{{fill-rule:evenodd;clip-rule:evenodd;fill:#A16837;}}
+    </style>
+    <path class="st0" d="m1347.2 751.6c33.01 35.73 110.52 0.6 109.92-50.87 69.64-7.87 94.78-109.31 45.42-143.53 67.22-61.47 13.62-154.73-54.5-151.7 3.63-112.34-157.15-154.73-185.31-15.44-59.95-12.11-106.28 102.04-43.6 129.9-30.65 24.21-37.83 92.97 5.45 106.28-26.88 66.4 70.31 152 122.62 125.36"/>
+    <path class="st1" d="m1289.8 509.6c-9.83-12.07-0.05-16.88 7.06-8.82 16.87 19.11 31.41 45.09 46.82 61.75 2.12-63.14 3.74-110.09 3.72-116.71-0.07-17.56 11.93-15.65 11.9-4.91-0.03 10.69-0.89 80.98-1.75 166.32 17.4-27.81 40.85-81.48 56.81-99.57 7.11-8.05 13.64-0.74 5.09 12.27-16.94 25.79-41.18 86.06-62.19 116.61-0.21 21.83-0.41 44.26-0.6 66.65 17.71-19.19 52.36-63.45 72.46-82.84 7.73-7.46 17.73-2.51 7.06 8.82-18.9 20.08-55.56 70.13-79.69 95.04-0.88 112.94-1.19 218.93 0.69 229.95-4.11 6.16-17.78 2.43-21.9 8.59-2.82-18.47 0.28-143.51 4.05-266.06-21.41-23.58-46.76-60.2-64.3-78.84-10.67-11.34-0.67-16.28 7.06-8.82 18.56 17.9 41.57 48.68 57.87 67.3 1.02-32.52 2.07-64.41 3.04-93.65-19.01-20.44-34.98-50.71-53.2-73.08"/>
+    <path class="st0" d="m181 1033.7c-23.13-27.69 3.95-73.86 38.97-69.28-15.73-31.45 15.38-72.79 66.03-51.96-1.97-60.58 59.56-80.61 102.83-54.12 20.76-51.52 97.51-52.58 127.73 5.41 220.1 5.05 440.19 10.1 660.29 15.15 43.43-69.86 118.49-62.8 116.9-2.16 36.47-38.29 106.97-6.79 92.01 44.38 35.97-14.04 78.97 5.91 71.44 50.87 39.84-0.44 52.66 33.9 27.06 74.69-434.42-4.32-868.84-8.65-1303.3-12.98"/>
+    <polygon class="st2" points="471.34 657.86 462.06 998.51 1216.3 1034.3 1214.9 640.63 707.28 307.94"/>
+    <polygon class="st3" points="909.83 1019.8 1216.3 1034.3 1214.9 640.63 907.61 439.22"/>
+    <path class="st4" d="m572.09 984.69 3.96-158.49c0-102.17 51.87-144.08 112.66-143.16 55.14 0.83 98.09 54.12 98.09 131.23l-3.81 181.15c-70.21-4.91-140.54-8.71-210.9-10.73"/>
+    <path class="st1" d="m707.06 990.57 1.36-105.53-8.86-0.74-0.72 105.81c2.74 0.15 5.48 0.31 8.22 0.46m-5.41-131.39c-5.58-5.75-7.68-18.71-5.27-26.35 2.11-6.68 10.17-11.97 17.12-11.2 7.29 0.81 12.54 9.9 13.83 17.12 1.23 6.91-1.75 15.4-7.25 19.76-4.81 3.84-14.15 5.08-18.43 0.67zm-95.95 126.61-0.87-158.88c0-50.93 27.89-103.59 78.38-104.72 38.09-0.86 69.81 48.3 69.81 89.58l-1.78 181.53c-3.61-0.23-7.23-0.47-10.84-0.7 0.7-56.26 1.39-108.65 2.09-167.66 0-19.19-8.96-60.14-32.27-79.57l-0.74 57.61-9.39 3.67 0.46-67.6c-5.39-2.63-11.37-4.2-17.99-4.35-6.26-0.14-12.21 1.09-17.78 3.43v250.2c-3.14-0.16-6.28-0.31-9.43-0.45l2.55-246.2c-24.74 15.24-40.55 52.83-40.55 86.56l-2.6 157.9 5.07 0.2c-4.71-0.21-9.41-0.38-14.12-0.55z"/>
+    <path class="st5" d="m664.77 738.12c5.58-2.34 11.52-3.57 17.78-3.43 6.62 0.14 12.6 1.71 17.99 4.35l-0.46 67.6 9.39-3.67 0.74-57.61c23.31 19.44 32.27 60.38 32.27 79.57-0.69 59.01-1.39 111.39-2.09 167.66-11.11-0.7-22.22-1.37-33.34-2.01l1.36-105.53-8.86-0.74-0.72 105.81c-11.35-0.63-22.71-1.23-34.07-1.79v-250.21zm-50.02 248 2.6-157.9c0-33.73 15.8-71.32 40.55-86.56l-2.55 246.2c-13.54-0.63-27.07-1.21-40.6-1.74zm86.9-126.94c-5.58-5.75-7.68-18.71-5.27-26.35 2.11-6.68 10.17-11.97 17.12-11.2 7.29 0.81 12.54 9.9 13.83 17.12 1.23 6.91-1.75 15.4-7.25 19.76-4.81 3.84-14.15 5.08-18.43 0.67z"/>
+    <path class="st5" d="m1012.4 396.16c2.26-25.58 4.51-51.16 6.77-76.73-2.96-0.13-5.02-0.73-8.87-1.55-8.49-1.8-7.83-5.94-7.5-10.56l1.62-22.12c0.55-7.47 4.33-11.01 13.68-11.01 33.38-1.47 65.68-0.76 97.03 1.85 8.59 0 13.03 7.1 12.75 12.07l-1.41 24.4c-0.27 4.68-1.75 6.2-11.24 6.52 1.56 63.86 3.12 127.72 4.68 191.58-35.84-38.15-71.68-76.3-107.51-114.45"/>
+    <path class="st6" d="m404.12 686.74c16.69 19.2 54.72 24.73 75.13 15.03 52.24-24.84 122.12-168.08 194.5-247.09 13.53-14.77 33.72-25.14 50.92 1.67 50.68 78.99 93.67 156.49 153.6 228.72 14.55 17.53 43.17 36.46 65.95 35.89 92.89-2.29 187.98 7.88 280.48 7.51 23.43-0.09 52.59-18.92 42.57-55.93-107.96-7.79-215.92-15.58-323.89-23.37-62.9-86.25-125.78-172.51-188.67-258.77-42.02 2.5-84.03 5.01-126.05 7.51-74.84 96.28-149.69 192.56-224.54 288.83"/>
+    <path class="st4" d="m1219.7 690.08c-32.56 6.92-64.28 12.84-97.67-8.35-41.53 22.88-78.68 16.64-113.53-5.01-47.86 26.99-80.1 13.96-103.51-11.69-61.81-67.71-101.88-157.01-154.43-230.39-29.85-41.67-79.16-39.84-107.68-5.84-61.43 73.21-115.21 176.19-181.14 250.43-15.93 17.93-60.26 26.48-71.79-5.84-7.24-20.3-0.51-45.44 12.52-62.61 80.04-105.5 156.42-209.51 251.26-318.88 28.81-33.22 67.63-29.52 101.12-25.12 68.25 8.97 113.49 15.55 166.84 29.29 28.34 7.3 51.09 21.88 71.79 42.57 91.03 91.03 181.39 188.06 260.44 289.66 12.77 16.41 26.77 42.75 16.7 60.94-8.23 14.86-23.09 15.31-50.92 0.84"/>
+    <path class="st2" d="m1012.1 907.27c0.76-30.57 1.52-50.57 2.29-81.14 0-30.38 29.67-49.8 57.14-50.28 21.27-0.38 51.71 21.81 51.71 48 1.05 32.76 2.09 54.95 3.14 87.71-38.09-1.44-76.18-2.87-114.28-4.29"/>
+    <path class="st7" d="m486.81 542.28c1.41-1.81 4.01-2.14 5.82-0.73s2.13 4.01 0.73 5.82c-7.3 9.38-13.63 18.05-19.06 26.05-5.52 8.13-10.25 15.71-14.25 22.8-1.12 1.99-3.64 2.69-5.63 1.57s-2.69-3.64-1.57-5.63c4.13-7.31 8.97-15.09 14.61-23.38 5.71-8.41 12.14-17.23 19.35-26.5m127-123.36c1.49-1.74 4.1-1.94 5.84-0.45s1.94 4.1 0.45 5.84c-8.08 9.45-15.92 18.95-23.52 28.49-7.64 9.58-14.95 19.07-21.95 28.49-1.36 1.83-3.95 2.22-5.79 0.86s-2.22-3.95-0.86-5.79c7.18-9.65 14.55-19.23 22.11-28.71 7.6-9.55 15.5-19.12 23.72-28.73zm64.48-110.35c1.3-1.88 3.88-2.35 5.76-1.05s2.35 3.87 1.05 5.75l-32.08 46.23c-1.3 1.88-3.87 2.35-5.75 1.06-1.88-1.3-2.35-3.88-1.05-5.76l32.07-46.23zm480.87 270.98c-1.65-1.58-1.7-4.21-0.11-5.85 1.58-1.65 4.2-1.7 5.85-0.11 12.06 11.66 20.94 21.04 27.91 29.05 6.97 8 12.14 14.77 16.7 21.11 1.33 1.85 0.91 4.44-0.94 5.77s-4.44 0.91-5.77-0.94c-4.34-6.03-9.33-12.55-16.24-20.49-6.92-7.95-15.65-17.17-27.4-28.54zm-109.19-6.5c-1.6-1.63-1.58-4.25 0.05-5.85s4.25-1.58 5.85 0.05c8.42 8.52 15.72 17.08 21.98 25.68 6.28 8.63 11.46 17.24 15.6 25.83 0.99 2.06 0.13 4.54-1.93 5.53s-4.53 0.13-5.53-1.93c-3.95-8.21-8.88-16.4-14.82-24.57-5.98-8.21-13.02-16.46-21.2-24.74zm-79.47-17.16c-1.22-1.93-0.64-4.49 1.3-5.71 1.93-1.22 4.49-0.64 5.71 1.3l33.59 53.16c1.22 1.93 0.64 4.49-1.3 5.71-1.93 1.22-4.49 0.64-5.71-1.3l-33.59-53.16zm-66.18 7.18c-1.41-1.81-1.08-4.41 0.73-5.82s4.41-1.08 5.82 0.73c8.23 10.6 15.7 21.23 22.11 31.87 6.42 10.67 11.78 21.39 15.78 32.16 0.8 2.14-0.29 4.52-2.43 5.32s-4.52-0.29-5.32-2.43c-3.79-10.2-8.93-20.46-15.13-30.77-6.22-10.33-13.51-20.69-21.56-31.06zm-82.43-138.8c-1.47-1.75-1.24-4.37 0.52-5.84 1.75-1.47 4.37-1.24 5.84 0.52 9.71 11.63 18.71 23.27 26.66 34.94 7.96 11.69 14.87 23.43 20.36 35.2 0.97 2.07 0.07 4.53-1.99 5.5-2.07 0.97-4.53 0.07-5.5-1.99-5.27-11.3-11.96-22.65-19.72-34.03-7.76-11.41-16.6-22.85-26.17-34.3zm60.8 8.49c-1.34-1.85-0.93-4.44 0.93-5.79 1.85-1.34 4.44-0.93 5.79 0.93l30.84 42.61c1.34 1.85 0.93 4.45-0.92 5.79s-4.45 0.93-5.79-0.92l-30.85-42.62zm71.31 5.17c-1.16-1.97-0.51-4.51 1.46-5.67s4.51-0.51 5.67 1.46c2.2 3.69 4.34 7.71 6.48 11.72 4.05 7.6 8.11 15.21 13.4 21.79 6.14 7.63 13.55 14.26 20.97 20.88 3.86 3.45 7.72 6.9 11.31 10.38 1.64 1.59 1.67 4.21 0.08 5.85s-4.21 1.67-5.85 0.08c-3.66-3.55-7.36-6.86-11.05-10.16-7.69-6.88-15.39-13.76-21.91-21.86-5.75-7.14-10-15.11-14.24-23.08-2.02-3.76-4.03-7.53-6.32-11.39zm73.24 7.38c-1.44-1.77-1.17-4.38 0.6-5.82s4.38-1.17 5.82 0.6l39.08 48.21c1.44 1.77 1.17 4.38-0.6 5.82s-4.38 1.17-5.82-0.6l-39.08-48.21zm-76.29-100.2c-1.3-1.88-0.83-4.46 1.05-5.76s4.46-0.83 5.76 1.05l21.09 30.53c1.3 1.88 0.83 4.46-1.05 5.76s-4.46 0.83-5.76-1.05l-21.09-30.53zm-51.73-6.5c-1.3-1.88-0.83-4.46 1.05-5.76s4.46-0.83 5.76 1.05l28.41 41.11c1.3 1.88 0.83 4.46-1.05 5.76s-4.46 0.83-5.76-1.05l-28.41-41.11zm-83.63-13.54c-1.31-1.87-0.86-4.46 1.01-5.77s4.46-0.86 5.77 1.01c6.74 9.59 13.01 18.58 18.74 26.86 5.47 7.92 10.17 14.8 13.98 20.5 1.27 1.9 0.76 4.47-1.14 5.74s-4.47 0.76-5.74-1.14c-3.75-5.62-8.43-12.47-13.91-20.4-5.23-7.57-11.51-16.57-18.71-26.8zm-73.79-25.48c-1.43-1.78-1.15-4.39 0.63-5.82s4.39-1.15 5.82 0.63c9.82 12.23 17.31 22.66 23.45 32.54 6.18 9.95 11 19.35 15.47 29.47 0.92 2.1-0.03 4.54-2.12 5.46s-4.54-0.03-5.46-2.12c-4.32-9.79-8.97-18.86-14.91-28.43-6-9.63-13.3-19.8-22.88-31.73z"/>
+    <path class="st1" d="m1024.5 319.32c-4.79 0.1-3.98-0.33-4.26-2.61s-1.53-5.56 3.26-5.66l83.66-0.33c4.79-0.1 8.91 1.67 9.18 3.95 0.28 2.28-10.09 4.22-14.88 4.32l-76.96 0.33zm91.87 45.74 0.2 8.28-49.43 1.97c-3.34 0.13-6.2-1.61-6.4-3.89-0.19-2.28 2.36-4.24 5.7-4.37l49.93-1.99zm-27.17-90.73-1.88 27.91c-0.22 3.23-3.3 4.39-6.89 2.6s-6.32-5.87-6.1-9.1l1.48-21.95c4.48 0.14 8.94 0.32 13.39 0.54z"/>
+    <path class="st8" d="m835.66 776.7c5.24 2.19 17.6 3.23 25.07 2.49 6.54-0.65 12.05-3.53 11.68-6.13-0.4-2.72-8.87-4.86-15.75-5.48-6.58-0.6-14.91 0.34-19.4 2.29-3.93 1.71-5.62 5.15-1.6 6.83m-75.04-134.06c4.11 2.19 13.8 3.23 19.67 2.49 5.13-0.65 9.46-3.53 9.16-6.13-0.31-2.72-6.96-4.86-12.36-5.48-5.16-0.6-11.7 0.34-15.22 2.29-3.08 1.71-4.41 5.15-1.25 6.83zm-25.96-51.05c5.23-2.19 17.6-3.23 25.07-2.49 6.54 0.65 12.05 3.53 11.68 6.13-0.39 2.72-8.87 4.86-15.75 5.48-6.58 0.6-14.91-0.34-19.39-2.29-3.94-1.71-5.62-5.15-1.61-6.83zm-229.24 160.5c5.43-2.19 18.26-3.23 26.02-2.49 6.78 0.65 12.51 3.53 12.12 6.13-0.41 2.72-9.2 4.86-16.34 5.48-6.83 0.6-15.47-0.34-20.13-2.29-4.09-1.7-5.84-5.15-1.67-6.83z"/>
+    <path class="st9" d="m40.27 1031c-43.33 11.7-64.7 34.99 3.92 49.66 36.03 7.7 143.23 0.17 118.3 27.3-51.3 55.82 240.96 94.57 259.34 107.29 9.18 6.35 1.39 7.71-32.31 17.45-49.4 14.28 15.83 27.65 31 30.54 73.35 13.97 117.23 9.89 182.94 27.8 12.25 3.34 48.84 25.71 20.55 37.41-46.93 19.41-37.81 34.64 51.32 54.06 217.37 47.36 555.58 48.44 702.59-23.75 53.73-26.38 77.29-56.75 5.65-88.63-10.32-4.59-27.7-20.46 15.68-30.05 15.04-3.32 55.03-7.8 60.44-22.21 5.14-13.71-78.36-24.26-36.91-40.51 76.44-29.97 160.82-45.23 239-70.33 64.73-20.78 24.82-42.67-6.53-52.27-353.38-108.17-577.03-38-855.77-58.19-152.16-11.02-304.9-17.07-457.35-11.3-101.7 3.84-203.61 19.19-301.86 45.73"/>
+    <path class="st10" d="m446.81 987.14c-35.71-39.78 1.88-90.16 16.77-36.03-1.4-74.05 52.5-53.09 33.55 0.62 24.95-28.46 66.29-1.65 16.15 36.03-22.15-0.21-44.31-0.42-66.47-0.62"/>
+    <path class="st10" d="m826.41 1001.4c-39.14-37.9 2.48-64.61 18.64-42.87-14.68-74.78 41.98-59.09 41.63-28.58 22.47-29.24 62.3-12.8 39.76 30.44 41.18-38.26 53.27 14.96 26.71 41.63-42.25-0.21-84.49-0.42-126.74-0.62"/>
+    <path class="st10" d="m398.85 1198.5c-9-14.27 6.24-20.09 15.34-6.57 8.47 12.58 13.66 31.88 18.41 50.84 3.71 14.83-7.59 18.24-10.52 6.57-4.54-18.07-13.3-35.08-23.23-50.84m44.26-9.2c4.03-15.13 15.78-17.62 14.02 2.63-1.67 19.35-3.53 38.74-7.01 57.85-2.12 11.62-13.98 10.77-14.02-1.31-0.08-22.81 2.87-43.64 7.01-59.17zm29.37 22.79c14.65-10.36 18.41 1.02 9.19 11.84-7.46 8.75-9.42 17.7-14.46 28.04-6.55 13.45-15.89 11.17-13.15-0.44 3.28-13.83 6.81-31.24 18.42-39.44zm-104.75-114.82c-4.1 9.76 1.15 15.64 7.45 3.94 7.36-13.65 15.97-26.61 23.23-40.32 5.82-10.99-3.39-16.2-9.2-8.33-9.82 13.31-15.08 29.47-21.48 44.71zm-12.27 3.5c-1.61 12.61-12.23 13.7-13.15-6.13-0.98-21.3 5.1-42.48 10.52-63.11 2.62-9.98 11.91-7.35 10.52 3.51-2.82 21.88-5.1 43.84-7.89 65.73zm-27.17 10.08c3.63 14.22 13.08 12.03 12.13-0.88-1.65-22.42-5.24-45.56-13.45-66.62-3.92-10.06-17.68-12.59-15.34-0.88 4.49 22.4 9.19 39.16 16.66 68.38zm583.38-58.28c-8.07-11.04-15.94-7.66-10.67 4.13 4.06 9.09 8.44 18.09 13.77 26.5 4.16 6.56 11.98 4.46 9.29-6.2-2.24-8.85-7-17.06-12.39-24.43zm36.82 22.37c-2.65 10.82-12.35 12.36-13.42 2.06-1.01-9.7-0.94-19.59 0.34-29.25 2.18-16.4 11.56-19.54 13.08-3.79 0.99 10.28 2.46 20.95 0 30.98zm8.95 1.72c-3.68 7.52 2.3 11.44 8.26 4.82 5.47-6.08 11.18-12.55 13.77-20.31 2.8-8.4-3.54-13.71-8.26-7.92-5.72 7.02-9.79 15.28-13.77 23.41zm-13.42 122.17c-4.13 7.79 1.03 13.23 7.23 5.85 6.66-7.92 10.9-17.6 16.17-26.5 6.07-10.23-1.86-13.59-9.29-5.16-6.49 7.36-9.53 17.15-14.11 25.81zm-28.57 2.07c2.15 10.71 10.02 9.48 11.01-2.06 0.8-9.3 0.25-19.03-2.75-27.88-4.74-13.94-14.92-10.71-14.45 3.44 0.3 9.07 4.41 17.61 6.19 26.5zm-36.48-10.33c-4.19-6.16-1.59-14.47 7.57-7.23 6.32 5 10.98 12.2 14.11 19.62 2.96 7-1.63 11.6-5.85 6.88-5.55-6.19-11.16-12.39-15.83-19.27zm-56.44-71.58c-3.72 7.33 0.38 12.22 7.57 6.2 4.89-4.09 7.18-9.8 10.67-15.14 2.43-3.73-1.51-7.15-6.88-4.47-5.53 2.73-8.57 7.91-11.36 13.41zm-19.27-37.86c2.74-11.19 8.92-10.51 10.32 0.34 1.48 11.47 1.17 23.03-2.06 34.76-2.89 10.5-12.56 11.38-12.05-1.03 0.47-11.41 1.07-22.97 3.79-34.07zm374.92-65.66c-4.74 8.26 1.1 11.93 7.16 5.17 6.65-7.42 14.74-13.9 19.49-22.67 5.31-9.81-1.57-17.35-8.75-9.94-7.6 7.84-12.46 17.97-17.9 27.44zm-19.08-9.94c-2.22 11.93 7.22 16.92 11.13 5.17 6.06-18.21 6.77-33.4 11.13-52.09 3.43-14.7-4.24-23.92-9.15-10.34-6.65 18.41-9.53 38.01-13.11 57.26zm-11.53 10.74c3.04 6.94 9.93 4.38 7.95-3.58-3.64-14.61-7.22-29.33-12.72-43.34-3.79-9.65-14.43-7.38-12.33 3.58 2.93 15.25 10.86 29.12 17.1 43.34zm-367.37 99.62c2.63 6.04 7.36 2.4 7.57-5.16 0.28-10.12-2.71-20.11-5.16-29.94-1.76-7.07-10.76-7.73-11.01 0.35-0.38 11.92 3.54 23.12 8.6 34.75zm-476.46-3.72c4.3 10.91 13.56 5.78 9.64-7.89-3.85-13.43-8.47-19.15-15.78-26.29-6.83-6.68-14.89-1.04-10.52 7.89 4.57 9.31 12.86 16.64 16.66 26.29z"/>
+    <path class="st10" d="m1289.4 993.65c10.17-14.29 20.11-28.75 35.93-39.4 10.12-6.82 18.01 8.48 6.76 16.7-10.97 8.01-20.25 15.74-30.66 23.17-4.02-0.17-8.03-0.33-12.03-0.47m-20.33-0.58c-7.49-24.95-16.21-49.66-19.69-75.41-3-22.18 13.26-29.95 18.29-7.55 5.27 23.49 3.98 47.98 5.97 71.97 7.29-25.58 10.26-35.58 20.28-54.87 7.67-14.76 29.09-12.73 20.68 2.78-10.83 19.98-24.5 40.08-34.77 63.36-3.6-0.11-7.18-0.2-10.76-0.28z"/>
+    <path class="st2" d="m799.16 1312.6c29.46-17.44 101.53-18.96 142.6-15.35 35.9 3.16 68.58 19.27 66.99 34.36-2.17 20.65-48.7 28.92-93.63 32.41-36.24 2.81-86.16-0.05-110.81-10.91-21.62-9.52-26.05-28.14-5.15-40.51m-140.01-80.06c27.56-16.23 94.98-17.65 133.41-14.28 33.59 2.95 64.15 17.93 62.67 31.99-2.03 19.23-45.56 26.92-87.59 30.17-33.91 2.61-80.6-0.04-103.67-10.15-20.22-8.88-24.37-26.22-4.82-37.73zm-105.85-78.85c25.73-15.18 88.66-16.51 124.54-13.36 31.35 2.75 59.89 16.77 58.5 29.91-1.89 17.98-42.53 25.17-81.77 28.21-31.65 2.44-75.24-0.04-96.77-9.49-18.89-8.3-22.75-24.51-4.5-35.27zm-74.48-70.66c22.03-12.82 72.25-14.84 102.96-12.18 26.84 2.32 51.63 14.21 50.08 25.26-1.62 11.58-33.21 21.71-66.8 24.27-27.1 2.06-67.61-0.48-86.04-8.47-16.17-7-15.83-19.79-0.2-28.88zm87.42-60.09c21.5-8.54 72.25-13.17 102.96-10.81 26.84 2.07 49.49 12.61 47.95 22.42-1.62 10.28-36.41 18.79-64.67 21.54-27.01 2.62-61.21-0.43-79.64-7.51-16.18-6.22-23.1-19.09-6.6-25.64z"/>
+    <path class="st11" d="m1066.1 251.38c-10.84 4.54-16.87 1.08-10.39-11.33 6.02-11.52 8.86-44.8-7.79-61.02-70.71-68.92-28.22-123.68 42.92-170.33 37.55-24.62 89.14 6.2 48.25 52.34-34.01 38.37-56.9 47.24-27.86 83.62 38.32 48.01-1.93 88.63-45.13 106.72"/>
+    <path class="st2" d="m324.93 300.72c74.97-0.5 149.94-1.01 224.91-1.51 24.09-40.22-22.08-70.98-59.62-47.55-9.99-68.74-104.98-46.73-102.64 0.76-35.98-17.87-74.97 9.55-62.65 48.3"/>
+    <path class="st2" d="m534.75 124.86c91.07 0.5 182.14 1.01 273.21 1.51 32.15-49.04-40.2-85.55-72.45-51.32 6.29-83.02-127.8-89.06-128.31 2.26-31.7-21.13-81.51-2.26-72.45 47.55"/>
+    <path class="st5" d="m1208 1298.6c-1.09 12.12-2.18 24.25-3.27 36.37-7.27 4.49-23.03 6.54-21.82 13.46 0.98 5.62 6.28 3.96 17.09-1.09-1.58 5.45-8.06 13.46-4.94 15.51 6.69 4.39 13.99-6.85 15.12-18.06 10.2 3.14 13.65 3.97 16.54-1.24 1.36-2.45-0.09-6.34-10.36-7.49 2.06-15.52 4.12-31.03 6.18-46.55-4.84 3.03-9.69 6.06-14.54 9.09m-43.64 1.09c-1.67 12.04-3.67 24.02-11.64 34.91 8.21 3.15 9.11 6.43 8 9.87-2.19 6.78-12.85-0.53-19.28-1.87-8.61 5.1-17.8 12.08-22.63 9.12-2.95-1.81-1.16-5.41 8.81-10.57-7.72-1.78-9.87-3.47-9.09-7.27 1.02-4.97 16.52-3.7 25.09-3.64 4.08-11.64 5.23-23.28 6.91-34.91 4.62 1.45 9.22 2.91 13.83 4.36zm-79.65-120.02c-28.43 19.19-29.04-27.19-8.73-37.82-7.66-0.71-16.61-0.91-23.58-1.9-4.16-0.59-4.2-2.11-3.01-5.04 3.02-7.43 10.34-10.67 16.78-14.16-8.48-17.34-0.61-28.85 11.64-25.82-5.56-16.92 11-25.16 21.82-16 4.61-18.43 40.85-7.76 19.28 32l-1.09 61.1c-9.59 4.25-15.17 3.4-33.11 7.64z"/>
+    <path class="st2" d="m1100.7 1124.3c3.42 0 6.18 2.77 6.18 6.18s-2.77 6.18-6.18 6.18-6.18-2.77-6.18-6.18c-0.01-3.41 2.76-6.18 6.18-6.18m-23.2 4.46c-2.6-13.1 7.62-25.14 19.87-28.62 17.02-4.84 32.93 7.97 39.53 23.06 16.37 37.42 69.2 87.31 119.98 11.96 16.87-25.03 43.01-0.23 25.43 21.84 18.48-7.65 35.87 6.16 11.81 34.87 12.12 8.96 7.2 34.48-17.53 47.56-1.99 48.91-54.29 73.47-100.16 71.43-32.88-1.46-74.2-24.37-90.23-54.55-16.29-30.63-0.89-88.19-8.7-127.55z"/>
+    <path class="st8" d="m1134 1217.5c-1.1-5.73 4.25-7.68 5.27-2.77 8.46 40.74 51.85 50.18 67.65 30.22-6.28-2.59-3.53-8.77 1.66-7.21 22.82 6.85 37.38-17.61 20.24-24.95-6.44-2.76-2.09-7.31 3.05-6.1 22.19 5.23 12.57 43.02-15.25 38.26-18.41 28.96-72.77 23.63-82.62-27.45"/>
+    <path class="st12" d="m1062.3 898.7-0.19-44.54-41.07 0.2c-0.09 13.85-0.22 30.37-0.31 44.03 13.73-0.06 27.63 0.07 41.57 0.31m55.16-44.81-37.81 0.19 0.39 44.98c12.69 0.28 25.35 0.62 37.86 0.95-0.17-13.73-0.29-31.15-0.44-46.12zm-38.39-67.28 0.42 48.55 37.73-0.37c-0.02-1.28-0.04-2.49-0.07-3.62-0.01-16.46-13.96-40.05-38.08-44.56zm-57.92 49.12 40.88-0.41-0.21-48.78c-25.84 4.16-40.31 25.91-40.67 49.19zm-21.02 62.92c-3.15 0.07-5.11 4.79-5.14 7.93l-0.09 9.8c-0.03 3.19 3.34 6.99 6.53 7 45.36 0.17 93.14 0.17 138.52 0.56 3.33 0.03 3.86-4.23 3.83-7.56l-0.09-9.9c-0.03-3.48-1.95-5.89-5.42-5.97l-1.76-0.04c-0.52-24.29-1.05-47.2-1.57-71.77 0-25.14-23.83-62.5-64.28-62-42.99 0.53-69.43 34.67-69.43 70.28-0.08 22.81-0.17 40.28-0.25 61.64l-0.85 0.03z"/>
+  </svg>
+    </div>
+    
+    <!-- Content - Right side -->
+    <div class="content">
+        <h1 class="main-title">{main_title}</h1>
+        <p class="subtitle">{subtitle}</p>
+    </div>
+</body>
+</html>'''
+    
+    return html_code
+
+def generate_section_header_slide_10(
+    main_title="Main Title Here",
+    subtitle="You can enter a subtitle here if you need it",
+    bg_color="#9BD89B",
+    notebook_bg="#FFFFFF",
+    title_color="#A84A3A",
+    subtitle_color="#5A5A5A",
+    sticky_note_colors=["#FFD966", "#FFB3B3"],
+    custom_css=""
+):
+    """
+    Generate a notebook-style overview slide with spiral binding and bookmark sticky notes.
+    
+    Parameters:
+    - main_title: Main title text (default: "Main Title Here")
+    - subtitle: Subtitle text displayed below the main title (default: "You can enter a subtitle here if you need it")
+    - bg_color: Background color of the slide (default: "#9BD89B" - light green)
+    - notebook_bg: Notebook paper background color (default: "#FFFFFF" - white)
+    - title_color: Color of the main title text (default: "#A84A3A" - brown/red)
+    - subtitle_color: Color of the subtitle text (default: "#5A5A5A" - gray)
+    - sticky_note_colors: List of colors for bookmark sticky notes (default: ["#FFD966", "#FFB3B3"] - yellow and pink)
+    - custom_css: Additional custom CSS to inject into the style block (default: "")
+    
+    Returns:
+    - Complete HTML string for the slide
+    """
+    
+    if isinstance(main_title, list):
+        main_title = main_title[0]
+    if isinstance(subtitle, list):
+        subtitle = subtitle[0]
+    
+    # Generate sticky notes (always show)
+    sticky_notes_html = ""
+    if len(sticky_note_colors) >= 2:
+        sticky_notes_html = f"""
+        <div class="sticky-notes">
+            <div class="sticky-note" style="background: {sticky_note_colors[0]};"></div>
+            <div class="sticky-note" style="background: {sticky_note_colors[1]};"></div>
+        </div>
+        """
+    
+    html_code = f"""
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>{main_title} - Slide</title>
+        <link href="https://fonts.googleapis.com/css2?family=Roboto:wght@400;500;700;900&family=Noto+Sans:wght@400;500;700&display=swap" rel="stylesheet">
+        <style>
+            * {{
+                margin: 0;
+                padding: 0;
+                box-sizing: border-box;
+            }}
+            
+            body {{
+                margin: 0;
+                padding: 0;
+                font-family: 'Roboto', 'Noto Sans', sans-serif;
+                overflow: hidden;
+            }}
+            
+            .slide-container {{
+                width: 1920px;
+                height: 1080px;
+                background: {bg_color};
+                position: relative;
+                display: flex;
+                justify-content: center;
+                align-items: center;
+            }}
+            
+            .notebook {{
+                width: 1400px;
+                height: 700px;
+                background: {notebook_bg};
+                border-radius: 0 15px 15px 0;
+                box-shadow: 0 20px 60px rgba(0,0,0,0.3);
+                position: relative;
+                display: flex;
+                flex-direction: column;
+                align-items: center;
+                justify-content: center;
+                padding: 60px 100px 60px 140px;
+                background-image: 
+                    repeating-linear-gradient(
+                        to bottom,
+                        transparent 0px,
+                        transparent 39px,
+                        rgba(180, 180, 180, 0.25) 39px,
+                        rgba(180, 180, 180, 0.25) 40px
+                    ),
+                    linear-gradient(
+                        to right,
+                        transparent 0px,
+                        transparent 89px,
+                        rgba(255, 100, 100, 0.4) 89px,
+                        rgba(255, 100, 100, 0.4) 92px,
+                        transparent 92px
+                    );
+            }}
+            
+            .spiral-binding {{
+                position: absolute;
+                left: 15px;
+                top: 40px;
+                bottom: 40px;
+                width: 60px;
+                display: flex;
+                flex-direction: column;
+                justify-content: space-around;
+                align-items: center;
+                z-index: 10;
+            }}
+            
+            .spiral-ring {{
+                width: 35px;
+                height: 45px;
+                border: 5px solid #2a2a2a;
+                border-radius: 50%;
+                background: linear-gradient(to right, rgba(0,0,0,0.1) 0%, transparent 50%, rgba(255,255,255,0.3) 100%);
+                box-shadow: inset -2px 0 4px rgba(0,0,0,0.3), inset 2px 0 4px rgba(255,255,255,0.3);
+            }}
+            
+            .sticky-notes {{
+                position: absolute;
+                top: -50px;
+                right: 200px;
+                display: flex;
+                flex-direction: row;
+                gap: 30px;
+                z-index: 5;
+            }}
+            
+            .sticky-note {{
+                width: 180px;
+                height: 100px;
+                border-radius: 3px;
+                box-shadow: 0 6px 15px rgba(0,0,0,0.2);
+                position: relative;
+            }}
+            
+            .sticky-note::before {{
+                content: '';
+                position: absolute;
+                top: -10px;
+                left: 50%;
+                transform: translateX(-50%);
+                width: 60px;
+                height: 20px;
+                background: rgba(255, 255, 255, 0.4);
+                border-radius: 2px;
+            }}
+            
+            .section-number {{
+                font-size: 4rem;
+                font-weight: 900;
+                color: #4A4A4A;
+                font-family: 'Roboto', 'Noto Sans', sans-serif;
+            }}
+            
+            .main-title {{
+                font-size: 4rem;
+                font-weight: 900;
+                color: {title_color};
+                text-align: center;
+                margin-bottom: 50px;
+                font-family: 'Roboto', 'Noto Sans', sans-serif;
+                letter-spacing: 1px;
+                width: 100%;
+                max-width: 1200px;
+                z-index: 3;
+            }}
+            
+            .subtitle {{
+                font-size: 2rem;
+                font-weight: 400;
+                color: {subtitle_color};
+                text-align: center;
+                line-height: 1.6;
+                font-family: 'Noto Sans', 'Roboto', sans-serif;
+                width: 100%;
+                max-width: 1200px;
+                z-index: 3;
+            }}
+            
+            {custom_css}
+        </style>
+    </head>
+    <body>
+        <div class="slide-container">
+            <div class="notebook">
+                <div class="spiral-binding">
+                    <div class="spiral-ring"></div>
+                    <div class="spiral-ring"></div>
+                    <div class="spiral-ring"></div>
+                    <div class="spiral-ring"></div>
+                    <div class="spiral-ring"></div>
+                    <div class="spiral-ring"></div>
+                    <div class="spiral-ring"></div>
+                    <div class="spiral-ring"></div>
+                    <div class="spiral-ring"></div>
+                    <div class="spiral-ring"></div>
+                </div>
+                
+                {sticky_notes_html}
+                
+                <div class="main-title">{main_title}</div>
+                <div class="subtitle">{subtitle}</div>
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+    
+    return html_code
+
+def generate_section_header_slide_12(
+    main_title="What is <br> artificial intelligence?",
+    bg_color="#f5f5f5",
+    title_color="#2d3748",
+    custom_css=""
+):
+    """
+    Generate a minimal question slide with geometric background icons.
+    
+    Parameters:
+    - main_title: Main title text
+    - bg_color: Background color
+    - title_color: Color of the main question/title text
+    - custom_css: Additional custom CSS
+    
+    Returns:
+    - HTML string
+    """
+    
+    # Section number removed; always render the decorative arrow SVG
+
+    # Wrap arrow and question in visible, positioned block containers so the
+    # converter can detect them as separate elements.
+    question_block_html = f'<div class="block question-block" style="position:absolute; top:320px; left:120px; width:1680px;"><div class="question">{main_title}</div></div>'
+    
+    # SVG decoration - wrapped in container for converter recognition
+    svg_decoration_html = '''<div class="svg-decoration">
+        <svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" viewBox="0 0 349.98 404.85" width="100%" height="100%" preserveAspectRatio="xMidYMid meet">
+            <path d="m21.673 387.4c4.5311 3.232 17.093-3.7092 49.835-92.884 33.132-99.223 24.842-98.113 25.195-101.22" fill="none" stroke="#000" stroke-width="7.5808"/>
+            <path d="m9.3338 385.21c-5.5634-0.15978-12.914-8.7261 11.535-105.52 20.728-67.241 34.065-95.705 42.635-100.65" fill="none" stroke="#000" stroke-width="7.5808"/>
+            <path d="m61.099 188.17c-10.657-2.6855-5.8822-19.804 4.5119-19.243" fill="none" stroke="#000" stroke-width="7.5808"/>
+            <path d="m62.697 183.18c-22.413 35.084-56.478 144.18-54.97 197.09-0.60276 2.2927 16.176 7.2052 17.088 5.5113 30.438-42.974 65.799-150.21 70.849-192.18-16.275-10.679-32.967-10.426-32.967-10.426z" fill="#8c9fbd" fill-rule="evenodd" stroke="#000" stroke-width=".75808"/>
+            <path d="m95.724 198.47c7.003 1.0866 14.704-8.1263 6.0323-18.638" fill="none" stroke="#000" stroke-width="7.5808"/>
+            <path d="m60.643 170.62c0.41893-30.713 20.418-81.326 23.13-89.395s34.271-83.326 54.962-77.064 15.761 49.195-4.0546 109.54-31.179 70.414-31.179 70.414" fill="none" stroke="#000" stroke-width="7.5808"/>
+            <path d="m138.33 8.0324c-26.672-7.7494-73.214 116.23-74.078 162.46-1.6226 6.4141 8.773 5.6941 19.431 8.4432 10.951 2.8473 16.689 9.4584 18.172 3.5716 26.955-44.869 64.655-165.41 36.475-174.48z" fill="#8c9fbd" fill-rule="evenodd" stroke="#000" stroke-width=".75808"/>
+            <path d="m59.342 177.84c-3.0174 10.06 8.254 6.7068 19.528 9.8798s20.139 10.726 22.553 3.5391-8.9971-15.837-18.174-17.69-21.447-4.1303-23.907 4.2715z" fill="#fae472" fill-rule="evenodd" stroke="#000" stroke-width="3.7904"/>
+            <path d="m16.687 365.96c14.006-84.171 34.011-136.85 41.926-156.3 7.2339-20.325-10.548 53.861-14.186 64.687l-27.74 91.613z" fill="#fff" fill-opacity=".54167" fill-rule="evenodd"/>
+            <path d="m73.835 167.51c10.3-61.664 30.716-108.86 36.591-116.65s-2.9963 28.3-2.9963 28.3l-33.595 88.354z" fill="#fff" fill-opacity=".54167" fill-rule="evenodd"/>
+            <path d="m299.95 263.47c-2.5923-0.21458-5.2364-0.12238-7.8339-0.15105-20.089-0.35718-40.131-0.33793-60.223 0.14397-39.199 1.1043-79.194 2.0061-117.79 9.5691-1.3237 0.30448-9.4849 1.2978-10.201 3.1465-0.41149 1.0623 2.4222-1.051 2.6412-2.169 0.24313-1.2413-2.5334-3.6461-1.2706-3.5755 12.583 0.70346 26.129 4.7564 38.692 6.487 60.37 8.0202 121.77 11.682 181.68 22.654 70.271 16.203-32.569 30.647-46.417 31.868-44.378 3.3506-91.065 1.0639-134.84 9.6982-0.70183 0.21654 0.06344-5.6501 5.8595-2.8015 11.429 5.617 23.275 10.42 34.919 15.568 9.3567 4.1975 46.284 15.711 41.876 30.768-9.6527 12.142-34.543 10.79-48.474 11.519-17.674 0.76333-35.359 0.81646-53.046 0.90711-7.4686 0.06817-14.967 0.07921-22.397 0.9282-6.0326 0.73547-12.023 1.3194-18.092 1.6709-6.4636 0.36966-12.923 0.89954-19.363 1.5609-5.6366 0.66362-11.24 1.5034-16.906 1.8983-4.4927 0.26851-8.9764 0.65414-13.475 0.82453-4.0933 0.13039-8.1854 0.09711-12.28 0.03899-3.432-0.05008-6.8606-0.15735-10.28 0.2206l-2.5826-10.563c4.4102-0.41538 8.7977-0.3954 13.221-0.33603 3.6548 0.04764 7.3085 0.0822 10.963-0.0244 4.236-0.14708 8.4596-0.49794 12.692-0.72209 5.3906-0.34108 10.721-1.1824 16.086-1.7698 6.783-0.65499 13.579-1.1935 20.381-1.6097 5.6498-0.34735 11.22-0.97668 16.839-1.6301 8.398-0.87682 16.85-0.7782 25.283-0.70632 17.208 0.2056 34.409 0.37522 51.605-0.45325 9.1431-0.54983 18.434-1.1124 27.415-3.0235 0.66456-0.1414 6.4881-2.0766 6.6064-1.5154 1.6398 3.0727-4.8004-5.1582-7.7546-7.0031-8.413-5.2539-17.542-9.3368-26.549-13.442-4.9411-2.1898-71.688-24.188-36.103-30.023 45.252-4.9962 91.151-3.7838 136.54-7.7894 8.3014-0.87416 81.643-4.8198 44.088-15.768-58.6-13.412-120.19-16.717-179.87-22.926-11.232-1.1549-89.41-10.698-31.427-21.082 39.938-6.172 80.689-7.4134 121.01-9.1726 20.313-0.86285 40.616-1.5948 60.944-1.9562 2.5975-0.02866 5.2416 0.06353 7.8339-0.15104v10.892z" fill-opacity=".75"/>
+            <path d="m8.6731 383.7c-3.8858 22.709 2.0327 25.782 14.192 4.3371-5.4783-0.44454-12.119-3.1366-14.192-4.3371z" fill="#929292" fill-rule="evenodd" stroke="#000" stroke-width="4.6243"/>
+        </svg>
+    </div>'''
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Question Slide</title>
+    <link href="https://fonts.googleapis.com/css2?family=Roboto:wght@400;700;900&family=Noto+Sans:wght@400;700&display=swap" rel="stylesheet">
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body {{
+            font-family: 'Roboto', 'Noto Sans', sans-serif;
+            width: 1920px;
+            height: 1080px;
+            background: {bg_color};
+            padding: 300px 120px;
+        }}
+        
+        
+        .question {{
+            font-size: 6rem;
+            font-weight: 700;
+            color: {title_color};
+            line-height: 1.3;
+            background: rgba(255, 255, 255, 0.01);
+            padding: 20px;
+        }}
+        
+        .svg-decoration {{
+            position: absolute;
+            right: 50px;
+            bottom: 50px;
+            width: 500px;
+            height: 680px;
+            z-index: 5;
+        }}
+        
+        {custom_css}
+    </style>
+</head>
+<body>
+    {question_block_html}
+    {svg_decoration_html}
+</body>
+</html>"""
+    
+    return html_code
+
+
+def generate_section_header_slide_15(
+    main_title="This is the title of this section",
+    bg_color="#0f2f1f",
+    text_color="#f8f8f8",
+    blob1_color="rgba(220, 38, 38, 0.5)",
+    blob2_color="rgba(34, 139, 34, 0.5)",
+    blob3_color="rgba(218, 165, 32, 0.4)",
+    custom_css=""
+):
+    """
+    Generate a Christmas-themed section header slide with festive gradient blobs and SVG illustration.
+    Parameters:
+    - main_title: Main title text (italic, bold, white)
+    - bg_color: Background color (default: #0f2f1f - dark evergreen)
+    - text_color: Text color (default: #f8f8f8 - bright white)
+    - blob1_color: First gradient blob color (default: red - rgba(220, 38, 38, 0.5))
+    - blob2_color: Second gradient blob color (default: forest green - rgba(34, 139, 34, 0.5))
+    - blob3_color: Third gradient blob color (default: golden - rgba(218, 165, 32, 0.4))
+    - custom_css: Additional custom CSS rules
+    
+    Returns:
+    - Complete HTML string with embedded Christmas tree SVG illustration
+    """
+    
+    # Always include blobs (static)
+    blobs_html = f"""
+        <div class="gradient-blob blob1"></div>
+        <div class="gradient-blob blob2"></div>
+        <div class="gradient-blob blob3"></div>
+        """
+    
+    # project_name removed
+    
+    # section number removed (not used)
+    
+    html_code = f"""
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>Gradient Colorful Title Slide</title>
+        <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;700;900&display=swap" rel="stylesheet">
+        <style>
+            * {{
+                margin: 0;
+                padding: 0;
+                box-sizing: border-box;
+            }}
+            
+            body {{
+                font-family: 'Inter', sans-serif;
+                background: {bg_color};
+                color: {text_color};
+                overflow: hidden;
+            }}
+            
+            .slide-container {{
+                width: 1920px;
+                height: 1080px;
+                position: relative;
+                overflow: hidden;
+                display: flex;
+                align-items: center;
+                justify-content: space-between;
+            }}
+            
+            /* Gradient Blobs */
+            .gradient-blob {{
+                position: absolute;
+                border-radius: 50%;
+                filter: blur(100px);
+                opacity: 1; /* static visible blobs */
+                z-index: 1;
+            }}
+            
+            .blob1 {{
+                width: 500px;
+                height: 500px;
+                background: {blob1_color};
+                top: 5%;
+                right: 10%;
+            }}
+            
+            .blob2 {{
+                width: 600px;
+                height: 600px;
+                background: {blob2_color};
+                bottom: 5%;
+                right: 15%;
+            }}
+            
+            .blob3 {{
+                width: 450px;
+                height: 450px;
+                background: {blob3_color};
+                bottom: 0%;
+                right: 0%;
+            }}
+            
+            /* Content Area - Left Side */
+            .content {{
+                position: relative;
+                z-index: 10;
+                padding: 100px 60px 100px 120px;
+                width: 65%;
+                display: flex;
+                flex-direction: column;
+                justify-content: center;
+            }}
+            
+            /* SVG Container - Right Side */
+            .svg-container {{
+                position: relative;
+                z-index: 10;
+                width: 45%;
+                height: 100%;
+                display: flex;
+                align-items: center;
+                justify-content: center;
+                padding: 180px 120px 180px 60px;
+            }}
+            
+            .svg-container svg {{
+                max-width: 100%;
+                max-height: 100%;
+                width: auto;
+                height: auto;
+            }}
+            
+            /* Tagline removed */
+            
+            /* Project Name removed */
+            
+            /* Main Title */
+            .main-title {{
+                font-size: 4.5rem;
+                font-weight: 900;
+                font-style: italic;
+                text-align: left;
+                max-width: 900px;
+                line-height: 1.2;
+                margin-bottom: 30px;
+                opacity: 1;
+            }}
+            
+            /* Section Number */
+            /* section-number removed */
+            
+            /* Animations */
+            /* Animations removed - slide is static and converter-friendly */
+            
+            /* Responsive Design */
+            @media (max-width: 1920px) {{
+                .slide-container {{
+                    width: 100vw;
+                    height: 100vh;
+                    transform-origin: top left;
+                }}
+            }}
+            
+            {custom_css}
+        </style>
+    </head>
+    <body>
+        <div class="slide-container">
+            {blobs_html}
+            
+            <div class="content">
+                <div class="main-title">{main_title}</div>
+            </div>
+            
+            <div class="svg-container">
+                <?xml version='1.0' encoding='utf-8'?>
+                <svg xmlns:xlink="http://www.w3.org/1999/xlink" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 572.55 614.16">
+                    <defs>
+                    <linearGradient id="a">
+                        <stop stop-color="#4e9a06" offset="0"/>
+                        <stop stop-color="#73d216" offset="1"/>
+                    </linearGradient>
+                    <linearGradient id="h" x1="170.6" x2="84.474" y1="-70.642" y2="-103.64" gradientTransform="matrix(.52353 .30226 -.30226 .52353 188.6 91.779)" gradientUnits="userSpaceOnUse">
+                        <stop stop-color="#ffd543" offset="0"/>
+                        <stop stop-color="#ffe791" offset="1"/>
+                    </linearGradient>
+                    <linearGradient id="b" x1="258.1" x2="290.29" y1="600.69" y2="603.63" gradientUnits="userSpaceOnUse">
+                        <stop stop-color="#8f5902" offset="0"/>
+                        <stop stop-color="#c17d11" offset="1"/>
+                    </linearGradient>
+                    <linearGradient id="g" x2="0" y1="98.459" y2="247.42" gradientUnits="userSpaceOnUse" xlink:href="#a"/>
+                    <linearGradient id="f" x1="285.07" x2="283.4" y1="205.98" y2="337.65" gradientUnits="userSpaceOnUse" xlink:href="#a"/>
+                    <linearGradient id="e" x1="284.39" x2="286.44" y1="309.82" y2="420.19" gradientUnits="userSpaceOnUse" xlink:href="#a"/>
+                    <linearGradient id="d" x1="292.54" x2="292.53" y1="389.45" y2="492.78" gradientUnits="userSpaceOnUse" xlink:href="#a"/>
+                    <linearGradient id="c" x1="283.03" x2="284.77" y1="453.04" y2="581.74" gradientUnits="userSpaceOnUse" xlink:href="#a"/>
+                    </defs>
+                    <g transform="translate(9.7969 -27.143)">
+                    <path d="m-1.634 620.28c11.293 3.917 22.509 7.1206 33.804 9.5199 11.462 2.4347 23.004 4.0412 34.789 4.7243 11.424 0.66221 23.075 0.45673 35.101-0.70301 11.183-1.0785 22.689-2.9821 34.637-5.7806 13.256-3.8968 25.307-8.6203 36.847-13.372 12.45-5.1265 24.307-10.286 36.441-14.476 12.146-4.1944 24.571-7.4175 38.148-8.6636 10.178-1.5292 20.528-2.4041 30.85-2.3895 10.355 0.0147 20.681 0.92464 30.776 2.9675 10.07 2.0376 19.909 5.2023 29.319 9.7299 9.7669 4.2818 19.642 8.0352 29.782 11.197 9.993 3.1161 20.243 5.6578 30.9 7.5645 10.124 1.8114 20.615 3.0498 31.602 3.6634 10.846 0.3877 21.575 0.58391 32.244 0.6467 10.791 0.0635 21.522-9e-3 32.251-0.15876s21.458-0.37506 32.245-0.61703c10.672-0.23942 21.402-0.49474 32.245-0.70774 7.0535 0.0765-2.4996 2.1618-19.363 3.748-7.088 0.66669-15.468 1.2452-24.449 1.5493-11.863 0.50187-22.837 1.1034-33.591 1.5573-11.193 0.47242-22.147 0.78491-33.616 0.65863-10.56-0.11627-21.556-0.60452-33.575-1.6824-12.472-0.97366-24.118-2.7432-35.247-5.138-11.9-2.5605-23.208-5.8358-34.303-9.6172-11.181-3.8106-22.144-8.1351-33.277-12.76-12.754-3.9386-25.727-5.8349-38.749-6.1338-13.051-0.29947-26.152 1.0056-39.131 3.4676-12.828 2.4331-25.537 5.9962-37.963 10.257-12.527 4.2951-24.766 9.2992-36.548 14.569-10.726 5.3084-21.889 9.1749-33.322 11.891-11.471 2.7254-23.213 4.2929-35.059 4.997-11.766 0.69946-23.633 0.54712-35.436-0.16842-11.877-0.72001-23.689-2.0103-35.267-3.5768-3.487-0.96157-14.1-2.1216-21.982-4.2537-9.1229-2.4679-14.586-6.238-1.1012-12.51" fill="#5a5148" stroke="#000" stroke-linecap="square" stroke-linejoin="round" stroke-width=".033"/>
+                    <path d="m296.53 545.59c-17.378-0.10986-40.543 8.0028-51.25 17.719 0.18786 21.763-2.0564 34-5.9375 48.562 17.982 0.73415 33.744 5.7527 43.719 13.156 12.606-2.7256 24.791-7.7016 37.781-8.4375-1.9069-19.639-2.1312-38.238-2.625-57.125-0.63283-9.8722-9.7976-13.8-21.688-13.875z" fill="#764c02"/>
+                    <path d="m294.65 553.6c-15.774-0.0997-36.803 7.2645-46.522 16.084 0.17052 19.755-1.8667 30.863-5.3897 44.082 16.323 0.66642 30.631 5.2219 39.685 11.942 11.443-2.4742 22.504-6.9911 34.296-7.6591-1.731-17.827-1.9346-34.71-2.3828-51.855-0.57445-8.9614-8.8937-12.527-19.687-12.595z" fill="url(#b)"/>
+                    <path d="m281.99 97.229c-0.72644-0.0183-1.4618 0.035-2.25 0.125-7.6823 1.2992-13.525 14.134-20.469 31.25-4.3538 10.732-9.1505 23.152-15.094 35.438-5.5504 11.473-12.122 22.831-20.281 32.625-5.3597 6.4437-9.965 12.364-14.594 18.281s-9.2653 11.838-14.625 18.281c-10.897 12.064-9.5257 20.469-1.9375 23.594 1.4729 0.60658 3.1645 1.0234 5.0625 1.2188-1.7556 3.5205-3.5511 7.0212-5.4375 10.469-5.2735 9.6379-11.082 18.985-17.406 27.906-6.3517 8.9603-13.234 17.481-20.688 25.5 0.0231 11.468 7.649 16.036 16.625 16.281 0.29079 8e-3 0.5816 9.9e-4 0.875 0-0.48613 1.1076-0.96418 2.2105-1.4688 3.3125-4.6606 10.179-10.158 20.095-16.938 29.375-6.4663 8.8516-14.106 17.146-23.375 24.5-6.2028 9.7807 7.7267 18.83 19.531 17.656-1.4809 2.9554-2.9781 5.8935-4.5625 8.7812-5.0102 9.132-10.638 17.941-17.531 26.375-6.296 7.7034-11.599 11.699-22.531 22.188-7.5783 10.166-4.4191 16.616 3.8438 18.719 2.3324 0.59355 5.0767 0.832 8.0938 0.71875-4.7442 7.5362-9.7859 14.887-15.156 22-6.6832 8.8523-13.862 17.344-21.531 25.344s-15.827 15.508-24.5 22.438c-1.4886 11.444 5.8275 16.976 15.094 18.375 8.8063 1.3292 19.376-1.0764 25.75-5.6562 9.9524-4.1339 20.776-5.0039 31.125-3.0625s20.218 6.6908 28.188 13.781c9.641 5.9993 20.384 7.7556 31.219 7.125 10.804-0.62885 21.699-3.6313 31.656-7.1562 9.1364-1.2666 18.005 0.0979 26.812 2.25 8.7428 2.1362 17.417 5.0572 26.188 6.9375 8.7943 1.8854 17.7 2.7256 26.875 0.71875 7.7577-2.6659 15.305-6.6304 23.125-9.5 7.7669-2.8501 15.803-4.6202 24.531-2.9688 9.71 0.37621 19.254 3.8112 28.812 6 9.5975 2.1977 19.21 3.1392 28.906-1.4688 8.7521-2.687 16.57-8.3739 24.688-12.969 8.1942-4.6382 16.693-8.1635 26.656-6.3125 7.8366 0.72399 15.316 3.4152 22.812 5.875 7.5539 2.4784 15.126 4.722 23.062 4.5312 10.785-2.4641 13.083-8.2773 11.062-14.875-1.76-5.7463-6.7911-12.089-12.406-17.312-9.3126-8.7768-17.955-18.252-25.938-28.25-4.9797-6.237-9.7118-12.673-14.188-19.281 6.8576 1.6755 13.106 1.8692 17.75 0.6875 8.2629-2.1027 11.453-8.5524 3.875-18.719-8.8957-7.095-16.267-14.484-22.562-22.188-6.8932-8.4341-12.521-17.243-17.531-26.375-3.2837-5.9851-6.2855-12.133-9.2188-18.406 2.9593 0.56684 6.1659 0.60825 9.7188-0.1875 15.73-5.2288 1.0718-11.184-14.594-25.719-13.413-14.745-18.289-24.646-21.531-33.156-1.751-4.5956-3.0125-8.8071-4.9062-13.125 0.92771-8e-3 1.8243-0.037 2.7188-0.0937 12.215-0.77533 20.887-6.1075 13.531-15.5-9.2632-8.7123-16.697-16.402-22.938-23.594-8.0615-9.2899-14.131-17.749-19.5-26.5-4.6921-7.648-8.8739-15.589-13.406-24.438 1.0546-0.99194 2.0747-2.0733 3.0312-3.25 4.7872-8.5809 5.1676-21.954-2.3125-28.781-8.9002-9.4869-17.062-19.548-24.469-30.062-7.4631-10.593-14.177-21.659-20.156-33.094-5.9922-11.46-11.217-23.305-15.75-35.406-4.3415-9.017-8.5408-20.976-19.438-21.25z" fill="#4a9106"/>
+                    <path d="m447.29 551.06-2.6498 0.077 0.84793 20.081 1.275-0.077 0.52692-20.081z" fill="#312c29"/>
+                    <path d="m465.67 588.96c0 10.452-8.473 18.925-18.925 18.925s-18.925-8.473-18.925-18.925 8.4729-18.925 18.925-18.925 18.925 8.473 18.925 18.925z" fill="#640000"/>
+                    <path d="m463.08 588.96c0 9.0202-7.3123 16.332-16.332 16.332s-16.332-7.3123-16.332-16.332 7.3123-16.332 16.332-16.332 16.332 7.3123 16.332 16.332z" fill="#cc0001"/>
+                    <path d="m443.17 585.07c-2.7865 1.7001-6.0116 1.4858-7.2035-0.47854s0.10072-4.935 2.8872-6.6351 6.0116-1.4858 7.2035 0.47854-0.10071 4.935-2.8872 6.6351z" fill="#fabdbd"/>
+                    <path d="m446.69 578.06c-0.74528-1.2283-2.1047-1.8669-3.5872-1.9654s-3.1231 0.31939-4.6382 1.2438-2.6392 2.1933-3.2334 3.5589-0.65346 2.8697 0.0918 4.098 2.1131 1.8807 3.5956 1.9792 3.1231-0.3194 4.6382-1.2438 2.6392-2.1933 3.2334-3.5589 0.6451-2.8835-0.10018-4.1118zm-1.2798 0.78085c0.44663 0.73608 0.45216 1.7012 1e-3 2.737s-1.361 2.0955-2.6324 2.8712-2.642 1.1077-3.7666 1.033-1.963-0.53161-2.4097-1.2677-0.45755-1.679-7e-3 -2.7148 1.3748-2.1039 2.6462-2.8796 2.6283-1.0993 3.7529-1.0246 1.9684 0.50943 2.4151 1.2455z" fill="#640000"/>
+                    <g transform="translate(-227.31 66.726)">
+                        <path d="m343.07 490.25-2.6498 0.077 0.84793 20.081 1.275-0.077 0.52692-20.081z" fill="#312c29"/>
+                        <g transform="translate(15.765 11.549)">
+                        <path d="m341.66 511.84c0 8.4271-6.8315 15.259-15.259 15.259s-15.259-6.8315-15.259-15.259 6.8315-15.259 15.259-15.259 15.259 6.8315 15.259 15.259z" fill="#132c51"/>
+                        <path d="m339.57 511.84c0 7.2727-5.8957 13.168-13.168 13.168s-13.168-5.8957-13.168-13.168 5.8957-13.168 13.168-13.168 13.168 5.8957 13.168 13.168z" fill="#3466a5"/>
+                        <path d="m323.52 508.7c-2.2466 1.3707-4.847 1.198-5.808-0.38584s0.0812-3.979 2.3278-5.3497 4.847-1.198 5.808 0.38584-0.0812 3.979-2.3278 5.3497z" fill="#cbdbed"/>
+                        <path d="m326.36 503.05c-0.60089-0.99033-1.697-1.5052-2.8923-1.5846s-2.5181 0.25751-3.7396 1.0028-2.1279 1.7684-2.607 2.8694-0.52686 2.3138 0.074 3.3041 1.7037 1.5163 2.899 1.5958 2.5181-0.25752 3.7396-1.0028 2.1279-1.7684 2.607-2.8694 0.52013-2.3249-0.0808-3.3152zm-1.0319 0.62958c0.36011 0.59348 0.36456 1.3716 8.1e-4 2.2068s-1.0974 1.6895-2.1225 2.315-2.1302 0.89313-3.0369 0.83289-1.5827-0.42862-1.9428-1.0221-0.36891-1.3537-6e-3 -2.1889 1.1084-1.6963 2.1336-2.3217 2.1191-0.88636 3.0258-0.82612 1.5871 0.41074 1.9472 1.0042z" fill="#132c51"/>
+                        </g>
+                    </g>
+                    <path d="m234.77 611.3c-20.091 0-37.849 5.3233-48.625 13.5 11.482-5.5423 27.093-8.9375 44.312-8.9375 18.274 0 34.745 3.8439 46.375 10-7.2747 1.5585-13.925 2.9263-21.219 3.5312-5.3914-0.0532-11.274 0.71769-16.156-2.0625l-5 3.1562c-1.8637 6.8115 32.807 0.28777 36.781-0.65625 7.3226-1.0873 14.417-3.2006 21.531-5.1875 11.355-3.0799 21.274-5.9601 36.094-4.9062 10.691 0.97877 13.748 2.3519 26.031 5.0312-4.1593-2.3778-8.6422-4.1581-13.188-5.6562-6.2167-2.3543-12.865-3.3442-19.5-3.0625-13.507 0.44493-26.107 5.6786-39.156 8.5-10.814-8.0262-28.405-13.25-48.281-13.25z" fill="#5a5148"/>
+                    <path d="m176.28 470.5c-5.5536 0.12641-11.029 1.5392-16.406 3.5625-9.4497 3.5559-18.607 8.973-27.5 12.594-2.2657 0.79991-4.52 1.4724-6.6875 1.9688-3.9939 6.2871-8.1873 12.428-12.625 18.406-6.231 8.3938-12.932 16.445-20.062 24.062-7.1361 7.624-14.716 14.818-22.781 21.469-0.32865 4.1799 0.67039 6.9847 2.5 9.0625 1.9805 2.2491 5.1067 3.7586 8.9062 4.4375 7.5991 1.3578 17.575-0.91267 22.938-4.8438 0.17372-0.13574 0.36246-0.25107 0.5625-0.34375 9.9476-4.2154 20.741-5.1229 31.031-3.1875 10.28 1.9336 20.059 6.7045 28.031 13.812l0.0312 0.0312c8.672 5.4925 18.483 7.0744 28.469 6.4062 9.7065-0.64946 19.576-3.4257 28.781-6.75 0.18285-0.0604 0.37129-0.10224 0.5625-0.125 13.789-1.9503 26.659 2.1338 39.094 5.7188 12.392 3.5729 24.31 6.626 36.531 3.9375 7.1983-2.5492 14.529-6.5383 22.375-9.375 7.3708-2.6648 15.197-4.3142 23.812-2.75v-0.0312c9.8667 0.39001 19.153 3.8117 28.031 5.875s17.106 2.851 25.5-1.2188c0.12117-0.0608 0.24648-0.11306 0.375-0.15625 7.7204-2.4182 15.074-7.8259 23.031-12.406 7.8904-4.542 16.676-8.2614 26.938-6.4062 0.0866 0.0157 0.16322 0.0149 0.25 0.0312 7.5374 0.74857 14.531 3.119 21.281 5.375 7.3026 2.4406 14.319 4.745 21.406 4.6562 4.2007-1.0224 6.5204-2.5225 7.625-4.0312 1.129-1.5422 1.3652-3.2657 0.84375-5.6562-1.0428-4.7811-5.7802-11.342-11.281-16.562l-0.0312-0.0312c-8.7703-8.4328-16.912-17.496-24.438-27.062-5.2098-7.7836-10.48-13.546-15.188-18.844-7.1224-3.3347-14.406-7.2831-21.875-10.094-9.5588-3.597-19.385-5.2891-29.5-1.2188-7.6964 3.7687-14.756 9.9292-22.25 14.781-7.5716 4.9021-15.587 8.4687-25.156 6.875-10.004-3.8845-19.115-9.4835-28.344-14.812-9.825-3.4481-19.192-9.694-29.188-12.156-10.521-2.9092-19.736 0.46041-28.625 5.25-8.7954 4.739-17.272 10.868-26.438 13.75-9.5691 1.5937-17.616-1.9729-25.188-6.875-7.4943-4.8521-14.522-11.013-22.219-14.781-4.4252-1.7808-8.8055-2.4421-13.125-2.3438z" fill="url(#c)"/>
+                    <path d="m157.39 466.22-2.6498 0.077 0.84793 20.081 1.275-0.077 0.52692-20.081z" fill="#312c29"/>
+                    <path d="m175.77 504.13c0 10.452-8.473 18.925-18.925 18.925s-18.925-8.473-18.925-18.925 8.4729-18.925 18.925-18.925 18.925 8.473 18.925 18.925z" fill="#644600"/>
+                    <path d="m173.18 504.13c0 9.0202-7.3123 16.332-16.332 16.332s-16.332-7.3123-16.332-16.332 7.3123-16.332 16.332-16.332 16.332 7.3123 16.332 16.332z" fill="#ffd543"/>
+                    <path d="m153.27 500.23c-2.7865 1.7001-6.0116 1.4858-7.2035-0.47854s0.10072-4.935 2.8872-6.6351 6.0116-1.4858 7.2035 0.47854-0.10071 4.935-2.8872 6.6351z" fill="#fff0b9"/>
+                    <path d="m156.79 493.23c-0.74528-1.2283-2.1047-1.8669-3.5872-1.9654s-3.1231 0.31939-4.6382 1.2438-2.6392 2.1933-3.2334 3.5589-0.65346 2.8697 0.0918 4.098 2.1131 1.8807 3.5956 1.9792 3.1231-0.3194 4.6382-1.2438 2.6392-2.1933 3.2334-3.5589 0.6451-2.8835-0.10018-4.1118zm-1.2798 0.78085c0.44663 0.73608 0.45216 1.7012 1e-3 2.737s-1.361 2.0955-2.6324 2.8712-2.642 1.1077-3.7666 1.033-1.963-0.53161-2.4097-1.2677-0.45755-1.679-7e-3 -2.7148 1.3748-2.1039 2.6462-2.8796 2.6283-1.0993 3.7529-1.0246 1.9684 0.50943 2.4151 1.2455z" fill="#644600"/>
+                    <g transform="translate(-64.884 -9.391)">
+                        <path d="m327.31 478.7-2.6498 0.077 0.84793 20.081 1.275-0.077 0.52692-20.081z" fill="#312c29"/>
+                        <path d="m341.66 511.84c0 8.4271-6.8315 15.259-15.259 15.259s-15.259-6.8315-15.259-15.259 6.8315-15.259 15.259-15.259 15.259 6.8315 15.259 15.259z" fill="#640000"/>
+                        <path d="m339.57 511.84c0 7.2727-5.8957 13.168-13.168 13.168s-13.168-5.8957-13.168-13.168 5.8957-13.168 13.168-13.168 13.168 5.8957 13.168 13.168z" fill="#cc0001"/>
+                        <path d="m323.52 508.7c-2.2466 1.3707-4.847 1.198-5.808-0.38584s0.0812-3.979 2.3278-5.3497 4.847-1.198 5.808 0.38584-0.0812 3.979-2.3278 5.3497z" fill="#fabdbd"/>
+                        <path d="m326.36 503.05c-0.60089-0.99033-1.697-1.5052-2.8923-1.5846s-2.5181 0.25751-3.7396 1.0028-2.1279 1.7684-2.607 2.8694-0.52686 2.3138 0.074 3.3041 1.7037 1.5163 2.899 1.5958 2.5181-0.25752 3.7396-1.0028 2.1279-1.7684 2.607-2.8694 0.52013-2.3249-0.0808-3.3152zm-1.0319 0.62958c0.36011 0.59348 0.36456 1.3716 8.1e-4 2.2068s-1.0974 1.6895-2.1225 2.315-2.1302 0.89313-3.0369 0.83289-1.5827-0.42862-1.9428-1.0221-0.36891-1.3537-6e-3 -2.1889 1.1084-1.6963 2.1336-2.3217 2.1191-0.88636 3.0258-0.82612 1.5871 0.41074 1.9472 1.0042z" fill="#640000"/>
+                    </g>
+                    <path d="m396.24 466.97-2.6498 0.077 0.84793 20.081 1.275-0.077 0.52692-20.081z" fill="#312c29"/>
+                    <path d="m414.62 504.87c0 10.452-8.473 18.925-18.925 18.925s-18.925-8.473-18.925-18.925 8.4729-18.925 18.925-18.925 18.925 8.473 18.925 18.925z" fill="#132c51"/>
+                    <path d="m412.03 504.87c0 9.0202-7.3123 16.332-16.332 16.332s-16.332-7.3123-16.332-16.332 7.3123-16.332 16.332-16.332 16.332 7.3123 16.332 16.332z" fill="#3466a5"/>
+                    <path d="m392.12 500.98c-2.7865 1.7001-6.0116 1.4858-7.2035-0.47854s0.10072-4.935 2.8872-6.6351 6.0116-1.4858 7.2035 0.47854-0.10071 4.935-2.8872 6.6351z" fill="#cbdbed"/>
+                    <path d="m395.64 493.97c-0.74528-1.2283-2.1047-1.8669-3.5872-1.9654s-3.1231 0.31939-4.6382 1.2438-2.6392 2.1933-3.2334 3.5589-0.65346 2.8697 0.0918 4.098 2.1131 1.8807 3.5956 1.9792 3.1231-0.3194 4.6382-1.2438 2.6392-2.1933 3.2334-3.5589 0.6451-2.8835-0.10018-4.1118zm-1.2798 0.78085c0.44663 0.73608 0.45216 1.7012 1e-3 2.737s-1.361 2.0955-2.6324 2.8712-2.642 1.1077-3.7666 1.033-1.963-0.53161-2.4097-1.2677-0.45755-1.679-7e-3 -2.7148 1.3748-2.1039 2.6462-2.8796 2.6283-1.0993 3.7529-1.0246 1.9684 0.50943 2.4151 1.2455z" fill="#132c51"/>
+                    <path d="m291.44 398.97c-8.3242-0.0686-16.564 1.5817-23.75 5.4062-6.4718 4.4844-14.383 5.8398-22.406 5.4375-7.8847-0.39533-15.88-2.4829-22.812-5-11.352-5.298-24.993-7.3757-37.812-4.5-9.2419 1.6235-17.742 4.9811-25.625 8.9688-2.0266 4.1425-4.1026 8.2487-6.3438 12.281-4.785 8.6099-10.186 16.968-16.75 25-6.0002 7.3418-12.984 14.413-21.344 21.188-2.6456 3.6485-3.3792 6.3325-3.25 7.7812 0.13215 1.482 0.72818 2.3246 2.6562 3.2812 3.8305 1.9006 12.825 2.0387 22.562-1.375l0.0625-0.0312c8.1892-3.3619 17.093-8.6558 26.656-12.25 9.5871-3.6031 20.198-5.4349 31-1.0625l0.25 0.125c8.0921 3.9857 14.983 10.105 21.906 14.594 6.847 4.4396 13.348 7.2177 21.125 6 7.9124-2.5782 15.88-8.2591 24.594-12.969 8.7924-4.7523 18.822-8.4503 30.125-5.3438l0.0937 0.0312c10.493 2.6238 19.544 8.7172 28.312 11.812 0.22814 0.0832 0.44787 0.18781 0.65625 0.3125 8.7749 5.0965 17.239 10.26 26.25 13.844 7.7485 1.192 14.211-1.573 21.031-6 6.915-4.4885 13.813-10.608 21.906-14.594 0.0818-0.0447 0.16518-0.0864 0.25-0.125 10.802-4.3724 21.413-2.5406 31 1.0625 9.5635 3.5942 18.467 8.8881 26.656 12.25l0.0625 0.0312c9.7393 3.4143 18.733 3.2698 22.562 1.375 1.9276-0.95372 2.5244-1.7724 2.6562-3.25 0.12893-1.4444-0.60414-4.1324-3.25-7.7812-8.3705-6.7836-15.34-13.862-21.344-21.219-6.5667-8.0457-11.964-16.406-16.75-25.031-3.9425-7.1058-7.4626-14.413-10.875-21.844-6.162-3.128-11.937-6.6268-19.062-5.7812-16.033 4.2928-5.9515 24.794-23.812 26.906-10.478-1.3537-19.959-4.7401-29.094-8.7812-9.3343-4.1294-18.31-8.9482-27.625-12.938-7.884-4.2512-17.35-7.0585-26.906-7.6875-1.1893-0.0783-2.3733-0.1152-3.5625-0.125z" fill="url(#d)"/>
+                    <g transform="translate(-143.44 -87.131)">
+                        <path d="m327.31 478.7-2.6498 0.077 0.84793 20.081 1.275-0.077 0.52692-20.081z" fill="#312c29"/>
+                        <path d="m341.66 511.84c0 8.4271-6.8315 15.259-15.259 15.259s-15.259-6.8315-15.259-15.259 6.8315-15.259 15.259-15.259 15.259 6.8315 15.259 15.259z" fill="#3b2242"/>
+                        <path d="m339.57 511.84c0 7.2727-5.8957 13.168-13.168 13.168s-13.168-5.8957-13.168-13.168 5.8957-13.168 13.168-13.168 13.168 5.8957 13.168 13.168z" fill="#75507b"/>
+                        <path d="m323.52 508.7c-2.2466 1.3707-4.847 1.198-5.808-0.38584s0.0812-3.979 2.3278-5.3497 4.847-1.198 5.808 0.38584-0.0812 3.979-2.3278 5.3497z" fill="#e4d4e2"/>
+                        <path d="m326.36 503.05c-0.60089-0.99033-1.697-1.5052-2.8923-1.5846s-2.5181 0.25751-3.7396 1.0028-2.1279 1.7684-2.607 2.8694-0.52686 2.3138 0.074 3.3041 1.7037 1.5163 2.899 1.5958 2.5181-0.25752 3.7396-1.0028 2.1279-1.7684 2.607-2.8694 0.52013-2.3249-0.0808-3.3152zm-1.0319 0.62958c0.36011 0.59348 0.36456 1.3716 8.1e-4 2.2068s-1.0974 1.6895-2.1225 2.315-2.1302 0.89313-3.0369 0.83289-1.5827-0.42862-1.9428-1.0221-0.36891-1.3537-6e-3 -2.1889 1.1084-1.6963 2.1336-2.3217 2.1191-0.88636 3.0258-0.82612 1.5871 0.41074 1.9472 1.0042z" fill="#3b2242"/>
+                    </g>
+                    <g transform="translate(-13.882 -88.1)">
+                        <path d="m327.31 478.7-2.6498 0.077 0.84793 20.081 1.275-0.077 0.52692-20.081z" fill="#312c29"/>
+                        <path d="m341.66 511.84c0 8.4271-6.8315 15.259-15.259 15.259s-15.259-6.8315-15.259-15.259 6.8315-15.259 15.259-15.259 15.259 6.8315 15.259 15.259z" fill="#644600"/>
+                        <path d="m339.57 511.84c0 7.2727-5.8957 13.168-13.168 13.168s-13.168-5.8957-13.168-13.168 5.8957-13.168 13.168-13.168 13.168 5.8957 13.168 13.168z" fill="#ffd543"/>
+                        <path d="m323.52 508.7c-2.2466 1.3707-4.847 1.198-5.808-0.38584s0.0812-3.979 2.3278-5.3497 4.847-1.198 5.808 0.38584-0.0812 3.979-2.3278 5.3497z" fill="#fff0b9"/>
+                        <path d="m326.36 503.05c-0.60089-0.99033-1.697-1.5052-2.8923-1.5846s-2.5181 0.25751-3.7396 1.0028-2.1279 1.7684-2.607 2.8694-0.52686 2.3138 0.074 3.3041 1.7037 1.5163 2.899 1.5958 2.5181-0.25752 3.7396-1.0028 2.1279-1.7684 2.607-2.8694 0.52013-2.3249-0.0808-3.3152zm-1.0319 0.62958c0.36011 0.59348 0.36456 1.3716 8.1e-4 2.2068s-1.0974 1.6895-2.1225 2.315-2.1302 0.89313-3.0369 0.83289-1.5827-0.42862-1.9428-1.0221-0.36891-1.3537-6e-3 -2.1889 1.1084-1.6963 2.1336-2.3217 2.1191-0.88636 3.0258-0.82612 1.5871 0.41074 1.9472 1.0042z" fill="#644600"/>
+                    </g>
+                    <path d="m218.19 320.06c-6.9608-0.15996-14.479 2.2886-23.188 9.2188-4.0591 3.9415-10.431 7.0085-16.938 8.2812-0.73701 1.6921-1.4983 3.3819-2.2812 5.0625-4.4384 9.5269-9.6616 18.819-16.094 27.562-6.1107 8.3067-13.315 16.112-22 23.094-1.0897 1.8291-1.1565 3.2169-0.59375 4.6875 0.58751 1.5354 2.0416 3.2003 4.1562 4.5625 4.1949 2.7022 10.757 3.9284 15.531 2.375 8.9665-4.959 18.927-9.4605 30.062-11.438l0.125-0.0312c12.808-2.8402 26.252-0.76741 37.531 4.4375v-0.0312c6.2977 2.2868 13.481 4.1256 20.438 4.5312 7.3564 0.42898 14.46-0.74332 20.062-4.625 0.0908-0.0573 0.18466-0.10945 0.28125-0.15625 8.3264-4.4314 17.862-5.9851 27.281-5.4062 9.5492 0.58678 18.979 3.3654 26.906 7.5938l0.25 0.125c8.7845 3.7784 17.151 8.1803 25.688 11.969 8.5995 3.8163 17.372 7.01 26.969 8.3125 3.4364-0.46796 5.1311-1.5605 6.375-3.125 1.2871-1.6188 2.103-4.004 2.9062-6.7812s1.6156-5.9095 3.4375-8.8438 4.8347-5.5282 9.2812-6.7188c0.13375-0.0305 0.26952-0.0514 0.40625-0.0625 7.7126-0.91511 13.784 2.7218 19.406 5.5938 5.5955 2.8585 10.688 5.0914 17.656 3.5625 3.1039-1.0746 4.1854-2.163 4.25-2.1875-0.0112-0.0208-0.0122-0.0381-0.0625-0.15625-0.14239-0.33426-0.56795-1.007-1.3125-1.8125-2.9782-3.222-10.378-8.3364-18.031-15.438-0.0541-0.0501-0.10619-0.10219-0.15625-0.15625-5.852-6.4332-10.067-11.979-13.219-16.906-4.9229-7.6965-7.2562-13.862-9.2188-19.375-1.1824-3.3214-2.213-6.3687-3.625-9.4688-4.8042-0.84687-9.5479-2.3128-13.594-4.4375-9.3797-4.7232-19.778-6.2399-29.875-4.9062-10.063 1.3293-19.817 5.4981-27.875 12.094-9.6308 5.4227-20.113 6.5276-30.531 5.25-10.368-1.2713-20.668-4.8956-30.062-9-11.191-4.5568-20.779-12.236-31.125-15.594-2.9829-0.96792-6.0548-1.5835-9.2188-1.6562zm217.91 81.562c0.0204 0.038 0.0201-3e-3 0.0312-0.0312l-0.0312 0.0312z" fill="url(#e)"/>
+                    <path d="m363.52 320.32-2.6498 0.077 0.84793 20.081 1.275-0.077 0.52692-20.081z" fill="#312c29"/>
+                    <path d="m381.9 358.22c0 10.452-8.473 18.925-18.925 18.925s-18.925-8.473-18.925-18.925 8.4729-18.925 18.925-18.925 18.925 8.473 18.925 18.925z" fill="#640000"/>
+                    <path d="m379.31 358.22c0 9.0202-7.3123 16.332-16.332 16.332s-16.332-7.3123-16.332-16.332 7.3123-16.332 16.332-16.332 16.332 7.3123 16.332 16.332z" fill="#cc0001"/>
+                    <path d="m359.4 354.33c-2.7865 1.7001-6.0116 1.4858-7.2035-0.47854s0.10072-4.935 2.8872-6.6351 6.0116-1.4858 7.2035 0.47854-0.10071 4.935-2.8872 6.6351z" fill="#fabdbd"/>
+                    <path d="m362.93 347.32c-0.74528-1.2283-2.1047-1.8669-3.5872-1.9654s-3.1231 0.31939-4.6382 1.2438-2.6392 2.1933-3.2334 3.5589-0.65346 2.8697 0.0918 4.098 2.1131 1.8807 3.5956 1.9792 3.1231-0.3194 4.6382-1.2438 2.6392-2.1933 3.2334-3.5589 0.6451-2.8835-0.10018-4.1118zm-1.2798 0.78085c0.44663 0.73608 0.45216 1.7012 1e-3 2.737s-1.361 2.0955-2.6324 2.8712-2.642 1.1077-3.7666 1.033-1.963-0.53161-2.4097-1.2677-0.45755-1.679-7e-3 -2.7148 1.3748-2.1039 2.6462-2.8796 2.6283-1.0993 3.7529-1.0246 1.9684 0.50943 2.4151 1.2455z" fill="#640000"/>
+                    <g transform="translate(18.729 8.1939)">
+                        <path d="m227.95 312.07-2.6498 0.077 0.84793 20.081 1.275-0.077 0.52692-20.081z" fill="#312c29"/>
+                        <g transform="translate(-99.356 -166.63)">
+                        <path d="m341.66 511.84c0 8.4271-6.8315 15.259-15.259 15.259s-15.259-6.8315-15.259-15.259 6.8315-15.259 15.259-15.259 15.259 6.8315 15.259 15.259z" fill="#132c51"/>
+                        <path d="m339.57 511.84c0 7.2727-5.8957 13.168-13.168 13.168s-13.168-5.8957-13.168-13.168 5.8957-13.168 13.168-13.168 13.168 5.8957 13.168 13.168z" fill="#3466a5"/>
+                        <path d="m323.52 508.7c-2.2466 1.3707-4.847 1.198-5.808-0.38584s0.0812-3.979 2.3278-5.3497 4.847-1.198 5.808 0.38584-0.0812 3.979-2.3278 5.3497z" fill="#cbdbed"/>
+                        <path d="m326.36 503.05c-0.60089-0.99033-1.697-1.5052-2.8923-1.5846s-2.5181 0.25751-3.7396 1.0028-2.1279 1.7684-2.607 2.8694-0.52686 2.3138 0.074 3.3041 1.7037 1.5163 2.899 1.5958 2.5181-0.25752 3.7396-1.0028 2.1279-1.7684 2.607-2.8694 0.52013-2.3249-0.0808-3.3152zm-1.0319 0.62958c0.36011 0.59348 0.36456 1.3716 8.1e-4 2.2068s-1.0974 1.6895-2.1225 2.315-2.1302 0.89313-3.0369 0.83289-1.5827-0.42862-1.9428-1.0221-0.36891-1.3537-6e-3 -2.1889 1.1084-1.6963 2.1336-2.3217 2.1191-0.88636 3.0258-0.82612 1.5871 0.41074 1.9472 1.0042z" fill="#132c51"/>
+                        </g>
+                    </g>
+                    <path d="m247.91 239.62c-0.58222 7e-3 -1.1894 0.0276-1.8125 0.0625-17.37 3.9247-15.054 6.4122-25.844 13.406-6.671 3.1867-12.998 4.793-18.344 5.0312-1.4897 3.6142-2.9729 7.2236-4.8438 10.625-4.8414 8.8023-10.154 17.329-15.938 25.5-5.8025 8.198-12.087 16.034-18.875 23.406 0.17633 4.2185 1.5197 6.9408 3.5938 8.7812 2.2138 1.9644 5.4266 3.0187 9.125 3.1875 7.3969 0.33766 16.502-3.1054 21.156-7.625 0.0496-0.0545 0.10175-0.10666 0.15625-0.15625 12.751-10.147 23.799-10.509 33.531-7.0312s18.355 10.273 27.969 14.188h0.0625c8.5373 3.7299 17.757 6.967 26.938 8.1562 9.4349 1.2223 18.828 0.28137 27.375-4.5312 7.8454-6.3286 17.274-10.31 27.031-11.562 9.7659-1.2536 19.862 0.22652 28.969 4.8125l0.0312 0.0312c8.1562 4.2832 20.096 5.5696 28.031 4 3.9678-0.7848 6.7965-2.3353 7.7812-3.7812 0.49236-0.72298 0.64299-1.3677 0.5-2.3438-0.13993-0.95513-0.68381-2.2881-1.9062-3.875-8.4954-8.0003-15.39-15.106-21.188-21.781-7.4257-8.5502-13.044-16.376-18.031-24.406-3.7916-6.1054-7.2321-12.343-10.75-19.094-1.785 0.74156-3.6111 1.2695-5.4688 1.5625-6.3981 1.0091-13.07-0.71327-18.906-5.5938-5.3029-4.8798-12.861-5.927-21.812-4.8438-6.7945 0.8223-14.394 2.8658-22.406 5.4375-9.9318 0.53226-14.381-2.6963-18.938-5.875-4.1869-2.921-8.4542-5.7985-17.188-5.6875z" fill="url(#f)"/>
+                    <g transform="translate(-30.025 -258.86)">
+                        <path d="m343.07 490.25-2.6498 0.077 0.84793 20.081 1.275-0.077 0.52692-20.081z" fill="#312c29"/>
+                        <path d="m357.42 523.39c0 8.4271-6.8315 15.259-15.259 15.259s-15.259-6.8315-15.259-15.259 6.8315-15.259 15.259-15.259 15.259 6.8315 15.259 15.259z" fill="#3b2242"/>
+                        <path d="m355.33 523.39c0 7.2727-5.8957 13.168-13.168 13.168s-13.168-5.8957-13.168-13.168 5.8957-13.168 13.168-13.168 13.168 5.8957 13.168 13.168z" fill="#75507b"/>
+                        <path d="m339.28 520.25c-2.2466 1.3707-4.847 1.198-5.808-0.38584s0.0812-3.979 2.3278-5.3497 4.847-1.198 5.808 0.38583-0.0812 3.979-2.3278 5.3497z" fill="#e4d4e2"/>
+                        <path d="m342.12 514.6c-0.60089-0.99033-1.697-1.5052-2.8923-1.5846s-2.5181 0.25751-3.7396 1.0028-2.1279 1.7684-2.607 2.8694-0.52686 2.3138 0.074 3.3041 1.7037 1.5163 2.899 1.5958 2.5181-0.25752 3.7396-1.0028 2.1279-1.7684 2.607-2.8694 0.52013-2.3249-0.0808-3.3152zm-1.0319 0.62957c0.36011 0.59348 0.36456 1.3716 8.1e-4 2.2068s-1.0974 1.6895-2.1225 2.315-2.1302 0.89313-3.0369 0.83289-1.5827-0.42862-1.9428-1.0221-0.36891-1.3537-6e-3 -2.1889 1.1084-1.6963 2.1336-2.3217 2.1191-0.88636 3.0258-0.82612 1.5871 0.41074 1.9472 1.0042z" fill="#3b2242"/>
+                    </g>
+                    <g transform="translate(-128.66 -248.01)">
+                        <path d="m343.07 490.25-2.6498 0.077 0.84793 20.081 1.275-0.077 0.52692-20.081z" fill="#312c29"/>
+                        <path d="m357.42 523.39c0 8.4271-6.8315 15.259-15.259 15.259s-15.259-6.8315-15.259-15.259 6.8315-15.259 15.259-15.259 15.259 6.8315 15.259 15.259z" fill="#640000"/>
+                        <path d="m355.33 523.39c0 7.2727-5.8957 13.168-13.168 13.168s-13.168-5.8957-13.168-13.168 5.8957-13.168 13.168-13.168 13.168 5.8957 13.168 13.168z" fill="#cc0001"/>
+                        <path d="m339.28 520.25c-2.2466 1.3707-4.847 1.198-5.808-0.38584s0.0812-3.979 2.3278-5.3497 4.847-1.198 5.808 0.38583-0.0812 3.979-2.3278 5.3497z" fill="#fabdbd"/>
+                        <path d="m342.12 514.6c-0.60089-0.99033-1.697-1.5052-2.8923-1.5846s-2.5181 0.25751-3.7396 1.0028-2.1279 1.7684-2.607 2.8694-0.52686 2.3138 0.074 3.3041 1.7037 1.5163 2.899 1.5958 2.5181-0.25752 3.7396-1.0028 2.1279-1.7684 2.607-2.8694 0.52013-2.3249-0.0808-3.3152zm-1.0319 0.62957c0.36011 0.59348 0.36456 1.3716 8.1e-4 2.2068s-1.0974 1.6895-2.1225 2.315-2.1302 0.89313-3.0369 0.83289-1.5827-0.42862-1.9428-1.0221-0.36891-1.3537-6e-3 -2.1889 1.1084-1.6963 2.1336-2.3217 2.1191-0.88636 3.0258-0.82612 1.5871 0.41074 1.9472 1.0042z" fill="#640000"/>
+                    </g>
+                    <path d="m281.18 112.61c-2.7981 0.44781-5.8974 3.4938-9.0938 8.9688s-6.4491 13.076-10.094 21.656c-3.7659 8.8655-7.9663 18.772-13.131 28.53-4.8321 9.1305-10.508 18.132-17.463 26.032-4.8852 5.558-9.1147 10.671-13.358 15.798-4.2199 5.099-8.4539 10.213-13.36 15.796l-0.0625 0.0625c-4.3276 4.5339-6.2253 8.3322-6.5625 10.938s0.48765 4.1052 2.5625 5.375c4.1375 2.5322 13.99 2.4716 24.906-2.4375 4.6514-2.8732 6.4747-4.8298 9.375-6.6875 2.9349-1.8799 6.7095-3.3433 14.75-5.0625 0.10242-0.0288 0.20689-0.0496 0.3125-0.0625 9.6403-0.51057 14.623 2.5556 18.75 5.2812 4.1041 2.7103 7.3901 5.0552 15.812 4.6562 8.402-2.5392 16.359-4.5487 23.469-4.9688 7.1752-0.42387 13.633 0.80691 18.438 4.9375 7e-3 6e-3 0.0241-6e-3 0.0312 0l0.0625 0.0625c9.6403 7.5565 21.546 5.4483 29.625-3.8125 1.9079-3.3054 3.0054-7.6204 2.8125-11.688-0.19558-4.1244-1.6389-7.8768-4.5312-10.375-0.0328-0.0405-0.064-0.0822-0.0937-0.125-8.1293-8.2002-15.579-16.882-22.359-25.96-6.882-9.2138-13.075-18.836-18.592-28.78-5.5649-10.03-10.442-20.387-14.642-30.979l-0.0625-0.15625c-2.138-4.2183-4.1679-8.8732-6.8438-12.188-2.6825-3.3225-5.6705-5.3096-10.656-4.8125" fill="url(#g)"/>
+                    <path d="m322.54 153.14c-8.9 5.609-28.42-19.477-38.917-20.171s-33.147 21.607-41.232 14.876 9.7416-33.048 7.1574-43.245-30.792-24.848-26.889-34.617 34.44-0.94741 43.34-6.5565 14.117-36.964 24.614-36.27 11.544 32.462 19.628 39.193 39.517 2.0033 42.101 12.201-27.306 21.01-31.209 30.779 10.306 38.202 1.4062 43.811z" fill="#a07d00"/>
+                    <path d="m316.42 142.55c-7.309 4.6063-23.339-15.995-31.96-16.565s-27.222 17.744-33.861 12.216 8.0002-27.14 5.8779-35.514-25.288-20.406-22.082-28.429 28.284-0.77805 35.593-5.3844 11.593-30.356 20.214-29.786 9.4801 26.659 16.12 32.187 32.453 1.6452 34.575 10.02-22.425 17.254-25.63 25.277 8.4638 31.373 1.1548 35.979z" fill="url(#h)"/>
+                    </g>
+                </svg>
+                
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+    
+    return html_code
+
+def generate_section_header_slide_17(
+    section_title="PROJECT SCHEDULE",
+    section_subtitle="You could enter a subtitle here if you need it",
+    bg_color="#f5f3ed",
+    title_color="#d4af6a",
+    subtitle_color="#7a8288",
+    circle_left_color="#e8b558",
+    circle_right_color="#d9653b",
+    bar_color="#6b7f82"
+):
+    """
+    Generate a section header slide with centered title, subtitle, decorative circles at corners, and horizontal bars.
+    
+    Parameters:
+    - section_title: Section title text in uppercase
+    - section_subtitle: Section subtitle text below main title
+    - bg_color: Background color
+    - title_color: Color for main title
+    - subtitle_color: Color for subtitle text
+    - circle_left_color: Color for top-left corner circle
+    - circle_right_color: Color for bottom-right corner circle
+    - bar_color: Color for horizontal decorative bars
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Project Schedule Slide</title>
+    <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@400;700;800&display=swap" rel="stylesheet">
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body {{
+            font-family: 'Montserrat', sans-serif;
+            background-color: {bg_color};
+            overflow: hidden;
+        }}
+        
+        .slide-wrapper {{
+            width: 100vw;
+            height: 100vh;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+        }}
+        
+        .slide-container {{
+            width: 1920px;
+            height: 1080px;
+            background-color: {bg_color};
+            position: relative;
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+            justify-content: center;
+            overflow: hidden;
+        }}
+        
+        /* Decorative circles */
+        .circle-left {{
+            position: absolute;
+            width: 550px;
+            height: 550px;
+            border-radius: 50%;
+            background-color: {circle_left_color};
+            top: -275px;
+            left: -275px;
+        }}
+        
+        .circle-right {{
+            position: absolute;
+            width: 550px;
+            height: 550px;
+            border-radius: 50%;
+            background-color: {circle_right_color};
+            bottom: -275px;
+            right: -275px;
+        }}
+        
+        /* Horizontal bars */
+        .bar-top {{
+            position: absolute;
+            width: 780px;
+            height: 35px;
+            background-color: {bar_color};
+            top: 85px;
+            right: 0;
+        }}
+        
+        .bar-bottom {{
+            position: absolute;
+            width: 780px;
+            height: 35px;
+            background-color: {bar_color};
+            bottom: 200px;
+            left: 115px;
+        }}
+        
+        /* Content */
+        .content {{
+            position: relative;
+            z-index: 10;
+            text-align: center;
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+            gap: 20px;
+        }}
+        
+        .main-title {{
+            font-size: 110px;
+            font-weight: 700;
+            color: {title_color};
+            letter-spacing: 8px;
+            line-height: 1.1;
+            margin-bottom: 20px;
+            text-transform: uppercase;
+        }}
+        
+        .subtitle {{
+            font-size: 42px;
+            font-weight: 400;
+            color: {subtitle_color};
+            max-width: 1100px;
+            line-height: 1.4;
+        }}
+    </style>
+</head>
+<body>
+    <div class="slide-wrapper">
+        <div class="slide-container">
+            <!-- Decorative elements -->
+            <div class="circle-left"></div>
+            <div class="circle-right"></div>
+            <div class="bar-top"></div>
+            <div class="bar-bottom"></div>
+            
+            <!-- Main content -->
+            <div class="content">
+                <div class="main-title">{section_title}</div>
+                <div class="subtitle">{section_subtitle}</div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+    
+    return html_code
+
+def generate_section_header_slide_18(
+    section_title="Main Title Here",
+    section_subtitle="You could enter a subtitle here if you need it",
+    bg_color="#f5f5f0",
+    title_color="#E8B44F",
+    subtitle_color="#666666",
+    circle_blue="#6B9FBD",
+    circle_yellow="#E8B44F",
+    circle_teal="#6FBAAA"
+):
+    """
+    Generate a minimalist section header slide with centered title, subtitle, and decorative circles at corners.
+    
+    Parameters:
+    - section_title: Section title text for the section
+    - section_subtitle: Section subtitle or description text
+    - bg_color: Background color
+    - title_color: Color for the main title text
+    - subtitle_color: Color for the subtitle text
+    - circle_blue: Color for blue decorative circles
+    - circle_yellow: Color for yellow decorative circles
+    - circle_teal: Color for teal decorative circles
+    """
+    
+    html_code = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Section Slide - {section_title}</title>
+    <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@400;700&display=swap" rel="stylesheet">
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        
+        body {{
+            font-family: 'Montserrat', sans-serif;
+            overflow: hidden;
+            width: 1920px;
+            height: 1080px;
+            margin: 0;
+            padding: 0;
+            background-color: {bg_color};
+            position: relative;
+        }}
+        
+        /* Top-left circles - partially visible */
+        .circle-group-top {{
+            position: absolute;
+            top: -60px;
+            left: -60px;
+            display: flex;
+            gap: 10px;
+        }}
+        
+        .circle {{
+            width: 120px;
+            height: 120px;
+            border-radius: 50%;
+        }}
+        
+        .circle-blue {{
+            background-color: {circle_blue};
+        }}
+        
+        .circle-yellow {{
+            background-color: {circle_yellow};
+        }}
+        
+        .circle-teal {{
+            background-color: {circle_teal};
+        }}
+        
+        /* Bottom-right circles - partially visible */
+        .circle-group-bottom {{
+            position: absolute;
+            bottom: -60px;
+            right: -60px;
+            display: flex;
+            gap: 10px;
+        }}
+        
+        /* Content */
+        .content {{
+            position: absolute;
+            top: 50%;
+            left: 50%;
+            transform: translate(-50%, -50%);
+            text-align: center;
+            z-index: 10;
+            max-width: 1400px;
+        }}
+        
+        .main-title {{
+            font-size: 90px;
+            font-weight: 700;
+            color: {title_color};
+            line-height: 1.1;
+            margin-bottom: 30px;
+            letter-spacing: 2px;
+        }}
+        
+        .subtitle {{
+            font-size: 36px;
+            font-weight: 400;
+            color: {subtitle_color};
+            line-height: 1.4;
+        }}
+        
+    </style>
+</head>
+<body>
+            <!-- Top-left decorative circles -->
+            <div class="circle-group-top">
+                <div class="circle circle-blue"></div>
+                <div class="circle circle-yellow"></div>
+                <div class="circle circle-teal"></div>
+            </div>
+            
+            <!-- Bottom-right decorative circles -->
+            <div class="circle-group-bottom">
+                <div class="circle circle-blue"></div>
+                <div class="circle circle-yellow"></div>
+                <div class="circle circle-teal"></div>
+            </div>
+            
+            <!-- Main content -->
+            <div class="content">
+                <h1 class="main-title">{section_title}</h1>
+                <p class="subtitle">{section_subtitle}</p>
+            </div>
+</body>
+</html>"""
+    
+    return html_code
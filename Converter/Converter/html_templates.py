@@ -0,0 +1,218 @@
+"""
+Lớp template biên dịch sẵn cho các hàm `generate_*` của html_lib.
+
+Mỗi generator dựng lại nguyên một f-string vài KB ở mỗi lần gọi (kèm vòng lặp, if/else
+chọn CSS...), trong khi phần lớn nội dung là CSS/markup tĩnh. Ở đây mỗi generator được
+biên dịch một lần thành các đoạn tĩnh + slot động, lần gọi sau chỉ còn một `''.join`.
+
+Tham số được chia hai loại, quyết định bằng AST của hàm:
+  - slot: chỉ xuất hiện dưới dạng `{param}` trần trong f-string (không `!r`, không format
+    spec, không gán lại, không dùng trong biểu thức nào khác) → giá trị chỉ được chèn vào
+    output, nên chèn thẳng vào chỗ của nó là tương đương.
+  - key: mọi tham số còn lại (cờ show_*, list items, số cột...) → ảnh hưởng cấu trúc, nên mỗi
+    tổ hợp giá trị của chúng có một template riêng (LRU, tối đa MAX_TEMPLATES_PER_GENERATOR).
+
+Template được dựng bằng cách gọi hàm gốc với sentinel thay cho các slot, hai lần với hai bộ
+sentinel khác độ dài; nếu hai lần cho phần tĩnh khác nhau hoặc sentinel bị biến đổi thì
+generator đó (với key đó) luôn gọi hàm gốc. Output luôn giống hệt hàm gốc.
+
+    from html_templates import compiled_library
+    lib = compiled_library()
+    html = lib.generate_title_slide(main_title='Báo cáo', subtitle='2026')
+"""
+
+import re
+import ast
+import time
+import inspect
+import textwrap
+import threading
+from collections import OrderedDict
+
+MAX_TEMPLATES_PER_GENERATOR = 64
+# Ký tự Private Use của Unicode: không có trong template nào
+SENTINEL_OPEN = '\ue000'
+SENTINEL_CLOSE = '\ue001'
+SENTINEL_RE = re.compile(SENTINEL_OPEN + r'(\d+)(?::#+)?' + SENTINEL_CLOSE)
+_SIMPLE_TYPES = (str, int, float, bool, type(None))
+_UNCOMPILABLE = object()
+_DEFAULT = object()  # key của tham số không truyền (dùng giá trị mặc định)
+
+
+def _freeze(value):
+    """Giá trị hashable dùng làm key template (list/dict lồng nhau → tuple)."""
+    if type(value) is str:
+        return value
+    if isinstance(value, _SIMPLE_TYPES):
+        # Giữ kiểu để True / 1 / 1.0 (bằng nhau khi hash) không dùng chung template
+        return (type(value), value)
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    if isinstance(value, dict):
+        return (dict, tuple((k, _freeze(v)) for k, v in value.items()))
+    raise TypeError(f'unhashable template argument of type {type(value).__name__}')
+
+
+def slot_params(fn) -> tuple:
+    """Các tham số của fn chỉ được dùng như `{param}` trần trong f-string."""
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(fn)))
+    except (OSError, TypeError, SyntaxError):
+        return ()
+    func = tree.body[0]
+    params = [a.arg for a in func.args.args + func.args.kwonlyargs]
+    direct = set()
+    for node in ast.walk(func):
+        if (isinstance(node, ast.FormattedValue) and node.conversion == -1 and node.format_spec is None
+                and isinstance(node.value, ast.Name)):
+            direct.add(id(node.value))
+    uses = {name: [] for name in params}
+    for node in ast.walk(func):
+        if isinstance(node, ast.Name) and node.id in uses:
+            uses[node.id].append(isinstance(node.ctx, ast.Load) and id(node) in direct)
+    return tuple(name for name in params if uses[name] and all(uses[name]))
+
+
+class _Template:
+    __slots__ = ('render',)
+
+    def __init__(self, statics: list, slots: list):
+        # Sinh một hàm `''.join((s0, format(v['a']), s1, ...))` cho đúng template này
+        names = {f'_s{i}': text for i, text in enumerate(statics)}
+        parts = []
+        for i, slot in enumerate(slots):
+            parts.append(f'_s{i}')
+            parts.append(f'_f(v[{slot!r}])')
+        parts.append(f'_s{len(slots)}')
+        source = f"def render(v):\n    return ''.join(({', '.join(parts)},))\n"
+        namespace = dict(names, _f=format)
+        exec(source, namespace)
+        self.render = namespace['render']
+
+
+def _split(html: str, slots: tuple):
+    """(đoạn tĩnh, tên slot theo thứ tự) của một lần render bằng sentinel."""
+    pieces = SENTINEL_RE.split(html)
+    return pieces[0::2], [slots[int(i)] for i in pieces[1::2]]
+
+
+class CompiledGenerator:
+    """Gọi được như generator gốc (chỉ keyword argument mới đi đường biên dịch)."""
+
+    def __init__(self, fn):
+        self.fn = fn
+        self.__name__ = fn.__name__
+        self.__doc__ = fn.__doc__
+        self.__wrapped__ = fn
+        params = [p for p in inspect.signature(fn).parameters.values()
+                  if p.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)]
+        self.defaults = {p.name: p.default for p in params if p.default is not inspect.Parameter.empty}
+        self.slots = tuple(name for name in slot_params(fn) if name in self.defaults)
+        self.keys = tuple(p.name for p in params if p.name not in self.slots)
+        # Tham số bắt buộc thì không có giá trị mặc định để dựng template
+        self.compiled = len(self.defaults) == len(params)
+        self._templates = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _compile(self, values: dict):
+        first = dict(values, **{name: f'{SENTINEL_OPEN}{i}{SENTINEL_CLOSE}' for i, name in enumerate(self.slots)})
+        second = dict(values, **{name: f'{SENTINEL_OPEN}{i}:{"#" * (i + 3)}{SENTINEL_CLOSE}'
+                                 for i, name in enumerate(self.slots)})
+        try:
+            statics, order = _split(self.fn(**first), self.slots)
+            statics_2, order_2 = _split(self.fn(**second), self.slots)
+        except Exception:
+            return _UNCOMPILABLE
+        if statics != statics_2 or order != order_2 or any(SENTINEL_OPEN in s or SENTINEL_CLOSE in s for s in statics):
+            return _UNCOMPILABLE
+        return _Template(statics, order)
+
+    def __call__(self, *args, **kwargs):
+        if args or not self.compiled:
+            return self.fn(*args, **kwargs)
+        values = self.defaults.copy()
+        values.update(kwargs)
+        if len(values) != len(self.defaults):
+            return self.fn(**kwargs)  # tham số lạ (**kwargs của generator, hoặc sai tên): để hàm gốc xử lý
+        try:
+            key = tuple([_DEFAULT if name not in kwargs else _freeze(kwargs[name]) for name in self.keys])
+        except TypeError:
+            return self.fn(**kwargs)
+
+        template = self._templates.get(key)
+        if template is None:
+            template = self._compile(values)
+            with self._lock:
+                self._templates[key] = template
+                if len(self._templates) > MAX_TEMPLATES_PER_GENERATOR:
+                    self._templates.popitem(last=False)
+        if template is _UNCOMPILABLE:
+            return self.fn(**kwargs)
+        return template.render(values)
+
+    def worthwhile(self, rounds: int = 20, min_speedup: float = 1.2) -> bool:
+        """
+        Template có nhanh hơn hàm gốc rõ rệt không (đo với tham số mặc định). Với generator
+        chỉ có một f-string, CPython đã nối chuỗi gần như tối ưu và phần dispatch ở đây còn
+        làm chậm hơn; lợi ích nằm ở các generator có vòng lặp / dựng chuỗi phụ.
+        """
+        if not self.compiled:
+            return False
+        self()  # dựng template cho bộ tham số mặc định
+        if not self.stats()['templates']:
+            return False
+
+        def best(fn):
+            timings = []
+            for _ in range(5):
+                started = time.perf_counter()
+                for _ in range(rounds):
+                    fn()
+                timings.append(time.perf_counter() - started)
+            return min(timings)
+
+        return best(self.fn) >= best(self) * min_speedup
+
+    def stats(self) -> dict:
+        return {
+            'slots': len(self.slots),
+            'keys': len(self.keys),
+            'templates': sum(1 for t in self._templates.values() if t is not _UNCOMPILABLE),
+        }
+
+
+class CompiledLibrary:
+    """
+    Bọc một module generator: `lib.generate_x` trả về bản biên dịch nếu nó nhanh hơn,
+    ngược lại chính hàm gốc (quyết định lười, một lần mỗi generator).
+    """
+
+    def __init__(self, module):
+        self._module = module
+        self._compiled = {}
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        attr = getattr(self._module, name)
+        if not name.startswith('generate_') or not callable(attr):
+            return attr
+        compiled = self._compiled.get(name)
+        if compiled is None:
+            with self._lock:
+                compiled = self._compiled.get(name)
+                if compiled is None:
+                    compiled = CompiledGenerator(attr)
+                    compiled = self._compiled[name] = compiled if compiled.worthwhile() else attr
+        return compiled
+
+
+_library = None
+
+
+def compiled_library():
+    """CompiledLibrary dùng chung cho html_lib."""
+    global _library
+    if _library is None:
+        import html_lib
+        _library = CompiledLibrary(html_lib)
+    return _library
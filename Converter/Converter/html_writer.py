@@ -0,0 +1,268 @@
+"""
+Chế độ ghi theo luồng cho các hàm `generate_*` của html_lib.
+
+Generator gốc dựng các phần lặp (danh sách bước, lưới item...) bằng `html += f"..."` rồi
+nhúng kết quả vào một f-string lớn và trả về nguyên chuỗi. Ở đây mỗi generator được biến
+đổi (qua AST, một lần, lười) thành một hàm sinh ra từng đoạn HTML:
+
+  - biến tích luỹ `x = ""` / `x += ...` thành list các đoạn (`x.append(...)`), không còn
+    chép lại chuỗi mỗi vòng lặp;
+  - f-string cuối cùng được phát từng phần: đoạn tĩnh, giá trị chèn, và các đoạn của biến
+    tích luỹ — không bao giờ nối thành một chuỗi cả slide.
+
+Output nối lại luôn giống hệt hàm gốc: bản biến đổi được so với hàm gốc (tham số mặc định)
+khi tạo, lệch thì generator đó dùng đường dự phòng `yield fn(**kwargs)`.
+
+    from html_writer import render_to, iter_deck_document
+    with open('slide.html', 'w', encoding='utf-8') as f:
+        render_to(f, 'generate_process_steps_slide', steps=steps)
+    for chunk in iter_deck_document([('generate_title_slide', {}), ...]):
+        sock.sendall(chunk.encode('utf-8'))
+"""
+
+import ast
+import html
+import inspect
+import threading
+
+DEFAULT_BUFFER_CHARS = 16 * 1024
+
+DECK_DOCUMENT_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<title>{title}</title>
+<style>
+@page { size: 1920px 1080px; margin: 0; }
+html, body { margin: 0; padding: 0; }
+.deck-slide { width: 1920px; height: 1080px; overflow: hidden; break-after: page; }
+.deck-slide:last-child { break-after: auto; }
+.deck-slide iframe { width: 1920px; height: 1080px; border: 0; display: block; }
+</style>
+</head>
+<body>
+"""
+DECK_DOCUMENT_TAIL = '</body>\n</html>\n'
+
+
+def _own_nodes(func):
+    """Các node thuộc scope của func (không đi vào hàm/lambda lồng bên trong)."""
+    stack = list(func.body)
+    while stack:
+        node = stack.pop()
+        yield node
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+            stack.extend(ast.iter_child_nodes(node))
+
+
+def _accumulators(func) -> set:
+    """Biến chỉ được khởi tạo bằng một chuỗi hằng rồi nối thêm bằng `+=`."""
+    inits, appends, other_stores = {}, set(), set()
+    for node in _own_nodes(func):
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            name = node.targets[0].id
+            if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str) and name not in inits:
+                inits[name] = node
+            else:
+                other_stores.add(name)
+        elif isinstance(node, ast.AugAssign) and isinstance(node.target, ast.Name):
+            (appends if isinstance(node.op, ast.Add) else other_stores).add(node.target.id)
+        elif isinstance(node, (ast.For, ast.comprehension, ast.With, ast.AnnAssign, ast.Assign)):
+            for target in ast.walk(node.target if hasattr(node, 'target') else node):
+                if isinstance(target, ast.Name) and isinstance(target.ctx, ast.Store):
+                    other_stores.add(target.id)
+    params = {a.arg for a in func.args.args + func.args.kwonlyargs}
+    return {name for name in inits if name in appends and name not in other_stores and name not in params}
+
+
+def _final_fstring(func):
+    """(câu lệnh cần thay, f-string cuối) với dạng `return f"..."` hoặc `html = f"..."; ...; return html`."""
+    body = func.body
+    returns = [node for node in _own_nodes(func) if isinstance(node, ast.Return)]
+    if len(returns) != 1 or body[-1] is not returns[0] or returns[0].value is None:
+        return None
+    value = returns[0].value
+    if isinstance(value, ast.JoinedStr):
+        return returns[0], value
+    if not isinstance(value, ast.Name):
+        return None
+    assigns = [node for node in body if isinstance(node, ast.Assign) and len(node.targets) == 1
+               and isinstance(node.targets[0], ast.Name) and node.targets[0].id == value.id]
+    uses = [node for node in _own_nodes(func) if isinstance(node, ast.Name) and node.id == value.id]
+    # Chỉ gán một lần (bằng f-string) và chỉ được đọc ở câu return
+    if len(assigns) != 1 or len(uses) != 2 or not isinstance(assigns[0].value, ast.JoinedStr):
+        return None
+    return assigns[0], assigns[0].value
+
+
+class _ToChunks(ast.NodeTransformer):
+    def __init__(self, accumulators: set, streamed: set):
+        self.accumulators = accumulators
+        self.streamed = streamed  # id() của các Name được phát trực tiếp bằng `yield from`
+
+    def visit_FunctionDef(self, node):
+        return node  # hàm lồng giữ nguyên
+
+    def visit_Assign(self, node):
+        target = node.targets[0] if len(node.targets) == 1 else None
+        if isinstance(target, ast.Name) and target.id in self.accumulators and isinstance(node.value, ast.Constant):
+            initial = [node.value] if node.value.value else []
+            return ast.copy_location(ast.Assign(targets=node.targets, value=ast.List(elts=initial, ctx=ast.Load())),
+                                     node)
+        return self.generic_visit(node)
+
+    def visit_AugAssign(self, node):
+        if isinstance(node.target, ast.Name) and node.target.id in self.accumulators:
+            call = ast.Call(func=ast.Attribute(value=ast.Name(node.target.id, ast.Load()), attr='append',
+                                               ctx=ast.Load()),
+                            args=[self.visit(node.value)], keywords=[])
+            return ast.copy_location(ast.Expr(call), node)
+        return self.generic_visit(node)
+
+    def visit_Name(self, node):
+        if node.id in self.accumulators and isinstance(node.ctx, ast.Load) and id(node) not in self.streamed:
+            # Dùng ở chỗ khác (if x:, len(x), f-string phụ): nối lại tại chỗ
+            return ast.copy_location(ast.Call(func=ast.Attribute(value=ast.Constant(''), attr='join', ctx=ast.Load()),
+                                              args=[node], keywords=[]), node)
+        return node
+
+
+def _chunk_statements(fstring: ast.JoinedStr, accumulators: set, streamed: set) -> list:
+    statements = []
+    for part in fstring.values:
+        if isinstance(part, ast.Constant):
+            value = ast.Yield(part)
+        elif id(part.value) in streamed:
+            value = ast.YieldFrom(ast.Name(part.value.id, ast.Load()))
+        else:
+            value = ast.Yield(ast.JoinedStr(values=[part]))
+        statements.append(ast.Expr(value))
+    return statements
+
+
+def chunked(fn):
+    """
+    Bản sinh-từng-đoạn của generator `fn` (cùng tham số), hoặc None nếu hàm không có dạng
+    f-string cuối quen thuộc.
+    """
+    try:
+        # Không dedent: textwrap.dedent xoá khoảng trắng của các dòng trống bên trong chuỗi
+        source = inspect.getsource(fn)
+        filename = inspect.getsourcefile(fn)
+    except (OSError, TypeError):
+        return None
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None  # hàm lồng / method (source bị thụt lề)
+    func = tree.body[0]
+    if not isinstance(func, ast.FunctionDef):
+        return None
+    found = _final_fstring(func)
+    if found is None:
+        return None
+    statement, fstring = found
+    accumulators = _accumulators(func)
+    streamed = {id(part.value) for part in fstring.values
+                if isinstance(part, ast.FormattedValue) and part.conversion == -1 and part.format_spec is None
+                and isinstance(part.value, ast.Name) and part.value.id in accumulators}
+
+    transformer = _ToChunks(accumulators, streamed)
+    fstring.values = [transformer.visit(part) if isinstance(part, ast.FormattedValue) else part
+                      for part in fstring.values]
+    chunks = _chunk_statements(fstring, accumulators, streamed)
+    new_body = []
+    for node in func.body:
+        if node is statement:
+            new_body.extend(chunks)
+        elif not isinstance(node, ast.Return):
+            new_body.append(transformer.visit(node))
+    func.body = new_body
+    func.decorator_list = []
+    ast.fix_missing_locations(tree)
+    ast.increment_lineno(tree, fn.__code__.co_firstlineno - 1)
+
+    namespace = dict(fn.__globals__)
+    exec(compile(tree, filename or '<html_writer>', 'exec'), namespace)
+    return namespace[func.name]
+
+
+class _Writers:
+    def __init__(self):
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def get(self, fn):
+        writer = self._cache.get(fn)
+        if writer is None:
+            writer = chunked(fn)
+            try:
+                if writer is None or ''.join(writer()) != fn():
+                    writer = None
+            except Exception:
+                writer = None
+            if writer is None:
+                def writer(*args, _fn=fn, **kwargs):
+                    yield _fn(*args, **kwargs)
+            with self._lock:
+                self._cache[fn] = writer
+        return writer
+
+
+_writers = _Writers()
+
+
+def _resolve(generator):
+    if callable(generator):
+        return getattr(generator, '__wrapped__', generator)
+    import html_lib
+    return getattr(html_lib, generator)
+
+
+def iter_render(generator, *args, **kwargs):
+    """Các đoạn HTML của một slide; `generator` là tên trong html_lib hoặc chính hàm."""
+    fn = _resolve(generator)
+    return _writers.get(fn)(*args, **kwargs)
+
+
+def render_to(sink, generator, *args, buffer_chars: int = DEFAULT_BUFFER_CHARS, encoding: str = None, **kwargs) -> int:
+    """
+    Ghi một slide vào `sink` (file-like có .write, hoặc callable nhận từng đoạn). Các đoạn nhỏ
+    được gom tới `buffer_chars` ký tự trước mỗi lần ghi; với `encoding`, sink nhận bytes.
+    Trả về số ký tự đã ghi.
+    """
+    return write_chunks(sink, iter_render(generator, *args, **kwargs), buffer_chars, encoding)
+
+
+def write_chunks(sink, chunks, buffer_chars: int = DEFAULT_BUFFER_CHARS, encoding: str = None) -> int:
+    """Ghi một dãy đoạn bất kỳ (vd. `iter_deck_document`) vào `sink`, gom như `render_to`."""
+    write = sink if callable(sink) else sink.write
+    pending, size, total = [], 0, 0
+    for chunk in chunks:
+        pending.append(chunk)
+        size += len(chunk)
+        if size >= buffer_chars:
+            data = ''.join(pending)
+            write(data.encode(encoding) if encoding else data)
+            total += size
+            pending, size = [], 0
+    if pending:
+        data = ''.join(pending)
+        write(data.encode(encoding) if encoding else data)
+        total += size
+    return total
+
+
+def iter_deck_document(slides: list, title: str = 'Deck'):
+    """
+    Cả deck thành một document (mỗi slide một `<iframe srcdoc>` 1920x1080, in được thành PDF
+    mỗi slide một trang), phát từng đoạn: slide nào cũng không bị nối thành chuỗi hoàn chỉnh.
+    """
+    yield DECK_DOCUMENT_HEAD.replace('{title}', html.escape(title))
+    for name, kwargs in slides:
+        yield '<div class="deck-slide"><iframe srcdoc="'
+        for chunk in iter_render(name, **(kwargs or {})):
+            # Escape từng ký tự nên escape theo đoạn cho kết quả như escape cả chuỗi
+            yield html.escape(chunk, quote=True)
+        yield '"></iframe></div>\n'
+    yield DECK_DOCUMENT_TAIL
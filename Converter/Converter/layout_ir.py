@@ -0,0 +1,65 @@
+"""
+Layout IR mà converter.js ghi cạnh HTML đã chuyển đổi (`--layout`, `options: {"layout": true}`):
+`<output>.layout.json`. Các tool Python (chấm điểm, thumbnail, export) đọc thẳng hình học của
+element từ đây thay vì mở lại browser và parse HTML.
+
+    {
+      "version": 1,
+      "viewport": {"width": 1920, "height": 1080},
+      "content": {"width": ..., "height": ...},      # kích thước .content-wrapper
+      "background": "...",
+      "container": {"padding": {...}, "borderRadius": "...", "boxShadow": "..."},
+      "elements": [
+        {"tag", "index", "x", "y", "width", "height", "zIndex", "style", "attributes", "content"}, ...
+      ]
+    }
+
+Toạ độ x/y tính từ góc trên-trái của .content-wrapper, giống hệt left/top trong HTML xuất ra;
+element đã được sắp theo thứ tự DOM.
+"""
+
+import os
+import json
+
+LAYOUT_IR_VERSION = 1
+
+
+class LayoutIRError(ValueError):
+    pass
+
+
+def layout_path_for(output_file):
+    """Đường dẫn layout IR đi kèm một file HTML đã chuyển đổi (khớp layoutPathFor trong converter.js)."""
+    root, ext = os.path.splitext(output_file)
+    if ext.lower() not in ('.html', '.htm'):
+        root = output_file
+    return root + '.layout.json'
+
+
+def parse_layout(data):
+    """Kiểm tra version và các trường bắt buộc; nhận dict, str hoặc bytes JSON."""
+    if isinstance(data, (str, bytes)):
+        data = json.loads(data)
+    version = data.get('version')
+    if version != LAYOUT_IR_VERSION:
+        raise LayoutIRError(f"Unsupported layout IR version {version!r} (expected {LAYOUT_IR_VERSION})")
+    if not isinstance(data.get('elements'), list):
+        raise LayoutIRError("Layout IR has no 'elements' list")
+    return data
+
+
+def load_layout(path):
+    """Đọc layout IR từ file .layout.json, hoặc từ file HTML đã chuyển đổi (tìm file IR đi kèm)."""
+    if not path.endswith('.layout.json'):
+        path = layout_path_for(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse_layout(json.load(f))
+
+
+def element_boxes(layout, tags=None):
+    """(tag, x, y, width, height) của các element, lọc theo tập tag nếu có."""
+    return [
+        (el['tag'], el['x'], el['y'], el['width'], el['height'])
+        for el in layout['elements']
+        if tags is None or el['tag'] in tags
+    ]
@@ -0,0 +1,119 @@
+// Uniform-grid spatial index cho các pass hình học của converter.js.
+// File này chạy được cả trong Node (require, dùng cho benchmark) lẫn trong trang
+// (converter.js inject mã nguồn qua page.evaluate → window.__slidegenLayout).
+(function (root) {
+    const TEXT_TAGS = new Set(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'span', 'label', 'button', 'a']);
+    const BOX_TAGS = new Set(['div', 'section', 'article', 'main']);
+
+    // Mỗi item được ghi vào mọi ô mà rect của nó phủ lên; key ô là một số (không tạo string).
+    class SpatialGrid {
+        constructor(cellSize = 128) {
+            this.cellSize = cellSize;
+            this.cells = new Map();
+        }
+
+        static forSlide(width, height, count) {
+            // Khoảng vài item mỗi ô khi phân bố đều; kẹp lại để rect lớn không phủ quá nhiều ô
+            const ideal = Math.sqrt((width * height) / Math.max(1, count)) * 4;
+            return new SpatialGrid(Math.min(256, Math.max(32, ideal)));
+        }
+
+        cellKey(cx, cy) {
+            return (cx + 32768) * 65536 + (cy + 32768);
+        }
+
+        insert(item, x, y, width = 0, height = 0) {
+            const size = this.cellSize;
+            const x0 = Math.floor(x / size), x1 = Math.floor((x + width) / size);
+            const y0 = Math.floor(y / size), y1 = Math.floor((y + height) / size);
+            for (let cx = x0; cx <= x1; cx++) {
+                for (let cy = y0; cy <= y1; cy++) {
+                    const key = this.cellKey(cx, cy);
+                    const bucket = this.cells.get(key);
+                    if (bucket) bucket.push(item);
+                    else this.cells.set(key, [item]);
+                }
+            }
+        }
+
+        // Các item có rect phủ lên ô chứa điểm (x, y); mỗi item xuất hiện tối đa một lần
+        queryPoint(x, y) {
+            const size = this.cellSize;
+            return this.cells.get(this.cellKey(Math.floor(x / size), Math.floor(y / size))) || [];
+        }
+
+        // true nếu có item trong các ô giao với rect thoả predicate (dừng ngay khi gặp)
+        someInRect(x, y, width, height, predicate) {
+            const size = this.cellSize;
+            const x0 = Math.floor(x / size), x1 = Math.floor((x + width) / size);
+            const y0 = Math.floor(y / size), y1 = Math.floor((y + height) / size);
+            for (let cx = x0; cx <= x1; cx++) {
+                for (let cy = y0; cy <= y1; cy++) {
+                    const bucket = this.cells.get(this.cellKey(cx, cy));
+                    if (bucket && bucket.some(predicate)) return true;
+                }
+            }
+            return false;
+        }
+    }
+
+    // Căn giữa block text nằm gần tâm box chứa nó. Box chứa phải phủ góc trên-trái của text,
+    // nên chỉ cần xét các box trong ô của điểm đó; lấy box đứng trước nhất (như Array.find).
+    function centerTextBlocks(elementsData, slideWidth, slideHeight) {
+        const boxes = SpatialGrid.forSlide(slideWidth, slideHeight, elementsData.length);
+        elementsData.forEach((box, order) => {
+            if (BOX_TAGS.has(box.tagName)) {
+                boxes.insert({ box, order }, box.relativeX, box.relativeY, box.rect.width, box.rect.height);
+            }
+        });
+
+        elementsData.forEach((el) => {
+            if (!TEXT_TAGS.has(el.tagName)) return;
+            let parentBox = null;
+            let parentOrder = Infinity;
+            for (const { box, order } of boxes.queryPoint(el.relativeX, el.relativeY)) {
+                if (order < parentOrder &&
+                    box !== el &&
+                    el.relativeX >= box.relativeX &&
+                    el.relativeY >= box.relativeY &&
+                    el.relativeX + el.rect.width <= box.relativeX + box.rect.width &&
+                    el.relativeY + el.rect.height <= box.relativeY + box.rect.height) {
+                    parentBox = box;
+                    parentOrder = order;
+                }
+            }
+            if (parentBox) {
+                const centerX = parentBox.relativeX + parentBox.rect.width / 2 - el.rect.width / 2;
+                const centerY = parentBox.relativeY + parentBox.rect.height / 2 - el.rect.height / 2;
+                if (Math.abs(el.relativeX - centerX) < 20 && Math.abs(el.relativeY - centerY) < 20) {
+                    el.relativeX = centerX;
+                    el.relativeY = centerY;
+                }
+            }
+        });
+    }
+
+    // Index các panel theo góc trên-trái: một panel nằm trong container (dung sai `tolerance`
+    // ở cạnh phải/dưới) thì góc trên-trái của nó nằm trong rect mở rộng của container.
+    function indexPanels(panels, slideWidth, slideHeight) {
+        const grid = SpatialGrid.forSlide(slideWidth, slideHeight, panels.length);
+        panels.forEach(panel => grid.insert(panel, panel.relativeX, panel.relativeY));
+        return {
+            hasPanelInside(container, tolerance = 50) {
+                const right = container.relativeX + container.rect.width + tolerance;
+                const bottom = container.relativeY + container.rect.height + tolerance;
+                return grid.someInRect(container.relativeX, container.relativeY,
+                    right - container.relativeX, bottom - container.relativeY, child =>
+                        child !== container &&
+                        child.relativeX >= container.relativeX &&
+                        child.relativeY >= container.relativeY &&
+                        child.relativeX + child.rect.width <= right &&
+                        child.relativeY + child.rect.height <= bottom);
+            }
+        };
+    }
+
+    const api = { SpatialGrid, centerTextBlocks, indexPanels, TEXT_TAGS, BOX_TAGS };
+    if (typeof module !== 'undefined' && module.exports) module.exports = api;
+    else root.__slidegenLayout = api;
+})(typeof window !== 'undefined' ? window : globalThis);
@@ -27,14 +27,11 @@ def save_slide(html_content, filename, output_dir):
 
 def get_all_generate_functions():
     """
-    Dynamically discover all generate_* functions from html_lib.
+    Dynamically discover all generate_* functions from html_lib (every submodule of the package).
     Returns a sorted list of (name, function) tuples.
     Skips nested/inner functions (e.g. generate_planning_phase_slide.get_icon_svg).
     """
-    funcs = []
-    for name, obj in inspect.getmembers(html_lib):
-        if inspect.isfunction(obj) and name.startswith("generate_") and obj.__module__ == html_lib.__name__:
-            funcs.append((name, obj))
+    funcs = [(name, obj) for name, obj in html_lib.iter_generators() if inspect.isfunction(obj)]
     funcs.sort(key=lambda x: x[0])
     return funcs
 
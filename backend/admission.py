@@ -0,0 +1,155 @@
+import os
+import math
+import time
+import heapq
+import itertools
+import threading
+
+
+INTERACTIVE = 0
+BULK = 1
+PRIORITY_NAMES = {INTERACTIVE: 'interactive', BULK: 'bulk'}
+
+
+class Overloaded(Exception):
+    """Raised when the conversion queue is full; carries a Retry-After estimate in seconds."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f'Conversion queue is full, retry in {retry_after}s')
+        self.retry_after = retry_after
+
+
+class Cancelled(Exception):
+    """Raised by `with ticket:` when the ticket was cancelled before it got a slot."""
+
+
+class Ticket:
+    """
+    A reserved place in the conversion queue. `with ticket:` blocks until a
+    conversion slot is free and holds it for the body; cancel() gives the
+    place back if the work will never run.
+    """
+
+    def __init__(self, controller, priority: int):
+        self.controller = controller
+        self.priority = priority
+        self.state = 'queued'
+        self.started = None
+
+    def __enter__(self):
+        self.controller._enter(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.controller._exit(self)
+
+    def cancel(self):
+        self.controller._cancel(self)
+
+
+class AdmissionController:
+    """
+    Caps concurrent conversions at `max_concurrent` and queued ones at `max_queue`.
+    Interactive (single-slide) requests are granted free slots before bulk work
+    when `prioritize` is set; otherwise slots go out in arrival order.
+    """
+
+    def __init__(self, max_concurrent: int, max_queue: int, prioritize: bool = True):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.prioritize = prioritize
+        self.active = 0
+        self.queued = {INTERACTIVE: 0, BULK: 0}
+        self.admitted = {INTERACTIVE: 0, BULK: 0}
+        self.rejected = {INTERACTIVE: 0, BULK: 0}
+        self._avg_seconds = 1.0  # EWMA of slot hold time, for Retry-After
+        self._waiters = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+
+    def admit(self, priority: int = INTERACTIVE, count: int = 1) -> list:
+        """Reserve `count` places at once (all or nothing); raise Overloaded if they don't fit."""
+        with self._cond:
+            free_slots = max(0, self.max_concurrent - self.active)
+            if sum(self.queued.values()) + count > self.max_queue + free_slots:
+                self.rejected[priority] += count
+                raise Overloaded(self._retry_after())
+            self.queued[priority] += count
+            self.admitted[priority] += count
+            return [Ticket(self, priority) for _ in range(count)]
+
+    @property
+    def capacity(self) -> int:
+        """Most places a single admit() can ever reserve (every slot free, empty queue)."""
+        return self.max_concurrent + self.max_queue
+
+    def slot(self, priority: int = INTERACTIVE) -> Ticket:
+        """Single ticket, for `with admission.slot(): ...` around a synchronous conversion."""
+        return self.admit(priority)[0]
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                'active': self.active,
+                'max_concurrent': self.max_concurrent,
+                'queued': {PRIORITY_NAMES[p]: n for p, n in self.queued.items()},
+                'max_queue': self.max_queue,
+                'admitted': {PRIORITY_NAMES[p]: n for p, n in self.admitted.items()},
+                'rejected': {PRIORITY_NAMES[p]: n for p, n in self.rejected.items()},
+                'avg_seconds': round(self._avg_seconds, 3),
+                'retry_after': self._retry_after(),
+            }
+
+    def _retry_after(self) -> int:
+        backlog = sum(self.queued.values()) + 1
+        return max(1, math.ceil(backlog / self.max_concurrent * self._avg_seconds))
+
+    def _leave_queue(self, ticket: Ticket, state: str):
+        """The only place a ticket stops counting as queued (granted or cancelled)."""
+        self.queued[ticket.priority] -= 1
+        ticket.state = state
+
+    def _enter(self, ticket: Ticket):
+        with self._cond:
+            if ticket.state == 'cancelled':
+                raise Cancelled('Ticket was cancelled before it got a slot')
+            if ticket.state != 'queued':
+                raise RuntimeError(f'Ticket is {ticket.state}')
+            entry = (ticket.priority if self.prioritize else 0, next(self._seq), ticket)
+            heapq.heappush(self._waiters, entry)
+            while ticket.state == 'queued' and (self._waiters[0][2] is not ticket
+                                                or self.active >= self.max_concurrent):
+                self._cond.wait()
+            if ticket.state == 'cancelled':
+                # Cancelled while waiting (job cancel, batch client gone): give up the place, never run
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+                raise Cancelled('Ticket was cancelled before it got a slot')
+            heapq.heappop(self._waiters)
+            self._leave_queue(ticket, 'active')
+            self.active += 1
+            ticket.started = time.monotonic()
+            # The next waiter may also fit in a free slot
+            self._cond.notify_all()
+
+    def _exit(self, ticket: Ticket):
+        with self._cond:
+            self.active -= 1
+            ticket.state = 'done'
+            self._avg_seconds = 0.8 * self._avg_seconds + 0.2 * (time.monotonic() - ticket.started)
+            self._cond.notify_all()
+
+    def _cancel(self, ticket: Ticket):
+        with self._cond:
+            if ticket.state == 'queued':
+                self._leave_queue(ticket, 'cancelled')
+                self._cond.notify_all()
+
+
+def admission_from_env(default_concurrency: int) -> AdmissionController:
+    return AdmissionController(
+        max_concurrent=int(os.environ.get('CONVERT_MAX_CONCURRENT', default_concurrency)),
+        max_queue=int(os.environ.get('CONVERT_MAX_QUEUE', '64')),
+        prioritize=os.environ.get('CONVERT_PRIORITIZE_INTERACTIVE', '1') != '0',
+    )
@@ -1,7 +1,14 @@
+import io
 import os
-import tempfile
-import subprocess
-from flask import Flask, request, jsonify, send_file, Response
+import re
+import sys
+import json
+import time
+import uuid
+import atexit
+import zipfile
+from flask import Flask, request, jsonify, send_file, send_from_directory, Response
+from werkzeug.utils import secure_filename
 from flask_cors import CORS
 
 
@@ -10,29 +17,206 @@ CORS(app)
 
 
 REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-CONVERTER_JS_PATH = os.path.join(REPO_ROOT, 'Converter', 'Converter', 'converter.js')
+CONVERTER_DIR = os.path.join(REPO_ROOT, 'Converter', 'Converter')
+CONVERTER_JS_PATH = os.path.join(CONVERTER_DIR, 'converter.js')
 
+sys.path.insert(0, CONVERTER_DIR)
+from converter import get_converter_daemon  # noqa: E402
+from conversion_cache import get_conversion_cache  # noqa: E402
+from html_templates import compiled_library  # noqa: E402
+from jobs import job_manager_from_env, DONE  # noqa: E402
+from admission import admission_from_env, Overloaded, INTERACTIVE, BULK  # noqa: E402
+from url_fetcher import url_fetcher_from_env, ResponseTooLarge  # noqa: E402
+from http_cache import prepare_html  # noqa: E402
+from metrics import Registry  # noqa: E402
+from renderer import RendererPool  # noqa: E402
+from pipeline import DeckPipeline, StreamSessions, chunk_docx, chunk_idea  # noqa: E402
+from artifact_store import artifact_store_from_env  # noqa: E402
+from font_inline import inline_fonts  # noqa: E402
 
-def run_node_converter(input_path: str, output_path: str) -> None:
+CACHE_KEY_RE = re.compile(r'[0-9a-f]{64}')
+
+# Every conversion that reaches the browser holds one of a bounded number of
+# slots; requests beyond the queue limit get 429. Conversion jobs run on a pool
+# sized to the converter daemon's page pool, so a request thread only enqueues
+# and returns.
+admission = admission_from_env(get_converter_daemon().pool_size)
+jobs = job_manager_from_env(get_converter_daemon().pool_size, admission)
+url_fetcher = url_fetcher_from_env(os.path.join(os.path.dirname(os.path.abspath(__file__)), '.url_cache'))
+
+# Screenshots come from a separate warm Playwright browser so captures never
+# compete with conversions for converter pages.
+renderer = RendererPool(pages=int(os.environ.get('CAPTURE_POOL_SIZE', '4')),
+                        timeout=float(os.environ.get('CAPTURE_TIMEOUT', '60')))
+atexit.register(renderer.close)
+CAPTURE_DIR = os.environ.get('CAPTURE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.captures'))
+
+# Streaming deck generation (streaming.html): uploads and ideas wait here until
+# their EventSource connects; generated slides are previewed from an in-memory
+# TTL/LRU store, so abandoned decks are reclaimed without any cleanup call.
+stream_sessions = StreamSessions(ttl=float(os.environ.get('STREAM_SESSION_TTL_SECONDS', '1800')))
+temp_store = artifact_store_from_env()
+DOCX_MAX_BYTES = int(os.environ.get('DOCX_MAX_MB', '20')) * 1024 * 1024
+# Streamed slides embed subset fonts from the local asset mirror instead of linking Google Fonts
+INLINE_FONTS = os.environ.get('INLINE_FONTS', '1') != '0'
+
+metrics = Registry()
+PHASE_SECONDS = metrics.histogram(
+    'slidegen_conversion_phase_seconds',
+    'Time spent in each converter.js phase (acquire, load, fonts, animations, evaluate, serialize)')
+CONVERSION_SECONDS = metrics.histogram(
+    'slidegen_conversion_seconds', 'End-to-end conversion time in the backend, by cache outcome')
+CONVERSIONS = metrics.counter('slidegen_conversions_total', 'Conversions by outcome (cached, converted, error)')
+metrics.gauge('slidegen_queue_depth', 'Conversions admitted but waiting for a slot',
+              lambda: {(('priority', name),): n for name, n in admission.stats()['queued'].items()})
+metrics.gauge('slidegen_active_conversions', 'Conversions currently holding a slot', lambda: admission.stats()['active'])
+metrics.collected_counter('slidegen_rejected_conversions_total', 'Conversions rejected with 429',
+                          lambda: {(('priority', name),): n for name, n in admission.stats()['rejected'].items()})
+metrics.gauge('slidegen_jobs', 'Async conversion jobs by state',
+              lambda: {(('state', state),): n for state, n in jobs.stats()['jobs'].items()})
+metrics.gauge('slidegen_cache_hit_ratio', 'Conversion cache hit rate since start',
+              lambda: get_conversion_cache().stats()['hit_rate'])
+metrics.gauge('slidegen_cache_bytes', 'Bytes stored in the conversion cache', lambda: get_conversion_cache().stats()['bytes'])
+metrics.gauge('slidegen_temp_store_bytes', 'Bytes of streamed slide previews held in memory',
+              lambda: temp_store.stats()['bytes'])
+metrics.gauge('slidegen_converter_launch_seconds', 'Browser launch time of the running converter daemon',
+              lambda: get_converter_daemon().launch_timings.get('launch', 0) / 1000)
+
+
+def run_node_converter(html: str, options: dict = None) -> str:
     if not os.path.isfile(CONVERTER_JS_PATH):
         raise FileNotFoundError(f"converter.js not found at {CONVERTER_JS_PATH}")
 
-    cmd = [
-        'node',
-        CONVERTER_JS_PATH,
-        input_path,
-        output_path,
-    ]
-
-    proc = subprocess.run(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        cwd=REPO_ROOT,
-    )
-    if proc.returncode != 0:
-        raise RuntimeError(f"Converter failed (code {proc.returncode}): {proc.stderr}\n{proc.stdout}")
+    # Jobs go to a warm `converter.js --daemon` (one Chromium, pooled pages)
+    # instead of spawning node + launching a browser per request. The HTML is
+    # passed as a string and loaded with page.setContent, so no temp files.
+    try:
+        result = get_converter_daemon().convert_html(html, options=options)
+    except RuntimeError as exc:
+        raise RuntimeError(f"Converter failed: {exc}") from exc
+    for phase, ms in (result.get('timings') or {}).items():
+        PHASE_SECONDS.observe(ms / 1000, phase=phase)
+    return result['html']
+
+
+def lookup_conversion(html: bytes, options: dict = None) -> tuple:
+    """(cache key, converted bytes or None). Checked before admission: cache hits never take a slot."""
+    started = time.perf_counter()
+    cache = get_conversion_cache()
+    key = cache.key(html, options=options)
+    cached = cache.get(key)
+    if cached is not None:
+        CONVERSIONS.inc(outcome='cached')
+        CONVERSION_SECONDS.observe(time.perf_counter() - started, cached='true')
+    return key, cached
+
+
+def convert_html_bytes(html: bytes, options: dict = None, priority: int = None) -> tuple:
+    """
+    Convert an HTML document, serving repeats from the content-addressed cache.
+    Returns (cache key, converted bytes); the key doubles as the strong ETag.
+    With a priority, a cache miss waits for an admission slot first (callers that
+    already hold a ticket, like jobs and batches, pass None).
+    """
+    key, cached = lookup_conversion(html, options)
+    if cached is not None:
+        return key, cached
+    return key, convert_uncached(key, html, options, priority)
+
+
+def convert_uncached(key: str, html: bytes, options: dict = None, priority: int = None) -> bytes:
+    """Run the converter for a cache miss already looked up under `key` and store the result."""
+    started = time.perf_counter()
+    try:
+        if priority is None:
+            html_bytes = run_node_converter(html.decode('utf-8', errors='replace'), options).encode('utf-8')
+        else:
+            with admission.slot(priority):
+                html_bytes = run_node_converter(html.decode('utf-8', errors='replace'), options).encode('utf-8')
+    except Overloaded:
+        raise
+    except Exception:
+        CONVERSIONS.inc(outcome='error')
+        raise
+    get_conversion_cache().put(key, html_bytes)
+    CONVERSIONS.inc(outcome='converted')
+    CONVERSION_SECONDS.observe(time.perf_counter() - started, cached='false')
+    return html_bytes
+
+
+def html_response(key: str, html_bytes: bytes, immutable: bool = False) -> Response:
+    """
+    Converted slide with a strong ETag, 304 on a matching If-None-Match (GET/HEAD)
+    and gzip/br negotiated from precompressed variants stored beside the cache entry.
+    """
+    if_none_match = request.headers.get('If-None-Match') if request.method in ('GET', 'HEAD') else None
+    status, body, headers = prepare_html(get_conversion_cache(), key, html_bytes,
+                                         request.headers.get('Accept-Encoding', ''), if_none_match)
+    headers['Content-Location'] = f'/convert/result/{key}'
+    headers['Cache-Control'] = 'public, max-age=31536000, immutable' if immutable else 'no-cache'
+    return Response(body, status=status, mimetype='text/html', headers=headers)
+
+
+BATCH_MAX_SLIDES = int(os.environ.get('CONVERT_BATCH_MAX_SLIDES', '500'))
+BATCH_MAX_SLIDE_BYTES = int(os.environ.get('CONVERT_BATCH_MAX_SLIDE_MB', '10')) * 1024 * 1024
+
+
+def read_batch_zip(data: bytes) -> list:
+    """(name, html bytes) for every .html entry of a ZIP, in name order."""
+    slides = []
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        for info in sorted(archive.infolist(), key=lambda info: info.filename):
+            if info.is_dir() or not info.filename.lower().endswith(('.html', '.htm')):
+                continue
+            if info.filename.startswith('__MACOSX/'):
+                continue
+            if info.file_size > BATCH_MAX_SLIDE_BYTES:
+                raise ValueError(f'{info.filename} exceeds {BATCH_MAX_SLIDE_BYTES} bytes')
+            slides.append((info.filename, archive.read(info)))
+    return slides
+
+
+def read_batch_request():
+    """
+    Slides from a ZIP (multipart "file" or application/zip body) or a JSON body:
+    ["<html>", ...], [{"name", "html"}, ...] or {"slides": [...], "options": {...}}.
+    """
+    if 'file' in request.files:
+        return read_batch_zip(request.files['file'].read()), None
+    if request.mimetype in ('application/zip', 'application/x-zip-compressed'):
+        return read_batch_zip(request.get_data()), None
+
+    data = request.get_json(silent=True)
+    options = None
+    if isinstance(data, dict):
+        options = data.get('options')
+        data = data.get('slides')
+    if not isinstance(data, list):
+        raise ValueError('Expected a JSON array of slides or a ZIP of HTML files')
+    slides = []
+    for idx, item in enumerate(data):
+        if isinstance(item, dict):
+            name, html = item.get('name') or f'slide_{idx + 1}.html', item.get('html')
+        else:
+            name, html = f'slide_{idx + 1}.html', item
+        if not isinstance(html, str):
+            raise ValueError(f'Slide {idx} has no "html" string')
+        slides.append((name, html.encode('utf-8')))
+    return slides, options
+
+
+def fetch_url_html(url: str) -> bytes:
+    # Pooled session + on-disk cache with conditional revalidation; an unchanged
+    # page then also hits the conversion cache, so neither step is repeated.
+    return url_fetcher.fetch(url)
+
+
+@app.errorhandler(Overloaded)
+def overloaded(exc: Overloaded):
+    response = jsonify({'error': str(exc), 'retry_after': exc.retry_after})
+    response.status_code = 429
+    response.headers['Retry-After'] = str(exc.retry_after)
+    return response
 
 
 @app.get('/health')
@@ -40,6 +224,280 @@ def health() -> Response:
     return jsonify({'status': 'ok'})
 
 
+def capture_options(data: dict) -> dict:
+    """format (png|jpeg|webp), width (downscale, <= 1920) and quality (jpeg/webp) from a request body."""
+    width = data.get('width')
+    quality = data.get('quality')
+    return {
+        'fmt': str(data.get('format') or 'png').lower(),
+        'width': int(width) if width else None,
+        'quality': int(quality) if quality else None,
+    }
+
+
+def save_capture(data: bytes, name: str) -> str:
+    os.makedirs(CAPTURE_DIR, exist_ok=True)
+    stem, ext = os.path.splitext(name)
+    filename = f'{secure_filename(stem) or "slide"}_{uuid.uuid4().hex[:8]}{ext}'
+    with open(os.path.join(CAPTURE_DIR, filename), 'wb') as f:
+        f.write(data)
+    return filename
+
+
+def capture_url(filename: str, download: bool = False) -> str:
+    # Absolute, since the frontend may be served from another origin
+    url = f"{request.host_url.rstrip('/')}/api/captures/{filename}"
+    return url + '?download=1' if download else url
+
+
+@app.post('/api/capture-slide')
+def capture_slide():
+    """Render one slide ({html_content, slide_name, format?, width?, quality?}) to an image."""
+    data = request.get_json(silent=True) or {}
+    html = data.get('html_content')
+    if not html:
+        return jsonify({'success': False, 'error': 'Missing "html_content"'}), 400
+    try:
+        options = capture_options(data)
+        image = renderer.capture(html, **options)
+    except ValueError as exc:
+        return jsonify({'success': False, 'error': str(exc)}), 400
+    except Exception as exc:
+        return jsonify({'success': False, 'error': str(exc)}), 500
+
+    ext = 'jpg' if options['fmt'] == 'jpeg' else options['fmt']
+    filename = save_capture(image, f"{data.get('slide_name') or 'slide'}.{ext}")
+    return jsonify({
+        'success': True,
+        'image_url': capture_url(filename),
+        'download_url': capture_url(filename, download=True),
+        'filename': filename,
+        'bytes': len(image),
+        'message': 'Slide captured',
+    })
+
+
+@app.post('/api/capture-slides-batch')
+def capture_slides_batch():
+    """Render many slides concurrently on the renderer pool and return one ZIP of images."""
+    data = request.get_json(silent=True) or {}
+    slides = data.get('slides')
+    if not isinstance(slides, list) or not slides:
+        return jsonify({'success': False, 'error': 'Missing "slides" list'}), 400
+    if any(not isinstance(slide, dict) or not slide.get('html_content') for slide in slides):
+        return jsonify({'success': False, 'error': 'Every slide needs "html_content"'}), 400
+    try:
+        options = capture_options(data)
+        images = renderer.capture_many([slide['html_content'] for slide in slides], **options)
+    except ValueError as exc:
+        return jsonify({'success': False, 'error': str(exc)}), 400
+    except Exception as exc:
+        return jsonify({'success': False, 'error': str(exc)}), 500
+
+    ext = 'jpg' if options['fmt'] == 'jpeg' else options['fmt']
+    archive = io.BytesIO()
+    failed = []
+    # Images are already compressed; storing them skips a pointless deflate pass
+    with zipfile.ZipFile(archive, 'w', zipfile.ZIP_STORED) as zf:
+        for idx, (slide, image) in enumerate(zip(slides, images)):
+            name = secure_filename(slide.get('slide_name') or '') or f'slide_{idx + 1}'
+            if isinstance(image, Exception):
+                failed.append({'index': idx, 'slide_name': slide.get('slide_name'), 'error': str(image)})
+                continue
+            zf.writestr(f'{idx + 1:03d}_{name}.{ext}', image)
+    captured = len(slides) - len(failed)
+    if captured == 0:
+        return jsonify({'success': False, 'error': 'No slide could be captured', 'failed': failed}), 500
+
+    filename = save_capture(archive.getvalue(), 'slides.zip')
+    return jsonify({
+        'success': True,
+        'download_url': capture_url(filename, download=True),
+        'filename': filename,
+        'captured_slides': captured,
+        'failed': failed,
+        'message': f'Captured {captured}/{len(slides)} slides',
+    })
+
+
+@app.post('/api/export-slides-pdf')
+def export_slides_pdf():
+    """
+    Print a deck ({slides: [{html_content, slide_name}]}) into one PDF, one 1920x1080
+    page per slide. Returns JSON with a download_url, or the PDF itself streamed from
+    disk when called with ?stream=1 or Accept: application/pdf.
+    """
+    data = request.get_json(silent=True) or {}
+    slides = data.get('slides')
+    if not isinstance(slides, list) or not slides:
+        return jsonify({'success': False, 'error': 'Missing "slides" list'}), 400
+    if any(not isinstance(slide, dict) or not slide.get('html_content') for slide in slides):
+        return jsonify({'success': False, 'error': 'Every slide needs "html_content"'}), 400
+
+    os.makedirs(CAPTURE_DIR, exist_ok=True)
+    name = secure_filename(data.get('deck_name') or '') or 'slides'
+    filename = f'{name}_{uuid.uuid4().hex[:8]}.pdf'
+    path = os.path.join(CAPTURE_DIR, filename)
+    started = time.perf_counter()
+    try:
+        renderer.export_pdf([slide['html_content'] for slide in slides], path)
+    except Exception as exc:
+        if os.path.exists(path):
+            os.remove(path)
+        return jsonify({'success': False, 'error': str(exc)}), 500
+
+    if request.args.get('stream') == '1' or request.accept_mimetypes.best == 'application/pdf':
+        return send_file(path, mimetype='application/pdf', as_attachment=True, download_name=filename)
+    return jsonify({
+        'success': True,
+        # Relative: the editor prefixes config.BACKEND_URL itself
+        'download_url': f'/api/captures/{filename}?download=1',
+        'filename': filename,
+        'pages': len(slides),
+        'bytes': os.path.getsize(path),
+        'ms': int((time.perf_counter() - started) * 1000),
+        'message': f'Exported {len(slides)} slides to PDF',
+    })
+
+
+@app.get('/api/captures/<path:filename>')
+def get_capture(filename: str):
+    return send_from_directory(CAPTURE_DIR, filename, as_attachment=request.args.get('download') == '1')
+
+
+def form_flag(value, default: bool = True) -> bool:
+    if value is None:
+        return default
+    return str(value).strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def with_inlined_fonts(html_bytes: bytes) -> bytes:
+    """Slide HTML with mirrored Google Fonts inlined as subset data URIs (unchanged when disabled)."""
+    if not INLINE_FONTS:
+        return html_bytes
+    return inline_fonts(html_bytes.decode('utf-8')).encode('utf-8')
+
+
+def convert_deck_slide(html_bytes: bytes) -> bytes:
+    """
+    Convert one generated deck slide. The cache is keyed on the slide as generated (marked
+    when fonts get inlined), so font inlining only runs on a miss, right before the converter.
+    """
+    key, cached = lookup_conversion(html_bytes, {'inlineFonts': True} if INLINE_FONTS else None)
+    if cached is not None:
+        return cached
+    return convert_uncached(key, with_inlined_fonts(html_bytes), None, BULK)
+
+
+def stream_deck(sections, title: str, options: dict) -> Response:
+    """SSE response running the deck pipeline; slides go to the temp store as they finish."""
+    deck_id = temp_store.new_group()
+
+    def store(index: int, html_bytes: bytes) -> str:
+        return temp_store.put(deck_id, f'slide_{index + 1:03d}.html', html_bytes)
+
+    pipeline = DeckPipeline(
+        sections,
+        compiled_library(),
+        convert=convert_deck_slide,
+        store=store,
+        title=title,
+        enable_transitions=options.get('enable_transition_slides', True),
+        enable_thank_you=options.get('enable_thank_you_slide', True),
+        workers=get_converter_daemon().pool_size,
+    )
+    return Response(pipeline.run(project_name=title, project_id=None, temp_dir=deck_id),
+                    mimetype='text/event-stream',
+                    headers={'X-Accel-Buffering': 'no', 'Cache-Control': 'no-cache'})
+
+
+# The /api routes used by the upload and idea forms answer errors with "detail",
+# which is what script.js and index.html read.
+@app.post('/api/upload-docx-for-stream')
+def upload_docx_for_stream():
+    """Keep an uploaded .docx (plus slide options) until /api/upload-docx-stream asks for it."""
+    upload = request.files.get('file')
+    if upload is None or not upload.filename.lower().endswith('.docx'):
+        return jsonify({'success': False, 'detail': 'Upload a .docx "file"'}), 400
+    data = upload.read(DOCX_MAX_BYTES + 1)
+    if len(data) > DOCX_MAX_BYTES:
+        return jsonify({'success': False, 'detail': f'File exceeds {DOCX_MAX_BYTES // (1024 * 1024)} MB'}), 413
+    if not zipfile.is_zipfile(io.BytesIO(data)):
+        return jsonify({'success': False, 'detail': 'Not a valid .docx file'}), 400
+
+    filename = f"{uuid.uuid4().hex}_{secure_filename(upload.filename) or 'document.docx'}"
+    stream_sessions.put(filename, kind='docx', data=data, title=os.path.splitext(upload.filename)[0], options={
+        'enable_transition_slides': form_flag(request.form.get('enable_transition_slides')),
+        'enable_thank_you_slide': form_flag(request.form.get('enable_thank_you_slide')),
+    })
+    return jsonify({'success': True, 'filename': filename, 'message': 'Uploaded, open the stream to generate'})
+
+
+@app.post('/api/generate-from-idea')
+def generate_from_idea():
+    """Register an idea ({title, prompt, content_length, ...}) and return the session id to stream it."""
+    data = request.get_json(silent=True) or {}
+    prompt = (data.get('prompt') or '').strip()
+    if not prompt:
+        return jsonify({'success': False, 'detail': 'Missing "prompt"'}), 400
+    session_id = uuid.uuid4().hex
+    stream_sessions.put(session_id, kind='idea', title=(data.get('title') or '').strip(), prompt=prompt,
+                        content_length=data.get('content_length') or 'standard', options={
+                            'enable_transition_slides': form_flag(data.get('enable_transition_slides')),
+                            'enable_thank_you_slide': form_flag(data.get('enable_thank_you_slide')),
+                        })
+    return jsonify({'success': True, 'session_id': session_id})
+
+
+@app.get('/api/upload-docx-stream')
+def upload_docx_stream():
+    """
+    SSE: status, progress, slide_completed (one per slide, in order) and complete
+    events for an uploaded .docx. Failures arrive as an error_event.
+    """
+    session = stream_sessions.get(request.args.get('filename', ''))
+    if session is None or session['kind'] != 'docx':
+        return jsonify({'success': False, 'detail': 'Unknown or expired upload'}), 404
+    return stream_deck(chunk_docx(io.BytesIO(session['data'])), session['title'], session['options'])
+
+
+@app.get('/api/generate-from-idea-stream')
+def generate_from_idea_stream():
+    """SSE for an idea registered with /api/generate-from-idea; same events as /api/upload-docx-stream."""
+    session = stream_sessions.get(request.args.get('session_id', ''))
+    if session is None or session['kind'] != 'idea':
+        return jsonify({'success': False, 'detail': 'Unknown or expired session'}), 404
+    sections = chunk_idea(session['title'], session['prompt'], session['content_length'])
+    return stream_deck(sections, session['title'], session['options'])
+
+
+@app.get('/api/temp-file')
+def get_temp_file():
+    """A streamed slide preview by the html_path of its slide_completed event (served from memory)."""
+    artifact = temp_store.get(request.args.get('path', ''))
+    if artifact is None:
+        return jsonify({'error': 'Unknown or expired preview'}), 404
+    return Response(artifact[0], mimetype=artifact[1], headers={'Cache-Control': 'private, no-cache'})
+
+
+@app.post('/api/cleanup-temp')
+def cleanup_temp():
+    """Drop the previews of a streamed deck ({temp_dir} from the complete event)."""
+    temp_dir = (request.get_json(silent=True) or {}).get('temp_dir') or ''
+    if not temp_dir:
+        return jsonify({'success': False, 'error': 'Missing "temp_dir"'}), 400
+    return jsonify({'success': True, 'removed': temp_store.drop_group(temp_dir)})
+
+@app.get('/metrics')
+def prometheus_metrics() -> Response:
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+
+@app.get('/convert/queue')
+def queue_stats():
+    return jsonify({'admission': admission.stats(), 'jobs': jobs.stats(), 'url_cache': url_fetcher.stats()})
+
+
 @app.post('/convert/upload')
 def convert_upload():
     if 'file' not in request.files:
@@ -50,16 +508,9 @@ def convert_upload():
         return jsonify({'error': 'Empty filename'}), 400
 
     try:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            input_path = os.path.join(tmpdir, 'input.html')
-            output_path = os.path.join(tmpdir, 'output.html')
-            uploaded.save(input_path)
-
-            run_node_converter(input_path, output_path)
-
-            with open(output_path, 'rb') as f:
-                html_bytes = f.read()
-            return Response(html_bytes, mimetype='text/html')
+        return html_response(*convert_html_bytes(uploaded.read(), priority=INTERACTIVE))
+    except Overloaded:
+        raise
     except Exception as exc:
         return jsonify({'error': str(exc)}), 500
 
@@ -72,17 +523,9 @@ def convert_html():
         return jsonify({'error': 'Missing "html" string in JSON body'}), 400
 
     try:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            input_path = os.path.join(tmpdir, 'input.html')
-            output_path = os.path.join(tmpdir, 'output.html')
-            with open(input_path, 'w', encoding='utf-8') as f:
-                f.write(html)
-
-            run_node_converter(input_path, output_path)
-
-            with open(output_path, 'rb') as f:
-                html_bytes = f.read()
-            return Response(html_bytes, mimetype='text/html')
+        return html_response(*convert_html_bytes(html.encode('utf-8'), data.get('options'), priority=INTERACTIVE))
+    except Overloaded:
+        raise
     except Exception as exc:
         return jsonify({'error': str(exc)}), 500
 
@@ -94,25 +537,152 @@ def convert_url():
     if not url:
         return jsonify({'error': 'Missing "url" in JSON body'}), 400
 
-    # Simple fetch via requests to persist HTML then convert
     try:
-        import requests
-        resp = requests.get(url, timeout=20)
-        resp.raise_for_status()
+        return html_response(*convert_html_bytes(fetch_url_html(url), priority=INTERACTIVE))
+    except Overloaded:
+        raise
+    except ResponseTooLarge as exc:
+        return jsonify({'error': str(exc)}), 413
+    except Exception as exc:
+        return jsonify({'error': str(exc)}), 500
+
+
+@app.post('/convert/batch')
+def convert_batch():
+    """Convert many slides concurrently, streaming one NDJSON line per slide as it finishes."""
+    try:
+        slides, options = read_batch_request()
+    except (ValueError, zipfile.BadZipFile) as exc:
+        return jsonify({'error': str(exc)}), 400
+    if not slides:
+        return jsonify({'error': 'No HTML slides in request'}), 400
+    if len(slides) > BATCH_MAX_SLIDES:
+        return jsonify({'error': f'Too many slides ({len(slides)} > {BATCH_MAX_SLIDES})'}), 413
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            input_path = os.path.join(tmpdir, 'input.html')
-            output_path = os.path.join(tmpdir, 'output.html')
-            with open(input_path, 'w', encoding='utf-8') as f:
-                f.write(resp.text)
+    # Cache hits are answered straight away; only misses are admitted and converted
+    hits, misses = [], []
+    for idx, (_, html) in enumerate(slides):
+        started = time.perf_counter()
+        key, cached = lookup_conversion(html, options)
+        if cached is None:
+            misses.append((idx, key))
+        else:
+            hits.append((idx, (key, cached, int((time.perf_counter() - started) * 1000)), None))
 
-            run_node_converter(input_path, output_path)
+    # Misses are admitted all or nothing; more than the queue can ever hold would be a 429 forever
+    if len(misses) > admission.capacity:
+        return jsonify({'error': f'{len(misses)} slides need converting but at most {admission.capacity} can be '
+                                 f'queued at once (CONVERT_MAX_CONCURRENT + CONVERT_MAX_QUEUE); split the batch'}), 413
 
-            with open(output_path, 'rb') as f:
-                html_bytes = f.read()
-            return Response(html_bytes, mimetype='text/html')
-    except Exception as exc:
-        return jsonify({'error': str(exc)}), 500
+    def convert_one(miss):
+        started = time.perf_counter()
+        idx, key = miss
+        html = convert_uncached(key, slides[idx][1], options)
+        return key, html, int((time.perf_counter() - started) * 1000)
+
+    # Admits every miss before the response starts, so an over-full queue is a 429
+    converted = jobs.run_unordered(convert_one, misses)
+
+    def results():
+        yield from hits
+        for miss_idx, result, error in converted:
+            yield misses[miss_idx][0], result, error
+
+    def generate():
+        started = time.perf_counter()
+        failed = 0
+        for idx, result, error in results():
+            line = {'index': idx, 'name': slides[idx][0], 'ok': error is None}
+            if error is None:
+                key, html, line['ms'] = result
+                line['html'] = html.decode('utf-8')
+                line['result_url'] = f'/convert/result/{key}'
+            else:
+                failed += 1
+                line['error'] = error
+            yield json.dumps(line) + '\n'
+        yield json.dumps({
+            'done': True,
+            'total': len(slides),
+            'success': len(slides) - failed,
+            'error': failed,
+            'ms': int((time.perf_counter() - started) * 1000),
+        }) + '\n'
+
+    response = Response(generate(), mimetype='application/x-ndjson',
+                        headers={'X-Accel-Buffering': 'no', 'Cache-Control': 'no-cache'})
+    # Runs when the server closes the response, even if the client left before the first line
+    response.call_on_close(converted.close)
+    return response
+
+
+def submit_conversion_job(kind: str, html: bytes, options: dict = None):
+    """A finished job for a cache hit; otherwise an admitted job that converts the HTML."""
+    key, cached = lookup_conversion(html, options)
+    if cached is not None:
+        return jobs.completed(kind, (key, cached))
+    return jobs.submit(kind, lambda: (key, convert_uncached(key, html, options)))
+
+
+@app.post('/convert/jobs')
+def create_job():
+    """Enqueue a conversion (multipart "file", or JSON "html"/"url" + "options") and return its id."""
+    if 'file' in request.files:
+        job = submit_conversion_job('upload', request.files['file'].read())
+    else:
+        data = request.get_json(silent=True) or {}
+        if data.get('html'):
+            job = submit_conversion_job('html', data['html'].encode('utf-8'), data.get('options'))
+        elif data.get('url'):
+            # The page is only known once fetched, so the job admits itself on a cache miss
+            job = jobs.submit('url', lambda url: convert_html_bytes(fetch_url_html(url), None, BULK), data['url'],
+                              admit=False)
+        else:
+            return jsonify({'error': 'Provide a "file" upload, or "html" or "url" in JSON body'}), 400
+
+    response = jsonify(job.to_dict())
+    response.status_code = 202
+    response.headers['Location'] = f'/convert/jobs/{job.id}'
+    return response
+
+
+@app.get('/convert/jobs/<job_id>')
+def get_job(job_id: str):
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown job id'}), 404
+    info = job.to_dict()
+    if job.status == DONE:
+        info['result_url'] = f'/convert/jobs/{job.id}/result'
+        info['result_bytes'] = len(job.result[1])
+    return jsonify(info)
+
+
+@app.get('/convert/jobs/<job_id>/result')
+def get_job_result(job_id: str):
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown job id'}), 404
+    if job.status != DONE:
+        return jsonify(job.to_dict()), 409
+    return html_response(*job.result)
+
+
+@app.get('/convert/result/<key>')
+def get_result(key: str):
+    """A converted slide by cache key; the URL never changes meaning, so it is cached forever."""
+    cached = get_conversion_cache().get(key) if CACHE_KEY_RE.fullmatch(key) else None
+    if cached is None:
+        return jsonify({'error': 'Unknown or evicted result'}), 404
+    return html_response(key, cached, immutable=True)
+
+
+@app.delete('/convert/jobs/<job_id>')
+def cancel_job(job_id: str):
+    job = jobs.cancel(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown job id'}), 404
+    return jsonify(job.to_dict())
 
 
 if __name__ == '__main__':
@@ -0,0 +1,145 @@
+import os
+import time
+import uuid
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+class ArtifactStore:
+    """
+    Short-lived artifacts (streamed slide previews) in memory, keyed by opaque ids
+    of the form `<group>/<name>`; a group is one deck.
+
+    Every read or write renews an entry's `ttl`, so entries stay in LRU order and
+    expired ones are always at the front: each call drops them in amortised O(1),
+    and abandoned decks disappear without a sweeper thread. Past `max_bytes` the
+    least recently used entries are evicted, or written to `spill_dir` when one is
+    configured, so only spilled entries ever touch the filesystem.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, ttl: float = 1800, spill_dir: str = None):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.spill_dir = spill_dir
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._entries = OrderedDict()  # key -> (data, content_type, expires)
+        self._spilled = {}  # key -> (path, content_type, expires)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def new_group() -> str:
+        return uuid.uuid4().hex
+
+    def put(self, group: str, name: str, data: bytes, content_type: str = 'text/html') -> str:
+        key = f'{group}/{name}'
+        now = time.time()
+        with self._lock:
+            self._expire(now)
+            self._remove(key)
+            self._entries[key] = (data, content_type, now + self.ttl)
+            self.bytes += len(data)
+            while self.bytes > self.max_bytes and len(self._entries) > 1:
+                self._evict_oldest()
+        return key
+
+    def get(self, key: str):
+        """(data, content_type) or None once the entry expired, was evicted or its group dropped."""
+        now = time.time()
+        with self._lock:
+            self._expire(now)
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries[key] = (entry[0], entry[1], now + self.ttl)
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0], entry[1]
+            spilled = self._spilled.get(key)
+            if spilled is None or spilled[2] < now:
+                self.misses += 1
+                return None
+            self._spilled[key] = (spilled[0], spilled[1], now + self.ttl)
+        try:
+            with open(spilled[0], 'rb') as f:
+                data = f.read()
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return data, spilled[1]
+
+    def drop_group(self, group: str) -> int:
+        """Forget every artifact of a group; returns how many were removed."""
+        prefix = f'{group}/'
+        with self._lock:
+            keys = [key for key in list(self._entries) + list(self._spilled) if key.startswith(prefix)]
+            for key in keys:
+                self._remove(key)
+        return len(keys)
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._expire(time.time())
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.bytes,
+                'spilled': len(self._spilled),
+                'evicted': self.evicted,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= len(entry[0])
+        spilled = self._spilled.pop(key, None)
+        if spilled is not None:
+            self._unlink(spilled[0])
+
+    def _expire(self, now: float):
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if entry[2] >= now:
+                break
+            self._remove(key)
+        # Spilled entries are rare; a full pass only runs while some exist
+        for key in [key for key, spilled in self._spilled.items() if spilled[2] < now]:
+            self._remove(key)
+
+    def _evict_oldest(self):
+        key, (data, content_type, expires) = self._entries.popitem(last=False)
+        self.bytes -= len(data)
+        self.evicted += 1
+        if self.spill_dir is None:
+            return
+        os.makedirs(self.spill_dir, exist_ok=True)
+        path = os.path.join(self.spill_dir, hashlib.sha256(key.encode('utf-8')).hexdigest())
+        try:
+            with open(path, 'wb') as f:
+                f.write(data)
+        except OSError:
+            return
+        self._spilled[key] = (path, content_type, expires)
+
+    @staticmethod
+    def _unlink(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def artifact_store_from_env() -> ArtifactStore:
+    return ArtifactStore(
+        max_bytes=int(os.environ.get('TEMP_STORE_MAX_MB', '256')) * 1024 * 1024,
+        ttl=float(os.environ.get('TEMP_STORE_TTL_SECONDS', '1800')),
+        spill_dir=os.environ.get('TEMP_STORE_SPILL_DIR') or None,
+    )
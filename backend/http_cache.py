@@ -0,0 +1,89 @@
+import gzip
+
+try:
+    import brotli
+except ImportError:  # optional: without it only gzip is offered
+    brotli = None
+
+
+# Suffix of each precompressed variant stored beside `<key>.html` in the conversion cache
+VARIANT_SUFFIXES = {'br': '.html.br', 'gzip': '.html.gz'}
+# Below this size compression costs more than it saves
+MIN_COMPRESS_BYTES = 1024
+
+
+def available_encodings():
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def negotiate_encoding(accept_encoding: str):
+    """Best content-coding from an Accept-Encoding header (server preference br > gzip), or None."""
+    if not accept_encoding:
+        return None
+    weights = {}
+    for part in accept_encoding.split(','):
+        name, _, params = part.strip().partition(';')
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name.strip().lower()] = q
+    for encoding in available_encodings():
+        if weights.get(encoding, weights.get('*', 0)) > 0:
+            return encoding
+    return None
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(data, quality=11)
+    # mtime=0 keeps the bytes (and so the stored variant) deterministic
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def etag_for(key: str, encoding: str = None) -> str:
+    """Strong ETag from the conversion cache key; each content-coding gets its own tag."""
+    tag = key[:32]
+    return f'"{tag}-{encoding}"' if encoding else f'"{tag}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match uses weak comparison, so W/ prefixes are ignored."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(',')]
+    return etag in (tag[2:] if tag.startswith('W/') else tag for tag in candidates)
+
+
+def encoded_variant(cache, key: str, data: bytes, encoding: str) -> bytes:
+    """
+    Precompressed variant of a cached output: read from beside `<key>.html`, or
+    compressed once and stored there for the next request.
+    """
+    suffix = VARIANT_SUFFIXES[encoding]
+    variant = cache.get(key, suffix=suffix)
+    if variant is None:
+        variant = compress(data, encoding)
+        cache.put(key, variant, suffix=suffix)
+    return variant
+
+
+def prepare_html(cache, key: str, data: bytes, accept_encoding: str, if_none_match: str = None):
+    """
+    (status, body, headers) for a converted slide. 304 with no body when the
+    client's validator still matches; otherwise the negotiated encoding.
+    """
+    encoding = negotiate_encoding(accept_encoding) if len(data) >= MIN_COMPRESS_BYTES else None
+    etag = etag_for(key, encoding)
+    headers = {'ETag': etag, 'Vary': 'Accept-Encoding'}
+    if etag_matches(if_none_match, etag):
+        return 304, b'', headers
+    if encoding:
+        data = encoded_variant(cache, key, data, encoding)
+        headers['Content-Encoding'] = encoding
+    return 200, data, headers
@@ -0,0 +1,217 @@
+import os
+import time
+import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from admission import BULK
+
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+ERROR = 'error'
+CANCELLED = 'cancelled'
+FINISHED_STATES = (DONE, ERROR, CANCELLED)
+
+
+class Job:
+    def __init__(self, kind: str):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.status = QUEUED
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.result = None
+        self.error = None
+        self.future = None
+        self.ticket = None
+
+    def to_dict(self) -> dict:
+        info = {
+            'id': self.id,
+            'kind': self.kind,
+            'status': self.status,
+            'created': self.created,
+            'started': self.started,
+            'finished': self.finished,
+        }
+        if self.error is not None:
+            info['error'] = self.error
+        return info
+
+
+class UnorderedResults:
+    """Completion-order results of JobManager.run_unordered; close() works before the first next() too."""
+
+    def __init__(self, futures: dict, tickets: list):
+        self._futures = futures
+        self._tickets = tickets
+        self._results = self._iter_completed()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._results)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _iter_completed(self):
+        try:
+            for future in as_completed(self._futures):
+                try:
+                    yield self._futures[future], future.result(), None
+                except Exception as exc:
+                    yield self._futures[future], None, str(exc)
+        finally:
+            self._release()
+
+    def _release(self):
+        for future in self._futures:
+            future.cancel()
+        for ticket in self._tickets:
+            if ticket is not None:
+                ticket.cancel()
+
+    def close(self):
+        self._results.close()
+        # A generator closed before its first next() never runs its finally
+        self._release()
+
+
+class JobManager:
+    """
+    Runs conversions off the request threads. The pool has as many workers as the
+    converter daemon has browser pages, so queued jobs wait here instead of piling up
+    inside Chromium. Finished jobs are kept for `ttl` seconds so clients can poll.
+    With an `admission` controller, a job takes a bulk ticket at submit time
+    (raising Overloaded when the queue is full) and a slot before it runs, unless
+    it is submitted with admit=False (the work admits itself, or needs no slot).
+    """
+
+    def __init__(self, workers: int, ttl: float = 600, max_jobs: int = 1000, admission=None):
+        self.workers = workers
+        self.admission = admission
+        self.ttl = ttl
+        self.max_jobs = max_jobs
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='convert-job')
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, fn, *args, admit: bool = True) -> Job:
+        """Queue fn(*args) and return the job immediately; its return value becomes job.result."""
+        job = Job(kind)
+        if admit and self.admission is not None:
+            job.ticket = self.admission.admit(BULK)[0]
+        self._add(job)
+        job.future = self._executor.submit(self._run, job, fn, args)
+        return job
+
+    def completed(self, kind: str, result) -> Job:
+        """A job that is already done (e.g. a cache hit), pollable like any other."""
+        job = Job(kind)
+        job.status, job.result = DONE, result
+        job.started = job.finished = job.created
+        self._add(job)
+        return job
+
+    def get(self, job_id: str):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str):
+        """
+        Cancel a job. Queued jobs never start; a running conversion cannot be
+        interrupted inside the browser, so its result is discarded when it lands.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status in FINISHED_STATES:
+                return job
+            if job.future is not None:
+                job.future.cancel()
+            if job.ticket is not None:
+                job.ticket.cancel()
+            job.status = CANCELLED
+            job.finished = time.time()
+            return job
+
+    def run_unordered(self, fn, items):
+        """
+        Run fn(item) for every item on the shared pool and iterate (index, result, error)
+        in completion order. Admission tickets for all items are taken up front, so an
+        oversized batch is rejected with Overloaded before anything runs; callers pass
+        only the items that need a conversion slot (cache misses). The caller must close()
+        the returned iterator (or use it as a context manager), even if it never iterates:
+        that cancels items not yet started and releases their tickets.
+        """
+        tickets = self.admission.admit(BULK, len(items)) if self.admission is not None else [None] * len(items)
+        futures = {self._executor.submit(self._run_admitted, ticket, fn, item): idx
+                   for idx, (ticket, item) in enumerate(zip(tickets, items))}
+        return UnorderedResults(futures, tickets)
+
+    def stats(self) -> dict:
+        with self._lock:
+            counts = {state: 0 for state in (QUEUED, RUNNING) + FINISHED_STATES}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+        return {'workers': self.workers, 'jobs': counts}
+
+    @staticmethod
+    def _run_admitted(ticket, fn, *args):
+        if ticket is None:
+            return fn(*args)
+        with ticket:
+            return fn(*args)
+
+    def _run(self, job: Job, fn, args):
+        with self._lock:
+            if job.status == CANCELLED:
+                return
+            job.status = RUNNING
+            job.started = time.time()
+        try:
+            result, error = self._run_admitted(job.ticket, fn, *args), None
+        except Exception as exc:
+            result, error = None, str(exc)
+        with self._lock:
+            if job.status == CANCELLED:
+                return
+            job.finished = time.time()
+            if error is None:
+                job.status, job.result = DONE, result
+            else:
+                job.status, job.error = ERROR, error
+
+    def _add(self, job: Job):
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+
+    def _prune(self):
+        now = time.time()
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job.status in FINISHED_STATES and now - job.finished > self.ttl]
+        for job_id in expired:
+            del self._jobs[job_id]
+        # Still over the cap: drop the oldest finished jobs first
+        if len(self._jobs) >= self.max_jobs:
+            finished = sorted((job for job in self._jobs.values() if job.status in FINISHED_STATES),
+                              key=lambda job: job.finished)
+            for job in finished[:len(self._jobs) - self.max_jobs + 1]:
+                del self._jobs[job.id]
+
+
+def job_manager_from_env(default_workers: int, admission=None) -> JobManager:
+    return JobManager(
+        admission=admission,
+        workers=int(os.environ.get('CONVERT_JOB_WORKERS', default_workers)),
+        ttl=float(os.environ.get('CONVERT_JOB_TTL_SECONDS', '600')),
+        max_jobs=int(os.environ.get('CONVERT_JOB_MAX', '1000')),
+    )
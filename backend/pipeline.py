@@ -0,0 +1,344 @@
+import re
+import html
+import json
+import time
+import queue
+import zipfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from xml.etree import ElementTree
+
+
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+HEADING_STYLE_RE = re.compile(r'^(?:heading|title|subtitle)\s*(\d*)$', re.IGNORECASE)
+SENTENCE_RE = re.compile(r'(?<=[.!?…])\s+')
+
+MAX_TITLE_CHARS = 70
+MAX_POINT_TITLE_CHARS = 48
+MAX_DESCRIPTION_CHARS = 180
+SHORT_ITEM_CHARS = 60
+POINTS_PER_SLIDE = 3
+ITEMS_PER_SLIDE = 6
+
+# Upper bound of content slides for the idea form's "Độ sâu Nội dung" choices
+IDEA_CONTENT_SLIDES = {'brief': 6, 'standard': 10, 'detailed': 16, 'extensive': 23}
+
+_END = object()
+
+
+class Section:
+    """A heading and the paragraphs under it; level 0 is the document title."""
+
+    def __init__(self, title: str, level: int, paragraphs=None):
+        self.title = title
+        self.level = level
+        self.paragraphs = paragraphs if paragraphs is not None else []
+
+
+def _clip(text: str, limit: int) -> str:
+    text = ' '.join(text.split())
+    return text if len(text) <= limit else text[:limit - 1].rstrip() + '…'
+
+
+def _heading_level(p):
+    """Heading level of a <w:p> (0 for the document title), or None for body text."""
+    ppr = p.find(f'{W_NS}pPr')
+    if ppr is None:
+        return None
+    outline = ppr.find(f'{W_NS}outlineLvl')
+    if outline is not None:
+        return int(outline.get(f'{W_NS}val', '0')) + 1
+    style = ppr.find(f'{W_NS}pStyle')
+    if style is not None:
+        match = HEADING_STYLE_RE.match(style.get(f'{W_NS}val', ''))
+        if match:
+            name = style.get(f'{W_NS}val', '').lower()
+            return 0 if name.startswith('title') else int(match.group(1) or 1)
+    return None
+
+
+def chunk_docx(source) -> iter:
+    """
+    Sections of a .docx (path or file object), yielded while word/document.xml is
+    still being parsed, so the first slide can be planned before the whole file is read.
+    """
+    with zipfile.ZipFile(source) as archive, archive.open('word/document.xml') as document:
+        current = None
+        for _, element in ElementTree.iterparse(document, events=('end',)):
+            if element.tag != f'{W_NS}p':
+                continue
+            text = ''.join(t.text or '' for t in element.iter(f'{W_NS}t')).strip()
+            level = _heading_level(element)
+            element.clear()
+            if not text:
+                continue
+            if level is not None:
+                if current is not None:
+                    yield current
+                current = Section(text, level)
+            elif current is None:
+                current = Section('', 1, [text])
+            else:
+                current.paragraphs.append(text)
+        if current is not None:
+            yield current
+
+
+def chunk_idea(title: str, prompt: str, content_length: str = 'standard') -> iter:
+    """
+    Sections from a free-text idea: the title becomes the cover, each blank-line
+    separated block (or group of sentences) a content section.
+    """
+    yield Section(title or _clip(prompt, MAX_TITLE_CHARS), 0)
+    blocks = [block.strip() for block in re.split(r'\n\s*\n', prompt or '') if block.strip()]
+    if len(blocks) == 1:
+        sentences = [s for s in SENTENCE_RE.split(blocks[0]) if s.strip()]
+        blocks = ['\n'.join(sentences[i:i + POINTS_PER_SLIDE]) for i in range(0, len(sentences), POINTS_PER_SLIDE)]
+    for block in blocks[:IDEA_CONTENT_SLIDES.get(content_length, IDEA_CONTENT_SLIDES['standard'])]:
+        lines = [line.strip(' -*•\t') for line in block.splitlines() if line.strip(' -*•\t')]
+        heading = lines[0] if len(lines) > 1 and len(lines[0]) <= SHORT_ITEM_CHARS else ''
+        yield Section(heading, 1, lines[1:] if heading else lines)
+
+
+def _point(text: str):
+    """Split 'Title: description' (or the first sentence) into a point title and description."""
+    head, sep, rest = text.partition(':')
+    if sep and 0 < len(head) <= MAX_POINT_TITLE_CHARS:
+        return head.strip(), rest.strip()
+    sentences = SENTENCE_RE.split(text, maxsplit=1)
+    if len(sentences) == 2 and len(sentences[0]) <= MAX_POINT_TITLE_CHARS:
+        return sentences[0].rstrip('.'), sentences[1]
+    return _clip(text, MAX_POINT_TITLE_CHARS), text if len(text) > MAX_POINT_TITLE_CHARS else ''
+
+
+def select_tools(section: Section, deck_title: str, enable_transitions: bool) -> list:
+    """
+    (html_lib generator name, kwargs) for the slides of one section. Escaping
+    happens here because the generators interpolate values into markup as-is.
+    """
+    esc = html.escape
+    if section.level == 0:
+        subtitle = section.paragraphs[0] if section.paragraphs else ''
+        return [('generate_title_slide', {'main_title': esc(_clip(section.title, MAX_TITLE_CHARS)),
+                                          'subtitle': esc(_clip(subtitle, MAX_TITLE_CHARS))})]
+
+    title = esc(_clip(section.title or deck_title, MAX_TITLE_CHARS))
+    calls = []
+    if enable_transitions and section.title and section.level <= 1:
+        calls.append(('generate_section_header_slide', {'header_text': title}))
+
+    paragraphs = section.paragraphs
+    if len(paragraphs) > POINTS_PER_SLIDE and all(len(p) <= SHORT_ITEM_CHARS for p in paragraphs):
+        for i in range(0, len(paragraphs), ITEMS_PER_SLIDE):
+            items = [esc(p) for p in paragraphs[i:i + ITEMS_PER_SLIDE]]
+            calls.append(('generate_content_slide', {
+                'main_title': title, 'items': items,
+                'num_columns': min(3, len(items)), 'num_rows': 1 if len(items) <= 3 else 2,
+            }))
+        return calls
+
+    for i in range(0, len(paragraphs), POINTS_PER_SLIDE):
+        kwargs = {'title': title}
+        for n, text in enumerate(paragraphs[i:i + POINTS_PER_SLIDE], start=1):
+            point_title, description = _point(text)
+            kwargs[f'point{n}_title'] = esc(point_title)
+            kwargs[f'point{n}_description'] = esc(_clip(description, MAX_DESCRIPTION_CHARS))
+        for n in range(len(paragraphs[i:i + POINTS_PER_SLIDE]) + 1, POINTS_PER_SLIDE + 1):
+            kwargs[f'point{n}_title'] = ''
+            kwargs[f'point{n}_description'] = ''
+        calls.append(('generate_main_points_slide', kwargs))
+    return calls
+
+
+def thank_you_tool() -> tuple:
+    return 'generate_thank_you_slide_3', {'main_title': 'THANK YOU', 'show_phone': False, 'show_email': False}
+
+
+class StreamSessions:
+    """
+    Inputs waiting for their SSE stream (an uploaded .docx or an idea), kept for
+    `ttl` seconds. Lookups do not consume the entry, so an EventSource that
+    reconnects can start the stream again.
+    """
+
+    def __init__(self, ttl: float = 1800, max_sessions: int = 256):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def put(self, session_id: str, **payload):
+        with self._lock:
+            now = time.time()
+            for stale in [sid for sid, (created, _) in self._sessions.items() if now - created > self.ttl]:
+                del self._sessions[stale]
+            while len(self._sessions) >= self.max_sessions:
+                del self._sessions[next(iter(self._sessions))]
+            self._sessions[session_id] = (now, payload)
+
+    def get(self, session_id: str):
+        with self._lock:
+            entry = self._sessions.get(session_id)
+        if entry is None or time.time() - entry[0] > self.ttl:
+            return None
+        return entry[1]
+
+
+def sse(event: str, data: dict) -> str:
+    return f'event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n'
+
+
+class DeckPipeline:
+    """
+    Turns a stream of sections into converted slides as concurrent stages joined
+    by queues: chunking -> tool selection -> html_lib rendering -> conversion.
+
+    Chunking with tool selection and rendering each have a thread; conversion
+    runs on `workers` threads. Slides are announced in deck order as soon as they
+    and every slide before them are stored, so the first slide shows up after one
+    section's worth of work no matter how long the deck is. `store(index, html_bytes)` returns the path the
+    client loads the slide from.
+    """
+
+    def __init__(self, sections, renderer_module, convert, store, title: str = '',
+                 enable_transitions: bool = True, enable_thank_you: bool = True, workers: int = 4):
+        self.sections = sections
+        self.renderer_module = renderer_module
+        self.convert = convert
+        self.store = store
+        self.title = title
+        self.enable_transitions = enable_transitions
+        self.enable_thank_you = enable_thank_you
+        self.workers = workers
+        self.total = None
+        self.cancelled = threading.Event()
+        self._events = queue.Queue()
+        self._plans = queue.Queue()
+        self._renders = queue.Queue()
+        self._done = {}
+        self._next = 0
+        self._emit_lock = threading.Lock()
+        self._failed = False
+
+    def _fail(self, exc: Exception):
+        with self._emit_lock:
+            if self._failed:
+                return
+            self._failed = True
+        self.cancelled.set()
+        self._events.put(('error_event', {'message': str(exc) or exc.__class__.__name__}))
+        self._events.put(_END)
+
+    def _status(self, step: int, message: str, description: str):
+        self._events.put(('status', {'message': message, 'title': message, 'description': description, 'step': step}))
+
+    def _chunk_and_select(self):
+        try:
+            self._status(1, 'Phân tích tài liệu', 'Đang tách tài liệu thành các phần...')
+            index = 0
+            for n, section in enumerate(self.sections):
+                if self.cancelled.is_set():
+                    return
+                if n == 0:
+                    self._status(2, 'Chuẩn bị nội dung', 'Đang chọn bố cục cho từng phần...')
+                    if section.level != 0:
+                        # No explicit title paragraph: the cover uses the deck title
+                        cover = Section(self.title, 0)
+                        for call in select_tools(cover, self.title, False):
+                            self._plans.put((index, call))
+                            index += 1
+                    else:
+                        self.title = section.title or self.title
+                for call in select_tools(section, self.title, self.enable_transitions):
+                    self._plans.put((index, call))
+                    index += 1
+            if self.enable_thank_you:
+                self._plans.put((index, thank_you_tool()))
+                index += 1
+            self.total = index
+            self._events.put(('progress', self._progress()))
+        except Exception as exc:
+            self._fail(exc)
+        finally:
+            self._plans.put(_END)
+
+    def _render(self):
+        try:
+            first = True
+            while not self.cancelled.is_set():
+                item = self._plans.get()
+                if item is _END:
+                    break
+                if first:
+                    self._status(3, 'Thiết kế slide', 'Đang dựng và chuyển đổi từng slide...')
+                    first = False
+                index, (name, kwargs) = item
+                generator = getattr(self.renderer_module, name)
+                self._renders.put((index, generator(**kwargs).encode('utf-8')))
+        except Exception as exc:
+            self._fail(exc)
+        finally:
+            for _ in range(self.workers):
+                self._renders.put(_END)
+
+    def _convert_worker(self):
+        while True:
+            item = self._renders.get()
+            if item is _END or self.cancelled.is_set():
+                return
+            index, html_bytes = item
+            try:
+                converted = self.convert(html_bytes)
+                path = self.store(index, converted)
+            except Exception as exc:
+                self._fail(exc)
+                return
+            self._slide_ready(index, path)
+
+    def _progress(self) -> dict:
+        total = self.total or 0
+        percentage = int(self._next * 100 / total) if total else 0
+        return {'current': self._next, 'total': total, 'percentage': percentage}
+
+    def _slide_ready(self, index: int, path: str):
+        # Hold finished slides until every earlier one is out, so the deck keeps its order
+        with self._emit_lock:
+            if self._failed:
+                return
+            self._done[index] = path
+            while self._next in self._done:
+                self._events.put(('slide_completed', {
+                    'index': self._next, 'total': self.total, 'html_path': self._done.pop(self._next), 'is_temp': True,
+                }))
+                self._next += 1
+                if self.total:
+                    self._events.put(('progress', self._progress()))
+
+    def run(self, **complete_info) -> iter:
+        """SSE text for the whole deck; closing the generator (client gone) cancels the stages."""
+        started = time.perf_counter()
+        threading.Thread(target=self._chunk_and_select, name='deck-chunk', daemon=True).start()
+        threading.Thread(target=self._render, name='deck-render', daemon=True).start()
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='deck-convert')
+        workers = [executor.submit(self._convert_worker) for _ in range(self.workers)]
+        executor.shutdown(wait=False)
+
+        def watch():
+            for worker in workers:
+                worker.result()
+            if not self._failed:
+                self._events.put(_END)
+
+        threading.Thread(target=watch, name='deck-watch', daemon=True).start()
+        try:
+            while True:
+                event = self._events.get()
+                if event is _END:
+                    break
+                yield sse(*event)
+            if not self._failed:
+                yield sse('complete', dict(complete_info, project_name=complete_info.get('project_name') or self.title,
+                                           total_slides=self._next,
+                                           ms=int((time.perf_counter() - started) * 1000)))
+        finally:
+            self.cancelled.set()
@@ -0,0 +1,233 @@
+import html
+import base64
+import asyncio
+import threading
+import concurrent.futures
+
+SLIDE_WIDTH = 1920
+SLIDE_HEIGHT = 1080
+IMAGE_FORMATS = {'png': 'png', 'jpeg': 'jpeg', 'jpg': 'jpeg', 'webp': 'webp'}
+FONTS_READY_JS = 'document.fonts.ready.then(() => true)'
+PDF_CHUNK_BYTES = 1024 * 1024
+
+# Editor slides arrive as the inner content of .slide-container (see SlideEditor.cleanSlideContentForExport)
+SLIDE_FRAGMENT_TEMPLATE = """<!DOCTYPE html>
+<html><head><meta charset="UTF-8">
+<link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap" rel="stylesheet">
+<style>
+* { margin: 0; padding: 0; box-sizing: border-box; }
+body { width: 1920px; height: 1080px; overflow: hidden; font-family: 'Inter', Arial, sans-serif; }
+.slide-container { position: relative; width: 1920px; height: 1080px; overflow: hidden; background: white; }
+.element { position: absolute; }
+.element img, .element video { width: 100%; height: 100%; object-fit: cover; border-radius: inherit; }
+.resize-handle, .connector-control-point, .smart-guide, .distance-indicator { display: none !important; }
+</style></head>
+<body><div class="slide-container">{content}</div></body></html>"""
+
+# One print document for the whole deck: every slide is an isolated iframe on its own 1920x1080 page
+DECK_PDF_TEMPLATE = """<!DOCTYPE html>
+<html><head><meta charset="UTF-8"><style>
+@page { size: 1920px 1080px; margin: 0; }
+html, body { margin: 0; padding: 0; }
+.pdf-page { width: 1920px; height: 1080px; overflow: hidden; break-after: page; }
+.pdf-page:last-child { break-after: auto; }
+.pdf-page iframe { width: 1920px; height: 1080px; border: 0; display: block; }
+</style></head><body>{pages}</body></html>"""
+
+
+def slide_document(content: str) -> str:
+    """Full HTML documents pass through; editor fragments get the slide-container shell."""
+    if '<html' in content[:2048].lower():
+        return content
+    return SLIDE_FRAGMENT_TEMPLATE.replace('{content}', content)
+
+
+class RendererPool:
+    """
+    Persistent Playwright Chromium for rendering slide HTML to images.
+
+    The browser runs on a private asyncio loop in a background thread and is
+    launched once, on first use. Up to `pages` pages of one 1920x1080 context are
+    reused across captures, and fonts/images come through the local asset mirror.
+    Screenshots go through CDP Page.captureScreenshot, which encodes PNG, JPEG
+    or WebP directly and downscales via clip.scale without a second resize pass.
+    """
+
+    def __init__(self, pages: int = 4, timeout: float = 60, pdf_exports: int = 2):
+        self.pages = pages
+        self.timeout = timeout
+        self.pdf_exports = pdf_exports
+        self._pdf_slots = None
+        self._loop = None
+        self._lock = threading.Lock()
+        self._launch_lock = None  # loop primitives are created on the renderer loop, see _ensure_browser
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._idle = None
+        self._created = 0
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='renderer-loop', daemon=True).start()
+                self._loop = loop
+        return self._loop
+
+    def _call(self, coro, timeout: float):
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_started())
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            # Cancel the coroutine so its finally blocks give back pages and slots
+            future.cancel()
+            raise
+
+    async def _ensure_browser(self):
+        if self._launch_lock is None:
+            self._launch_lock = asyncio.Lock()
+            self._pdf_slots = asyncio.Semaphore(self.pdf_exports)
+        async with self._launch_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return
+            from playwright.async_api import async_playwright
+            from asset_mirror import AssetMirror
+
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(
+                headless=True, args=['--no-sandbox', '--disable-setuid-sandbox', '--disable-dev-shm-usage'])
+            self._context = await self._browser.new_context(
+                viewport={'width': SLIDE_WIDTH, 'height': SLIDE_HEIGHT}, device_scale_factor=1)
+            await AssetMirror().install(self._context)
+            # Pages of a crashed browser are useless; start the pool over
+            self._idle = asyncio.Queue()
+            self._created = 0
+
+    async def _new_page(self):
+        page = await self._context.new_page()
+        return page, await self._context.new_cdp_session(page)
+
+    async def _acquire(self):
+        await self._ensure_browser()
+        if not self._idle.empty():
+            return self._idle.get_nowait()
+        if self._created < self.pages:
+            self._created += 1
+            try:
+                return await self._new_page()
+            except Exception:
+                self._created -= 1
+                raise
+        return await self._idle.get()
+
+    async def _release(self, entry, broken: bool):
+        if broken:
+            await entry[0].close()
+            # Replace the page so callers waiting on the queue are not stranded
+            try:
+                entry = await self._new_page()
+            except Exception:
+                self._created -= 1
+                return
+        self._idle.put_nowait(entry)
+
+    async def _render(self, html: str, fmt: str, width: int, quality: int) -> bytes:
+        entry = await self._acquire()
+        page, cdp = entry
+        broken = False
+        try:
+            await page.set_content(html, wait_until='load', timeout=self.timeout * 1000)
+            await page.evaluate(FONTS_READY_JS)
+            scale = min(1.0, width / SLIDE_WIDTH) if width else 1.0
+            params = {
+                'format': fmt,
+                'clip': {'x': 0, 'y': 0, 'width': SLIDE_WIDTH, 'height': SLIDE_HEIGHT, 'scale': scale},
+            }
+            if quality and fmt != 'png':
+                params['quality'] = quality
+            shot = await cdp.send('Page.captureScreenshot', params)
+            return base64.b64decode(shot['data'])
+        except BaseException:
+            # Includes cancellation after a timeout: the page may still be loading, replace it
+            broken = True
+            raise
+        finally:
+            await self._release(entry, broken)
+
+    @staticmethod
+    def _check_format(fmt: str) -> str:
+        if fmt not in IMAGE_FORMATS:
+            raise ValueError(f'Unsupported image format {fmt!r} (use png, jpeg or webp)')
+        return IMAGE_FORMATS[fmt]
+
+    def capture(self, html: str, fmt: str = 'png', width: int = None, quality: int = None) -> bytes:
+        """Render one HTML document at 1920x1080; `width` (<= 1920) downscales the image."""
+        fmt = self._check_format(fmt)
+        return self._call(self._render(html, fmt, width, quality), self.timeout)
+
+    def capture_many(self, htmls: list, fmt: str = 'png', width: int = None, quality: int = None) -> list:
+        """Render several documents concurrently on the page pool; returns bytes or the exception per item."""
+        fmt = self._check_format(fmt)
+
+        async def render_all():
+            return await asyncio.gather(*(self._render(html, fmt, width, quality) for html in htmls),
+                                        return_exceptions=True)
+
+        return self._call(render_all(), self.timeout * max(1, len(htmls) / self.pages))
+
+    async def _export_pdf(self, htmls: list, path: str):
+        await self._ensure_browser()
+        pages = ''.join(
+            f'<div class="pdf-page"><iframe srcdoc="{html.escape(slide_document(doc), quote=True)}"></iframe></div>'
+            for doc in htmls)
+        async with self._pdf_slots:
+            page = await self._context.new_page()
+            try:
+                # 'load' on the outer document also waits for every iframe
+                await page.set_content(DECK_PDF_TEMPLATE.replace('{pages}', pages),
+                                       wait_until='load', timeout=self.timeout * 1000 * max(1, len(htmls) / 10))
+                await asyncio.gather(*(frame.evaluate(FONTS_READY_JS) for frame in page.frames))
+                cdp = await self._context.new_cdp_session(page)
+                printed = await cdp.send('Page.printToPDF', {
+                    'printBackground': True,
+                    'preferCSSPageSize': True,
+                    'marginTop': 0, 'marginBottom': 0, 'marginLeft': 0, 'marginRight': 0,
+                    'transferMode': 'ReturnAsStream',
+                })
+                # Copy the PDF stream to disk chunk by chunk instead of holding it in memory
+                with open(path, 'wb') as f:
+                    while True:
+                        chunk = await cdp.send('IO.read', {'handle': printed['stream'], 'size': PDF_CHUNK_BYTES})
+                        data = chunk['data']
+                        f.write(base64.b64decode(data) if chunk.get('base64Encoded') else data.encode('utf-8'))
+                        if chunk.get('eof'):
+                            break
+                await cdp.send('IO.close', {'handle': printed['stream']})
+            finally:
+                await page.close()
+
+    def export_pdf(self, htmls: list, path: str) -> str:
+        """
+        Print a whole deck (full documents or editor fragments) into one PDF at `path`,
+        one 1920x1080 page per slide, in a single load and a single print pass.
+        """
+        self._call(self._export_pdf(htmls, path), self.timeout * max(1, len(htmls) / 10) + self.timeout)
+        return path
+
+    def close(self):
+        if self._loop is None:
+            return
+
+        async def shutdown():
+            if self._browser is not None:
+                await self._browser.close()
+            if self._playwright is not None:
+                await self._playwright.stop()
+
+        try:
+            self._call(shutdown(), 10)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
@@ -0,0 +1,189 @@
+import os
+import json
+import time
+import hashlib
+import threading
+
+
+class ResponseTooLarge(ValueError):
+    pass
+
+
+class UrlFetcher:
+    """
+    Fetches slide HTML for /convert/url through one pooled requests.Session.
+
+    Bodies are cached on disk under sha256(url) with their ETag/Last-Modified.
+    Within `ttl` seconds a cached body is returned without touching the network;
+    after that the URL is revalidated with a conditional GET and a 304 reuses the
+    cached body. Downloads are streamed and abort once they exceed `max_bytes`.
+    """
+
+    def __init__(self, root: str, ttl: float = 300, max_bytes: int = 10 * 1024 * 1024,
+                 timeout: float = 20, max_cache_bytes: int = 256 * 1024 * 1024, pool_size: int = 8):
+        self.root = root
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.max_cache_bytes = max_cache_bytes
+        self.pool_size = pool_size
+        self.hits = 0
+        self.revalidated = 0
+        self.fetched = 0
+        self._session = None
+        self._lock = threading.Lock()
+        self._sizes = None  # body path -> size, loaded lazily
+
+    def session(self):
+        with self._lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._session = session
+            return self._session
+
+    def _paths(self, url: str):
+        digest = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.root, digest[:2], digest)
+        return base + '.json', base + '.body'
+
+    def _load(self, url: str):
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None, None
+        if meta.get('url') != url:
+            return None, None
+        return meta, body
+
+    def _write(self, path: str, data: bytes):
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _store(self, url: str, meta: dict, body: bytes = None):
+        meta_path, body_path = self._paths(url)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        if body is not None:
+            self._write(body_path, body)
+        self._write(meta_path, json.dumps(meta).encode('utf-8'))
+        if body is not None:
+            with self._lock:
+                sizes = self._load_sizes()
+                sizes[body_path] = len(body)
+                if sum(sizes.values()) > self.max_cache_bytes:
+                    self._evict(sizes)
+
+    def fetch(self, url: str) -> bytes:
+        """HTML bytes for url (UTF-8 when the server declared another charset)."""
+        meta, body = self._load(url)
+        now = time.time()
+        if meta is not None and now - meta['checked'] < self.ttl:
+            with self._lock:
+                self.hits += 1
+            return body
+
+        headers = {}
+        if meta is not None:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        with self.session().get(url, headers=headers, timeout=self.timeout, stream=True) as resp:
+            if resp.status_code == 304 and meta is not None:
+                meta['checked'] = now
+                self._store(url, meta)
+                with self._lock:
+                    self.revalidated += 1
+                return body
+            resp.raise_for_status()
+
+            declared = resp.headers.get('Content-Length')
+            if declared and declared.isdigit() and int(declared) > self.max_bytes:
+                raise ResponseTooLarge(f'{url} is {declared} bytes (limit {self.max_bytes})')
+            chunks, size = [], 0
+            for chunk in resp.iter_content(chunk_size=64 * 1024):
+                size += len(chunk)
+                if size > self.max_bytes:
+                    raise ResponseTooLarge(f'{url} exceeds {self.max_bytes} bytes')
+                chunks.append(chunk)
+            body = b''.join(chunks)
+
+            # Only transcode an explicitly declared charset; otherwise keep the bytes
+            # so a <meta charset> inside the document still applies.
+            content_type = resp.headers.get('Content-Type', '')
+            if 'charset=' in content_type.lower() and resp.encoding and resp.encoding.lower() not in ('utf-8', 'utf8'):
+                body = body.decode(resp.encoding, errors='replace').encode('utf-8')
+
+            self._store(url, {
+                'url': url,
+                'etag': resp.headers.get('ETag'),
+                'last_modified': resp.headers.get('Last-Modified'),
+                'checked': now,
+                'size': len(body),
+            }, body)
+        with self._lock:
+            self.fetched += 1
+        return body
+
+    def stats(self) -> dict:
+        with self._lock:
+            sizes = self._load_sizes()
+            return {
+                'entries': len(sizes),
+                'bytes': sum(sizes.values()),
+                'hits': self.hits,
+                'revalidated': self.revalidated,
+                'fetched': self.fetched,
+            }
+
+    def _load_sizes(self):
+        if self._sizes is None:
+            self._sizes = {}
+            for dirpath, _, filenames in os.walk(self.root):
+                for name in filenames:
+                    if name.endswith('.body'):
+                        path = os.path.join(dirpath, name)
+                        try:
+                            self._sizes[path] = os.path.getsize(path)
+                        except OSError:
+                            pass
+        return self._sizes
+
+    def _evict(self, sizes):
+        def mtime(path):
+            try:
+                return os.path.getmtime(path[:-len('.body')] + '.json')
+            except OSError:
+                return 0
+
+        total = sum(sizes.values())
+        for path in sorted(sizes, key=mtime):
+            if total <= self.max_cache_bytes * 0.9:
+                break
+            for stale in (path, path[:-len('.body')] + '.json'):
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+            total -= sizes.pop(path)
+
+
+def url_fetcher_from_env(default_root: str) -> UrlFetcher:
+    return UrlFetcher(
+        root=os.environ.get('URL_CACHE_DIR', default_root),
+        ttl=float(os.environ.get('URL_CACHE_TTL_SECONDS', '300')),
+        max_bytes=int(os.environ.get('URL_FETCH_MAX_MB', '10')) * 1024 * 1024,
+        timeout=float(os.environ.get('URL_FETCH_TIMEOUT', '20')),
+        max_cache_bytes=int(os.environ.get('URL_CACHE_MAX_MB', '256')) * 1024 * 1024,
+    )